@@ -0,0 +1,379 @@
+"""
+.. module:: accuracy
+    :synopsis: Measure the speed and the accuracy of the analysis on rendered scans of calibration prints with known tool offsets
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The interlocked calibration print is generated with the :class:`calibration_pattern.calibration_pattern` class of the gcode generator, and rendered into scans using the :class:`rasterizer.rasterizer`, with the lines of every tool moved by a known offset, like a printer of which the nozzles are not aligned. The offsets are given in the coordinates of the pattern, the same coordinates as the x_offsets and y_offsets of the :class:`config.printer_config`, and are rotated with the print onto the bed. The x_offsets and y_offsets of the generator of the pattern are printed as well, so a print that compensates the known offsets, for example using the offsets of :meth:`aggregate.aggregator.offsets`, should give offsets of zero. The scans are mirrored and rotated like a scan of the paper lying in the given orientation on the scanner, and can be blurred, made noisy and skewed.
+
+Every stage of the analysis (see :mod:`pipeline`) is timed separately, and the offsets of every estimator are compared to the known offsets between the tool of each structure and the reference tool. An estimator that can not be used for a scan, for example the fir quadrature detection on the short profiles of a low resolution scan, gives no offsets instead of stopping the measurement. The result is a table of the time and the error of every estimator at every resolution, from which the fastest estimator that is accurate enough can be chosen.
+"""
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+import correlation
+import fir
+import quadrature
+from detect import detector
+from parameters import parameters,parse_settings
+from pipeline import pipeline,orientations,n_estimators,_round
+from scan import scan
+
+generator_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','gcode generator')
+"""Folder of the gcode generator, of which the calibration pattern and the rasterizer are used"""
+
+if generator_folder not in sys.path:
+    sys.path.append(generator_folder)
+
+from benchmark import printer_for_tools
+from calibration_pattern import calibration_pattern
+from config import pattern_config
+from generator import generator
+from rasterizer import rasterizer
+
+estimator_names = ('fft 1','fft 2','fft 3','fft 4','correlation','fir 1','fir 2','fir 3')
+"""Names of the estimators of :mod:`pipeline`, with the harmonic of the fft and the fir quadrature detection"""
+
+estimator_stages = ('quadrature',)*4+('correlation',)+('fir',)*3
+"""Stage of the analysis in which every estimator is calculated"""
+
+common_stages = ('open','detect','resample','mask')
+"""Stages of the analysis that are needed by every estimator"""
+
+
+class harness:
+    """Renders scans of a calibration print with known tool offsets and analyses them. For example to find the error of every estimator on a blurred and noisy scan of 600 dpi:
+
+    .. code-block:: python
+
+        measured = harness()
+        measured.blur = 0.05
+        measured.noise = 0.05
+        result = measured.measure(600)
+        print(dict(zip(estimator_names,result['max_error'])))
+
+    :param pattern: The :class:`calibration_pattern.calibration_pattern` of which the print is rendered. By default the default pattern, printed by a printer with the tools of :attr:`harness.tools`.
+    :param settings: Dictionary with parameters of the analysis to change, see :class:`parameters.parameters`. The parameters of the structures, the number of nozzles and the resolution are taken from the pattern and the scan.
+    """
+
+    tools = (1,2,3)
+    """Tools of the print, the n of the analysis is the number of tools"""
+
+    reference_tool = 1
+    """Tool that prints the reference patterns, one of the tools"""
+
+    x_offsets = None
+    """The known x offsets of the tools in millimeter, in the order of :attr:`harness.tools`. By default random offsets of at most max_offset."""
+
+    y_offsets = None
+    """The known y offsets of the tools in millimeter"""
+
+    max_offset = 0.1
+    """Largest random offset in millimeter"""
+
+    orientation = 2
+    """The orientation of the paper on the scanner, 1 to 4"""
+
+    blur = 0.03
+    """Standard deviation of the gaussian blur of the scanner in millimeter"""
+
+    noise = 0.03
+    """Standard deviation of the noise of the scanner, as fraction of the full scale"""
+
+    skew = 0.01
+    """Rotation of the paper on the scanner in radians, on top of the rotation of the orientation"""
+
+    seed = 0
+    """Seed of the random offsets and the noise"""
+
+    margin = 10
+    """Space between the print and the sides of the scan in millimeter"""
+
+    fir_order = fir.order
+    """Order of the band-pass filters of the fir quadrature detection"""
+
+    def __init__(self,pattern=None,settings=None):
+        if pattern is None:
+            pattern = calibration_pattern(gen=generator(printer_for_tools(max(self.tools))))
+        self.pattern = pattern
+        self.settings = {} if settings is None else dict(settings)
+
+    def known_offsets(self):
+        """Get the known offsets of the tools
+
+        :return: Dictionary with the x and y offset in millimeter of every tool
+        :rtype: dict
+        """
+        random = np.random.default_rng(self.seed)
+        x_offsets = self.x_offsets
+        y_offsets = self.y_offsets
+        if x_offsets is None:
+            x_offsets = random.uniform(-self.max_offset,self.max_offset,len(self.tools))
+        if y_offsets is None:
+            y_offsets = random.uniform(-self.max_offset,self.max_offset,len(self.tools))
+        return {tool:(float(x),float(y)) for tool,x,y in zip(self.tools,x_offsets,y_offsets)}
+
+    def expected(self):
+        """Get the offsets the analysis should find, the offsets between the tool of every structure and the reference tool. Besides the known offsets of the nozzles, these include the x_offsets and y_offsets of the generator of the pattern, such that a print that compensates the known offsets should give offsets of zero.
+
+        :return: Arrays with the expected x and y offset of every structure in meter
+        :rtype: tuple
+        """
+        known = self.known_offsets()
+        gen = self.pattern.gen
+        tools = list(self.tools)
+        #the signal patterns of the i-th tool use the i-th offsets of the generator, see calibration_pattern.calibration_pattern
+        reference_index = tools.index(self.reference_tool)
+        x_reference = known[self.reference_tool][0]+gen.x_offsets[reference_index]
+        y_reference = known[self.reference_tool][1]+gen.y_offsets[reference_index]
+        x_offset = np.array([known[tool][0]+gen.x_offsets[i1]-x_reference for i1,tool in enumerate(tools) for i2 in range(2)])*1e-3
+        y_offset = np.array([known[tool][1]+gen.y_offsets[i1]-y_reference for i1,tool in enumerate(tools) for i2 in range(2)])*1e-3
+        return x_offset,y_offset
+
+    def parameters(self,dpi):
+        """Get the parameters of the analysis of a scan of the print
+
+        :param dpi: Resolution of the scan in dots per inch
+        :return: The parameters. The spatial average is scaled with the resolution, unless it is given in the settings.
+        :rtype: parameters.parameters
+        """
+        config = self.pattern.config
+        values = {'structure_pitch':config.interlocked_pitch*1e-3,
+                  'structure_period':config.interlocked_period*1e-3,
+                  'structure_length':config.length*1e-3,
+                  'structure_width':config.width*1e-3,
+                  'structure_spacing':config.spacing*1e-3,
+                  'structure_spacing_to_square':config.spacing_to_square*1e-3,
+                  'rotation':math.degrees(self.pattern.gen.rotation),
+                  'spatial_average':max(1,_round(parameters.spatial_average*dpi/1200))}
+        values.update(self.settings)
+        values['n'] = len(self.tools)
+        values['dpi'] = dpi
+        return parameters(**values)
+
+    def render(self,dpi,file_name):
+        """Generate the print and render it into a scan
+
+        :param dpi: Resolution of the scan in dots per inch
+        :param file_name: Name of the BMP file
+        :return: Dictionary with the time spent on generating ('generate') and on rendering ('render') in seconds
+        :rtype: dict
+        """
+        timings = {}
+        start = time.perf_counter()
+        image = rasterizer(self.pattern.gen.config)
+        image.write_all(self.pattern.iter_full_interlocked_print(list(self.tools),self.reference_tool))
+        timings['generate'] = time.perf_counter()-start
+
+        start = time.perf_counter()
+        image.dpi = dpi
+        image.blur = self.blur
+        image.noise = self.noise
+        image.seed = self.seed
+        image.mirror = True
+        image.paper_rotation = (self.orientation % 4)*math.pi/2+self.skew
+        image.tool_offsets = {tool:self.pattern.gen.rotate_around_origin(x,y) for tool,(x,y) in self.known_offsets().items()}
+        #make the page just large enough for the print
+        x0,y0,x1,y1 = image.segments()[:4]
+        x_rel = np.concatenate((x0,x1))-self.pattern.gen.x_center
+        y_rel = np.concatenate((y0,y1))-self.pattern.gen.y_center
+        cos = math.cos(image.paper_rotation)
+        sin = math.sin(image.paper_rotation)
+        image.page_width = 2*np.abs(cos*x_rel-sin*y_rel).max()+2*self.margin
+        image.page_height = 2*np.abs(sin*x_rel+cos*y_rel).max()+2*self.margin
+        image.write_bmp(file_name)
+        timings['render'] = time.perf_counter()-start
+        return timings
+
+    def analyse(self,file_name,dpi):
+        """Analyse a scan stage by stage, like :meth:`pipeline.pipeline.analyse`. A stage that fails gives NaN offsets for its estimators.
+
+        :param file_name: Name of the BMP file
+        :param dpi: Resolution of the scan in dots per inch
+        :return: Dictionary with the x and y offsets (as arrays of estimators by structures), the time spent on every stage and the error message of every stage that failed ('errors')
+        :rtype: dict
+        """
+        settings = self.parameters(dpi)
+        analysis = pipeline(settings)
+        n_structures = 2*len(self.tools)
+        result = {'x_offset':np.full((n_estimators,n_structures),np.nan),'y_offset':np.full((n_estimators,n_structures),np.nan),'errors':{}}
+        timings = dict.fromkeys(common_stages+('quadrature','correlation','fir'),0.0)
+        result['timings'] = timings
+
+        start = time.perf_counter()
+        image = scan(file_name)
+        timings['open'] = time.perf_counter()-start
+        start = time.perf_counter()
+        try:
+            found = detector(settings).detect(image,self.orientation)
+        except Exception as error:
+            result['errors']['detect'] = str(error)
+            return result
+        finally:
+            timings['detect'] = time.perf_counter()-start
+
+        dy = settings.pixel_size
+        period = settings.structure_period
+        window = _round(settings.structure_pitch/dy)
+        stages = (('quadrature',slice(0,4),lambda ref,sig: quadrature.quadrature_offsets(ref,sig,dy,period,(1,2,3,4)).T),
+                  ('correlation',slice(4,5),lambda ref,sig: correlation.correlation_offsets(ref,sig,dy,period)),
+                  ('fir',slice(5,8),lambda ref,sig: fir.fir_offsets(ref,sig,dy,period,(1,2,3),self.fir_order).T))
+        for name,(order,invert,ver) in zip(('x_offset','y_offset'),orientations[self.orientation]):
+            start = time.perf_counter()
+            frame,boxes = analysis.structures(found,ver)
+            center,ref_only,sig_only = analysis.profiles(image,frame,boxes,order,settings)
+            timings['resample'] += time.perf_counter()-start
+            start = time.perf_counter()
+            ref = quadrature.mask_profiles(center,ref_only,window)
+            sig = quadrature.mask_profiles(center,sig_only,window)
+            timings['mask'] += time.perf_counter()-start
+            for stage,rows,function in stages:
+                start = time.perf_counter()
+                try:
+                    offsets = function(ref,sig)
+                except Exception as error:
+                    result['errors'][stage] = str(error)
+                    continue
+                finally:
+                    timings[stage] += time.perf_counter()-start
+                result[name][rows] = -offsets if invert else offsets
+        image.close()
+        return result
+
+    def measure(self,dpi,folder=None):
+        """Render a scan, analyse it and compare the offsets to the known offsets
+
+        :param dpi: Resolution of the scan in dots per inch
+        :param folder: Folder in which the scan is written, by default a temporary folder
+        :return: Dictionary with the resolution ('dpi'), the result of :meth:`harness.analyse` ('x_offset', 'y_offset', 'timings' which also contains the timings of :meth:`harness.render`, and 'errors'), for every estimator the root mean square ('rms_error') and the largest ('max_error') difference from the expected offsets in meter, NaN when it failed, and for every estimator the time ('time') spent on the stages it needs in seconds
+        :rtype: dict
+        """
+        if folder is None:
+            with tempfile.TemporaryDirectory() as temporary:
+                return self.measure(dpi,temporary)
+        file_name = os.path.join(folder,"accuracy_%s-%d.bmp" % ("".join(str(tool) for tool in self.tools),self.orientation))
+        timings = self.render(dpi,file_name)
+        result = self.analyse(file_name,dpi)
+        os.remove(file_name)
+        result['timings'] = dict(timings,**result['timings'])
+        x_expected,y_expected = self.expected()
+        difference = np.concatenate((result['x_offset']-x_expected,result['y_offset']-y_expected),axis=1)
+        result['dpi'] = dpi
+        result['rms_error'] = np.sqrt(np.mean(difference**2,axis=1))
+        result['max_error'] = np.max(np.abs(difference),axis=1)
+        common = sum(result['timings'][stage] for stage in common_stages)
+        result['time'] = np.array([common+result['timings'][stage] for stage in estimator_stages])
+        return result
+
+    def run(self,dpis=(300,600,1200,2400),progress=None):
+        """Measure the analysis at several resolutions
+
+        :param dpis: The resolutions in dots per inch
+        :param progress: Function that is called with the result of every resolution when it is measured
+        :return: List with the result of :meth:`harness.measure` for every resolution
+        :rtype: list
+        """
+        results = []
+        for dpi in dpis:
+            results.append(self.measure(dpi))
+            if progress is not None:
+                progress(results[-1])
+        return results
+
+
+def fastest(results,tolerance):
+    """Find the fastest estimator and resolution of which the largest error is within a tolerance
+
+    :param results: The results of :meth:`harness.run`
+    :param tolerance: Largest allowed error in meter
+    :return: The result of the resolution and the index of the estimator, or None when no estimator is accurate enough
+    :rtype: tuple
+    """
+    best = None
+    for result in results:
+        for i1 in range(n_estimators):
+            if result['max_error'][i1] <= tolerance and (best is None or result['time'][i1] < best[0]['time'][best[1]]):
+                best = (result,i1)
+    return best
+
+
+def table(results,tolerance=None):
+    """Format the speed and accuracy of every estimator at every resolution as a table
+
+    :param results: The results of :meth:`harness.run`
+    :param tolerance: Largest allowed error in meter. When given, the estimators that are accurate enough are marked, and the fastest of them is given.
+    :return: The table
+    :rtype: string
+    """
+    lines = ["%6s %-12s %10s %10s %10s\n" % ('dpi','estimator','time (s)','rms (um)','max (um)')]
+    for result in results:
+        for i1,name in enumerate(estimator_names):
+            line = "%6d %-12s %10.3f %10.2f %10.2f" % (result['dpi'],name,result['time'][i1],result['rms_error'][i1]*1e6,result['max_error'][i1]*1e6)
+            if tolerance is not None and result['max_error'][i1] <= tolerance:
+                line += " ok"
+            lines.append(line+"\n")
+    lines.append("\n%6s %s\n" % ('dpi','stages (s)'))
+    for result in results:
+        lines.append("%6d %s\n" % (result['dpi'],"  ".join("%s %.3f" % (stage,duration) for stage,duration in result['timings'].items())))
+        for stage,error in result['errors'].items():
+            lines.append("%6s %s failed: %s\n" % ('',stage,error))
+    if tolerance is not None:
+        best = fastest(results,tolerance)
+        if best is None:
+            lines.append("\nno estimator is within %.2f um\n" % (tolerance*1e6))
+        else:
+            lines.append("\nfastest within %.2f um: %s at %d dpi, %.3f s\n" % (tolerance*1e6,estimator_names[best[1]],best[0]['dpi'],best[0]['time'][best[1]]))
+    return "".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the speed and the accuracy of the analysis on rendered scans with known tool offsets")
+    parser.add_argument("--dpi",default="300,600,1200,2400",help="comma separated resolutions of the scans in dots per inch")
+    parser.add_argument("--tools",default="123",help="tools of the print, for example 123")
+    parser.add_argument("--reference-tool",type=int,default=harness.reference_tool,help="tool that prints the reference patterns")
+    parser.add_argument("--x-offsets",default=None,help="comma separated known x offsets of the tools in millimeter, by default random")
+    parser.add_argument("--y-offsets",default=None,help="comma separated known y offsets of the tools in millimeter, by default random")
+    parser.add_argument("--max-offset",type=float,default=harness.max_offset,help="largest random offset in millimeter")
+    parser.add_argument("--orientation",type=int,default=harness.orientation,help="orientation of the paper on the scanner, 1 to 4")
+    parser.add_argument("--blur",type=float,default=harness.blur,help="standard deviation of the blur in millimeter")
+    parser.add_argument("--noise",type=float,default=harness.noise,help="standard deviation of the noise as fraction of the full scale")
+    parser.add_argument("--skew",type=float,default=harness.skew,help="rotation of the paper in radians")
+    parser.add_argument("--seed",type=int,default=harness.seed,help="seed of the random offsets and the noise")
+    parser.add_argument("--fir-order",type=int,default=harness.fir_order,help="order of the band-pass filters of the fir quadrature detection")
+    parser.add_argument("--tolerance",type=float,default=None,help="largest allowed error in micrometer, to find the fastest estimator that is accurate enough")
+    parser.add_argument("--set",action="append",default=[],metavar="NAME=VALUE",help="change a parameter of the analysis, for example --set ver_x_use=0.3")
+    args = parser.parse_args()
+
+    settings = parse_settings(args.set)
+    tools = tuple(int(tool) for tool in args.tools)
+    measured = harness(calibration_pattern(pattern_config(),generator(printer_for_tools(max(tools)))),settings)
+    measured.tools = tools
+    measured.reference_tool = args.reference_tool
+    if args.x_offsets is not None:
+        measured.x_offsets = [float(offset) for offset in args.x_offsets.split(",")]
+    if args.y_offsets is not None:
+        measured.y_offsets = [float(offset) for offset in args.y_offsets.split(",")]
+    measured.max_offset = args.max_offset
+    measured.orientation = args.orientation
+    measured.blur = args.blur
+    measured.noise = args.noise
+    measured.skew = args.skew
+    measured.seed = args.seed
+    measured.fir_order = args.fir_order
+    known = measured.known_offsets()
+    print("known offsets (mm): %s" % (", ".join("T%d %.4f,%.4f" % (tool,x,y) for tool,(x,y) in known.items())))
+
+    def progress(result):
+        print("%d dpi: %s" % (result['dpi'],", ".join("%s %.3f s" % (stage,duration) for stage,duration in result['timings'].items())),flush=True)
+
+    results = measured.run([int(dpi) for dpi in args.dpi.split(",")],progress)
+    print()
+    print(table(results,args.tolerance*1e-6 if args.tolerance is not None else None))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+.. module:: aggregate
+    :synopsis: Combine the offsets of all scans of a printer into tool offsets for the gcode generator, updated scan by scan
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Every scan gives for every structure and every estimator an offset. Like the visualisation scripts of the Matlab analyser, the offsets of the two structures printed by the same nozzle are averaged first, which cancels the error that depends on the direction of printing. Per tool, the averaged offsets of all estimators and all structure pairs of the tool are compared to their median, and offsets that are further from the median than threshold times the median absolute deviation (scaled to a standard deviation) are rejected, for example an estimator that locked onto the wrong harmonic.
+
+For every printer, tool, direction and estimator the mean and variance of the accepted offsets of all scans are kept using Welford's method, so adding a scan takes the same time however many scans were added before. Estimator 0 is the mean of all accepted estimators. Since the offsets of all orientations are in the coordinates of the printer, scans of all orientations and of repeated prints are combined.
+"""
+import json
+import math
+import os
+import numpy as np
+
+t_95 = (12.706,4.303,3.182,2.776,2.571,2.447,2.365,2.306,2.262,2.228,2.201,2.179,2.160,2.145,2.131,2.120,2.110,2.101,2.093,2.086,2.080,2.074,2.069,2.064,2.060,2.056,2.052,2.048,2.045,2.042)
+"""Two sided 95% quantiles of the Student t distribution for 1 to 30 degrees of freedom, above which 1.96 is used"""
+
+directions = ('x','y')
+"""The directions of the offsets"""
+
+
+def welford(statistic,value):
+    """Add a value to a running mean and variance
+
+    :param statistic: List with the number of values, the mean and the sum of squared differences from the mean, which is updated
+    :param value: The value
+    """
+    statistic[0] += 1
+    delta = value-statistic[1]
+    statistic[1] += delta/statistic[0]
+    statistic[2] += delta*(value-statistic[1])
+
+
+def reject_outliers(values,threshold,min_spread):
+    """Find the values that are not outliers, using the median and the median absolute deviation
+
+    :param values: Array of values
+    :param threshold: Largest allowed distance from the median, in scaled median absolute deviations
+    :param min_spread: Smallest scaled median absolute deviation, such that values that agree to within this are never rejected
+    :return: True for the values that are accepted
+    :rtype: numpy.ndarray
+    """
+    median = np.median(values)
+    spread = max(1.4826*np.median(np.abs(values-median)),min_spread)
+    return np.abs(values-median) <= threshold*spread
+
+
+class aggregator:
+    """Running statistics of the offsets of the tools of printers. For example to add the scans of all orientations and get the offsets for the gcode generator:
+
+    .. code-block:: python
+
+        combined = aggregator()
+        for orientation in range(1,5):
+            combined.add(pipeline().analyse("example_12345-%d.bmp" % (orientation),5,orientation),"12345",printer="diabase")
+        offsets = combined.offsets("diabase",tool_list=(1,2,3,4,5))
+        gen.x_offsets = offsets['x_offsets']
+
+    """
+
+    threshold = 3.5
+    """Largest distance from the median of an accepted offset, in scaled median absolute deviations"""
+
+    min_spread = 1e-6
+    """Smallest scaled median absolute deviation used for rejecting outliers, in meter"""
+
+    estimator = 0
+    """Estimator that is used for the offsets, 0 for the mean of all accepted estimators or 1 to 8 for a single estimator"""
+
+    def __init__(self):
+        self.statistics = {}
+        """For every (printer, tool, direction, estimator) a list with the number of offsets, their mean and the sum of the squared differences from the mean"""
+        self.rejected = {}
+        """For every (printer, tool, direction) the number of rejected offsets"""
+        self._keys = set()
+
+    def add(self,result,nozzles,printer='',key=None):
+        """Add the offsets of a scan
+
+        :param result: The result of the scan with the x_offset and y_offset arrays of estimators by structures, see :meth:`pipeline.pipeline.analyse`
+        :param nozzles: The nozzles as string, for example "12345"
+        :param printer: Name of the printer
+        :param key: Unique key of the scan. A scan of which the key was already added is not added again.
+        :return: True when the scan was added
+        :rtype: bool
+        """
+        if key is not None:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+        tools = np.array([int(nozzle) for nozzle in nozzles])
+        for direction in directions:
+            offsets = np.asarray(result[direction+'_offset'],dtype=float)
+            #average the two structures of every nozzle
+            pairs = offsets[:,0::2]/2+offsets[:,1::2]/2
+            for tool in np.unique(tools):
+                values = pairs[:,tools == tool]
+                accepted = reject_outliers(values,self.threshold,self.min_spread)
+                rejected = (printer,int(tool),direction)
+                self.rejected[rejected] = self.rejected.get(rejected,0)+int(np.count_nonzero(~accepted))
+                for i1 in range(values.shape[0]):
+                    if accepted[i1].any():
+                        welford(self.statistics.setdefault((printer,int(tool),direction,i1+1),[0,0.0,0.0]),values[i1,accepted[i1]].mean())
+                welford(self.statistics.setdefault((printer,int(tool),direction,0),[0,0.0,0.0]),values[accepted].mean())
+        return True
+
+    def statistic(self,printer,tool,direction,estimator=None):
+        """Get the statistics of the offset of a tool
+
+        :param printer: Name of the printer
+        :param tool: Tool number
+        :param direction: 'x' or 'y'
+        :param estimator: The estimator, by default :attr:`aggregator.estimator`
+        :return: Dictionary with the number of scans ('count'), the mean offset ('mean'), the standard deviation of the offsets of the scans ('std') and the half width of the 95% confidence interval of the mean ('interval'), in meter. The standard deviation and the interval are None with fewer than two scans.
+        :rtype: dict
+        """
+        estimator = self.estimator if estimator is None else estimator
+        count,mean,m2 = self.statistics.get((printer,tool,direction,estimator),(0,math.nan,0.0))
+        if count < 2:
+            return {'count':count,'mean':mean,'std':None,'interval':None}
+        std = math.sqrt(m2/(count-1))
+        quantile = t_95[count-2] if count-1 <= len(t_95) else 1.96
+        return {'count':count,'mean':mean,'std':std,'interval':quantile*std/math.sqrt(count)}
+
+    def offsets(self,printer,tool_list=(1,2,3,4,5),x_offsets=None,y_offsets=None,estimator=None):
+        """Get the offsets for the gcode generator, which compensate the measured offsets. A tool offset in the printer config is measured as the same offset, so the measured offset is subtracted from the offset used for printing the samples.
+
+        The offsets are in the order of the tool list of the print, not of the tools of the printer, because the generator gives the i-th x_offsets and y_offsets to the i-th tool of the tool list. For example for a print of tools 3 and 4 the first offset is that of tool 3.
+
+        :param printer: Name of the printer
+        :param tool_list: The tool list of the print, as given to :meth:`calibration_pattern.calibration_pattern.full_interlocked_print`
+        :param x_offsets: The x offsets in millimeter that were used for printing the samples, in the order of the tool list, by default zero
+        :param y_offsets: The y offsets in millimeter that were used for printing the samples, in the order of the tool list, by default zero
+        :param estimator: The estimator, by default :attr:`aggregator.estimator`
+        :return: Dictionary with the x_offsets and y_offsets lists in millimeter, the lists x_intervals and y_intervals with the half widths of the 95% confidence intervals in millimeter (None when unknown) and the list counts with the number of scans of every tool. Tools without scans keep their offsets.
+        :rtype: dict
+        """
+        used = {'x':x_offsets if x_offsets is not None else [0]*len(tool_list),'y':y_offsets if y_offsets is not None else [0]*len(tool_list)}
+        result = {'counts':[]}
+        for direction in directions:
+            result[direction+'_offsets'] = []
+            result[direction+'_intervals'] = []
+        for i1,tool in enumerate(tool_list):
+            counts = []
+            for direction in directions:
+                found = self.statistic(printer,tool,direction,estimator)
+                counts.append(found['count'])
+                if found['count'] == 0:
+                    result[direction+'_offsets'].append(used[direction][i1])
+                    result[direction+'_intervals'].append(None)
+                else:
+                    result[direction+'_offsets'].append(used[direction][i1]-found['mean']*1e3)
+                    result[direction+'_intervals'].append(found['interval']*1e3 if found['interval'] is not None else None)
+            result['counts'].append(min(counts))
+        return result
+
+    def reset(self,printer=None):
+        """Forget the offsets of a printer, for example after its offsets were changed
+
+        :param printer: Name of the printer, by default all printers
+        """
+        self.statistics = {key:value for key,value in self.statistics.items() if printer is not None and key[0] != printer}
+        self.rejected = {key:value for key,value in self.rejected.items() if printer is not None and key[0] != printer}
+
+    def save(self,file_name):
+        """Save the statistics to a JSON file
+
+        :param file_name: Name of the file
+        """
+        with open(file_name+'.tmp','w') as f:
+            json.dump({'statistics':[list(key)+value for key,value in self.statistics.items()],
+                       'rejected':[list(key)+[value] for key,value in self.rejected.items()],
+                       'keys':sorted(self._keys)},f)
+        os.replace(file_name+'.tmp',file_name)
+
+    @classmethod
+    def load(cls,file_name):
+        """Load statistics saved by :meth:`aggregator.save`
+
+        :param file_name: Name of the file
+        :return: The aggregator
+        :rtype: aggregator
+        """
+        result = cls()
+        with open(file_name) as f:
+            data = json.load(f)
+        result.statistics = {tuple(item[:4]):item[4:] for item in data['statistics']}
+        result.rejected = {tuple(item[:3]):item[3] for item in data['rejected']}
+        result._keys = set(data['keys'])
+        return result
@@ -0,0 +1,363 @@
+"""
+.. module:: batch
+    :synopsis: Analyse all scans in a folder in parallel, keeping the results of scans that did not change
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Scans are found by their name, <sample>_<nozzles>-<orientation>.bmp, for example "example_12345-1.bmp" for a sample named example printed using nozzles 1,2,3,4 and 5 in orientation 1. Every scan is analysed by :class:`pipeline.pipeline` in a pool of processes. The result of every scan is stored in a cache folder, under a hash of the content of the scan and of the parameters of the analysis, so only new or changed scans are analysed again. The hash of a scan is kept together with its size and modification time, such that unchanged scans are not read at all.
+
+The results are merged per sample into result_<sample>_<nozzles>.npz files with the arrays x_offset_mat and y_offset_mat. Like the cell arrays of the Matlab analyser, x_offset_mat[i1] contains the offsets of estimator i1 (see :mod:`pipeline`) with a row for every orientation and a column for every structure. Orientations that were not analysed are zero.
+"""
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import time
+import numpy as np
+
+from parameters import parameters,parse_settings
+from pipeline import pipeline,n_estimators
+from scan import scan
+from store import store
+from aggregate import aggregator
+
+version = 1
+"""Version of the analysis, part of the keys of the cache such that changes of the analysis invalidate old results"""
+
+scan_name = re.compile(r"^(?P<sample>.+)_(?P<nozzles>\d+)-(?P<orientation>[1-4])\.bmp$")
+"""Pattern of the names of the scans"""
+
+
+def discover(folder):
+    """Find the scans in a folder
+
+    :param folder: The folder
+    :return: List of tuples with the file name, the sample name, the nozzles (as string) and the orientation of every scan, sorted by file name
+    :rtype: list
+    """
+    found = []
+    for name in sorted(os.listdir(folder)):
+        match = scan_name.match(name)
+        if match:
+            found.append((os.path.join(folder,name),match.group('sample'),match.group('nozzles'),int(match.group('orientation'))))
+    return found
+
+
+def file_hash(file_name,chunk_size=1 << 22):
+    """Calculate the hash of the content of a file
+
+    :param file_name: The file
+    :param chunk_size: Number of bytes that is read at once
+    :return: The hash as hexadecimal string
+    :rtype: str
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_name,'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size),b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def analyse_scan(analyser,file_name,n,orientation,buffers=None):
+    """Analyse one scan and convert the result such that it can be stored as JSON
+
+    :param analyser: The :class:`pipeline.pipeline`
+    :param file_name: The scan
+    :param n: Number of nozzles
+    :param orientation: The orientation of the paper on the scanner
+    :param buffers: Buffers for the levels of the scan, see :attr:`scan.scan.buffers`
+    :return: Dictionary with the x and y offsets as lists, the angle of the bottom line and the time spent on every stage, or with the error when the scan could not be analysed
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    image = None
+    try:
+        image = scan(file_name)
+        image.buffers = buffers
+        result = analyser.analyse(image,n,orientation)
+    except Exception as error:
+        return {'error':str(error),'timings':{'total':time.perf_counter()-start}}
+    finally:
+        if image is not None:
+            image.close()
+    result['timings']['total'] = time.perf_counter()-start
+    return {'x_offset':result['x_offset'].tolist(),
+            'y_offset':result['y_offset'].tolist(),
+            'angle_bottom':result['angle_bottom'],
+            'timings':result['timings']}
+
+
+def _analyse_scan(file_name,n,orientation,values):
+    """Analyse one scan in a worker process
+    """
+    return analyse_scan(pipeline(parameters(**values)),file_name,n,orientation)
+
+
+class batch:
+    """Analyses all scans in a folder. For example:
+
+    .. code-block:: python
+
+        runner = batch(parameters(structure_period=0.004))
+        report = runner.run("data/")
+
+    :param settings: The :class:`parameters.parameters` of the analysis, when not given the defaults are used
+    """
+
+    workers = None
+    """Number of processes that analyse scans at the same time, by default the number of processors"""
+
+    cache_folder = None
+    """Folder in which the results of the scans are kept, by default a folder named .analyser_cache in the folder of the scans"""
+
+    output_folder = None
+    """Folder to which the results of the samples are written, by default the folder of the scans"""
+
+    store = None
+    """The :class:`store.store` to which the offsets of every scan are appended, if any"""
+
+    aggregator = None
+    """The :class:`aggregate.aggregator` to which the offsets of every scan are added, if any"""
+
+    printer = ''
+    """Name of the printer of the scans, used for the store and the aggregator"""
+
+    def __init__(self,settings=None):
+        self.settings = parameters() if settings is None else settings
+        self.cache = None
+        """The cache folder that is used, set by :meth:`batch.open_cache`"""
+        self._index = {}
+
+    def open_cache(self,folder):
+        """Make the cache folder and load the known hashes of the scans
+
+        :param folder: The folder with the scans
+        :return: The cache folder
+        :rtype: str
+        """
+        self.cache = self.cache_folder if self.cache_folder is not None else os.path.join(folder,'.analyser_cache')
+        os.makedirs(self.cache,exist_ok=True)
+        index_name = os.path.join(self.cache,'index.json')
+        if os.path.isfile(index_name):
+            with open(index_name) as f:
+                self._index = json.load(f)
+        else:
+            self._index = {}
+        return self.cache
+
+    def save_index(self):
+        """Save the known hashes of the scans in the cache folder
+        """
+        with open(os.path.join(self.cache,'index.json'),'w') as f:
+            json.dump(self._index,f)
+
+    def cached(self,key):
+        """Get a result from the cache
+
+        :param key: The key of the result, see :meth:`batch.key`
+        :return: The result, or None when it is not in the cache
+        :rtype: dict
+        """
+        file_name = os.path.join(self.cache,key+'.json')
+        if not os.path.isfile(file_name):
+            return None
+        with open(file_name) as f:
+            return json.load(f)
+
+    def cache_result(self,key,result):
+        """Put a result in the cache
+
+        :param key: The key of the result, see :meth:`batch.key`
+        :param result: The result
+        """
+        with open(os.path.join(self.cache,key+'.json'),'w') as f:
+            json.dump(result,f)
+
+    def scan_hash(self,file_name):
+        """Get the hash of the content of a scan. The hash is only calculated again when the size or the modification time of the file changed.
+
+        :param file_name: The scan
+        :return: The hash as hexadecimal string
+        :rtype: str
+        """
+        status = os.stat(file_name)
+        path = os.path.abspath(file_name)
+        known = self._index.get(path)
+        if known is not None and known[0] == status.st_size and known[1] == status.st_mtime_ns:
+            return known[2]
+        digest = file_hash(file_name)
+        self._index[path] = [status.st_size,status.st_mtime_ns,digest]
+        return digest
+
+    def key(self,file_name,n,orientation):
+        """Get the key of the result of a scan in the cache, from the content of the scan and the parameters of the analysis
+
+        :param file_name: The scan
+        :param n: Number of nozzles
+        :param orientation: The orientation of the paper on the scanner
+        :return: The key
+        :rtype: str
+        """
+        values = dict(self.settings.values(),n=n)
+        description = json.dumps([version,orientation,values],sort_keys=True)
+        return self.scan_hash(file_name)+'-'+hashlib.blake2b(description.encode(),digest_size=10).hexdigest()
+
+    def record(self,file_name,sample,nozzles,orientation,key,result):
+        """Append the offsets of a scan to the store and add them to the aggregator, when these are used and the scan was not added before
+
+        :param file_name: The scan, of which the modification time is used as the time of the scan
+        :param sample: Name of the sample
+        :param nozzles: The nozzles as string
+        :param orientation: The orientation of the paper on the scanner
+        :param key: The key of the scan, see :meth:`batch.key`
+        :param result: The result of the scan
+        """
+        if 'error' in result:
+            return
+        #the same content may be scanned under another name, which is another scan
+        scan_key = os.path.basename(file_name)+'/'+key
+        if self.store is not None:
+            self.store.append_scan(result,sample,nozzles,orientation,self.printer,os.path.getmtime(file_name),scan_key)
+        if self.aggregator is not None:
+            self.aggregator.add(result,nozzles,self.printer,scan_key)
+
+    def run(self,folder):
+        """Analyse all new or changed scans in a folder and write the results of every sample
+
+        :param folder: The folder with the scans
+        :return: Report with the number of scans ('scans'), analysed scans ('analysed'), scans taken from the cache ('cached'), the errors of scans that could not be analysed ('failed'), the written result files ('outputs'), the total time ('time'), the throughput in scans and megabytes per second of analysed scans ('scans_per_second' and 'megabytes_per_second') and the total time of every stage of the analysis ('stages')
+        :rtype: dict
+        """
+        start = time.perf_counter()
+        self.open_cache(folder)
+        scans = discover(folder)
+
+        results = {}
+        keys = {}
+        todo = []
+        for file_name,sample,nozzles,orientation in scans:
+            key = self.key(file_name,len(nozzles),orientation)
+            keys[file_name] = key
+            cached = self.cached(key)
+            if cached is not None:
+                results[file_name] = cached
+            else:
+                todo.append((file_name,len(nozzles),orientation,key))
+        self.save_index()
+
+        analyse_start = time.perf_counter()
+        if todo:
+            values = self.settings.values()
+            with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {pool.submit(_analyse_scan,file_name,n,orientation,values):(file_name,key) for file_name,n,orientation,key in todo}
+                for future in concurrent.futures.as_completed(futures):
+                    file_name,key = futures[future]
+                    result = future.result()
+                    results[file_name] = result
+                    if 'error' not in result:
+                        self.cache_result(key,result)
+        analyse_time = time.perf_counter()-analyse_start
+
+        outputs = self.merge(scans,results,folder)
+        for file_name,sample,nozzles,orientation in scans:
+            self.record(file_name,sample,nozzles,orientation,keys[file_name],results[file_name])
+        stages = {}
+        for file_name,n,orientation,key in todo:
+            for stage,duration in results[file_name]['timings'].items():
+                stages[stage] = stages.get(stage,0)+duration
+        analysed_bytes = sum(os.path.getsize(file_name) for file_name,n,orientation,key in todo)
+        return {'scans':len(scans),
+                'analysed':len(todo),
+                'cached':len(scans)-len(todo),
+                'failed':{file_name:result['error'] for file_name,result in results.items() if 'error' in result},
+                'outputs':outputs,
+                'time':time.perf_counter()-start,
+                'scans_per_second':len(todo)/analyse_time if todo else 0,
+                'megabytes_per_second':analysed_bytes/1e6/analyse_time if todo else 0,
+                'stages':stages}
+
+    def merge(self,scans,results,folder):
+        """Merge the results of the scans per sample and write them to result_<sample>_<nozzles>.npz files
+
+        :param scans: The scans, see :meth:`batch.discover`
+        :param results: For every scan file name the result of the analysis
+        :param folder: The folder of the scans
+        :return: The names of the written files
+        :rtype: list
+        """
+        samples = {}
+        for file_name,sample,nozzles,orientation in scans:
+            result = results.get(file_name)
+            if result is None or 'error' in result:
+                continue
+            if (sample,nozzles) not in samples:
+                x_offset_mat = np.zeros((n_estimators,4,2*len(nozzles)))
+                y_offset_mat = np.zeros((n_estimators,4,2*len(nozzles)))
+                samples[(sample,nozzles)] = (x_offset_mat,y_offset_mat)
+            x_offset_mat,y_offset_mat = samples[(sample,nozzles)]
+            x_offset_mat[:,orientation-1,:] = result['x_offset']
+            y_offset_mat[:,orientation-1,:] = result['y_offset']
+        output = self.output_folder if self.output_folder is not None else folder
+        outputs = []
+        for (sample,nozzles),(x_offset_mat,y_offset_mat) in samples.items():
+            file_name = os.path.join(output,'result_%s_%s.npz' % (sample,nozzles))
+            np.savez(file_name,x_offset_mat=x_offset_mat,y_offset_mat=y_offset_mat)
+            outputs.append(file_name)
+        return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse all scans of interlocked calibration patterns in a folder")
+    parser.add_argument("folder",help="folder with the scans, named <sample>_<nozzles>-<orientation>.bmp")
+    parser.add_argument("--workers",type=int,default=None,help="number of processes, by default the number of processors")
+    parser.add_argument("--cache",default=None,help="folder in which the results of the scans are kept")
+    parser.add_argument("--output",default=None,help="folder to which the results of the samples are written")
+    parser.add_argument("--store",default=None,help="folder of the store to which the offsets of every scan are appended")
+    parser.add_argument("--printer",default='',help="name of the printer of the scans, used for the store and the aggregated offsets")
+    parser.add_argument("--aggregate",default=None,help="JSON file with the aggregated offsets of the printer, which is updated with the scans")
+    parser.add_argument("--tools",default="1,2,3,4,5",help="tool list of the prints, the aggregated offsets are given in this order like the x_offsets and y_offsets of the gcode generator")
+    parser.add_argument("--set",action="append",default=[],metavar="NAME=VALUE",help="change a parameter of the analysis, for example --set structure_period=0.004")
+    args = parser.parse_args()
+
+    settings = parse_settings(args.set)
+    runner = batch(parameters(**settings))
+    runner.workers = args.workers
+    runner.cache_folder = args.cache
+    runner.output_folder = args.output
+    if args.store is not None:
+        runner.store = store(args.store)
+    runner.printer = args.printer
+    if args.aggregate is not None:
+        runner.aggregator = aggregator.load(args.aggregate) if os.path.isfile(args.aggregate) else aggregator()
+    report = runner.run(args.folder)
+    print("%d scans, %d analysed, %d from the cache, %d failed in %.1f s" % (report['scans'],report['analysed'],report['cached'],len(report['failed']),report['time']))
+    if report['analysed']:
+        print("%.2f scans/s, %.1f MB/s" % (report['scans_per_second'],report['megabytes_per_second']))
+        for stage,duration in report['stages'].items():
+            print("%-12s %8.2f s" % (stage,duration))
+    for file_name,error in report['failed'].items():
+        print("%s: %s" % (file_name,error))
+    for file_name in report['outputs']:
+        print("written " + file_name)
+    if args.aggregate is not None:
+        runner.aggregator.save(args.aggregate)
+        print_offsets(runner.aggregator,args.printer,[int(tool) for tool in args.tools.split(',')])
+
+
+def print_offsets(combined,printer,tool_list):
+    """Print the aggregated offsets of a printer, in the form used by the gcode generator. Like the x_offsets and y_offsets of the generator, the i-th offset is that of the i-th tool of the tool list of the print (see :meth:`aggregate.aggregator.offsets`).
+
+    :param combined: The :class:`aggregate.aggregator`
+    :param printer: Name of the printer
+    :param tool_list: The tool list of the print
+    """
+    offsets = combined.offsets(printer,tool_list)
+    for direction in ('x','y'):
+        print("%s_offsets = [%s]" % (direction,",".join("%.4f" % (offset) for offset in offsets[direction+'_offsets'])))
+        print("%s_intervals = [%s]" % (direction,",".join("%.4f" % (interval) if interval is not None else "None" for interval in offsets[direction+'_intervals'])))
+    print("scans = %s" % (offsets['counts']))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+.. module:: correlation
+    :synopsis: Offset between structures from the peak of their circular cross correlation
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+This replaces calculate_offset_cor of the Matlab analyser (offset{5}). That function interpolates both profiles ten times and convolves them directly, which is slow and limits the resolution to a tenth of a pixel. Here the circular cross correlation of the raw masked profiles of all structures is calculated at once in the frequency domain. The peak is then searched within one structure period and refined to a fraction of a pixel. The correlation is a sum of sines, so between the samples it is known exactly. The phase method finds the peak of this band limited correlation using a few Newton steps, which is where the phases of the cross spectrum weighted by frequency and magnitude cancel. The parabolic method fits a parabola through the highest sample and its neighbours, which is cheaper but slightly biased.
+
+All lengths are in meter, like in the Matlab analyser. Like the quadrature offsets, the offset is the shift of the signal relative to the reference minus half a period, so it is zero when the lines of the signal are exactly between the lines of the reference.
+"""
+import numpy as np
+
+newton_steps = 4
+"""Number of Newton steps used to find the peak of the band limited correlation with the phase method"""
+
+
+def cross_spectrum(ref,sig):
+    """Calculate the cross spectrum of profiles after subtracting their mean
+
+    :param ref: The masked reference profiles, along the last axis
+    :param sig: The masked signal profiles, along the last axis. Should broadcast against the reference profiles.
+    :return: The positive frequency bins of the cross spectrum
+    :rtype: numpy.ndarray
+    """
+    ref = np.asarray(ref,dtype=float)
+    sig = np.asarray(sig,dtype=float)
+    ref = ref-ref.mean(axis=-1,keepdims=True)
+    sig = sig-sig.mean(axis=-1,keepdims=True)
+    return np.fft.rfft(sig,axis=-1)*np.conj(np.fft.rfft(ref,axis=-1))
+
+
+def _parabola(correlation,peak):
+    n = correlation.shape[-1]
+    before = np.take_along_axis(correlation,(peak-1)[...,None] % n,axis=-1)[...,0]
+    center = np.take_along_axis(correlation,peak[...,None] % n,axis=-1)[...,0]
+    after = np.take_along_axis(correlation,(peak+1)[...,None] % n,axis=-1)[...,0]
+    curvature = before-2*center+after
+    shift = np.where(curvature < 0,0.5*(before-after)/np.where(curvature < 0,curvature,-1),0)
+    return peak+np.clip(shift,-0.5,0.5)
+
+
+def _newton(spectrum,lag,n):
+    """Move the lags to the nearest peak of the band limited correlation
+    """
+    k = np.arange(spectrum.shape[-1])
+    weight = np.full(spectrum.shape[-1],2.0)
+    weight[0] = 1
+    if n % 2 == 0:
+        weight[-1] = 1
+    magnitude = np.abs(spectrum)*weight
+    phase = np.angle(spectrum)
+    omega = 2*np.pi*k/n
+    for i1 in range(newton_steps):
+        argument = phase+omega*lag[...,None]
+        slope = -(magnitude*omega*np.sin(argument)).sum(axis=-1)
+        curvature = -(magnitude*omega**2*np.cos(argument)).sum(axis=-1)
+        step = np.where(curvature < 0,-slope/np.where(curvature < 0,curvature,-1),0)
+        lag = lag+np.clip(step,-0.5,0.5)
+    return lag
+
+
+def correlation_offsets(ref,sig,dy,period,method="phase"):
+    """Calculate the offsets between masked reference and signal profiles from the peak of their circular cross correlation, the equivalent of offset{5} of the Matlab analyser. For example for the profiles of all structures of a scan stacked into arrays of structures by samples (see :meth:`quadrature.mask_profiles`):
+
+    .. code-block:: python
+
+        offsets = correlation_offsets(ref,sig,dy,structure_period)
+
+    :param ref: The masked reference profiles, along the last axis
+    :param sig: The masked signal profiles, along the last axis. Should broadcast against the reference profiles.
+    :param dy: Pixel size along the profiles
+    :param period: Period of the structures
+    :param method: How the peak is refined between the samples, "phase" (peak of the band limited correlation), "parabolic" or "none"
+    :return: The offsets
+    :rtype: numpy.ndarray
+    """
+    if method not in ("phase","parabolic","none"):
+        raise Exception("Unknown peak refinement method " + str(method))
+    spectrum = cross_spectrum(ref,sig)
+    n = np.shape(ref)[-1]
+    correlation = np.fft.irfft(spectrum,n,axis=-1)
+    #the correlation repeats every period, so only lags within one period are searched
+    samples = int(np.ceil(period/dy))
+    if samples >= n:
+        raise Exception("The profiles should be longer than one period")
+    peak = np.argmax(correlation[...,:samples+1],axis=-1)
+    if method == "none":
+        lag = peak.astype(float)
+    else:
+        lag = _parabola(correlation,peak)
+        if method == "phase":
+            lag = _newton(spectrum,lag,n)
+    shift = lag*dy-period/2
+    return (shift+period/2) % period-period/2
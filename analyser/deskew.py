@@ -0,0 +1,252 @@
+"""
+.. module:: deskew
+    :synopsis: Resample regions of a scan in a straightened frame, with a single bicubic interpolation
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The Matlab analyser rotates the whole scan by the nominal rotation, cuts out the box and rotates the box again by the measured angle of its bottom line, both for the gray image and for the binary image. Two rotations after each other are a single rotation and a shift, so here both are combined into one affine map from a straightened frame to the pixels of the scan. Only the regions of this frame that are needed, for example the windows around the structures, are resampled, once, using bicubic interpolation with the same kernel as imrotate. The binary image is made from the resampled gray values instead of being rotated separately. Outside of the scan the color of the paper is used, so the colors do not have to be inverted before rotating.
+
+Coordinates are in pixels, as (row, column), with angles in degrees that are counter clockwise on the screen like in imrotate.
+"""
+import math
+import numpy as np
+
+cubic_a = -0.5
+"""Parameter of the cubic convolution kernel, the same as used by imrotate and interp2"""
+
+band_rows = 256
+"""Number of rows of a frame that is resampled at once"""
+
+
+def _cubic_weights(t):
+    """Weights of the cubic convolution kernel for the samples at -1, 0, 1 and 2 from a point at fraction t between sample 0 and 1
+    """
+    a = cubic_a
+    t2 = t*t
+    t3 = t2*t
+    return (a*(t3-2*t2+t),
+            (a+2)*t3-(a+3)*t2+1,
+            -(a+2)*t3+(2*a+3)*t2-a*t,
+            a*(t2-t3))
+
+
+def _region(image,row,column,height,width,fill):
+    """Get a region of an image, which is either an array or a :class:`scan.scan`, padded with the fill value
+    """
+    if hasattr(image,"gray"):
+        return image.gray(row,column,height,width).astype(np.float32)
+    result = np.full((height,width),fill,dtype=np.float32)
+    row0 = max(row,0)
+    row1 = min(row+height,image.shape[0])
+    column0 = max(column,0)
+    column1 = min(column+width,image.shape[1])
+    if row1 > row0 and column1 > column0:
+        result[row0-row:row1-row,column0-column:column1-column] = image[row0:row1,column0:column1]
+    return result
+
+
+def bicubic(image,rows,columns,fill=255):
+    """Interpolate an image at arbitrary points using cubic convolution. Only the region of the image around the points is read.
+
+    :param image: A two dimensional array or a :class:`scan.scan`
+    :param rows: Array with the row coordinates of the points
+    :param columns: Array with the column coordinates of the points, of the same shape
+    :param fill: Value of the image outside of its edges
+    :return: The interpolated values
+    :rtype: numpy.ndarray
+    """
+    row_base = np.floor(rows).astype(np.int64)
+    column_base = np.floor(columns).astype(np.int64)
+    row0 = int(row_base.min())-1
+    column0 = int(column_base.min())-1
+    region = _region(image,row0,column0,int(row_base.max())+3-row0,int(column_base.max())+3-column0,fill)
+    row_weights = _cubic_weights((rows-row_base).astype(np.float32))
+    column_weights = _cubic_weights((columns-column_base).astype(np.float32))
+    stride = region.shape[1]
+    flat = region.ravel()
+    index = (row_base-row0-1)*stride+(column_base-column0-1)
+    result = np.zeros(np.shape(rows),dtype=np.float32)
+    for i1 in range(4):
+        partial = column_weights[0]*flat[index]
+        for i2 in range(1,4):
+            partial += column_weights[i2]*flat[index+i2]
+        result += row_weights[i1]*partial
+        index += stride
+    return result
+
+
+class deskew:
+    """Affine map from a straightened frame to the pixels of a scan. The frame is made by rotating the scan by angle around the scan pixel center and keeping shape pixels around it, like imrotate with the crop option. Further rotations and crops can be added, after which regions are resampled at once. For example to rotate by the nominal rotation, cut out a box and straighten it, and read the window of a structure:
+
+    .. code-block:: python
+
+        frame = deskew(15,(image.rows/2,image.columns/2),image.shape)
+        frame = frame.crop(box_row,box_column,box_height,box_width).rotate(angle_bottom)
+        window = frame.window(image,row,column,height,width)
+
+    :param angle: Rotation in degrees
+    :param center: Position in the scan (row, column) of the center of the frame
+    :param shape: Size of the frame in pixels (rows, columns)
+    """
+
+    def __init__(self,angle,center,shape):
+        rotation = math.radians(angle)
+        c = math.cos(rotation)
+        s = math.sin(rotation)
+        self.matrix = np.array([[c,s],[-s,c]])
+        """Matrix that maps the frame coordinates to scan coordinates"""
+        self.shape = (int(shape[0]),int(shape[1]))
+        """Size of the frame in pixels (rows, columns)"""
+        frame_center = (np.array(self.shape)-1)/2
+        self.offset = np.asarray(center,dtype=float)-self.matrix@frame_center
+        """Scan coordinates of pixel (0,0) of the frame"""
+
+    def _copy(self,matrix,offset,shape):
+        result = object.__new__(deskew)
+        result.matrix = matrix
+        result.offset = offset
+        result.shape = (int(shape[0]),int(shape[1]))
+        return result
+
+    @property
+    def angle(self):
+        """Total rotation of the frame in degrees"""
+        return math.degrees(math.atan2(self.matrix[0,1],self.matrix[0,0]))
+
+    def to_scan(self,rows,columns):
+        """Convert frame coordinates to scan coordinates
+
+        :param rows: Rows in the frame
+        :param columns: Columns in the frame
+        :return: The rows and the columns in the scan
+        :rtype: tuple
+        """
+        rows = np.asarray(rows,dtype=float)
+        columns = np.asarray(columns,dtype=float)
+        return (self.offset[0]+self.matrix[0,0]*rows+self.matrix[0,1]*columns,
+                self.offset[1]+self.matrix[1,0]*rows+self.matrix[1,1]*columns)
+
+    def from_scan(self,rows,columns):
+        """Convert scan coordinates to frame coordinates
+
+        :param rows: Rows in the scan
+        :param columns: Columns in the scan
+        :return: The rows and the columns in the frame
+        :rtype: tuple
+        """
+        inverse = np.linalg.inv(self.matrix)
+        rows = np.asarray(rows,dtype=float)-self.offset[0]
+        columns = np.asarray(columns,dtype=float)-self.offset[1]
+        return (inverse[0,0]*rows+inverse[0,1]*columns,
+                inverse[1,0]*rows+inverse[1,1]*columns)
+
+    def crop(self,row,column,height,width):
+        """Get the frame of a region of this frame
+
+        :param row: First row of the region
+        :param column: First column of the region
+        :param height: Number of rows of the region
+        :param width: Number of columns of the region
+        :return: The new frame
+        :rtype: deskew
+        """
+        return self._copy(self.matrix,self.offset+self.matrix@np.array([row,column],dtype=float),(height,width))
+
+    def rotate(self,angle):
+        """Get the frame that is made by rotating this frame around its center, like imrotate with the crop option
+
+        :param angle: Rotation in degrees
+        :return: The new frame
+        :rtype: deskew
+        """
+        rotation = deskew(angle,(0,0),(1,1)).matrix
+        center = (np.array(self.shape)-1)/2
+        return self._copy(self.matrix@rotation,self.offset+self.matrix@(center-rotation@center),self.shape)
+
+    def rot90(self):
+        """Get the frame that is made by rotating this frame by 90 degrees counter clockwise, like rot90, which swaps its rows and columns
+
+        :return: The new frame
+        :rtype: deskew
+        """
+        matrix = self.matrix@np.array([[0.0,1.0],[-1.0,0.0]])
+        offset = self.offset+self.matrix@np.array([0.0,self.shape[1]-1])
+        return self._copy(matrix,offset,(self.shape[1],self.shape[0]))
+
+    def level(self,level):
+        """Get the frame for a downsampled level of the scan (see :meth:`scan.scan.level`), in which both the pixels of the frame and of the scan are 2^level times larger
+
+        :param level: The level
+        :return: The new frame
+        :rtype: deskew
+        """
+        factor = 1 << level
+        half = (factor-1)/2
+        offset = (self.offset+self.matrix@np.array([half,half])-half)/factor
+        return self._copy(self.matrix,offset,(self.shape[0]//factor,self.shape[1]//factor))
+
+    def window(self,image,row,column,height,width,fill=255):
+        """Resample a region of the frame
+
+        :param image: The scan, or a two dimensional array
+        :param row: First row of the region
+        :param column: First column of the region
+        :param height: Number of rows of the region
+        :param width: Number of columns of the region
+        :param fill: Value of the image outside of its edges
+        :return: The resampled gray values
+        :rtype: numpy.ndarray
+        """
+        result = np.empty((int(height),int(width)),dtype=np.float32)
+        columns = np.arange(column,column+width,dtype=float)
+        for start in range(0,int(height),band_rows):
+            rows = np.arange(row+start,row+min(start+band_rows,height),dtype=float)
+            scan_rows,scan_columns = self.to_scan(rows[:,None],columns[None,:])
+            result[start:start+len(rows)] = bicubic(image,scan_rows,scan_columns,fill)
+        return result
+
+    def resample(self,image,fill=255):
+        """Resample the whole frame
+
+        :param image: The scan, or a two dimensional array
+        :param fill: Value of the image outside of its edges
+        :return: The resampled gray values
+        :rtype: numpy.ndarray
+        """
+        return self.window(image,0,0,self.shape[0],self.shape[1],fill)
+
+
+def box_filter(image,size,fill=255):
+    """Average an image over square blocks, like imfilter with fspecial('average',size), using cumulative sums. Outside of the image the fill value is used.
+
+    :param image: Two dimensional array
+    :param size: Size of the blocks in pixels
+    :param fill: Value of the image outside of its edges
+    :return: The averaged image
+    :rtype: numpy.ndarray
+    """
+    size = max(int(size),1)
+    before = (size-1)//2
+    after = size-1-before
+    padded = np.pad(np.asarray(image,dtype=np.float64),((before+1,after),(before+1,after)),constant_values=fill)
+    padded[0,:] = 0
+    padded[:,0] = 0
+    np.cumsum(padded,axis=0,out=padded)
+    np.cumsum(padded,axis=1,out=padded)
+    total = padded[size:,size:]-padded[:-size,size:]
+    total -= padded[size:,:-size]
+    total += padded[:-size,:-size]
+    total *= 1/(size*size)
+    return total.astype(np.float32)
+
+
+def dark_mask(image,size,threshold,fill=255):
+    """Find the dark parts of an image after averaging, like I_bw of the Matlab analyser
+
+    :param image: Two dimensional array
+    :param size: Size of the averaging blocks in pixels
+    :param threshold: Gray value below which the averaged image is dark
+    :param fill: Value of the image outside of its edges
+    :return: True where the image is dark
+    :rtype: numpy.ndarray
+    """
+    return box_filter(image,size,fill) < threshold
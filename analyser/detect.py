@@ -0,0 +1,325 @@
+"""
+.. module:: detect
+    :synopsis: Coarse to fine detection of the box and the structures in a scan
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The Matlab analyser labels all connected dark areas of the thresholded full resolution scan to find the box, and again for the structures, and builds coordinate matrices of the size of the scan to find the pixels of the box. Here the box and the structures are found on a downsampled level of the scan (see :meth:`scan.scan.level`), where the average filter that is used before thresholding is only a few pixels wide. Connected areas are found from the runs of dark pixels in every row, which are joined using union-find, without labelling pixels one by one. The bottom line of the box and the edges of the structures are then refined at full resolution, only inside narrow bands around the edges that were found on the coarse level, see :mod:`deskew`.
+
+Positions are in pixels of the full resolution scan, as (row, column), unless stated otherwise.
+"""
+import math
+import numpy as np
+
+from deskew import deskew,bicubic,dark_mask
+from parameters import parameters
+
+
+def runs(mask):
+    """Find the runs of true values in every row of a mask
+
+    :param mask: Two dimensional boolean array
+    :return: The row, the first column and the column after the last column of every run, in row major order
+    :rtype: tuple
+    """
+    mask = np.asarray(mask,dtype=bool)
+    padded = np.zeros((mask.shape[0],mask.shape[1]+2),dtype=np.int8)
+    padded[:,1:-1] = mask
+    change = np.diff(padded,axis=1)
+    rows,starts = np.nonzero(change == 1)
+    stops = np.nonzero(change == -1)[1]
+    return rows,starts,stops
+
+
+def _union(n,first,second):
+    """Find the root of every element after joining the given pairs of elements
+    """
+    parent = np.arange(n)
+    while len(first):
+        root_first = parent[first]
+        root_second = parent[second]
+        different = root_first != root_second
+        if not different.any():
+            break
+        root_first = root_first[different]
+        root_second = root_second[different]
+        lowest = np.minimum(root_first,root_second)
+        np.minimum.at(parent,root_first,lowest)
+        np.minimum.at(parent,root_second,lowest)
+        #point every element directly to its root
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped,parent):
+                break
+            parent = jumped
+    return parent
+
+
+def components(mask):
+    """Find the 8-connected areas of a mask, like bwconncomp and regionprops
+
+    :param mask: Two dimensional boolean array
+    :return: A label image (0 outside of the areas, and from 1 to the number of areas inside) and a dictionary with for every area the area in pixels ('area'), the bounding box ('top', 'left', 'height' and 'width') and the centroid ('row' and 'column')
+    :rtype: tuple
+    """
+    mask = np.asarray(mask,dtype=bool)
+    rows,starts,stops = runs(mask)
+    n = len(rows)
+    #runs in the previous row touch a run when they overlap, or meet diagonally
+    key = mask.shape[1]+2
+    start_key = rows*key+starts
+    stop_key = rows*key+stops
+    previous = (rows-1)*key
+    low = np.searchsorted(stop_key,previous+starts,side='left')
+    high = np.searchsorted(start_key,previous+stops,side='right')
+    count = np.maximum(high-low,0)
+    second = np.repeat(np.arange(n),count)
+    first = np.repeat(low,count)+np.arange(count.sum())-np.repeat(np.cumsum(count)-count,count)
+    roots = _union(n,first,second)
+    unique,run_label = np.unique(roots,return_inverse=True)
+    n_areas = len(unique)
+
+    lengths = stops-starts
+    area = np.bincount(run_label,weights=lengths,minlength=n_areas)
+    top = np.full(n_areas,mask.shape[0])
+    bottom = np.full(n_areas,-1)
+    left = np.full(n_areas,mask.shape[1])
+    right = np.full(n_areas,-1)
+    np.minimum.at(top,run_label,rows)
+    np.maximum.at(bottom,run_label,rows)
+    np.minimum.at(left,run_label,starts)
+    np.maximum.at(right,run_label,stops)
+    with np.errstate(invalid='ignore'):
+        row = np.bincount(run_label,weights=lengths*rows,minlength=n_areas)/area
+        column = np.bincount(run_label,weights=lengths*(starts+stops-1)/2,minlength=n_areas)/area
+
+    labels = np.zeros(mask.shape,dtype=np.int32)
+    first_pixel = rows*mask.shape[1]+starts
+    offsets = np.arange(lengths.sum())-np.repeat(np.cumsum(lengths)-lengths,lengths)
+    labels.ravel()[np.repeat(first_pixel,lengths)+offsets] = np.repeat(run_label+1,lengths)
+    return labels,{'area':area.astype(int),
+                   'top':top,
+                   'left':left,
+                   'height':bottom-top+1,
+                   'width':right-left,
+                   'row':row,
+                   'column':column}
+
+
+class detector:
+    """Finds the box and the structures in a scan. For example:
+
+    .. code-block:: python
+
+        found = detector(parameters(n=5)).detect(scan("data/example_12345-1.bmp"),1)
+        window = found['frame'].window(image,*found['vertical'][0])
+
+    :param settings: The :class:`parameters.parameters` of the analysis, when not given the defaults are used
+    """
+
+    level = None
+    """Level of the scan on which the box and the structures are found. When None, the coarsest level on which the average filter is at least four pixels wide is used."""
+
+    line_samples = 256
+    """Number of columns at which the position of the bottom line of the box is measured at full resolution"""
+
+    edge_length = 256
+    """Length in pixels of the part of every edge of a structure that is used to refine the edge at full resolution"""
+
+    def __init__(self,settings=None):
+        self.settings = parameters() if settings is None else settings
+
+    def coarse_level(self):
+        """Get the level of the scan on which the box and the structures are found
+
+        :return: The level
+        :rtype: int
+        """
+        if self.level is not None:
+            return self.level
+        return max(0,int(math.floor(math.log2(self.settings.spatial_average/4))))
+
+    def nominal_frame(self,image):
+        """Get the frame of the whole scan rotated by the nominal rotation, like imrotate with the loose option
+
+        :param image: The :class:`scan.scan`
+        :return: The frame
+        :rtype: deskew.deskew
+        """
+        rows,columns = image.shape
+        rotation = math.radians(self.settings.rotation)
+        c = abs(math.cos(rotation))
+        s = abs(math.sin(rotation))
+        shape = (math.ceil(rows*c+columns*s),math.ceil(rows*s+columns*c))
+        return deskew(self.settings.rotation,((rows-1)/2,(columns-1)/2),shape)
+
+    def _coarse_mask(self,image,frame,level,threshold):
+        coarse = frame.level(level).resample(image.level(level))
+        if threshold is None:
+            #the average color of the scan, minus 15, plus 10 like in the Matlab analyser
+            threshold = float(coarse.mean())-5
+        return dark_mask(coarse,self.settings.spatial_average/(1 << level),threshold),threshold
+
+    def find_box(self,areas,level,orientation):
+        """Select the box from the areas found on the coarse level
+
+        :param areas: The areas, see :meth:`detect.components`
+        :param level: The coarse level
+        :param orientation: The orientation of the paper on the scanner, 1 to 4
+        :return: The number of the area of the box
+        :rtype: int
+        """
+        factor = self.settings.pixel_size*(1 << level)
+        box_x,box_y = self.settings.box_size(orientation)
+        condition = ((abs(areas['width']-box_x/factor) < self.settings.box_x_margin/factor) &
+                     (abs(areas['height']-box_y/factor) < self.settings.box_y_margin/factor))
+        found = np.nonzero(condition)[0]
+        if len(found) == 0:
+            raise Exception("Could not find the box")
+        if len(found) > 1:
+            raise Exception("Found more than one box")
+        return int(found[0])
+
+    def bottom_line(self,image,frame,labels,box,level,orientation):
+        """Measure the angle of the bottom line of the box. The line is first located on the coarse level, after which its center is measured at full resolution in a narrow band around it.
+
+        :param image: The :class:`scan.scan`
+        :param frame: The frame in which the box was found
+        :param labels: The label image of the coarse level
+        :param box: The label of the box
+        :param level: The coarse level
+        :param orientation: The orientation of the paper on the scanner, 1 to 4
+        :return: The angle in degrees (like angle_bottom of the Matlab analyser), and the columns and rows in the frame of the measured line centers
+        :rtype: tuple
+        """
+        settings = self.settings
+        factor = 1 << level
+        rows,columns = np.nonzero(labels == box)
+        top = rows.min()
+        height = rows.max()-top+1
+        left = columns.min()
+        width = columns.max()-left+1
+        use = ((columns > left+width*settings.box_line_self_start) &
+               (columns < left+width*settings.box_line_self_stop))
+        if orientation == 1 or orientation == 4:
+            use &= rows < top+height*settings.box_line_other_stop
+        else:
+            use &= rows > top+height*(1-settings.box_line_other_stop)
+        if use.sum() < 2:
+            raise Exception("Could not find the bottom line of the box")
+        coarse_fit = np.polyfit(columns[use],rows[use],1)
+        thickness = np.bincount(columns[use]).max()
+
+        half = (thickness/2+2)*factor
+        sample_columns = np.linspace((left+width*settings.box_line_self_start)*factor,(left+width*settings.box_line_self_stop)*factor,self.line_samples)
+        coarse_columns = (sample_columns-(factor-1)/2)/factor
+        center_rows = np.polyval(coarse_fit,coarse_columns)*factor+(factor-1)/2
+        offsets = np.arange(-np.ceil(half),np.ceil(half)+1)
+        band_rows = center_rows[None,:]+offsets[:,None]
+        band_columns = np.broadcast_to(sample_columns,band_rows.shape)
+        gray = bicubic(image,*frame.to_scan(band_rows,band_columns))
+        darkness = np.clip(np.median(gray,axis=0)-gray,0,None)
+        total = darkness.sum(axis=0)
+        valid = total > 0
+        line_rows = (darkness*band_rows).sum(axis=0)[valid]/total[valid]
+        line_columns = sample_columns[valid]
+        fit = np.polyfit(line_columns,line_rows,1)
+        return math.degrees(math.atan(fit[0])),line_columns,line_rows
+
+    def refine(self,image,frame,bounding_box,threshold,level):
+        """Refine the bounding box of a structure at full resolution. Every edge is searched in a narrow band around the edge found on the coarse level, in which the same average filter and threshold are used.
+
+        :param image: The :class:`scan.scan`
+        :param frame: The frame of the straightened box
+        :param bounding_box: The bounding box on the coarse level (top, left, height, width)
+        :param threshold: The gray value below which the averaged scan is dark
+        :param level: The coarse level
+        :return: The bounding box at full resolution (top, left, height, width)
+        :rtype: tuple
+        """
+        factor = 1 << level
+        size = int(round(self.settings.spatial_average))
+        top,left,height,width = [value*factor for value in bounding_box]
+        margin = 2*factor
+        edges = []
+        for vertical,start,length,other,other_length in ((False,top,height,left,width),(True,left,width,top,height)):
+            middle = other+other_length/2
+            along = int(min(self.edge_length,other_length/2))
+            for edge,first in ((start,True),(start+length,False)):
+                band_start = int(edge-margin-size)
+                band_length = int(2*(margin+size))
+                if vertical:
+                    gray = frame.window(image,int(middle-along/2)-size,band_start,along+2*size,band_length)
+                else:
+                    gray = frame.window(image,band_start,int(middle-along/2)-size,band_length,along+2*size)
+                dark = dark_mask(gray,size,threshold)[size:-size,size:-size]
+                fraction = dark.mean(axis=0 if vertical else 1)
+                inside = np.nonzero(fraction >= 0.5)[0]
+                if len(inside) == 0:
+                    edges.append(edge)
+                elif first:
+                    edges.append(band_start+size+inside[0])
+                else:
+                    edges.append(band_start+size+inside[-1]+1)
+        top,bottom,left,right = edges
+        return (int(top),int(left),int(bottom-top),int(right-left))
+
+    def find_structures(self,image,frame,level,threshold):
+        """Find the structures in the straightened box
+
+        :param image: The :class:`scan.scan`
+        :param frame: The frame of the straightened box
+        :param level: The coarse level
+        :param threshold: The gray value below which the averaged scan is dark
+        :return: The bounding boxes of the vertical and of the horizontal structures on the coarse level, sorted by column and by row
+        :rtype: tuple
+        """
+        settings = self.settings
+        mask = self._coarse_mask(image,frame,level,threshold)[0]
+        areas = components(mask)[1]
+        factor = settings.pixel_size*(1 << level)
+        width = settings.structure_width/factor
+        width_margin = settings.structure_width_margin/factor
+        length = settings.structure_length/factor
+        length_margin = settings.structure_length_margin/factor
+        boxes = np.stack((areas['top'],areas['left'],areas['height'],areas['width']),axis=1)
+        vertical = ((abs(areas['width']-width) < width_margin) & (abs(areas['height']-length) < length_margin))
+        horizontal = ((abs(areas['height']-width) < width_margin) & (abs(areas['width']-length) < length_margin))
+        vertical_boxes = boxes[vertical][np.argsort(areas['column'][vertical])]
+        horizontal_boxes = boxes[horizontal][np.argsort(areas['row'][horizontal])]
+        return vertical_boxes,horizontal_boxes
+
+    def detect(self,image,orientation):
+        """Find the box and the structures in a scan
+
+        :param image: The :class:`scan.scan`
+        :param orientation: The orientation of the paper on the scanner, 1 to 4
+        :return: Dictionary with the coarse level ('level'), the threshold ('threshold'), the frame of the scan rotated by the nominal rotation ('nominal'), the box in that frame ('box', as top, left, height, width), the angle of the bottom line in degrees ('angle_bottom'), the measured centers of the bottom line ('line', as columns and rows), the frame of the straightened box ('frame') and the bounding boxes of the vertical and horizontal structures in that frame ('vertical' and 'horizontal', as lists of top, left, height, width)
+        :rtype: dict
+        """
+        if orientation not in (1,2,3,4):
+            raise Exception("Unknown orientation " + str(orientation))
+        level = self.coarse_level()
+        factor = 1 << level
+        nominal = self.nominal_frame(image)
+        mask,threshold = self._coarse_mask(image,nominal,level,None)
+        labels,areas = components(mask)
+        box = self.find_box(areas,level,orientation)
+        angle_bottom,line_columns,line_rows = self.bottom_line(image,nominal,labels,box+1,level,orientation)
+        box_bounds = (int(areas['top'][box]*factor),int(areas['left'][box]*factor),int(areas['height'][box]*factor),int(areas['width'][box]*factor))
+        frame = nominal.crop(*box_bounds).rotate(angle_bottom)
+
+        vertical,horizontal = self.find_structures(image,frame,level,threshold)
+        expected = 2*self.settings.n
+        if len(vertical) != expected:
+            raise Exception("Could not find all of the vertical structures, found %d instead of %d" % (len(vertical),expected))
+        if len(horizontal) != expected:
+            raise Exception("Could not find all of the horizontal structures, found %d instead of %d" % (len(horizontal),expected))
+        return {'level':level,
+                'threshold':threshold,
+                'nominal':nominal,
+                'box':box_bounds,
+                'angle_bottom':angle_bottom,
+                'line':(line_columns,line_rows),
+                'frame':frame,
+                'vertical':[self.refine(image,frame,bounding_box,threshold,level) for bounding_box in vertical],
+                'horizontal':[self.refine(image,frame,bounding_box,threshold,level) for bounding_box in horizontal]}
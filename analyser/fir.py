@@ -0,0 +1,200 @@
+"""
+.. module:: fir
+    :synopsis: FIR quadrature detection of the offset between structures, with a cached filter bank and overlap-save filtering
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+This is a batched version of calculate_offset_fir of the Matlab analyser (offset{6} to offset{8}). The band-pass filters are designed like fir1 (a windowed ideal band-pass, scaled to a gain of one at the center of the band). They depend only on the number of samples of the profiles, the pixel size, the structure period and the harmonic, so they are designed once and kept. Like filtfilt the profiles are extended at both ends by odd reflection and filtered forward and backward, starting from the steady state of the first sample. The filtering is done by overlap-save FFT convolution, for all profiles and all harmonics at once. Profiles can be stacked along any number of leading axes, so the per column profiles of every structure are handled like the averaged profiles.
+
+All lengths are in meter, like in the Matlab analyser.
+"""
+import functools
+import numpy as np
+
+order = 300
+"""Order of the band-pass filters, the number of taps is one more"""
+
+
+def _round(value):
+    """Round halfway values away from zero, like round in Matlab
+    """
+    return int(np.sign(value)*np.floor(abs(value)+0.5))
+
+
+def fir1_bandpass(order,low,high):
+    """Design a band-pass filter like fir1(order,[low,high],'bandpass') in Matlab
+
+    :param order: Order of the filter
+    :param low: Lower edge of the band, relative to the Nyquist frequency
+    :param high: Upper edge of the band, relative to the Nyquist frequency
+    :return: The taps of the filter
+    :rtype: numpy.ndarray
+    """
+    m = np.arange(order+1)-order/2
+    taps = (high*np.sinc(high*m)-low*np.sinc(low*m))*np.hamming(order+1)
+    center = (low+high)/2
+    return taps/abs(np.sum(taps*np.exp(-1j*np.pi*center*m)))
+
+
+@functools.lru_cache(maxsize=64)
+def band_pass(n_samples,dy,period,harmonic,order=order):
+    """Get the band-pass filter around a harmonic of the structure period for profiles of a given length, the same filter as calculate_offset_fir of the Matlab analyser. Filters are kept, so they are only designed once.
+
+    :param n_samples: Number of samples of the profiles
+    :param dy: Pixel size along the profiles
+    :param period: Period of the structures
+    :param harmonic: The harmonic
+    :param order: Order of the filter
+    :return: The taps of the filter, which should not be changed
+    :rtype: numpy.ndarray
+    """
+    length = (n_samples-1)*dy
+    k_nyquist = n_samples/length/2
+    k_width = 1/length/k_nyquist
+    k_center = harmonic/period/k_nyquist
+    if k_center+k_width >= 1:
+        raise Exception("Harmonic %d is above the Nyquist frequency of the profiles" % (harmonic))
+    taps = fir1_bandpass(order,k_center-k_width,k_center+k_width)
+    taps.setflags(write=False)
+    return taps
+
+
+_spectra = {}
+
+
+def _taps_spectrum(taps,n_fft):
+    """Get the transform of filter taps, which is kept for the next time the same filters are used
+    """
+    key = (taps.tobytes(),taps.shape,n_fft)
+    if key not in _spectra:
+        if len(_spectra) >= 64:
+            _spectra.clear()
+        _spectra[key] = np.fft.rfft(taps,n_fft,axis=-1)
+    return _spectra[key]
+
+
+def overlap_save(signals,taps,paired=False):
+    """Filter signals with FIR filters using overlap-save FFT convolution. The samples before the start of the signals are taken to be zero, so the result equals the first part of the full convolution.
+
+    :param signals: Array with the signals along the last axis
+    :param taps: The taps of one filter, or an array with the taps of several filters along the last axis
+    :param paired: When several filters are given, filter the signals along the second last axis each with their own filter, instead of filtering every signal with all filters
+    :return: The filtered signals, with an extra axis before the last axis when several filters are given and paired is false
+    :rtype: numpy.ndarray
+    """
+    signals = np.asarray(signals,dtype=float)
+    taps = np.asarray(taps,dtype=float)
+    n_taps = taps.shape[-1]
+    n = signals.shape[-1]
+    n_fft = 1 << int(np.ceil(np.log2(4*n_taps)))
+    step = n_fft-n_taps+1
+    n_frames = -(-n//step)
+    padded = np.zeros(signals.shape[:-1]+(n_taps-1+n_frames*step,))
+    padded[...,n_taps-1:n_taps-1+n] = signals
+    frames = np.lib.stride_tricks.sliding_window_view(padded,n_fft,axis=-1)[...,::step,:]
+    spectrum = np.fft.rfft(frames,axis=-1)
+    filter_spectrum = _taps_spectrum(taps,n_fft)
+    if taps.ndim == 1:
+        spectrum = spectrum*filter_spectrum
+    elif paired:
+        spectrum = spectrum*filter_spectrum[:,None,:]
+    else:
+        spectrum = spectrum[...,None,:,:]*filter_spectrum[:,None,:]
+    filtered = np.fft.irfft(spectrum,n_fft,axis=-1)[...,n_taps-1:]
+    return filtered.reshape(filtered.shape[:-2]+(-1,))[...,:n]
+
+
+def _steady_filter(signals,taps,paired=False):
+    """Filter starting from the steady state of the first sample, like filter with the initial conditions used by filtfilt
+    """
+    n_taps = np.shape(taps)[-1]
+    start = np.repeat(signals[...,:1],n_taps-1,axis=-1)
+    return overlap_save(np.concatenate((start,signals),axis=-1),taps,paired)[...,n_taps-1:]
+
+
+def filtfilt(signals,taps):
+    """Filter signals forward and backward like filtfilt(taps,1,signals) in Matlab, for all signals and filters at once
+
+    :param signals: Array with the signals along the last axis
+    :param taps: The taps of one filter, or an array with the taps of several filters along the last axis
+    :return: The filtered signals, with an extra axis before the last axis when several filters are given
+    :rtype: numpy.ndarray
+    """
+    signals = np.asarray(signals,dtype=float)
+    taps = np.asarray(taps,dtype=float)
+    n_reflect = 3*(taps.shape[-1]-1)
+    if signals.shape[-1] <= n_reflect:
+        raise Exception("The signals should be longer than %d samples to filter them with filtfilt" % (n_reflect))
+    first = signals[...,:1]
+    last = signals[...,-1:]
+    extended = np.concatenate((2*first-signals[...,n_reflect:0:-1],signals,2*last-signals[...,-2:-n_reflect-2:-1]),axis=-1)
+    forward = _steady_filter(extended,taps)
+    backward = _steady_filter(forward[...,::-1],taps,taps.ndim > 1)[...,::-1]
+    return backward[...,n_reflect:-n_reflect]
+
+
+def hilbert(signals):
+    """Calculate the Hilbert transform of signals along the last axis, the imaginary part of hilbert in Matlab
+
+    :param signals: Array with the signals along the last axis
+    :return: The transformed signals
+    :rtype: numpy.ndarray
+    """
+    n = np.shape(signals)[-1]
+    weights = np.zeros(n)
+    weights[0] = 1
+    weights[1:(n+1)//2] = 2
+    if n % 2 == 0:
+        weights[n//2] = 1
+    return np.fft.ifft(np.fft.fft(signals,axis=-1)*weights,axis=-1).imag
+
+
+def used_samples(n_samples,dy,period):
+    """Get the samples that are used for the quadrature detection, an integer number of periods starting at a tenth of the profile, like calculate_offset_fir of the Matlab analyser
+
+    :param n_samples: Number of samples of the profiles
+    :param dy: Pixel size along the profiles
+    :param period: Period of the structures
+    :return: The slice of used samples
+    :rtype: slice
+    """
+    per_period = _round(period/dy)
+    periods = int(np.floor(0.8*n_samples/per_period))
+    start = _round(0.1*n_samples)-1
+    return slice(start,start+periods*per_period+1)
+
+
+def fir_offsets(ref,sig,dy,period,harmonics=(1,2,3),order=order):
+    """Calculate the offsets between masked reference and signal profiles using fir quadrature detection (offset{6} to offset{8} of the Matlab analyser for the default harmonics). For example for the per column profiles of all structures, stacked into an array of structures by columns by samples, and the averaged reference profiles of all structures:
+
+    .. code-block:: python
+
+        offsets = fir_offsets(ref[:,None,:],sig_columns,dy,structure_period)
+
+    :param ref: The masked reference profiles, along the last axis
+    :param sig: The masked signal profiles, along the last axis. Should broadcast against the reference profiles.
+    :param dy: Pixel size along the profiles
+    :param period: Period of the structures
+    :param harmonics: The harmonics for which the offset is calculated
+    :param order: Order of the band-pass filters
+    :return: The offsets, with the harmonics on the last axis
+    :rtype: numpy.ndarray
+    """
+    ref = np.asarray(ref,dtype=float)
+    sig = np.asarray(sig,dtype=float)
+    n = ref.shape[-1]
+    harmonics = np.asarray(harmonics)
+    taps = np.stack([band_pass(n,dy,period,int(harmonic),order) for harmonic in harmonics])
+    if ref.shape == sig.shape:
+        ref_filtered,sig_filtered = filtfilt(np.stack((ref,sig)),taps)
+    else:
+        ref_filtered = filtfilt(ref,taps)
+        sig_filtered = filtfilt(sig,taps)
+    quadrature = hilbert(ref_filtered)
+    use = used_samples(n,dy,period)
+    in_phase = (sig_filtered[...,use]*ref_filtered[...,use]).sum(axis=-1)
+    out_of_phase = (sig_filtered[...,use]*quadrature[...,use]).sum(axis=-1)
+    angle = np.arctan2(out_of_phase,in_phase)
+    #for an odd harmonic the reference and the signal are 180 degrees out of phase
+    angle = angle-np.pi*(harmonics % 2 == 1)
+    angle = np.where(angle < -np.pi,angle+2*np.pi,angle)
+    return angle/2/np.pi*period/harmonics
@@ -0,0 +1,181 @@
+"""
+.. module:: parameters
+    :synopsis: Parameters of the structures and of the analysis, the same as the properties of the Matlab analyser
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+"""
+import math
+
+
+class parameters:
+    """The parameters of an analysis. The defaults are the same as the properties of the Matlab analyser class. Copy the properties of the structure from the python script used to generate the gcode for the print. All lengths are in meter. Every parameter can be changed when making the parameters, for example:
+
+    .. code-block:: python
+
+        settings = parameters(n=4,dpi=2400)
+
+    :param settings: Parameters to change from their defaults
+    """
+
+    structure_pitch = 0.00075
+    """Distance between the two straight lines that are closest together"""
+
+    structure_period = 0.0035
+    """Period of the printed pattern"""
+
+    structure_length = 0.07
+    """Length of a structure (longitudinal direction)"""
+
+    structure_width = 0.008
+    """Width of a structure (transverse direction)"""
+
+    structure_spacing = 0.003
+    """Spacing between the structures"""
+
+    structure_spacing_to_square = 0.005
+    """Spacing between the structures and the square surrounding them"""
+
+    structure_length_margin = 0.03
+    """Acceptable error margin on the length of the structures"""
+
+    structure_width_margin = 0.008
+    """Acceptable error margin on the width of the structures"""
+
+    rotation = 15
+    """Rotation of the structure in degrees, used for making sure all the belts/lead screws are pre-loading"""
+
+    box_x_margin = 0.02
+    """Acceptable error margin on the size of the box in the x direction"""
+
+    box_y_margin = 0.02
+    """Acceptable error margin on the size of the box in the y direction"""
+
+    box_line_self_start = 0.1
+    """Start position of the part of the bottom line of the box that is used, relative to the width of the box"""
+
+    box_line_self_stop = 0.9
+    """Stop position of the part of the bottom line of the box that is used, relative to the width of the box"""
+
+    box_line_other_stop = 0.1
+    """Maximum distance from the bottom of the box where the bottom line is searched, relative to the height of the box"""
+
+    ver_x_ref_only_start = 0.0006
+    """Distance from the side of the structure where the part that only contains the reference starts"""
+
+    ver_x_ref_only_stop = 0.0013
+    """Distance from the side of the structure where the part that only contains the reference stops"""
+
+    ver_x_sig_only_start = 0.0006
+    """Distance from the side of the structure where the part that only contains the signal starts"""
+
+    ver_x_sig_only_stop = 0.0013
+    """Distance from the side of the structure where the part that only contains the signal stops"""
+
+    ver_x_use = 0.2
+    """Ratio of the total width of the structure to use for determining the offsets"""
+
+    ver_y_use = 0.7
+    """Ratio of the total length of the structure to use for determining the offsets"""
+
+    dpi = 1200
+    """Resolution of the scan in dots per inch"""
+
+    spatial_average = 50
+    """Size in pixels of the average filter used to determine the location of the structures"""
+
+    n = 1
+    """Number of nozzles"""
+
+    def __init__(self,**settings):
+        for name,value in settings.items():
+            if name.startswith('_') or not hasattr(parameters,name) or callable(getattr(parameters,name)):
+                raise Exception("Unknown setting given to parameters: " + name)
+            setattr(self,name,value)
+
+    def values(self):
+        """Get all parameters
+
+        :return: Dictionary with the value of every parameter
+        :rtype: dict
+        """
+        return {name:getattr(self,name) for name in dir(parameters) if not name.startswith('_') and not callable(getattr(parameters,name)) and not isinstance(getattr(parameters,name),property)}
+
+    @property
+    def pixel_size(self):
+        """Size of a pixel of the scan"""
+        return 2.54e-2/self.dpi
+
+    def repetitions(self):
+        """Number of repetitions of the repetitive calibration structures
+
+        :return: The number of repetitions
+        :rtype: int
+        """
+        return math.floor(self.structure_length/self.structure_pitch/2)
+
+    def one_dir_width(self):
+        """Total width of the structures in one direction
+
+        :return: The width
+        :rtype: float
+        """
+        return self.n*(self.structure_width+self.structure_spacing)*2-self.structure_spacing
+
+    def effective_width(self):
+        """Total effective width of all the calibration structures, without the box
+
+        :return: The width
+        :rtype: float
+        """
+        return self.one_dir_width()+self.repetitions()*self.structure_pitch*2+self.structure_spacing
+
+    def box_width(self):
+        """Width of the box
+
+        :return: The width
+        :rtype: float
+        """
+        return self.effective_width()+2*self.structure_spacing_to_square
+
+    def effective_height(self):
+        """Total effective height of all the calibration structures, without the box
+
+        :return: The height
+        :rtype: float
+        """
+        return max(self.one_dir_width(),self.repetitions()*self.structure_pitch*2)
+
+    def box_height(self):
+        """Height of the box
+
+        :return: The height
+        :rtype: float
+        """
+        return self.effective_height()+2*self.structure_spacing_to_square
+
+    def box_size(self,orientation):
+        """Size of the box in the scan, which depends on the orientation of the paper on the scanner
+
+        :param orientation: The orientation, 1 to 4
+        :return: The size in the x and in the y direction
+        :rtype: tuple
+        """
+        if orientation % 2 == 1:
+            return self.box_height(),self.box_width()
+        return self.box_width(),self.box_height()
+
+
+def parse_settings(texts):
+    """Convert parameters given on the command line as NAME=VALUE into a dictionary for :class:`parameters`. Whole numbers are given as int to the parameters of which the default is an int, such as spatial_average.
+
+    :param texts: List of parameters as NAME=VALUE
+    :return: Dictionary with the value of every parameter
+    :rtype: dict
+    """
+    settings = {}
+    for text in texts:
+        name,value = text.split('=',1)
+        value = float(value)
+        if isinstance(getattr(parameters,name,None),int) and value.is_integer():
+            value = int(value)
+        settings[name] = value
+    return settings
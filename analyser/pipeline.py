@@ -0,0 +1,191 @@
+"""
+.. module:: pipeline
+    :synopsis: Analyse a scan of an interlocked calibration pattern, like analyse_interlocked_differential of the Matlab analyser
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The scan is memory mapped (see :mod:`scan`), the box and the structures are found on a downsampled level (see :mod:`detect`), and only the windows around the structures are resampled in the straightened frame (see :mod:`deskew`). The profiles of all structures of one direction are then stacked, masked and analysed at once by every estimator:
+
+- offset{1} to offset{4}: 1st to 4th harmonic, fft quadrature detection (see :mod:`quadrature`)
+- offset{5}: correlation based algorithm (see :mod:`correlation`)
+- offset{6} to offset{8}: 1st to 3rd harmonic, fir quadrature detection (see :mod:`fir`)
+
+Unlike calculate_offset_cor of the Matlab analyser, the correlation based offset uses the same convention as the other offsets.
+"""
+import math
+import time
+import numpy as np
+
+import correlation
+import fir
+import quadrature
+from detect import detector
+from parameters import parameters
+from scan import scan
+
+n_estimators = 8
+"""Number of offsets that is calculated for every structure"""
+
+orientations = {1:(('ascend',True,True),('descend',True,False)),
+                2:(('ascend',True,False),('ascend',False,True)),
+                3:(('descend',False,True),('ascend',False,False)),
+                4:(('descend',False,False),('descend',True,True))}
+"""For every orientation of the paper on the scanner the order, invert and ver arguments of find_offsets_ver_interlocked of the Matlab analyser, for the x and the y offsets"""
+
+
+def _round(value):
+    """Round halfway values away from zero, like round in Matlab
+    """
+    return int(math.copysign(math.floor(abs(value)+0.5),value))
+
+
+class pipeline:
+    """Analyses scans of interlocked calibration patterns. For example to analyse a scan named "example_12345-1.bmp", printed using nozzles 1,2,3,4 and 5 and in orientation 1:
+
+    .. code-block:: python
+
+        result = pipeline(parameters(dpi=1200)).analyse("data/example_12345-1.bmp",5,1)
+        x_offsets = result['x_offset'][0]
+
+    :param settings: The :class:`parameters.parameters` of the analysis, when not given the defaults are used
+    """
+
+    def __init__(self,settings=None):
+        self.settings = parameters() if settings is None else settings
+
+    def structures(self,found,ver):
+        """Get the frame and the bounding boxes of the structures of one direction. When ver is false the frame is rotated by 90 degrees, such that the horizontal structures become vertical, like find_offsets_ver_interlocked of the Matlab analyser.
+
+        :param found: The result of :meth:`detect.detector.detect`
+        :param ver: Use the vertical structures
+        :return: The frame and the bounding boxes (top, left, height, width) in that frame
+        :rtype: tuple
+        """
+        frame = found['frame']
+        if ver:
+            return frame,list(found['vertical'])
+        width = frame.shape[1]
+        boxes = [(width-left-box_width,top,box_width,height) for top,left,height,box_width in found['horizontal']]
+        return frame.rot90(),boxes
+
+    def profile_samples(self,settings):
+        """Number of samples of the profiles of the structures, an integer number of periods over the used part of the length of the structures
+
+        :param settings: The :class:`parameters.parameters` of the analysis
+        :return: The number of samples
+        :rtype: int
+        """
+        periods = _round(settings.structure_length*settings.ver_y_use/settings.structure_period)
+        return _round(periods*settings.structure_period/settings.pixel_size)+1
+
+    def profiles(self,image,frame,boxes,order,settings):
+        """Resample the windows of the structures and average them along the rows, like the ver_vec, ver_ref_only_vec and ver_sig_only_vec of the Matlab analyser
+
+        :param image: The :class:`scan.scan`
+        :param frame: The frame of the structures
+        :param boxes: The bounding boxes of the structures (top, left, height, width)
+        :param order: 'ascend' when the first structure from the left is printed by the first nozzle, otherwise 'descend'
+        :param settings: The :class:`parameters.parameters` of the analysis
+        :return: The center, reference only and signal only profiles, as arrays of structures by samples
+        :rtype: tuple
+        """
+        dx = settings.pixel_size
+        dy = settings.pixel_size
+        width_abs = settings.structure_width/dx
+        length_abs = settings.structure_length/dy
+        n_samples = self.profile_samples(settings)
+        ref_width = _round((settings.ver_x_ref_only_stop-settings.ver_x_ref_only_start)/dx)
+        sig_width = _round((settings.ver_x_sig_only_stop-settings.ver_x_sig_only_start)/dx)
+
+        centers = [(top+(height-1)/2,left+(width-1)/2) for top,left,height,width in boxes]
+        centers.sort(key=lambda center: center[1],reverse=(order == 'descend'))
+        center_profiles = []
+        ref_profiles = []
+        sig_profiles = []
+        for y_loc,x_loc in centers:
+            x_start = _round(x_loc-width_abs*settings.ver_x_use/2)
+            x_stop = x_start+_round(width_abs*settings.ver_x_use)
+            y_start = _round(y_loc-length_abs*settings.ver_y_use/2)
+            if order == 'ascend':
+                sig_start = _round(x_loc-width_abs*0.5+settings.ver_x_sig_only_start/dx)
+                ref_start = _round(x_loc+width_abs*0.5-settings.ver_x_ref_only_stop/dx)
+            else:
+                sig_start = _round(x_loc+width_abs*0.5-settings.ver_x_sig_only_stop/dx)
+                ref_start = _round(x_loc-width_abs*0.5+settings.ver_x_ref_only_start/dx)
+            center_profiles.append(frame.window(image,y_start,x_start,n_samples,x_stop-x_start+1).mean(axis=1,dtype=float))
+            ref_profiles.append(frame.window(image,y_start,ref_start,n_samples,ref_width+1).mean(axis=1,dtype=float))
+            sig_profiles.append(frame.window(image,y_start,sig_start,n_samples,sig_width+1).mean(axis=1,dtype=float))
+        return np.array(center_profiles),np.array(ref_profiles),np.array(sig_profiles)
+
+    def offsets(self,center,ref_only,sig_only,settings):
+        """Calculate all offsets from the profiles of the structures of one direction
+
+        :param center: The center profiles, as array of structures by samples
+        :param ref_only: The profiles of the strips that only contain the reference
+        :param sig_only: The profiles of the strips that only contain the signal
+        :param settings: The :class:`parameters.parameters` of the analysis
+        :return: The offsets as array of estimators by structures, and the time spent on every estimator
+        :rtype: tuple
+        """
+        dy = settings.pixel_size
+        period = settings.structure_period
+        window = _round(settings.structure_pitch/dy)
+        result = np.empty((n_estimators,len(center)))
+        timings = {}
+        start = time.perf_counter()
+        ref = quadrature.mask_profiles(center,ref_only,window)
+        sig = quadrature.mask_profiles(center,sig_only,window)
+        result[0:4] = quadrature.quadrature_offsets(ref,sig,dy,period,(1,2,3,4)).T
+        timings['quadrature'] = time.perf_counter()-start
+        start = time.perf_counter()
+        result[4] = correlation.correlation_offsets(ref,sig,dy,period)
+        timings['correlation'] = time.perf_counter()-start
+        start = time.perf_counter()
+        result[5:8] = fir.fir_offsets(ref,sig,dy,period,(1,2,3)).T
+        timings['fir'] = time.perf_counter()-start
+        return result,timings
+
+    def analyse(self,image,n,orientation):
+        """Analyse a scan
+
+        :param image: The :class:`scan.scan`, or the name of the BMP file
+        :param n: Number of nozzles
+        :param orientation: The orientation of the paper on the scanner, 1 to 4
+        :return: Dictionary with the x and y offsets (as arrays of estimators by structures, like a row of x_offset_mat and y_offset_mat of the Matlab analyser), the angle of the bottom line and the time spent on every stage
+        :rtype: dict
+        """
+        timings = {}
+        start = time.perf_counter()
+        if isinstance(image,str):
+            image = scan(image)
+        settings = parameters(**dict(self.settings.values(),n=n))
+        timings['open'] = time.perf_counter()-start
+
+        start = time.perf_counter()
+        found = detector(settings).detect(image,orientation)
+        timings['detect'] = time.perf_counter()-start
+
+        result = {'angle_bottom':found['angle_bottom']}
+        for name,(order,invert,ver) in zip(('x_offset','y_offset'),orientations[orientation]):
+            start = time.perf_counter()
+            frame,boxes = self.structures(found,ver)
+            center,ref_only,sig_only = self.profiles(image,frame,boxes,order,settings)
+            timings['resample'] = timings.get('resample',0)+time.perf_counter()-start
+            offsets,estimator_timings = self.offsets(center,ref_only,sig_only,settings)
+            for stage,duration in estimator_timings.items():
+                timings[stage] = timings.get(stage,0)+duration
+            result[name] = -offsets if invert else offsets
+        result['timings'] = timings
+        return result
+
+
+def analyse(file_name,n,orientation,**settings):
+    """Analyse a scan using the default settings, except for the given settings
+
+    :param file_name: Name of the BMP file
+    :param n: Number of nozzles
+    :param orientation: The orientation of the paper on the scanner, 1 to 4
+    :param settings: Parameters to change from their defaults, see :class:`parameters.parameters`
+    :return: See :meth:`pipeline.analyse`
+    :rtype: dict
+    """
+    return pipeline(parameters(**settings)).analyse(file_name,n,orientation)
@@ -0,0 +1,149 @@
+"""
+.. module:: quadrature
+    :synopsis: FFT quadrature detection of the offset between structures, for all structures and harmonics at once
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+This is a batched version of calculate_offset of the Matlab analyser (offset{1} to offset{4}). The profiles of all structures are stacked along the first axes, with the position along the structure on the last axis. Every profile is transformed with a single rfft, and the bins around each harmonic are cut out for all harmonics at once. In calculate_offset the bins of the reference are convolved with the flipped conjugate bins of the signal and the flipped conjugate bins of the reference are convolved with the signal. Both sums are then transformed back with an ifft and the angle between the in phase and the quadrature parts is taken. The second convolution is the flipped conjugate of the first, so the in phase part equals twice the real part, and the quadrature part twice the imaginary part, of the inverse transform of the first convolution alone. The angles are therefore found with one convolution (done as a product of zero padded transforms) and two transforms along the last axis.
+
+All lengths are in meter, like in the Matlab analyser.
+"""
+import numpy as np
+
+bins_around = 6
+"""Number of bins on each side of a harmonic that is used for the quadrature detection (kndif in the Matlab analyser)"""
+
+
+def movmean(profiles,window):
+    """Moving average along the last axis, with the same window placement and shrinking window at the ends as movmean in Matlab
+
+    :param profiles: Array with the profiles along the last axis
+    :param window: Length of the window in samples
+    :return: The averaged profiles
+    :rtype: numpy.ndarray
+    """
+    profiles = np.asarray(profiles,dtype=float)
+    n = profiles.shape[-1]
+    window = max(int(window),1)
+    before = window//2
+    after = window-1-before
+    cumulative = np.zeros(profiles.shape[:-1]+(n+1,))
+    np.cumsum(profiles,axis=-1,out=cumulative[...,1:])
+    index = np.arange(n)
+    start = np.maximum(index-before,0)
+    stop = np.minimum(index+after+1,n)
+    return (cumulative[...,stop]-cumulative[...,start])/(stop-start)
+
+
+def mask_profiles(center,only,window):
+    """Make the center profile white wherever the profile of the strip that only contains one of the structures is white, like the ver_*_only_vec_mod vectors of the Matlab analyser. The strip profile is first averaged over a structure pitch, and is white where this average is above its mean.
+
+    :param center: The profiles of the center of the structures, along the last axis. For per column detection the columns can be on the second last axis.
+    :param only: The profiles of the strips that only contain one structure, along the last axis
+    :param window: Length of the moving average in samples, the structure pitch divided by the pixel size
+    :return: The masked center profiles
+    :rtype: numpy.ndarray
+    """
+    filtered = movmean(only,window)
+    mask = filtered > filtered.mean(axis=-1,keepdims=True)
+    white = np.where(mask,filtered,-np.inf).max(axis=-1,keepdims=True)
+    center = np.asarray(center,dtype=float)
+    if center.ndim > mask.ndim:
+        mask = mask[...,None,:]
+        white = white[...,None,:]
+    return np.where(mask,white,center)
+
+
+def spectrum(profiles,window=True):
+    """Transform profiles along the last axis
+
+    :param profiles: Array with the profiles along the last axis
+    :param window: Multiply the profiles with a Hamming window first, like is done for the averaged profiles in the Matlab analyser
+    :return: The positive frequency bins
+    :rtype: numpy.ndarray
+    """
+    profiles = np.asarray(profiles,dtype=float)
+    if window:
+        profiles = profiles*np.hamming(profiles.shape[-1])
+    return np.fft.rfft(profiles,axis=-1)
+
+
+def harmonic_bins(n_samples,dy,period,harmonics):
+    """Find the bins around the harmonics of the structure period
+
+    :param n_samples: Number of samples of the profiles
+    :param dy: Pixel size along the profiles
+    :param period: Period of the structures
+    :param harmonics: The harmonics
+    :return: Array with a row of bin numbers for every harmonic
+    :rtype: numpy.ndarray
+    """
+    dk = 1/((n_samples-1)*dy)
+    centers = np.rint(np.asarray(harmonics)/period/dk).astype(int)
+    return centers[:,None]+np.arange(-bins_around,bins_around+1)
+
+
+def quadrature_angles(ref_bins,sig_bins):
+    """Calculate the phase between the reference and the signal for every point of the inverse transform of their cross correlation, like the angles in calculate_offset of the Matlab analyser
+
+    :param ref_bins: The bins of the reference, along the last axis
+    :param sig_bins: The bins of the signal, along the last axis
+    :return: The angles before the compensation of odd harmonics
+    :rtype: numpy.ndarray
+    """
+    n = ref_bins.shape[-1]
+    length = 2*n-1
+    correlation = np.fft.ifft(np.fft.fft(ref_bins,length,axis=-1)*np.fft.fft(np.conj(sig_bins[...,::-1]),length,axis=-1),axis=-1)
+    correlation = np.roll(correlation,-(n-1),axis=-1)
+    return np.angle(np.fft.ifft(correlation,axis=-1))
+
+
+def offsets_from_spectra(ref_spectrum,sig_spectrum,n_samples,dy,period,harmonics=(1,2,3,4)):
+    """Calculate the offsets between reference and signal from their spectra
+
+    :param ref_spectrum: Spectra of the masked reference profiles, along the last axis
+    :param sig_spectrum: Spectra of the masked signal profiles, along the last axis. Should broadcast against the reference spectra.
+    :param n_samples: Number of samples of the profiles
+    :param dy: Pixel size along the profiles
+    :param period: Period of the structures
+    :param harmonics: The harmonics for which the offset is calculated
+    :return: The offsets, with the harmonics on the last axis
+    :rtype: numpy.ndarray
+    """
+    harmonics = np.asarray(harmonics)
+    bins = harmonic_bins(n_samples,dy,period,harmonics)
+    if bins.max() >= ref_spectrum.shape[-1]:
+        raise Exception("Harmonic %d is above the Nyquist frequency of the profiles" % (harmonics.max()))
+    angles = quadrature_angles(ref_spectrum[...,bins],sig_spectrum[...,bins])
+    #for an odd harmonic the reference and the signal are 180 degrees out of phase
+    angles = angles-np.pi*(harmonics[:,None] % 2 == 1)
+    angles = np.where(angles < -np.pi,angles+2*np.pi,angles)
+    angle = angles[...,2:-2].mean(axis=-1)
+    return angle/2/np.pi*period/harmonics
+
+
+def quadrature_offsets(ref,sig,dy,period,harmonics=(1,2,3,4),window=True):
+    """Calculate the offsets between masked reference and signal profiles using fft quadrature detection (offset{1} to offset{4} of the Matlab analyser for the default harmonics). For example for the averaged profiles of all structures of a scan, stacked into arrays of structures by samples:
+
+    .. code-block:: python
+
+        ref = mask_profiles(center,ref_only,round(structure_pitch/dy))
+        sig = mask_profiles(center,sig_only,round(structure_pitch/dy))
+        offsets = quadrature_offsets(ref,sig,dy,structure_period)
+
+    :param ref: The masked reference profiles, along the last axis
+    :param sig: The masked signal profiles, along the last axis. Should broadcast against the reference profiles.
+    :param dy: Pixel size along the profiles
+    :param period: Period of the structures
+    :param harmonics: The harmonics for which the offset is calculated
+    :param window: Multiply the profiles with a Hamming window before the transform
+    :return: The offsets, with the harmonics on the last axis
+    :rtype: numpy.ndarray
+    """
+    ref = np.asarray(ref,dtype=float)
+    sig = np.asarray(sig,dtype=float)
+    if ref.shape == sig.shape:
+        ref_spectrum,sig_spectrum = spectrum(np.stack((ref,sig)),window)
+    else:
+        ref_spectrum = spectrum(ref,window)
+        sig_spectrum = spectrum(sig,window)
+    return offsets_from_spectra(ref_spectrum,sig_spectrum,ref.shape[-1],dy,period,harmonics)
@@ -0,0 +1,198 @@
+"""
+.. module:: scan
+    :synopsis: Memory mapped access to scanned BMP images, with grayscale regions, tiles and a downsampled pyramid
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The pixel array of the BMP file is memory mapped, so opening a scan does not read the image. Only the rows of a region that is asked for are read from the file and converted to grayscale, using the same weights as rgb2gray in Matlab. Downsampled levels of the image (the pyramid) are made by averaging blocks of pixels, reading the image in bands of rows, and are kept once they are made. Detection can run on a coarse level, after which only the regions around the structures have to be read at full resolution.
+"""
+import math
+import struct
+import numpy as np
+
+gray_weights = (0.298936021293775,0.587043074451121,0.114020904255103)
+"""Weights of red, green and blue in the gray value, the same as rgb2gray in Matlab"""
+
+_file_header = struct.Struct("<2sIHHI")
+_info_header = struct.Struct("<IiiHHIIiiII")
+
+
+class scan:
+    """A scanned image stored as BMP file. 8 bit (with a palette), 24 bit and 32 bit uncompressed BMP files are supported. For example to find the darkest pixel of a coarse version of the scan and read the region around it at full resolution:
+
+    .. code-block:: python
+
+        image = scan("data/example_12345-1.bmp")
+        coarse = image.level(3)
+        row,column = np.unravel_index(np.argmin(coarse),coarse.shape)
+        region = image.gray(row*8-100,column*8-100,200,200)
+
+    :param file_name: Name of the BMP file
+    """
+
+    band_rows = 256
+    """Number of rows that is read at once when making a level of the pyramid"""
+
+    fill = 255
+    """Gray value of pixels of a region that are outside of the image, the color of paper"""
+
+    buffers = None
+    """Dictionary in which the arrays of the levels are kept and reused by the next scan with the same size, to avoid allocating them for every scan when many scans are analysed after each other. The levels of a scan are overwritten by the next scan that uses the same buffers, so only share the buffers between scans that are analysed one after the other."""
+
+    def __init__(self,file_name):
+        self.file_name = file_name
+        with open(file_name,"rb") as f:
+            header = f.read(_file_header.size+_info_header.size)
+            if len(header) < _file_header.size+_info_header.size:
+                raise Exception("%s is not a BMP file" % (file_name))
+            magic,file_size,reserved1,reserved2,offset = _file_header.unpack(header[:_file_header.size])
+            (info_size,width,height,planes,bits,compression,image_size,x_pixels_per_meter,y_pixels_per_meter,n_colors,important_colors) = _info_header.unpack(header[_file_header.size:])
+            if magic != b"BM" or info_size < _info_header.size:
+                raise Exception("%s is not a BMP file" % (file_name))
+            if compression not in (0,3) or bits not in (8,24,32) or (compression == 3 and bits != 32):
+                raise Exception("Only uncompressed 8, 24 and 32 bit BMP files are supported")
+            palette = None
+            if bits == 8:
+                f.seek(_file_header.size+info_size)
+                palette = np.frombuffer(f.read(4*(n_colors or 256)),dtype=np.uint8).reshape(-1,4)
+        self.rows = abs(height)
+        """Number of rows of the image"""
+        self.columns = width
+        """Number of columns of the image"""
+        self.dpi = round(x_pixels_per_meter*0.0254) if x_pixels_per_meter else None
+        """Resolution stored in the file in dots per inch, or None when it is not stored"""
+        self.channels = bits//8
+        stride = (self.channels*width+3)//4*4
+        data = np.memmap(file_name,dtype=np.uint8,mode='r',offset=offset,shape=(self.rows,stride))
+        #rows are stored from bottom to top, unless the height is negative
+        if height > 0:
+            data = data[::-1]
+        self.pixels = data[:,:self.channels*width].reshape(self.rows,width,self.channels)
+        """The memory mapped pixels, as rows by columns by bytes per pixel (blue, green, red and for 32 bit files alpha, or the palette index for 8 bit files). Indexing this array does not copy the image."""
+        if palette is None:
+            self._palette_gray = None
+        else:
+            self._palette_gray = self._convert(palette[:,None,:3])[:,0]
+        self._levels = {}
+
+    @property
+    def shape(self):
+        """Size of the image in pixels (rows, columns)"""
+        return (self.rows,self.columns)
+
+    def _convert(self,pixels):
+        """Convert blue, green, red pixels to gray values, rounded like rgb2gray
+        """
+        gray = pixels[:,:,2]*np.float32(gray_weights[0])
+        gray += pixels[:,:,1]*np.float32(gray_weights[1])
+        gray += pixels[:,:,0]*np.float32(gray_weights[2])
+        return np.rint(gray).astype(np.uint8)
+
+    def gray(self,row,column,height,width):
+        """Read a region of the image and convert it to gray values. Only this region is read from the file. Pixels of the region that are outside of the image get the value fill.
+
+        :param row: First row of the region
+        :param column: First column of the region
+        :param height: Number of rows of the region
+        :param width: Number of columns of the region
+        :return: The gray values of the region
+        :rtype: numpy.ndarray
+        """
+        row = int(row)
+        column = int(column)
+        height = int(height)
+        width = int(width)
+        result = np.full((height,width),self.fill,dtype=np.uint8)
+        row0 = max(row,0)
+        row1 = min(row+height,self.rows)
+        column0 = max(column,0)
+        column1 = min(column+width,self.columns)
+        if row1 <= row0 or column1 <= column0:
+            return result
+        pixels = self.pixels[row0:row1,column0:column1]
+        if self._palette_gray is not None:
+            gray = self._palette_gray[pixels[:,:,0]]
+        else:
+            gray = self._convert(pixels)
+        result[row0-row:row1-row,column0-column:column1-column] = gray
+        return result
+
+    def tiles(self,tile_size=1024):
+        """Read the image tile by tile
+
+        :param tile_size: Size of the square tiles in pixels
+        :return: Iterator over the tiles as tuples of the first row, the first column and the gray values of the tile
+        :rtype: iterator
+        """
+        for row in range(0,self.rows,tile_size):
+            for column in range(0,self.columns,tile_size):
+                yield row,column,self.gray(row,column,min(tile_size,self.rows-row),min(tile_size,self.columns-column))
+
+    def _buffer(self,level,rows,columns):
+        """Get the array for a level, from the buffers when they are used
+        """
+        if self.buffers is None:
+            return np.empty((rows,columns),dtype=np.float32)
+        key = (level,rows,columns)
+        if key not in self.buffers:
+            self.buffers[key] = np.empty((rows,columns),dtype=np.float32)
+        return self.buffers[key]
+
+    def level(self,level):
+        """Get a downsampled version of the image, in which every pixel is the mean of a block of 2^level by 2^level pixels. Pixels at the bottom and right side that do not fill a whole block are left out. Levels are kept once they are made, and a level is made from the finest level that was already made.
+
+        :param level: The level, 0 is the full resolution
+        :return: The mean gray values
+        :rtype: numpy.ndarray
+        """
+        if level in self._levels:
+            return self._levels[level]
+        if level == 0:
+            return self.gray(0,0,self.rows,self.columns).astype(np.float32)
+        finer = max([made for made in self._levels if made < level],default=0)
+        factor = 1 << (level-finer)
+        if finer:
+            source = self._levels[finer]
+            rows = source.shape[0]//factor
+            columns = source.shape[1]//factor
+            result = self._buffer(level,rows,columns)
+            source[:rows*factor,:columns*factor].reshape(rows,factor,columns,factor).mean(axis=(1,3),dtype=np.float32,out=result)
+        else:
+            rows = self.rows//factor
+            columns = self.columns//factor
+            result = self._buffer(level,rows,columns)
+            #read the image in bands, such that the full resolution image is never in memory
+            band = factor*max(1,self.band_rows//factor)
+            for start in range(0,rows*factor,band):
+                stop = min(start+band,rows*factor)
+                gray = self.gray(start,0,stop-start,columns*factor)
+                result[start//factor:stop//factor] = gray.reshape((stop-start)//factor,factor,columns,factor).mean(axis=(1,3),dtype=np.float32)
+        self._levels[level] = result
+        return result
+
+    def pyramid(self,levels):
+        """Make several levels of the pyramid at once, see :meth:`scan.level`
+
+        :param levels: The number of levels, the coarsest level is levels
+        :return: List with the levels 1 to levels
+        :rtype: list
+        """
+        return [self.level(level) for level in range(1,levels+1)]
+
+    def level_for(self,pixel_size,dpi=None):
+        """Find the coarsest level of which the pixels are not larger than a size
+
+        :param pixel_size: The largest allowed pixel size in meter
+        :param dpi: Resolution of the scan, by default the resolution stored in the file
+        :return: The level
+        :rtype: int
+        """
+        if dpi is None:
+            dpi = self.dpi
+        factor = pixel_size/(0.0254/dpi)
+        return max(0,int(math.floor(math.log2(factor)))) if factor >= 1 else 0
+
+    def close(self):
+        """Release the memory map of the file
+        """
+        self.pixels = None
+        self._levels = {}
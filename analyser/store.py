@@ -0,0 +1,251 @@
+"""
+.. module:: store
+    :synopsis: Append-only columnar store of the offsets of all analysed scans
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Instead of a result file per sample, the offsets of every scan are appended to a store with one record for every structure and every estimator of the scan. A record contains the time of the scan, the printer, the sample, the nozzles, the orientation, the structure, the tool that printed the structure, the estimator (1 to 8, like offset{1} to offset{8} of the Matlab analyser) and the x and the y offset.
+
+The records are kept in chunks of at most chunk_rows records, and every chunk only contains records of one printer. Every column of a chunk is a separate file with the raw values, so a query only reads the columns it needs. The index (index.json) contains for every chunk its printer, the number of records, the first and last time and the tools and estimators it contains, such that chunks that can not contain any requested record are not read at all. Records are only ever appended: the index is written after the columns, so a partially appended chunk is repaired on the next append.
+"""
+import json
+import os
+import time
+import numpy as np
+
+column_types = {'time':'<f8',
+                'printer':'<i4',
+                'sample':'<i4',
+                'nozzles':'<i4',
+                'orientation':'<i1',
+                'structure':'<i2',
+                'tool':'<i2',
+                'estimator':'<i1',
+                'x_offset':'<f4',
+                'y_offset':'<f4'}
+"""The columns of the store and their types. The printer, sample and nozzles columns contain numbers of names, see :meth:`store.names`."""
+
+named_columns = ('printer','sample','nozzles')
+"""The columns that contain names"""
+
+
+def _seconds(moment):
+    """Convert a time to seconds since the epoch, from either a number of seconds or a datetime
+    """
+    if moment is None or isinstance(moment,(int,float)):
+        return moment
+    return moment.timestamp()
+
+
+class store:
+    """Store of the offsets of all analysed scans. For example to add a scan and to get the offsets of tool 3 of the first harmonic of the fir quadrature detection (estimator 6) of the last 90 days:
+
+    .. code-block:: python
+
+        results = store("results/")
+        results.append_scan(pipeline().analyse("example_12345-1.bmp",5,1),"example","12345",1,printer="diabase")
+        found = results.query(('time','x_offset','y_offset'),printer="diabase",tool=3,estimator=6,since=time.time()-90*24*3600)
+
+    :param folder: The folder of the store, which is made when it does not exist
+    """
+
+    chunk_rows = 1 << 16
+    """Maximum number of records in a chunk"""
+
+    def __init__(self,folder):
+        self.folder = folder
+        os.makedirs(folder,exist_ok=True)
+        index_name = os.path.join(folder,'index.json')
+        if os.path.isfile(index_name):
+            with open(index_name) as f:
+                index = json.load(f)
+        else:
+            index = {'chunks':[],'names':{name:[] for name in named_columns}}
+        self.chunks = index['chunks']
+        """For every chunk a dictionary with its folder ('name'), its printer, the number of records ('rows'), the first and last time ('time') and the contained tools and estimators"""
+        self._names = index['names']
+        self._codes = {name:{value:code for code,value in enumerate(self._names[name])} for name in named_columns}
+        self._scans = set()
+        scans_name = os.path.join(folder,'scans.txt')
+        if os.path.isfile(scans_name):
+            with open(scans_name) as f:
+                self._scans = set(f.read().split())
+
+    def names(self,column):
+        """Get the names of a column that contains names. The value of the column is the position of the name in this list.
+
+        :param column: 'printer', 'sample' or 'nozzles'
+        :return: The names
+        :rtype: list
+        """
+        return list(self._names[column])
+
+    def code(self,column,value,add=False):
+        """Get the number of a name
+
+        :param column: 'printer', 'sample' or 'nozzles'
+        :param value: The name
+        :param add: Add the name when it is not known yet
+        :return: The number, or None when the name is not known and not added
+        :rtype: int
+        """
+        codes = self._codes[column]
+        if value not in codes and add:
+            codes[value] = len(self._names[column])
+            self._names[column].append(value)
+        return codes.get(value)
+
+    def _write_index(self):
+        file_name = os.path.join(self.folder,'index.json')
+        with open(file_name+'.tmp','w') as f:
+            json.dump({'chunks':self.chunks,'names':self._names},f)
+        os.replace(file_name+'.tmp',file_name)
+
+    def append(self,records):
+        """Append records to the store
+
+        :param records: Dictionary with an array of values for every column, see :data:`store.column_types`. Single values are used for all records. For the printer, sample and nozzles columns the names may be given instead of their numbers.
+        """
+        length = max(np.size(records[column]) for column in column_types)
+        values = {}
+        for column,dtype in column_types.items():
+            value = records[column]
+            if column in named_columns and isinstance(np.ravel(value)[0],str):
+                value = [self.code(column,name,add=True) for name in np.ravel(value)]
+            values[column] = np.broadcast_to(np.asarray(value,dtype=dtype),(length,))
+        for printer in np.unique(values['printer']):
+            selected = np.flatnonzero(values['printer'] == printer)
+            while len(selected):
+                chunk = self._tail(int(printer))
+                take = selected[:self.chunk_rows-chunk['rows']]
+                selected = selected[len(take):]
+                self._append_chunk(chunk,{column:value[take] for column,value in values.items()})
+        self._write_index()
+
+    def _tail(self,printer):
+        """Get the last chunk of a printer that is not full, or make a new chunk
+        """
+        for chunk in reversed(self.chunks):
+            if chunk['printer'] == printer:
+                if chunk['rows'] < self.chunk_rows:
+                    return chunk
+                break
+        chunk = {'name':'%06d' % (len(self.chunks)),'printer':printer,'rows':0,'time':None,'tools':[],'estimators':[]}
+        os.makedirs(os.path.join(self.folder,chunk['name']),exist_ok=True)
+        self.chunks.append(chunk)
+        return chunk
+
+    def _append_chunk(self,chunk,values):
+        """Append records to the columns of a chunk and update the index of the chunk
+        """
+        for column,dtype in column_types.items():
+            file_name = os.path.join(self.folder,chunk['name'],column)
+            size = chunk['rows']*np.dtype(dtype).itemsize
+            with open(file_name,'ab') as f:
+                #remove what was written after the last complete append
+                if f.tell() != size:
+                    f.truncate(size)
+                f.write(np.ascontiguousarray(values[column]).tobytes())
+        chunk['rows'] += len(values['time'])
+        first = float(values['time'].min())
+        last = float(values['time'].max())
+        chunk['time'] = [first,last] if chunk['time'] is None else [min(chunk['time'][0],first),max(chunk['time'][1],last)]
+        chunk['tools'] = sorted(set(chunk['tools'])|set(values['tool'].tolist()))
+        chunk['estimators'] = sorted(set(chunk['estimators'])|set(values['estimator'].tolist()))
+
+    def append_scan(self,result,sample,nozzles,orientation,printer='',timestamp=None,key=None):
+        """Append the offsets of a scan to the store
+
+        :param result: The result of the scan with the x_offset and y_offset arrays of estimators by structures, see :meth:`pipeline.pipeline.analyse`
+        :param sample: Name of the sample
+        :param nozzles: The nozzles as string, for example "12345"
+        :param orientation: The orientation of the paper on the scanner
+        :param printer: Name of the printer
+        :param timestamp: Time of the scan in seconds since the epoch, or a datetime, by default now
+        :param key: Unique key of the scan, for example :meth:`batch.batch.key`. A scan of which the key was already appended is not appended again.
+        :return: True when the scan was appended
+        :rtype: bool
+        """
+        if key is not None and key in self._scans:
+            return False
+        x_offset = np.asarray(result['x_offset'])
+        y_offset = np.asarray(result['y_offset'])
+        n_estimators,n_structures = x_offset.shape
+        structure = np.tile(np.arange(n_structures),n_estimators)
+        tools = np.array([int(nozzle) for nozzle in nozzles])
+        self.append({'time':_seconds(timestamp) if timestamp is not None else time.time(),
+                     'printer':printer,
+                     'sample':sample,
+                     'nozzles':nozzles,
+                     'orientation':orientation,
+                     'structure':structure,
+                     'tool':tools[structure//2],
+                     'estimator':np.repeat(np.arange(1,n_estimators+1),n_structures),
+                     'x_offset':x_offset.ravel(),
+                     'y_offset':y_offset.ravel()})
+        if key is not None:
+            self._scans.add(key)
+            with open(os.path.join(self.folder,'scans.txt'),'a') as f:
+                f.write(key+'\n')
+        return True
+
+    def _read(self,chunk,column):
+        return np.fromfile(os.path.join(self.folder,chunk['name'],column),dtype=column_types[column],count=chunk['rows'])
+
+    def query(self,columns=('time','tool','x_offset','y_offset'),printer=None,sample=None,tool=None,estimator=None,orientation=None,since=None,until=None):
+        """Get the records that match all given conditions. Only the chunks that can contain matching records are read, and of those only the requested columns and the columns of the conditions.
+
+        :param columns: The columns to return
+        :param printer: Name of the printer
+        :param sample: Name of the sample
+        :param tool: Tool number
+        :param estimator: Estimator, 1 to 8
+        :param orientation: Orientation, 1 to 4
+        :param since: Earliest time in seconds since the epoch, or a datetime
+        :param until: Latest time in seconds since the epoch, or a datetime
+        :return: Dictionary with an array of values for every requested column
+        :rtype: dict
+        """
+        since = _seconds(since)
+        until = _seconds(until)
+        equal = {}
+        for column,value in (('printer',printer),('sample',sample),('tool',tool),('estimator',estimator),('orientation',orientation)):
+            if value is None:
+                continue
+            if column in named_columns:
+                value = self.code(column,value)
+                if value is None:
+                    return {column:np.empty(0,dtype=column_types[column]) for column in columns}
+            equal[column] = value
+        parts = {column:[] for column in columns}
+        for chunk in self.chunks:
+            if chunk['rows'] == 0:
+                continue
+            if 'printer' in equal and chunk['printer'] != equal['printer']:
+                continue
+            if 'tool' in equal and equal['tool'] not in chunk['tools']:
+                continue
+            if 'estimator' in equal and equal['estimator'] not in chunk['estimators']:
+                continue
+            if (since is not None and chunk['time'][1] < since) or (until is not None and chunk['time'][0] > until):
+                continue
+            read = {}
+            def column_values(column):
+                if column not in read:
+                    read[column] = self._read(chunk,column)
+                return read[column]
+            mask = np.ones(chunk['rows'],dtype=bool)
+            for column,value in equal.items():
+                if column != 'printer':
+                    mask &= column_values(column) == value
+            if since is not None or until is not None:
+                times = column_values('time')
+                if since is not None:
+                    mask &= times >= since
+                if until is not None:
+                    mask &= times <= until
+            for column in columns:
+                if column == 'printer':
+                    parts[column].append(np.full(np.count_nonzero(mask),chunk['printer'],dtype=column_types[column]))
+                else:
+                    parts[column].append(column_values(column)[mask])
+        return {column:np.concatenate(part) if part else np.empty(0,dtype=column_types[column]) for column,part in parts.items()}
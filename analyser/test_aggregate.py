@@ -0,0 +1,61 @@
+"""
+.. module:: test_aggregate
+    :synopsis: Checks that the offsets of the aggregator compensate the offsets of the nozzles when they are given to the gcode generator
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+A scan of a printer with known nozzle offsets is rendered and analysed with the :mod:`accuracy` harness. The offsets of the :class:`aggregate.aggregator` are then used as x_offsets and y_offsets of the generator, and the scan of the compensated print should give offsets of about zero. Run with pytest, or as a script.
+"""
+import sys
+
+import numpy as np
+
+from accuracy import harness,generator_folder
+from aggregate import aggregator
+
+if generator_folder not in sys.path:
+    sys.path.append(generator_folder)
+from benchmark import printer_for_tools
+from calibration_pattern import calibration_pattern
+from generator import generator
+
+
+def _round_trip(measured,dpi,tolerance):
+    result = measured.measure(dpi)
+    assert np.all(result['max_error'][:5] < tolerance),result['max_error']
+
+    combined = aggregator()
+    combined.add(result,"".join(str(tool) for tool in measured.tools))
+    offsets = combined.offsets('',measured.tools)
+    assert len(offsets['x_offsets']) == len(measured.tools)
+    measured.pattern.gen.x_offsets = offsets['x_offsets']
+    measured.pattern.gen.y_offsets = offsets['y_offsets']
+    compensated = measured.measure(dpi)
+    x_expected,y_expected = measured.expected()
+    assert np.all(np.abs(x_expected) < tolerance) and np.all(np.abs(y_expected) < tolerance)
+    #the fft quadrature detection and the correlation are accurate at this resolution
+    assert np.all(np.abs(compensated['x_offset'][:5]) < tolerance),compensated['x_offset']
+    assert np.all(np.abs(compensated['y_offset'][:5]) < tolerance),compensated['y_offset']
+
+
+def test_round_trip(dpi=600,tolerance=5e-6):
+    measured = harness()
+    measured.x_offsets = [0.03,-0.06,0.08]
+    measured.y_offsets = [-0.04,0.05,0.02]
+    _round_trip(measured,dpi,tolerance)
+
+
+def test_round_trip_of_tool_subset(dpi=600,tolerance=5e-6):
+    #a print of tools 3 and 4 of a printer with five tools, of which the offsets are in the order of the tool list
+    measured = harness(calibration_pattern(gen=generator(printer_for_tools(5))))
+    measured.tools = (3,4)
+    measured.reference_tool = 3
+    measured.x_offsets = [0.05,-0.07]
+    measured.y_offsets = [-0.03,0.06]
+    _round_trip(measured,dpi,tolerance)
+
+
+if __name__ == "__main__":
+    for name,test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print("%s passed" % (name))
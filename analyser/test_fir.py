@@ -0,0 +1,134 @@
+"""
+.. module:: test_fir
+    :synopsis: Checks the overlap-save filtering and the batched fir quadrature detection against direct convolution and a literal port of calculate_offset_fir of the Matlab analyser
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Run with pytest, or as a script.
+"""
+import numpy as np
+
+import fir
+import quadrature
+
+dpi = 1200
+dy = 0.0254/dpi
+period = 0.0035
+pitch = 0.00075
+
+
+def _fir1(order,low,high):
+    """fir1(order,[low,high],'bandpass') of Matlab, one tap at a time
+    """
+    taps = np.zeros(order+1)
+    for i1 in range(order+1):
+        m = i1-order/2
+        if m == 0:
+            ideal = high-low
+        else:
+            ideal = (np.sin(np.pi*high*m)-np.sin(np.pi*low*m))/(np.pi*m)
+        taps[i1] = ideal*(0.54-0.46*np.cos(2*np.pi*i1/order))
+    center = (low+high)/2
+    gain = abs(sum(taps[i1]*np.exp(-1j*np.pi*center*(i1-order/2)) for i1 in range(order+1)))
+    return taps/gain
+
+
+def _filter(taps,signal):
+    """filter(taps,1,signal) of Matlab with the initial conditions of filtfilt, by direct convolution
+    """
+    start = np.full(len(taps)-1,signal[0])
+    return np.convolve(np.concatenate((start,signal)),taps,'valid')
+
+
+def _filtfilt(taps,signal):
+    """filtfilt(taps,1,signal) of Matlab by direct convolution
+    """
+    n_reflect = 3*(len(taps)-1)
+    extended = np.concatenate((2*signal[0]-signal[n_reflect:0:-1],signal,2*signal[-1]-signal[-2:-n_reflect-2:-1]))
+    forward = _filter(taps,extended)
+    backward = _filter(taps,forward[::-1])[::-1]
+    return backward[n_reflect:-n_reflect]
+
+
+def _calculate_offset_fir(yscale,ref_mod,sig_mod,harmonic):
+    """Literal port of calculate_offset_fir of the Matlab analyser
+    """
+    L = yscale[-1]-yscale[0]
+    dk = 1/L
+    n = len(yscale)
+    k_nyq = 1/(L/n)/2
+    kdif = dk/k_nyq
+    kcenter = harmonic/period/k_nyq
+    b = _fir1(300,kcenter-kdif,kcenter+kdif)
+    n_per_period = int(np.floor(period/dy+0.5))
+    use_periods = int(np.floor(0.8*n/n_per_period))
+    use = np.arange(int(np.floor(0.1*n+0.5)),int(np.floor(0.1*n+0.5))+use_periods*n_per_period+1)-1
+    ref_mod_filt = _filtfilt(b,ref_mod)
+    sig_mod_filt = _filtfilt(b,sig_mod)
+    weights = np.zeros(n)
+    weights[0] = 1
+    weights[1:(n+1)//2] = 2
+    if n % 2 == 0:
+        weights[n//2] = 1
+    H_ref_mod_filt = np.imag(np.fft.ifft(np.fft.fft(ref_mod_filt)*weights))
+    in_phase = np.sum(sig_mod_filt[use]*ref_mod_filt[use])
+    out_of_phase = np.sum(sig_mod_filt[use]*H_ref_mod_filt[use])
+    angle = np.arctan2(out_of_phase,in_phase)
+    if harmonic % 2 == 1:
+        angle = angle-np.pi
+    if angle < -np.pi:
+        angle = angle+2*np.pi
+    return angle/2/np.pi*period/harmonic
+
+
+def test_overlap_save():
+    random = np.random.default_rng(3)
+    signals = random.normal(size=(4,2000))
+    taps = random.normal(size=(3,301))
+    filtered = fir.overlap_save(signals,taps[0])
+    for i1 in range(len(signals)):
+        assert np.allclose(filtered[i1],np.convolve(signals[i1],taps[0])[:2000])
+    filtered = fir.overlap_save(signals,taps)
+    for i1 in range(len(taps)):
+        assert np.allclose(filtered[2,i1],np.convolve(signals[2],taps[i1])[:2000])
+    filtered = fir.overlap_save(signals[:3],taps,paired=True)
+    for i1 in range(len(taps)):
+        assert np.allclose(filtered[i1],np.convolve(signals[i1],taps[i1])[:2000])
+
+
+def test_filtfilt():
+    random = np.random.default_rng(4)
+    signals = random.normal(size=(2,2000))
+    taps = np.stack([_fir1(300,low,low+0.02) for low in (0.05,0.1)])
+    assert np.allclose(fir.fir1_bandpass(300,0.05,0.07),taps[0])
+    filtered = fir.filtfilt(signals,taps)
+    for i1 in range(len(signals)):
+        for i2 in range(len(taps)):
+            assert np.allclose(filtered[i1,i2],_filtfilt(taps[i2],signals[i1]))
+    assert np.allclose(fir.filtfilt(signals,taps[1])[1],_filtfilt(taps[1],signals[1]))
+
+
+def test_fir_offsets(n_structures=4):
+    random = np.random.default_rng(5)
+    n = round(14*period/dy)+1
+    yscale = np.arange(n)*dy
+    offsets = random.uniform(-3e-4,3e-4,n_structures)
+    lines = lambda start: np.where((yscale-start) % period < pitch,40.0,235.0)
+    ref_only = np.array([lines(0) for offset in offsets])+random.normal(0,8,(n_structures,n))
+    sig_only = np.array([lines(period/2+offset) for offset in offsets])+random.normal(0,8,(n_structures,n))
+    center = np.minimum(ref_only,sig_only)
+    window = round(pitch/dy)
+    ref = quadrature.mask_profiles(center,ref_only,window)
+    sig = quadrature.mask_profiles(center,sig_only,window)
+    harmonics = (1,2,3)
+    batched = fir.fir_offsets(ref,sig,dy,period,harmonics)
+    literal = np.array([[_calculate_offset_fir(yscale,ref[i1],sig[i1],harmonic) for harmonic in harmonics] for i1 in range(n_structures)])
+    assert np.abs(batched-literal).max() < 1e-15
+    #the per column profiles are handled like the averaged profiles
+    assert np.allclose(fir.fir_offsets(ref[:,None,:],np.stack((sig,sig),axis=1),dy,period,harmonics)[:,1],batched,rtol=0,atol=1e-15)
+
+
+if __name__ == "__main__":
+    for name,test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print("%s passed" % (name))
@@ -0,0 +1,88 @@
+"""
+.. module:: test_quadrature
+    :synopsis: Checks the batched fft quadrature detection against a literal port of calculate_offset of the Matlab analyser
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Run with pytest, or as a script.
+"""
+import numpy as np
+
+import quadrature
+
+dpi = 1200
+dy = 0.0254/dpi
+period = 0.0035
+pitch = 0.00075
+
+
+def _movmean(profile,window):
+    """movmean of Matlab, one sample at a time
+    """
+    n = len(profile)
+    before = window//2
+    after = window-1-before
+    return np.array([profile[max(i1-before,0):min(i1+after+1,n)].mean() for i1 in range(n)])
+
+
+def _calculate_offset(ref_fft,sig_fft,harmonic):
+    """Literal port of calculate_offset of the Matlab analyser
+    """
+    sig_fft_inv = sig_fft[::-1]
+    ref_fft_inv = ref_fft[::-1]
+    H_ref_fft = -1j*ref_fft
+    H_ref_fft_inv = H_ref_fft[::-1]
+    n = len(sig_fft_inv)
+    ref_x_sig = np.convolve(ref_fft,np.conj(sig_fft_inv))+np.convolve(np.conj(ref_fft_inv),sig_fft)
+    H_ref_x_sig = np.convolve(H_ref_fft,np.conj(sig_fft_inv))+np.convolve(np.conj(H_ref_fft_inv),sig_fft)
+    ref_x_sig_2 = np.concatenate((ref_x_sig[n-1:],ref_x_sig[:n-1]))
+    H_ref_x_sig_2 = np.concatenate((H_ref_x_sig[n-1:],H_ref_x_sig[:n-1]))
+    X = np.real(np.fft.ifft(ref_x_sig_2))
+    Y = np.real(np.fft.ifft(H_ref_x_sig_2))
+    angles = np.arctan2(Y,X)
+    if harmonic % 2 == 1:
+        angles = angles-np.pi
+    for i1 in range(len(angles)):
+        if angles[i1] < -np.pi:
+            angles[i1] = angles[i1]+2*np.pi
+    return np.mean(angles[2:-2])/2/np.pi*period/harmonic
+
+
+def _profiles(n_structures=6,n_samples=2316,seed=1):
+    """Masked reference and signal profiles of structures with random offsets
+    """
+    random = np.random.default_rng(seed)
+    y = np.arange(n_samples)*dy
+    offsets = random.uniform(-2e-4,2e-4,n_structures)
+    lines = lambda start: np.where((y-start) % period < pitch,40.0,235.0)
+    ref_only = np.array([lines(0) for offset in offsets])+random.normal(0,5,(n_structures,n_samples))
+    sig_only = np.array([lines(period/2+offset) for offset in offsets])+random.normal(0,5,(n_structures,n_samples))
+    center = np.minimum(ref_only,sig_only)
+    window = round(pitch/dy)
+    return quadrature.mask_profiles(center,ref_only,window),quadrature.mask_profiles(center,sig_only,window),ref_only,window
+
+
+def test_movmean():
+    ref,sig,ref_only,window = _profiles()
+    for size in (window,7):
+        assert np.allclose(quadrature.movmean(ref_only,size)[3],_movmean(ref_only[3],size))
+
+
+def test_quadrature_offsets():
+    ref,sig,ref_only,window = _profiles()
+    harmonics = (1,2,3,4)
+    offsets = quadrature.quadrature_offsets(ref,sig,dy,period,harmonics)
+    n = ref.shape[1]
+    bins = quadrature.harmonic_bins(n,dy,period,harmonics)
+    literal = np.empty(offsets.shape)
+    for i1 in range(len(ref)):
+        ref_fft = np.fft.fft(ref[i1]*np.hamming(n))
+        sig_fft = np.fft.fft(sig[i1]*np.hamming(n))
+        for i2,harmonic in enumerate(harmonics):
+            literal[i1,i2] = _calculate_offset(ref_fft[bins[i2]],sig_fft[bins[i2]],harmonic)
+    assert np.abs(offsets-literal).max() < 1e-15
+
+
+if __name__ == "__main__":
+    test_movmean()
+    test_quadrature_offsets()
+    print("tests passed")
@@ -0,0 +1,351 @@
+"""
+.. module:: watch
+    :synopsis: Analyse scans as soon as they are dropped in a folder, using a pool of warm worker processes
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The watcher checks a folder for scans named like the scans of :mod:`batch`. A scan is analysed once its size and modification time did not change for a while and its size is the size stored in its BMP header, so scans that are still being written by the scanner are left alone. The worker processes are started and prepared before the first scan arrives: the modules are imported, the fir filter bank is made and every estimator is run once, and the buffers of the pyramid are reused from scan to scan. Results are shared with :mod:`batch` through the same cache, so scans that were already analysed are published immediately.
+
+Every result is published as soon as it is ready: it is written to <scan name>.json in the output folder, the result_<sample>_<nozzles>.npz file of its sample is updated and the on_result function is called. The status, with the queue depth, the latency percentiles and whether the pool is full, is written to watch_status.json in the output folder. When the pool is full scans are left waiting in the folder, such that a burst of scans does not use an unbounded amount of memory.
+"""
+import argparse
+import collections
+import concurrent.futures
+import json
+import os
+import struct
+import time
+import numpy as np
+
+from batch import batch,discover,analyse_scan,scan_name,print_offsets
+from parameters import parameters,parse_settings
+from pipeline import pipeline
+from store import store
+from aggregate import aggregator
+
+_worker = {}
+"""State of a worker process, made by :func:`_start_worker`"""
+
+
+def _start_worker(values):
+    """Prepare a worker process: make the pipeline and the buffers of the pyramid, and run the estimators once on random profiles, such that the fir filter bank is made
+    """
+    settings = parameters(**values)
+    analyser = pipeline(settings)
+    random = np.random.default_rng(0)
+    profiles = random.normal(128,20,(3,2*settings.n,analyser.profile_samples(settings)))
+    analyser.offsets(profiles[0],profiles[1],profiles[2],settings)
+    _worker['pipeline'] = analyser
+    _worker['buffers'] = {}
+
+
+def _ping():
+    """Task that only makes sure that a worker process was started
+    """
+    return os.getpid()
+
+
+def _analyse_scan(file_name,n,orientation):
+    """Analyse one scan in a prepared worker process
+    """
+    return analyse_scan(_worker['pipeline'],file_name,n,orientation,_worker['buffers'])
+
+
+def complete(file_name,size):
+    """Check whether a BMP file was completely written, using the file size stored in its header
+
+    :param file_name: The file
+    :param size: The current size of the file
+    :return: True when the file is complete
+    :rtype: bool
+    """
+    with open(file_name,'rb') as f:
+        header = f.read(6)
+    if len(header) < 6 or header[:2] != b'BM':
+        return False
+    stored = struct.unpack('<I',header[2:])[0]
+    #some programs store 0 instead of the file size
+    return stored == 0 or stored <= size
+
+
+def _write_json(file_name,data):
+    """Write a JSON file at once, such that readers never see a partially written file
+    """
+    with open(file_name+'.tmp','w') as f:
+        json.dump(data,f)
+    os.replace(file_name+'.tmp',file_name)
+
+
+class watcher:
+    """Watches a folder and analyses new or changed scans. For example to analyse all scans that are dropped in the folder scans/ until stopped:
+
+    .. code-block:: python
+
+        watcher("scans/",parameters(structure_period=0.004)).run()
+
+    :param folder: The folder that is watched
+    :param settings: The :class:`parameters.parameters` of the analysis, when not given the defaults are used
+    """
+
+    settle = 1.0
+    """Time in seconds during which the size and the modification time of a scan should not change before it is analysed"""
+
+    poll = 0.5
+    """Time in seconds between checks of the folder"""
+
+    workers = None
+    """Number of worker processes, by default the number of processors"""
+
+    max_pending = None
+    """Maximum number of scans that are in the pool, by default twice the number of workers. More scans are left waiting in the folder."""
+
+    output_folder = None
+    """Folder to which the results are published, by default the watched folder"""
+
+    status_interval = 5.0
+    """Time in seconds between updates of the status file"""
+
+    history = 1000
+    """Number of recent scans of which the latency is kept for the percentiles"""
+
+    on_result = None
+    """Function that is called with the file name and the published result (see :meth:`watcher.publish`) of every scan"""
+
+    def __init__(self,folder,settings=None):
+        self.folder = folder
+        self.runner = batch(settings)
+        """The :class:`batch.batch` of which the cache and the merging of results are used"""
+        self._seen = {}
+        self._accepted = {}
+        self._waiting = collections.deque()
+        self._pending = {}
+        self._latencies = collections.deque(maxlen=self.history)
+        self._durations = collections.deque(maxlen=self.history)
+        self._pool = None
+        self._status_time = 0
+        self.counts = {'analysed':0,'cached':0,'failed':0}
+        """Number of scans that were analysed, taken from the cache and that could not be analysed"""
+
+    def _output(self):
+        return self.output_folder if self.output_folder is not None else self.folder
+
+    def _n_workers(self):
+        return self.workers if self.workers is not None else os.cpu_count()
+
+    def start(self):
+        """Start and prepare the worker processes, and open the cache
+        """
+        self.runner.open_cache(self.folder)
+        os.makedirs(self._output(),exist_ok=True)
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self._n_workers(),initializer=_start_worker,initargs=(self.runner.settings.values(),))
+        concurrent.futures.wait([self._pool.submit(_ping) for i1 in range(self._n_workers())])
+
+    def stop(self):
+        """Stop the worker processes. Scans that are in the pool are finished first and published.
+        """
+        if self._pool is None:
+            return
+        for future in list(self._pending):
+            future.cancel()
+        while self._pending:
+            self._collect(None)
+        self._pool.shutdown(wait=True)
+        self._pool = None
+        self.write_status()
+
+    def ready(self):
+        """Find the scans that are new or changed and completely written. Every scan is returned only once, until it is changed.
+
+        :return: List of tuples with the file name, the sample name, the nozzles and the orientation of every scan
+        :rtype: list
+        """
+        now = time.monotonic()
+        found = []
+        for file_name,sample,nozzles,orientation in discover(self.folder):
+            try:
+                status = os.stat(file_name)
+            except FileNotFoundError:
+                continue
+            state = (status.st_size,status.st_mtime_ns)
+            if self._accepted.get(file_name) == state:
+                continue
+            if file_name not in self._seen or self._seen[file_name][0] != state:
+                self._seen[file_name] = (state,now)
+                continue
+            if now-self._seen[file_name][1] < self.settle or not complete(file_name,status.st_size):
+                continue
+            del self._seen[file_name]
+            self._accepted[file_name] = state
+            found.append((file_name,sample,nozzles,orientation))
+        return found
+
+    def step(self):
+        """Check the folder once, start analysing the scans that are ready and publish the scans that are finished
+        """
+        for file_name,sample,nozzles,orientation in self.ready():
+            key = self.runner.key(file_name,len(nozzles),orientation)
+            cached = self.runner.cached(key)
+            if cached is not None:
+                self.counts['cached'] += 1
+                self.publish(file_name,cached)
+            else:
+                self._waiting.append((file_name,len(nozzles),orientation,key))
+        self.runner.save_index()
+        max_pending = self.max_pending if self.max_pending is not None else 2*self._n_workers()
+        while self._waiting and len(self._pending) < max_pending:
+            file_name,n,orientation,key = self._waiting.popleft()
+            self._pending[self._pool.submit(_analyse_scan,file_name,n,orientation)] = (file_name,key)
+        self._collect(self.poll)
+        if time.monotonic()-self._status_time > self.status_interval:
+            self.write_status()
+
+    def _collect(self,timeout):
+        """Wait at most timeout seconds for scans to finish, and publish the finished scans
+        """
+        if not self._pending:
+            if timeout:
+                time.sleep(timeout)
+            return
+        done,not_done = concurrent.futures.wait(self._pending,timeout=timeout,return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            file_name,key = self._pending.pop(future)
+            if future.cancelled():
+                del self._accepted[file_name]
+                continue
+            result = future.result()
+            if 'error' in result:
+                self.counts['failed'] += 1
+            else:
+                self.counts['analysed'] += 1
+                self.runner.cache_result(key,result)
+            self._durations.append(result['timings']['total'])
+            self.publish(file_name,result)
+
+    def publish(self,file_name,result):
+        """Publish the result of a scan: write it to <scan name>.json in the output folder, update the result file of its sample, add it to the store and the aggregator of the runner and call on_result
+
+        :param file_name: The scan
+        :param result: The result, see :func:`batch.analyse_scan`, to which the time from writing the scan to publishing the result is added ('latency')
+        """
+        latency = time.time()-os.path.getmtime(file_name)
+        self._latencies.append(latency)
+        published = dict(result,latency=latency)
+        name = os.path.splitext(os.path.basename(file_name))[0]
+        _write_json(os.path.join(self._output(),name+'.json'),published)
+        if 'error' not in result:
+            self.merge(file_name)
+            match = scan_name.match(os.path.basename(file_name))
+            nozzles = match.group('nozzles')
+            orientation = int(match.group('orientation'))
+            self.runner.record(file_name,match.group('sample'),nozzles,orientation,self.runner.key(file_name,len(nozzles),orientation),result)
+        if self.on_result is not None:
+            self.on_result(file_name,published)
+
+    def merge(self,file_name):
+        """Update the result_<sample>_<nozzles>.npz file of the sample of a scan with the cached results of all scans of that sample
+
+        :param file_name: The scan
+        """
+        scans = discover(self.folder)
+        sample = [(found[1],found[2]) for found in scans if found[0] == file_name]
+        scans = [found for found in scans if (found[1],found[2]) in sample]
+        results = {}
+        for found_name,found_sample,nozzles,orientation in scans:
+            if self._accepted.get(found_name) is None:
+                continue
+            cached = self.runner.cached(self.runner.key(found_name,len(nozzles),orientation))
+            if cached is not None:
+                results[found_name] = cached
+        self.runner.merge(scans,results,self._output())
+
+    def status(self):
+        """Get the status of the watcher
+
+        :return: Dictionary with the number of scans waiting in the folder ('waiting') and in the pool ('pending'), their sum ('queue_depth'), whether the pool is full ('backpressure'), the counts (see :attr:`watcher.counts`) and the 50th, 90th and 99th percentile and maximum of the time from writing a scan to publishing its result ('latency') and of the time to analyse a scan ('analysis'), in seconds
+        :rtype: dict
+        """
+        max_pending = self.max_pending if self.max_pending is not None else 2*self._n_workers()
+        result = {'waiting':len(self._waiting),
+                  'pending':len(self._pending),
+                  'queue_depth':len(self._waiting)+len(self._pending),
+                  'backpressure':len(self._pending) >= max_pending,
+                  'workers':self._n_workers()}
+        result.update(self.counts)
+        for name,values in (('latency',self._latencies),('analysis',self._durations)):
+            if values:
+                p50,p90,p99 = np.percentile(values,(50,90,99))
+                result[name] = {'p50':p50,'p90':p90,'p99':p99,'max':max(values)}
+            else:
+                result[name] = None
+        return result
+
+    def write_status(self):
+        """Write the status to watch_status.json in the output folder
+        """
+        self._status_time = time.monotonic()
+        _write_json(os.path.join(self._output(),'watch_status.json'),dict(self.status(),time=time.time()))
+
+    def run(self,duration=None):
+        """Watch the folder until stopped, or for a limited time
+
+        :param duration: Time in seconds after which to stop, by default never
+        """
+        self.start()
+        start = time.monotonic()
+        try:
+            while duration is None or time.monotonic()-start < duration:
+                self.step()
+        finally:
+            self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse scans of interlocked calibration patterns as soon as they are dropped in a folder")
+    parser.add_argument("folder",help="folder that is watched for scans, named <sample>_<nozzles>-<orientation>.bmp")
+    parser.add_argument("--workers",type=int,default=None,help="number of processes, by default the number of processors")
+    parser.add_argument("--max-pending",type=int,default=None,help="maximum number of scans in the pool, by default twice the number of processes")
+    parser.add_argument("--settle",type=float,default=watcher.settle,help="seconds during which a scan should not change before it is analysed")
+    parser.add_argument("--poll",type=float,default=watcher.poll,help="seconds between checks of the folder")
+    parser.add_argument("--cache",default=None,help="folder in which the results of the scans are kept")
+    parser.add_argument("--output",default=None,help="folder to which the results are published")
+    parser.add_argument("--store",default=None,help="folder of the store to which the offsets of every scan are appended")
+    parser.add_argument("--printer",default='',help="name of the printer of the scans, used for the store and the aggregated offsets")
+    parser.add_argument("--aggregate",default=None,help="JSON file with the aggregated offsets of the printer, which is updated with every scan")
+    parser.add_argument("--tools",default="1,2,3,4,5",help="tool list of the prints, the aggregated offsets are given in this order like the x_offsets and y_offsets of the gcode generator")
+    parser.add_argument("--duration",type=float,default=None,help="seconds after which to stop, by default never")
+    parser.add_argument("--set",action="append",default=[],metavar="NAME=VALUE",help="change a parameter of the analysis, for example --set structure_period=0.004")
+    args = parser.parse_args()
+
+    settings = parse_settings(args.set)
+    watching = watcher(args.folder,parameters(**settings))
+    watching.workers = args.workers
+    watching.max_pending = args.max_pending
+    watching.settle = args.settle
+    watching.poll = args.poll
+    watching.output_folder = args.output
+    watching.runner.cache_folder = args.cache
+    if args.store is not None:
+        watching.runner.store = store(args.store)
+    watching.runner.printer = args.printer
+    if args.aggregate is not None:
+        watching.runner.aggregator = aggregator.load(args.aggregate) if os.path.isfile(args.aggregate) else aggregator()
+
+    def report(file_name,result):
+        status = watching.status()
+        if 'error' in result:
+            print("%s failed: %s" % (file_name,result['error']))
+        else:
+            print("%s published %.1f s after writing, queue depth %d" % (file_name,result['latency'],status['queue_depth']))
+            if args.aggregate is not None:
+                watching.runner.aggregator.save(args.aggregate)
+    watching.on_result = report
+    try:
+        watching.run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(watching.status(),indent=1))
+    if args.aggregate is not None:
+        print_offsets(watching.runner.aggregator,args.printer,[int(tool) for tool in args.tools.split(',')])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+.. module:: benchmark
+    :synopsis: Measure the time, memory and output size of generating prints for grids of pattern sizes, tool counts and output modes, and compare them to a baseline
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Every configuration of the grid is generated once to warm up and then repeats times, of which the shortest time is used, since the other repeats are only slower because of other processes. The peak memory is measured in a separate run using tracemalloc, which slows down the generation. The prints are generated with both the :class:`generator.generator` and the :class:`toolpath.toolpath` class, and written as text, as binary gcode (see :mod:`binary_gcode`) and streamed through a :class:`sink.file_sink`.
+
+The results can be saved as a baseline. When a baseline is given, configurations that became slower or use more memory than allowed by the tolerances, or of which the output changed size, are flagged. The baseline stores the machine it was made on, since times can only be compared on the same machine.
+
+Before benchmarking, the gcode files generated by test_pattern_generator.py are generated again with every engine and output mode and compared to the committed files.
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+import binary_gcode
+from calibration_pattern import calibration_pattern
+from config import pattern_config,printer_config
+from generator import generator
+from sink import file_sink
+from toolpath import toolpath
+
+engines = {'generator':generator,'toolpath':toolpath}
+"""The classes that can be used to generate the gcode"""
+
+modes = ('text','binary','stream')
+"""The output modes: written as text at once, written as binary gcode, or streamed through a :class:`sink.file_sink`"""
+
+default_grid = {'length':[35,70,140],
+                'interlocked_period':[4],
+                'tools':[1,5,16],
+                'rotation':[0,15]}
+"""Default grid of the full interlocked print. The rotation is in degrees. The meander print only uses the length and the rotation."""
+
+golden_folder = os.path.dirname(os.path.abspath(__file__))
+"""Folder with the committed gcode files of test_pattern_generator.py"""
+
+
+def printer_for_tools(n_tools,config=None):
+    """Make a printer config with tools 1 to n_tools, of which all tools have the settings of the first tool of a config
+
+    :param n_tools: Number of tools
+    :param config: The :class:`config.printer_config` of which the settings are used, by default the default config
+    :return: The printer config
+    :rtype: config.printer_config
+    """
+    config = printer_config() if config is None else config
+    per_tool = ('nozzle_diameters','standby_temperatures','printing_temperatures','extrusion_multiplier','retraction_distance','x_offsets','y_offsets')
+    changes = {name:(getattr(config,name)[0],)*n_tools for name in per_tool}
+    return config.replace(tools=tuple(range(1,n_tools+1)),**changes)
+
+
+def generate(pattern,print_name,arguments,mode,file_name):
+    """Generate a print and write it to a file
+
+    :param pattern: The :class:`calibration_pattern.calibration_pattern`
+    :param print_name: 'full_interlocked_print' or 'meander_print'
+    :param arguments: The arguments of the print, without the file name
+    :param mode: The output mode, see :data:`benchmark.modes`
+    :param file_name: The file the print is written to
+    """
+    if mode == 'stream':
+        with file_sink(file_name) as output:
+            getattr(pattern,'write_'+print_name)(*arguments,output)
+    else:
+        getattr(pattern,print_name)(*arguments,file_name,binary=(mode == 'binary'))
+
+
+def read_gcode(file_name,mode):
+    """Read the gcode of a file written by :func:`generate`
+
+    :param file_name: The file
+    :param mode: The output mode the file was written with
+    :return: The gcode
+    :rtype: string
+    """
+    if mode == 'binary':
+        return binary_gcode.decode(file_name)
+    with open(file_name) as f:
+        return f.read()
+
+
+def _golden_prints(engine):
+    """The prints of test_pattern_generator.py, made one after the other with the same pattern, as tuples of the pattern, the print, its arguments and the file name
+    """
+    pattern = calibration_pattern(gen=engines[engine]())
+    pattern.gen.x_offsets = [0,0,0,0,0]
+    pattern.gen.y_offsets = [0,0,0,0,0]
+    yield pattern,'full_interlocked_print',([1,2,3,4,5],2),"interlocked_calibration_pattern_diabase.gcode"
+    pattern.gen.x_offsets = [0,-0.05,0.05,-0.1,0.1]
+    pattern.gen.y_offsets = [0,-0.05,0.05,-0.1,0.1]
+    yield pattern,'full_interlocked_print',([2,2,2,2,2],2),"interlocked_calibration_pattern_diabase_one_tool_only_with_offsets.gcode"
+    pattern.spacing = 0.5
+    pattern.gen.rotation = 0
+    pattern.width = 40
+    pattern.length = 10
+    yield pattern,'meander_print',(1,),"meander_print.gcode"
+
+
+def check_golden(folder=None):
+    """Generate the prints of test_pattern_generator.py with every engine and output mode, and compare them to the committed files
+
+    :param folder: Folder with the committed files, by default :data:`benchmark.golden_folder`
+    :return: List with a tuple of the file name, the engine, the mode and whether the gcode is the same, for every check
+    :rtype: list
+    """
+    folder = golden_folder if folder is None else folder
+    results = []
+    with tempfile.TemporaryDirectory() as temporary:
+        for engine in engines:
+            for mode in modes:
+                for pattern,print_name,arguments,name in _golden_prints(engine):
+                    file_name = os.path.join(temporary,name)
+                    generate(pattern,print_name,arguments,mode,file_name)
+                    results.append((name,engine,mode,read_gcode(file_name,mode) == read_gcode(os.path.join(folder,name),'text')))
+    return results
+
+
+def configurations(grid=None,engine_names=None,mode_names=None):
+    """Expand the grid into all configurations of both prints
+
+    :param grid: Dictionary with lists of lengths, interlocked periods, numbers of tools and rotations in degrees, by default :data:`benchmark.default_grid`
+    :param engine_names: The engines, by default all engines
+    :param mode_names: The output modes, by default all modes
+    :return: List of dictionaries with the print, engine, mode and parameters of every configuration
+    :rtype: list
+    """
+    grid = default_grid if grid is None else grid
+    engine_names = list(engines) if engine_names is None else engine_names
+    mode_names = list(modes) if mode_names is None else mode_names
+    result = []
+    for engine in engine_names:
+        for mode in mode_names:
+            for length in grid['length']:
+                for rotation in grid['rotation']:
+                    for period in grid['interlocked_period']:
+                        for n_tools in grid['tools']:
+                            result.append({'print':'full_interlocked_print','engine':engine,'mode':mode,'length':length,'interlocked_period':period,'tools':n_tools,'rotation':rotation})
+                    result.append({'print':'meander_print','engine':engine,'mode':mode,'length':length,'rotation':rotation})
+    return result
+
+
+def key(configuration):
+    """Get the name of a configuration, which is used in the baseline
+
+    :param configuration: The configuration
+    :return: The name
+    :rtype: string
+    """
+    return "|".join("%s=%s" % (name,value) for name,value in configuration.items())
+
+
+def _setup(configuration):
+    """Make the pattern and the arguments of the print of a configuration
+    """
+    n_tools = configuration.get('tools',1)
+    printer = printer_for_tools(n_tools).replace(rotation=configuration['rotation']*math.pi/180)
+    values = {'length':configuration['length']}
+    if 'interlocked_period' in configuration:
+        values['interlocked_period'] = configuration['interlocked_period']
+    pattern = calibration_pattern(pattern_config(**values),engines[configuration['engine']](printer))
+    if configuration['print'] == 'meander_print':
+        return pattern,(1,)
+    return pattern,(list(range(1,n_tools+1)),min(2,n_tools))
+
+
+def measure(configuration,folder,repeats=3):
+    """Measure the time, the peak memory and the output size of a configuration
+
+    :param configuration: The configuration, see :func:`benchmark.configurations`
+    :param folder: Folder in which the print is written
+    :param repeats: Number of times the time is measured
+    :return: Dictionary with the shortest time ('time') in seconds, the peak memory ('peak') and the size of the output ('bytes') in bytes
+    :rtype: dict
+    """
+    pattern,arguments = _setup(configuration)
+    file_name = os.path.join(folder,"benchmark.gcode")
+    generate(pattern,configuration['print'],arguments,configuration['mode'],file_name)
+    times = []
+    for i1 in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        generate(pattern,configuration['print'],arguments,configuration['mode'],file_name)
+        times.append(time.perf_counter()-start)
+    gc.collect()
+    tracemalloc.start()
+    generate(pattern,configuration['print'],arguments,configuration['mode'],file_name)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {'time':min(times),'peak':peak,'bytes':os.path.getsize(file_name)}
+
+
+def machine():
+    """Describe the machine, to check that a baseline was made on the same machine
+
+    :return: Dictionary with the platform, the processor and the Python version
+    :rtype: dict
+    """
+    return {'platform':platform.platform(),'processor':platform.processor() or platform.machine(),'python':platform.python_version()}
+
+
+def compare(results,baseline,time_tolerance=0.25,memory_tolerance=0.1,time_floor=0.002):
+    """Compare results to a baseline
+
+    :param results: Dictionary with the results of every configuration, by name
+    :param baseline: Dictionary with the baseline results of every configuration, by name
+    :param time_tolerance: Allowed relative increase of the time
+    :param memory_tolerance: Allowed relative increase of the peak memory
+    :param time_floor: Increase of the time in seconds that is always allowed, since short times are noisy
+    :return: Dictionary with for every configuration that is flagged a list of the flags: 'slower', 'memory' and 'bytes' (the output changed size)
+    :rtype: dict
+    """
+    flags = {}
+    for name,result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        found = []
+        if result['time'] > base['time']*(1+time_tolerance) and result['time']-base['time'] > time_floor:
+            found.append('slower')
+        if result['peak'] > base['peak']*(1+memory_tolerance):
+            found.append('memory')
+        if result['bytes'] != base['bytes']:
+            found.append('bytes')
+        if found:
+            flags[name] = found
+    return flags
+
+
+def run(grid=None,engine_names=None,mode_names=None,repeats=3,progress=None):
+    """Measure all configurations of a grid
+
+    :param grid: See :func:`benchmark.configurations`
+    :param engine_names: See :func:`benchmark.configurations`
+    :param mode_names: See :func:`benchmark.configurations`
+    :param repeats: See :func:`benchmark.measure`
+    :param progress: Function that is called with the name and the result of every configuration when it is measured
+    :return: Dictionary with the results of every configuration, by name
+    :rtype: dict
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for configuration in configurations(grid,engine_names,mode_names):
+            name = key(configuration)
+            results[name] = dict(configuration,**measure(configuration,folder,repeats))
+            if progress is not None:
+                progress(name,results[name])
+    return results
+
+
+def _numbers(text):
+    return [float(value) if '.' in value else int(value) for value in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the generation of calibration prints and compare it to a baseline")
+    parser.add_argument("--length",type=_numbers,default=default_grid['length'],help="comma separated lengths of the patterns in millimeter")
+    parser.add_argument("--interlocked-period",type=_numbers,default=default_grid['interlocked_period'],help="comma separated interlocked periods in millimeter")
+    parser.add_argument("--tools",type=_numbers,default=default_grid['tools'],help="comma separated numbers of tools, 1 to 16")
+    parser.add_argument("--rotation",type=_numbers,default=default_grid['rotation'],help="comma separated rotations in degrees")
+    parser.add_argument("--engines",default=",".join(engines),help="comma separated engines: generator, toolpath")
+    parser.add_argument("--modes",default=",".join(modes),help="comma separated output modes: text, binary, stream")
+    parser.add_argument("--repeats",type=int,default=3,help="number of times every configuration is timed")
+    parser.add_argument("--baseline",default=None,help="JSON file with the baseline to compare to")
+    parser.add_argument("--save",default=None,help="save the results as baseline to this JSON file")
+    parser.add_argument("--time-tolerance",type=float,default=0.25,help="allowed relative increase of the time")
+    parser.add_argument("--memory-tolerance",type=float,default=0.1,help="allowed relative increase of the peak memory")
+    parser.add_argument("--skip-golden",action="store_true",help="do not compare to the committed gcode files")
+    args = parser.parse_args()
+
+    failed = False
+    if not args.skip_golden:
+        for name,engine,mode,same in check_golden():
+            if not same:
+                print("golden file %s differs for %s %s" % (name,engine,mode))
+                failed = True
+        if not failed:
+            print("all golden files are the same")
+
+    grid = {'length':args.length,'interlocked_period':args.interlocked_period,'tools':args.tools,'rotation':args.rotation}
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['machine'] != machine():
+            print("the baseline was made on another machine, times can not be compared: %s" % (baseline['machine']))
+
+    def progress(name,result):
+        line = "%-110s %8.4f s %10.0f kB %10.0f kB" % (name,result['time'],result['peak']/1e3,result['bytes']/1e3)
+        if baseline is not None and name in baseline['results']:
+            line += " %+6.0f%%" % ((result['time']/baseline['results'][name]['time']-1)*100)
+        print(line)
+
+    results = run(grid,args.engines.split(","),args.modes.split(","),args.repeats,progress)
+    if baseline is not None:
+        flags = compare(results,baseline['results'],args.time_tolerance,args.memory_tolerance)
+        for name,found in flags.items():
+            print("regression %s: %s" % (",".join(found),name))
+        print("%d of %d configurations flagged" % (len(flags),len(results)))
+        failed = failed or bool(flags)
+    if args.save is not None:
+        with open(args.save,"w") as f:
+            json.dump({'machine':machine(),'time':time.time(),'results':results},f,indent=1)
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,364 @@
+"""
+.. module:: binary_gcode
+    :synopsis: Compact binary container for gcode, with a streaming encoder and decoder
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+A binary gcode file starts with a header (the magic bytes GCB and a version number), followed by independent blocks of lines. Every block starts with its flags (compressed and/or checksummed), the number of lines, the size of the payload and the crc32 of the uncompressed payload. In the payload every line starts with an opcode:
+
+* 0: a line of raw text, followed by its length and its utf-8 bytes
+* 1: same as 0, but for a last line that did not end with a newline
+* 2: a new motion shape followed by a line of that shape. A shape is the command (G0, G1, G2 or G3), its word letters and the number of decimals of every word. The shape gets the next free shape number of the block.
+* 3 and up: a motion line of shape number opcode-3
+
+The words of a motion line are stored as the difference of their fixed point value with the previous value of the same letter and number of decimals in the block, as zigzag varint. A motion line is only encoded like this if decoding it results in exactly the same text; all other lines are stored as raw text. Since every block starts from scratch, blocks can be decoded independently.
+"""
+import argparse
+import re
+import struct
+import zlib
+
+from sink import sink
+
+magic = b"GCB"
+version = 1
+
+COMPRESSED = 1
+"""Block flag indicating that the payload is compressed using zlib"""
+
+CHECKSUM = 2
+"""Block flag indicating that the block contains the crc32 of its payload"""
+
+_header = struct.Struct("<3sB")
+_block_header = struct.Struct("<BIII")
+_commands = ('G0','G1','G2','G3')
+_command_index = {command:index for index,command in enumerate(_commands)}
+_word = re.compile(r"([A-Z])(-?)([0-9]+)(?:\.([0-9]+))?$")
+
+
+def _write_varint(out,value):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data,position):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value,position
+        shift += 7
+
+
+def _format(value,decimals):
+    """Format a fixed point value with a number of decimals the way %.nf would
+    """
+    digits = str(abs(value))
+    if decimals:
+        digits = digits.rjust(decimals+1,'0')
+        digits = digits[:-decimals]+'.'+digits[-decimals:]
+    if value < 0:
+        return '-'+digits
+    return digits
+
+
+class block_encoder:
+    """Encoder of a single block of lines, see :mod:`binary_gcode` for the format
+    """
+
+    def __init__(self):
+        self._payload = bytearray()
+        self._shapes = {}
+        self._previous = {}
+        self.n_lines = 0
+        """Number of lines in the block"""
+
+    def add(self,line,newline=True):
+        """Add a line to the block
+
+        :param line: The line without its newline
+        :param newline: Wether the line ended with a newline
+        """
+        self.n_lines += 1
+        if newline:
+            tokens = line.split(' ')
+            command = _command_index.get(tokens[0])
+            if command is not None and len(tokens) > 1 and self._add_motion(command,tokens,line):
+                return
+        data = line.encode('utf-8')
+        self._payload.append(0 if newline else 1)
+        _write_varint(self._payload,len(data))
+        self._payload += data
+
+    def _add_motion(self,command,tokens,line):
+        letters = []
+        decimals = []
+        values = []
+        for token in tokens[1:]:
+            match = _word.match(token)
+            if match is None:
+                return False
+            letter,sign,whole,fraction = match.groups()
+            if fraction is None:
+                fraction = ""
+            value = int(whole+fraction)
+            if sign:
+                value = -value
+            letters.append(letter)
+            decimals.append(len(fraction))
+            values.append(value)
+        if len(letters) > 255 or max(decimals) > 255:
+            return False
+        if " ".join([tokens[0]]+[letter+_format(value,n) for letter,value,n in zip(letters,values,decimals)]) != line:
+            #for example -0.000 or leading zeros, can not be reproduced
+            return False
+
+        payload = self._payload
+        shape = (command,tuple(letters),tuple(decimals))
+        number = self._shapes.get(shape)
+        if number is None:
+            number = len(self._shapes)
+            self._shapes[shape] = number
+            payload.append(2)
+            payload.append(command)
+            payload.append(len(letters))
+            for letter,n in zip(letters,decimals):
+                payload.append(ord(letter))
+                payload.append(n)
+        else:
+            _write_varint(payload,number+3)
+        previous = self._previous
+        for letter,n,value in zip(letters,decimals,values):
+            key = (letter,n)
+            delta = value-previous.get(key,0)
+            previous[key] = value
+            _write_varint(payload,delta*2 if delta >= 0 else -delta*2-1)
+        return True
+
+    def finish(self,compress=True,checksum=True,level=6):
+        """Get the encoded block including its header
+
+        :param compress: Compress the payload using zlib
+        :param checksum: Add the crc32 of the payload
+        :param level: zlib compression level
+        :return: The encoded block
+        :rtype: bytes
+        """
+        payload = bytes(self._payload)
+        flags = 0
+        crc = 0
+        if checksum:
+            flags |= CHECKSUM
+            crc = zlib.crc32(payload)
+        if compress:
+            flags |= COMPRESSED
+            payload = zlib.compress(payload,level)
+        return _block_header.pack(flags,self.n_lines,len(payload),crc)+payload
+
+
+def decode_block(flags,n_lines,payload,crc):
+    """Decode the payload of a single block
+
+    :param flags: The flags of the block
+    :param n_lines: The number of lines in the block
+    :param payload: The payload as stored in the file
+    :param crc: The crc32 stored in the block header
+    :return: The gcode of the block
+    :rtype: string
+    """
+    if flags & COMPRESSED:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error:
+            raise Exception("Corrupt binary gcode block")
+    if flags & CHECKSUM and zlib.crc32(payload) != crc:
+        raise Exception("Checksum error in binary gcode block")
+    lines = []
+    shapes = []
+    previous = {}
+    position = 0
+    for i1 in range(n_lines):
+        opcode,position = _read_varint(payload,position)
+        if opcode < 2:
+            length,position = _read_varint(payload,position)
+            line = payload[position:position+length].decode('utf-8')
+            position += length
+            lines.append(line+'\n' if opcode == 0 else line)
+            continue
+        if opcode == 2:
+            command = payload[position]
+            n_words = payload[position+1]
+            position += 2
+            words = []
+            for i2 in range(n_words):
+                words.append((chr(payload[position]),payload[position+1]))
+                position += 2
+            shape = (_commands[command],words)
+            shapes.append(shape)
+        else:
+            shape = shapes[opcode-3]
+        command,words = shape
+        parts = [command]
+        for letter,decimals in words:
+            zigzag,position = _read_varint(payload,position)
+            delta = zigzag >> 1 if not zigzag & 1 else -((zigzag+1) >> 1)
+            key = (letter,decimals)
+            value = previous.get(key,0)+delta
+            previous[key] = value
+            parts.append(letter+_format(value,decimals))
+        lines.append(" ".join(parts)+'\n')
+    return "".join(lines)
+
+
+class binary_sink(sink):
+    """Sink that encodes gcode to binary gcode (see :mod:`binary_gcode`) and writes it to a binary file. Only a single block is kept in memory, so arbitrary long prints can be encoded. For example:
+
+    .. code-block:: python
+
+        with binary_sink("example.bgcode") as output:
+            pattern.write_full_interlocked_print([1,2,3,4,5],2,output)
+
+    :param file: Name of the file to write to, or a file object opened in binary mode. A file that is opened by the sink is also closed by it.
+    """
+
+    block_lines = 4096
+    """Number of lines per block"""
+
+    compress = True
+    """Compress every block using zlib"""
+
+    compression_level = 6
+    """zlib compression level"""
+
+    checksum = True
+    """Add a crc32 checksum to every block"""
+
+    def __init__(self,file,buffer_size=None,block_lines=None,compress=None,checksum=None):
+        super().__init__(buffer_size)
+        if block_lines is not None:
+            self.block_lines = block_lines
+        if compress is not None:
+            self.compress = compress
+        if checksum is not None:
+            self.checksum = checksum
+        if isinstance(file,str):
+            self.file = open(file,"wb")
+            self._owns_file = True
+        else:
+            self.file = file
+            self._owns_file = False
+        self.file.write(_header.pack(magic,version))
+        self.bytes_encoded = _header.size
+        """Number of bytes of binary gcode written"""
+        self._block = block_encoder()
+        self._partial = ""
+
+    def write_chunk(self,chunk):
+        lines = (self._partial+chunk).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._block.add(line)
+            if self._block.n_lines >= self.block_lines:
+                self._write_block()
+
+    def _write_block(self):
+        block = self._block.finish(self.compress,self.checksum,self.compression_level)
+        self.file.write(block)
+        self.bytes_encoded += len(block)
+        self._block = block_encoder()
+
+    def close(self):
+        self.flush()
+        if self._partial:
+            self._block.add(self._partial,False)
+            self._partial = ""
+        if self._block.n_lines:
+            self._write_block()
+        if self._owns_file:
+            self.file.close()
+
+
+def iter_decode(file):
+    """Decode binary gcode block by block, without reading the whole file in memory
+
+    :param file: Name of the binary gcode file, or a file object opened in binary mode
+    :return: Iterator over the gcode of every block
+    :rtype: iterator
+    """
+    if isinstance(file,str):
+        with open(file,"rb") as f:
+            yield from iter_decode(f)
+        return
+    header = file.read(_header.size)
+    if len(header) < _header.size or _header.unpack(header)[0] != magic:
+        raise Exception("File is not binary gcode")
+    if _header.unpack(header)[1] != version:
+        raise Exception("Unsupported binary gcode version")
+    while True:
+        block_header = file.read(_block_header.size)
+        if not block_header:
+            return
+        if len(block_header) < _block_header.size:
+            raise Exception("Binary gcode file is truncated")
+        flags,n_lines,size,crc = _block_header.unpack(block_header)
+        payload = file.read(size)
+        if len(payload) < size:
+            raise Exception("Binary gcode file is truncated")
+        yield decode_block(flags,n_lines,payload,crc)
+
+
+def encode(code,file,**options):
+    """Encode a complete gcode program to binary gcode
+
+    :param code: The gcode, either a string or an iterable of pieces of gcode
+    :param file: Name of the file to write to, or a file object opened in binary mode
+    :param options: Options of :class:`binary_gcode.binary_sink`
+    :return: The number of bytes written
+    :rtype: int
+    """
+    if isinstance(code,str):
+        code = [code]
+    with binary_sink(file,**options) as output:
+        output.write_all(code)
+    return output.bytes_encoded
+
+
+def decode(file):
+    """Decode a complete binary gcode file
+
+    :param file: Name of the binary gcode file, or a file object opened in binary mode
+    :return: The gcode
+    :rtype: string
+    """
+    return "".join(iter_decode(file))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert between text gcode and binary gcode")
+    parser.add_argument("mode",choices=["encode","decode"],help="encode text to binary or decode binary to text")
+    parser.add_argument("input",help="file to convert")
+    parser.add_argument("output",help="file the result is written to")
+    parser.add_argument("--no-compression",action="store_true",help="do not compress the blocks")
+    parser.add_argument("--no-checksum",action="store_true",help="do not add checksums to the blocks")
+    parser.add_argument("--block-lines",type=int,help="number of lines per block")
+    args = parser.parse_args()
+
+    if args.mode == "encode":
+        n_text = 0
+        with open(args.input) as f, binary_sink(args.output,block_lines=args.block_lines,compress=not args.no_compression,checksum=not args.no_checksum) as output:
+            for chunk in iter(lambda: f.read(sink.buffer_size),""):
+                n_text += len(chunk)
+                output.write(chunk)
+        print("%.0f bytes -> %.0f bytes (%.1f times smaller)" % (n_text,output.bytes_encoded,n_text/output.bytes_encoded))
+    else:
+        with open(args.output,"w") as f:
+            for code in iter_decode(args.input):
+                f.write(code)
+
+
+if __name__ == '__main__':
+    main()
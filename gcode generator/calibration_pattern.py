@@ -4,41 +4,82 @@
 .. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
 """
 
+import copy
 import math
+import threading
+
+import binary_gcode
+import schedule
+from config import pattern_config,config_property
 from generator import generator
 
+_direction_names = {'y':'vertical','x':'horizontal'}
+
 class calibration_pattern:
-    #pattern parameters
-    width = 8 
-    """Length of lines in the test pattern"""
+    """This class can be used to make calibration patterns. The parameters of the pattern are stored in an immutable :class:`config.pattern_config` and the printer specific parameters in the :class:`config.printer_config` of the generator. Every print is generated by its own job (see :meth:`calibration_pattern.job`), so a single calibration_pattern can generate multiple prints at the same time, for example in different threads.
 
-    pitch = 1
-    """Milimeter spacing between the lines of the test pattern"""
-    
-    sigref_only = 2 
-    """Space where this only a sig or a ref pattern"""
+    :param config: The parameters of the pattern, when not given the defaults of :class:`config.pattern_config` are used
+    :param gen: The generator used to generate the gcode, when not given a :class:`generator.generator` with the default printer parameters is used
+    """
 
-    length = 70
-    """Total length of all the meanders"""
-    
-    square_lines = 3 
-    """Number of lines of the square around the structure"""
-    
-    spacing = 3 
-    """Spacing between two patterns of different nozzles"""
-    
-    spacing_to_square = 5 
-    """Spacing between the patterns and the square"""
+    cache_sections = False
+    """Keep the gcode of every section (the square, each reference pattern and each signal pattern) of the last :meth:`calibration_pattern.full_interlocked_print` in memory, and only regenerate the sections whose inputs changed. This makes regenerating a print after changing only the offsets of the tools much faster."""
+
+    schedule_blocks = False
+    """Reorder the patterns of :meth:`calibration_pattern.full_interlocked_print` to minimise travel and tool changes, see :mod:`schedule`. The reference patterns are still all printed before the signal patterns."""
+
+    template_cache_size = 256
+    """Maximum number of templates of a single period (see :meth:`calibration_pattern.interlocked_template`) that is kept in memory"""
 
-    interlocked_period = 4 
-    """How many milliemeters it takes before the structure repeats itself"""
+    #set on jobs, see job
+    _is_job = False
 
-    interlocked_pitch = 0.75 
-    """The pitch of the lines in the center of the structure in millimeters"""
+    def __init__(self,config=None,gen=None):
+        self.config = pattern_config() if config is None else config
+        """Immutable :class:`config.pattern_config` with the parameters of the pattern. Every parameter of the config can also be read and assigned as an attribute of the pattern, for example pattern.width = 10. Assigning replaces the config by a changed copy."""
 
-    gen = generator()
-    """An instance of the generator class to generate the gcode"""
+        self.gen = generator() if gen is None else gen
+        """An instance of the generator class to generate the gcode"""
 
+        self.regenerated_sections = []
+        """Names of the sections that were (re)generated by the print of a job (see :meth:`calibration_pattern.job`). A print of the pattern itself runs in a new job and does not change the pattern, so this is only filled in on jobs."""
+
+        self.schedule_report = None
+        """Estimated travel, tool changes and time before and after scheduling of the print of a job, when :attr:`calibration_pattern.schedule_blocks` is enabled. Like :attr:`calibration_pattern.regenerated_sections` this is only filled in on jobs."""
+
+        #caches that are shared by all jobs of this pattern
+        self._templates = {}
+        self._sections = {}
+        self._lock = threading.Lock()
+
+    def job(self):
+        """Create the context of a single print job: a copy of this pattern with its own generator (see :meth:`generator.job`) that holds the position and tool state of the print. The job shares the immutable configs and the caches of this pattern. A print of the pattern itself runs in a new job, so several prints can be generated at the same time. A print of a job runs in the job itself, which keeps the results of its last print, for example:
+
+        .. code-block:: python
+
+            job = pattern.job()
+            lines = job.full_interlocked_print([1,2,3,4,5],2,"example.g")
+            print(job.regenerated_sections,job.schedule_report)
+
+        :return: The job
+        :rtype: calibration_pattern
+        """
+        job = copy.copy(self)
+        job.gen = self.gen.job()
+        job.regenerated_sections = []
+        job.schedule_report = None
+        job._is_job = True
+        return job
+
+    def _print_job(self):
+        """Get the job a print runs in: a new job of the pattern, or the job itself with a new generator state and without the results of its previous print
+        """
+        if not self._is_job:
+            return self.job()
+        self.gen = self.gen.job()
+        self.regenerated_sections = []
+        self.schedule_report = None
+        return self
 
     def repetitions(self):
         """Calculates the number of repetions/periods of the repetitie pattern.
@@ -125,15 +166,21 @@ class calibration_pattern:
         :return: The gcode to generate the square
         :rtype: string
         """
-        lines = ""
+        return "".join(self.iter_square_pattern(x_start,y_start,x,y,clockwise,n))
+
+    def iter_square_pattern(self,x_start,y_start,x,y,clockwise,n):
+        """Same as :meth:`calibration_pattern.square_pattern`, but yields the gcode piece by piece instead of returning it as a single string
+
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
         d = self.gen.nozzle_diameters[self.gen.current_tool_index]
-        lines += self.gen.move_to(x_start,y_start)
-        lines += self.gen.reretract()
+        yield self.gen.move_to(x_start,y_start)
+        yield self.gen.reretract()
         for i1 in range(n):
-            lines += self.gen.move_to(x_start + i1*d,y_start + i1*d)
-            lines += self.gen.square(x-i1*d*2,y-i1*d*2,clockwise)
-        lines += self.gen.retract()
-        return lines
+            yield self.gen.move_to(x_start + i1*d,y_start + i1*d)
+            yield self.gen.square(x-i1*d*2,y-i1*d*2,clockwise)
+        yield self.gen.retract()
 
     def interlocked_reference_pattern(self,x_start,y_start,direction):
         """Generate the gcode to print a single interlocked reference pattern
@@ -144,135 +191,152 @@ class calibration_pattern:
         :return: The gcode to generate the pattern
         :rtype: string
         """
+        return "".join(self.iter_interlocked_reference_pattern(x_start,y_start,direction))
+
+    def iter_interlocked_reference_pattern(self,x_start,y_start,direction):
+        """Same as :meth:`calibration_pattern.interlocked_reference_pattern`, but yields the gcode piece by piece instead of returning it as a single string
+
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
         repititions = self.repetitions_interlocked()
 
-        lines = ""
-        
         if direction == '+y':
-            lines += self.gen.move_to(x_start+self.width,y_start+self.interlocked_period/2)
-            lines += self.gen.reretract()
-            for i1 in range(repititions):
-                #make sure retraction artefact can be take of print
-                if i1 ==0:
-                    lines += self.gen.move(-(self.width-self.sigref_only),0)
-                else:
-                    lines += self.gen.line(-(self.width-self.sigref_only),0)
-                lines += self.gen.u_turn(0,self.interlocked_pitch,True)
-                lines += self.gen.line(self.width-self.sigref_only,0)
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,self.interlocked_pitch/2,False)
-                lines += self.gen.line(0,self.interlocked_period-2*self.interlocked_pitch)
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,self.interlocked_pitch/2,False)
-            lines += self.gen.move(-(self.width-self.sigref_only),0)
+            yield self.gen.move_to(x_start+self.width,y_start+self.interlocked_period/2)
         elif direction == '-y':
-            lines += self.gen.move_to(x_start+self.width,y_start-self.interlocked_period/2)
-            lines += self.gen.reretract()
-            for i1 in range(repititions):
-                #make sure retraction artefact can be take of print
-                if i1 ==0:
-                    lines += self.gen.move(-(self.width-self.sigref_only),0)
-                else:
-                    lines += self.gen.line(-(self.width-self.sigref_only),0)
-                lines += self.gen.u_turn(0,-self.interlocked_pitch,False)
-                lines += self.gen.line(self.width-self.sigref_only,0)
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,-self.interlocked_pitch/2,True)
-                lines += self.gen.line(0,-(self.interlocked_period-2*self.interlocked_pitch))
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,-self.interlocked_pitch/2,True)
-            lines += self.gen.move(-(self.width-self.sigref_only),0)
+            yield self.gen.move_to(x_start+self.width,y_start-self.interlocked_period/2)
         elif direction == '+x':
-            lines += self.gen.move_to(x_start+self.interlocked_period/2,y_start+self.width)
-            lines += self.gen.reretract()
-            for i1 in range(repititions):
-                if i1 == 0:
-                    lines += self.gen.move(0,-(self.width-self.sigref_only))
-                else:
-                    lines += self.gen.line(0,-(self.width-self.sigref_only))
-                lines += self.gen.u_turn(self.interlocked_pitch,0,False)
-                lines += self.gen.line(0,self.width-self.sigref_only)
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,self.interlocked_pitch/2,True)
-                lines += self.gen.line(self.interlocked_period-2*self.interlocked_pitch,0)
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,-self.interlocked_pitch/2,True)
-            lines += self.gen.move(0,-(self.width-self.sigref_only))
+            yield self.gen.move_to(x_start+self.interlocked_period/2,y_start+self.width)
         elif direction == '-x':
-            lines += self.gen.move_to(x_start-self.interlocked_period/2,y_start+self.width)
-            lines += self.gen.reretract()
-            for i1 in range(repititions):
-                if i1 == 0:
-                    lines += self.gen.move(0,-(self.width-self.sigref_only))
-                else:
-                    lines += self.gen.line(0,-(self.width-self.sigref_only))
-                lines += self.gen.u_turn(-self.interlocked_pitch,0,True)
-                lines += self.gen.line(0,self.width-self.sigref_only)
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,self.interlocked_pitch/2,False)
-                lines += self.gen.line(-(self.interlocked_period-2*self.interlocked_pitch),0)
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,-self.interlocked_pitch/2,False)
-            lines += self.gen.move(0,-(self.width-self.sigref_only))
+            yield self.gen.move_to(x_start-self.interlocked_period/2,y_start+self.width)
         else:
             raise Exception("Unknown direction given to single_pattern function")
-        lines += self.gen.retract()
-        return lines
+        template = self.interlocked_template('reference',direction)
+        yield self.gen.reretract()
+        yield from self._iter_interlocked_repetitions(template,repititions)
+        yield self.gen.retract()
 
     def interlocked_signal_pattern(self,x_start,y_start,direction):
+        """Generate the gcode to print a single interlocked signal pattern
+
+        :param x_start: The x location of the bottom left corner of the pattern
+        :param y_start: The y location of the bottom left corner of the pattern
+        :param direction: The direction the pattern should be printed in. Options are: '+y', '-y','+x', '-x'
+        :return: The gcode to generate the pattern
+        :rtype: string
+        """
+        return "".join(self.iter_interlocked_signal_pattern(x_start,y_start,direction))
+
+    def iter_interlocked_signal_pattern(self,x_start,y_start,direction):
+        """Same as :meth:`calibration_pattern.interlocked_signal_pattern`, but yields the gcode piece by piece instead of returning it as a single string
+
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
         repititions = self.repetitions_interlocked()
 
-        lines = ""
-        lines += self.gen.move_to(x_start,y_start)
-        lines += self.gen.reretract()
+        yield self.gen.move_to(x_start,y_start)
+        yield self.gen.reretract()
+        template = self.interlocked_template('signal',direction)
+        yield from self._iter_interlocked_repetitions(template,repititions)
+        yield self.gen.retract()
+
+    def _iter_interlocked_repetitions(self,template,repititions):
+        """Yield the gcode of all repetitions of an interlocked pattern. Every repetition is the template, except that the first line of the first repetition is a move, to make sure the retraction artefact can be taken of the print. The pattern ends with a move in the same direction as the first line.
+        """
+        name,x,y = template[0]
+        if repititions > 0:
+            yield self.gen.move(x,y)
+            yield self.gen.repeat(template[1:],1)
+            yield self.gen.repeat(template,repititions-1)
+        yield self.gen.move(x,y)
+
+    def interlocked_template(self,pattern,direction):
+        """Get the moves of a single period of an interlocked pattern. All periods of a pattern are the same moves, so a template is only calculated once and then reused for all repetitions, see :meth:`generator.repeat`. This saves calculating the moves of every period, but with the default :class:`generator.generator` the gcode of every repetition is still formatted move by move, so the time grows with :meth:`calibration_pattern.repetitions_interlocked`. Only with the :class:`toolpath.toolpath` engine the repetitions are copied in bulk. Templates are cached per pattern, direction, tool and :attr:`calibration_pattern.config`. The cache is shared by all jobs of the pattern and is cleared once it holds :attr:`calibration_pattern.template_cache_size` templates.
+
+        :param pattern: Either 'reference' or 'signal'
+        :param direction: The direction the pattern should be printed in. Options are: '+y', '-y','+x', '-x'
+        :return: The moves of one period as a tuple of (primitive, x, y) and (primitive, x, y, clockwise) tuples, where primitive is the name of a method of the :class:`generator` class
+        :rtype: tuple
+        """
+        key = (pattern,direction,self.gen.current_tool_index,self.config)
+        template = self._templates.get(key)
+        if template is None:
+            if pattern == 'reference':
+                template = self._interlocked_reference_template(direction)
+            elif pattern == 'signal':
+                template = self._interlocked_signal_template(direction)
+            else:
+                raise Exception("Unknown pattern given to interlocked_template function")
+            with self._lock:
+                if len(self._templates) >= self.template_cache_size:
+                    self._templates.clear()
+                self._templates[key] = template
+        return template
+
+    def _interlocked_reference_template(self,direction):
         if direction == '+y':
-            for i1 in range(repititions):
-                #make sure retraction artefact can be taken of print
-                if i1 ==0:
-                    lines += self.gen.move(self.width-self.sigref_only,0)
-                else:
-                    lines += self.gen.line(self.width-self.sigref_only,0)
-                lines += self.gen.u_turn(0,self.interlocked_pitch,False)
-                lines += self.gen.line(-(self.width-self.sigref_only),0)
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,self.interlocked_pitch/2,True)
-                lines += self.gen.line(0,self.interlocked_period-2*self.interlocked_pitch)
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,self.interlocked_pitch/2,True)
-            lines += self.gen.move(self.width-self.sigref_only,0)
+            return (('line',-(self.width-self.sigref_only),0),
+                    ('u_turn',0,self.interlocked_pitch,True),
+                    ('line',self.width-self.sigref_only,0),
+                    ('quarter_turn',self.interlocked_pitch/2,self.interlocked_pitch/2,False),
+                    ('line',0,self.interlocked_period-2*self.interlocked_pitch),
+                    ('quarter_turn',-self.interlocked_pitch/2,self.interlocked_pitch/2,False))
         elif direction == '-y':
-            for i1 in range(repititions):
-                #make sure retraction artefact can be taken of print
-                if i1 ==0:
-                    lines += self.gen.move(self.width-self.sigref_only,0)
-                else:
-                    lines += self.gen.line(self.width-self.sigref_only,0)
-                lines += self.gen.u_turn(0,-self.interlocked_pitch,True)
-                lines += self.gen.line(-(self.width-self.sigref_only),0)
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,-self.interlocked_pitch/2,False)
-                lines += self.gen.line(0,-(self.interlocked_period-2*self.interlocked_pitch))
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,-self.interlocked_pitch/2,False)
-            lines += self.gen.move(self.width-self.sigref_only,0)
+            return (('line',-(self.width-self.sigref_only),0),
+                    ('u_turn',0,-self.interlocked_pitch,False),
+                    ('line',self.width-self.sigref_only,0),
+                    ('quarter_turn',self.interlocked_pitch/2,-self.interlocked_pitch/2,True),
+                    ('line',0,-(self.interlocked_period-2*self.interlocked_pitch)),
+                    ('quarter_turn',-self.interlocked_pitch/2,-self.interlocked_pitch/2,True))
         elif direction == '+x':
-            for i1 in range(repititions):
-                #make sure retraction artefact can be taken of print
-                if i1 ==0:
-                    lines += self.gen.move(0,self.width-self.sigref_only)
-                else:
-                    lines += self.gen.line(0,self.width-self.sigref_only)
-                lines += self.gen.u_turn(self.interlocked_pitch,0,True)
-                lines += self.gen.line(0,-(self.width-self.sigref_only))
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,-self.interlocked_pitch/2,False)
-                lines += self.gen.line(self.interlocked_period-2*self.interlocked_pitch,0)
-                lines += self.gen.quarter_turn(self.interlocked_pitch/2,self.interlocked_pitch/2,False)
-            lines += self.gen.move(0,self.width-self.sigref_only)
+            return (('line',0,-(self.width-self.sigref_only)),
+                    ('u_turn',self.interlocked_pitch,0,False),
+                    ('line',0,self.width-self.sigref_only),
+                    ('quarter_turn',self.interlocked_pitch/2,self.interlocked_pitch/2,True),
+                    ('line',self.interlocked_period-2*self.interlocked_pitch,0),
+                    ('quarter_turn',self.interlocked_pitch/2,-self.interlocked_pitch/2,True))
         elif direction == '-x':
-            for i1 in range(repititions):
-                #make sure retraction artefact can be taken of print
-                if i1 ==0:
-                    lines += self.gen.move(0,self.width-self.sigref_only)
-                else:
-                    lines += self.gen.line(0,self.width-self.sigref_only)
-                lines += self.gen.u_turn(-self.interlocked_pitch,0,False)
-                lines += self.gen.line(0,-(self.width-self.sigref_only))
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,-self.interlocked_pitch/2,True)
-                lines += self.gen.line(-(self.interlocked_period-2*self.interlocked_pitch),0)
-                lines += self.gen.quarter_turn(-self.interlocked_pitch/2,self.interlocked_pitch/2,True)
-            lines += self.gen.move(0,self.width-self.sigref_only)
+            return (('line',0,-(self.width-self.sigref_only)),
+                    ('u_turn',-self.interlocked_pitch,0,True),
+                    ('line',0,self.width-self.sigref_only),
+                    ('quarter_turn',-self.interlocked_pitch/2,self.interlocked_pitch/2,False),
+                    ('line',-(self.interlocked_period-2*self.interlocked_pitch),0),
+                    ('quarter_turn',-self.interlocked_pitch/2,-self.interlocked_pitch/2,False))
+        else:
+            raise Exception("Unknown direction given to single_pattern function")
+
+    def _interlocked_signal_template(self,direction):
+        if direction == '+y':
+            return (('line',self.width-self.sigref_only,0),
+                    ('u_turn',0,self.interlocked_pitch,False),
+                    ('line',-(self.width-self.sigref_only),0),
+                    ('quarter_turn',-self.interlocked_pitch/2,self.interlocked_pitch/2,True),
+                    ('line',0,self.interlocked_period-2*self.interlocked_pitch),
+                    ('quarter_turn',self.interlocked_pitch/2,self.interlocked_pitch/2,True))
+        elif direction == '-y':
+            return (('line',self.width-self.sigref_only,0),
+                    ('u_turn',0,-self.interlocked_pitch,True),
+                    ('line',-(self.width-self.sigref_only),0),
+                    ('quarter_turn',-self.interlocked_pitch/2,-self.interlocked_pitch/2,False),
+                    ('line',0,-(self.interlocked_period-2*self.interlocked_pitch)),
+                    ('quarter_turn',self.interlocked_pitch/2,-self.interlocked_pitch/2,False))
+        elif direction == '+x':
+            return (('line',0,self.width-self.sigref_only),
+                    ('u_turn',self.interlocked_pitch,0,True),
+                    ('line',0,-(self.width-self.sigref_only)),
+                    ('quarter_turn',self.interlocked_pitch/2,-self.interlocked_pitch/2,False),
+                    ('line',self.interlocked_period-2*self.interlocked_pitch,0),
+                    ('quarter_turn',self.interlocked_pitch/2,self.interlocked_pitch/2,False))
+        elif direction == '-x':
+            return (('line',0,self.width-self.sigref_only),
+                    ('u_turn',-self.interlocked_pitch,0,False),
+                    ('line',0,-(self.width-self.sigref_only)),
+                    ('quarter_turn',-self.interlocked_pitch/2,-self.interlocked_pitch/2,True),
+                    ('line',-(self.interlocked_period-2*self.interlocked_pitch),0),
+                    ('quarter_turn',-self.interlocked_pitch/2,self.interlocked_pitch/2,True))
         else:
             raise Exception("Unknown direction given to single_pattern function")
-        lines += self.gen.retract()
-        return lines
 
     def single_pattern(self,x_start,y_start,direction):
         """Generate the gcode to print a single simple reference pattern
@@ -283,57 +347,63 @@ class calibration_pattern:
         :return: The gcode to generate the pattern
         :rtype: string
         """
+        return "".join(self.iter_single_pattern(x_start,y_start,direction))
+
+    def iter_single_pattern(self,x_start,y_start,direction):
+        """Same as :meth:`calibration_pattern.single_pattern`, but yields the gcode piece by piece instead of returning it as a single string
+
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
         repetitions = self.repetitions()
-        lines = ""
-        lines += self.gen.move_to(x_start,y_start)
-        lines += self.gen.reretract()
+        yield self.gen.move_to(x_start,y_start)
+        yield self.gen.reretract()
         if direction == '+y':
             for i1 in range(repetitions):
                 #make sure retraction artefact can be take of print
                 if i1 ==0:
-                    lines += self.gen.move(self.width-2*self.pitch,0)
+                    yield self.gen.move(self.width-2*self.pitch,0)
                 else:
-                    lines += self.gen.line(self.width-2*self.pitch,0)
-                lines += self.gen.u_turn(0,self.pitch,False)
-                lines += self.gen.line(-(self.width-2*self.pitch),0)
-                lines += self.gen.u_turn(0,self.pitch,True)
-            lines += self.gen.move(self.width,0)
+                    yield self.gen.line(self.width-2*self.pitch,0)
+                yield self.gen.u_turn(0,self.pitch,False)
+                yield self.gen.line(-(self.width-2*self.pitch),0)
+                yield self.gen.u_turn(0,self.pitch,True)
+            yield self.gen.move(self.width,0)
         elif direction == '-y':
             for i1 in range(repetitions):
                 if i1 ==0:
-                    lines += self.gen.move(self.width-2*self.pitch,0)
+                    yield self.gen.move(self.width-2*self.pitch,0)
                 else:
-                    lines += self.gen.line(self.width-2*self.pitch,0)
-                lines += self.gen.u_turn(0,-self.pitch,True)
-                lines += self.gen.line(-(self.width-2*self.pitch),0)
-                lines += self.gen.u_turn(0,-self.pitch,False)
-            lines += self.gen.move(self.width,0)
+                    yield self.gen.line(self.width-2*self.pitch,0)
+                yield self.gen.u_turn(0,-self.pitch,True)
+                yield self.gen.line(-(self.width-2*self.pitch),0)
+                yield self.gen.u_turn(0,-self.pitch,False)
+            yield self.gen.move(self.width,0)
         elif direction == '+x':
-            lines += self.gen.line(0,self.pitch)
+            yield self.gen.line(0,self.pitch)
             for i1 in range(repetitions):
                 if i1 == 0:
-                    lines += self.gen.move(0,self.width-2*self.pitch)
+                    yield self.gen.move(0,self.width-2*self.pitch)
                 else:
-                    lines += self.gen.line(0,self.width-2*self.pitch)
-                lines += self.gen.u_turn(self.pitch,0,True)
-                lines += self.gen.line(0,-(self.width-2*self.pitch))
-                lines += self.gen.u_turn(self.pitch,0,False)
-            lines += self.gen.move(0,self.width)
+                    yield self.gen.line(0,self.width-2*self.pitch)
+                yield self.gen.u_turn(self.pitch,0,True)
+                yield self.gen.line(0,-(self.width-2*self.pitch))
+                yield self.gen.u_turn(self.pitch,0,False)
+            yield self.gen.move(0,self.width)
         elif direction == '-x':
-            lines += self.gen.line(0,self.pitch)
+            yield self.gen.line(0,self.pitch)
             for i1 in range(repetitions):
                 if i1 == 0:
-                    lines += self.gen.move(0,self.width-2*self.pitch)
+                    yield self.gen.move(0,self.width-2*self.pitch)
                 else:
-                    lines += self.gen.line(0,self.width-2*self.pitch)
-                lines += self.gen.u_turn(-self.pitch,0,False)
-                lines += self.gen.line(0,-(self.width-2*self.pitch))
-                lines += self.gen.u_turn(-self.pitch,0,True)
-            lines += self.move(0,self.width)
+                    yield self.gen.line(0,self.width-2*self.pitch)
+                yield self.gen.u_turn(-self.pitch,0,False)
+                yield self.gen.line(0,-(self.width-2*self.pitch))
+                yield self.gen.u_turn(-self.pitch,0,True)
+            yield self.move(0,self.width)
         else:
             raise Exception("Unknown direction given to single_pattern function")
-        lines += self.gen.retract()
-        return lines
+        yield self.gen.retract()
 
     def differential_interlocked_reference_pattern(self,x_start,y_start,direction):
         """Generate the gcode to print one side (the reference side) of two interlocked patterns, one going up and one going down
@@ -344,26 +414,20 @@ class calibration_pattern:
         :return: The gcode to generate the pattern
         :rtype: string
         """
-        lines = ""
-        if direction == 'y':
-            lines += self.interlocked_reference_pattern(x_start,y_start,'+y')
-            lines += self.gen.move(self.width,0)
-            lines += self.gen.move(0,-self.length)
-            lines += self.interlocked_reference_pattern(x_start+self.spacing+self.width,y_start,'+y')
-            lines += self.gen.move(self.width,0)
-            lines += self.gen.move(0,-self.length)
-            #lines += self.interlocked_reference_pattern(x_start+self.spacing+self.width,y_start+self.effective_length(),'-y')
-        elif direction == 'x':
-            lines += self.interlocked_reference_pattern(x_start,y_start,'+x')
-            lines += self.gen.move(0,self.width)
-            lines += self.gen.move(-self.length,0)
-            lines += self.interlocked_reference_pattern(x_start,y_start+self.spacing+self.width,'+x')
-            lines += self.gen.move(0,self.width)
-            lines += self.gen.move(-self.length,0)
-            #lines += self.interlocked_reference_pattern(x_start+self.effective_length(),y_start+self.spacing+self.width,'-x')
-        else:
-            raise Exception("Unknown direction given to differential_pattern function")
-        return lines
+        return "".join(self.iter_differential_interlocked_reference_pattern(x_start,y_start,direction))
+
+    def iter_differential_interlocked_reference_pattern(self,x_start,y_start,direction,reverse=False):
+        """Same as :meth:`calibration_pattern.differential_interlocked_reference_pattern`, but yields the gcode piece by piece instead of returning it as a single string
+
+        :param reverse: Print the second half of the pattern first
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
+        halves = self.differential_halves('reference',x_start,y_start,direction)
+        if reverse:
+            halves.reverse()
+        for half in halves:
+            yield from self.iter_differential_half('reference',half)
 
     def differential_interlocked_signal_pattern(self,x_start,y_start,direction):
         """Generate the gcode to print one side (the signal side) of two interlocked patterns, one going up and one going down
@@ -374,99 +438,284 @@ class calibration_pattern:
         :return: The gcode to generate the pattern
         :rtype: string
         """
-        lines = ""
-        if direction == 'y':
-            lines += self.interlocked_signal_pattern(x_start,y_start,'+y')
-            lines += self.interlocked_signal_pattern(x_start+self.spacing+self.width,y_start+self.effective_length_interlocked()+self.interlocked_pitch,'-y')
-        elif direction == 'x':
-            lines += self.interlocked_signal_pattern(x_start,y_start,'+x')
-            lines += self.interlocked_signal_pattern(x_start+self.effective_length_interlocked()+self.interlocked_pitch,y_start+self.spacing+self.width ,'-x')
+        return "".join(self.iter_differential_interlocked_signal_pattern(x_start,y_start,direction))
+
+    def iter_differential_interlocked_signal_pattern(self,x_start,y_start,direction,reverse=False):
+        """Same as :meth:`calibration_pattern.differential_interlocked_signal_pattern`, but yields the gcode piece by piece instead of returning it as a single string
+
+        :param reverse: Print the second half of the pattern first
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
+        halves = self.differential_halves('signal',x_start,y_start,direction)
+        if reverse:
+            halves.reverse()
+        for half in halves:
+            yield from self.iter_differential_half('signal',half)
+
+    def differential_halves(self,pattern,x_start,y_start,direction):
+        """Get the two halves of a differential interlocked pattern. Both halves start with a move to their starting point, so they can be printed in any order.
+
+        :param pattern: Either 'reference' or 'signal'
+        :param x_start: The x location of the bottom left corner of the pattern
+        :param y_start: The y location of the bottom left corner of the pattern
+        :param direction: The direction the pattern should be printed in. Options are: 'y','x'
+        :return: List with for both halves a tuple with the x and y location of the half, its direction and the moves done after it
+        :rtype: list
+        """
+        if pattern == 'reference':
+            if direction == 'y':
+                return [(x_start,y_start,'+y',((self.width,0),(0,-self.length))),
+                        (x_start+self.spacing+self.width,y_start,'+y',((self.width,0),(0,-self.length)))]
+                        #(x_start+self.spacing+self.width,y_start+self.effective_length(),'-y')
+            elif direction == 'x':
+                return [(x_start,y_start,'+x',((0,self.width),(-self.length,0))),
+                        (x_start,y_start+self.spacing+self.width,'+x',((0,self.width),(-self.length,0)))]
+                        #(x_start+self.effective_length(),y_start+self.spacing+self.width,'-x')
+        elif pattern == 'signal':
+            if direction == 'y':
+                return [(x_start,y_start,'+y',()),
+                        (x_start+self.spacing+self.width,y_start+self.effective_length_interlocked()+self.interlocked_pitch,'-y',())]
+            elif direction == 'x':
+                return [(x_start,y_start,'+x',()),
+                        (x_start+self.effective_length_interlocked()+self.interlocked_pitch,y_start+self.spacing+self.width,'-x',())]
+        raise Exception("Unknown direction given to differential_pattern function")
+
+    def iter_differential_half(self,pattern,half):
+        """Generate the gcode of one half of a differential interlocked pattern piece by piece
+
+        :param pattern: Either 'reference' or 'signal'
+        :param half: One of the halves returned by :meth:`calibration_pattern.differential_halves`
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
+        x_start,y_start,direction,moves = half
+        if pattern == 'reference':
+            yield from self.iter_interlocked_reference_pattern(x_start,y_start,direction)
         else:
-            raise Exception("Unknown direction given to differential_pattern function")
-        return lines
+            yield from self.iter_interlocked_signal_pattern(x_start,y_start,direction)
+        for x,y in moves:
+            yield self.gen.move(x,y)
 
 
-    def meander_print(self,tool,save_file_name):
+    def meander_print(self,tool,save_file_name,binary=False):
         """Generate the gcode to print a simple meandering structure, that fir example can be used to better understand conduction in 3D printed conductors.
 
         :param tool: tool number of the tool that will be used for the print
         :param save_file_name: Name of the file the gcode will be written to
+        :param binary: Write the gcode as binary gcode (see :mod:`binary_gcode`) instead of as text
         :return: The gcode to generate the print
         :rtype: string
         """
-        tool_index_list = self.gen.find_tools([tool])
-        tool_index = tool_index_list[0]
-        lines = ""
-        lines += self.gen.starting_code(tool_index_list)
-        lines += self.gen.tool_change(tool_index)
-        lines += self.gen.move_to(self.gen.x_center-self.width/2,self.gen.y_center-self.length/2-10)
-        lines += self.gen.extrude(15)
-        lines += self.gen.retract()
-        lines += self.gen.move_to(self.gen.x_center-self.width/2,self.gen.y_center-self.length/2)
-        lines += self.gen.reretract()
-        lines += self.single_pattern(self.gen.x_center-self.width/2,self.gen.y_center-self.length/2,'+y')
-        lines += self.gen.retract()
-        lines += self.gen.stop_code() 
-
-        f = open(save_file_name,"w")
-        f.write(lines)
-        f.close()
+        lines = "".join(self.iter_meander_print(tool))
+
+        if binary:
+            binary_gcode.encode(lines,save_file_name)
+        else:
+            f = open(save_file_name,"w")
+            f.write(lines)
+            f.close()
 
         return lines
 
-    def full_interlocked_print(self,tool_list,reference_tool,save_file_name):
+    def write_meander_print(self,tool,output):
+        """Stream the gcode of :meth:`calibration_pattern.meander_print` into output while it is being generated, without keeping the whole print in memory
+
+        :param tool: tool number of the tool that will be used for the print
+        :param output: Object with a write method the gcode will be written to, for example a :class:`sink.file_sink`
+        """
+        for code in self.iter_meander_print(tool):
+            output.write(code)
+
+    def iter_meander_print(self,tool):
+        """Generate the gcode of :meth:`calibration_pattern.meander_print` piece by piece
+
+        :param tool: tool number of the tool that will be used for the print
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
+        job = self._print_job()
+        yield from job._iter_meander_job(tool)
+
+    def _iter_meander_job(self,tool):
+        tool_index_list = self.gen.find_tools([tool])
+        tool_index = tool_index_list[0]
+        yield self.gen.starting_code(tool_index_list)
+        yield self.gen.tool_change(tool_index)
+        yield self.gen.move_to(self.gen.x_center-self.width/2,self.gen.y_center-self.length/2-10)
+        yield self.gen.extrude(15)
+        yield self.gen.retract()
+        yield self.gen.move_to(self.gen.x_center-self.width/2,self.gen.y_center-self.length/2)
+        yield self.gen.reretract()
+        yield from self.iter_single_pattern(self.gen.x_center-self.width/2,self.gen.y_center-self.length/2,'+y')
+        yield self.gen.retract()
+        yield self.gen.stop_code() 
+        yield self.gen.flush()
+
+    def full_interlocked_print(self,tool_list,reference_tool,save_file_name,binary=False):
         """Generate the gcode to print a complete interlocked calibration pattern, that can be scanned and analysed to find the xy offsets.
 
         :param tool: List of tool number of the tools. Each tool will be used for 4 calibration patterns. One in both the positive and negative x and y directions.
         :param save_file_name: Name of the file the gcode will be written to
+        :param binary: Write the gcode as binary gcode (see :mod:`binary_gcode`) instead of as text
         :return: The gcode to generate the print
         :rtype: string
         """
+        lines = "".join(self.iter_full_interlocked_print(tool_list,reference_tool))
 
-        tool_list_indexes = self.gen.find_tools(tool_list)
-        lines = ""
-        lines += self.gen.starting_code(tool_list_indexes)
+        if binary:
+            binary_gcode.encode(lines,save_file_name)
+        else:
+            f = open(save_file_name,"w")
+            f.write(lines)
+            f.close()
+
+        return lines
+
+    def write_full_interlocked_print(self,tool_list,reference_tool,output):
+        """Stream the gcode of :meth:`calibration_pattern.full_interlocked_print` into output while it is being generated, without keeping the whole print in memory. For example:
+
+        .. code-block:: python
+
+            with file_sink("example.g") as output:
+                pattern.write_full_interlocked_print([1,2,3,4,5],2,output)
+
+        :param tool_list: List of tool number of the tools. Each tool will be used for 4 calibration patterns. One in both the positive and negative x and y directions.
+        :param reference_tool: Tool number of the tool used to print the reference patterns and the square, which should be in the tool list
+        :param output: Object with a write method the gcode will be written to, for example a :class:`sink.file_sink`
+        """
+        for code in self.iter_full_interlocked_print(tool_list,reference_tool):
+            output.write(code)
 
+    def iter_full_interlocked_print(self,tool_list,reference_tool):
+        """Generate the gcode of :meth:`calibration_pattern.full_interlocked_print` piece by piece, such that the first gcode is available right away. Use :func:`sink.chunks` to group the pieces into bigger chunks.
+
+        :param tool_list: List of tool number of the tools. Each tool will be used for 4 calibration patterns. One in both the positive and negative x and y directions.
+        :param reference_tool: Tool number of the tool used to print the reference patterns and the square, which should be in the tool list
+        :return: Iterator over the gcode
+        :rtype: iterator
+        """
+        job = self._print_job()
+        yield from job._iter_full_interlocked_job(tool_list,reference_tool)
+
+    def _iter_full_interlocked_job(self,tool_list,reference_tool):
+        tool_list_indexes = self.gen.find_tools(tool_list)
         reference_tool_index = self.gen.find_tools([reference_tool])
         reference_tool_index = reference_tool_index[0]
 
         self.n_tools = len(tool_list)
+        #the offsets are those of the position of a tool in the tool list, the reference tool uses the offsets of its first position
+        if reference_tool not in tool_list:
+            raise Exception("The reference tool %d should be in the tool list %s, the offsets of the tools are those of their position in the tool list" % (reference_tool,tool_list))
+        reference_offset_index = tool_list.index(reference_tool)
+        sections = [('start',self._iter_start_section,(tool_list_indexes,reference_tool_index)),
+                    ('square',self._iter_square_section,())]
+        if self.schedule_blocks:
+            blocks,self.schedule_report = schedule.plan(self,tool_list_indexes,reference_tool_index)
+            for kind,i1,direction,tool_index,reverse in blocks:
+                name = '%s %s %.0f' % (_direction_names[direction],kind,i1)
+                if kind == 'reference':
+                    sections.append((name,self._iter_reference_section,(i1,direction,reverse)))
+                else:
+                    sections.append((name,self._iter_signal_section,(i1,direction,tool_index,reverse)))
+        else:
+            for i1 in range(self.n_tools):
+                sections.append(('vertical reference %.0f' % (i1),self._iter_reference_section,(i1,"y")))
+            for i1 in range(self.n_tools):
+                sections.append(('horizontal reference %.0f' % (i1),self._iter_reference_section,(i1,"x")))
+            for i1 in range(self.n_tools):
+                sections.append(('vertical signal %.0f' % (i1),self._iter_signal_section,(i1,"y",tool_list_indexes[i1])))
+                sections.append(('horizontal signal %.0f' % (i1),self._iter_signal_section,(i1,"x",None)))
+        sections.append(('stop',self._iter_stop_section,()))
+
+        for name,section,arguments in sections:
+            #the signal patterns of tool i1 are printed with offsets i1, everything else with the offsets of the reference tool
+            self.gen._tool_offset_index = arguments[0] if section == self._iter_signal_section else reference_offset_index
+            yield from self._iter_section(name,section,arguments)
+
+    def _iter_start_section(self,tool_list_indexes,reference_tool_index):
+        yield self.gen.starting_code(tool_list_indexes)
+        yield self.gen.tool_change(reference_tool_index)
+
+    def _iter_square_section(self):
         square_width = self.total_width_interlocked()+2*self.spacing_to_square
         square_height = self.total_height_interlocked()+2*self.spacing_to_square
+        yield from self.iter_square_pattern(self.gen.x_center-square_width/2,self.gen.y_center-square_height/2,square_width,square_height,True,self.square_lines)
 
-        lines += self.gen.tool_change(reference_tool_index)
-        self._tool_offset_index = 0
-        lines += self.square_pattern(self.gen.x_center-square_width/2,self.gen.y_center-square_height/2,square_width,square_height,True,self.square_lines)
-        for i1 in range(self.n_tools):
-            lines += ";print vertical interlocked reference pattern %.0f\n" % (i1)
+    def pattern_start(self,i1,direction):
+        """Calculate the location of the differential patterns of a tool
+
+        :param i1: Index of the tool in the tool list
+        :param direction: Either 'y' for the vertical or 'x' for the horizontal pattern
+        :return: The x and y location of the bottom left corner of the pattern
+        :rtype: tuple
+        """
+        if direction == "y":
             x_start = self.gen.x_center-self.total_width()/2+2*i1*(self.width+self.spacing)
             y_start = self.gen.y_center-self.effective_length()/2
-            lines += self.differential_interlocked_reference_pattern(x_start,y_start,"y")
-        
-        for i1 in range(self.n_tools):
-            lines += ";print horizontal interlocked reference pattern %.0f\n" % (i1)
+        else:
             x_start = self.gen.x_center+self.total_width()/2-self.length
             y_start = self.gen.y_center-self.total_one_dir_width()/2+2*i1*(self.width+self.spacing)
-            lines += self.differential_interlocked_reference_pattern(x_start,y_start,"x")
+        return x_start,y_start
 
-        for i1 in range(self.n_tools):
-            lines += ";print vertical interlocked signal pattern %.0f\n" % (i1)
-            lines += self.gen.tool_change(tool_list_indexes[i1])
-            self._tool_offset_index = i1
-            x_start = self.gen.x_center-self.total_width()/2+2*i1*(self.width+self.spacing)
-            y_start = self.gen.y_center-self.effective_length()/2
-            lines += self.differential_interlocked_signal_pattern(x_start,y_start,"y")
+    def _iter_reference_section(self,i1,direction,reverse=False):
+        yield self.gen.comment("print %s interlocked reference pattern %.0f" % (_direction_names[direction],i1))
+        x_start,y_start = self.pattern_start(i1,direction)
+        yield from self.iter_differential_interlocked_reference_pattern(x_start,y_start,direction,reverse)
 
-            lines += ";print horizontal interlocked signal pattern %.0f\n" % (i1)
-            x_start = self.gen.x_center+self.total_width()/2-self.length
-            y_start = self.gen.y_center-self.total_one_dir_width()/2+2*i1*(self.width+self.spacing)
-            lines += self.differential_interlocked_signal_pattern(x_start,y_start,"x")
+    def _iter_signal_section(self,i1,direction,tool_index,reverse=False):
+        yield self.gen.comment("print %s interlocked signal pattern %.0f" % (_direction_names[direction],i1))
+        x_start,y_start = self.pattern_start(i1,direction)
+        if tool_index is not None:
+            yield self.gen.tool_change(tool_index)
+        yield from self.iter_differential_interlocked_signal_pattern(x_start,y_start,direction,reverse)
 
-            
-        lines += self.gen.stop_code()
-        
-        f = open(save_file_name,"w")
-        f.write(lines)
-        f.close()
+    def _iter_stop_section(self):
+        yield self.gen.stop_code()
 
-        return lines
\ No newline at end of file
+    def _section_inputs(self,offsets=True):
+        """Collect all parameters that influence the gcode of a section. Only the offsets of the tool that is actually used (:attr:`generator._tool_offset_index`) are included, such that changing the offsets of other tools does not invalidate a section. Sections without moves, like the start and the stop section, do not depend on the offsets at all.
+        """
+        gen = self.gen
+        printer = gen.config.replace(x_offsets=(),y_offsets=())
+        if not offsets:
+            return (type(gen),self.config,printer,self.n_tools)
+        return (type(gen),self.config,printer,self.n_tools,
+                gen._tool_offset_index,gen.x_offsets[gen._tool_offset_index],gen.y_offsets[gen._tool_offset_index])
+
+    def _iter_section(self,name,section,arguments):
+        """Yield the gcode of a section of a print. When :attr:`calibration_pattern.cache_sections` is enabled, the gcode of the section is reused if none of its inputs changed since it was last generated by any job of the pattern. Otherwise it is generated and its name is added to :attr:`calibration_pattern.regenerated_sections` of the job.
+        """
+        if not self.cache_sections:
+            self.regenerated_sections.append(name)
+            yield from section(*arguments)
+            yield self.gen.flush()
+            return
+
+        moves = section not in (self._iter_start_section,self._iter_stop_section)
+        key = (arguments,getattr(self.gen,'current_tool_index',None),self._section_inputs(moves))
+        cached = self._sections.get(name)
+        if cached is not None and cached[0] == key:
+            key,code,self.gen.current_tool_index,position = cached
+            if position is not None:
+                self.gen.curr_x,self.gen.curr_y = position
+            yield code
+            return
+
+        self.regenerated_sections.append(name)
+        codes = []
+        for code in section(*arguments):
+            codes.append(code)
+            yield code
+        codes.append(self.gen.flush())
+        yield codes[-1]
+        position = None
+        if hasattr(self.gen,'curr_x'):
+            position = (self.gen.curr_x,self.gen.curr_y)
+        with self._lock:
+            self._sections[name] = (key,"".join(codes),self.gen.current_tool_index,position)
+
+
+for _name in pattern_config.__slots__:
+    setattr(calibration_pattern,_name,config_property(_name,"%s of :attr:`calibration_pattern.config`, see :class:`config.pattern_config`" % (_name)))
+del _name
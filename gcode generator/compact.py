@@ -0,0 +1,343 @@
+"""
+.. module:: compact
+    :synopsis: Optimizer that makes gcode smaller without changing the printed motion
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+"""
+import argparse
+import itertools
+
+from sink import sink
+
+_motion_commands = ('G0','G1','G2','G3')
+
+
+def trim_number(value):
+    """Remove trailing zeros from a number in gcode, for example 0.350 becomes 0.35 and 5.0000 becomes 5
+
+    :param value: The number as string
+    :return: The trimmed number as string
+    :rtype: string
+    """
+    if '.' in value:
+        value = value.rstrip('0').rstrip('.')
+        if value in ('','-','-0'):
+            value = '0'
+    return value
+
+
+def _parse(line):
+    """Split a line of gcode in its command and its words. Returns None for lines that are not simple motion commands.
+    """
+    tokens = line.split()
+    if not tokens or tokens[0] not in _motion_commands:
+        return None
+    words = []
+    for token in tokens[1:]:
+        letter = token[0]
+        if not letter.isalpha() or len(token) < 2:
+            return None
+        try:
+            float(token[1:])
+        except ValueError:
+            return None
+        words.append((letter,trim_number(token[1:])))
+    return tokens[0],words
+
+
+class compactor:
+    """Optimizer that makes gcode smaller, without changing the motion of the printer. Gcode is processed line by line and:
+
+    * words that set a modal value to the value it already has are dropped, like an F word that repeats the current feedrate or an X word that repeats the current x position
+    * travel moves that do not change the position (zero length or duplicate moves) are removed. Their feedrate is passed on to the next move.
+    * trailing zeros of numbers are removed
+    * optionally comments are removed
+
+    Arcs (G2 and G3) only lose their unchanged feedrate. Every other command (tool changes, homing, temperatures etc.) is kept as is, and because such a command can run a macro on the printer, the position and feedrate are considered unknown after it. Before such a command the feedrate is brought in the same state as in the original gcode. Use :func:`compact.verify` to check that compacted gcode results in the same motion as the original.
+    """
+
+    strip_comments = False
+    """Remove comments from the gcode. Note that the comments are used to find the sections of a print, for example by :mod:`simulator`."""
+
+    def __init__(self,strip_comments=None):
+        if strip_comments is not None:
+            self.strip_comments = strip_comments
+        self._position = {'X':None,'Y':None,'Z':None}
+        self._feed = None
+        self._emitted_feed = None
+        self._absolute = True
+        self._relative_extrusion = False
+        self._partial = ""
+        self.bytes_in = 0
+        """Number of characters of gcode given to the compactor"""
+        self.bytes_out = 0
+        """Number of characters of gcode returned by the compactor"""
+        self.lines_in = 0
+        """Number of lines given to the compactor"""
+        self.lines_out = 0
+        """Number of lines returned by the compactor"""
+
+    def compact(self,code):
+        """Compact a piece of gcode. The gcode does not have to consist of whole lines; an incomplete last line is kept until the rest of it is given, or until :meth:`compactor.finish` is called.
+
+        :param code: The gcode to compact
+        :return: The compacted gcode
+        :rtype: string
+        """
+        self.bytes_in += len(code)
+        lines = (self._partial+code).split('\n')
+        self._partial = lines.pop()
+        out = []
+        for line in lines:
+            self._compact_line(line,out)
+        out = "".join(out)
+        self.bytes_out += len(out)
+        return out
+
+    def finish(self):
+        """Compact the incomplete last line, if any
+
+        :return: The compacted gcode
+        :rtype: string
+        """
+        out = []
+        if self._partial:
+            self._compact_line(self._partial,out)
+            self._partial = ""
+        out = "".join(out)
+        self.bytes_out += len(out)
+        return out
+
+    def _compact_line(self,line,out):
+        self.lines_in += 1
+        stripped = line.strip()
+        if stripped.startswith(';') or not stripped:
+            if not self.strip_comments:
+                out.append(line+'\n')
+                self.lines_out += 1
+            return
+
+        parsed = _parse(stripped)
+        if parsed is None:
+            self._other_command(line,stripped,out)
+            return
+        command,words = parsed
+        if not self._absolute:
+            #relative moves are only trimmed
+            for letter,value in words:
+                if letter == 'F':
+                    self._feed = value
+            self._emit(command,[word for word in words if word[0] != 'F'],out)
+            return
+
+        kept = []
+        moves = False
+        for letter,value in words:
+            if letter == 'F':
+                self._feed = value
+            elif letter in self._position:
+                if command in ('G0','G1') and self._position[letter] == value:
+                    continue
+                self._position[letter] = value
+                kept.append((letter,value))
+                moves = True
+            elif letter == 'E':
+                if self._relative_extrusion and float(value) == 0:
+                    continue
+                kept.append((letter,value))
+                moves = True
+            else:
+                kept.append((letter,value))
+                moves = True
+        if command in ('G2','G3'):
+            #positions of arcs are kept, an arc without end point is a full circle
+            kept = [word for word in words if word[0] != 'F']
+        elif not moves:
+            #zero length travel, only its feedrate is remembered
+            return
+        self._emit(command,kept,out)
+
+    def _emit(self,command,words,out):
+        if self._feed is not None and self._feed != self._emitted_feed:
+            words = words+[('F',self._feed)]
+            self._emitted_feed = self._feed
+        out.append(" ".join([command]+[letter+value for letter,value in words])+'\n')
+        self.lines_out += 1
+
+    def _other_command(self,line,stripped,out):
+        if self._feed is not None and self._feed != self._emitted_feed:
+            out.append("G1 F%s\n" % (self._feed))
+            self.lines_out += 1
+        out.append(line+'\n')
+        self.lines_out += 1
+        command = stripped.split()[0]
+        if command == 'M83':
+            self._relative_extrusion = True
+        elif command == 'M82':
+            self._relative_extrusion = False
+        elif command == 'G90':
+            self._absolute = True
+        elif command == 'G91':
+            self._absolute = False
+        self._position = {'X':None,'Y':None,'Z':None}
+        self._feed = None
+        self._emitted_feed = None
+
+    def report(self):
+        """Get the size reduction achieved so far
+
+        :return: The number of characters and lines before and after compaction, and the reduction as fraction of the original size
+        :rtype: dict
+        """
+        reduction = 0
+        if self.bytes_in:
+            reduction = 1-self.bytes_out/self.bytes_in
+        return {'bytes_in':self.bytes_in,
+                'bytes_out':self.bytes_out,
+                'lines_in':self.lines_in,
+                'lines_out':self.lines_out,
+                'reduction':reduction}
+
+
+class compact_sink(sink):
+    """Sink that compacts the gcode (see :class:`compact.compactor`) before writing it to another output. For example to write a compacted print to a file:
+
+    .. code-block:: python
+
+        with compact_sink(file_sink("example.g")) as output:
+            pattern.write_full_interlocked_print([1,2,3,4,5],2,output)
+        print(output.compactor.report())
+
+    :param output: Object with a write method the compacted gcode is written to, for example another sink. When it has a close method, it is closed together with this sink.
+    :param strip_comments: Remove comments from the gcode
+    """
+
+    def __init__(self,output,buffer_size=None,strip_comments=None):
+        super().__init__(buffer_size)
+        self.output = output
+        self.compactor = compactor(strip_comments)
+
+    def write_chunk(self,chunk):
+        self.output.write(self.compactor.compact(chunk))
+
+    def close(self):
+        self.flush()
+        self.output.write(self.compactor.finish())
+        if hasattr(self.output,'close'):
+            self.output.close()
+
+
+def iter_compact(codes,strip_comments=None):
+    """Compact gcode that is generated piece by piece, for example by :meth:`calibration_pattern.iter_full_interlocked_print`
+
+    :param codes: Iterable with pieces of gcode
+    :param strip_comments: Remove comments from the gcode
+    :return: Iterator over the compacted gcode
+    :rtype: iterator
+    """
+    optimizer = compactor(strip_comments)
+    for code in codes:
+        yield optimizer.compact(code)
+    yield optimizer.finish()
+
+
+def compact(code,strip_comments=None):
+    """Compact a complete gcode program
+
+    :param code: The gcode
+    :param strip_comments: Remove comments from the gcode
+    :return: The compacted gcode
+    :rtype: string
+    """
+    return "".join(iter_compact([code],strip_comments))
+
+
+def motion(code):
+    """Interpret gcode as the sequence of things the printer actually does. Every move results in a tuple with the command, the position it moves to, the extruded amount, the feedrate and for arcs the center, with all modal values filled in. Moves that do not move and do not extrude are left out. Every other command results in a tuple with the command and the feedrate at the moment it is executed. Comments are ignored.
+
+    :param code: The gcode, either as a string or as an iterable of lines
+    :return: Iterator over the actions of the printer
+    :rtype: iterator
+    """
+    if isinstance(code,str):
+        code = code.split('\n')
+    position = {'X':None,'Y':None,'Z':None}
+    feed = None
+    absolute = True
+    relative_extrusion = False
+    for line in code:
+        stripped = line.strip()
+        if stripped.startswith(';') or not stripped:
+            continue
+        parsed = _parse(stripped)
+        if parsed is None:
+            yield ('command'," ".join(stripped.split()),feed)
+            command = stripped.split()[0]
+            if command == 'M83':
+                relative_extrusion = True
+            elif command == 'M82':
+                relative_extrusion = False
+            elif command == 'G90':
+                absolute = True
+            elif command == 'G91':
+                absolute = False
+            position = {'X':None,'Y':None,'Z':None}
+            feed = None
+            continue
+        command,words = parsed
+        values = {letter:float(value) for letter,value in words}
+        if 'F' in values:
+            feed = values.pop('F')
+        if not absolute:
+            yield (command,tuple(sorted(values.items())),feed)
+            continue
+        target = dict(position)
+        for axis in target:
+            if axis in values:
+                target[axis] = values[axis]
+        extrusion = values.get('E')
+        extrudes = extrusion is not None and not (relative_extrusion and extrusion == 0)
+        if command in ('G0','G1') and target == position and not extrudes and set(values) <= {'X','Y','Z','E'}:
+            continue
+        if not extrudes and relative_extrusion:
+            extrusion = None
+        position = target
+        yield (command,position['X'],position['Y'],position['Z'],extrusion,feed,values.get('I'),values.get('J'))
+
+
+def verify(original,compacted):
+    """Check that two gcode programs, for example a program and its compacted version, result in exactly the same actions of the printer (see :func:`compact.motion`)
+
+    :param original: The original gcode
+    :param compacted: The compacted gcode
+    :return: The number of actions that were compared
+    :rtype: int
+    """
+    n_actions = 0
+    for action,compacted_action in itertools.zip_longest(motion(original),motion(compacted)):
+        if action != compacted_action:
+            raise Exception("Gcode results in different motion at action %.0f: %s instead of %s" % (n_actions,compacted_action,action))
+        n_actions += 1
+    return n_actions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact a gcode file without changing the printed motion")
+    parser.add_argument("input",help="gcode file to compact")
+    parser.add_argument("output",help="file the compacted gcode is written to")
+    parser.add_argument("--strip-comments",action="store_true",help="also remove comments")
+    args = parser.parse_args()
+
+    with open(args.input) as f:
+        original = f.read()
+    optimizer = compactor(args.strip_comments)
+    compacted = optimizer.compact(original)+optimizer.finish()
+    n_actions = verify(original,compacted)
+    with open(args.output,"w") as f:
+        f.write(compacted)
+    report = optimizer.report()
+    print("%.0f bytes -> %.0f bytes (%.1f%% smaller), %.0f lines -> %.0f lines" % (report['bytes_in'],report['bytes_out'],100*report['reduction'],report['lines_in'],report['lines_out']))
+    print("verified that all %.0f actions of the printer are identical" % (n_actions))
+
+
+if __name__ == '__main__':
+    main()
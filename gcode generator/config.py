@@ -0,0 +1,158 @@
+"""
+.. module:: config
+    :synopsis: Immutable configurations of the printer and of the calibration pattern
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+"""
+import math
+
+class frozen_config:
+    """Base class of the immutable configurations. The values are stored in __slots__ and can not be changed once the configuration is made, so a configuration can safely be shared between threads. Use :meth:`frozen_config.replace` to make a copy with some values changed. Lists are stored as tuples.
+
+    Every subclass defines its parameters and their default values in _defaults.
+    """
+    __slots__ = ()
+    _defaults = {}
+
+    def __init__(self,**values):
+        for name in self.__slots__:
+            value = values.pop(name,self._defaults[name])
+            if isinstance(value,list):
+                value = tuple(value)
+            object.__setattr__(self,name,value)
+        if values:
+            raise Exception("Unknown parameter given to %s: %s" % (type(self).__name__,", ".join(values)))
+
+    def __setattr__(self,name,value):
+        raise AttributeError("%s is immutable, use replace to change %s" % (type(self).__name__,name))
+
+    def __delattr__(self,name):
+        raise AttributeError("%s is immutable" % (type(self).__name__))
+
+    def replace(self,**changes):
+        """Make a copy of the configuration with some values changed
+
+        :param changes: The parameters to change and their new values
+        :return: The new configuration
+        :rtype: frozen_config
+        """
+        values = self.values()
+        values.update(changes)
+        return type(self)(**values)
+
+    def values(self):
+        """Get all parameters of the configuration
+
+        :return: Dictionary with the value of every parameter
+        :rtype: dict
+        """
+        return {name:getattr(self,name) for name in self.__slots__}
+
+    def __eq__(self,other):
+        return type(self) is type(other) and all(getattr(self,name) == getattr(other,name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash((type(self),)+tuple(getattr(self,name) for name in self.__slots__))
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__,", ".join("%s=%r" % (name,getattr(self,name)) for name in self.__slots__))
+
+    def __reduce__(self):
+        return (_make,(type(self),self.values()))
+
+
+def _make(cls,values):
+    return cls(**values)
+
+
+class printer_config(frozen_config):
+    """Printer specific parameters used by the :class:`generator.generator` class. By default the parameters of a Diabase H-series 3D printer are used. All lists with one value per tool should be of the same size as tools.
+
+    :param tools: List containing the tool numbers of the tools of the 3D printer
+    :param nozzle_diameters: Diameter of the nozzle of the tools in the tools list in millimeter
+    :param standby_temperatures: Standby temperature used for the tools in the tools list in degrees Celsius
+    :param printing_temperatures: Printing temperature used for the tools in the tools list in degrees Celsius
+    :param extrusion_multiplier: Extrusion multiplier used for the tools in the tools list
+    :param retraction_distance: Retraction distance used for the tools in the tools list
+    :param retraction_speed: Retraction speed in mm/s used by all tools
+    :param z_offset: Additional offset in the z direction given to all z moves in millimeter. Allows compensating for printers improperly calibrated in the z direction
+    :param insert_pause: Insert a pause between probing the bed and actually printing, during which a piece of paper can be placed on the bed.
+    :param x_offsets: List with additional offsets in the x direction (mm) given to all x moves of the tools in the tools list. In a full interlocked print the signal patterns of the i-th tool of the tool list get the i-th offset, and the square and the reference patterns get the offset of the reference tool.
+    :param y_offsets: List with additional offsets in the y direction (mm) given to all y moves of the tools in the tools list, used like x_offsets
+    :param x_center: Location where the center of the printed structure will be (in mm)
+    :param y_center: Location where the center of the printed structure will be (in mm)
+    :param rotation: Rotation of the structure in radians
+    :param bed_temp: Temperature in degrees celsius to which the bed will be heated
+    :param layer_height: Used layer height in millimeter
+    :param print_speed: Used printing speed in mm/s
+    :param enable_retraction: Wether or not retraction should be enabled
+    :param z_hop: Wether or not a z-hop should be performed during a retraction
+    :param filament_diameter: Diameter of the used filament in millimeter
+    """
+    _defaults = {
+        #printer specific parameters
+        #diabase
+        'tools':(1,2,3,4,5),
+        'nozzle_diameters':(0.4,0.4,0.4,0.4,0.4),
+        'standby_temperatures':(175,175,175,175,175),
+        'printing_temperatures':(200,200,200,200,200),
+        'extrusion_multiplier':(1.1,1.1,1.1,1.1,1.1),
+        'retraction_distance':(5,5,5,5,5),
+        'retraction_speed':80,
+        'z_offset':0.15,
+        'insert_pause':True,
+        'x_offsets':(0,0,0,0,0),
+        'y_offsets':(0,0,0,0,0),
+        'x_center':0,
+        'y_center':0,
+        'rotation':math.pi/180*15,
+        #filament parameters
+        'bed_temp':60,
+        'layer_height':0.2,
+        'print_speed':30,
+        'enable_retraction':True,
+        'z_hop':0.5,
+        'filament_diameter':1.75,
+    }
+    __slots__ = tuple(_defaults)
+
+
+class pattern_config(frozen_config):
+    """Parameters of the calibration patterns used by the :class:`calibration_pattern.calibration_pattern` class
+
+    :param width: Length of lines in the test pattern
+    :param pitch: Milimeter spacing between the lines of the test pattern
+    :param sigref_only: Space where this only a sig or a ref pattern
+    :param length: Total length of all the meanders
+    :param square_lines: Number of lines of the square around the structure
+    :param spacing: Spacing between two patterns of different nozzles
+    :param spacing_to_square: Spacing between the patterns and the square
+    :param interlocked_period: How many milliemeters it takes before the structure repeats itself
+    :param interlocked_pitch: The pitch of the lines in the center of the structure in millimeters
+    """
+    _defaults = {
+        'width':8,
+        'pitch':1,
+        'sigref_only':2,
+        'length':70,
+        'square_lines':3,
+        'spacing':3,
+        'spacing_to_square':5,
+        'interlocked_period':4,
+        'interlocked_pitch':0.75,
+    }
+    __slots__ = tuple(_defaults)
+
+
+def config_property(name,doc=None):
+    """Make a property that reads a parameter from the config attribute of an object. Assigning the property replaces the config by a copy in which the parameter is changed, such that the old config is never modified.
+
+    :param name: Name of the parameter
+    :param doc: Documentation of the property
+    :return: The property
+    :rtype: property
+    """
+    def getter(self):
+        return getattr(self.config,name)
+    def setter(self,value):
+        self.config = self.config.replace(**{name:value})
+    return property(getter,setter,doc=doc)
@@ -5,77 +5,31 @@
 """
 import math
 
+from config import printer_config,config_property
+
 class generator:
-    """This class can be used to make simple gcode patterns
+    """This class can be used to make simple gcode patterns. The printer specific parameters are stored in an immutable :class:`config.printer_config`, while the position and the selected tool are stored in the generator itself. Use :meth:`generator.job` to get a generator with its own position and tool state for every print that is generated at the same time.
     """
     
-    #printer specific parameters
-    #diabase
-    tools = [1,2,3,4,5] 
-    """List containing the tool numbers of the tools of the 3D printer"""
-    
-    nozzle_diameters = [0.4,0.4,0.4,0.4,0.4] #mm diameter of the hole in the used nozzle. One for each tool
-    """Diameter of the nozzle of the tools in the tools list in millimeter. Should be of the same size as tools."""
-
-    standby_temperatures = [175,175,175,175,175]
-    """Standby temperature used for the tools in the tools list in degrees Celsius. Should be of the same size as tools."""
-
-    printing_temperatures = [200,200,200,200,200]
-    """Printing temperature used for the tools in the tools list in degrees Celsius. Should be of the same size as tools."""
-    
-    extrusion_multiplier = [1.1, 1.1, 1.1, 1.1, 1.1]
-    """Extrusion multiplier used for the tools in the tools list. Should be of the same size as tools."""
-
-    retraction_distance = [5,5,5,5,5]
-    """Retraction distance used for the tools in the tools list. Should be of the same size as tools."""
-
-    retraction_speed = 80
-    """Retraction speed in mm/s used by all tools"""
-
-    z_offset = 0.15
-    """Additional offset in the z direction given to all z moves in millimeter. Allows compensating for printers improperly calibrated in the z direction"""
-    
-    insert_pause = True
-    """Insert a pause between probing the bed and actually printing, during which a piece of paper can be placed on the bed."""
-    
-    x_offsets = [0,0,0,0,0]
-    """List with additional offsets in the x direction (mm) given to all x moves of the tools in the tools list. Should be of the same size as tools."""
-
-    y_offsets = [0,0,0,0,0]
-    """List with additional offsets in the y direction (mm) given to all y moves of the tools in the tools list. Should be of the same size as tools."""
-
-    x_center = 0
-    """Location where the center of the printed structure will be (in mm)"""
-
-    y_center = 0
-    """Location where the center of the printed structure will be (in mm)"""
-
-    rotation = math.pi/180*15
-    """Rotation of the structure in radians"""
-
-    #filament parameters
-    bed_temp = 60
-    """Temperature in degrees celsius to which the bed will be heated"""
+    #don't touch
+    _current_tool_index = -1
+    _tool_offset_index = -1
 
-    layer_height = 0.2 #mm
-    """Used layer height in millimeter"""
+    def __init__(self,config=None):
+        """
+        :param config: The printer specific parameters, when not given the defaults of :class:`config.printer_config` are used
+        """
+        self.config = printer_config() if config is None else config
+        """Immutable :class:`config.printer_config` with the printer specific parameters. Every parameter of the config can also be read and assigned as an attribute of the generator, for example gen.x_offsets = [0,0.1]. Assigning replaces the config by a changed copy, so a config that is shared with another generator is never modified."""
 
-    print_speed = 30 #mm/s
-    """Used printing speed in mm/s"""
+    def job(self):
+        """Create a generator for a single print job. The job shares the (immutable) config of this generator, but keeps its own position and tool state, so multiple jobs can generate gcode at the same time, for example in different threads.
 
-    enable_retraction = True
-    """Wether or not retraction should be enabled"""
+        :return: A new generator of the same class with the same config
+        :rtype: generator
+        """
+        return type(self)(self.config)
 
-    z_hop = 0.5
-    """Wether or not a z-hop should be performed during a retraction"""
-    
-    filament_diameter = 1.75
-    """Diameter of the used filament in millimeter"""
-    
-    #don't touch
-    _current_tool_index = -1
-    _tool_offset_index = -1
-    
     def extrusion_volume_to_length(self,volume):
         """Convert a desired volume to be extruded out of the nozzle, to the length of filament that needs to be extruded
 
@@ -83,7 +37,8 @@ class generator:
         :return: The length of filament that needs to be extruded
         :rtype: float
         """
-        return volume / (self.filament_diameter * self.filament_diameter * 3.14159 * 0.25)
+        config = self.config
+        return volume / (config.filament_diameter * config.filament_diameter * 3.14159 * 0.25)
 
     def extrusion_for_length(self,length):
         """Convert a desired line length, to the extrusion volume needed
@@ -92,8 +47,9 @@ class generator:
         :return: The extrusion volume needed
         :rtype: float
         """
+        config = self.config
 
-        return self.extrusion_volume_to_length(length * self.nozzle_diameters[self.current_tool_index] * self.layer_height * self.extrusion_multiplier[self.current_tool_index])
+        return self.extrusion_volume_to_length(length * config.nozzle_diameters[self.current_tool_index] * config.layer_height * config.extrusion_multiplier[self.current_tool_index])
 
     def rotate(self,x_cor,y_cor):
         """Rotate a coordinate around the center of the print
@@ -103,12 +59,13 @@ class generator:
         :return: The rotated coordinate
         :rtype: list
         """ 
-        x_rel = x_cor-self.x_center
-        y_rel = y_cor-self.y_center
-        x_new = math.cos(self.rotation)*x_rel-math.sin(self.rotation)*y_rel
-        y_new = math.sin(self.rotation)*x_rel+math.cos(self.rotation)*y_rel
-        x_new = x_new+self.x_center
-        y_new = y_new+self.y_center
+        config = self.config
+        x_rel = x_cor-config.x_center
+        y_rel = y_cor-config.y_center
+        x_new = math.cos(config.rotation)*x_rel-math.sin(config.rotation)*y_rel
+        y_new = math.sin(config.rotation)*x_rel+math.cos(config.rotation)*y_rel
+        x_new = x_new+config.x_center
+        y_new = y_new+config.y_center
         return x_new,y_new
 
     def rotate_around_origin(self,x_cor,y_cor):
@@ -119,8 +76,9 @@ class generator:
         :return: The rotated coordinate
         :rtype: list
         """ 
-        x_new = math.cos(self.rotation)*x_cor-math.sin(self.rotation)*y_cor
-        y_new = math.sin(self.rotation)*x_cor+math.cos(self.rotation)*y_cor
+        config = self.config
+        x_new = math.cos(config.rotation)*x_cor-math.sin(config.rotation)*y_cor
+        y_new = math.sin(config.rotation)*x_cor+math.cos(config.rotation)*y_cor
         return x_new,y_new
         
 
@@ -132,13 +90,14 @@ class generator:
         :return: The gcode to generate the line
         :rtype: string
         """ 
+        config = self.config
         length = math.sqrt(x**2 + y**2)
         self.curr_x += x
         self.curr_y += y
-        x_pos = self.curr_x+self.x_offsets[self._tool_offset_index]
-        y_pos = self.curr_y+self.y_offsets[self._tool_offset_index]
+        x_pos = self.curr_x+config.x_offsets[self._tool_offset_index]
+        y_pos = self.curr_y+config.y_offsets[self._tool_offset_index]
         x_rot,y_rot = self.rotate(x_pos,y_pos)
-        return "G1 X%.3f Y%.3f E%.4f F%.0f\n" % (x_rot, y_rot, self.extrusion_for_length(length), self.print_speed * 60)
+        return "G1 X%.3f Y%.3f E%.4f F%.0f\n" % (x_rot, y_rot, self.extrusion_for_length(length), config.print_speed * 60)
     
     def move_to(self,x,y):
         """Generate the gcode for a move from the current position to a specific coordinate
@@ -148,12 +107,13 @@ class generator:
         :return: The gcode to generate the move
         :rtype: string
         """
+        config = self.config
         self.curr_x = x
         self.curr_y = y
-        x_pos = x+self.x_offsets[self._tool_offset_index]
-        y_pos = y+self.y_offsets[self._tool_offset_index]
+        x_pos = x+config.x_offsets[self._tool_offset_index]
+        y_pos = y+config.y_offsets[self._tool_offset_index]
         x_rot,y_rot = self.rotate(x_pos,y_pos)
-        return "G1 X%.3f Y%.3f F%0.0f\n" % (x_rot,y_rot,self.print_speed*60)
+        return "G1 X%.3f Y%.3f F%0.0f\n" % (x_rot,y_rot,config.print_speed*60)
          
     
     def extrude(self,amount):
@@ -173,10 +133,11 @@ class generator:
         :return: The gcode to generate the move
         :rtype: string
         """ 
+        config = self.config
         self.curr_x += x
         self.curr_y += y
-        x_pos = self.curr_x+self.x_offsets[self._tool_offset_index]
-        y_pos = self.curr_y+self.y_offsets[self._tool_offset_index]
+        x_pos = self.curr_x+config.x_offsets[self._tool_offset_index]
+        y_pos = self.curr_y+config.y_offsets[self._tool_offset_index]
         x_rot,y_rot = self.rotate(x_pos,y_pos)
         return "G1 X%.3f Y%.3f\n" % (x_rot,y_rot)
 
@@ -190,25 +151,26 @@ class generator:
         :return: The gcode to generate the quarter_turn
         :rtype: string
         """         
+        config = self.config
         distance = math.sqrt(x**2 + y**2)
         angle = math.atan2(y,x)
         center_dist = distance/math.sqrt(2)
         length = 3.14159*distance/4
         self.curr_x += x
         self.curr_y += y
-        curr_x_comp = self.curr_x+self.x_offsets[self._tool_offset_index]
-        curr_y_comp = self.curr_y+self.y_offsets[self._tool_offset_index]
+        curr_x_comp = self.curr_x+config.x_offsets[self._tool_offset_index]
+        curr_y_comp = self.curr_y+config.y_offsets[self._tool_offset_index]
         curr_x_rot,curr_y_rot = self.rotate(curr_x_comp,curr_y_comp)
         if clockwise:
             x_center2 = math.cos(angle-math.pi/4)*center_dist
             y_center2 = math.sin(angle-math.pi/4)*center_dist
             x_center_rot, y_center_rot = self.rotate_around_origin(x_center2,y_center2)
-            return "G2 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_center_rot, y_center_rot, self.extrusion_for_length(length), self.print_speed * 60)
+            return "G2 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_center_rot, y_center_rot, self.extrusion_for_length(length), config.print_speed * 60)
         else:
             x_center2 = math.cos(angle+math.pi/4)*center_dist
             y_center2 = math.sin(angle+math.pi/4)*center_dist
             x_center_rot, y_center_rot = self.rotate_around_origin(x_center2,y_center2)
-            return "G3 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_center_rot, y_center_rot, self.extrusion_for_length(length), self.print_speed * 60)
+            return "G3 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_center_rot, y_center_rot, self.extrusion_for_length(length), config.print_speed * 60)
 
     def u_turn(self,x,y,clockwise):
         """Generate the gcode for a u turn from the currrent position to a new position at a specified distance in x and y
@@ -219,22 +181,23 @@ class generator:
         :return: The gcode to generate the u turn
         :rtype: string
         """    
+        config = self.config
         x_halfway = x/2
         y_halfway = y/2
         self.curr_x += x
         self.curr_y += y
         distance = math.sqrt(x**2 + y**2)
         length = 3.14159*distance/2
-        curr_x_comp = self.curr_x+self.x_offsets[self._tool_offset_index]
-        curr_y_comp = self.curr_y+self.y_offsets[self._tool_offset_index]
+        curr_x_comp = self.curr_x+config.x_offsets[self._tool_offset_index]
+        curr_y_comp = self.curr_y+config.y_offsets[self._tool_offset_index]
         curr_x_rot, curr_y_rot = self.rotate(curr_x_comp,curr_y_comp)
         x_half_rot, y_half_rot = self.rotate(curr_x_comp-x_halfway, curr_y_comp-y_halfway)
         x_half_rot2 = curr_x_rot - x_half_rot
         y_half_rot2 = curr_y_rot - y_half_rot
         if clockwise:
-            return "G2 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_half_rot2, y_half_rot2, self.extrusion_for_length(length), self.print_speed * 60)
+            return "G2 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_half_rot2, y_half_rot2, self.extrusion_for_length(length), config.print_speed * 60)
         else:
-            return "G3 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_half_rot2, y_half_rot2, self.extrusion_for_length(length), self.print_speed * 60)
+            return "G3 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n" % (curr_x_rot, curr_y_rot, x_half_rot2, y_half_rot2, self.extrusion_for_length(length), config.print_speed * 60)
 
     def square(self,x,y,clockwise):
         """Generate the gcode for square with a specific size and the bottom left corner at the current position
@@ -258,6 +221,23 @@ class generator:
             lines += self.line(-x,0)
         return lines
 
+    def repeat(self,template,repetitions):
+        """Generate the gcode for a sequence of relative moves that is repeated a number of times, for example a single period of a repetitive pattern
+
+        The primitives of the template are only looked up once, but this generator still formats every move of every repetition, because the gcode is in absolute coordinates that are rounded per move. The time therefore grows with the number of repetitions. Only the :class:`toolpath.toolpath` engine copies the template in bulk, such that the time of the repetitions hardly grows.
+
+        :param template: Sequence of moves. Each move is a tuple with the name of the primitive (line, move, u_turn or quarter_turn) followed by its arguments, for example ('u_turn',0,0.75,True)
+        :param repetitions: Number of times the template is repeated
+        :return: The gcode to generate the repeated moves
+        :rtype: string
+        """
+        moves = [(getattr(self,move[0]),move[1:]) for move in template]
+        lines = []
+        for i1 in range(repetitions):
+            for primitive,arguments in moves:
+                lines.append(primitive(*arguments))
+        return "".join(lines)
+
     def retract(self):
         """Generate the gcode for a retraction in case retraction is enabled
 
@@ -280,6 +260,23 @@ class generator:
         else:
             return ""
     
+    def comment(self,text):
+        """Generate a gcode comment
+
+        :param text: The text of the comment
+        :return: The gcode comment
+        :rtype: string
+        """
+        return ";%s\n" % (text)
+
+    def flush(self):
+        """Get gcode that was generated, but not returned yet. The generator class returns all gcode directly, so this is always empty, but subclasses that buffer the gcode, like :class:`toolpath.toolpath`, use this to return what they buffered.
+
+        :return: The buffered gcode
+        :rtype: string
+        """
+        return ""
+
     def starting_code(self,tool_list_indexes):
         """Generate the gcode to start a print. This includes things as homing, heating up the bed and heating up tools
 
@@ -344,4 +341,9 @@ class generator:
             if found_tool == False:
                 raise Exception("unknown tool in tool list")
         return tool_list_indexes
-    
\ No newline at end of file
+    
+
+
+for _name in printer_config.__slots__:
+    setattr(generator,_name,config_property(_name,"%s of :attr:`generator.config`, see :class:`config.printer_config`" % (_name)))
+del _name
@@ -0,0 +1,271 @@
+"""
+.. module:: instrument
+    :synopsis: Count and time the calls of the primitives, patterns and sections while generating gcode
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+While an :class:`instrument` is enabled, the methods of the generator, calibration pattern and sink classes (and of their subclasses, like :class:`toolpath.toolpath`) are replaced by versions that count the calls, the time spent in them and the number of characters of gcode they return. The time is given both including the methods called by a method and excluding them (self time), so for example the time spent formatting a line is separated from the time spent in :meth:`generator.generator.rotate`. Methods that yield gcode, like the sections of a print, are timed only while they are running, not while the caller is using the gcode. When the instrument is disabled the original methods are put back, so the instrumentation costs nothing when it is not used.
+
+The calls are counted per thread, so prints that are generated at the same time in a pool of threads can be measured together. A :class:`cProfile.Profile` can be given, which is then only enabled while the chosen sections are generated.
+"""
+import argparse
+import cProfile
+import functools
+import inspect
+import os
+import pstats
+import threading
+import time
+
+import generator
+import calibration_pattern
+import sink
+
+
+def default_classes():
+    """Get the classes of which the methods are instrumented by default: the :class:`generator.generator`, :class:`calibration_pattern.calibration_pattern` and :class:`sink.sink` classes and all their subclasses that are imported
+
+    :return: The classes
+    :rtype: list
+    """
+    classes = []
+    todo = [generator.generator,calibration_pattern.calibration_pattern,sink.sink]
+    while todo:
+        cls = todo.pop(0)
+        if cls not in classes:
+            classes.append(cls)
+            todo.extend(cls.__subclasses__())
+    return classes
+
+
+class instrument:
+    """Measures where the time of generating gcode goes. For example to find the slowest primitives of a print:
+
+    .. code-block:: python
+
+        with instrument() as measured:
+            pattern.full_interlocked_print(tool_list,reference_tool,"example.g")
+        print(measured.table())
+
+    Or to profile the square section of the print with cProfile:
+
+    .. code-block:: python
+
+        with instrument(profiler=cProfile.Profile(),profile_sections=['square'],count=False) as measured:
+            pattern.full_interlocked_print(tool_list,reference_tool,"example.g")
+        measured.stats().sort_stats('cumulative').print_stats(10)
+
+    :param classes: The classes of which the methods are instrumented, by default :func:`default_classes`
+    :param profiler: Object with enable and disable methods, like :class:`cProfile.Profile`, that is enabled while the profiled sections are generated
+    :param profile_sections: Names of the sections of the print during which the profiler is enabled, or True for all sections
+    :param count: Count the calls of all methods. When false only the sections are counted, such that a profile is not disturbed by the instrumentation of the methods.
+    """
+
+    section_method = '_iter_section'
+    """Method of which every call generates a named section of a print, see :meth:`calibration_pattern.calibration_pattern._iter_section`"""
+
+    def __init__(self,classes=None,profiler=None,profile_sections=True,count=True):
+        self.classes = classes
+        self.profiler = profiler
+        self.profile_sections = profile_sections
+        self.count = count
+        self._originals = []
+        self._states = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start = None
+        self._time = 0.0
+
+    def _state(self):
+        """Get the counters of the current thread
+        """
+        state = getattr(self._local,'state',None)
+        if state is None:
+            state = {'stack':[],'functions':{},'sections':{},'bytes':0}
+            self._local.state = state
+            with self._lock:
+                self._states.append(state)
+        return state
+
+    def _exit(self,state,table,key,start,size):
+        """Count a finished call (or a resumption of a method that yields gcode) in a table
+        """
+        elapsed = time.perf_counter()-start
+        stack = state['stack']
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        else:
+            state['bytes'] += size
+        entry = state[table].get(key)
+        if entry is None:
+            entry = state[table][key] = [0,0.0,0.0,0]
+        entry[1] += elapsed
+        entry[2] += elapsed-children
+        entry[3] += size
+        return entry
+
+    def _wrap(self,key,function):
+        """Make a version of a method that counts its calls
+        """
+        def wrapper(*args,**kwargs):
+            state = self._state()
+            state['stack'].append(0.0)
+            start = time.perf_counter()
+            try:
+                result = function(*args,**kwargs)
+            except BaseException:
+                self._exit(state,'functions',key,start,0)[0] += 1
+                raise
+            self._exit(state,'functions',key,start,len(result) if type(result) is str else 0)[0] += 1
+            return result
+        return functools.update_wrapper(wrapper,function)
+
+    def _wrap_generator(self,key,function,section=False):
+        """Make a version of a method that yields gcode, which counts the time it is running. For the section method the name of the section is used as key.
+        """
+        def wrapper(*args,**kwargs):
+            state = self._state()
+            table = 'functions'
+            name = key
+            if section:
+                table = 'sections'
+                name = args[1] if len(args) > 1 else kwargs['name']
+            profile = section and self.profiler is not None and (self.profile_sections is True or name in self.profile_sections)
+            iterator = function(*args,**kwargs)
+            calls = 1
+            try:
+                while True:
+                    state['stack'].append(0.0)
+                    start = time.perf_counter()
+                    if profile:
+                        self.profiler.enable()
+                    try:
+                        code = next(iterator)
+                    except StopIteration:
+                        self._exit(state,table,name,start,0)[0] += calls
+                        return
+                    except BaseException:
+                        self._exit(state,table,name,start,0)[0] += calls
+                        raise
+                    finally:
+                        if profile:
+                            self.profiler.disable()
+                    self._exit(state,table,name,start,len(code) if type(code) is str else 0)[0] += calls
+                    calls = 0
+                    yield code
+            finally:
+                iterator.close()
+        return functools.update_wrapper(wrapper,function)
+
+    def enable(self):
+        """Start counting, by replacing the methods of the classes
+        """
+        if self._originals:
+            return
+        for cls in (self.classes if self.classes is not None else default_classes()):
+            for name,function in list(vars(cls).items()):
+                if not inspect.isfunction(function) or (name != self.section_method and (name.startswith('_') or not self.count)):
+                    continue
+                key = "%s.%s" % (cls.__name__,name)
+                if inspect.isgeneratorfunction(function):
+                    wrapper = self._wrap_generator(key,function,name == self.section_method)
+                else:
+                    wrapper = self._wrap(key,function)
+                self._originals.append((cls,name,function))
+                setattr(cls,name,wrapper)
+        self._start = time.perf_counter()
+
+    def disable(self):
+        """Stop counting, by putting back the original methods
+        """
+        for cls,name,function in reversed(self._originals):
+            setattr(cls,name,function)
+        self._originals = []
+        if self._start is not None:
+            self._time += time.perf_counter()-self._start
+            self._start = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.disable()
+
+    def report(self):
+        """Get the counts of all threads
+
+        :return: Dictionary with the time during which the instrument was enabled ('total_time'), the number of characters of gcode returned by the outermost instrumented calls ('bytes'), and for every instrumented method ('functions') and for every section of a print ('sections') a dictionary with the number of calls ('calls'), the time spent in it ('time'), the time spent in it excluding other instrumented methods ('self_time') and the number of characters of gcode it returned ('bytes')
+        :rtype: dict
+        """
+        total_time = self._time+(time.perf_counter()-self._start if self._start is not None else 0)
+        result = {'total_time':total_time,'bytes':0,'functions':{},'sections':{}}
+        with self._lock:
+            states = list(self._states)
+        for state in states:
+            result['bytes'] += state['bytes']
+            for table in ('functions','sections'):
+                for key,(calls,elapsed,self_time,size) in state[table].items():
+                    entry = result[table].setdefault(key,{'calls':0,'time':0.0,'self_time':0.0,'bytes':0})
+                    entry['calls'] += calls
+                    entry['time'] += elapsed
+                    entry['self_time'] += self_time
+                    entry['bytes'] += size
+        return result
+
+    def table(self,sort='self_time',limit=None):
+        """Format the report as a table
+
+        :param sort: The column on which the functions and sections are sorted, from large to small
+        :param limit: Maximum number of functions that is shown, by default all
+        :return: The table
+        :rtype: string
+        """
+        report = self.report()
+        lines = ["total %.3f s, %d bytes, %.1f MB/s\n" % (report['total_time'],report['bytes'],report['bytes']/1e6/report['total_time'] if report['total_time'] else 0)]
+        for table in ('functions','sections'):
+            entries = sorted(report[table].items(),key=lambda item: item[1][sort],reverse=True)
+            if table == 'functions' and limit is not None:
+                entries = entries[:limit]
+            lines.append("\n%-48s %10s %10s %10s %12s\n" % (table,'calls','time (s)','self (s)','bytes'))
+            for key,entry in entries:
+                lines.append("%-48s %10d %10.4f %10.4f %12d\n" % (key,entry['calls'],entry['time'],entry['self_time'],entry['bytes']))
+        return "".join(lines)
+
+    def stats(self):
+        """Get the statistics of the profiler
+
+        :return: The statistics, which can be sorted, printed and saved
+        :rtype: pstats.Stats
+        """
+        return pstats.Stats(self.profiler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure where the time of generating a full interlocked calibration print goes")
+    parser.add_argument("--tools",default="1,2,3,4,5",help="tools of the print")
+    parser.add_argument("--reference-tool",type=int,default=2,help="tool used for the reference patterns")
+    parser.add_argument("--toolpath",action="store_true",help="use the toolpath class instead of the generator class")
+    parser.add_argument("--output",default=os.devnull,help="file the gcode is written to")
+    parser.add_argument("--sort",default="self_time",choices=("calls","time","self_time","bytes"),help="column on which the table is sorted")
+    parser.add_argument("--limit",type=int,default=None,help="maximum number of functions in the table")
+    parser.add_argument("--profile",default=None,help="generate the print a second time while profiling all sections with cProfile, and save the statistics to this file")
+    args = parser.parse_args()
+
+    gen = None
+    if args.toolpath:
+        import toolpath
+        gen = toolpath.toolpath()
+    pattern = calibration_pattern.calibration_pattern(gen=gen)
+    tool_list = [int(tool) for tool in args.tools.split(',')]
+    with instrument() as measured:
+        pattern.full_interlocked_print(tool_list,args.reference_tool,args.output)
+    print(measured.table(args.sort,args.limit))
+    if args.profile is not None:
+        with instrument(profiler=cProfile.Profile(),count=False) as profiled:
+            pattern.full_interlocked_print(tool_list,args.reference_tool,args.output)
+        profiled.stats().dump_stats(args.profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,3897 +11,3897 @@ G32
 M83
 M25
 T2
-G1 X-75.585 Y-80.713 F1800
+G1 X-75.656 Y-80.836 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-75.585 Y-80.713 F1800
-G1 X106.009 Y-32.055 E6.8782 F1800
-G1 X75.727 Y80.958 E4.2806 F1800
-G1 X-105.867 Y32.300 E6.8782 F1800
-G1 X-75.585 Y-80.713 E4.2806 F1800
-G1 X-75.303 Y-80.223 F1800
-G1 X105.519 Y-31.772 E6.8489 F1800
-G1 X75.444 Y80.468 E4.2513 F1800
-G1 X-105.377 Y32.017 E6.8489 F1800
-G1 X-75.303 Y-80.223 E4.2513 F1800
-G1 X-75.020 Y-79.733 F1800
-G1 X105.029 Y-31.490 E6.8197 F1800
-G1 X75.161 Y79.978 E4.2220 F1800
-G1 X-104.887 Y31.734 E6.8197 F1800
-G1 X-75.020 Y-79.733 E4.2220 F1800
+G1 X-75.656 Y-80.836 F1800
+G1 X105.938 Y-32.178 E6.8782 F1800
+G1 X75.656 Y80.836 E4.2806 F1800
+G1 X-105.938 Y32.178 E6.8782 F1800
+G1 X-75.656 Y-80.836 E4.2806 F1800
+G1 X-75.373 Y-80.346 F1800
+G1 X105.448 Y-31.895 E6.8489 F1800
+G1 X75.373 Y80.346 E4.2513 F1800
+G1 X-105.448 Y31.895 E6.8489 F1800
+G1 X-75.373 Y-80.346 E4.2513 F1800
+G1 X-75.090 Y-79.856 F1800
+G1 X104.958 Y-31.612 E6.8197 F1800
+G1 X75.090 Y79.856 E4.2220 F1800
+G1 X-104.958 Y31.612 E6.8197 F1800
+G1 X-75.090 Y-79.856 E4.2220 F1800
 G1 Z0.850 E-5.0000 F4800
 ;print vertical interlocked reference pattern 0
-G1 X-70.594 Y-52.976 F1800
+G1 X-70.665 Y-53.099 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-76.390 Y-54.529
-G2 X-76.584 Y-53.805 I-0.097 J0.362 E0.0431 F1800
-G1 X-70.788 Y-52.252 E0.2195 F1800
-G3 X-70.523 Y-51.793 I-0.097 J0.362 E0.0152 F1800
-G1 X-71.170 Y-49.378 E0.0915 F1800
-G3 X-71.629 Y-49.113 I-0.362 J-0.097 E0.0152 F1800
-G1 X-77.425 Y-50.665 E0.2195 F1800
-G2 X-77.619 Y-49.941 I-0.097 J0.362 E0.0431 F1800
-G1 X-71.824 Y-48.388 E0.2195 F1800
-G3 X-71.558 Y-47.929 I-0.097 J0.362 E0.0152 F1800
-G1 X-72.205 Y-45.514 E0.0915 F1800
-G3 X-72.665 Y-45.249 I-0.362 J-0.097 E0.0152 F1800
-G1 X-78.460 Y-46.802 E0.2195 F1800
-G2 X-78.654 Y-46.077 I-0.097 J0.362 E0.0431 F1800
-G1 X-72.859 Y-44.524 E0.2195 F1800
-G3 X-72.594 Y-44.065 I-0.097 J0.362 E0.0152 F1800
-G1 X-73.241 Y-41.650 E0.0915 F1800
-G3 X-73.700 Y-41.385 I-0.362 J-0.097 E0.0152 F1800
-G1 X-79.496 Y-42.938 E0.2195 F1800
-G2 X-79.690 Y-42.214 I-0.097 J0.362 E0.0431 F1800
-G1 X-73.894 Y-40.661 E0.2195 F1800
-G3 X-73.629 Y-40.201 I-0.097 J0.362 E0.0152 F1800
-G1 X-74.276 Y-37.787 E0.0915 F1800
-G3 X-74.735 Y-37.521 I-0.362 J-0.097 E0.0152 F1800
-G1 X-80.531 Y-39.074 E0.2195 F1800
-G2 X-80.725 Y-38.350 I-0.097 J0.362 E0.0431 F1800
-G1 X-74.929 Y-36.797 E0.2195 F1800
-G3 X-74.664 Y-36.338 I-0.097 J0.362 E0.0152 F1800
-G1 X-75.311 Y-33.923 E0.0915 F1800
-G3 X-75.771 Y-33.658 I-0.362 J-0.097 E0.0152 F1800
-G1 X-81.566 Y-35.211 E0.2195 F1800
-G2 X-81.760 Y-34.486 I-0.097 J0.362 E0.0431 F1800
-G1 X-75.965 Y-32.933 E0.2195 F1800
-G3 X-75.700 Y-32.474 I-0.097 J0.362 E0.0152 F1800
-G1 X-76.347 Y-30.059 E0.0915 F1800
-G3 X-76.806 Y-29.794 I-0.362 J-0.097 E0.0152 F1800
-G1 X-82.601 Y-31.347 E0.2195 F1800
-G2 X-82.796 Y-30.622 I-0.097 J0.362 E0.0431 F1800
-G1 X-77.000 Y-29.070 E0.2195 F1800
-G3 X-76.735 Y-28.610 I-0.097 J0.362 E0.0152 F1800
-G1 X-77.382 Y-26.195 E0.0915 F1800
-G3 X-77.841 Y-25.930 I-0.362 J-0.097 E0.0152 F1800
-G1 X-83.637 Y-27.483 E0.2195 F1800
-G2 X-83.831 Y-26.759 I-0.097 J0.362 E0.0431 F1800
-G1 X-78.035 Y-25.206 E0.2195 F1800
-G3 X-77.770 Y-24.747 I-0.097 J0.362 E0.0152 F1800
-G1 X-78.417 Y-22.332 E0.0915 F1800
-G3 X-78.876 Y-22.067 I-0.362 J-0.097 E0.0152 F1800
-G1 X-84.672 Y-23.620 E0.2195 F1800
-G2 X-84.866 Y-22.895 I-0.097 J0.362 E0.0431 F1800
-G1 X-79.071 Y-21.342 E0.2195 F1800
-G3 X-78.805 Y-20.883 I-0.097 J0.362 E0.0152 F1800
-G1 X-79.452 Y-18.468 E0.0915 F1800
-G3 X-79.912 Y-18.203 I-0.362 J-0.097 E0.0152 F1800
-G1 X-85.707 Y-19.756 E0.2195 F1800
-G2 X-85.901 Y-19.031 I-0.097 J0.362 E0.0431 F1800
-G1 X-80.106 Y-17.478 E0.2195 F1800
-G3 X-79.841 Y-17.019 I-0.097 J0.362 E0.0152 F1800
-G1 X-80.488 Y-14.604 E0.0915 F1800
-G3 X-80.947 Y-14.339 I-0.362 J-0.097 E0.0152 F1800
-G1 X-86.742 Y-15.892 E0.2195 F1800
-G2 X-86.937 Y-15.168 I-0.097 J0.362 E0.0431 F1800
-G1 X-81.141 Y-13.615 E0.2195 F1800
-G3 X-80.876 Y-13.155 I-0.097 J0.362 E0.0152 F1800
-G1 X-81.523 Y-10.741 E0.0915 F1800
-G3 X-81.982 Y-10.476 I-0.362 J-0.097 E0.0152 F1800
-G1 X-87.778 Y-12.028 E0.2195 F1800
-G2 X-87.972 Y-11.304 I-0.097 J0.362 E0.0431 F1800
-G1 X-82.176 Y-9.751 E0.2195 F1800
-G3 X-81.911 Y-9.292 I-0.097 J0.362 E0.0152 F1800
-G1 X-82.558 Y-6.877 E0.0915 F1800
-G3 X-83.017 Y-6.612 I-0.362 J-0.097 E0.0152 F1800
-G1 X-88.813 Y-8.165 E0.2195 F1800
-G2 X-89.007 Y-7.440 I-0.097 J0.362 E0.0431 F1800
-G1 X-83.212 Y-5.887 E0.2195 F1800
-G3 X-82.946 Y-5.428 I-0.097 J0.362 E0.0152 F1800
-G1 X-83.593 Y-3.013 E0.0915 F1800
-G3 X-84.053 Y-2.748 I-0.362 J-0.097 E0.0152 F1800
-G1 X-89.848 Y-4.301 E0.2195 F1800
-G2 X-90.042 Y-3.577 I-0.097 J0.362 E0.0431 F1800
-G1 X-84.247 Y-2.024 E0.2195 F1800
-G3 X-83.982 Y-1.564 I-0.097 J0.362 E0.0152 F1800
-G1 X-84.629 Y0.850 E0.0915 F1800
-G3 X-85.088 Y1.116 I-0.362 J-0.097 E0.0152 F1800
-G1 X-90.884 Y-0.437 E0.2195 F1800
-G2 X-91.078 Y0.287 I-0.097 J0.362 E0.0431 F1800
-G1 X-85.282 Y1.840 E0.2195 F1800
-G3 X-85.017 Y2.299 I-0.097 J0.362 E0.0152 F1800
-G1 X-85.664 Y4.714 E0.0915 F1800
-G3 X-86.123 Y4.979 I-0.362 J-0.097 E0.0152 F1800
-G1 X-91.919 Y3.426 E0.2195 F1800
-G2 X-92.113 Y4.151 I-0.097 J0.362 E0.0431 F1800
-G1 X-86.317 Y5.704 E0.2195 F1800
-G3 X-86.052 Y6.163 I-0.097 J0.362 E0.0152 F1800
-G1 X-86.699 Y8.578 E0.0915 F1800
-G3 X-87.159 Y8.843 I-0.362 J-0.097 E0.0152 F1800
-G1 X-92.954 Y7.290 E0.2195 F1800
-G2 X-93.148 Y8.015 I-0.097 J0.362 E0.0431 F1800
-G1 X-87.353 Y9.567 E0.2195 F1800
-G3 X-87.088 Y10.027 I-0.097 J0.362 E0.0152 F1800
-G1 X-87.735 Y12.442 E0.0915 F1800
-G3 X-88.194 Y12.707 I-0.362 J-0.097 E0.0152 F1800
-G1 X-93.989 Y11.154
+G1 X-76.460 Y-54.652
+G2 X-76.655 Y-53.927 I-0.097 J0.362 E0.0431 F1800
+G1 X-70.859 Y-52.374 E0.2195 F1800
+G3 X-70.594 Y-51.915 I-0.097 J0.362 E0.0152 F1800
+G1 X-71.241 Y-49.500 E0.0915 F1800
+G3 X-71.700 Y-49.235 I-0.362 J-0.097 E0.0152 F1800
+G1 X-77.496 Y-50.788 E0.2195 F1800
+G2 X-77.690 Y-50.063 I-0.097 J0.362 E0.0431 F1800
+G1 X-71.894 Y-48.511 E0.2195 F1800
+G3 X-71.629 Y-48.051 I-0.097 J0.362 E0.0152 F1800
+G1 X-72.276 Y-45.636 E0.0915 F1800
+G3 X-72.735 Y-45.371 I-0.362 J-0.097 E0.0152 F1800
+G1 X-78.531 Y-46.924 E0.2195 F1800
+G2 X-78.725 Y-46.200 I-0.097 J0.362 E0.0431 F1800
+G1 X-72.930 Y-44.647 E0.2195 F1800
+G3 X-72.664 Y-44.188 I-0.097 J0.362 E0.0152 F1800
+G1 X-73.311 Y-41.773 E0.0915 F1800
+G3 X-73.771 Y-41.508 I-0.362 J-0.097 E0.0152 F1800
+G1 X-79.566 Y-43.061 E0.2195 F1800
+G2 X-79.760 Y-42.336 I-0.097 J0.362 E0.0431 F1800
+G1 X-73.965 Y-40.783 E0.2195 F1800
+G3 X-73.700 Y-40.324 I-0.097 J0.362 E0.0152 F1800
+G1 X-74.347 Y-37.909 E0.0915 F1800
+G3 X-74.806 Y-37.644 I-0.362 J-0.097 E0.0152 F1800
+G1 X-80.602 Y-39.197 E0.2195 F1800
+G2 X-80.796 Y-38.472 I-0.097 J0.362 E0.0431 F1800
+G1 X-75.000 Y-36.919 E0.2195 F1800
+G3 X-74.735 Y-36.460 I-0.097 J0.362 E0.0152 F1800
+G1 X-75.382 Y-34.045 E0.0915 F1800
+G3 X-75.841 Y-33.780 I-0.362 J-0.097 E0.0152 F1800
+G1 X-81.637 Y-35.333 E0.2195 F1800
+G2 X-81.831 Y-34.609 I-0.097 J0.362 E0.0431 F1800
+G1 X-76.035 Y-33.056 E0.2195 F1800
+G3 X-75.770 Y-32.596 I-0.097 J0.362 E0.0152 F1800
+G1 X-76.417 Y-30.182 E0.0915 F1800
+G3 X-76.877 Y-29.916 I-0.362 J-0.097 E0.0152 F1800
+G1 X-82.672 Y-31.469 E0.2195 F1800
+G2 X-82.866 Y-30.745 I-0.097 J0.362 E0.0431 F1800
+G1 X-77.071 Y-29.192 E0.2195 F1800
+G3 X-76.805 Y-28.733 I-0.097 J0.362 E0.0152 F1800
+G1 X-77.453 Y-26.318 E0.0915 F1800
+G3 X-77.912 Y-26.053 I-0.362 J-0.097 E0.0152 F1800
+G1 X-83.707 Y-27.606 E0.2195 F1800
+G2 X-83.901 Y-26.881 I-0.097 J0.362 E0.0431 F1800
+G1 X-78.106 Y-25.328 E0.2195 F1800
+G3 X-77.841 Y-24.869 I-0.097 J0.362 E0.0152 F1800
+G1 X-78.488 Y-22.454 E0.0915 F1800
+G3 X-78.947 Y-22.189 I-0.362 J-0.097 E0.0152 F1800
+G1 X-84.743 Y-23.742 E0.2195 F1800
+G2 X-84.937 Y-23.018 I-0.097 J0.362 E0.0431 F1800
+G1 X-79.141 Y-21.465 E0.2195 F1800
+G3 X-78.876 Y-21.005 I-0.097 J0.362 E0.0152 F1800
+G1 X-79.523 Y-18.591 E0.0915 F1800
+G3 X-79.982 Y-18.325 I-0.362 J-0.097 E0.0152 F1800
+G1 X-85.778 Y-19.878 E0.2195 F1800
+G2 X-85.972 Y-19.154 I-0.097 J0.362 E0.0431 F1800
+G1 X-80.176 Y-17.601 E0.2195 F1800
+G3 X-79.911 Y-17.142 I-0.097 J0.362 E0.0152 F1800
+G1 X-80.558 Y-14.727 E0.0915 F1800
+G3 X-81.018 Y-14.462 I-0.362 J-0.097 E0.0152 F1800
+G1 X-86.813 Y-16.015 E0.2195 F1800
+G2 X-87.007 Y-15.290 I-0.097 J0.362 E0.0431 F1800
+G1 X-81.212 Y-13.737 E0.2195 F1800
+G3 X-80.947 Y-13.278 I-0.097 J0.362 E0.0152 F1800
+G1 X-81.594 Y-10.863 E0.0915 F1800
+G3 X-82.053 Y-10.598 I-0.362 J-0.097 E0.0152 F1800
+G1 X-87.848 Y-12.151 E0.2195 F1800
+G2 X-88.043 Y-11.426 I-0.097 J0.362 E0.0431 F1800
+G1 X-82.247 Y-9.874 E0.2195 F1800
+G3 X-81.982 Y-9.414 I-0.097 J0.362 E0.0152 F1800
+G1 X-82.629 Y-6.999 E0.0915 F1800
+G3 X-83.088 Y-6.734 I-0.362 J-0.097 E0.0152 F1800
+G1 X-88.884 Y-8.287 E0.2195 F1800
+G2 X-89.078 Y-7.563 I-0.097 J0.362 E0.0431 F1800
+G1 X-83.282 Y-6.010 E0.2195 F1800
+G3 X-83.017 Y-5.551 I-0.097 J0.362 E0.0152 F1800
+G1 X-83.664 Y-3.136 E0.0915 F1800
+G3 X-84.123 Y-2.871 I-0.362 J-0.097 E0.0152 F1800
+G1 X-89.919 Y-4.423 E0.2195 F1800
+G2 X-90.113 Y-3.699 I-0.097 J0.362 E0.0431 F1800
+G1 X-84.318 Y-2.146 E0.2195 F1800
+G3 X-84.052 Y-1.687 I-0.097 J0.362 E0.0152 F1800
+G1 X-84.699 Y0.728 E0.0915 F1800
+G3 X-85.159 Y0.993 I-0.362 J-0.097 E0.0152 F1800
+G1 X-90.954 Y-0.560 E0.2195 F1800
+G2 X-91.148 Y0.165 I-0.097 J0.362 E0.0431 F1800
+G1 X-85.353 Y1.718 E0.2195 F1800
+G3 X-85.088 Y2.177 I-0.097 J0.362 E0.0152 F1800
+G1 X-85.735 Y4.592 E0.0915 F1800
+G3 X-86.194 Y4.857 I-0.362 J-0.097 E0.0152 F1800
+G1 X-91.990 Y3.304 E0.2195 F1800
+G2 X-92.184 Y4.028 I-0.097 J0.362 E0.0431 F1800
+G1 X-86.388 Y5.581 E0.2195 F1800
+G3 X-86.123 Y6.041 I-0.097 J0.362 E0.0152 F1800
+G1 X-86.770 Y8.455 E0.0915 F1800
+G3 X-87.229 Y8.721 I-0.362 J-0.097 E0.0152 F1800
+G1 X-93.025 Y7.168 E0.2195 F1800
+G2 X-93.219 Y7.892 I-0.097 J0.362 E0.0431 F1800
+G1 X-87.423 Y9.445 E0.2195 F1800
+G3 X-87.158 Y9.904 I-0.097 J0.362 E0.0152 F1800
+G1 X-87.805 Y12.319 E0.0915 F1800
+G3 X-88.265 Y12.584 I-0.362 J-0.097 E0.0152 F1800
+G1 X-94.060 Y11.031
 G1 Z0.850 E-5.0000 F4800
-G1 X-86.262 Y13.224
-G1 X-68.145 Y-54.390
-G1 X-59.969 Y-50.129 F1800
+G1 X-86.333 Y13.102
+G1 X-68.215 Y-54.513
+G1 X-60.040 Y-50.252 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-65.765 Y-51.682
-G2 X-65.959 Y-50.958 I-0.097 J0.362 E0.0431 F1800
-G1 X-60.163 Y-49.405 E0.2195 F1800
-G3 X-59.898 Y-48.946 I-0.097 J0.362 E0.0152 F1800
-G1 X-60.545 Y-46.531 E0.0915 F1800
-G3 X-61.004 Y-46.266 I-0.362 J-0.097 E0.0152 F1800
-G1 X-66.800 Y-47.818 E0.2195 F1800
-G2 X-66.994 Y-47.094 I-0.097 J0.362 E0.0431 F1800
-G1 X-61.198 Y-45.541 E0.2195 F1800
-G3 X-60.933 Y-45.082 I-0.097 J0.362 E0.0152 F1800
-G1 X-61.580 Y-42.667 E0.0915 F1800
-G3 X-62.040 Y-42.402 I-0.362 J-0.097 E0.0152 F1800
-G1 X-67.835 Y-43.955 E0.2195 F1800
-G2 X-68.029 Y-43.230 I-0.097 J0.362 E0.0431 F1800
-G1 X-62.234 Y-41.677 E0.2195 F1800
-G3 X-61.968 Y-41.218 I-0.097 J0.362 E0.0152 F1800
-G1 X-62.616 Y-38.803 E0.0915 F1800
-G3 X-63.075 Y-38.538 I-0.362 J-0.097 E0.0152 F1800
-G1 X-68.870 Y-40.091 E0.2195 F1800
-G2 X-69.064 Y-39.367 I-0.097 J0.362 E0.0431 F1800
-G1 X-63.269 Y-37.814 E0.2195 F1800
-G3 X-63.004 Y-37.354 I-0.097 J0.362 E0.0152 F1800
-G1 X-63.651 Y-34.940 E0.0915 F1800
-G3 X-64.110 Y-34.674 I-0.362 J-0.097 E0.0152 F1800
-G1 X-69.906 Y-36.227 E0.2195 F1800
-G2 X-70.100 Y-35.503 I-0.097 J0.362 E0.0431 F1800
-G1 X-64.304 Y-33.950 E0.2195 F1800
-G3 X-64.039 Y-33.491 I-0.097 J0.362 E0.0152 F1800
-G1 X-64.686 Y-31.076 E0.0915 F1800
-G3 X-65.145 Y-30.811 I-0.362 J-0.097 E0.0152 F1800
-G1 X-70.941 Y-32.364 E0.2195 F1800
-G2 X-71.135 Y-31.639 I-0.097 J0.362 E0.0431 F1800
-G1 X-65.339 Y-30.086 E0.2195 F1800
-G3 X-65.074 Y-29.627 I-0.097 J0.362 E0.0152 F1800
-G1 X-65.721 Y-27.212 E0.0915 F1800
-G3 X-66.181 Y-26.947 I-0.362 J-0.097 E0.0152 F1800
-G1 X-71.976 Y-28.500 E0.2195 F1800
-G2 X-72.170 Y-27.775 I-0.097 J0.362 E0.0431 F1800
-G1 X-66.375 Y-26.223 E0.2195 F1800
-G3 X-66.110 Y-25.763 I-0.097 J0.362 E0.0152 F1800
-G1 X-66.757 Y-23.348 E0.0915 F1800
-G3 X-67.216 Y-23.083 I-0.362 J-0.097 E0.0152 F1800
-G1 X-73.011 Y-24.636 E0.2195 F1800
-G2 X-73.206 Y-23.912 I-0.097 J0.362 E0.0431 F1800
-G1 X-67.410 Y-22.359 E0.2195 F1800
-G3 X-67.145 Y-21.900 I-0.097 J0.362 E0.0152 F1800
-G1 X-67.792 Y-19.485 E0.0915 F1800
-G3 X-68.251 Y-19.220 I-0.362 J-0.097 E0.0152 F1800
-G1 X-74.047 Y-20.773 E0.2195 F1800
-G2 X-74.241 Y-20.048 I-0.097 J0.362 E0.0431 F1800
-G1 X-68.445 Y-18.495 E0.2195 F1800
-G3 X-68.180 Y-18.036 I-0.097 J0.362 E0.0152 F1800
-G1 X-68.827 Y-15.621 E0.0915 F1800
-G3 X-69.286 Y-15.356 I-0.362 J-0.097 E0.0152 F1800
-G1 X-75.082 Y-16.909 E0.2195 F1800
-G2 X-75.276 Y-16.184 I-0.097 J0.362 E0.0431 F1800
-G1 X-69.481 Y-14.631 E0.2195 F1800
-G3 X-69.215 Y-14.172 I-0.097 J0.362 E0.0152 F1800
-G1 X-69.862 Y-11.757 E0.0915 F1800
-G3 X-70.322 Y-11.492 I-0.362 J-0.097 E0.0152 F1800
-G1 X-76.117 Y-13.045 E0.2195 F1800
-G2 X-76.311 Y-12.321 I-0.097 J0.362 E0.0431 F1800
-G1 X-70.516 Y-10.768 E0.2195 F1800
-G3 X-70.251 Y-10.308 I-0.097 J0.362 E0.0152 F1800
-G1 X-70.898 Y-7.894 E0.0915 F1800
-G3 X-71.357 Y-7.628 I-0.362 J-0.097 E0.0152 F1800
-G1 X-77.153 Y-9.181 E0.2195 F1800
-G2 X-77.347 Y-8.457 I-0.097 J0.362 E0.0431 F1800
-G1 X-71.551 Y-6.904 E0.2195 F1800
-G3 X-71.286 Y-6.445 I-0.097 J0.362 E0.0152 F1800
-G1 X-71.933 Y-4.030 E0.0915 F1800
-G3 X-72.392 Y-3.765 I-0.362 J-0.097 E0.0152 F1800
-G1 X-78.188 Y-5.318 E0.2195 F1800
-G2 X-78.382 Y-4.593 I-0.097 J0.362 E0.0431 F1800
-G1 X-72.586 Y-3.040 E0.2195 F1800
-G3 X-72.321 Y-2.581 I-0.097 J0.362 E0.0152 F1800
-G1 X-72.968 Y-0.166 E0.0915 F1800
-G3 X-73.428 Y0.099 I-0.362 J-0.097 E0.0152 F1800
-G1 X-79.223 Y-1.454 E0.2195 F1800
-G2 X-79.417 Y-0.730 I-0.097 J0.362 E0.0431 F1800
-G1 X-73.622 Y0.823 E0.2195 F1800
-G3 X-73.357 Y1.283 I-0.097 J0.362 E0.0152 F1800
-G1 X-74.004 Y3.697 E0.0915 F1800
-G3 X-74.463 Y3.963 I-0.362 J-0.097 E0.0152 F1800
-G1 X-80.258 Y2.410 E0.2195 F1800
-G2 X-80.453 Y3.134 I-0.097 J0.362 E0.0431 F1800
-G1 X-74.657 Y4.687 E0.2195 F1800
-G3 X-74.392 Y5.146 I-0.097 J0.362 E0.0152 F1800
-G1 X-75.039 Y7.561 E0.0915 F1800
-G3 X-75.498 Y7.826 I-0.362 J-0.097 E0.0152 F1800
-G1 X-81.294 Y6.273 E0.2195 F1800
-G2 X-81.488 Y6.998 I-0.097 J0.362 E0.0431 F1800
-G1 X-75.692 Y8.551 E0.2195 F1800
-G3 X-75.427 Y9.010 I-0.097 J0.362 E0.0152 F1800
-G1 X-76.074 Y11.425 E0.0915 F1800
-G3 X-76.533 Y11.690 I-0.362 J-0.097 E0.0152 F1800
-G1 X-82.329 Y10.137 E0.2195 F1800
-G2 X-82.523 Y10.862 I-0.097 J0.362 E0.0431 F1800
-G1 X-76.728 Y12.414 E0.2195 F1800
-G3 X-76.462 Y12.874 I-0.097 J0.362 E0.0152 F1800
-G1 X-77.109 Y15.289 E0.0915 F1800
-G3 X-77.569 Y15.554 I-0.362 J-0.097 E0.0152 F1800
-G1 X-83.364 Y14.001
+G1 X-65.835 Y-51.805
+G2 X-66.029 Y-51.080 I-0.097 J0.362 E0.0431 F1800
+G1 X-60.234 Y-49.527 E0.2195 F1800
+G3 X-59.969 Y-49.068 I-0.097 J0.362 E0.0152 F1800
+G1 X-60.616 Y-46.653 E0.0915 F1800
+G3 X-61.075 Y-46.388 I-0.362 J-0.097 E0.0152 F1800
+G1 X-66.871 Y-47.941 E0.2195 F1800
+G2 X-67.065 Y-47.216 I-0.097 J0.362 E0.0431 F1800
+G1 X-61.269 Y-45.664 E0.2195 F1800
+G3 X-61.004 Y-45.204 I-0.097 J0.362 E0.0152 F1800
+G1 X-61.651 Y-42.789 E0.0915 F1800
+G3 X-62.110 Y-42.524 I-0.362 J-0.097 E0.0152 F1800
+G1 X-67.906 Y-44.077 E0.2195 F1800
+G2 X-68.100 Y-43.353 I-0.097 J0.362 E0.0431 F1800
+G1 X-62.304 Y-41.800 E0.2195 F1800
+G3 X-62.039 Y-41.341 I-0.097 J0.362 E0.0152 F1800
+G1 X-62.686 Y-38.926 E0.0915 F1800
+G3 X-63.146 Y-38.661 I-0.362 J-0.097 E0.0152 F1800
+G1 X-68.941 Y-40.214 E0.2195 F1800
+G2 X-69.135 Y-39.489 I-0.097 J0.362 E0.0431 F1800
+G1 X-63.340 Y-37.936 E0.2195 F1800
+G3 X-63.074 Y-37.477 I-0.097 J0.362 E0.0152 F1800
+G1 X-63.722 Y-35.062 E0.0915 F1800
+G3 X-64.181 Y-34.797 I-0.362 J-0.097 E0.0152 F1800
+G1 X-69.976 Y-36.350 E0.2195 F1800
+G2 X-70.170 Y-35.625 I-0.097 J0.362 E0.0431 F1800
+G1 X-64.375 Y-34.072 E0.2195 F1800
+G3 X-64.110 Y-33.613 I-0.097 J0.362 E0.0152 F1800
+G1 X-64.757 Y-31.198 E0.0915 F1800
+G3 X-65.216 Y-30.933 I-0.362 J-0.097 E0.0152 F1800
+G1 X-71.012 Y-32.486 E0.2195 F1800
+G2 X-71.206 Y-31.762 I-0.097 J0.362 E0.0431 F1800
+G1 X-65.410 Y-30.209 E0.2195 F1800
+G3 X-65.145 Y-29.749 I-0.097 J0.362 E0.0152 F1800
+G1 X-65.792 Y-27.335 E0.0915 F1800
+G3 X-66.251 Y-27.069 I-0.362 J-0.097 E0.0152 F1800
+G1 X-72.047 Y-28.622 E0.2195 F1800
+G2 X-72.241 Y-27.898 I-0.097 J0.362 E0.0431 F1800
+G1 X-66.445 Y-26.345 E0.2195 F1800
+G3 X-66.180 Y-25.886 I-0.097 J0.362 E0.0152 F1800
+G1 X-66.827 Y-23.471 E0.0915 F1800
+G3 X-67.287 Y-23.206 I-0.362 J-0.097 E0.0152 F1800
+G1 X-73.082 Y-24.759 E0.2195 F1800
+G2 X-73.276 Y-24.034 I-0.097 J0.362 E0.0431 F1800
+G1 X-67.481 Y-22.481 E0.2195 F1800
+G3 X-67.216 Y-22.022 I-0.097 J0.362 E0.0152 F1800
+G1 X-67.863 Y-19.607 E0.0915 F1800
+G3 X-68.322 Y-19.342 I-0.362 J-0.097 E0.0152 F1800
+G1 X-74.117 Y-20.895 E0.2195 F1800
+G2 X-74.312 Y-20.171 I-0.097 J0.362 E0.0431 F1800
+G1 X-68.516 Y-18.618 E0.2195 F1800
+G3 X-68.251 Y-18.158 I-0.097 J0.362 E0.0152 F1800
+G1 X-68.898 Y-15.744 E0.0915 F1800
+G3 X-69.357 Y-15.478 I-0.362 J-0.097 E0.0152 F1800
+G1 X-75.153 Y-17.031 E0.2195 F1800
+G2 X-75.347 Y-16.307 I-0.097 J0.362 E0.0431 F1800
+G1 X-69.551 Y-14.754 E0.2195 F1800
+G3 X-69.286 Y-14.295 I-0.097 J0.362 E0.0152 F1800
+G1 X-69.933 Y-11.880 E0.0915 F1800
+G3 X-70.392 Y-11.615 I-0.362 J-0.097 E0.0152 F1800
+G1 X-76.188 Y-13.168 E0.2195 F1800
+G2 X-76.382 Y-12.443 I-0.097 J0.362 E0.0431 F1800
+G1 X-70.587 Y-10.890 E0.2195 F1800
+G3 X-70.321 Y-10.431 I-0.097 J0.362 E0.0152 F1800
+G1 X-70.968 Y-8.016 E0.0915 F1800
+G3 X-71.428 Y-7.751 I-0.362 J-0.097 E0.0152 F1800
+G1 X-77.223 Y-9.304 E0.2195 F1800
+G2 X-77.417 Y-8.579 I-0.097 J0.362 E0.0431 F1800
+G1 X-71.622 Y-7.027 E0.2195 F1800
+G3 X-71.357 Y-6.567 I-0.097 J0.362 E0.0152 F1800
+G1 X-72.004 Y-4.152 E0.0915 F1800
+G3 X-72.463 Y-3.887 I-0.362 J-0.097 E0.0152 F1800
+G1 X-78.259 Y-5.440 E0.2195 F1800
+G2 X-78.453 Y-4.716 I-0.097 J0.362 E0.0431 F1800
+G1 X-72.657 Y-3.163 E0.2195 F1800
+G3 X-72.392 Y-2.704 I-0.097 J0.362 E0.0152 F1800
+G1 X-73.039 Y-0.289 E0.0915 F1800
+G3 X-73.498 Y-0.024 I-0.362 J-0.097 E0.0152 F1800
+G1 X-79.294 Y-1.576 E0.2195 F1800
+G2 X-79.488 Y-0.852 I-0.097 J0.362 E0.0431 F1800
+G1 X-73.692 Y0.701 E0.2195 F1800
+G3 X-73.427 Y1.160 I-0.097 J0.362 E0.0152 F1800
+G1 X-74.074 Y3.575 E0.0915 F1800
+G3 X-74.534 Y3.840 I-0.362 J-0.097 E0.0152 F1800
+G1 X-80.329 Y2.287 E0.2195 F1800
+G2 X-80.523 Y3.012 I-0.097 J0.362 E0.0431 F1800
+G1 X-74.728 Y4.565 E0.2195 F1800
+G3 X-74.463 Y5.024 I-0.097 J0.362 E0.0152 F1800
+G1 X-75.110 Y7.439 E0.0915 F1800
+G3 X-75.569 Y7.704 I-0.362 J-0.097 E0.0152 F1800
+G1 X-81.364 Y6.151 E0.2195 F1800
+G2 X-81.559 Y6.875 I-0.097 J0.362 E0.0431 F1800
+G1 X-75.763 Y8.428 E0.2195 F1800
+G3 X-75.498 Y8.888 I-0.097 J0.362 E0.0152 F1800
+G1 X-76.145 Y11.302 E0.0915 F1800
+G3 X-76.604 Y11.568 I-0.362 J-0.097 E0.0152 F1800
+G1 X-82.400 Y10.015 E0.2195 F1800
+G2 X-82.594 Y10.739 I-0.097 J0.362 E0.0431 F1800
+G1 X-76.798 Y12.292 E0.2195 F1800
+G3 X-76.533 Y12.751 I-0.097 J0.362 E0.0152 F1800
+G1 X-77.180 Y15.166 E0.0915 F1800
+G3 X-77.639 Y15.431 I-0.362 J-0.097 E0.0152 F1800
+G1 X-83.435 Y13.878
 G1 Z0.850 E-5.0000 F4800
-G1 X-75.637 Y16.071
-G1 X-57.520 Y-51.543
+G1 X-75.708 Y15.949
+G1 X-57.590 Y-51.666
 ;print vertical interlocked reference pattern 1
-G1 X-49.344 Y-47.282 F1800
+G1 X-49.415 Y-47.405 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-55.139 Y-48.835
-G2 X-55.333 Y-48.111 I-0.097 J0.362 E0.0431 F1800
-G1 X-49.538 Y-46.558 E0.2195 F1800
-G3 X-49.273 Y-46.098 I-0.097 J0.362 E0.0152 F1800
-G1 X-49.920 Y-43.684 E0.0915 F1800
-G3 X-50.379 Y-43.419 I-0.362 J-0.097 E0.0152 F1800
-G1 X-56.175 Y-44.971 E0.2195 F1800
-G2 X-56.369 Y-44.247 I-0.097 J0.362 E0.0431 F1800
-G1 X-50.573 Y-42.694 E0.2195 F1800
-G3 X-50.308 Y-42.235 I-0.097 J0.362 E0.0152 F1800
-G1 X-50.955 Y-39.820 E0.0915 F1800
-G3 X-51.414 Y-39.555 I-0.362 J-0.097 E0.0152 F1800
-G1 X-57.210 Y-41.108 E0.2195 F1800
-G2 X-57.404 Y-40.383 I-0.097 J0.362 E0.0431 F1800
-G1 X-51.608 Y-38.830 E0.2195 F1800
-G3 X-51.343 Y-38.371 I-0.097 J0.362 E0.0152 F1800
-G1 X-51.990 Y-35.956 E0.0915 F1800
-G3 X-52.450 Y-35.691 I-0.362 J-0.097 E0.0152 F1800
-G1 X-58.245 Y-37.244 E0.2195 F1800
-G2 X-58.439 Y-36.520 I-0.097 J0.362 E0.0431 F1800
-G1 X-52.644 Y-34.967 E0.2195 F1800
-G3 X-52.379 Y-34.507 I-0.097 J0.362 E0.0152 F1800
-G1 X-53.026 Y-32.093 E0.0915 F1800
-G3 X-53.485 Y-31.827 I-0.362 J-0.097 E0.0152 F1800
-G1 X-59.280 Y-33.380 E0.2195 F1800
-G2 X-59.475 Y-32.656 I-0.097 J0.362 E0.0431 F1800
-G1 X-53.679 Y-31.103 E0.2195 F1800
-G3 X-53.414 Y-30.644 I-0.097 J0.362 E0.0152 F1800
-G1 X-54.061 Y-28.229 E0.0915 F1800
-G3 X-54.520 Y-27.964 I-0.362 J-0.097 E0.0152 F1800
-G1 X-60.316 Y-29.517 E0.2195 F1800
-G2 X-60.510 Y-28.792 I-0.097 J0.362 E0.0431 F1800
-G1 X-54.714 Y-27.239 E0.2195 F1800
-G3 X-54.449 Y-26.780 I-0.097 J0.362 E0.0152 F1800
-G1 X-55.096 Y-24.365 E0.0915 F1800
-G3 X-55.555 Y-24.100 I-0.362 J-0.097 E0.0152 F1800
-G1 X-61.351 Y-25.653 E0.2195 F1800
-G2 X-61.545 Y-24.928 I-0.097 J0.362 E0.0431 F1800
-G1 X-55.750 Y-23.376 E0.2195 F1800
-G3 X-55.484 Y-22.916 I-0.097 J0.362 E0.0152 F1800
-G1 X-56.131 Y-20.501 E0.0915 F1800
-G3 X-56.591 Y-20.236 I-0.362 J-0.097 E0.0152 F1800
-G1 X-62.386 Y-21.789 E0.2195 F1800
-G2 X-62.580 Y-21.065 I-0.097 J0.362 E0.0431 F1800
-G1 X-56.785 Y-19.512 E0.2195 F1800
-G3 X-56.520 Y-19.053 I-0.097 J0.362 E0.0152 F1800
-G1 X-57.167 Y-16.638 E0.0915 F1800
-G3 X-57.626 Y-16.373 I-0.362 J-0.097 E0.0152 F1800
-G1 X-63.422 Y-17.926 E0.2195 F1800
-G2 X-63.616 Y-17.201 I-0.097 J0.362 E0.0431 F1800
-G1 X-57.820 Y-15.648 E0.2195 F1800
-G3 X-57.555 Y-15.189 I-0.097 J0.362 E0.0152 F1800
-G1 X-58.202 Y-12.774 E0.0915 F1800
-G3 X-58.661 Y-12.509 I-0.362 J-0.097 E0.0152 F1800
-G1 X-64.457 Y-14.062 E0.2195 F1800
-G2 X-64.651 Y-13.337 I-0.097 J0.362 E0.0431 F1800
-G1 X-58.855 Y-11.784 E0.2195 F1800
-G3 X-58.590 Y-11.325 I-0.097 J0.362 E0.0152 F1800
-G1 X-59.237 Y-8.910 E0.0915 F1800
-G3 X-59.697 Y-8.645 I-0.362 J-0.097 E0.0152 F1800
-G1 X-65.492 Y-10.198 E0.2195 F1800
-G2 X-65.686 Y-9.474 I-0.097 J0.362 E0.0431 F1800
-G1 X-59.891 Y-7.921 E0.2195 F1800
-G3 X-59.626 Y-7.461 I-0.097 J0.362 E0.0152 F1800
-G1 X-60.273 Y-5.047 E0.0915 F1800
-G3 X-60.732 Y-4.781 I-0.362 J-0.097 E0.0152 F1800
-G1 X-66.527 Y-6.334 E0.2195 F1800
-G2 X-66.722 Y-5.610 I-0.097 J0.362 E0.0431 F1800
-G1 X-60.926 Y-4.057 E0.2195 F1800
-G3 X-60.661 Y-3.598 I-0.097 J0.362 E0.0152 F1800
-G1 X-61.308 Y-1.183 E0.0915 F1800
-G3 X-61.767 Y-0.918 I-0.362 J-0.097 E0.0152 F1800
-G1 X-67.563 Y-2.471 E0.2195 F1800
-G2 X-67.757 Y-1.746 I-0.097 J0.362 E0.0431 F1800
-G1 X-61.961 Y-0.193 E0.2195 F1800
-G3 X-61.696 Y0.266 I-0.097 J0.362 E0.0152 F1800
-G1 X-62.343 Y2.681 E0.0915 F1800
-G3 X-62.802 Y2.946 I-0.362 J-0.097 E0.0152 F1800
-G1 X-68.598 Y1.393 E0.2195 F1800
-G2 X-68.792 Y2.117 I-0.097 J0.362 E0.0431 F1800
-G1 X-62.997 Y3.670 E0.2195 F1800
-G3 X-62.731 Y4.130 I-0.097 J0.362 E0.0152 F1800
-G1 X-63.378 Y6.544 E0.0915 F1800
-G3 X-63.838 Y6.810 I-0.362 J-0.097 E0.0152 F1800
-G1 X-69.633 Y5.257 E0.2195 F1800
-G2 X-69.827 Y5.981 I-0.097 J0.362 E0.0431 F1800
-G1 X-64.032 Y7.534 E0.2195 F1800
-G3 X-63.767 Y7.993 I-0.097 J0.362 E0.0152 F1800
-G1 X-64.414 Y10.408 E0.0915 F1800
-G3 X-64.873 Y10.673 I-0.362 J-0.097 E0.0152 F1800
-G1 X-70.669 Y9.120 E0.2195 F1800
-G2 X-70.863 Y9.845 I-0.097 J0.362 E0.0431 F1800
-G1 X-65.067 Y11.398 E0.2195 F1800
-G3 X-64.802 Y11.857 I-0.097 J0.362 E0.0152 F1800
-G1 X-65.449 Y14.272 E0.0915 F1800
-G3 X-65.908 Y14.537 I-0.362 J-0.097 E0.0152 F1800
-G1 X-71.704 Y12.984 E0.2195 F1800
-G2 X-71.898 Y13.709 I-0.097 J0.362 E0.0431 F1800
-G1 X-66.102 Y15.261 E0.2195 F1800
-G3 X-65.837 Y15.721 I-0.097 J0.362 E0.0152 F1800
-G1 X-66.484 Y18.136 E0.0915 F1800
-G3 X-66.944 Y18.401 I-0.362 J-0.097 E0.0152 F1800
-G1 X-72.739 Y16.848
+G1 X-55.210 Y-48.958
+G2 X-55.404 Y-48.233 I-0.097 J0.362 E0.0431 F1800
+G1 X-49.609 Y-46.680 E0.2195 F1800
+G3 X-49.343 Y-46.221 I-0.097 J0.362 E0.0152 F1800
+G1 X-49.991 Y-43.806 E0.0915 F1800
+G3 X-50.450 Y-43.541 I-0.362 J-0.097 E0.0152 F1800
+G1 X-56.245 Y-45.094 E0.2195 F1800
+G2 X-56.439 Y-44.369 I-0.097 J0.362 E0.0431 F1800
+G1 X-50.644 Y-42.817 E0.2195 F1800
+G3 X-50.379 Y-42.357 I-0.097 J0.362 E0.0152 F1800
+G1 X-51.026 Y-39.942 E0.0915 F1800
+G3 X-51.485 Y-39.677 I-0.362 J-0.097 E0.0152 F1800
+G1 X-57.281 Y-41.230 E0.2195 F1800
+G2 X-57.475 Y-40.506 I-0.097 J0.362 E0.0431 F1800
+G1 X-51.679 Y-38.953 E0.2195 F1800
+G3 X-51.414 Y-38.494 I-0.097 J0.362 E0.0152 F1800
+G1 X-52.061 Y-36.079 E0.0915 F1800
+G3 X-52.520 Y-35.814 I-0.362 J-0.097 E0.0152 F1800
+G1 X-58.316 Y-37.366 E0.2195 F1800
+G2 X-58.510 Y-36.642 I-0.097 J0.362 E0.0431 F1800
+G1 X-52.714 Y-35.089 E0.2195 F1800
+G3 X-52.449 Y-34.630 I-0.097 J0.362 E0.0152 F1800
+G1 X-53.096 Y-32.215 E0.0915 F1800
+G3 X-53.556 Y-31.950 I-0.362 J-0.097 E0.0152 F1800
+G1 X-59.351 Y-33.503 E0.2195 F1800
+G2 X-59.545 Y-32.778 I-0.097 J0.362 E0.0431 F1800
+G1 X-53.750 Y-31.225 E0.2195 F1800
+G3 X-53.485 Y-30.766 I-0.097 J0.362 E0.0152 F1800
+G1 X-54.132 Y-28.351 E0.0915 F1800
+G3 X-54.591 Y-28.086 I-0.362 J-0.097 E0.0152 F1800
+G1 X-60.386 Y-29.639 E0.2195 F1800
+G2 X-60.581 Y-28.915 I-0.097 J0.362 E0.0431 F1800
+G1 X-54.785 Y-27.362 E0.2195 F1800
+G3 X-54.520 Y-26.902 I-0.097 J0.362 E0.0152 F1800
+G1 X-55.167 Y-24.488 E0.0915 F1800
+G3 X-55.626 Y-24.222 I-0.362 J-0.097 E0.0152 F1800
+G1 X-61.422 Y-25.775 E0.2195 F1800
+G2 X-61.616 Y-25.051 I-0.097 J0.362 E0.0431 F1800
+G1 X-55.820 Y-23.498 E0.2195 F1800
+G3 X-55.555 Y-23.039 I-0.097 J0.362 E0.0152 F1800
+G1 X-56.202 Y-20.624 E0.0915 F1800
+G3 X-56.661 Y-20.359 I-0.362 J-0.097 E0.0152 F1800
+G1 X-62.457 Y-21.912 E0.2195 F1800
+G2 X-62.651 Y-21.187 I-0.097 J0.362 E0.0431 F1800
+G1 X-56.856 Y-19.634 E0.2195 F1800
+G3 X-56.590 Y-19.175 I-0.097 J0.362 E0.0152 F1800
+G1 X-57.237 Y-16.760 E0.0915 F1800
+G3 X-57.697 Y-16.495 I-0.362 J-0.097 E0.0152 F1800
+G1 X-63.492 Y-18.048 E0.2195 F1800
+G2 X-63.686 Y-17.324 I-0.097 J0.362 E0.0431 F1800
+G1 X-57.891 Y-15.771 E0.2195 F1800
+G3 X-57.626 Y-15.311 I-0.097 J0.362 E0.0152 F1800
+G1 X-58.273 Y-12.897 E0.0915 F1800
+G3 X-58.732 Y-12.631 I-0.362 J-0.097 E0.0152 F1800
+G1 X-64.528 Y-14.184 E0.2195 F1800
+G2 X-64.722 Y-13.460 I-0.097 J0.362 E0.0431 F1800
+G1 X-58.926 Y-11.907 E0.2195 F1800
+G3 X-58.661 Y-11.448 I-0.097 J0.362 E0.0152 F1800
+G1 X-59.308 Y-9.033 E0.0915 F1800
+G3 X-59.767 Y-8.768 I-0.362 J-0.097 E0.0152 F1800
+G1 X-65.563 Y-10.321 E0.2195 F1800
+G2 X-65.757 Y-9.596 I-0.097 J0.362 E0.0431 F1800
+G1 X-59.961 Y-8.043 E0.2195 F1800
+G3 X-59.696 Y-7.584 I-0.097 J0.362 E0.0152 F1800
+G1 X-60.343 Y-5.169 E0.0915 F1800
+G3 X-60.803 Y-4.904 I-0.362 J-0.097 E0.0152 F1800
+G1 X-66.598 Y-6.457 E0.2195 F1800
+G2 X-66.792 Y-5.732 I-0.097 J0.362 E0.0431 F1800
+G1 X-60.997 Y-4.180 E0.2195 F1800
+G3 X-60.732 Y-3.720 I-0.097 J0.362 E0.0152 F1800
+G1 X-61.379 Y-1.305 E0.0915 F1800
+G3 X-61.838 Y-1.040 I-0.362 J-0.097 E0.0152 F1800
+G1 X-67.633 Y-2.593 E0.2195 F1800
+G2 X-67.828 Y-1.869 I-0.097 J0.362 E0.0431 F1800
+G1 X-62.032 Y-0.316 E0.2195 F1800
+G3 X-61.767 Y0.143 I-0.097 J0.362 E0.0152 F1800
+G1 X-62.414 Y2.558 E0.0915 F1800
+G3 X-62.873 Y2.823 I-0.362 J-0.097 E0.0152 F1800
+G1 X-68.669 Y1.271 E0.2195 F1800
+G2 X-68.863 Y1.995 I-0.097 J0.362 E0.0431 F1800
+G1 X-63.067 Y3.548 E0.2195 F1800
+G3 X-62.802 Y4.007 I-0.097 J0.362 E0.0152 F1800
+G1 X-63.449 Y6.422 E0.0915 F1800
+G3 X-63.908 Y6.687 I-0.362 J-0.097 E0.0152 F1800
+G1 X-69.704 Y5.134 E0.2195 F1800
+G2 X-69.898 Y5.859 I-0.097 J0.362 E0.0431 F1800
+G1 X-64.103 Y7.412 E0.2195 F1800
+G3 X-63.837 Y7.871 I-0.097 J0.362 E0.0152 F1800
+G1 X-64.484 Y10.286 E0.0915 F1800
+G3 X-64.944 Y10.551 I-0.362 J-0.097 E0.0152 F1800
+G1 X-70.739 Y8.998 E0.2195 F1800
+G2 X-70.933 Y9.722 I-0.097 J0.362 E0.0431 F1800
+G1 X-65.138 Y11.275 E0.2195 F1800
+G3 X-64.873 Y11.735 I-0.097 J0.362 E0.0152 F1800
+G1 X-65.520 Y14.149 E0.0915 F1800
+G3 X-65.979 Y14.415 I-0.362 J-0.097 E0.0152 F1800
+G1 X-71.774 Y12.862 E0.2195 F1800
+G2 X-71.969 Y13.586 I-0.097 J0.362 E0.0431 F1800
+G1 X-66.173 Y15.139 E0.2195 F1800
+G3 X-65.908 Y15.598 I-0.097 J0.362 E0.0152 F1800
+G1 X-66.555 Y18.013 E0.0915 F1800
+G3 X-67.014 Y18.278 I-0.362 J-0.097 E0.0152 F1800
+G1 X-72.810 Y16.725
 G1 Z0.850 E-5.0000 F4800
-G1 X-65.012 Y18.918
-G1 X-46.894 Y-48.696
-G1 X-38.719 Y-44.435 F1800
+G1 X-65.082 Y18.796
+G1 X-46.965 Y-48.819
+G1 X-38.789 Y-44.558 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-44.514 Y-45.988
-G2 X-44.708 Y-45.264 I-0.097 J0.362 E0.0431 F1800
-G1 X-38.913 Y-43.711 E0.2195 F1800
-G3 X-38.648 Y-43.251 I-0.097 J0.362 E0.0152 F1800
-G1 X-39.295 Y-40.837 E0.0915 F1800
-G3 X-39.754 Y-40.572 I-0.362 J-0.097 E0.0152 F1800
-G1 X-45.549 Y-42.124 E0.2195 F1800
-G2 X-45.744 Y-41.400 I-0.097 J0.362 E0.0431 F1800
-G1 X-39.948 Y-39.847 E0.2195 F1800
-G3 X-39.683 Y-39.388 I-0.097 J0.362 E0.0152 F1800
-G1 X-40.330 Y-36.973 E0.0915 F1800
-G3 X-40.789 Y-36.708 I-0.362 J-0.097 E0.0152 F1800
-G1 X-46.585 Y-38.261 E0.2195 F1800
-G2 X-46.779 Y-37.536 I-0.097 J0.362 E0.0431 F1800
-G1 X-40.983 Y-35.983 E0.2195 F1800
-G3 X-40.718 Y-35.524 I-0.097 J0.362 E0.0152 F1800
-G1 X-41.365 Y-33.109 E0.0915 F1800
-G3 X-41.824 Y-32.844 I-0.362 J-0.097 E0.0152 F1800
-G1 X-47.620 Y-34.397 E0.2195 F1800
-G2 X-47.814 Y-33.673 I-0.097 J0.362 E0.0431 F1800
-G1 X-42.019 Y-32.120 E0.2195 F1800
-G3 X-41.753 Y-31.660 I-0.097 J0.362 E0.0152 F1800
-G1 X-42.400 Y-29.246 E0.0915 F1800
-G3 X-42.860 Y-28.980 I-0.362 J-0.097 E0.0152 F1800
-G1 X-48.655 Y-30.533 E0.2195 F1800
-G2 X-48.849 Y-29.809 I-0.097 J0.362 E0.0431 F1800
-G1 X-43.054 Y-28.256 E0.2195 F1800
-G3 X-42.789 Y-27.797 I-0.097 J0.362 E0.0152 F1800
-G1 X-43.436 Y-25.382 E0.0915 F1800
-G3 X-43.895 Y-25.117 I-0.362 J-0.097 E0.0152 F1800
-G1 X-49.691 Y-26.670 E0.2195 F1800
-G2 X-49.885 Y-25.945 I-0.097 J0.362 E0.0431 F1800
-G1 X-44.089 Y-24.392 E0.2195 F1800
-G3 X-43.824 Y-23.933 I-0.097 J0.362 E0.0152 F1800
-G1 X-44.471 Y-21.518 E0.0915 F1800
-G3 X-44.930 Y-21.253 I-0.362 J-0.097 E0.0152 F1800
-G1 X-50.726 Y-22.806 E0.2195 F1800
-G2 X-50.920 Y-22.081 I-0.097 J0.362 E0.0431 F1800
-G1 X-45.124 Y-20.529 E0.2195 F1800
-G3 X-44.859 Y-20.069 I-0.097 J0.362 E0.0152 F1800
-G1 X-45.506 Y-17.654 E0.0915 F1800
-G3 X-45.966 Y-17.389 I-0.362 J-0.097 E0.0152 F1800
-G1 X-51.761 Y-18.942 E0.2195 F1800
-G2 X-51.955 Y-18.218 I-0.097 J0.362 E0.0431 F1800
-G1 X-46.160 Y-16.665 E0.2195 F1800
-G3 X-45.895 Y-16.206 I-0.097 J0.362 E0.0152 F1800
-G1 X-46.542 Y-13.791 E0.0915 F1800
-G3 X-47.001 Y-13.526 I-0.362 J-0.097 E0.0152 F1800
-G1 X-52.796 Y-15.078 E0.2195 F1800
-G2 X-52.991 Y-14.354 I-0.097 J0.362 E0.0431 F1800
-G1 X-47.195 Y-12.801 E0.2195 F1800
-G3 X-46.930 Y-12.342 I-0.097 J0.362 E0.0152 F1800
-G1 X-47.577 Y-9.927 E0.0915 F1800
-G3 X-48.036 Y-9.662 I-0.362 J-0.097 E0.0152 F1800
-G1 X-53.832 Y-11.215 E0.2195 F1800
-G2 X-54.026 Y-10.490 I-0.097 J0.362 E0.0431 F1800
-G1 X-48.230 Y-8.937 E0.2195 F1800
-G3 X-47.965 Y-8.478 I-0.097 J0.362 E0.0152 F1800
-G1 X-48.612 Y-6.063 E0.0915 F1800
-G3 X-49.071 Y-5.798 I-0.362 J-0.097 E0.0152 F1800
-G1 X-54.867 Y-7.351 E0.2195 F1800
-G2 X-55.061 Y-6.627 I-0.097 J0.362 E0.0431 F1800
-G1 X-49.266 Y-5.074 E0.2195 F1800
-G3 X-49.000 Y-4.614 I-0.097 J0.362 E0.0152 F1800
-G1 X-49.647 Y-2.200 E0.0915 F1800
-G3 X-50.107 Y-1.934 I-0.362 J-0.097 E0.0152 F1800
-G1 X-55.902 Y-3.487 E0.2195 F1800
-G2 X-56.096 Y-2.763 I-0.097 J0.362 E0.0431 F1800
-G1 X-50.301 Y-1.210 E0.2195 F1800
-G3 X-50.036 Y-0.751 I-0.097 J0.362 E0.0152 F1800
-G1 X-50.683 Y1.664 E0.0915 F1800
-G3 X-51.142 Y1.929 I-0.362 J-0.097 E0.0152 F1800
-G1 X-56.937 Y0.376 E0.2195 F1800
-G2 X-57.132 Y1.101 I-0.097 J0.362 E0.0431 F1800
-G1 X-51.336 Y2.654 E0.2195 F1800
-G3 X-51.071 Y3.113 I-0.097 J0.362 E0.0152 F1800
-G1 X-51.718 Y5.528 E0.0915 F1800
-G3 X-52.177 Y5.793 I-0.362 J-0.097 E0.0152 F1800
-G1 X-57.973 Y4.240 E0.2195 F1800
-G2 X-58.167 Y4.964 I-0.097 J0.362 E0.0431 F1800
-G1 X-52.371 Y6.517 E0.2195 F1800
-G3 X-52.106 Y6.977 I-0.097 J0.362 E0.0152 F1800
-G1 X-52.753 Y9.391 E0.0915 F1800
-G3 X-53.212 Y9.657 I-0.362 J-0.097 E0.0152 F1800
-G1 X-59.008 Y8.104 E0.2195 F1800
-G2 X-59.202 Y8.828 I-0.097 J0.362 E0.0431 F1800
-G1 X-53.407 Y10.381 E0.2195 F1800
-G3 X-53.141 Y10.840 I-0.097 J0.362 E0.0152 F1800
-G1 X-53.788 Y13.255 E0.0915 F1800
-G3 X-54.248 Y13.520 I-0.362 J-0.097 E0.0152 F1800
-G1 X-60.043 Y11.967 E0.2195 F1800
-G2 X-60.237 Y12.692 I-0.097 J0.362 E0.0431 F1800
-G1 X-54.442 Y14.245 E0.2195 F1800
-G3 X-54.177 Y14.704 I-0.097 J0.362 E0.0152 F1800
-G1 X-54.824 Y17.119 E0.0915 F1800
-G3 X-55.283 Y17.384 I-0.362 J-0.097 E0.0152 F1800
-G1 X-61.079 Y15.831 E0.2195 F1800
-G2 X-61.273 Y16.556 I-0.097 J0.362 E0.0431 F1800
-G1 X-55.477 Y18.108 E0.2195 F1800
-G3 X-55.212 Y18.568 I-0.097 J0.362 E0.0152 F1800
-G1 X-55.859 Y20.983 E0.0915 F1800
-G3 X-56.318 Y21.248 I-0.362 J-0.097 E0.0152 F1800
-G1 X-62.114 Y19.695
+G1 X-44.585 Y-46.111
+G2 X-44.779 Y-45.386 I-0.097 J0.362 E0.0431 F1800
+G1 X-38.983 Y-43.833 E0.2195 F1800
+G3 X-38.718 Y-43.374 I-0.097 J0.362 E0.0152 F1800
+G1 X-39.365 Y-40.959 E0.0915 F1800
+G3 X-39.825 Y-40.694 I-0.362 J-0.097 E0.0152 F1800
+G1 X-45.620 Y-42.247 E0.2195 F1800
+G2 X-45.814 Y-41.522 I-0.097 J0.362 E0.0431 F1800
+G1 X-40.019 Y-39.970 E0.2195 F1800
+G3 X-39.754 Y-39.510 I-0.097 J0.362 E0.0152 F1800
+G1 X-40.401 Y-37.095 E0.0915 F1800
+G3 X-40.860 Y-36.830 I-0.362 J-0.097 E0.0152 F1800
+G1 X-46.655 Y-38.383 E0.2195 F1800
+G2 X-46.850 Y-37.659 I-0.097 J0.362 E0.0431 F1800
+G1 X-41.054 Y-36.106 E0.2195 F1800
+G3 X-40.789 Y-35.647 I-0.097 J0.362 E0.0152 F1800
+G1 X-41.436 Y-33.232 E0.0915 F1800
+G3 X-41.895 Y-32.967 I-0.362 J-0.097 E0.0152 F1800
+G1 X-47.691 Y-34.519 E0.2195 F1800
+G2 X-47.885 Y-33.795 I-0.097 J0.362 E0.0431 F1800
+G1 X-42.089 Y-32.242 E0.2195 F1800
+G3 X-41.824 Y-31.783 I-0.097 J0.362 E0.0152 F1800
+G1 X-42.471 Y-29.368 E0.0915 F1800
+G3 X-42.930 Y-29.103 I-0.362 J-0.097 E0.0152 F1800
+G1 X-48.726 Y-30.656 E0.2195 F1800
+G2 X-48.920 Y-29.931 I-0.097 J0.362 E0.0431 F1800
+G1 X-43.125 Y-28.378 E0.2195 F1800
+G3 X-42.859 Y-27.919 I-0.097 J0.362 E0.0152 F1800
+G1 X-43.506 Y-25.504 E0.0915 F1800
+G3 X-43.966 Y-25.239 I-0.362 J-0.097 E0.0152 F1800
+G1 X-49.761 Y-26.792 E0.2195 F1800
+G2 X-49.955 Y-26.068 I-0.097 J0.362 E0.0431 F1800
+G1 X-44.160 Y-24.515 E0.2195 F1800
+G3 X-43.895 Y-24.055 I-0.097 J0.362 E0.0152 F1800
+G1 X-44.542 Y-21.641 E0.0915 F1800
+G3 X-45.001 Y-21.375 I-0.362 J-0.097 E0.0152 F1800
+G1 X-50.797 Y-22.928 E0.2195 F1800
+G2 X-50.991 Y-22.204 I-0.097 J0.362 E0.0431 F1800
+G1 X-45.195 Y-20.651 E0.2195 F1800
+G3 X-44.930 Y-20.192 I-0.097 J0.362 E0.0152 F1800
+G1 X-45.577 Y-17.777 E0.0915 F1800
+G3 X-46.036 Y-17.512 I-0.362 J-0.097 E0.0152 F1800
+G1 X-51.832 Y-19.065 E0.2195 F1800
+G2 X-52.026 Y-18.340 I-0.097 J0.362 E0.0431 F1800
+G1 X-46.230 Y-16.787 E0.2195 F1800
+G3 X-45.965 Y-16.328 I-0.097 J0.362 E0.0152 F1800
+G1 X-46.612 Y-13.913 E0.0915 F1800
+G3 X-47.072 Y-13.648 I-0.362 J-0.097 E0.0152 F1800
+G1 X-52.867 Y-15.201 E0.2195 F1800
+G2 X-53.061 Y-14.477 I-0.097 J0.362 E0.0431 F1800
+G1 X-47.266 Y-12.924 E0.2195 F1800
+G3 X-47.000 Y-12.464 I-0.097 J0.362 E0.0152 F1800
+G1 X-47.648 Y-10.050 E0.0915 F1800
+G3 X-48.107 Y-9.784 I-0.362 J-0.097 E0.0152 F1800
+G1 X-53.902 Y-11.337 E0.2195 F1800
+G2 X-54.096 Y-10.613 I-0.097 J0.362 E0.0431 F1800
+G1 X-48.301 Y-9.060 E0.2195 F1800
+G3 X-48.036 Y-8.601 I-0.097 J0.362 E0.0152 F1800
+G1 X-48.683 Y-6.186 E0.0915 F1800
+G3 X-49.142 Y-5.921 I-0.362 J-0.097 E0.0152 F1800
+G1 X-54.938 Y-7.474 E0.2195 F1800
+G2 X-55.132 Y-6.749 I-0.097 J0.362 E0.0431 F1800
+G1 X-49.336 Y-5.196 E0.2195 F1800
+G3 X-49.071 Y-4.737 I-0.097 J0.362 E0.0152 F1800
+G1 X-49.718 Y-2.322 E0.0915 F1800
+G3 X-50.177 Y-2.057 I-0.362 J-0.097 E0.0152 F1800
+G1 X-55.973 Y-3.610 E0.2195 F1800
+G2 X-56.167 Y-2.885 I-0.097 J0.362 E0.0431 F1800
+G1 X-50.371 Y-1.333 E0.2195 F1800
+G3 X-50.106 Y-0.873 I-0.097 J0.362 E0.0152 F1800
+G1 X-50.753 Y1.542 E0.0915 F1800
+G3 X-51.213 Y1.807 I-0.362 J-0.097 E0.0152 F1800
+G1 X-57.008 Y0.254 E0.2195 F1800
+G2 X-57.202 Y0.978 I-0.097 J0.362 E0.0431 F1800
+G1 X-51.407 Y2.531 E0.2195 F1800
+G3 X-51.142 Y2.990 I-0.097 J0.362 E0.0152 F1800
+G1 X-51.789 Y5.405 E0.0915 F1800
+G3 X-52.248 Y5.670 I-0.362 J-0.097 E0.0152 F1800
+G1 X-58.043 Y4.118 E0.2195 F1800
+G2 X-58.238 Y4.842 I-0.097 J0.362 E0.0431 F1800
+G1 X-52.442 Y6.395 E0.2195 F1800
+G3 X-52.177 Y6.854 I-0.097 J0.362 E0.0152 F1800
+G1 X-52.824 Y9.269 E0.0915 F1800
+G3 X-53.283 Y9.534 I-0.362 J-0.097 E0.0152 F1800
+G1 X-59.079 Y7.981 E0.2195 F1800
+G2 X-59.273 Y8.706 I-0.097 J0.362 E0.0431 F1800
+G1 X-53.477 Y10.259 E0.2195 F1800
+G3 X-53.212 Y10.718 I-0.097 J0.362 E0.0152 F1800
+G1 X-53.859 Y13.133 E0.0915 F1800
+G3 X-54.318 Y13.398 I-0.362 J-0.097 E0.0152 F1800
+G1 X-60.114 Y11.845 E0.2195 F1800
+G2 X-60.308 Y12.569 I-0.097 J0.362 E0.0431 F1800
+G1 X-54.513 Y14.122 E0.2195 F1800
+G3 X-54.247 Y14.582 I-0.097 J0.362 E0.0152 F1800
+G1 X-54.894 Y16.996 E0.0915 F1800
+G3 X-55.354 Y17.262 I-0.362 J-0.097 E0.0152 F1800
+G1 X-61.149 Y15.709 E0.2195 F1800
+G2 X-61.343 Y16.433 I-0.097 J0.362 E0.0431 F1800
+G1 X-55.548 Y17.986 E0.2195 F1800
+G3 X-55.283 Y18.445 I-0.097 J0.362 E0.0152 F1800
+G1 X-55.930 Y20.860 E0.0915 F1800
+G3 X-56.389 Y21.125 I-0.362 J-0.097 E0.0152 F1800
+G1 X-62.185 Y19.572
 G1 Z0.850 E-5.0000 F4800
-G1 X-54.386 Y21.765
-G1 X-36.269 Y-45.849
+G1 X-54.457 Y21.643
+G1 X-36.340 Y-45.972
 ;print vertical interlocked reference pattern 2
-G1 X-28.093 Y-41.588 F1800
+G1 X-28.164 Y-41.711 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-33.889 Y-43.141
-G2 X-34.083 Y-42.417 I-0.097 J0.362 E0.0431 F1800
-G1 X-28.288 Y-40.864 E0.2195 F1800
-G3 X-28.022 Y-40.404 I-0.097 J0.362 E0.0152 F1800
-G1 X-28.669 Y-37.990 E0.0915 F1800
-G3 X-29.129 Y-37.724 I-0.362 J-0.097 E0.0152 F1800
-G1 X-34.924 Y-39.277 E0.2195 F1800
-G2 X-35.118 Y-38.553 I-0.097 J0.362 E0.0431 F1800
-G1 X-29.323 Y-37.000 E0.2195 F1800
-G3 X-29.058 Y-36.541 I-0.097 J0.362 E0.0152 F1800
-G1 X-29.705 Y-34.126 E0.0915 F1800
-G3 X-30.164 Y-33.861 I-0.362 J-0.097 E0.0152 F1800
-G1 X-35.960 Y-35.414 E0.2195 F1800
-G2 X-36.154 Y-34.689 I-0.097 J0.362 E0.0431 F1800
-G1 X-30.358 Y-33.136 E0.2195 F1800
-G3 X-30.093 Y-32.677 I-0.097 J0.362 E0.0152 F1800
-G1 X-30.740 Y-30.262 E0.0915 F1800
-G3 X-31.199 Y-29.997 I-0.362 J-0.097 E0.0152 F1800
-G1 X-36.995 Y-31.550 E0.2195 F1800
-G2 X-37.189 Y-30.826 I-0.097 J0.362 E0.0431 F1800
-G1 X-31.393 Y-29.273 E0.2195 F1800
-G3 X-31.128 Y-28.813 I-0.097 J0.362 E0.0152 F1800
-G1 X-31.775 Y-26.399 E0.0915 F1800
-G3 X-32.235 Y-26.133 I-0.362 J-0.097 E0.0152 F1800
-G1 X-38.030 Y-27.686 E0.2195 F1800
-G2 X-38.224 Y-26.962 I-0.097 J0.362 E0.0431 F1800
-G1 X-32.429 Y-25.409 E0.2195 F1800
-G3 X-32.163 Y-24.950 I-0.097 J0.362 E0.0152 F1800
-G1 X-32.811 Y-22.535 E0.0915 F1800
-G3 X-33.270 Y-22.270 I-0.362 J-0.097 E0.0152 F1800
-G1 X-39.065 Y-23.823 E0.2195 F1800
-G2 X-39.259 Y-23.098 I-0.097 J0.362 E0.0431 F1800
-G1 X-33.464 Y-21.545 E0.2195 F1800
-G3 X-33.199 Y-21.086 I-0.097 J0.362 E0.0152 F1800
-G1 X-33.846 Y-18.671 E0.0915 F1800
-G3 X-34.305 Y-18.406 I-0.362 J-0.097 E0.0152 F1800
-G1 X-40.101 Y-19.959 E0.2195 F1800
-G2 X-40.295 Y-19.234 I-0.097 J0.362 E0.0431 F1800
-G1 X-34.499 Y-17.682 E0.2195 F1800
-G3 X-34.234 Y-17.222 I-0.097 J0.362 E0.0152 F1800
-G1 X-34.881 Y-14.807 E0.0915 F1800
-G3 X-35.340 Y-14.542 I-0.362 J-0.097 E0.0152 F1800
-G1 X-41.136 Y-16.095 E0.2195 F1800
-G2 X-41.330 Y-15.371 I-0.097 J0.362 E0.0431 F1800
-G1 X-35.534 Y-13.818 E0.2195 F1800
-G3 X-35.269 Y-13.359 I-0.097 J0.362 E0.0152 F1800
-G1 X-35.916 Y-10.944 E0.0915 F1800
-G3 X-36.376 Y-10.679 I-0.362 J-0.097 E0.0152 F1800
-G1 X-42.171 Y-12.231 E0.2195 F1800
-G2 X-42.365 Y-11.507 I-0.097 J0.362 E0.0431 F1800
-G1 X-36.570 Y-9.954 E0.2195 F1800
-G3 X-36.305 Y-9.495 I-0.097 J0.362 E0.0152 F1800
-G1 X-36.952 Y-7.080 E0.0915 F1800
-G3 X-37.411 Y-6.815 I-0.362 J-0.097 E0.0152 F1800
-G1 X-43.206 Y-8.368 E0.2195 F1800
-G2 X-43.401 Y-7.643 I-0.097 J0.362 E0.0431 F1800
-G1 X-37.605 Y-6.090 E0.2195 F1800
-G3 X-37.340 Y-5.631 I-0.097 J0.362 E0.0152 F1800
-G1 X-37.987 Y-3.216 E0.0915 F1800
-G3 X-38.446 Y-2.951 I-0.362 J-0.097 E0.0152 F1800
-G1 X-44.242 Y-4.504 E0.2195 F1800
-G2 X-44.436 Y-3.780 I-0.097 J0.362 E0.0431 F1800
-G1 X-38.640 Y-2.227 E0.2195 F1800
-G3 X-38.375 Y-1.767 I-0.097 J0.362 E0.0152 F1800
-G1 X-39.022 Y0.647 E0.0915 F1800
-G3 X-39.481 Y0.913 I-0.362 J-0.097 E0.0152 F1800
-G1 X-45.277 Y-0.640 E0.2195 F1800
-G2 X-45.471 Y0.084 I-0.097 J0.362 E0.0431 F1800
-G1 X-39.676 Y1.637 E0.2195 F1800
-G3 X-39.410 Y2.096 I-0.097 J0.362 E0.0152 F1800
-G1 X-40.057 Y4.511 E0.0915 F1800
-G3 X-40.517 Y4.776 I-0.362 J-0.097 E0.0152 F1800
-G1 X-46.312 Y3.223 E0.2195 F1800
-G2 X-46.506 Y3.948 I-0.097 J0.362 E0.0431 F1800
-G1 X-40.711 Y5.501 E0.2195 F1800
-G3 X-40.446 Y5.960 I-0.097 J0.362 E0.0152 F1800
-G1 X-41.093 Y8.375 E0.0915 F1800
-G3 X-41.552 Y8.640 I-0.362 J-0.097 E0.0152 F1800
-G1 X-47.348 Y7.087 E0.2195 F1800
-G2 X-47.542 Y7.811 I-0.097 J0.362 E0.0431 F1800
-G1 X-41.746 Y9.364 E0.2195 F1800
-G3 X-41.481 Y9.824 I-0.097 J0.362 E0.0152 F1800
-G1 X-42.128 Y12.238 E0.0915 F1800
-G3 X-42.587 Y12.504 I-0.362 J-0.097 E0.0152 F1800
-G1 X-48.383 Y10.951 E0.2195 F1800
-G2 X-48.577 Y11.675 I-0.097 J0.362 E0.0431 F1800
-G1 X-42.781 Y13.228 E0.2195 F1800
-G3 X-42.516 Y13.687 I-0.097 J0.362 E0.0152 F1800
-G1 X-43.163 Y16.102 E0.0915 F1800
-G3 X-43.623 Y16.367 I-0.362 J-0.097 E0.0152 F1800
-G1 X-49.418 Y14.814 E0.2195 F1800
-G2 X-49.612 Y15.539 I-0.097 J0.362 E0.0431 F1800
-G1 X-43.817 Y17.092 E0.2195 F1800
-G3 X-43.552 Y17.551 I-0.097 J0.362 E0.0152 F1800
-G1 X-44.199 Y19.966 E0.0915 F1800
-G3 X-44.658 Y20.231 I-0.362 J-0.097 E0.0152 F1800
-G1 X-50.453 Y18.678 E0.2195 F1800
-G2 X-50.648 Y19.403 I-0.097 J0.362 E0.0431 F1800
-G1 X-44.852 Y20.955 E0.2195 F1800
-G3 X-44.587 Y21.415 I-0.097 J0.362 E0.0152 F1800
-G1 X-45.234 Y23.830 E0.0915 F1800
-G3 X-45.693 Y24.095 I-0.362 J-0.097 E0.0152 F1800
-G1 X-51.489 Y22.542
+G1 X-33.960 Y-43.264
+G2 X-34.154 Y-42.539 I-0.097 J0.362 E0.0431 F1800
+G1 X-28.358 Y-40.986 E0.2195 F1800
+G3 X-28.093 Y-40.527 I-0.097 J0.362 E0.0152 F1800
+G1 X-28.740 Y-38.112 E0.0915 F1800
+G3 X-29.199 Y-37.847 I-0.362 J-0.097 E0.0152 F1800
+G1 X-34.995 Y-39.400 E0.2195 F1800
+G2 X-35.189 Y-38.675 I-0.097 J0.362 E0.0431 F1800
+G1 X-29.394 Y-37.123 E0.2195 F1800
+G3 X-29.128 Y-36.663 I-0.097 J0.362 E0.0152 F1800
+G1 X-29.775 Y-34.248 E0.0915 F1800
+G3 X-30.235 Y-33.983 I-0.362 J-0.097 E0.0152 F1800
+G1 X-36.030 Y-35.536 E0.2195 F1800
+G2 X-36.224 Y-34.812 I-0.097 J0.362 E0.0431 F1800
+G1 X-30.429 Y-33.259 E0.2195 F1800
+G3 X-30.164 Y-32.800 I-0.097 J0.362 E0.0152 F1800
+G1 X-30.811 Y-30.385 E0.0915 F1800
+G3 X-31.270 Y-30.120 I-0.362 J-0.097 E0.0152 F1800
+G1 X-37.066 Y-31.672 E0.2195 F1800
+G2 X-37.260 Y-30.948 I-0.097 J0.362 E0.0431 F1800
+G1 X-31.464 Y-29.395 E0.2195 F1800
+G3 X-31.199 Y-28.936 I-0.097 J0.362 E0.0152 F1800
+G1 X-31.846 Y-26.521 E0.0915 F1800
+G3 X-32.305 Y-26.256 I-0.362 J-0.097 E0.0152 F1800
+G1 X-38.101 Y-27.809 E0.2195 F1800
+G2 X-38.295 Y-27.084 I-0.097 J0.362 E0.0431 F1800
+G1 X-32.499 Y-25.531 E0.2195 F1800
+G3 X-32.234 Y-25.072 I-0.097 J0.362 E0.0152 F1800
+G1 X-32.881 Y-22.657 E0.0915 F1800
+G3 X-33.341 Y-22.392 I-0.362 J-0.097 E0.0152 F1800
+G1 X-39.136 Y-23.945 E0.2195 F1800
+G2 X-39.330 Y-23.221 I-0.097 J0.362 E0.0431 F1800
+G1 X-33.535 Y-21.668 E0.2195 F1800
+G3 X-33.269 Y-21.208 I-0.097 J0.362 E0.0152 F1800
+G1 X-33.917 Y-18.794 E0.0915 F1800
+G3 X-34.376 Y-18.528 I-0.362 J-0.097 E0.0152 F1800
+G1 X-40.171 Y-20.081 E0.2195 F1800
+G2 X-40.365 Y-19.357 I-0.097 J0.362 E0.0431 F1800
+G1 X-34.570 Y-17.804 E0.2195 F1800
+G3 X-34.305 Y-17.345 I-0.097 J0.362 E0.0152 F1800
+G1 X-34.952 Y-14.930 E0.0915 F1800
+G3 X-35.411 Y-14.665 I-0.362 J-0.097 E0.0152 F1800
+G1 X-41.207 Y-16.218 E0.2195 F1800
+G2 X-41.401 Y-15.493 I-0.097 J0.362 E0.0431 F1800
+G1 X-35.605 Y-13.940 E0.2195 F1800
+G3 X-35.340 Y-13.481 I-0.097 J0.362 E0.0152 F1800
+G1 X-35.987 Y-11.066 E0.0915 F1800
+G3 X-36.446 Y-10.801 I-0.362 J-0.097 E0.0152 F1800
+G1 X-42.242 Y-12.354 E0.2195 F1800
+G2 X-42.436 Y-11.630 I-0.097 J0.362 E0.0431 F1800
+G1 X-36.640 Y-10.077 E0.2195 F1800
+G3 X-36.375 Y-9.617 I-0.097 J0.362 E0.0152 F1800
+G1 X-37.022 Y-7.203 E0.0915 F1800
+G3 X-37.482 Y-6.937 I-0.362 J-0.097 E0.0152 F1800
+G1 X-43.277 Y-8.490 E0.2195 F1800
+G2 X-43.471 Y-7.766 I-0.097 J0.362 E0.0431 F1800
+G1 X-37.676 Y-6.213 E0.2195 F1800
+G3 X-37.411 Y-5.754 I-0.097 J0.362 E0.0152 F1800
+G1 X-38.058 Y-3.339 E0.0915 F1800
+G3 X-38.517 Y-3.074 I-0.362 J-0.097 E0.0152 F1800
+G1 X-44.312 Y-4.627 E0.2195 F1800
+G2 X-44.507 Y-3.902 I-0.097 J0.362 E0.0431 F1800
+G1 X-38.711 Y-2.349 E0.2195 F1800
+G3 X-38.446 Y-1.890 I-0.097 J0.362 E0.0152 F1800
+G1 X-39.093 Y0.525 E0.0915 F1800
+G3 X-39.552 Y0.790 I-0.362 J-0.097 E0.0152 F1800
+G1 X-45.348 Y-0.763 E0.2195 F1800
+G2 X-45.542 Y-0.038 I-0.097 J0.362 E0.0431 F1800
+G1 X-39.746 Y1.515 E0.2195 F1800
+G3 X-39.481 Y1.974 I-0.097 J0.362 E0.0152 F1800
+G1 X-40.128 Y4.389 E0.0915 F1800
+G3 X-40.587 Y4.654 I-0.362 J-0.097 E0.0152 F1800
+G1 X-46.383 Y3.101 E0.2195 F1800
+G2 X-46.577 Y3.825 I-0.097 J0.362 E0.0431 F1800
+G1 X-40.782 Y5.378 E0.2195 F1800
+G3 X-40.516 Y5.837 I-0.097 J0.362 E0.0152 F1800
+G1 X-41.163 Y8.252 E0.0915 F1800
+G3 X-41.623 Y8.517 I-0.362 J-0.097 E0.0152 F1800
+G1 X-47.418 Y6.965 E0.2195 F1800
+G2 X-47.612 Y7.689 I-0.097 J0.362 E0.0431 F1800
+G1 X-41.817 Y9.242 E0.2195 F1800
+G3 X-41.552 Y9.701 I-0.097 J0.362 E0.0152 F1800
+G1 X-42.199 Y12.116 E0.0915 F1800
+G3 X-42.658 Y12.381 I-0.362 J-0.097 E0.0152 F1800
+G1 X-48.454 Y10.828 E0.2195 F1800
+G2 X-48.648 Y11.553 I-0.097 J0.362 E0.0431 F1800
+G1 X-42.852 Y13.106 E0.2195 F1800
+G3 X-42.587 Y13.565 I-0.097 J0.362 E0.0152 F1800
+G1 X-43.234 Y15.980 E0.0915 F1800
+G3 X-43.693 Y16.245 I-0.362 J-0.097 E0.0152 F1800
+G1 X-49.489 Y14.692 E0.2195 F1800
+G2 X-49.683 Y15.416 I-0.097 J0.362 E0.0431 F1800
+G1 X-43.887 Y16.969 E0.2195 F1800
+G3 X-43.622 Y17.429 I-0.097 J0.362 E0.0152 F1800
+G1 X-44.269 Y19.843 E0.0915 F1800
+G3 X-44.729 Y20.109 I-0.362 J-0.097 E0.0152 F1800
+G1 X-50.524 Y18.556 E0.2195 F1800
+G2 X-50.718 Y19.280 I-0.097 J0.362 E0.0431 F1800
+G1 X-44.923 Y20.833 E0.2195 F1800
+G3 X-44.658 Y21.292 I-0.097 J0.362 E0.0152 F1800
+G1 X-45.305 Y23.707 E0.0915 F1800
+G3 X-45.764 Y23.972 I-0.362 J-0.097 E0.0152 F1800
+G1 X-51.559 Y22.419
 G1 Z0.850 E-5.0000 F4800
-G1 X-43.761 Y24.612
-G1 X-25.644 Y-43.002
-G1 X-17.468 Y-38.741 F1800
+G1 X-43.832 Y24.490
+G1 X-25.715 Y-43.125
+G1 X-17.539 Y-38.864 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-23.264 Y-40.294
-G2 X-23.458 Y-39.570 I-0.097 J0.362 E0.0431 F1800
-G1 X-17.662 Y-38.017 E0.2195 F1800
-G3 X-17.397 Y-37.557 I-0.097 J0.362 E0.0152 F1800
-G1 X-18.044 Y-35.143 E0.0915 F1800
-G3 X-18.504 Y-34.877 I-0.362 J-0.097 E0.0152 F1800
-G1 X-24.299 Y-36.430 E0.2195 F1800
-G2 X-24.493 Y-35.706 I-0.097 J0.362 E0.0431 F1800
-G1 X-18.698 Y-34.153 E0.2195 F1800
-G3 X-18.432 Y-33.694 I-0.097 J0.362 E0.0152 F1800
-G1 X-19.080 Y-31.279 E0.0915 F1800
-G3 X-19.539 Y-31.014 I-0.362 J-0.097 E0.0152 F1800
-G1 X-25.334 Y-32.567 E0.2195 F1800
-G2 X-25.528 Y-31.842 I-0.097 J0.362 E0.0431 F1800
-G1 X-19.733 Y-30.289 E0.2195 F1800
-G3 X-19.468 Y-29.830 I-0.097 J0.362 E0.0152 F1800
-G1 X-20.115 Y-27.415 E0.0915 F1800
-G3 X-20.574 Y-27.150 I-0.362 J-0.097 E0.0152 F1800
-G1 X-26.370 Y-28.703 E0.2195 F1800
-G2 X-26.564 Y-27.979 I-0.097 J0.362 E0.0431 F1800
-G1 X-20.768 Y-26.426 E0.2195 F1800
-G3 X-20.503 Y-25.966 I-0.097 J0.362 E0.0152 F1800
-G1 X-21.150 Y-23.552 E0.0915 F1800
-G3 X-21.609 Y-23.286 I-0.362 J-0.097 E0.0152 F1800
-G1 X-27.405 Y-24.839 E0.2195 F1800
-G2 X-27.599 Y-24.115 I-0.097 J0.362 E0.0431 F1800
-G1 X-21.803 Y-22.562 E0.2195 F1800
-G3 X-21.538 Y-22.103 I-0.097 J0.362 E0.0152 F1800
-G1 X-22.185 Y-19.688 E0.0915 F1800
-G3 X-22.645 Y-19.423 I-0.362 J-0.097 E0.0152 F1800
-G1 X-28.440 Y-20.976 E0.2195 F1800
-G2 X-28.634 Y-20.251 I-0.097 J0.362 E0.0431 F1800
-G1 X-22.839 Y-18.698 E0.2195 F1800
-G3 X-22.574 Y-18.239 I-0.097 J0.362 E0.0152 F1800
-G1 X-23.221 Y-15.824 E0.0915 F1800
-G3 X-23.680 Y-15.559 I-0.362 J-0.097 E0.0152 F1800
-G1 X-29.475 Y-17.112 E0.2195 F1800
-G2 X-29.670 Y-16.387 I-0.097 J0.362 E0.0431 F1800
-G1 X-23.874 Y-14.835 E0.2195 F1800
-G3 X-23.609 Y-14.375 I-0.097 J0.362 E0.0152 F1800
-G1 X-24.256 Y-11.960 E0.0915 F1800
-G3 X-24.715 Y-11.695 I-0.362 J-0.097 E0.0152 F1800
-G1 X-30.511 Y-13.248 E0.2195 F1800
-G2 X-30.705 Y-12.524 I-0.097 J0.362 E0.0431 F1800
-G1 X-24.909 Y-10.971 E0.2195 F1800
-G3 X-24.644 Y-10.512 I-0.097 J0.362 E0.0152 F1800
-G1 X-25.291 Y-8.097 E0.0915 F1800
-G3 X-25.750 Y-7.832 I-0.362 J-0.097 E0.0152 F1800
-G1 X-31.546 Y-9.384 E0.2195 F1800
-G2 X-31.740 Y-8.660 I-0.097 J0.362 E0.0431 F1800
-G1 X-25.945 Y-7.107 E0.2195 F1800
-G3 X-25.679 Y-6.648 I-0.097 J0.362 E0.0152 F1800
-G1 X-26.326 Y-4.233 E0.0915 F1800
-G3 X-26.786 Y-3.968 I-0.362 J-0.097 E0.0152 F1800
-G1 X-32.581 Y-5.521 E0.2195 F1800
-G2 X-32.775 Y-4.796 I-0.097 J0.362 E0.0431 F1800
-G1 X-26.980 Y-3.243 E0.2195 F1800
-G3 X-26.715 Y-2.784 I-0.097 J0.362 E0.0152 F1800
-G1 X-27.362 Y-0.369 E0.0915 F1800
-G3 X-27.821 Y-0.104 I-0.362 J-0.097 E0.0152 F1800
-G1 X-33.617 Y-1.657 E0.2195 F1800
-G2 X-33.811 Y-0.933 I-0.097 J0.362 E0.0431 F1800
-G1 X-28.015 Y0.620 E0.2195 F1800
-G3 X-27.750 Y1.080 I-0.097 J0.362 E0.0152 F1800
-G1 X-28.397 Y3.494 E0.0915 F1800
-G3 X-28.856 Y3.760 I-0.362 J-0.097 E0.0152 F1800
-G1 X-34.652 Y2.207 E0.2195 F1800
-G2 X-34.846 Y2.931 I-0.097 J0.362 E0.0431 F1800
-G1 X-29.050 Y4.484 E0.2195 F1800
-G3 X-28.785 Y4.943 I-0.097 J0.362 E0.0152 F1800
-G1 X-29.432 Y7.358 E0.0915 F1800
-G3 X-29.892 Y7.623 I-0.362 J-0.097 E0.0152 F1800
-G1 X-35.687 Y6.070 E0.2195 F1800
-G2 X-35.881 Y6.795 I-0.097 J0.362 E0.0431 F1800
-G1 X-30.086 Y8.348 E0.2195 F1800
-G3 X-29.821 Y8.807 I-0.097 J0.362 E0.0152 F1800
-G1 X-30.468 Y11.222 E0.0915 F1800
-G3 X-30.927 Y11.487 I-0.362 J-0.097 E0.0152 F1800
-G1 X-36.722 Y9.934 E0.2195 F1800
-G2 X-36.917 Y10.658 I-0.097 J0.362 E0.0431 F1800
-G1 X-31.121 Y12.211 E0.2195 F1800
-G3 X-30.856 Y12.671 I-0.097 J0.362 E0.0152 F1800
-G1 X-31.503 Y15.085 E0.0915 F1800
-G3 X-31.962 Y15.351 I-0.362 J-0.097 E0.0152 F1800
-G1 X-37.758 Y13.798 E0.2195 F1800
-G2 X-37.952 Y14.522 I-0.097 J0.362 E0.0431 F1800
-G1 X-32.156 Y16.075 E0.2195 F1800
-G3 X-31.891 Y16.534 I-0.097 J0.362 E0.0152 F1800
-G1 X-32.538 Y18.949 E0.0915 F1800
-G3 X-32.997 Y19.214 I-0.362 J-0.097 E0.0152 F1800
-G1 X-38.793 Y17.661 E0.2195 F1800
-G2 X-38.987 Y18.386 I-0.097 J0.362 E0.0431 F1800
-G1 X-33.192 Y19.939 E0.2195 F1800
-G3 X-32.926 Y20.398 I-0.097 J0.362 E0.0152 F1800
-G1 X-33.573 Y22.813 E0.0915 F1800
-G3 X-34.033 Y23.078 I-0.362 J-0.097 E0.0152 F1800
-G1 X-39.828 Y21.525 E0.2195 F1800
-G2 X-40.022 Y22.250 I-0.097 J0.362 E0.0431 F1800
-G1 X-34.227 Y23.803 E0.2195 F1800
-G3 X-33.962 Y24.262 I-0.097 J0.362 E0.0152 F1800
-G1 X-34.609 Y26.677 E0.0915 F1800
-G3 X-35.068 Y26.942 I-0.362 J-0.097 E0.0152 F1800
-G1 X-40.864 Y25.389
+G1 X-23.335 Y-40.417
+G2 X-23.529 Y-39.692 I-0.097 J0.362 E0.0431 F1800
+G1 X-17.733 Y-38.139 E0.2195 F1800
+G3 X-17.468 Y-37.680 I-0.097 J0.362 E0.0152 F1800
+G1 X-18.115 Y-35.265 E0.0915 F1800
+G3 X-18.574 Y-35.000 I-0.362 J-0.097 E0.0152 F1800
+G1 X-24.370 Y-36.553 E0.2195 F1800
+G2 X-24.564 Y-35.828 I-0.097 J0.362 E0.0431 F1800
+G1 X-18.768 Y-34.276 E0.2195 F1800
+G3 X-18.503 Y-33.816 I-0.097 J0.362 E0.0152 F1800
+G1 X-19.150 Y-31.401 E0.0915 F1800
+G3 X-19.610 Y-31.136 I-0.362 J-0.097 E0.0152 F1800
+G1 X-25.405 Y-32.689 E0.2195 F1800
+G2 X-25.599 Y-31.965 I-0.097 J0.362 E0.0431 F1800
+G1 X-19.804 Y-30.412 E0.2195 F1800
+G3 X-19.538 Y-29.953 I-0.097 J0.362 E0.0152 F1800
+G1 X-20.186 Y-27.538 E0.0915 F1800
+G3 X-20.645 Y-27.273 I-0.362 J-0.097 E0.0152 F1800
+G1 X-26.440 Y-28.825 E0.2195 F1800
+G2 X-26.634 Y-28.101 I-0.097 J0.362 E0.0431 F1800
+G1 X-20.839 Y-26.548 E0.2195 F1800
+G3 X-20.574 Y-26.089 I-0.097 J0.362 E0.0152 F1800
+G1 X-21.221 Y-23.674 E0.0915 F1800
+G3 X-21.680 Y-23.409 I-0.362 J-0.097 E0.0152 F1800
+G1 X-27.476 Y-24.962 E0.2195 F1800
+G2 X-27.670 Y-24.237 I-0.097 J0.362 E0.0431 F1800
+G1 X-21.874 Y-22.684 E0.2195 F1800
+G3 X-21.609 Y-22.225 I-0.097 J0.362 E0.0152 F1800
+G1 X-22.256 Y-19.810 E0.0915 F1800
+G3 X-22.715 Y-19.545 I-0.362 J-0.097 E0.0152 F1800
+G1 X-28.511 Y-21.098 E0.2195 F1800
+G2 X-28.705 Y-20.374 I-0.097 J0.362 E0.0431 F1800
+G1 X-22.909 Y-18.821 E0.2195 F1800
+G3 X-22.644 Y-18.361 I-0.097 J0.362 E0.0152 F1800
+G1 X-23.291 Y-15.947 E0.0915 F1800
+G3 X-23.751 Y-15.681 I-0.362 J-0.097 E0.0152 F1800
+G1 X-29.546 Y-17.234 E0.2195 F1800
+G2 X-29.740 Y-16.510 I-0.097 J0.362 E0.0431 F1800
+G1 X-23.945 Y-14.957 E0.2195 F1800
+G3 X-23.680 Y-14.498 I-0.097 J0.362 E0.0152 F1800
+G1 X-24.327 Y-12.083 E0.0915 F1800
+G3 X-24.786 Y-11.818 I-0.362 J-0.097 E0.0152 F1800
+G1 X-30.581 Y-13.371 E0.2195 F1800
+G2 X-30.776 Y-12.646 I-0.097 J0.362 E0.0431 F1800
+G1 X-24.980 Y-11.093 E0.2195 F1800
+G3 X-24.715 Y-10.634 I-0.097 J0.362 E0.0152 F1800
+G1 X-25.362 Y-8.219 E0.0915 F1800
+G3 X-25.821 Y-7.954 I-0.362 J-0.097 E0.0152 F1800
+G1 X-31.617 Y-9.507 E0.2195 F1800
+G2 X-31.811 Y-8.783 I-0.097 J0.362 E0.0431 F1800
+G1 X-26.015 Y-7.230 E0.2195 F1800
+G3 X-25.750 Y-6.770 I-0.097 J0.362 E0.0152 F1800
+G1 X-26.397 Y-4.356 E0.0915 F1800
+G3 X-26.856 Y-4.090 I-0.362 J-0.097 E0.0152 F1800
+G1 X-32.652 Y-5.643 E0.2195 F1800
+G2 X-32.846 Y-4.919 I-0.097 J0.362 E0.0431 F1800
+G1 X-27.051 Y-3.366 E0.2195 F1800
+G3 X-26.785 Y-2.907 I-0.097 J0.362 E0.0152 F1800
+G1 X-27.432 Y-0.492 E0.0915 F1800
+G3 X-27.892 Y-0.227 I-0.362 J-0.097 E0.0152 F1800
+G1 X-33.687 Y-1.780 E0.2195 F1800
+G2 X-33.881 Y-1.055 I-0.097 J0.362 E0.0431 F1800
+G1 X-28.086 Y0.498 E0.2195 F1800
+G3 X-27.821 Y0.957 I-0.097 J0.362 E0.0152 F1800
+G1 X-28.468 Y3.372 E0.0915 F1800
+G3 X-28.927 Y3.637 I-0.362 J-0.097 E0.0152 F1800
+G1 X-34.723 Y2.084 E0.2195 F1800
+G2 X-34.917 Y2.809 I-0.097 J0.362 E0.0431 F1800
+G1 X-29.121 Y4.362 E0.2195 F1800
+G3 X-28.856 Y4.821 I-0.097 J0.362 E0.0152 F1800
+G1 X-29.503 Y7.236 E0.0915 F1800
+G3 X-29.962 Y7.501 I-0.362 J-0.097 E0.0152 F1800
+G1 X-35.758 Y5.948 E0.2195 F1800
+G2 X-35.952 Y6.672 I-0.097 J0.362 E0.0431 F1800
+G1 X-30.156 Y8.225 E0.2195 F1800
+G3 X-29.891 Y8.684 I-0.097 J0.362 E0.0152 F1800
+G1 X-30.538 Y11.099 E0.0915 F1800
+G3 X-30.998 Y11.364 I-0.362 J-0.097 E0.0152 F1800
+G1 X-36.793 Y9.812 E0.2195 F1800
+G2 X-36.987 Y10.536 I-0.097 J0.362 E0.0431 F1800
+G1 X-31.192 Y12.089 E0.2195 F1800
+G3 X-30.927 Y12.548 I-0.097 J0.362 E0.0152 F1800
+G1 X-31.574 Y14.963 E0.0915 F1800
+G3 X-32.033 Y15.228 I-0.362 J-0.097 E0.0152 F1800
+G1 X-37.828 Y13.675 E0.2195 F1800
+G2 X-38.023 Y14.400 I-0.097 J0.362 E0.0431 F1800
+G1 X-32.227 Y15.953 E0.2195 F1800
+G3 X-31.962 Y16.412 I-0.097 J0.362 E0.0152 F1800
+G1 X-32.609 Y18.827 E0.0915 F1800
+G3 X-33.068 Y19.092 I-0.362 J-0.097 E0.0152 F1800
+G1 X-38.864 Y17.539 E0.2195 F1800
+G2 X-39.058 Y18.263 I-0.097 J0.362 E0.0431 F1800
+G1 X-33.262 Y19.816 E0.2195 F1800
+G3 X-32.997 Y20.276 I-0.097 J0.362 E0.0152 F1800
+G1 X-33.644 Y22.690 E0.0915 F1800
+G3 X-34.103 Y22.956 I-0.362 J-0.097 E0.0152 F1800
+G1 X-39.899 Y21.403 E0.2195 F1800
+G2 X-40.093 Y22.127 I-0.097 J0.362 E0.0431 F1800
+G1 X-34.298 Y23.680 E0.2195 F1800
+G3 X-34.032 Y24.139 I-0.097 J0.362 E0.0152 F1800
+G1 X-34.679 Y26.554 E0.0915 F1800
+G3 X-35.139 Y26.819 I-0.362 J-0.097 E0.0152 F1800
+G1 X-40.934 Y25.266
 G1 Z0.850 E-5.0000 F4800
-G1 X-33.136 Y27.459
-G1 X-15.019 Y-40.155
+G1 X-33.207 Y27.337
+G1 X-15.089 Y-40.278
 ;print vertical interlocked reference pattern 3
-G1 X-6.843 Y-35.894 F1800
+G1 X-6.914 Y-36.017 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-12.639 Y-37.447
-G2 X-12.833 Y-36.723 I-0.097 J0.362 E0.0431 F1800
-G1 X-7.037 Y-35.170 E0.2195 F1800
-G3 X-6.772 Y-34.710 I-0.097 J0.362 E0.0152 F1800
-G1 X-7.419 Y-32.296 E0.0915 F1800
-G3 X-7.878 Y-32.030 I-0.362 J-0.097 E0.0152 F1800
-G1 X-13.674 Y-33.583 E0.2195 F1800
-G2 X-13.868 Y-32.859 I-0.097 J0.362 E0.0431 F1800
-G1 X-8.072 Y-31.306 E0.2195 F1800
-G3 X-7.807 Y-30.847 I-0.097 J0.362 E0.0152 F1800
-G1 X-8.454 Y-28.432 E0.0915 F1800
-G3 X-8.914 Y-28.167 I-0.362 J-0.097 E0.0152 F1800
-G1 X-14.709 Y-29.720 E0.2195 F1800
-G2 X-14.903 Y-28.995 I-0.097 J0.362 E0.0431 F1800
-G1 X-9.108 Y-27.442 E0.2195 F1800
-G3 X-8.843 Y-26.983 I-0.097 J0.362 E0.0152 F1800
-G1 X-9.490 Y-24.568 E0.0915 F1800
-G3 X-9.949 Y-24.303 I-0.362 J-0.097 E0.0152 F1800
-G1 X-15.744 Y-25.856 E0.2195 F1800
-G2 X-15.939 Y-25.132 I-0.097 J0.362 E0.0431 F1800
-G1 X-10.143 Y-23.579 E0.2195 F1800
-G3 X-9.878 Y-23.119 I-0.097 J0.362 E0.0152 F1800
-G1 X-10.525 Y-20.705 E0.0915 F1800
-G3 X-10.984 Y-20.439 I-0.362 J-0.097 E0.0152 F1800
-G1 X-16.780 Y-21.992 E0.2195 F1800
-G2 X-16.974 Y-21.268 I-0.097 J0.362 E0.0431 F1800
-G1 X-11.178 Y-19.715 E0.2195 F1800
-G3 X-10.913 Y-19.256 I-0.097 J0.362 E0.0152 F1800
-G1 X-11.560 Y-16.841 E0.0915 F1800
-G3 X-12.019 Y-16.576 I-0.362 J-0.097 E0.0152 F1800
-G1 X-17.815 Y-18.129 E0.2195 F1800
-G2 X-18.009 Y-17.404 I-0.097 J0.362 E0.0431 F1800
-G1 X-12.214 Y-15.851 E0.2195 F1800
-G3 X-11.948 Y-15.392 I-0.097 J0.362 E0.0152 F1800
-G1 X-12.595 Y-12.977 E0.0915 F1800
-G3 X-13.055 Y-12.712 I-0.362 J-0.097 E0.0152 F1800
-G1 X-18.850 Y-14.265 E0.2195 F1800
-G2 X-19.044 Y-13.540 I-0.097 J0.362 E0.0431 F1800
-G1 X-13.249 Y-11.988 E0.2195 F1800
-G3 X-12.984 Y-11.528 I-0.097 J0.362 E0.0152 F1800
-G1 X-13.631 Y-9.113 E0.0915 F1800
-G3 X-14.090 Y-8.848 I-0.362 J-0.097 E0.0152 F1800
-G1 X-19.886 Y-10.401 E0.2195 F1800
-G2 X-20.080 Y-9.677 I-0.097 J0.362 E0.0431 F1800
-G1 X-14.284 Y-8.124 E0.2195 F1800
-G3 X-14.019 Y-7.665 I-0.097 J0.362 E0.0152 F1800
-G1 X-14.666 Y-5.250 E0.0915 F1800
-G3 X-15.125 Y-4.985 I-0.362 J-0.097 E0.0152 F1800
-G1 X-20.921 Y-6.537 E0.2195 F1800
-G2 X-21.115 Y-5.813 I-0.097 J0.362 E0.0431 F1800
-G1 X-15.319 Y-4.260 E0.2195 F1800
-G3 X-15.054 Y-3.801 I-0.097 J0.362 E0.0152 F1800
-G1 X-15.701 Y-1.386 E0.0915 F1800
-G3 X-16.161 Y-1.121 I-0.362 J-0.097 E0.0152 F1800
-G1 X-21.956 Y-2.674 E0.2195 F1800
-G2 X-22.150 Y-1.949 I-0.097 J0.362 E0.0431 F1800
-G1 X-16.355 Y-0.396 E0.2195 F1800
-G3 X-16.090 Y0.063 I-0.097 J0.362 E0.0152 F1800
-G1 X-16.737 Y2.478 E0.0915 F1800
-G3 X-17.196 Y2.743 I-0.362 J-0.097 E0.0152 F1800
-G1 X-22.991 Y1.190 E0.2195 F1800
-G2 X-23.186 Y1.914 I-0.097 J0.362 E0.0431 F1800
-G1 X-17.390 Y3.467 E0.2195 F1800
-G3 X-17.125 Y3.927 I-0.097 J0.362 E0.0152 F1800
-G1 X-17.772 Y6.341 E0.0915 F1800
-G3 X-18.231 Y6.607 I-0.362 J-0.097 E0.0152 F1800
-G1 X-24.027 Y5.054 E0.2195 F1800
-G2 X-24.221 Y5.778 I-0.097 J0.362 E0.0431 F1800
-G1 X-18.425 Y7.331 E0.2195 F1800
-G3 X-18.160 Y7.790 I-0.097 J0.362 E0.0152 F1800
-G1 X-18.807 Y10.205 E0.0915 F1800
-G3 X-19.266 Y10.470 I-0.362 J-0.097 E0.0152 F1800
-G1 X-25.062 Y8.917 E0.2195 F1800
-G2 X-25.256 Y9.642 I-0.097 J0.362 E0.0431 F1800
-G1 X-19.461 Y11.195 E0.2195 F1800
-G3 X-19.195 Y11.654 I-0.097 J0.362 E0.0152 F1800
-G1 X-19.842 Y14.069 E0.0915 F1800
-G3 X-20.302 Y14.334 I-0.362 J-0.097 E0.0152 F1800
-G1 X-26.097 Y12.781 E0.2195 F1800
-G2 X-26.291 Y13.505 I-0.097 J0.362 E0.0431 F1800
-G1 X-20.496 Y15.058 E0.2195 F1800
-G3 X-20.231 Y15.518 I-0.097 J0.362 E0.0152 F1800
-G1 X-20.878 Y17.932 E0.0915 F1800
-G3 X-21.337 Y18.198 I-0.362 J-0.097 E0.0152 F1800
-G1 X-27.132 Y16.645 E0.2195 F1800
-G2 X-27.327 Y17.369 I-0.097 J0.362 E0.0431 F1800
-G1 X-21.531 Y18.922 E0.2195 F1800
-G3 X-21.266 Y19.381 I-0.097 J0.362 E0.0152 F1800
-G1 X-21.913 Y21.796 E0.0915 F1800
-G3 X-22.372 Y22.061 I-0.362 J-0.097 E0.0152 F1800
-G1 X-28.168 Y20.508 E0.2195 F1800
-G2 X-28.362 Y21.233 I-0.097 J0.362 E0.0431 F1800
-G1 X-22.566 Y22.786 E0.2195 F1800
-G3 X-22.301 Y23.245 I-0.097 J0.362 E0.0152 F1800
-G1 X-22.948 Y25.660 E0.0915 F1800
-G3 X-23.407 Y25.925 I-0.362 J-0.097 E0.0152 F1800
-G1 X-29.203 Y24.372 E0.2195 F1800
-G2 X-29.397 Y25.097 I-0.097 J0.362 E0.0431 F1800
-G1 X-23.602 Y26.650 E0.2195 F1800
-G3 X-23.336 Y27.109 I-0.097 J0.362 E0.0152 F1800
-G1 X-23.983 Y29.524 E0.0915 F1800
-G3 X-24.443 Y29.789 I-0.362 J-0.097 E0.0152 F1800
-G1 X-30.238 Y28.236
+G1 X-12.709 Y-37.570
+G2 X-12.903 Y-36.845 I-0.097 J0.362 E0.0431 F1800
+G1 X-7.108 Y-35.292 E0.2195 F1800
+G3 X-6.843 Y-34.833 I-0.097 J0.362 E0.0152 F1800
+G1 X-7.490 Y-32.418 E0.0915 F1800
+G3 X-7.949 Y-32.153 I-0.362 J-0.097 E0.0152 F1800
+G1 X-13.745 Y-33.706 E0.2195 F1800
+G2 X-13.939 Y-32.981 I-0.097 J0.362 E0.0431 F1800
+G1 X-8.143 Y-31.429 E0.2195 F1800
+G3 X-7.878 Y-30.969 I-0.097 J0.362 E0.0152 F1800
+G1 X-8.525 Y-28.554 E0.0915 F1800
+G3 X-8.984 Y-28.289 I-0.362 J-0.097 E0.0152 F1800
+G1 X-14.780 Y-29.842 E0.2195 F1800
+G2 X-14.974 Y-29.118 I-0.097 J0.362 E0.0431 F1800
+G1 X-9.178 Y-27.565 E0.2195 F1800
+G3 X-8.913 Y-27.106 I-0.097 J0.362 E0.0152 F1800
+G1 X-9.560 Y-24.691 E0.0915 F1800
+G3 X-10.020 Y-24.426 I-0.362 J-0.097 E0.0152 F1800
+G1 X-15.815 Y-25.978 E0.2195 F1800
+G2 X-16.009 Y-25.254 I-0.097 J0.362 E0.0431 F1800
+G1 X-10.214 Y-23.701 E0.2195 F1800
+G3 X-9.949 Y-23.242 I-0.097 J0.362 E0.0152 F1800
+G1 X-10.596 Y-20.827 E0.0915 F1800
+G3 X-11.055 Y-20.562 I-0.362 J-0.097 E0.0152 F1800
+G1 X-16.850 Y-22.115 E0.2195 F1800
+G2 X-17.045 Y-21.390 I-0.097 J0.362 E0.0431 F1800
+G1 X-11.249 Y-19.837 E0.2195 F1800
+G3 X-10.984 Y-19.378 I-0.097 J0.362 E0.0152 F1800
+G1 X-11.631 Y-16.963 E0.0915 F1800
+G3 X-12.090 Y-16.698 I-0.362 J-0.097 E0.0152 F1800
+G1 X-17.886 Y-18.251 E0.2195 F1800
+G2 X-18.080 Y-17.527 I-0.097 J0.362 E0.0431 F1800
+G1 X-12.284 Y-15.974 E0.2195 F1800
+G3 X-12.019 Y-15.514 I-0.097 J0.362 E0.0152 F1800
+G1 X-12.666 Y-13.100 E0.0915 F1800
+G3 X-13.125 Y-12.834 I-0.362 J-0.097 E0.0152 F1800
+G1 X-18.921 Y-14.387 E0.2195 F1800
+G2 X-19.115 Y-13.663 I-0.097 J0.362 E0.0431 F1800
+G1 X-13.320 Y-12.110 E0.2195 F1800
+G3 X-13.054 Y-11.651 I-0.097 J0.362 E0.0152 F1800
+G1 X-13.701 Y-9.236 E0.0915 F1800
+G3 X-14.161 Y-8.971 I-0.362 J-0.097 E0.0152 F1800
+G1 X-19.956 Y-10.524 E0.2195 F1800
+G2 X-20.150 Y-9.799 I-0.097 J0.362 E0.0431 F1800
+G1 X-14.355 Y-8.246 E0.2195 F1800
+G3 X-14.090 Y-7.787 I-0.097 J0.362 E0.0152 F1800
+G1 X-14.737 Y-5.372 E0.0915 F1800
+G3 X-15.196 Y-5.107 I-0.362 J-0.097 E0.0152 F1800
+G1 X-20.992 Y-6.660 E0.2195 F1800
+G2 X-21.186 Y-5.936 I-0.097 J0.362 E0.0431 F1800
+G1 X-15.390 Y-4.383 E0.2195 F1800
+G3 X-15.125 Y-3.923 I-0.097 J0.362 E0.0152 F1800
+G1 X-15.772 Y-1.508 E0.0915 F1800
+G3 X-16.231 Y-1.243 I-0.362 J-0.097 E0.0152 F1800
+G1 X-22.027 Y-2.796 E0.2195 F1800
+G2 X-22.221 Y-2.072 I-0.097 J0.362 E0.0431 F1800
+G1 X-16.425 Y-0.519 E0.2195 F1800
+G3 X-16.160 Y-0.060 I-0.097 J0.362 E0.0152 F1800
+G1 X-16.807 Y2.355 E0.0915 F1800
+G3 X-17.267 Y2.620 I-0.362 J-0.097 E0.0152 F1800
+G1 X-23.062 Y1.067 E0.2195 F1800
+G2 X-23.256 Y1.792 I-0.097 J0.362 E0.0431 F1800
+G1 X-17.461 Y3.345 E0.2195 F1800
+G3 X-17.195 Y3.804 I-0.097 J0.362 E0.0152 F1800
+G1 X-17.843 Y6.219 E0.0915 F1800
+G3 X-18.302 Y6.484 I-0.362 J-0.097 E0.0152 F1800
+G1 X-24.097 Y4.931 E0.2195 F1800
+G2 X-24.291 Y5.656 I-0.097 J0.362 E0.0431 F1800
+G1 X-18.496 Y7.209 E0.2195 F1800
+G3 X-18.231 Y7.668 I-0.097 J0.362 E0.0152 F1800
+G1 X-18.878 Y10.083 E0.0915 F1800
+G3 X-19.337 Y10.348 I-0.362 J-0.097 E0.0152 F1800
+G1 X-25.133 Y8.795 E0.2195 F1800
+G2 X-25.327 Y9.519 I-0.097 J0.362 E0.0431 F1800
+G1 X-19.531 Y11.072 E0.2195 F1800
+G3 X-19.266 Y11.532 I-0.097 J0.362 E0.0152 F1800
+G1 X-19.913 Y13.946 E0.0915 F1800
+G3 X-20.372 Y14.211 I-0.362 J-0.097 E0.0152 F1800
+G1 X-26.168 Y12.659 E0.2195 F1800
+G2 X-26.362 Y13.383 I-0.097 J0.362 E0.0431 F1800
+G1 X-20.566 Y14.936 E0.2195 F1800
+G3 X-20.301 Y15.395 I-0.097 J0.362 E0.0152 F1800
+G1 X-20.948 Y17.810 E0.0915 F1800
+G3 X-21.408 Y18.075 I-0.362 J-0.097 E0.0152 F1800
+G1 X-27.203 Y16.522 E0.2195 F1800
+G2 X-27.397 Y17.247 I-0.097 J0.362 E0.0431 F1800
+G1 X-21.602 Y18.800 E0.2195 F1800
+G3 X-21.337 Y19.259 I-0.097 J0.362 E0.0152 F1800
+G1 X-21.984 Y21.674 E0.0915 F1800
+G3 X-22.443 Y21.939 I-0.362 J-0.097 E0.0152 F1800
+G1 X-28.238 Y20.386 E0.2195 F1800
+G2 X-28.433 Y21.110 I-0.097 J0.362 E0.0431 F1800
+G1 X-22.637 Y22.663 E0.2195 F1800
+G3 X-22.372 Y23.123 I-0.097 J0.362 E0.0152 F1800
+G1 X-23.019 Y25.537 E0.0915 F1800
+G3 X-23.478 Y25.803 I-0.362 J-0.097 E0.0152 F1800
+G1 X-29.274 Y24.250 E0.2195 F1800
+G2 X-29.468 Y24.974 I-0.097 J0.362 E0.0431 F1800
+G1 X-23.672 Y26.527 E0.2195 F1800
+G3 X-23.407 Y26.986 I-0.097 J0.362 E0.0152 F1800
+G1 X-24.054 Y29.401 E0.0915 F1800
+G3 X-24.513 Y29.666 I-0.362 J-0.097 E0.0152 F1800
+G1 X-30.309 Y28.113
 G1 Z0.850 E-5.0000 F4800
-G1 X-22.511 Y30.306
-G1 X-4.394 Y-37.308
-G1 X3.782 Y-33.047 F1800
+G1 X-22.582 Y30.184
+G1 X-4.464 Y-37.431
+G1 X3.711 Y-33.170 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-2.013 Y-34.600
-G2 X-2.208 Y-33.876 I-0.097 J0.362 E0.0431 F1800
-G1 X3.588 Y-32.323 E0.2195 F1800
-G3 X3.853 Y-31.863 I-0.097 J0.362 E0.0152 F1800
-G1 X3.206 Y-29.449 E0.0915 F1800
-G3 X2.747 Y-29.183 I-0.362 J-0.097 E0.0152 F1800
-G1 X-3.049 Y-30.736 E0.2195 F1800
-G2 X-3.243 Y-30.012 I-0.097 J0.362 E0.0431 F1800
-G1 X2.553 Y-28.459 E0.2195 F1800
-G3 X2.818 Y-28.000 I-0.097 J0.362 E0.0152 F1800
-G1 X2.171 Y-25.585 E0.0915 F1800
-G3 X1.712 Y-25.320 I-0.362 J-0.097 E0.0152 F1800
-G1 X-4.084 Y-26.873 E0.2195 F1800
-G2 X-4.278 Y-26.148 I-0.097 J0.362 E0.0431 F1800
-G1 X1.517 Y-24.595 E0.2195 F1800
-G3 X1.783 Y-24.136 I-0.097 J0.362 E0.0152 F1800
-G1 X1.136 Y-21.721 E0.0915 F1800
-G3 X0.676 Y-21.456 I-0.362 J-0.097 E0.0152 F1800
-G1 X-5.119 Y-23.009 E0.2195 F1800
-G2 X-5.313 Y-22.285 I-0.097 J0.362 E0.0431 F1800
-G1 X0.482 Y-20.732 E0.2195 F1800
-G3 X0.747 Y-20.272 I-0.097 J0.362 E0.0152 F1800
-G1 X0.100 Y-17.858 E0.0915 F1800
-G3 X-0.359 Y-17.592 I-0.362 J-0.097 E0.0152 F1800
-G1 X-6.155 Y-19.145 E0.2195 F1800
-G2 X-6.349 Y-18.421 I-0.097 J0.362 E0.0431 F1800
-G1 X-0.553 Y-16.868 E0.2195 F1800
-G3 X-0.288 Y-16.409 I-0.097 J0.362 E0.0152 F1800
-G1 X-0.935 Y-13.994 E0.0915 F1800
-G3 X-1.394 Y-13.729 I-0.362 J-0.097 E0.0152 F1800
-G1 X-7.190 Y-15.282 E0.2195 F1800
-G2 X-7.384 Y-14.557 I-0.097 J0.362 E0.0431 F1800
-G1 X-1.588 Y-13.004 E0.2195 F1800
-G3 X-1.323 Y-12.545 I-0.097 J0.362 E0.0152 F1800
-G1 X-1.970 Y-10.130 E0.0915 F1800
-G3 X-2.430 Y-9.865 I-0.362 J-0.097 E0.0152 F1800
-G1 X-8.225 Y-11.418 E0.2195 F1800
-G2 X-8.419 Y-10.693 I-0.097 J0.362 E0.0431 F1800
-G1 X-2.624 Y-9.141 E0.2195 F1800
-G3 X-2.358 Y-8.681 I-0.097 J0.362 E0.0152 F1800
-G1 X-3.006 Y-6.266 E0.0915 F1800
-G3 X-3.465 Y-6.001 I-0.362 J-0.097 E0.0152 F1800
-G1 X-9.260 Y-7.554 E0.2195 F1800
-G2 X-9.454 Y-6.830 I-0.097 J0.362 E0.0431 F1800
-G1 X-3.659 Y-5.277 E0.2195 F1800
-G3 X-3.394 Y-4.818 I-0.097 J0.362 E0.0152 F1800
-G1 X-4.041 Y-2.403 E0.0915 F1800
-G3 X-4.500 Y-2.138 I-0.362 J-0.097 E0.0152 F1800
-G1 X-10.296 Y-3.690 E0.2195 F1800
-G2 X-10.490 Y-2.966 I-0.097 J0.362 E0.0431 F1800
-G1 X-4.694 Y-1.413 E0.2195 F1800
-G3 X-4.429 Y-0.954 I-0.097 J0.362 E0.0152 F1800
-G1 X-5.076 Y1.461 E0.0915 F1800
-G3 X-5.535 Y1.726 I-0.362 J-0.097 E0.0152 F1800
-G1 X-11.331 Y0.173 E0.2195 F1800
-G2 X-11.525 Y0.898 I-0.097 J0.362 E0.0431 F1800
-G1 X-5.729 Y2.451 E0.2195 F1800
-G3 X-5.464 Y2.910 I-0.097 J0.362 E0.0152 F1800
-G1 X-6.111 Y5.325 E0.0915 F1800
-G3 X-6.571 Y5.590 I-0.362 J-0.097 E0.0152 F1800
-G1 X-12.366 Y4.037 E0.2195 F1800
-G2 X-12.560 Y4.761 I-0.097 J0.362 E0.0431 F1800
-G1 X-6.765 Y6.314 E0.2195 F1800
-G3 X-6.500 Y6.774 I-0.097 J0.362 E0.0152 F1800
-G1 X-7.147 Y9.188 E0.0915 F1800
-G3 X-7.606 Y9.454 I-0.362 J-0.097 E0.0152 F1800
-G1 X-13.401 Y7.901 E0.2195 F1800
-G2 X-13.596 Y8.625 I-0.097 J0.362 E0.0431 F1800
-G1 X-7.800 Y10.178 E0.2195 F1800
-G3 X-7.535 Y10.637 I-0.097 J0.362 E0.0152 F1800
-G1 X-8.182 Y13.052 E0.0915 F1800
-G3 X-8.641 Y13.317 I-0.362 J-0.097 E0.0152 F1800
-G1 X-14.437 Y11.764 E0.2195 F1800
-G2 X-14.631 Y12.489 I-0.097 J0.362 E0.0431 F1800
-G1 X-8.835 Y14.042 E0.2195 F1800
-G3 X-8.570 Y14.501 I-0.097 J0.362 E0.0152 F1800
-G1 X-9.217 Y16.916 E0.0915 F1800
-G3 X-9.676 Y17.181 I-0.362 J-0.097 E0.0152 F1800
-G1 X-15.472 Y15.628 E0.2195 F1800
-G2 X-15.666 Y16.353 I-0.097 J0.362 E0.0431 F1800
-G1 X-9.871 Y17.905 E0.2195 F1800
-G3 X-9.605 Y18.365 I-0.097 J0.362 E0.0152 F1800
-G1 X-10.252 Y20.780 E0.0915 F1800
-G3 X-10.712 Y21.045 I-0.362 J-0.097 E0.0152 F1800
-G1 X-16.507 Y19.492 E0.2195 F1800
-G2 X-16.701 Y20.216 I-0.097 J0.362 E0.0431 F1800
-G1 X-10.906 Y21.769 E0.2195 F1800
-G3 X-10.641 Y22.228 I-0.097 J0.362 E0.0152 F1800
-G1 X-11.288 Y24.643 E0.0915 F1800
-G3 X-11.747 Y24.908 I-0.362 J-0.097 E0.0152 F1800
-G1 X-17.543 Y23.355 E0.2195 F1800
-G2 X-17.737 Y24.080 I-0.097 J0.362 E0.0431 F1800
-G1 X-11.941 Y25.633 E0.2195 F1800
-G3 X-11.676 Y26.092 I-0.097 J0.362 E0.0152 F1800
-G1 X-12.323 Y28.507 E0.0915 F1800
-G3 X-12.782 Y28.772 I-0.362 J-0.097 E0.0152 F1800
-G1 X-18.578 Y27.219 E0.2195 F1800
-G2 X-18.772 Y27.944 I-0.097 J0.362 E0.0431 F1800
-G1 X-12.976 Y29.497 E0.2195 F1800
-G3 X-12.711 Y29.956 I-0.097 J0.362 E0.0152 F1800
-G1 X-13.358 Y32.371 E0.0915 F1800
-G3 X-13.818 Y32.636 I-0.362 J-0.097 E0.0152 F1800
-G1 X-19.613 Y31.083
+G1 X-2.084 Y-34.723
+G2 X-2.278 Y-33.998 I-0.097 J0.362 E0.0431 F1800
+G1 X3.517 Y-32.445 E0.2195 F1800
+G3 X3.782 Y-31.986 I-0.097 J0.362 E0.0152 F1800
+G1 X3.135 Y-29.571 E0.0915 F1800
+G3 X2.676 Y-29.306 I-0.362 J-0.097 E0.0152 F1800
+G1 X-3.119 Y-30.859 E0.2195 F1800
+G2 X-3.314 Y-30.134 I-0.097 J0.362 E0.0431 F1800
+G1 X2.482 Y-28.581 E0.2195 F1800
+G3 X2.747 Y-28.122 I-0.097 J0.362 E0.0152 F1800
+G1 X2.100 Y-25.707 E0.0915 F1800
+G3 X1.641 Y-25.442 I-0.362 J-0.097 E0.0152 F1800
+G1 X-4.155 Y-26.995 E0.2195 F1800
+G2 X-4.349 Y-26.271 I-0.097 J0.362 E0.0431 F1800
+G1 X1.447 Y-24.718 E0.2195 F1800
+G3 X1.712 Y-24.259 I-0.097 J0.362 E0.0152 F1800
+G1 X1.065 Y-21.844 E0.0915 F1800
+G3 X0.606 Y-21.579 I-0.362 J-0.097 E0.0152 F1800
+G1 X-5.190 Y-23.131 E0.2195 F1800
+G2 X-5.384 Y-22.407 I-0.097 J0.362 E0.0431 F1800
+G1 X0.411 Y-20.854 E0.2195 F1800
+G3 X0.677 Y-20.395 I-0.097 J0.362 E0.0152 F1800
+G1 X0.030 Y-17.980 E0.0915 F1800
+G3 X-0.430 Y-17.715 I-0.362 J-0.097 E0.0152 F1800
+G1 X-6.225 Y-19.268 E0.2195 F1800
+G2 X-6.419 Y-18.543 I-0.097 J0.362 E0.0431 F1800
+G1 X-0.624 Y-16.990 E0.2195 F1800
+G3 X-0.359 Y-16.531 I-0.097 J0.362 E0.0152 F1800
+G1 X-1.006 Y-14.116 E0.0915 F1800
+G3 X-1.465 Y-13.851 I-0.362 J-0.097 E0.0152 F1800
+G1 X-7.261 Y-15.404 E0.2195 F1800
+G2 X-7.455 Y-14.680 I-0.097 J0.362 E0.0431 F1800
+G1 X-1.659 Y-13.127 E0.2195 F1800
+G3 X-1.394 Y-12.667 I-0.097 J0.362 E0.0152 F1800
+G1 X-2.041 Y-10.253 E0.0915 F1800
+G3 X-2.500 Y-9.987 I-0.362 J-0.097 E0.0152 F1800
+G1 X-8.296 Y-11.540 E0.2195 F1800
+G2 X-8.490 Y-10.816 I-0.097 J0.362 E0.0431 F1800
+G1 X-2.694 Y-9.263 E0.2195 F1800
+G3 X-2.429 Y-8.804 I-0.097 J0.362 E0.0152 F1800
+G1 X-3.076 Y-6.389 E0.0915 F1800
+G3 X-3.536 Y-6.124 I-0.362 J-0.097 E0.0152 F1800
+G1 X-9.331 Y-7.677 E0.2195 F1800
+G2 X-9.525 Y-6.952 I-0.097 J0.362 E0.0431 F1800
+G1 X-3.730 Y-5.399 E0.2195 F1800
+G3 X-3.464 Y-4.940 I-0.097 J0.362 E0.0152 F1800
+G1 X-4.112 Y-2.525 E0.0915 F1800
+G3 X-4.571 Y-2.260 I-0.362 J-0.097 E0.0152 F1800
+G1 X-10.366 Y-3.813 E0.2195 F1800
+G2 X-10.560 Y-3.088 I-0.097 J0.362 E0.0431 F1800
+G1 X-4.765 Y-1.536 E0.2195 F1800
+G3 X-4.500 Y-1.076 I-0.097 J0.362 E0.0152 F1800
+G1 X-5.147 Y1.339 E0.0915 F1800
+G3 X-5.606 Y1.604 I-0.362 J-0.097 E0.0152 F1800
+G1 X-11.402 Y0.051 E0.2195 F1800
+G2 X-11.596 Y0.775 I-0.097 J0.362 E0.0431 F1800
+G1 X-5.800 Y2.328 E0.2195 F1800
+G3 X-5.535 Y2.787 I-0.097 J0.362 E0.0152 F1800
+G1 X-6.182 Y5.202 E0.0915 F1800
+G3 X-6.641 Y5.467 I-0.362 J-0.097 E0.0152 F1800
+G1 X-12.437 Y3.914 E0.2195 F1800
+G2 X-12.631 Y4.639 I-0.097 J0.362 E0.0431 F1800
+G1 X-6.835 Y6.192 E0.2195 F1800
+G3 X-6.570 Y6.651 I-0.097 J0.362 E0.0152 F1800
+G1 X-7.217 Y9.066 E0.0915 F1800
+G3 X-7.677 Y9.331 I-0.362 J-0.097 E0.0152 F1800
+G1 X-13.472 Y7.778 E0.2195 F1800
+G2 X-13.666 Y8.503 I-0.097 J0.362 E0.0431 F1800
+G1 X-7.871 Y10.056 E0.2195 F1800
+G3 X-7.606 Y10.515 I-0.097 J0.362 E0.0152 F1800
+G1 X-8.253 Y12.930 E0.0915 F1800
+G3 X-8.712 Y13.195 I-0.362 J-0.097 E0.0152 F1800
+G1 X-14.507 Y11.642 E0.2195 F1800
+G2 X-14.702 Y12.366 I-0.097 J0.362 E0.0431 F1800
+G1 X-8.906 Y13.919 E0.2195 F1800
+G3 X-8.641 Y14.379 I-0.097 J0.362 E0.0152 F1800
+G1 X-9.288 Y16.793 E0.0915 F1800
+G3 X-9.747 Y17.058 I-0.362 J-0.097 E0.0152 F1800
+G1 X-15.543 Y15.506 E0.2195 F1800
+G2 X-15.737 Y16.230 I-0.097 J0.362 E0.0431 F1800
+G1 X-9.941 Y17.783 E0.2195 F1800
+G3 X-9.676 Y18.242 I-0.097 J0.362 E0.0152 F1800
+G1 X-10.323 Y20.657 E0.0915 F1800
+G3 X-10.782 Y20.922 I-0.362 J-0.097 E0.0152 F1800
+G1 X-16.578 Y19.369 E0.2195 F1800
+G2 X-16.772 Y20.094 I-0.097 J0.362 E0.0431 F1800
+G1 X-10.977 Y21.647 E0.2195 F1800
+G3 X-10.711 Y22.106 I-0.097 J0.362 E0.0152 F1800
+G1 X-11.358 Y24.521 E0.0915 F1800
+G3 X-11.818 Y24.786 I-0.362 J-0.097 E0.0152 F1800
+G1 X-17.613 Y23.233 E0.2195 F1800
+G2 X-17.807 Y23.957 I-0.097 J0.362 E0.0431 F1800
+G1 X-12.012 Y25.510 E0.2195 F1800
+G3 X-11.747 Y25.970 I-0.097 J0.362 E0.0152 F1800
+G1 X-12.394 Y28.384 E0.0915 F1800
+G3 X-12.853 Y28.650 I-0.362 J-0.097 E0.0152 F1800
+G1 X-18.649 Y27.097 E0.2195 F1800
+G2 X-18.843 Y27.821 I-0.097 J0.362 E0.0431 F1800
+G1 X-13.047 Y29.374 E0.2195 F1800
+G3 X-12.782 Y29.833 I-0.097 J0.362 E0.0152 F1800
+G1 X-13.429 Y32.248 E0.0915 F1800
+G3 X-13.888 Y32.513 I-0.362 J-0.097 E0.0152 F1800
+G1 X-19.684 Y30.960
 G1 Z0.850 E-5.0000 F4800
-G1 X-11.886 Y33.153
-G1 X6.232 Y-34.461
+G1 X-11.956 Y33.031
+G1 X6.161 Y-34.584
 ;print vertical interlocked reference pattern 4
-G1 X14.407 Y-30.200 F1800
+G1 X14.337 Y-30.323 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X8.612 Y-31.753
-G2 X8.418 Y-31.029 I-0.097 J0.362 E0.0431 F1800
-G1 X14.213 Y-29.476 E0.2195 F1800
-G3 X14.478 Y-29.016 I-0.097 J0.362 E0.0152 F1800
-G1 X13.831 Y-26.602 E0.0915 F1800
-G3 X13.372 Y-26.336 I-0.362 J-0.097 E0.0152 F1800
-G1 X7.576 Y-27.889 E0.2195 F1800
-G2 X7.382 Y-27.165 I-0.097 J0.362 E0.0431 F1800
-G1 X13.178 Y-25.612 E0.2195 F1800
-G3 X13.443 Y-25.153 I-0.097 J0.362 E0.0152 F1800
-G1 X12.796 Y-22.738 E0.0915 F1800
-G3 X12.337 Y-22.473 I-0.362 J-0.097 E0.0152 F1800
-G1 X6.541 Y-24.026 E0.2195 F1800
-G2 X6.347 Y-23.301 I-0.097 J0.362 E0.0431 F1800
-G1 X12.143 Y-21.748 E0.2195 F1800
-G3 X12.408 Y-21.289 I-0.097 J0.362 E0.0152 F1800
-G1 X11.761 Y-18.874 E0.0915 F1800
-G3 X11.301 Y-18.609 I-0.362 J-0.097 E0.0152 F1800
-G1 X5.506 Y-20.162 E0.2195 F1800
-G2 X5.312 Y-19.438 I-0.097 J0.362 E0.0431 F1800
-G1 X11.107 Y-17.885 E0.2195 F1800
-G3 X11.373 Y-17.425 I-0.097 J0.362 E0.0152 F1800
-G1 X10.725 Y-15.011 E0.0915 F1800
-G3 X10.266 Y-14.745 I-0.362 J-0.097 E0.0152 F1800
-G1 X4.471 Y-16.298 E0.2195 F1800
-G2 X4.277 Y-15.574 I-0.097 J0.362 E0.0431 F1800
-G1 X10.072 Y-14.021 E0.2195 F1800
-G3 X10.337 Y-13.562 I-0.097 J0.362 E0.0152 F1800
-G1 X9.690 Y-11.147 E0.0915 F1800
-G3 X9.231 Y-10.882 I-0.362 J-0.097 E0.0152 F1800
-G1 X3.435 Y-12.435 E0.2195 F1800
-G2 X3.241 Y-11.710 I-0.097 J0.362 E0.0431 F1800
-G1 X9.037 Y-10.157 E0.2195 F1800
-G3 X9.302 Y-9.698 I-0.097 J0.362 E0.0152 F1800
-G1 X8.655 Y-7.283 E0.0915 F1800
-G3 X8.196 Y-7.018 I-0.362 J-0.097 E0.0152 F1800
-G1 X2.400 Y-8.571 E0.2195 F1800
-G2 X2.206 Y-7.846 I-0.097 J0.362 E0.0431 F1800
-G1 X8.002 Y-6.293 E0.2195 F1800
-G3 X8.267 Y-5.834 I-0.097 J0.362 E0.0152 F1800
-G1 X7.620 Y-3.419 E0.0915 F1800
-G3 X7.160 Y-3.154 I-0.362 J-0.097 E0.0152 F1800
-G1 X1.365 Y-4.707 E0.2195 F1800
-G2 X1.171 Y-3.983 I-0.097 J0.362 E0.0431 F1800
-G1 X6.966 Y-2.430 E0.2195 F1800
-G3 X7.231 Y-1.971 I-0.097 J0.362 E0.0152 F1800
-G1 X6.584 Y0.444 E0.0915 F1800
-G3 X6.125 Y0.709 I-0.362 J-0.097 E0.0152 F1800
-G1 X0.330 Y-0.843 E0.2195 F1800
-G2 X0.135 Y-0.119 I-0.097 J0.362 E0.0431 F1800
-G1 X5.931 Y1.434 E0.2195 F1800
-G3 X6.196 Y1.893 I-0.097 J0.362 E0.0152 F1800
-G1 X5.549 Y4.308 E0.0915 F1800
-G3 X5.090 Y4.573 I-0.362 J-0.097 E0.0152 F1800
-G1 X-0.706 Y3.020 E0.2195 F1800
-G2 X-0.900 Y3.745 I-0.097 J0.362 E0.0431 F1800
-G1 X4.896 Y5.298 E0.2195 F1800
-G3 X5.161 Y5.757 I-0.097 J0.362 E0.0152 F1800
-G1 X4.514 Y8.172 E0.0915 F1800
-G3 X4.055 Y8.437 I-0.362 J-0.097 E0.0152 F1800
-G1 X-1.741 Y6.884 E0.2195 F1800
-G2 X-1.935 Y7.608 I-0.097 J0.362 E0.0431 F1800
-G1 X3.860 Y9.161 E0.2195 F1800
-G3 X4.126 Y9.621 I-0.097 J0.362 E0.0152 F1800
-G1 X3.479 Y12.035 E0.0915 F1800
-G3 X3.019 Y12.301 I-0.362 J-0.097 E0.0152 F1800
-G1 X-2.776 Y10.748 E0.2195 F1800
-G2 X-2.970 Y11.472 I-0.097 J0.362 E0.0431 F1800
-G1 X2.825 Y13.025 E0.2195 F1800
-G3 X3.090 Y13.484 I-0.097 J0.362 E0.0152 F1800
-G1 X2.443 Y15.899 E0.0915 F1800
-G3 X1.984 Y16.164 I-0.362 J-0.097 E0.0152 F1800
-G1 X-3.812 Y14.611 E0.2195 F1800
-G2 X-4.006 Y15.336 I-0.097 J0.362 E0.0431 F1800
-G1 X1.790 Y16.889 E0.2195 F1800
-G3 X2.055 Y17.348 I-0.097 J0.362 E0.0152 F1800
-G1 X1.408 Y19.763 E0.0915 F1800
-G3 X0.949 Y20.028 I-0.362 J-0.097 E0.0152 F1800
-G1 X-4.847 Y18.475 E0.2195 F1800
-G2 X-5.041 Y19.200 I-0.097 J0.362 E0.0431 F1800
-G1 X0.755 Y20.752 E0.2195 F1800
-G3 X1.020 Y21.212 I-0.097 J0.362 E0.0152 F1800
-G1 X0.373 Y23.627 E0.0915 F1800
-G3 X-0.087 Y23.892 I-0.362 J-0.097 E0.0152 F1800
-G1 X-5.882 Y22.339 E0.2195 F1800
-G2 X-6.076 Y23.063 I-0.097 J0.362 E0.0431 F1800
-G1 X-0.281 Y24.616 E0.2195 F1800
-G3 X-0.016 Y25.075 I-0.097 J0.362 E0.0152 F1800
-G1 X-0.663 Y27.490 E0.0915 F1800
-G3 X-1.122 Y27.755 I-0.362 J-0.097 E0.0152 F1800
-G1 X-6.917 Y26.202 E0.2195 F1800
-G2 X-7.112 Y26.927 I-0.097 J0.362 E0.0431 F1800
-G1 X-1.316 Y28.480 E0.2195 F1800
-G3 X-1.051 Y28.939 I-0.097 J0.362 E0.0152 F1800
-G1 X-1.698 Y31.354 E0.0915 F1800
-G3 X-2.157 Y31.619 I-0.362 J-0.097 E0.0152 F1800
-G1 X-7.953 Y30.066 E0.2195 F1800
-G2 X-8.147 Y30.791 I-0.097 J0.362 E0.0431 F1800
-G1 X-2.351 Y32.344 E0.2195 F1800
-G3 X-2.086 Y32.803 I-0.097 J0.362 E0.0152 F1800
-G1 X-2.733 Y35.218 E0.0915 F1800
-G3 X-3.192 Y35.483 I-0.362 J-0.097 E0.0152 F1800
-G1 X-8.988 Y33.930
+G1 X8.541 Y-31.876
+G2 X8.347 Y-31.151 I-0.097 J0.362 E0.0431 F1800
+G1 X14.142 Y-29.598 E0.2195 F1800
+G3 X14.408 Y-29.139 I-0.097 J0.362 E0.0152 F1800
+G1 X13.761 Y-26.724 E0.0915 F1800
+G3 X13.301 Y-26.459 I-0.362 J-0.097 E0.0152 F1800
+G1 X7.506 Y-28.012 E0.2195 F1800
+G2 X7.312 Y-27.287 I-0.097 J0.362 E0.0431 F1800
+G1 X13.107 Y-25.734 E0.2195 F1800
+G3 X13.372 Y-25.275 I-0.097 J0.362 E0.0152 F1800
+G1 X12.725 Y-22.860 E0.0915 F1800
+G3 X12.266 Y-22.595 I-0.362 J-0.097 E0.0152 F1800
+G1 X6.470 Y-24.148 E0.2195 F1800
+G2 X6.276 Y-23.424 I-0.097 J0.362 E0.0431 F1800
+G1 X12.072 Y-21.871 E0.2195 F1800
+G3 X12.337 Y-21.412 I-0.097 J0.362 E0.0152 F1800
+G1 X11.690 Y-18.997 E0.0915 F1800
+G3 X11.231 Y-18.732 I-0.362 J-0.097 E0.0152 F1800
+G1 X5.435 Y-20.284 E0.2195 F1800
+G2 X5.241 Y-19.560 I-0.097 J0.362 E0.0431 F1800
+G1 X11.037 Y-18.007 E0.2195 F1800
+G3 X11.302 Y-17.548 I-0.097 J0.362 E0.0152 F1800
+G1 X10.655 Y-15.133 E0.0915 F1800
+G3 X10.195 Y-14.868 I-0.362 J-0.097 E0.0152 F1800
+G1 X4.400 Y-16.421 E0.2195 F1800
+G2 X4.206 Y-15.696 I-0.097 J0.362 E0.0431 F1800
+G1 X10.001 Y-14.143 E0.2195 F1800
+G3 X10.267 Y-13.684 I-0.097 J0.362 E0.0152 F1800
+G1 X9.619 Y-11.269 E0.0915 F1800
+G3 X9.160 Y-11.004 I-0.362 J-0.097 E0.0152 F1800
+G1 X3.365 Y-12.557 E0.2195 F1800
+G2 X3.171 Y-11.833 I-0.097 J0.362 E0.0431 F1800
+G1 X8.966 Y-10.280 E0.2195 F1800
+G3 X9.231 Y-9.820 I-0.097 J0.362 E0.0152 F1800
+G1 X8.584 Y-7.406 E0.0915 F1800
+G3 X8.125 Y-7.140 I-0.362 J-0.097 E0.0152 F1800
+G1 X2.329 Y-8.693 E0.2195 F1800
+G2 X2.135 Y-7.969 I-0.097 J0.362 E0.0431 F1800
+G1 X7.931 Y-6.416 E0.2195 F1800
+G3 X8.196 Y-5.957 I-0.097 J0.362 E0.0152 F1800
+G1 X7.549 Y-3.542 E0.0915 F1800
+G3 X7.090 Y-3.277 I-0.362 J-0.097 E0.0152 F1800
+G1 X1.294 Y-4.830 E0.2195 F1800
+G2 X1.100 Y-4.105 I-0.097 J0.362 E0.0431 F1800
+G1 X6.896 Y-2.552 E0.2195 F1800
+G3 X7.161 Y-2.093 I-0.097 J0.362 E0.0152 F1800
+G1 X6.514 Y0.322 E0.0915 F1800
+G3 X6.054 Y0.587 I-0.362 J-0.097 E0.0152 F1800
+G1 X0.259 Y-0.966 E0.2195 F1800
+G2 X0.065 Y-0.241 I-0.097 J0.362 E0.0431 F1800
+G1 X5.860 Y1.311 E0.2195 F1800
+G3 X6.125 Y1.771 I-0.097 J0.362 E0.0152 F1800
+G1 X5.478 Y4.186 E0.0915 F1800
+G3 X5.019 Y4.451 I-0.362 J-0.097 E0.0152 F1800
+G1 X-0.776 Y2.898 E0.2195 F1800
+G2 X-0.971 Y3.622 I-0.097 J0.362 E0.0431 F1800
+G1 X4.825 Y5.175 E0.2195 F1800
+G3 X5.090 Y5.634 I-0.097 J0.362 E0.0152 F1800
+G1 X4.443 Y8.049 E0.0915 F1800
+G3 X3.984 Y8.314 I-0.362 J-0.097 E0.0152 F1800
+G1 X-1.812 Y6.761 E0.2195 F1800
+G2 X-2.006 Y7.486 I-0.097 J0.362 E0.0431 F1800
+G1 X3.790 Y9.039 E0.2195 F1800
+G3 X4.055 Y9.498 I-0.097 J0.362 E0.0152 F1800
+G1 X3.408 Y11.913 E0.0915 F1800
+G3 X2.949 Y12.178 I-0.362 J-0.097 E0.0152 F1800
+G1 X-2.847 Y10.625 E0.2195 F1800
+G2 X-3.041 Y11.350 I-0.097 J0.362 E0.0431 F1800
+G1 X2.754 Y12.903 E0.2195 F1800
+G3 X3.020 Y13.362 I-0.097 J0.362 E0.0152 F1800
+G1 X2.373 Y15.777 E0.0915 F1800
+G3 X1.913 Y16.042 I-0.362 J-0.097 E0.0152 F1800
+G1 X-3.882 Y14.489 E0.2195 F1800
+G2 X-4.076 Y15.213 I-0.097 J0.362 E0.0431 F1800
+G1 X1.719 Y16.766 E0.2195 F1800
+G3 X1.984 Y17.226 I-0.097 J0.362 E0.0152 F1800
+G1 X1.337 Y19.640 E0.0915 F1800
+G3 X0.878 Y19.906 I-0.362 J-0.097 E0.0152 F1800
+G1 X-4.918 Y18.353 E0.2195 F1800
+G2 X-5.112 Y19.077 I-0.097 J0.362 E0.0431 F1800
+G1 X0.684 Y20.630 E0.2195 F1800
+G3 X0.949 Y21.089 I-0.097 J0.362 E0.0152 F1800
+G1 X0.302 Y23.504 E0.0915 F1800
+G3 X-0.157 Y23.769 I-0.362 J-0.097 E0.0152 F1800
+G1 X-5.953 Y22.216 E0.2195 F1800
+G2 X-6.147 Y22.941 I-0.097 J0.362 E0.0431 F1800
+G1 X-0.351 Y24.494 E0.2195 F1800
+G3 X-0.086 Y24.953 I-0.097 J0.362 E0.0152 F1800
+G1 X-0.733 Y27.368 E0.0915 F1800
+G3 X-1.193 Y27.633 I-0.362 J-0.097 E0.0152 F1800
+G1 X-6.988 Y26.080 E0.2195 F1800
+G2 X-7.182 Y26.804 I-0.097 J0.362 E0.0431 F1800
+G1 X-1.387 Y28.357 E0.2195 F1800
+G3 X-1.122 Y28.817 I-0.097 J0.362 E0.0152 F1800
+G1 X-1.769 Y31.231 E0.0915 F1800
+G3 X-2.228 Y31.497 I-0.362 J-0.097 E0.0152 F1800
+G1 X-8.023 Y29.944 E0.2195 F1800
+G2 X-8.218 Y30.668 I-0.097 J0.362 E0.0431 F1800
+G1 X-2.422 Y32.221 E0.2195 F1800
+G3 X-2.157 Y32.680 I-0.097 J0.362 E0.0152 F1800
+G1 X-2.804 Y35.095 E0.0915 F1800
+G3 X-3.263 Y35.360 I-0.362 J-0.097 E0.0152 F1800
+G1 X-9.059 Y33.807
 G1 Z0.850 E-5.0000 F4800
-G1 X-1.261 Y36.000
-G1 X16.857 Y-31.614
-G1 X25.032 Y-27.353 F1800
+G1 X-1.331 Y35.878
+G1 X16.786 Y-31.737
+G1 X24.962 Y-27.476 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X19.237 Y-28.906
-G2 X19.043 Y-28.182 I-0.097 J0.362 E0.0431 F1800
-G1 X24.838 Y-26.629 E0.2195 F1800
-G3 X25.104 Y-26.169 I-0.097 J0.362 E0.0152 F1800
-G1 X24.456 Y-23.755 E0.0915 F1800
-G3 X23.997 Y-23.489 I-0.362 J-0.097 E0.0152 F1800
-G1 X18.202 Y-25.042 E0.2195 F1800
-G2 X18.008 Y-24.318 I-0.097 J0.362 E0.0431 F1800
-G1 X23.803 Y-22.765 E0.2195 F1800
-G3 X24.068 Y-22.306 I-0.097 J0.362 E0.0152 F1800
-G1 X23.421 Y-19.891 E0.0915 F1800
-G3 X22.962 Y-19.626 I-0.362 J-0.097 E0.0152 F1800
-G1 X17.166 Y-21.179 E0.2195 F1800
-G2 X16.972 Y-20.454 I-0.097 J0.362 E0.0431 F1800
-G1 X22.768 Y-18.901 E0.2195 F1800
-G3 X23.033 Y-18.442 I-0.097 J0.362 E0.0152 F1800
-G1 X22.386 Y-16.027 E0.0915 F1800
-G3 X21.927 Y-15.762 I-0.362 J-0.097 E0.0152 F1800
-G1 X16.131 Y-17.315 E0.2195 F1800
-G2 X15.937 Y-16.591 I-0.097 J0.362 E0.0431 F1800
-G1 X21.733 Y-15.038 E0.2195 F1800
-G3 X21.998 Y-14.578 I-0.097 J0.362 E0.0152 F1800
-G1 X21.351 Y-12.164 E0.0915 F1800
-G3 X20.891 Y-11.898 I-0.362 J-0.097 E0.0152 F1800
-G1 X15.096 Y-13.451 E0.2195 F1800
-G2 X14.902 Y-12.727 I-0.097 J0.362 E0.0431 F1800
-G1 X20.697 Y-11.174 E0.2195 F1800
-G3 X20.962 Y-10.715 I-0.097 J0.362 E0.0152 F1800
-G1 X20.315 Y-8.300 E0.0915 F1800
-G3 X19.856 Y-8.035 I-0.362 J-0.097 E0.0152 F1800
-G1 X14.061 Y-9.588 E0.2195 F1800
-G2 X13.866 Y-8.863 I-0.097 J0.362 E0.0431 F1800
-G1 X19.662 Y-7.310 E0.2195 F1800
-G3 X19.927 Y-6.851 I-0.097 J0.362 E0.0152 F1800
-G1 X19.280 Y-4.436 E0.0915 F1800
-G3 X18.821 Y-4.171 I-0.362 J-0.097 E0.0152 F1800
-G1 X13.025 Y-5.724 E0.2195 F1800
-G2 X12.831 Y-4.999 I-0.097 J0.362 E0.0431 F1800
-G1 X18.627 Y-3.446 E0.2195 F1800
-G3 X18.892 Y-2.987 I-0.097 J0.362 E0.0152 F1800
-G1 X18.245 Y-0.572 E0.0915 F1800
-G3 X17.786 Y-0.307 I-0.362 J-0.097 E0.0152 F1800
-G1 X11.990 Y-1.860 E0.2195 F1800
-G2 X11.796 Y-1.136 I-0.097 J0.362 E0.0431 F1800
-G1 X17.591 Y0.417 E0.2195 F1800
-G3 X17.857 Y0.876 I-0.097 J0.362 E0.0152 F1800
-G1 X17.210 Y3.291 E0.0915 F1800
-G3 X16.750 Y3.556 I-0.362 J-0.097 E0.0152 F1800
-G1 X10.955 Y2.004 E0.2195 F1800
-G2 X10.761 Y2.728 I-0.097 J0.362 E0.0431 F1800
-G1 X16.556 Y4.281 E0.2195 F1800
-G3 X16.821 Y4.740 I-0.097 J0.362 E0.0152 F1800
-G1 X16.174 Y7.155 E0.0915 F1800
-G3 X15.715 Y7.420 I-0.362 J-0.097 E0.0152 F1800
-G1 X9.919 Y5.867 E0.2195 F1800
-G2 X9.725 Y6.592 I-0.097 J0.362 E0.0431 F1800
-G1 X15.521 Y8.145 E0.2195 F1800
-G3 X15.786 Y8.604 I-0.097 J0.362 E0.0152 F1800
-G1 X15.139 Y11.019 E0.0915 F1800
-G3 X14.680 Y11.284 I-0.362 J-0.097 E0.0152 F1800
-G1 X8.884 Y9.731 E0.2195 F1800
-G2 X8.690 Y10.455 I-0.097 J0.362 E0.0431 F1800
-G1 X14.486 Y12.008 E0.2195 F1800
-G3 X14.751 Y12.468 I-0.097 J0.362 E0.0152 F1800
-G1 X14.104 Y14.882 E0.0915 F1800
-G3 X13.644 Y15.148 I-0.362 J-0.097 E0.0152 F1800
-G1 X7.849 Y13.595 E0.2195 F1800
-G2 X7.655 Y14.319 I-0.097 J0.362 E0.0431 F1800
-G1 X13.450 Y15.872 E0.2195 F1800
-G3 X13.715 Y16.331 I-0.097 J0.362 E0.0152 F1800
-G1 X13.068 Y18.746 E0.0915 F1800
-G3 X12.609 Y19.011 I-0.362 J-0.097 E0.0152 F1800
-G1 X6.814 Y17.458 E0.2195 F1800
-G2 X6.619 Y18.183 I-0.097 J0.362 E0.0431 F1800
-G1 X12.415 Y19.736 E0.2195 F1800
-G3 X12.680 Y20.195 I-0.097 J0.362 E0.0152 F1800
-G1 X12.033 Y22.610 E0.0915 F1800
-G3 X11.574 Y22.875 I-0.362 J-0.097 E0.0152 F1800
-G1 X5.778 Y21.322 E0.2195 F1800
-G2 X5.584 Y22.047 I-0.097 J0.362 E0.0431 F1800
-G1 X11.380 Y23.599 E0.2195 F1800
-G3 X11.645 Y24.059 I-0.097 J0.362 E0.0152 F1800
-G1 X10.998 Y26.474 E0.0915 F1800
-G3 X10.539 Y26.739 I-0.362 J-0.097 E0.0152 F1800
-G1 X4.743 Y25.186 E0.2195 F1800
-G2 X4.549 Y25.910 I-0.097 J0.362 E0.0431 F1800
-G1 X10.344 Y27.463 E0.2195 F1800
-G3 X10.610 Y27.922 I-0.097 J0.362 E0.0152 F1800
-G1 X9.963 Y30.337 E0.0915 F1800
-G3 X9.503 Y30.602 I-0.362 J-0.097 E0.0152 F1800
-G1 X3.708 Y29.049 E0.2195 F1800
-G2 X3.514 Y29.774 I-0.097 J0.362 E0.0431 F1800
-G1 X9.309 Y31.327 E0.2195 F1800
-G3 X9.574 Y31.786 I-0.097 J0.362 E0.0152 F1800
-G1 X8.927 Y34.201 E0.0915 F1800
-G3 X8.468 Y34.466 I-0.362 J-0.097 E0.0152 F1800
-G1 X2.673 Y32.913 E0.2195 F1800
-G2 X2.478 Y33.638 I-0.097 J0.362 E0.0431 F1800
-G1 X8.274 Y35.191 E0.2195 F1800
-G3 X8.539 Y35.650 I-0.097 J0.362 E0.0152 F1800
-G1 X7.892 Y38.065 E0.0915 F1800
-G3 X7.433 Y38.330 I-0.362 J-0.097 E0.0152 F1800
-G1 X1.637 Y36.777
+G1 X19.166 Y-29.029
+G2 X18.972 Y-28.304 I-0.097 J0.362 E0.0431 F1800
+G1 X24.768 Y-26.751 E0.2195 F1800
+G3 X25.033 Y-26.292 I-0.097 J0.362 E0.0152 F1800
+G1 X24.386 Y-23.877 E0.0915 F1800
+G3 X23.926 Y-23.612 I-0.362 J-0.097 E0.0152 F1800
+G1 X18.131 Y-25.165 E0.2195 F1800
+G2 X17.937 Y-24.440 I-0.097 J0.362 E0.0431 F1800
+G1 X23.732 Y-22.887 E0.2195 F1800
+G3 X23.998 Y-22.428 I-0.097 J0.362 E0.0152 F1800
+G1 X23.350 Y-20.013 E0.0915 F1800
+G3 X22.891 Y-19.748 I-0.362 J-0.097 E0.0152 F1800
+G1 X17.096 Y-21.301 E0.2195 F1800
+G2 X16.902 Y-20.577 I-0.097 J0.362 E0.0431 F1800
+G1 X22.697 Y-19.024 E0.2195 F1800
+G3 X22.962 Y-18.564 I-0.097 J0.362 E0.0152 F1800
+G1 X22.315 Y-16.150 E0.0915 F1800
+G3 X21.856 Y-15.885 I-0.362 J-0.097 E0.0152 F1800
+G1 X16.060 Y-17.437 E0.2195 F1800
+G2 X15.866 Y-16.713 I-0.097 J0.362 E0.0431 F1800
+G1 X21.662 Y-15.160 E0.2195 F1800
+G3 X21.927 Y-14.701 I-0.097 J0.362 E0.0152 F1800
+G1 X21.280 Y-12.286 E0.0915 F1800
+G3 X20.821 Y-12.021 I-0.362 J-0.097 E0.0152 F1800
+G1 X15.025 Y-13.574 E0.2195 F1800
+G2 X14.831 Y-12.849 I-0.097 J0.362 E0.0431 F1800
+G1 X20.627 Y-11.296 E0.2195 F1800
+G3 X20.892 Y-10.837 I-0.097 J0.362 E0.0152 F1800
+G1 X20.245 Y-8.422 E0.0915 F1800
+G3 X19.785 Y-8.157 I-0.362 J-0.097 E0.0152 F1800
+G1 X13.990 Y-9.710 E0.2195 F1800
+G2 X13.796 Y-8.986 I-0.097 J0.362 E0.0431 F1800
+G1 X19.591 Y-7.433 E0.2195 F1800
+G3 X19.856 Y-6.973 I-0.097 J0.362 E0.0152 F1800
+G1 X19.209 Y-4.559 E0.0915 F1800
+G3 X18.750 Y-4.293 I-0.362 J-0.097 E0.0152 F1800
+G1 X12.955 Y-5.846 E0.2195 F1800
+G2 X12.760 Y-5.122 I-0.097 J0.362 E0.0431 F1800
+G1 X18.556 Y-3.569 E0.2195 F1800
+G3 X18.821 Y-3.110 I-0.097 J0.362 E0.0152 F1800
+G1 X18.174 Y-0.695 E0.0915 F1800
+G3 X17.715 Y-0.430 I-0.362 J-0.097 E0.0152 F1800
+G1 X11.919 Y-1.983 E0.2195 F1800
+G2 X11.725 Y-1.258 I-0.097 J0.362 E0.0431 F1800
+G1 X17.521 Y0.295 E0.2195 F1800
+G3 X17.786 Y0.754 I-0.097 J0.362 E0.0152 F1800
+G1 X17.139 Y3.169 E0.0915 F1800
+G3 X16.680 Y3.434 I-0.362 J-0.097 E0.0152 F1800
+G1 X10.884 Y1.881 E0.2195 F1800
+G2 X10.690 Y2.606 I-0.097 J0.362 E0.0431 F1800
+G1 X16.485 Y4.158 E0.2195 F1800
+G3 X16.751 Y4.618 I-0.097 J0.362 E0.0152 F1800
+G1 X16.104 Y7.033 E0.0915 F1800
+G3 X15.644 Y7.298 I-0.362 J-0.097 E0.0152 F1800
+G1 X9.849 Y5.745 E0.2195 F1800
+G2 X9.655 Y6.469 I-0.097 J0.362 E0.0431 F1800
+G1 X15.450 Y8.022 E0.2195 F1800
+G3 X15.715 Y8.481 I-0.097 J0.362 E0.0152 F1800
+G1 X15.068 Y10.896 E0.0915 F1800
+G3 X14.609 Y11.161 I-0.362 J-0.097 E0.0152 F1800
+G1 X8.813 Y9.608 E0.2195 F1800
+G2 X8.619 Y10.333 I-0.097 J0.362 E0.0431 F1800
+G1 X14.415 Y11.886 E0.2195 F1800
+G3 X14.680 Y12.345 I-0.097 J0.362 E0.0152 F1800
+G1 X14.033 Y14.760 E0.0915 F1800
+G3 X13.574 Y15.025 I-0.362 J-0.097 E0.0152 F1800
+G1 X7.778 Y13.472 E0.2195 F1800
+G2 X7.584 Y14.197 I-0.097 J0.362 E0.0431 F1800
+G1 X13.380 Y15.750 E0.2195 F1800
+G3 X13.645 Y16.209 I-0.097 J0.362 E0.0152 F1800
+G1 X12.998 Y18.624 E0.0915 F1800
+G3 X12.538 Y18.889 I-0.362 J-0.097 E0.0152 F1800
+G1 X6.743 Y17.336 E0.2195 F1800
+G2 X6.549 Y18.060 I-0.097 J0.362 E0.0431 F1800
+G1 X12.344 Y19.613 E0.2195 F1800
+G3 X12.610 Y20.073 I-0.097 J0.362 E0.0152 F1800
+G1 X11.962 Y22.487 E0.0915 F1800
+G3 X11.503 Y22.753 I-0.362 J-0.097 E0.0152 F1800
+G1 X5.708 Y21.200 E0.2195 F1800
+G2 X5.514 Y21.924 I-0.097 J0.362 E0.0431 F1800
+G1 X11.309 Y23.477 E0.2195 F1800
+G3 X11.574 Y23.936 I-0.097 J0.362 E0.0152 F1800
+G1 X10.927 Y26.351 E0.0915 F1800
+G3 X10.468 Y26.616 I-0.362 J-0.097 E0.0152 F1800
+G1 X4.672 Y25.063 E0.2195 F1800
+G2 X4.478 Y25.788 I-0.097 J0.362 E0.0431 F1800
+G1 X10.274 Y27.341 E0.2195 F1800
+G3 X10.539 Y27.800 I-0.097 J0.362 E0.0152 F1800
+G1 X9.892 Y30.215 E0.0915 F1800
+G3 X9.433 Y30.480 I-0.362 J-0.097 E0.0152 F1800
+G1 X3.637 Y28.927 E0.2195 F1800
+G2 X3.443 Y29.651 I-0.097 J0.362 E0.0431 F1800
+G1 X9.239 Y31.204 E0.2195 F1800
+G3 X9.504 Y31.664 I-0.097 J0.362 E0.0152 F1800
+G1 X8.857 Y34.078 E0.0915 F1800
+G3 X8.397 Y34.344 I-0.362 J-0.097 E0.0152 F1800
+G1 X2.602 Y32.791 E0.2195 F1800
+G2 X2.408 Y33.515 I-0.097 J0.362 E0.0431 F1800
+G1 X8.203 Y35.068 E0.2195 F1800
+G3 X8.468 Y35.527 I-0.097 J0.362 E0.0152 F1800
+G1 X7.821 Y37.942 E0.0915 F1800
+G3 X7.362 Y38.207 I-0.362 J-0.097 E0.0152 F1800
+G1 X1.567 Y36.654
 G1 Z0.850 E-5.0000 F4800
-G1 X9.365 Y38.847
-G1 X27.482 Y-28.767
+G1 X9.294 Y38.725
+G1 X27.411 Y-28.890
 ;print horizontal interlocked reference pattern 0
-G1 X33.097 Y-38.133 F1800
+G1 X33.027 Y-38.256 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X34.650 Y-43.929
-G3 X35.375 Y-43.735 I0.362 J0.097 E0.0431 F1800
-G1 X33.822 Y-37.939 E0.2195 F1800
-G2 X34.087 Y-37.480 I0.362 J0.097 E0.0152 F1800
-G1 X36.502 Y-36.833 E0.0915 F1800
-G2 X36.961 Y-37.098 I0.097 J-0.362 E0.0152 F1800
-G1 X38.514 Y-42.893 E0.2195 F1800
-G3 X39.238 Y-42.699 I0.362 J0.097 E0.0431 F1800
-G1 X37.685 Y-36.904 E0.2195 F1800
-G2 X37.951 Y-36.444 I0.362 J0.097 E0.0152 F1800
-G1 X40.365 Y-35.797 E0.0915 F1800
-G2 X40.825 Y-36.063 I0.097 J-0.362 E0.0152 F1800
-G1 X42.378 Y-41.858 E0.2195 F1800
-G3 X43.102 Y-41.664 I0.362 J0.097 E0.0431 F1800
-G1 X41.549 Y-35.868 E0.2195 F1800
-G2 X41.814 Y-35.409 I0.362 J0.097 E0.0152 F1800
-G1 X44.229 Y-34.762 E0.0915 F1800
-G2 X44.688 Y-35.027 I0.097 J-0.362 E0.0152 F1800
-G1 X46.241 Y-40.823 E0.2195 F1800
-G3 X46.966 Y-40.629 I0.362 J0.097 E0.0431 F1800
-G1 X45.413 Y-34.833 E0.2195 F1800
-G2 X45.678 Y-34.374 I0.362 J0.097 E0.0152 F1800
-G1 X48.093 Y-33.727 E0.0915 F1800
-G2 X48.552 Y-33.992 I0.097 J-0.362 E0.0152 F1800
-G1 X50.105 Y-39.788 E0.2195 F1800
-G3 X50.830 Y-39.593 I0.362 J0.097 E0.0431 F1800
-G1 X49.277 Y-33.798 E0.2195 F1800
-G2 X49.542 Y-33.339 I0.362 J0.097 E0.0152 F1800
-G1 X51.957 Y-32.692 E0.0915 F1800
-G2 X52.416 Y-32.957 I0.097 J-0.362 E0.0152 F1800
-G1 X53.969 Y-38.752 E0.2195 F1800
-G3 X54.693 Y-38.558 I0.362 J0.097 E0.0431 F1800
-G1 X53.140 Y-32.763 E0.2195 F1800
-G2 X53.405 Y-32.303 I0.362 J0.097 E0.0152 F1800
-G1 X55.820 Y-31.656 E0.0915 F1800
-G2 X56.280 Y-31.921 I0.097 J-0.362 E0.0152 F1800
-G1 X57.832 Y-37.717 E0.2195 F1800
-G3 X58.557 Y-37.523 I0.362 J0.097 E0.0431 F1800
-G1 X57.004 Y-31.727 E0.2195 F1800
-G2 X57.269 Y-31.268 I0.362 J0.097 E0.0152 F1800
-G1 X59.684 Y-30.621 E0.0915 F1800
-G2 X60.143 Y-30.886 I0.097 J-0.362 E0.0152 F1800
-G1 X61.696 Y-36.682 E0.2195 F1800
-G3 X62.421 Y-36.488 I0.362 J0.097 E0.0431 F1800
-G1 X60.868 Y-30.692 E0.2195 F1800
-G2 X61.133 Y-30.233 I0.362 J0.097 E0.0152 F1800
-G1 X63.548 Y-29.586 E0.0915 F1800
-G2 X64.007 Y-29.851 I0.097 J-0.362 E0.0152 F1800
-G1 X65.560 Y-35.646 E0.2195 F1800
-G3 X66.284 Y-35.452 I0.362 J0.097 E0.0431 F1800
-G1 X64.731 Y-29.657 E0.2195 F1800
-G2 X64.997 Y-29.198 I0.362 J0.097 E0.0152 F1800
-G1 X67.411 Y-28.550 E0.0915 F1800
-G2 X67.871 Y-28.816 I0.097 J-0.362 E0.0152 F1800
-G1 X69.424 Y-34.611 E0.2195 F1800
-G3 X70.148 Y-34.417 I0.362 J0.097 E0.0431 F1800
-G1 X68.595 Y-28.622 E0.2195 F1800
-G2 X68.860 Y-28.162 I0.362 J0.097 E0.0152 F1800
-G1 X71.275 Y-27.515 E0.0915 F1800
-G2 X71.734 Y-27.780 I0.097 J-0.362 E0.0152 F1800
-G1 X73.287 Y-33.576 E0.2195 F1800
-G3 X74.012 Y-33.382 I0.362 J0.097 E0.0431 F1800
-G1 X72.459 Y-27.586 E0.2195 F1800
-G2 X72.724 Y-27.127 I0.362 J0.097 E0.0152 F1800
-G1 X75.139 Y-26.480 E0.0915 F1800
-G2 X75.598 Y-26.745 I0.097 J-0.362 E0.0152 F1800
-G1 X77.151 Y-32.541 E0.2195 F1800
-G3 X77.875 Y-32.347 I0.362 J0.097 E0.0431 F1800
-G1 X76.323 Y-26.551 E0.2195 F1800
-G2 X76.588 Y-26.092 I0.362 J0.097 E0.0152 F1800
-G1 X79.003 Y-25.445 E0.0915 F1800
-G2 X79.462 Y-25.710 I0.097 J-0.362 E0.0152 F1800
-G1 X81.015 Y-31.505 E0.2195 F1800
-G3 X81.739 Y-31.311 I0.362 J0.097 E0.0431 F1800
-G1 X80.186 Y-25.516 E0.2195 F1800
-G2 X80.451 Y-25.056 I0.362 J0.097 E0.0152 F1800
-G1 X82.866 Y-24.409 E0.0915 F1800
-G2 X83.325 Y-24.675 I0.097 J-0.362 E0.0152 F1800
-G1 X84.878 Y-30.470 E0.2195 F1800
-G3 X85.603 Y-30.276 I0.362 J0.097 E0.0431 F1800
-G1 X84.050 Y-24.480 E0.2195 F1800
-G2 X84.315 Y-24.021 I0.362 J0.097 E0.0152 F1800
-G1 X86.730 Y-23.374 E0.0915 F1800
-G2 X87.189 Y-23.639 I0.097 J-0.362 E0.0152 F1800
-G1 X88.742 Y-29.435 E0.2195 F1800
-G3 X89.467 Y-29.241 I0.362 J0.097 E0.0431 F1800
-G1 X87.914 Y-23.445 E0.2195 F1800
-G2 X88.179 Y-22.986 I0.362 J0.097 E0.0152 F1800
-G1 X90.594 Y-22.339 E0.0915 F1800
-G2 X91.053 Y-22.604 I0.097 J-0.362 E0.0152 F1800
-G1 X92.606 Y-28.400 E0.2195 F1800
-G3 X93.330 Y-28.205 I0.362 J0.097 E0.0431 F1800
-G1 X91.777 Y-22.410 E0.2195 F1800
-G2 X92.043 Y-21.951 I0.362 J0.097 E0.0152 F1800
-G1 X94.457 Y-21.304 E0.0915 F1800
-G2 X94.917 Y-21.569 I0.097 J-0.362 E0.0152 F1800
-G1 X96.470 Y-27.364 E0.2195 F1800
-G3 X97.194 Y-27.170 I0.362 J0.097 E0.0431 F1800
-G1 X95.641 Y-21.375 E0.2195 F1800
-G2 X95.906 Y-20.915 I0.362 J0.097 E0.0152 F1800
-G1 X98.321 Y-20.268 E0.0915 F1800
-G2 X98.780 Y-20.533 I0.097 J-0.362 E0.0152 F1800
-G1 X100.333 Y-26.329
+G1 X34.580 Y-44.051
+G3 X35.304 Y-43.857 I0.362 J0.097 E0.0431 F1800
+G1 X33.751 Y-38.061 E0.2195 F1800
+G2 X34.016 Y-37.602 I0.362 J0.097 E0.0152 F1800
+G1 X36.431 Y-36.955 E0.0915 F1800
+G2 X36.890 Y-37.220 I0.097 J-0.362 E0.0152 F1800
+G1 X38.443 Y-43.016 E0.2195 F1800
+G3 X39.168 Y-42.822 I0.362 J0.097 E0.0431 F1800
+G1 X37.615 Y-37.026 E0.2195 F1800
+G2 X37.880 Y-36.567 I0.362 J0.097 E0.0152 F1800
+G1 X40.295 Y-35.920 E0.0915 F1800
+G2 X40.754 Y-36.185 I0.097 J-0.362 E0.0152 F1800
+G1 X42.307 Y-41.981 E0.2195 F1800
+G3 X43.031 Y-41.786 I0.362 J0.097 E0.0431 F1800
+G1 X41.478 Y-35.991 E0.2195 F1800
+G2 X41.744 Y-35.532 I0.362 J0.097 E0.0152 F1800
+G1 X44.158 Y-34.885 E0.0915 F1800
+G2 X44.618 Y-35.150 I0.097 J-0.362 E0.0152 F1800
+G1 X46.171 Y-40.945 E0.2195 F1800
+G3 X46.895 Y-40.751 I0.362 J0.097 E0.0431 F1800
+G1 X45.342 Y-34.956 E0.2195 F1800
+G2 X45.607 Y-34.496 I0.362 J0.097 E0.0152 F1800
+G1 X48.022 Y-33.849 E0.0915 F1800
+G2 X48.481 Y-34.115 I0.097 J-0.362 E0.0152 F1800
+G1 X50.034 Y-39.910 E0.2195 F1800
+G3 X50.759 Y-39.716 I0.362 J0.097 E0.0431 F1800
+G1 X49.206 Y-33.920 E0.2195 F1800
+G2 X49.471 Y-33.461 I0.362 J0.097 E0.0152 F1800
+G1 X51.886 Y-32.814 E0.0915 F1800
+G2 X52.345 Y-33.079 I0.097 J-0.362 E0.0152 F1800
+G1 X53.898 Y-38.875 E0.2195 F1800
+G3 X54.623 Y-38.681 I0.362 J0.097 E0.0431 F1800
+G1 X53.070 Y-32.885 E0.2195 F1800
+G2 X53.335 Y-32.426 I0.362 J0.097 E0.0152 F1800
+G1 X55.750 Y-31.779 E0.0915 F1800
+G2 X56.209 Y-32.044 I0.097 J-0.362 E0.0152 F1800
+G1 X57.762 Y-37.840 E0.2195 F1800
+G3 X58.486 Y-37.645 I0.362 J0.097 E0.0431 F1800
+G1 X56.933 Y-31.850 E0.2195 F1800
+G2 X57.198 Y-31.391 I0.362 J0.097 E0.0152 F1800
+G1 X59.613 Y-30.744 E0.0915 F1800
+G2 X60.073 Y-31.009 I0.097 J-0.362 E0.0152 F1800
+G1 X61.625 Y-36.804 E0.2195 F1800
+G3 X62.350 Y-36.610 I0.362 J0.097 E0.0431 F1800
+G1 X60.797 Y-30.815 E0.2195 F1800
+G2 X61.062 Y-30.355 I0.362 J0.097 E0.0152 F1800
+G1 X63.477 Y-29.708 E0.0915 F1800
+G2 X63.936 Y-29.973 I0.097 J-0.362 E0.0152 F1800
+G1 X65.489 Y-35.769 E0.2195 F1800
+G3 X66.214 Y-35.575 I0.362 J0.097 E0.0431 F1800
+G1 X64.661 Y-29.779 E0.2195 F1800
+G2 X64.926 Y-29.320 I0.362 J0.097 E0.0152 F1800
+G1 X67.341 Y-28.673 E0.0915 F1800
+G2 X67.800 Y-28.938 I0.097 J-0.362 E0.0152 F1800
+G1 X69.353 Y-34.734 E0.2195 F1800
+G3 X70.077 Y-34.540 I0.362 J0.097 E0.0431 F1800
+G1 X68.524 Y-28.744 E0.2195 F1800
+G2 X68.790 Y-28.285 I0.362 J0.097 E0.0152 F1800
+G1 X71.204 Y-27.638 E0.0915 F1800
+G2 X71.664 Y-27.903 I0.097 J-0.362 E0.0152 F1800
+G1 X73.217 Y-33.698 E0.2195 F1800
+G3 X73.941 Y-33.504 I0.362 J0.097 E0.0431 F1800
+G1 X72.388 Y-27.709 E0.2195 F1800
+G2 X72.653 Y-27.249 I0.362 J0.097 E0.0152 F1800
+G1 X75.068 Y-26.602 E0.0915 F1800
+G2 X75.527 Y-26.868 I0.097 J-0.362 E0.0152 F1800
+G1 X77.080 Y-32.663 E0.2195 F1800
+G3 X77.805 Y-32.469 I0.362 J0.097 E0.0431 F1800
+G1 X76.252 Y-26.673 E0.2195 F1800
+G2 X76.517 Y-26.214 I0.362 J0.097 E0.0152 F1800
+G1 X78.932 Y-25.567 E0.0915 F1800
+G2 X79.391 Y-25.832 I0.097 J-0.362 E0.0152 F1800
+G1 X80.944 Y-31.628 E0.2195 F1800
+G3 X81.668 Y-31.434 I0.362 J0.097 E0.0431 F1800
+G1 X80.116 Y-25.638 E0.2195 F1800
+G2 X80.381 Y-25.179 I0.362 J0.097 E0.0152 F1800
+G1 X82.795 Y-24.532 E0.0915 F1800
+G2 X83.255 Y-24.797 I0.097 J-0.362 E0.0152 F1800
+G1 X84.808 Y-30.593 E0.2195 F1800
+G3 X85.532 Y-30.398 I0.362 J0.097 E0.0431 F1800
+G1 X83.979 Y-24.603 E0.2195 F1800
+G2 X84.244 Y-24.144 I0.362 J0.097 E0.0152 F1800
+G1 X86.659 Y-23.497 E0.0915 F1800
+G2 X87.118 Y-23.762 I0.097 J-0.362 E0.0152 F1800
+G1 X88.671 Y-29.557 E0.2195 F1800
+G3 X89.396 Y-29.363 I0.362 J0.097 E0.0431 F1800
+G1 X87.843 Y-23.568 E0.2195 F1800
+G2 X88.108 Y-23.108 I0.362 J0.097 E0.0152 F1800
+G1 X90.523 Y-22.461 E0.0915 F1800
+G2 X90.982 Y-22.726 I0.097 J-0.362 E0.0152 F1800
+G1 X92.535 Y-28.522 E0.2195 F1800
+G3 X93.260 Y-28.328 I0.362 J0.097 E0.0431 F1800
+G1 X91.707 Y-22.532 E0.2195 F1800
+G2 X91.972 Y-22.073 I0.362 J0.097 E0.0152 F1800
+G1 X94.387 Y-21.426 E0.0915 F1800
+G2 X94.846 Y-21.691 I0.097 J-0.362 E0.0152 F1800
+G1 X96.399 Y-27.487 E0.2195 F1800
+G3 X97.123 Y-27.293 I0.362 J0.097 E0.0431 F1800
+G1 X95.570 Y-21.497 E0.2195 F1800
+G2 X95.835 Y-21.038 I0.362 J0.097 E0.0152 F1800
+G1 X98.250 Y-20.391 E0.0915 F1800
+G2 X98.710 Y-20.656 I0.097 J-0.362 E0.0152 F1800
+G1 X100.263 Y-26.451
 G1 Z0.850 E-5.0000 F4800
-G1 X98.263 Y-18.602
-G1 X30.648 Y-36.719
-G1 X30.250 Y-27.508 F1800
+G1 X98.192 Y-18.724
+G1 X30.577 Y-36.841
+G1 X30.180 Y-27.630 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X31.803 Y-33.304
-G3 X32.528 Y-33.109 I0.362 J0.097 E0.0431 F1800
-G1 X30.975 Y-27.314 E0.2195 F1800
-G2 X31.240 Y-26.855 I0.362 J0.097 E0.0152 F1800
-G1 X33.655 Y-26.208 E0.0915 F1800
-G2 X34.114 Y-26.473 I0.097 J-0.362 E0.0152 F1800
-G1 X35.667 Y-32.268 E0.2195 F1800
-G3 X36.391 Y-32.074 I0.362 J0.097 E0.0431 F1800
-G1 X34.838 Y-26.279 E0.2195 F1800
-G2 X35.104 Y-25.819 I0.362 J0.097 E0.0152 F1800
-G1 X37.518 Y-25.172 E0.0915 F1800
-G2 X37.978 Y-25.437 I0.097 J-0.362 E0.0152 F1800
-G1 X39.531 Y-31.233 E0.2195 F1800
-G3 X40.255 Y-31.039 I0.362 J0.097 E0.0431 F1800
-G1 X38.702 Y-25.243 E0.2195 F1800
-G2 X38.967 Y-24.784 I0.362 J0.097 E0.0152 F1800
-G1 X41.382 Y-24.137 E0.0915 F1800
-G2 X41.841 Y-24.402 I0.097 J-0.362 E0.0152 F1800
-G1 X43.394 Y-30.198 E0.2195 F1800
-G3 X44.119 Y-30.004 I0.362 J0.097 E0.0431 F1800
-G1 X42.566 Y-24.208 E0.2195 F1800
-G2 X42.831 Y-23.749 I0.362 J0.097 E0.0152 F1800
-G1 X45.246 Y-23.102 E0.0915 F1800
-G2 X45.705 Y-23.367 I0.097 J-0.362 E0.0152 F1800
-G1 X47.258 Y-29.162 E0.2195 F1800
-G3 X47.983 Y-28.968 I0.362 J0.097 E0.0431 F1800
-G1 X46.430 Y-23.173 E0.2195 F1800
-G2 X46.695 Y-22.713 I0.362 J0.097 E0.0152 F1800
-G1 X49.110 Y-22.066 E0.0915 F1800
-G2 X49.569 Y-22.332 I0.097 J-0.362 E0.0152 F1800
-G1 X51.122 Y-28.127 E0.2195 F1800
-G3 X51.846 Y-27.933 I0.362 J0.097 E0.0431 F1800
-G1 X50.293 Y-22.137 E0.2195 F1800
-G2 X50.558 Y-21.678 I0.362 J0.097 E0.0152 F1800
-G1 X52.973 Y-21.031 E0.0915 F1800
-G2 X53.433 Y-21.296 I0.097 J-0.362 E0.0152 F1800
-G1 X54.985 Y-27.092 E0.2195 F1800
-G3 X55.710 Y-26.898 I0.362 J0.097 E0.0431 F1800
-G1 X54.157 Y-21.102 E0.2195 F1800
-G2 X54.422 Y-20.643 I0.362 J0.097 E0.0152 F1800
-G1 X56.837 Y-19.996 E0.0915 F1800
-G2 X57.296 Y-20.261 I0.097 J-0.362 E0.0152 F1800
-G1 X58.849 Y-26.057 E0.2195 F1800
-G3 X59.574 Y-25.862 I0.362 J0.097 E0.0431 F1800
-G1 X58.021 Y-20.067 E0.2195 F1800
-G2 X58.286 Y-19.608 I0.362 J0.097 E0.0152 F1800
-G1 X60.701 Y-18.961 E0.0915 F1800
-G2 X61.160 Y-19.226 I0.097 J-0.362 E0.0152 F1800
-G1 X62.713 Y-25.021 E0.2195 F1800
-G3 X63.437 Y-24.827 I0.362 J0.097 E0.0431 F1800
-G1 X61.884 Y-19.032 E0.2195 F1800
-G2 X62.150 Y-18.572 I0.362 J0.097 E0.0152 F1800
-G1 X64.564 Y-17.925 E0.0915 F1800
-G2 X65.024 Y-18.190 I0.097 J-0.362 E0.0152 F1800
-G1 X66.577 Y-23.986 E0.2195 F1800
-G3 X67.301 Y-23.792 I0.362 J0.097 E0.0431 F1800
-G1 X65.748 Y-17.996 E0.2195 F1800
-G2 X66.013 Y-17.537 I0.362 J0.097 E0.0152 F1800
-G1 X68.428 Y-16.890 E0.0915 F1800
-G2 X68.887 Y-17.155 I0.097 J-0.362 E0.0152 F1800
-G1 X70.440 Y-22.951 E0.2195 F1800
-G3 X71.165 Y-22.757 I0.362 J0.097 E0.0431 F1800
-G1 X69.612 Y-16.961 E0.2195 F1800
-G2 X69.877 Y-16.502 I0.362 J0.097 E0.0152 F1800
-G1 X72.292 Y-15.855 E0.0915 F1800
-G2 X72.751 Y-16.120 I0.097 J-0.362 E0.0152 F1800
-G1 X74.304 Y-21.915 E0.2195 F1800
-G3 X75.028 Y-21.721 I0.362 J0.097 E0.0431 F1800
-G1 X73.476 Y-15.926 E0.2195 F1800
-G2 X73.741 Y-15.467 I0.362 J0.097 E0.0152 F1800
-G1 X76.155 Y-14.819 E0.0915 F1800
-G2 X76.615 Y-15.085 I0.097 J-0.362 E0.0152 F1800
-G1 X78.168 Y-20.880 E0.2195 F1800
-G3 X78.892 Y-20.686 I0.362 J0.097 E0.0431 F1800
-G1 X77.339 Y-14.891 E0.2195 F1800
-G2 X77.604 Y-14.431 I0.362 J0.097 E0.0152 F1800
-G1 X80.019 Y-13.784 E0.0915 F1800
-G2 X80.478 Y-14.049 I0.097 J-0.362 E0.0152 F1800
-G1 X82.031 Y-19.845 E0.2195 F1800
-G3 X82.756 Y-19.651 I0.362 J0.097 E0.0431 F1800
-G1 X81.203 Y-13.855 E0.2195 F1800
-G2 X81.468 Y-13.396 I0.362 J0.097 E0.0152 F1800
-G1 X83.883 Y-12.749 E0.0915 F1800
-G2 X84.342 Y-13.014 I0.097 J-0.362 E0.0152 F1800
-G1 X85.895 Y-18.810 E0.2195 F1800
-G3 X86.620 Y-18.616 I0.362 J0.097 E0.0431 F1800
-G1 X85.067 Y-12.820 E0.2195 F1800
-G2 X85.332 Y-12.361 I0.362 J0.097 E0.0152 F1800
-G1 X87.747 Y-11.714 E0.0915 F1800
-G2 X88.206 Y-11.979 I0.097 J-0.362 E0.0152 F1800
-G1 X89.759 Y-17.774 E0.2195 F1800
-G3 X90.483 Y-17.580 I0.362 J0.097 E0.0431 F1800
-G1 X88.930 Y-11.785 E0.2195 F1800
-G2 X89.195 Y-11.325 I0.362 J0.097 E0.0152 F1800
-G1 X91.610 Y-10.678 E0.0915 F1800
-G2 X92.070 Y-10.944 I0.097 J-0.362 E0.0152 F1800
-G1 X93.623 Y-16.739 E0.2195 F1800
-G3 X94.347 Y-16.545 I0.362 J0.097 E0.0431 F1800
-G1 X92.794 Y-10.749 E0.2195 F1800
-G2 X93.059 Y-10.290 I0.362 J0.097 E0.0152 F1800
-G1 X95.474 Y-9.643 E0.0915 F1800
-G2 X95.933 Y-9.908 I0.097 J-0.362 E0.0152 F1800
-G1 X97.486 Y-15.704
+G1 X31.733 Y-33.426
+G3 X32.457 Y-33.232 I0.362 J0.097 E0.0431 F1800
+G1 X30.904 Y-27.436 E0.2195 F1800
+G2 X31.169 Y-26.977 I0.362 J0.097 E0.0152 F1800
+G1 X33.584 Y-26.330 E0.0915 F1800
+G2 X34.043 Y-26.595 I0.097 J-0.362 E0.0152 F1800
+G1 X35.596 Y-32.391 E0.2195 F1800
+G3 X36.321 Y-32.197 I0.362 J0.097 E0.0431 F1800
+G1 X34.768 Y-26.401 E0.2195 F1800
+G2 X35.033 Y-25.942 I0.362 J0.097 E0.0152 F1800
+G1 X37.448 Y-25.295 E0.0915 F1800
+G2 X37.907 Y-25.560 I0.097 J-0.362 E0.0152 F1800
+G1 X39.460 Y-31.355 E0.2195 F1800
+G3 X40.184 Y-31.161 I0.362 J0.097 E0.0431 F1800
+G1 X38.631 Y-25.366 E0.2195 F1800
+G2 X38.897 Y-24.906 I0.362 J0.097 E0.0152 F1800
+G1 X41.311 Y-24.259 E0.0915 F1800
+G2 X41.771 Y-24.525 I0.097 J-0.362 E0.0152 F1800
+G1 X43.324 Y-30.320 E0.2195 F1800
+G3 X44.048 Y-30.126 I0.362 J0.097 E0.0431 F1800
+G1 X42.495 Y-24.330 E0.2195 F1800
+G2 X42.760 Y-23.871 I0.362 J0.097 E0.0152 F1800
+G1 X45.175 Y-23.224 E0.0915 F1800
+G2 X45.634 Y-23.489 I0.097 J-0.362 E0.0152 F1800
+G1 X47.187 Y-29.285 E0.2195 F1800
+G3 X47.912 Y-29.091 I0.362 J0.097 E0.0431 F1800
+G1 X46.359 Y-23.295 E0.2195 F1800
+G2 X46.624 Y-22.836 I0.362 J0.097 E0.0152 F1800
+G1 X49.039 Y-22.189 E0.0915 F1800
+G2 X49.498 Y-22.454 I0.097 J-0.362 E0.0152 F1800
+G1 X51.051 Y-28.250 E0.2195 F1800
+G3 X51.776 Y-28.055 I0.362 J0.097 E0.0431 F1800
+G1 X50.223 Y-22.260 E0.2195 F1800
+G2 X50.488 Y-21.801 I0.362 J0.097 E0.0152 F1800
+G1 X52.903 Y-21.154 E0.0915 F1800
+G2 X53.362 Y-21.419 I0.097 J-0.362 E0.0152 F1800
+G1 X54.915 Y-27.214 E0.2195 F1800
+G3 X55.639 Y-27.020 I0.362 J0.097 E0.0431 F1800
+G1 X54.086 Y-21.225 E0.2195 F1800
+G2 X54.351 Y-20.765 I0.362 J0.097 E0.0152 F1800
+G1 X56.766 Y-20.118 E0.0915 F1800
+G2 X57.226 Y-20.383 I0.097 J-0.362 E0.0152 F1800
+G1 X58.778 Y-26.179 E0.2195 F1800
+G3 X59.503 Y-25.985 I0.362 J0.097 E0.0431 F1800
+G1 X57.950 Y-20.189 E0.2195 F1800
+G2 X58.215 Y-19.730 I0.362 J0.097 E0.0152 F1800
+G1 X60.630 Y-19.083 E0.0915 F1800
+G2 X61.089 Y-19.348 I0.097 J-0.362 E0.0152 F1800
+G1 X62.642 Y-25.144 E0.2195 F1800
+G3 X63.367 Y-24.950 I0.362 J0.097 E0.0431 F1800
+G1 X61.814 Y-19.154 E0.2195 F1800
+G2 X62.079 Y-18.695 I0.362 J0.097 E0.0152 F1800
+G1 X64.494 Y-18.048 E0.0915 F1800
+G2 X64.953 Y-18.313 I0.097 J-0.362 E0.0152 F1800
+G1 X66.506 Y-24.108 E0.2195 F1800
+G3 X67.230 Y-23.914 I0.362 J0.097 E0.0431 F1800
+G1 X65.677 Y-18.119 E0.2195 F1800
+G2 X65.943 Y-17.660 I0.362 J0.097 E0.0152 F1800
+G1 X68.357 Y-17.012 E0.0915 F1800
+G2 X68.817 Y-17.278 I0.097 J-0.362 E0.0152 F1800
+G1 X70.370 Y-23.073 E0.2195 F1800
+G3 X71.094 Y-22.879 I0.362 J0.097 E0.0431 F1800
+G1 X69.541 Y-17.084 E0.2195 F1800
+G2 X69.806 Y-16.624 I0.362 J0.097 E0.0152 F1800
+G1 X72.221 Y-15.977 E0.0915 F1800
+G2 X72.680 Y-16.242 I0.097 J-0.362 E0.0152 F1800
+G1 X74.233 Y-22.038 E0.2195 F1800
+G3 X74.958 Y-21.844 I0.362 J0.097 E0.0431 F1800
+G1 X73.405 Y-16.048 E0.2195 F1800
+G2 X73.670 Y-15.589 I0.362 J0.097 E0.0152 F1800
+G1 X76.085 Y-14.942 E0.0915 F1800
+G2 X76.544 Y-15.207 I0.097 J-0.362 E0.0152 F1800
+G1 X78.097 Y-21.003 E0.2195 F1800
+G3 X78.821 Y-20.809 I0.362 J0.097 E0.0431 F1800
+G1 X77.269 Y-15.013 E0.2195 F1800
+G2 X77.534 Y-14.554 I0.362 J0.097 E0.0152 F1800
+G1 X79.948 Y-13.907 E0.0915 F1800
+G2 X80.408 Y-14.172 I0.097 J-0.362 E0.0152 F1800
+G1 X81.961 Y-19.967 E0.2195 F1800
+G3 X82.685 Y-19.773 I0.362 J0.097 E0.0431 F1800
+G1 X81.132 Y-13.978 E0.2195 F1800
+G2 X81.397 Y-13.518 I0.362 J0.097 E0.0152 F1800
+G1 X83.812 Y-12.871 E0.0915 F1800
+G2 X84.271 Y-13.137 I0.097 J-0.362 E0.0152 F1800
+G1 X85.824 Y-18.932 E0.2195 F1800
+G3 X86.549 Y-18.738 I0.362 J0.097 E0.0431 F1800
+G1 X84.996 Y-12.942 E0.2195 F1800
+G2 X85.261 Y-12.483 I0.362 J0.097 E0.0152 F1800
+G1 X87.676 Y-11.836 E0.0915 F1800
+G2 X88.135 Y-12.101 I0.097 J-0.362 E0.0152 F1800
+G1 X89.688 Y-17.897 E0.2195 F1800
+G3 X90.413 Y-17.703 I0.362 J0.097 E0.0431 F1800
+G1 X88.860 Y-11.907 E0.2195 F1800
+G2 X89.125 Y-11.448 I0.362 J0.097 E0.0152 F1800
+G1 X91.540 Y-10.801 E0.0915 F1800
+G2 X91.999 Y-11.066 I0.097 J-0.362 E0.0152 F1800
+G1 X93.552 Y-16.862 E0.2195 F1800
+G3 X94.276 Y-16.667 I0.362 J0.097 E0.0431 F1800
+G1 X92.723 Y-10.872 E0.2195 F1800
+G2 X92.988 Y-10.413 I0.362 J0.097 E0.0152 F1800
+G1 X95.403 Y-9.766 E0.0915 F1800
+G2 X95.863 Y-10.031 I0.097 J-0.362 E0.0152 F1800
+G1 X97.415 Y-15.826
 G1 Z0.850 E-5.0000 F4800
-G1 X95.416 Y-7.976
-G1 X27.801 Y-26.094
+G1 X95.345 Y-8.099
+G1 X27.730 Y-26.216
 ;print horizontal interlocked reference pattern 1
-G1 X27.403 Y-16.883 F1800
+G1 X27.333 Y-17.005 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X28.956 Y-22.678
-G3 X29.681 Y-22.484 I0.362 J0.097 E0.0431 F1800
-G1 X28.128 Y-16.689 E0.2195 F1800
-G2 X28.393 Y-16.229 I0.362 J0.097 E0.0152 F1800
-G1 X30.808 Y-15.582 E0.0915 F1800
-G2 X31.267 Y-15.847 I0.097 J-0.362 E0.0152 F1800
-G1 X32.820 Y-21.643 E0.2195 F1800
-G3 X33.544 Y-21.449 I0.362 J0.097 E0.0431 F1800
-G1 X31.991 Y-15.653 E0.2195 F1800
-G2 X32.257 Y-15.194 I0.362 J0.097 E0.0152 F1800
-G1 X34.671 Y-14.547 E0.0915 F1800
-G2 X35.131 Y-14.812 I0.097 J-0.362 E0.0152 F1800
-G1 X36.684 Y-20.608 E0.2195 F1800
-G3 X37.408 Y-20.414 I0.362 J0.097 E0.0431 F1800
-G1 X35.855 Y-14.618 E0.2195 F1800
-G2 X36.120 Y-14.159 I0.362 J0.097 E0.0152 F1800
-G1 X38.535 Y-13.512 E0.0915 F1800
-G2 X38.994 Y-13.777 I0.097 J-0.362 E0.0152 F1800
-G1 X40.547 Y-19.572 E0.2195 F1800
-G3 X41.272 Y-19.378 I0.362 J0.097 E0.0431 F1800
-G1 X39.719 Y-13.583 E0.2195 F1800
-G2 X39.984 Y-13.124 I0.362 J0.097 E0.0152 F1800
-G1 X42.399 Y-12.476 E0.0915 F1800
-G2 X42.858 Y-12.742 I0.097 J-0.362 E0.0152 F1800
-G1 X44.411 Y-18.537 E0.2195 F1800
-G3 X45.135 Y-18.343 I0.362 J0.097 E0.0431 F1800
-G1 X43.583 Y-12.548 E0.2195 F1800
-G2 X43.848 Y-12.088 I0.362 J0.097 E0.0152 F1800
-G1 X46.263 Y-11.441 E0.0915 F1800
-G2 X46.722 Y-11.706 I0.097 J-0.362 E0.0152 F1800
-G1 X48.275 Y-17.502 E0.2195 F1800
-G3 X48.999 Y-17.308 I0.362 J0.097 E0.0431 F1800
-G1 X47.446 Y-11.512 E0.2195 F1800
-G2 X47.711 Y-11.053 I0.362 J0.097 E0.0152 F1800
-G1 X50.126 Y-10.406 E0.0915 F1800
-G2 X50.586 Y-10.671 I0.097 J-0.362 E0.0152 F1800
-G1 X52.138 Y-16.467 E0.2195 F1800
-G3 X52.863 Y-16.273 I0.362 J0.097 E0.0431 F1800
-G1 X51.310 Y-10.477 E0.2195 F1800
-G2 X51.575 Y-10.018 I0.362 J0.097 E0.0152 F1800
-G1 X53.990 Y-9.371 E0.0915 F1800
-G2 X54.449 Y-9.636 I0.097 J-0.362 E0.0152 F1800
-G1 X56.002 Y-15.431 E0.2195 F1800
-G3 X56.727 Y-15.237 I0.362 J0.097 E0.0431 F1800
-G1 X55.174 Y-9.442 E0.2195 F1800
-G2 X55.439 Y-8.982 I0.362 J0.097 E0.0152 F1800
-G1 X57.854 Y-8.335 E0.0915 F1800
-G2 X58.313 Y-8.601 I0.097 J-0.362 E0.0152 F1800
-G1 X59.866 Y-14.396 E0.2195 F1800
-G3 X60.590 Y-14.202 I0.362 J0.097 E0.0431 F1800
-G1 X59.037 Y-8.406 E0.2195 F1800
-G2 X59.303 Y-7.947 I0.362 J0.097 E0.0152 F1800
-G1 X61.717 Y-7.300 E0.0915 F1800
-G2 X62.177 Y-7.565 I0.097 J-0.362 E0.0152 F1800
-G1 X63.730 Y-13.361 E0.2195 F1800
-G3 X64.454 Y-13.167 I0.362 J0.097 E0.0431 F1800
-G1 X62.901 Y-7.371 E0.2195 F1800
-G2 X63.166 Y-6.912 I0.362 J0.097 E0.0152 F1800
-G1 X65.581 Y-6.265 E0.0915 F1800
-G2 X66.040 Y-6.530 I0.097 J-0.362 E0.0152 F1800
-G1 X67.593 Y-12.326 E0.2195 F1800
-G3 X68.318 Y-12.131 I0.362 J0.097 E0.0431 F1800
-G1 X66.765 Y-6.336 E0.2195 F1800
-G2 X67.030 Y-5.877 I0.362 J0.097 E0.0152 F1800
-G1 X69.445 Y-5.230 E0.0915 F1800
-G2 X69.904 Y-5.495 I0.097 J-0.362 E0.0152 F1800
-G1 X71.457 Y-11.290 E0.2195 F1800
-G3 X72.181 Y-11.096 I0.362 J0.097 E0.0431 F1800
-G1 X70.629 Y-5.301 E0.2195 F1800
-G2 X70.894 Y-4.841 I0.362 J0.097 E0.0152 F1800
-G1 X73.308 Y-4.194 E0.0915 F1800
-G2 X73.768 Y-4.459 I0.097 J-0.362 E0.0152 F1800
-G1 X75.321 Y-10.255 E0.2195 F1800
-G3 X76.045 Y-10.061 I0.362 J0.097 E0.0431 F1800
-G1 X74.492 Y-4.265 E0.2195 F1800
-G2 X74.757 Y-3.806 I0.362 J0.097 E0.0152 F1800
-G1 X77.172 Y-3.159 E0.0915 F1800
-G2 X77.631 Y-3.424 I0.097 J-0.362 E0.0152 F1800
-G1 X79.184 Y-9.220 E0.2195 F1800
-G3 X79.909 Y-9.026 I0.362 J0.097 E0.0431 F1800
-G1 X78.356 Y-3.230 E0.2195 F1800
-G2 X78.621 Y-2.771 I0.362 J0.097 E0.0152 F1800
-G1 X81.036 Y-2.124 E0.0915 F1800
-G2 X81.495 Y-2.389 I0.097 J-0.362 E0.0152 F1800
-G1 X83.048 Y-8.184 E0.2195 F1800
-G3 X83.773 Y-7.990 I0.362 J0.097 E0.0431 F1800
-G1 X82.220 Y-2.195 E0.2195 F1800
-G2 X82.485 Y-1.736 I0.362 J0.097 E0.0152 F1800
-G1 X84.900 Y-1.088 E0.0915 F1800
-G2 X85.359 Y-1.354 I0.097 J-0.362 E0.0152 F1800
-G1 X86.912 Y-7.149 E0.2195 F1800
-G3 X87.636 Y-6.955 I0.362 J0.097 E0.0431 F1800
-G1 X86.083 Y-1.160 E0.2195 F1800
-G2 X86.348 Y-0.700 I0.362 J0.097 E0.0152 F1800
-G1 X88.763 Y-0.053 E0.0915 F1800
-G2 X89.223 Y-0.318 I0.097 J-0.362 E0.0152 F1800
-G1 X90.775 Y-6.114 E0.2195 F1800
-G3 X91.500 Y-5.920 I0.362 J0.097 E0.0431 F1800
-G1 X89.947 Y-0.124 E0.2195 F1800
-G2 X90.212 Y0.335 I0.362 J0.097 E0.0152 F1800
-G1 X92.627 Y0.982 E0.0915 F1800
-G2 X93.086 Y0.717 I0.097 J-0.362 E0.0152 F1800
-G1 X94.639 Y-5.079
+G1 X28.886 Y-22.801
+G3 X29.610 Y-22.607 I0.362 J0.097 E0.0431 F1800
+G1 X28.057 Y-16.811 E0.2195 F1800
+G2 X28.322 Y-16.352 I0.362 J0.097 E0.0152 F1800
+G1 X30.737 Y-15.705 E0.0915 F1800
+G2 X31.196 Y-15.970 I0.097 J-0.362 E0.0152 F1800
+G1 X32.749 Y-21.766 E0.2195 F1800
+G3 X33.474 Y-21.571 I0.362 J0.097 E0.0431 F1800
+G1 X31.921 Y-15.776 E0.2195 F1800
+G2 X32.186 Y-15.317 I0.362 J0.097 E0.0152 F1800
+G1 X34.601 Y-14.670 E0.0915 F1800
+G2 X35.060 Y-14.935 I0.097 J-0.362 E0.0152 F1800
+G1 X36.613 Y-20.730 E0.2195 F1800
+G3 X37.337 Y-20.536 I0.362 J0.097 E0.0431 F1800
+G1 X35.784 Y-14.741 E0.2195 F1800
+G2 X36.050 Y-14.281 I0.362 J0.097 E0.0152 F1800
+G1 X38.464 Y-13.634 E0.0915 F1800
+G2 X38.924 Y-13.899 I0.097 J-0.362 E0.0152 F1800
+G1 X40.477 Y-19.695 E0.2195 F1800
+G3 X41.201 Y-19.501 I0.362 J0.097 E0.0431 F1800
+G1 X39.648 Y-13.705 E0.2195 F1800
+G2 X39.913 Y-13.246 I0.362 J0.097 E0.0152 F1800
+G1 X42.328 Y-12.599 E0.0915 F1800
+G2 X42.787 Y-12.864 I0.097 J-0.362 E0.0152 F1800
+G1 X44.340 Y-18.660 E0.2195 F1800
+G3 X45.065 Y-18.466 I0.362 J0.097 E0.0431 F1800
+G1 X43.512 Y-12.670 E0.2195 F1800
+G2 X43.777 Y-12.211 I0.362 J0.097 E0.0152 F1800
+G1 X46.192 Y-11.564 E0.0915 F1800
+G2 X46.651 Y-11.829 I0.097 J-0.362 E0.0152 F1800
+G1 X48.204 Y-17.624 E0.2195 F1800
+G3 X48.928 Y-17.430 I0.362 J0.097 E0.0431 F1800
+G1 X47.376 Y-11.635 E0.2195 F1800
+G2 X47.641 Y-11.175 I0.362 J0.097 E0.0152 F1800
+G1 X50.056 Y-10.528 E0.0915 F1800
+G2 X50.515 Y-10.794 I0.097 J-0.362 E0.0152 F1800
+G1 X52.068 Y-16.589 E0.2195 F1800
+G3 X52.792 Y-16.395 I0.362 J0.097 E0.0431 F1800
+G1 X51.239 Y-10.599 E0.2195 F1800
+G2 X51.504 Y-10.140 I0.362 J0.097 E0.0152 F1800
+G1 X53.919 Y-9.493 E0.0915 F1800
+G2 X54.379 Y-9.758 I0.097 J-0.362 E0.0152 F1800
+G1 X55.931 Y-15.554 E0.2195 F1800
+G3 X56.656 Y-15.360 I0.362 J0.097 E0.0431 F1800
+G1 X55.103 Y-9.564 E0.2195 F1800
+G2 X55.368 Y-9.105 I0.362 J0.097 E0.0152 F1800
+G1 X57.783 Y-8.458 E0.0915 F1800
+G2 X58.242 Y-8.723 I0.097 J-0.362 E0.0152 F1800
+G1 X59.795 Y-14.519 E0.2195 F1800
+G3 X60.520 Y-14.324 I0.362 J0.097 E0.0431 F1800
+G1 X58.967 Y-8.529 E0.2195 F1800
+G2 X59.232 Y-8.070 I0.362 J0.097 E0.0152 F1800
+G1 X61.647 Y-7.423 E0.0915 F1800
+G2 X62.106 Y-7.688 I0.097 J-0.362 E0.0152 F1800
+G1 X63.659 Y-13.483 E0.2195 F1800
+G3 X64.383 Y-13.289 I0.362 J0.097 E0.0431 F1800
+G1 X62.830 Y-7.494 E0.2195 F1800
+G2 X63.096 Y-7.034 I0.362 J0.097 E0.0152 F1800
+G1 X65.510 Y-6.387 E0.0915 F1800
+G2 X65.970 Y-6.652 I0.097 J-0.362 E0.0152 F1800
+G1 X67.523 Y-12.448 E0.2195 F1800
+G3 X68.247 Y-12.254 I0.362 J0.097 E0.0431 F1800
+G1 X66.694 Y-6.458 E0.2195 F1800
+G2 X66.959 Y-5.999 I0.362 J0.097 E0.0152 F1800
+G1 X69.374 Y-5.352 E0.0915 F1800
+G2 X69.833 Y-5.617 I0.097 J-0.362 E0.0152 F1800
+G1 X71.386 Y-11.413 E0.2195 F1800
+G3 X72.111 Y-11.219 I0.362 J0.097 E0.0431 F1800
+G1 X70.558 Y-5.423 E0.2195 F1800
+G2 X70.823 Y-4.964 I0.362 J0.097 E0.0152 F1800
+G1 X73.238 Y-4.317 E0.0915 F1800
+G2 X73.697 Y-4.582 I0.097 J-0.362 E0.0152 F1800
+G1 X75.250 Y-10.377 E0.2195 F1800
+G3 X75.974 Y-10.183 I0.362 J0.097 E0.0431 F1800
+G1 X74.421 Y-4.388 E0.2195 F1800
+G2 X74.687 Y-3.929 I0.362 J0.097 E0.0152 F1800
+G1 X77.101 Y-3.281 E0.0915 F1800
+G2 X77.561 Y-3.547 I0.097 J-0.362 E0.0152 F1800
+G1 X79.114 Y-9.342 E0.2195 F1800
+G3 X79.838 Y-9.148 I0.362 J0.097 E0.0431 F1800
+G1 X78.285 Y-3.353 E0.2195 F1800
+G2 X78.550 Y-2.893 I0.362 J0.097 E0.0152 F1800
+G1 X80.965 Y-2.246 E0.0915 F1800
+G2 X81.424 Y-2.511 I0.097 J-0.362 E0.0152 F1800
+G1 X82.977 Y-8.307 E0.2195 F1800
+G3 X83.702 Y-8.113 I0.362 J0.097 E0.0431 F1800
+G1 X82.149 Y-2.317 E0.2195 F1800
+G2 X82.414 Y-1.858 I0.362 J0.097 E0.0152 F1800
+G1 X84.829 Y-1.211 E0.0915 F1800
+G2 X85.288 Y-1.476 I0.097 J-0.362 E0.0152 F1800
+G1 X86.841 Y-7.272 E0.2195 F1800
+G3 X87.566 Y-7.078 I0.362 J0.097 E0.0431 F1800
+G1 X86.013 Y-1.282 E0.2195 F1800
+G2 X86.278 Y-0.823 I0.362 J0.097 E0.0152 F1800
+G1 X88.693 Y-0.176 E0.0915 F1800
+G2 X89.152 Y-0.441 I0.097 J-0.362 E0.0152 F1800
+G1 X90.705 Y-6.236 E0.2195 F1800
+G3 X91.429 Y-6.042 I0.362 J0.097 E0.0431 F1800
+G1 X89.876 Y-0.247 E0.2195 F1800
+G2 X90.141 Y0.213 I0.362 J0.097 E0.0152 F1800
+G1 X92.556 Y0.860 E0.0915 F1800
+G2 X93.016 Y0.594 I0.097 J-0.362 E0.0152 F1800
+G1 X94.568 Y-5.201
 G1 Z0.850 E-5.0000 F4800
-G1 X92.569 Y2.649
-G1 X24.954 Y-15.469
-G1 X24.556 Y-6.258 F1800
+G1 X92.498 Y2.526
+G1 X24.883 Y-15.591
+G1 X24.486 Y-6.380 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X26.109 Y-12.053
-G3 X26.834 Y-11.859 I0.362 J0.097 E0.0431 F1800
-G1 X25.281 Y-6.063 E0.2195 F1800
-G2 X25.546 Y-5.604 I0.362 J0.097 E0.0152 F1800
-G1 X27.961 Y-4.957 E0.0915 F1800
-G2 X28.420 Y-5.222 I0.097 J-0.362 E0.0152 F1800
-G1 X29.973 Y-11.018 E0.2195 F1800
-G3 X30.697 Y-10.824 I0.362 J0.097 E0.0431 F1800
-G1 X29.144 Y-5.028 E0.2195 F1800
-G2 X29.410 Y-4.569 I0.362 J0.097 E0.0152 F1800
-G1 X31.824 Y-3.922 E0.0915 F1800
-G2 X32.284 Y-4.187 I0.097 J-0.362 E0.0152 F1800
-G1 X33.837 Y-9.983 E0.2195 F1800
-G3 X34.561 Y-9.788 I0.362 J0.097 E0.0431 F1800
-G1 X33.008 Y-3.993 E0.2195 F1800
-G2 X33.273 Y-3.534 I0.362 J0.097 E0.0152 F1800
-G1 X35.688 Y-2.887 E0.0915 F1800
-G2 X36.147 Y-3.152 I0.097 J-0.362 E0.0152 F1800
-G1 X37.700 Y-8.947 E0.2195 F1800
-G3 X38.425 Y-8.753 I0.362 J0.097 E0.0431 F1800
-G1 X36.872 Y-2.958 E0.2195 F1800
-G2 X37.137 Y-2.498 I0.362 J0.097 E0.0152 F1800
-G1 X39.552 Y-1.851 E0.0915 F1800
-G2 X40.011 Y-2.116 I0.097 J-0.362 E0.0152 F1800
-G1 X41.564 Y-7.912 E0.2195 F1800
-G3 X42.288 Y-7.718 I0.362 J0.097 E0.0431 F1800
-G1 X40.736 Y-1.922 E0.2195 F1800
-G2 X41.001 Y-1.463 I0.362 J0.097 E0.0152 F1800
-G1 X43.416 Y-0.816 E0.0915 F1800
-G2 X43.875 Y-1.081 I0.097 J-0.362 E0.0152 F1800
-G1 X45.428 Y-6.877 E0.2195 F1800
-G3 X46.152 Y-6.683 I0.362 J0.097 E0.0431 F1800
-G1 X44.599 Y-0.887 E0.2195 F1800
-G2 X44.864 Y-0.428 I0.362 J0.097 E0.0152 F1800
-G1 X47.279 Y0.219 E0.0915 F1800
-G2 X47.739 Y-0.046 I0.097 J-0.362 E0.0152 F1800
-G1 X49.291 Y-5.841 E0.2195 F1800
-G3 X50.016 Y-5.647 I0.362 J0.097 E0.0431 F1800
-G1 X48.463 Y0.148 E0.2195 F1800
-G2 X48.728 Y0.607 I0.362 J0.097 E0.0152 F1800
-G1 X51.143 Y1.255 E0.0915 F1800
-G2 X51.602 Y0.989 I0.097 J-0.362 E0.0152 F1800
-G1 X53.155 Y-4.806 E0.2195 F1800
-G3 X53.880 Y-4.612 I0.362 J0.097 E0.0431 F1800
-G1 X52.327 Y1.183 E0.2195 F1800
-G2 X52.592 Y1.643 I0.362 J0.097 E0.0152 F1800
-G1 X55.007 Y2.290 E0.0915 F1800
-G2 X55.466 Y2.025 I0.097 J-0.362 E0.0152 F1800
-G1 X57.019 Y-3.771 E0.2195 F1800
-G3 X57.743 Y-3.577 I0.362 J0.097 E0.0431 F1800
-G1 X56.190 Y2.219 E0.2195 F1800
-G2 X56.456 Y2.678 I0.362 J0.097 E0.0152 F1800
-G1 X58.870 Y3.325 E0.0915 F1800
-G2 X59.330 Y3.060 I0.097 J-0.362 E0.0152 F1800
-G1 X60.883 Y-2.736 E0.2195 F1800
-G3 X61.607 Y-2.542 I0.362 J0.097 E0.0431 F1800
-G1 X60.054 Y3.254 E0.2195 F1800
-G2 X60.319 Y3.713 I0.362 J0.097 E0.0152 F1800
-G1 X62.734 Y4.360 E0.0915 F1800
-G2 X63.193 Y4.095 I0.097 J-0.362 E0.0152 F1800
-G1 X64.746 Y-1.700 E0.2195 F1800
-G3 X65.471 Y-1.506 I0.362 J0.097 E0.0431 F1800
-G1 X63.918 Y4.289 E0.2195 F1800
-G2 X64.183 Y4.749 I0.362 J0.097 E0.0152 F1800
-G1 X66.598 Y5.396 E0.0915 F1800
-G2 X67.057 Y5.130 I0.097 J-0.362 E0.0152 F1800
-G1 X68.610 Y-0.665 E0.2195 F1800
-G3 X69.334 Y-0.471 I0.362 J0.097 E0.0431 F1800
-G1 X67.781 Y5.325 E0.2195 F1800
-G2 X68.047 Y5.784 I0.362 J0.097 E0.0152 F1800
-G1 X70.461 Y6.431 E0.0915 F1800
-G2 X70.921 Y6.166 I0.097 J-0.362 E0.0152 F1800
-G1 X72.474 Y0.370 E0.2195 F1800
-G3 X73.198 Y0.564 I0.362 J0.097 E0.0431 F1800
-G1 X71.645 Y6.360 E0.2195 F1800
-G2 X71.910 Y6.819 I0.362 J0.097 E0.0152 F1800
-G1 X74.325 Y7.466 E0.0915 F1800
-G2 X74.784 Y7.201 I0.097 J-0.362 E0.0152 F1800
-G1 X76.337 Y1.405 E0.2195 F1800
-G3 X77.062 Y1.600 I0.362 J0.097 E0.0431 F1800
-G1 X75.509 Y7.395 E0.2195 F1800
-G2 X75.774 Y7.854 I0.362 J0.097 E0.0152 F1800
-G1 X78.189 Y8.501 E0.0915 F1800
-G2 X78.648 Y8.236 I0.097 J-0.362 E0.0152 F1800
-G1 X80.201 Y2.441 E0.2195 F1800
-G3 X80.926 Y2.635 I0.362 J0.097 E0.0431 F1800
-G1 X79.373 Y8.430 E0.2195 F1800
-G2 X79.638 Y8.890 I0.362 J0.097 E0.0152 F1800
-G1 X82.053 Y9.537 E0.0915 F1800
-G2 X82.512 Y9.272 I0.097 J-0.362 E0.0152 F1800
-G1 X84.065 Y3.476 E0.2195 F1800
-G3 X84.789 Y3.670 I0.362 J0.097 E0.0431 F1800
-G1 X83.236 Y9.466 E0.2195 F1800
-G2 X83.501 Y9.925 I0.362 J0.097 E0.0152 F1800
-G1 X85.916 Y10.572 E0.0915 F1800
-G2 X86.376 Y10.307 I0.097 J-0.362 E0.0152 F1800
-G1 X87.928 Y4.511 E0.2195 F1800
-G3 X88.653 Y4.705 I0.362 J0.097 E0.0431 F1800
-G1 X87.100 Y10.501 E0.2195 F1800
-G2 X87.365 Y10.960 I0.362 J0.097 E0.0152 F1800
-G1 X89.780 Y11.607 E0.0915 F1800
-G2 X90.239 Y11.342 I0.097 J-0.362 E0.0152 F1800
-G1 X91.792 Y5.547
+G1 X26.039 Y-12.176
+G3 X26.763 Y-11.981 I0.362 J0.097 E0.0431 F1800
+G1 X25.210 Y-6.186 E0.2195 F1800
+G2 X25.475 Y-5.727 I0.362 J0.097 E0.0152 F1800
+G1 X27.890 Y-5.080 E0.0915 F1800
+G2 X28.349 Y-5.345 I0.097 J-0.362 E0.0152 F1800
+G1 X29.902 Y-11.140 E0.2195 F1800
+G3 X30.627 Y-10.946 I0.362 J0.097 E0.0431 F1800
+G1 X29.074 Y-5.151 E0.2195 F1800
+G2 X29.339 Y-4.691 I0.362 J0.097 E0.0152 F1800
+G1 X31.754 Y-4.044 E0.0915 F1800
+G2 X32.213 Y-4.310 I0.097 J-0.362 E0.0152 F1800
+G1 X33.766 Y-10.105 E0.2195 F1800
+G3 X34.490 Y-9.911 I0.362 J0.097 E0.0431 F1800
+G1 X32.937 Y-4.115 E0.2195 F1800
+G2 X33.203 Y-3.656 I0.362 J0.097 E0.0152 F1800
+G1 X35.617 Y-3.009 E0.0915 F1800
+G2 X36.077 Y-3.274 I0.097 J-0.362 E0.0152 F1800
+G1 X37.630 Y-9.070 E0.2195 F1800
+G3 X38.354 Y-8.876 I0.362 J0.097 E0.0431 F1800
+G1 X36.801 Y-3.080 E0.2195 F1800
+G2 X37.066 Y-2.621 I0.362 J0.097 E0.0152 F1800
+G1 X39.481 Y-1.974 E0.0915 F1800
+G2 X39.940 Y-2.239 I0.097 J-0.362 E0.0152 F1800
+G1 X41.493 Y-8.035 E0.2195 F1800
+G3 X42.218 Y-7.840 I0.362 J0.097 E0.0431 F1800
+G1 X40.665 Y-2.045 E0.2195 F1800
+G2 X40.930 Y-1.586 I0.362 J0.097 E0.0152 F1800
+G1 X43.345 Y-0.939 E0.0915 F1800
+G2 X43.804 Y-1.204 I0.097 J-0.362 E0.0152 F1800
+G1 X45.357 Y-6.999 E0.2195 F1800
+G3 X46.081 Y-6.805 I0.362 J0.097 E0.0431 F1800
+G1 X44.529 Y-1.010 E0.2195 F1800
+G2 X44.794 Y-0.550 I0.362 J0.097 E0.0152 F1800
+G1 X47.209 Y0.097 E0.0915 F1800
+G2 X47.668 Y-0.168 I0.097 J-0.362 E0.0152 F1800
+G1 X49.221 Y-5.964 E0.2195 F1800
+G3 X49.945 Y-5.770 I0.362 J0.097 E0.0431 F1800
+G1 X48.392 Y0.026 E0.2195 F1800
+G2 X48.657 Y0.485 I0.362 J0.097 E0.0152 F1800
+G1 X51.072 Y1.132 E0.0915 F1800
+G2 X51.532 Y0.867 I0.097 J-0.362 E0.0152 F1800
+G1 X53.084 Y-4.929 E0.2195 F1800
+G3 X53.809 Y-4.735 I0.362 J0.097 E0.0431 F1800
+G1 X52.256 Y1.061 E0.2195 F1800
+G2 X52.521 Y1.520 I0.362 J0.097 E0.0152 F1800
+G1 X54.936 Y2.167 E0.0915 F1800
+G2 X55.395 Y1.902 I0.097 J-0.362 E0.0152 F1800
+G1 X56.948 Y-3.893 E0.2195 F1800
+G3 X57.673 Y-3.699 I0.362 J0.097 E0.0431 F1800
+G1 X56.120 Y2.096 E0.2195 F1800
+G2 X56.385 Y2.556 I0.362 J0.097 E0.0152 F1800
+G1 X58.800 Y3.203 E0.0915 F1800
+G2 X59.259 Y2.937 I0.097 J-0.362 E0.0152 F1800
+G1 X60.812 Y-2.858 E0.2195 F1800
+G3 X61.536 Y-2.664 I0.362 J0.097 E0.0431 F1800
+G1 X59.983 Y3.132 E0.2195 F1800
+G2 X60.249 Y3.591 I0.362 J0.097 E0.0152 F1800
+G1 X62.663 Y4.238 E0.0915 F1800
+G2 X63.123 Y3.973 I0.097 J-0.362 E0.0152 F1800
+G1 X64.676 Y-1.823 E0.2195 F1800
+G3 X65.400 Y-1.629 I0.362 J0.097 E0.0431 F1800
+G1 X63.847 Y4.167 E0.2195 F1800
+G2 X64.112 Y4.626 I0.362 J0.097 E0.0152 F1800
+G1 X66.527 Y5.273 E0.0915 F1800
+G2 X66.986 Y5.008 I0.097 J-0.362 E0.0152 F1800
+G1 X68.539 Y-0.788 E0.2195 F1800
+G3 X69.264 Y-0.593 I0.362 J0.097 E0.0431 F1800
+G1 X67.711 Y5.202 E0.2195 F1800
+G2 X67.976 Y5.661 I0.362 J0.097 E0.0152 F1800
+G1 X70.391 Y6.308 E0.0915 F1800
+G2 X70.850 Y6.043 I0.097 J-0.362 E0.0152 F1800
+G1 X72.403 Y0.248 E0.2195 F1800
+G3 X73.127 Y0.442 I0.362 J0.097 E0.0431 F1800
+G1 X71.574 Y6.237 E0.2195 F1800
+G2 X71.840 Y6.697 I0.362 J0.097 E0.0152 F1800
+G1 X74.254 Y7.344 E0.0915 F1800
+G2 X74.714 Y7.079 I0.097 J-0.362 E0.0152 F1800
+G1 X76.267 Y1.283 E0.2195 F1800
+G3 X76.991 Y1.477 I0.362 J0.097 E0.0431 F1800
+G1 X75.438 Y7.273 E0.2195 F1800
+G2 X75.703 Y7.732 I0.362 J0.097 E0.0152 F1800
+G1 X78.118 Y8.379 E0.0915 F1800
+G2 X78.577 Y8.114 I0.097 J-0.362 E0.0152 F1800
+G1 X80.130 Y2.318 E0.2195 F1800
+G3 X80.855 Y2.512 I0.362 J0.097 E0.0431 F1800
+G1 X79.302 Y8.308 E0.2195 F1800
+G2 X79.567 Y8.767 I0.362 J0.097 E0.0152 F1800
+G1 X81.982 Y9.414 E0.0915 F1800
+G2 X82.441 Y9.149 I0.097 J-0.362 E0.0152 F1800
+G1 X83.994 Y3.354 E0.2195 F1800
+G3 X84.719 Y3.548 I0.362 J0.097 E0.0431 F1800
+G1 X83.166 Y9.343 E0.2195 F1800
+G2 X83.431 Y9.802 I0.362 J0.097 E0.0152 F1800
+G1 X85.846 Y10.450 E0.0915 F1800
+G2 X86.305 Y10.184 I0.097 J-0.362 E0.0152 F1800
+G1 X87.858 Y4.389 E0.2195 F1800
+G3 X88.582 Y4.583 I0.362 J0.097 E0.0431 F1800
+G1 X87.029 Y10.378 E0.2195 F1800
+G2 X87.294 Y10.838 I0.362 J0.097 E0.0152 F1800
+G1 X89.709 Y11.485 E0.0915 F1800
+G2 X90.169 Y11.220 I0.097 J-0.362 E0.0152 F1800
+G1 X91.721 Y5.424
 G1 Z0.850 E-5.0000 F4800
-G1 X89.722 Y13.274
-G1 X22.107 Y-4.843
+G1 X89.651 Y13.151
+G1 X22.036 Y-4.966
 ;print horizontal interlocked reference pattern 2
-G1 X21.709 Y4.368 F1800
+G1 X21.639 Y4.245 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X23.262 Y-1.428
-G3 X23.987 Y-1.234 I0.362 J0.097 E0.0431 F1800
-G1 X22.434 Y4.562 E0.2195 F1800
-G2 X22.699 Y5.021 I0.362 J0.097 E0.0152 F1800
-G1 X25.114 Y5.668 E0.0915 F1800
-G2 X25.573 Y5.403 I0.097 J-0.362 E0.0152 F1800
-G1 X27.126 Y-0.393 E0.2195 F1800
-G3 X27.850 Y-0.199 I0.362 J0.097 E0.0431 F1800
-G1 X26.297 Y5.597 E0.2195 F1800
-G2 X26.563 Y6.056 I0.362 J0.097 E0.0152 F1800
-G1 X28.977 Y6.703 E0.0915 F1800
-G2 X29.437 Y6.438 I0.097 J-0.362 E0.0152 F1800
-G1 X30.990 Y0.643 E0.2195 F1800
-G3 X31.714 Y0.837 I0.362 J0.097 E0.0431 F1800
-G1 X30.161 Y6.632 E0.2195 F1800
-G2 X30.426 Y7.092 I0.362 J0.097 E0.0152 F1800
-G1 X32.841 Y7.739 E0.0915 F1800
-G2 X33.300 Y7.473 I0.097 J-0.362 E0.0152 F1800
-G1 X34.853 Y1.678 E0.2195 F1800
-G3 X35.578 Y1.872 I0.362 J0.097 E0.0431 F1800
-G1 X34.025 Y7.668 E0.2195 F1800
-G2 X34.290 Y8.127 I0.362 J0.097 E0.0152 F1800
-G1 X36.705 Y8.774 E0.0915 F1800
-G2 X37.164 Y8.509 I0.097 J-0.362 E0.0152 F1800
-G1 X38.717 Y2.713 E0.2195 F1800
-G3 X39.441 Y2.907 I0.362 J0.097 E0.0431 F1800
-G1 X37.889 Y8.703 E0.2195 F1800
-G2 X38.154 Y9.162 I0.362 J0.097 E0.0152 F1800
-G1 X40.569 Y9.809 E0.0915 F1800
-G2 X41.028 Y9.544 I0.097 J-0.362 E0.0152 F1800
-G1 X42.581 Y3.748 E0.2195 F1800
-G3 X43.305 Y3.943 I0.362 J0.097 E0.0431 F1800
-G1 X41.752 Y9.738 E0.2195 F1800
-G2 X42.017 Y10.197 I0.362 J0.097 E0.0152 F1800
-G1 X44.432 Y10.844 E0.0915 F1800
-G2 X44.892 Y10.579 I0.097 J-0.362 E0.0152 F1800
-G1 X46.444 Y4.784 E0.2195 F1800
-G3 X47.169 Y4.978 I0.362 J0.097 E0.0431 F1800
-G1 X45.616 Y10.773 E0.2195 F1800
-G2 X45.881 Y11.233 I0.362 J0.097 E0.0152 F1800
-G1 X48.296 Y11.880 E0.0915 F1800
-G2 X48.755 Y11.615 I0.097 J-0.362 E0.0152 F1800
-G1 X50.308 Y5.819 E0.2195 F1800
-G3 X51.033 Y6.013 I0.362 J0.097 E0.0431 F1800
-G1 X49.480 Y11.809 E0.2195 F1800
-G2 X49.745 Y12.268 I0.362 J0.097 E0.0152 F1800
-G1 X52.160 Y12.915 E0.0915 F1800
-G2 X52.619 Y12.650 I0.097 J-0.362 E0.0152 F1800
-G1 X54.172 Y6.854 E0.2195 F1800
-G3 X54.896 Y7.048 I0.362 J0.097 E0.0431 F1800
-G1 X53.343 Y12.844 E0.2195 F1800
-G2 X53.609 Y13.303 I0.362 J0.097 E0.0152 F1800
-G1 X56.023 Y13.950 E0.0915 F1800
-G2 X56.483 Y13.685 I0.097 J-0.362 E0.0152 F1800
-G1 X58.036 Y7.890 E0.2195 F1800
-G3 X58.760 Y8.084 I0.362 J0.097 E0.0431 F1800
-G1 X57.207 Y13.879 E0.2195 F1800
-G2 X57.472 Y14.338 I0.362 J0.097 E0.0152 F1800
-G1 X59.887 Y14.986 E0.0915 F1800
-G2 X60.346 Y14.720 I0.097 J-0.362 E0.0152 F1800
-G1 X61.899 Y8.925 E0.2195 F1800
-G3 X62.624 Y9.119 I0.362 J0.097 E0.0431 F1800
-G1 X61.071 Y14.914 E0.2195 F1800
-G2 X61.336 Y15.374 I0.362 J0.097 E0.0152 F1800
-G1 X63.751 Y16.021 E0.0915 F1800
-G2 X64.210 Y15.756 I0.097 J-0.362 E0.0152 F1800
-G1 X65.763 Y9.960 E0.2195 F1800
-G3 X66.487 Y10.154 I0.362 J0.097 E0.0431 F1800
-G1 X64.934 Y15.950 E0.2195 F1800
-G2 X65.200 Y16.409 I0.362 J0.097 E0.0152 F1800
-G1 X67.614 Y17.056 E0.0915 F1800
-G2 X68.074 Y16.791 I0.097 J-0.362 E0.0152 F1800
-G1 X69.627 Y10.995 E0.2195 F1800
-G3 X70.351 Y11.189 I0.362 J0.097 E0.0431 F1800
-G1 X68.798 Y16.985 E0.2195 F1800
-G2 X69.063 Y17.444 I0.362 J0.097 E0.0152 F1800
-G1 X71.478 Y18.091 E0.0915 F1800
-G2 X71.937 Y17.826 I0.097 J-0.362 E0.0152 F1800
-G1 X73.490 Y12.031 E0.2195 F1800
-G3 X74.215 Y12.225 I0.362 J0.097 E0.0431 F1800
-G1 X72.662 Y18.020 E0.2195 F1800
-G2 X72.927 Y18.480 I0.362 J0.097 E0.0152 F1800
-G1 X75.342 Y19.127 E0.0915 F1800
-G2 X75.801 Y18.861 I0.097 J-0.362 E0.0152 F1800
-G1 X77.354 Y13.066 E0.2195 F1800
-G3 X78.079 Y13.260 I0.362 J0.097 E0.0431 F1800
-G1 X76.526 Y19.056 E0.2195 F1800
-G2 X76.791 Y19.515 I0.362 J0.097 E0.0152 F1800
-G1 X79.206 Y20.162 E0.0915 F1800
-G2 X79.665 Y19.897 I0.097 J-0.362 E0.0152 F1800
-G1 X81.218 Y14.101 E0.2195 F1800
-G3 X81.942 Y14.295 I0.362 J0.097 E0.0431 F1800
-G1 X80.389 Y20.091 E0.2195 F1800
-G2 X80.654 Y20.550 I0.362 J0.097 E0.0152 F1800
-G1 X83.069 Y21.197 E0.0915 F1800
-G2 X83.529 Y20.932 I0.097 J-0.362 E0.0152 F1800
-G1 X85.081 Y15.136 E0.2195 F1800
-G3 X85.806 Y15.331 I0.362 J0.097 E0.0431 F1800
-G1 X84.253 Y21.126 E0.2195 F1800
-G2 X84.518 Y21.585 I0.362 J0.097 E0.0152 F1800
-G1 X86.933 Y22.232 E0.0915 F1800
-G2 X87.392 Y21.967 I0.097 J-0.362 E0.0152 F1800
-G1 X88.945 Y16.172
+G1 X23.192 Y-1.550
+G3 X23.916 Y-1.356 I0.362 J0.097 E0.0431 F1800
+G1 X22.363 Y4.439 E0.2195 F1800
+G2 X22.628 Y4.899 I0.362 J0.097 E0.0152 F1800
+G1 X25.043 Y5.546 E0.0915 F1800
+G2 X25.502 Y5.280 I0.097 J-0.362 E0.0152 F1800
+G1 X27.055 Y-0.515 E0.2195 F1800
+G3 X27.780 Y-0.321 I0.362 J0.097 E0.0431 F1800
+G1 X26.227 Y5.475 E0.2195 F1800
+G2 X26.492 Y5.934 I0.362 J0.097 E0.0152 F1800
+G1 X28.907 Y6.581 E0.0915 F1800
+G2 X29.366 Y6.316 I0.097 J-0.362 E0.0152 F1800
+G1 X30.919 Y0.520 E0.2195 F1800
+G3 X31.643 Y0.714 I0.362 J0.097 E0.0431 F1800
+G1 X30.090 Y6.510 E0.2195 F1800
+G2 X30.356 Y6.969 I0.362 J0.097 E0.0152 F1800
+G1 X32.770 Y7.616 E0.0915 F1800
+G2 X33.230 Y7.351 I0.097 J-0.362 E0.0152 F1800
+G1 X34.783 Y1.555 E0.2195 F1800
+G3 X35.507 Y1.750 I0.362 J0.097 E0.0431 F1800
+G1 X33.954 Y7.545 E0.2195 F1800
+G2 X34.219 Y8.004 I0.362 J0.097 E0.0152 F1800
+G1 X36.634 Y8.651 E0.0915 F1800
+G2 X37.093 Y8.386 I0.097 J-0.362 E0.0152 F1800
+G1 X38.646 Y2.591 E0.2195 F1800
+G3 X39.371 Y2.785 I0.362 J0.097 E0.0431 F1800
+G1 X37.818 Y8.580 E0.2195 F1800
+G2 X38.083 Y9.040 I0.362 J0.097 E0.0152 F1800
+G1 X40.498 Y9.687 E0.0915 F1800
+G2 X40.957 Y9.422 I0.097 J-0.362 E0.0152 F1800
+G1 X42.510 Y3.626 E0.2195 F1800
+G3 X43.234 Y3.820 I0.362 J0.097 E0.0431 F1800
+G1 X41.682 Y9.616 E0.2195 F1800
+G2 X41.947 Y10.075 I0.362 J0.097 E0.0152 F1800
+G1 X44.362 Y10.722 E0.0915 F1800
+G2 X44.821 Y10.457 I0.097 J-0.362 E0.0152 F1800
+G1 X46.374 Y4.661 E0.2195 F1800
+G3 X47.098 Y4.855 I0.362 J0.097 E0.0431 F1800
+G1 X45.545 Y10.651 E0.2195 F1800
+G2 X45.810 Y11.110 I0.362 J0.097 E0.0152 F1800
+G1 X48.225 Y11.757 E0.0915 F1800
+G2 X48.685 Y11.492 I0.097 J-0.362 E0.0152 F1800
+G1 X50.237 Y5.697 E0.2195 F1800
+G3 X50.962 Y5.891 I0.362 J0.097 E0.0431 F1800
+G1 X49.409 Y11.686 E0.2195 F1800
+G2 X49.674 Y12.145 I0.362 J0.097 E0.0152 F1800
+G1 X52.089 Y12.793 E0.0915 F1800
+G2 X52.548 Y12.527 I0.097 J-0.362 E0.0152 F1800
+G1 X54.101 Y6.732 E0.2195 F1800
+G3 X54.826 Y6.926 I0.362 J0.097 E0.0431 F1800
+G1 X53.273 Y12.721 E0.2195 F1800
+G2 X53.538 Y13.181 I0.362 J0.097 E0.0152 F1800
+G1 X55.953 Y13.828 E0.0915 F1800
+G2 X56.412 Y13.563 I0.097 J-0.362 E0.0152 F1800
+G1 X57.965 Y7.767 E0.2195 F1800
+G3 X58.689 Y7.961 I0.362 J0.097 E0.0431 F1800
+G1 X57.136 Y13.757 E0.2195 F1800
+G2 X57.402 Y14.216 I0.362 J0.097 E0.0152 F1800
+G1 X59.816 Y14.863 E0.0915 F1800
+G2 X60.276 Y14.598 I0.097 J-0.362 E0.0152 F1800
+G1 X61.829 Y8.802 E0.2195 F1800
+G3 X62.553 Y8.996 I0.362 J0.097 E0.0431 F1800
+G1 X61.000 Y14.792 E0.2195 F1800
+G2 X61.265 Y15.251 I0.362 J0.097 E0.0152 F1800
+G1 X63.680 Y15.898 E0.0915 F1800
+G2 X64.139 Y15.633 I0.097 J-0.362 E0.0152 F1800
+G1 X65.692 Y9.838 E0.2195 F1800
+G3 X66.417 Y10.032 I0.362 J0.097 E0.0431 F1800
+G1 X64.864 Y15.827 E0.2195 F1800
+G2 X65.129 Y16.287 I0.362 J0.097 E0.0152 F1800
+G1 X67.544 Y16.934 E0.0915 F1800
+G2 X68.003 Y16.668 I0.097 J-0.362 E0.0152 F1800
+G1 X69.556 Y10.873 E0.2195 F1800
+G3 X70.280 Y11.067 I0.362 J0.097 E0.0431 F1800
+G1 X68.727 Y16.863 E0.2195 F1800
+G2 X68.993 Y17.322 I0.362 J0.097 E0.0152 F1800
+G1 X71.407 Y17.969 E0.0915 F1800
+G2 X71.867 Y17.704 I0.097 J-0.362 E0.0152 F1800
+G1 X73.420 Y11.908 E0.2195 F1800
+G3 X74.144 Y12.102 I0.362 J0.097 E0.0431 F1800
+G1 X72.591 Y17.898 E0.2195 F1800
+G2 X72.856 Y18.357 I0.362 J0.097 E0.0152 F1800
+G1 X75.271 Y19.004 E0.0915 F1800
+G2 X75.730 Y18.739 I0.097 J-0.362 E0.0152 F1800
+G1 X77.283 Y12.943 E0.2195 F1800
+G3 X78.008 Y13.138 I0.362 J0.097 E0.0431 F1800
+G1 X76.455 Y18.933 E0.2195 F1800
+G2 X76.720 Y19.392 I0.362 J0.097 E0.0152 F1800
+G1 X79.135 Y20.039 E0.0915 F1800
+G2 X79.594 Y19.774 I0.097 J-0.362 E0.0152 F1800
+G1 X81.147 Y13.979 E0.2195 F1800
+G3 X81.872 Y14.173 I0.362 J0.097 E0.0431 F1800
+G1 X80.319 Y19.968 E0.2195 F1800
+G2 X80.584 Y20.428 I0.362 J0.097 E0.0152 F1800
+G1 X82.999 Y21.075 E0.0915 F1800
+G2 X83.458 Y20.810 I0.097 J-0.362 E0.0152 F1800
+G1 X85.011 Y15.014 E0.2195 F1800
+G3 X85.735 Y15.208 I0.362 J0.097 E0.0431 F1800
+G1 X84.182 Y21.004 E0.2195 F1800
+G2 X84.447 Y21.463 I0.362 J0.097 E0.0152 F1800
+G1 X86.862 Y22.110 E0.0915 F1800
+G2 X87.322 Y21.845 I0.097 J-0.362 E0.0152 F1800
+G1 X88.874 Y16.049
 G1 Z0.850 E-5.0000 F4800
-G1 X86.875 Y23.899
-G1 X19.260 Y5.782
-G1 X18.862 Y14.993 F1800
+G1 X86.804 Y23.777
+G1 X19.189 Y5.659
+G1 X18.792 Y14.870 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X20.415 Y9.197
-G3 X21.140 Y9.391 I0.362 J0.097 E0.0431 F1800
-G1 X19.587 Y15.187 E0.2195 F1800
-G2 X19.852 Y15.646 I0.362 J0.097 E0.0152 F1800
-G1 X22.267 Y16.293 E0.0915 F1800
-G2 X22.726 Y16.028 I0.097 J-0.362 E0.0152 F1800
-G1 X24.279 Y10.233 E0.2195 F1800
-G3 X25.003 Y10.427 I0.362 J0.097 E0.0431 F1800
-G1 X23.450 Y16.222 E0.2195 F1800
-G2 X23.716 Y16.681 I0.362 J0.097 E0.0152 F1800
-G1 X26.130 Y17.329 E0.0915 F1800
-G2 X26.590 Y17.063 I0.097 J-0.362 E0.0152 F1800
-G1 X28.143 Y11.268 E0.2195 F1800
-G3 X28.867 Y11.462 I0.362 J0.097 E0.0431 F1800
-G1 X27.314 Y17.257 E0.2195 F1800
-G2 X27.579 Y17.717 I0.362 J0.097 E0.0152 F1800
-G1 X29.994 Y18.364 E0.0915 F1800
-G2 X30.453 Y18.099 I0.097 J-0.362 E0.0152 F1800
-G1 X32.006 Y12.303 E0.2195 F1800
-G3 X32.731 Y12.497 I0.362 J0.097 E0.0431 F1800
-G1 X31.178 Y18.293 E0.2195 F1800
-G2 X31.443 Y18.752 I0.362 J0.097 E0.0152 F1800
-G1 X33.858 Y19.399 E0.0915 F1800
-G2 X34.317 Y19.134 I0.097 J-0.362 E0.0152 F1800
-G1 X35.870 Y13.338 E0.2195 F1800
-G3 X36.594 Y13.532 I0.362 J0.097 E0.0431 F1800
-G1 X35.042 Y19.328 E0.2195 F1800
-G2 X35.307 Y19.787 I0.362 J0.097 E0.0152 F1800
-G1 X37.722 Y20.434 E0.0915 F1800
-G2 X38.181 Y20.169 I0.097 J-0.362 E0.0152 F1800
-G1 X39.734 Y14.374 E0.2195 F1800
-G3 X40.458 Y14.568 I0.362 J0.097 E0.0431 F1800
-G1 X38.905 Y20.363 E0.2195 F1800
-G2 X39.170 Y20.823 I0.362 J0.097 E0.0152 F1800
-G1 X41.585 Y21.470 E0.0915 F1800
-G2 X42.045 Y21.204 I0.097 J-0.362 E0.0152 F1800
-G1 X43.597 Y15.409 E0.2195 F1800
-G3 X44.322 Y15.603 I0.362 J0.097 E0.0431 F1800
-G1 X42.769 Y21.399 E0.2195 F1800
-G2 X43.034 Y21.858 I0.362 J0.097 E0.0152 F1800
-G1 X45.449 Y22.505 E0.0915 F1800
-G2 X45.908 Y22.240 I0.097 J-0.362 E0.0152 F1800
-G1 X47.461 Y16.444 E0.2195 F1800
-G3 X48.186 Y16.638 I0.362 J0.097 E0.0431 F1800
-G1 X46.633 Y22.434 E0.2195 F1800
-G2 X46.898 Y22.893 I0.362 J0.097 E0.0152 F1800
-G1 X49.313 Y23.540 E0.0915 F1800
-G2 X49.772 Y23.275 I0.097 J-0.362 E0.0152 F1800
-G1 X51.325 Y17.479 E0.2195 F1800
-G3 X52.049 Y17.674 I0.362 J0.097 E0.0431 F1800
-G1 X50.496 Y23.469 E0.2195 F1800
-G2 X50.762 Y23.928 I0.362 J0.097 E0.0152 F1800
-G1 X53.176 Y24.575 E0.0915 F1800
-G2 X53.636 Y24.310 I0.097 J-0.362 E0.0152 F1800
-G1 X55.189 Y18.515 E0.2195 F1800
-G3 X55.913 Y18.709 I0.362 J0.097 E0.0431 F1800
-G1 X54.360 Y24.504 E0.2195 F1800
-G2 X54.625 Y24.964 I0.362 J0.097 E0.0152 F1800
-G1 X57.040 Y25.611 E0.0915 F1800
-G2 X57.499 Y25.346 I0.097 J-0.362 E0.0152 F1800
-G1 X59.052 Y19.550 E0.2195 F1800
-G3 X59.777 Y19.744 I0.362 J0.097 E0.0431 F1800
-G1 X58.224 Y25.540 E0.2195 F1800
-G2 X58.489 Y25.999 I0.362 J0.097 E0.0152 F1800
-G1 X60.904 Y26.646 E0.0915 F1800
-G2 X61.363 Y26.381 I0.097 J-0.362 E0.0152 F1800
-G1 X62.916 Y20.585 E0.2195 F1800
-G3 X63.640 Y20.779 I0.362 J0.097 E0.0431 F1800
-G1 X62.087 Y26.575 E0.2195 F1800
-G2 X62.353 Y27.034 I0.362 J0.097 E0.0152 F1800
-G1 X64.767 Y27.681 E0.0915 F1800
-G2 X65.227 Y27.416 I0.097 J-0.362 E0.0152 F1800
-G1 X66.780 Y21.621 E0.2195 F1800
-G3 X67.504 Y21.815 I0.362 J0.097 E0.0431 F1800
-G1 X65.951 Y27.610 E0.2195 F1800
-G2 X66.216 Y28.069 I0.362 J0.097 E0.0152 F1800
-G1 X68.631 Y28.717 E0.0915 F1800
-G2 X69.090 Y28.451 I0.097 J-0.362 E0.0152 F1800
-G1 X70.643 Y22.656 E0.2195 F1800
-G3 X71.368 Y22.850 I0.362 J0.097 E0.0431 F1800
-G1 X69.815 Y28.645 E0.2195 F1800
-G2 X70.080 Y29.105 I0.362 J0.097 E0.0152 F1800
-G1 X72.495 Y29.752 E0.0915 F1800
-G2 X72.954 Y29.487 I0.097 J-0.362 E0.0152 F1800
-G1 X74.507 Y23.691 E0.2195 F1800
-G3 X75.232 Y23.885 I0.362 J0.097 E0.0431 F1800
-G1 X73.679 Y29.681 E0.2195 F1800
-G2 X73.944 Y30.140 I0.362 J0.097 E0.0152 F1800
-G1 X76.359 Y30.787 E0.0915 F1800
-G2 X76.818 Y30.522 I0.097 J-0.362 E0.0152 F1800
-G1 X78.371 Y24.726 E0.2195 F1800
-G3 X79.095 Y24.920 I0.362 J0.097 E0.0431 F1800
-G1 X77.542 Y30.716 E0.2195 F1800
-G2 X77.807 Y31.175 I0.362 J0.097 E0.0152 F1800
-G1 X80.222 Y31.822 E0.0915 F1800
-G2 X80.682 Y31.557 I0.097 J-0.362 E0.0152 F1800
-G1 X82.234 Y25.762 E0.2195 F1800
-G3 X82.959 Y25.956 I0.362 J0.097 E0.0431 F1800
-G1 X81.406 Y31.751 E0.2195 F1800
-G2 X81.671 Y32.211 I0.362 J0.097 E0.0152 F1800
-G1 X84.086 Y32.858 E0.0915 F1800
-G2 X84.545 Y32.592 I0.097 J-0.362 E0.0152 F1800
-G1 X86.098 Y26.797
+G1 X20.345 Y9.075
+G3 X21.069 Y9.269 I0.362 J0.097 E0.0431 F1800
+G1 X19.516 Y15.064 E0.2195 F1800
+G2 X19.781 Y15.524 I0.362 J0.097 E0.0152 F1800
+G1 X22.196 Y16.171 E0.0915 F1800
+G2 X22.655 Y15.906 I0.097 J-0.362 E0.0152 F1800
+G1 X24.208 Y10.110 E0.2195 F1800
+G3 X24.933 Y10.304 I0.362 J0.097 E0.0431 F1800
+G1 X23.380 Y16.100 E0.2195 F1800
+G2 X23.645 Y16.559 I0.362 J0.097 E0.0152 F1800
+G1 X26.060 Y17.206 E0.0915 F1800
+G2 X26.519 Y16.941 I0.097 J-0.362 E0.0152 F1800
+G1 X28.072 Y11.145 E0.2195 F1800
+G3 X28.796 Y11.339 I0.362 J0.097 E0.0431 F1800
+G1 X27.243 Y17.135 E0.2195 F1800
+G2 X27.509 Y17.594 I0.362 J0.097 E0.0152 F1800
+G1 X29.923 Y18.241 E0.0915 F1800
+G2 X30.383 Y17.976 I0.097 J-0.362 E0.0152 F1800
+G1 X31.936 Y12.181 E0.2195 F1800
+G3 X32.660 Y12.375 I0.362 J0.097 E0.0431 F1800
+G1 X31.107 Y18.170 E0.2195 F1800
+G2 X31.372 Y18.630 I0.362 J0.097 E0.0152 F1800
+G1 X33.787 Y19.277 E0.0915 F1800
+G2 X34.246 Y19.011 I0.097 J-0.362 E0.0152 F1800
+G1 X35.799 Y13.216 E0.2195 F1800
+G3 X36.524 Y13.410 I0.362 J0.097 E0.0431 F1800
+G1 X34.971 Y19.206 E0.2195 F1800
+G2 X35.236 Y19.665 I0.362 J0.097 E0.0152 F1800
+G1 X37.651 Y20.312 E0.0915 F1800
+G2 X38.110 Y20.047 I0.097 J-0.362 E0.0152 F1800
+G1 X39.663 Y14.251 E0.2195 F1800
+G3 X40.387 Y14.445 I0.362 J0.097 E0.0431 F1800
+G1 X38.835 Y20.241 E0.2195 F1800
+G2 X39.100 Y20.700 I0.362 J0.097 E0.0152 F1800
+G1 X41.515 Y21.347 E0.0915 F1800
+G2 X41.974 Y21.082 I0.097 J-0.362 E0.0152 F1800
+G1 X43.527 Y15.286 E0.2195 F1800
+G3 X44.251 Y15.481 I0.362 J0.097 E0.0431 F1800
+G1 X42.698 Y21.276 E0.2195 F1800
+G2 X42.963 Y21.735 I0.362 J0.097 E0.0152 F1800
+G1 X45.378 Y22.382 E0.0915 F1800
+G2 X45.838 Y22.117 I0.097 J-0.362 E0.0152 F1800
+G1 X47.390 Y16.322 E0.2195 F1800
+G3 X48.115 Y16.516 I0.362 J0.097 E0.0431 F1800
+G1 X46.562 Y22.311 E0.2195 F1800
+G2 X46.827 Y22.771 I0.362 J0.097 E0.0152 F1800
+G1 X49.242 Y23.418 E0.0915 F1800
+G2 X49.701 Y23.153 I0.097 J-0.362 E0.0152 F1800
+G1 X51.254 Y17.357 E0.2195 F1800
+G3 X51.979 Y17.551 I0.362 J0.097 E0.0431 F1800
+G1 X50.426 Y23.347 E0.2195 F1800
+G2 X50.691 Y23.806 I0.362 J0.097 E0.0152 F1800
+G1 X53.106 Y24.453 E0.0915 F1800
+G2 X53.565 Y24.188 I0.097 J-0.362 E0.0152 F1800
+G1 X55.118 Y18.392 E0.2195 F1800
+G3 X55.842 Y18.586 I0.362 J0.097 E0.0431 F1800
+G1 X54.289 Y24.382 E0.2195 F1800
+G2 X54.555 Y24.841 I0.362 J0.097 E0.0152 F1800
+G1 X56.969 Y25.488 E0.0915 F1800
+G2 X57.429 Y25.223 I0.097 J-0.362 E0.0152 F1800
+G1 X58.982 Y19.428 E0.2195 F1800
+G3 X59.706 Y19.622 I0.362 J0.097 E0.0431 F1800
+G1 X58.153 Y25.417 E0.2195 F1800
+G2 X58.418 Y25.876 I0.362 J0.097 E0.0152 F1800
+G1 X60.833 Y26.524 E0.0915 F1800
+G2 X61.292 Y26.258 I0.097 J-0.362 E0.0152 F1800
+G1 X62.845 Y20.463 E0.2195 F1800
+G3 X63.570 Y20.657 I0.362 J0.097 E0.0431 F1800
+G1 X62.017 Y26.452 E0.2195 F1800
+G2 X62.282 Y26.912 I0.362 J0.097 E0.0152 F1800
+G1 X64.697 Y27.559 E0.0915 F1800
+G2 X65.156 Y27.294 I0.097 J-0.362 E0.0152 F1800
+G1 X66.709 Y21.498 E0.2195 F1800
+G3 X67.433 Y21.692 I0.362 J0.097 E0.0431 F1800
+G1 X65.880 Y27.488 E0.2195 F1800
+G2 X66.146 Y27.947 I0.362 J0.097 E0.0152 F1800
+G1 X68.560 Y28.594 E0.0915 F1800
+G2 X69.020 Y28.329 I0.097 J-0.362 E0.0152 F1800
+G1 X70.573 Y22.533 E0.2195 F1800
+G3 X71.297 Y22.727 I0.362 J0.097 E0.0431 F1800
+G1 X69.744 Y28.523 E0.2195 F1800
+G2 X70.009 Y28.982 I0.362 J0.097 E0.0152 F1800
+G1 X72.424 Y29.629 E0.0915 F1800
+G2 X72.883 Y29.364 I0.097 J-0.362 E0.0152 F1800
+G1 X74.436 Y23.569 E0.2195 F1800
+G3 X75.161 Y23.763 I0.362 J0.097 E0.0431 F1800
+G1 X73.608 Y29.558 E0.2195 F1800
+G2 X73.873 Y30.018 I0.362 J0.097 E0.0152 F1800
+G1 X76.288 Y30.665 E0.0915 F1800
+G2 X76.747 Y30.399 I0.097 J-0.362 E0.0152 F1800
+G1 X78.300 Y24.604 E0.2195 F1800
+G3 X79.024 Y24.798 I0.362 J0.097 E0.0431 F1800
+G1 X77.472 Y30.594 E0.2195 F1800
+G2 X77.737 Y31.053 I0.362 J0.097 E0.0152 F1800
+G1 X80.152 Y31.700 E0.0915 F1800
+G2 X80.611 Y31.435 I0.097 J-0.362 E0.0152 F1800
+G1 X82.164 Y25.639 E0.2195 F1800
+G3 X82.888 Y25.833 I0.362 J0.097 E0.0431 F1800
+G1 X81.335 Y31.629 E0.2195 F1800
+G2 X81.600 Y32.088 I0.362 J0.097 E0.0152 F1800
+G1 X84.015 Y32.735 E0.0915 F1800
+G2 X84.475 Y32.470 I0.097 J-0.362 E0.0152 F1800
+G1 X86.027 Y26.674
 G1 Z0.850 E-5.0000 F4800
-G1 X84.028 Y34.524
-G1 X16.413 Y16.407
+G1 X83.957 Y34.402
+G1 X16.342 Y16.285
 ;print horizontal interlocked reference pattern 3
-G1 X16.015 Y25.618 F1800
+G1 X15.945 Y25.495 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X17.568 Y19.822
-G3 X18.293 Y20.017 I0.362 J0.097 E0.0431 F1800
-G1 X16.740 Y25.812 E0.2195 F1800
-G2 X17.005 Y26.271 I0.362 J0.097 E0.0152 F1800
-G1 X19.420 Y26.918 E0.0915 F1800
-G2 X19.879 Y26.653 I0.097 J-0.362 E0.0152 F1800
-G1 X21.432 Y20.858 E0.2195 F1800
-G3 X22.156 Y21.052 I0.362 J0.097 E0.0431 F1800
-G1 X20.603 Y26.847 E0.2195 F1800
-G2 X20.869 Y27.307 I0.362 J0.097 E0.0152 F1800
-G1 X23.283 Y27.954 E0.0915 F1800
-G2 X23.743 Y27.689 I0.097 J-0.362 E0.0152 F1800
-G1 X25.296 Y21.893 E0.2195 F1800
-G3 X26.020 Y22.087 I0.362 J0.097 E0.0431 F1800
-G1 X24.467 Y27.883 E0.2195 F1800
-G2 X24.732 Y28.342 I0.362 J0.097 E0.0152 F1800
-G1 X27.147 Y28.989 E0.0915 F1800
-G2 X27.606 Y28.724 I0.097 J-0.362 E0.0152 F1800
-G1 X29.159 Y22.928 E0.2195 F1800
-G3 X29.884 Y23.122 I0.362 J0.097 E0.0431 F1800
-G1 X28.331 Y28.918 E0.2195 F1800
-G2 X28.596 Y29.377 I0.362 J0.097 E0.0152 F1800
-G1 X31.011 Y30.024 E0.0915 F1800
-G2 X31.470 Y29.759 I0.097 J-0.362 E0.0152 F1800
-G1 X33.023 Y23.964 E0.2195 F1800
-G3 X33.747 Y24.158 I0.362 J0.097 E0.0431 F1800
-G1 X32.195 Y29.953 E0.2195 F1800
-G2 X32.460 Y30.412 I0.362 J0.097 E0.0152 F1800
-G1 X34.875 Y31.060 E0.0915 F1800
-G2 X35.334 Y30.794 I0.097 J-0.362 E0.0152 F1800
-G1 X36.887 Y24.999 E0.2195 F1800
-G3 X37.611 Y25.193 I0.362 J0.097 E0.0431 F1800
-G1 X36.058 Y30.988 E0.2195 F1800
-G2 X36.323 Y31.448 I0.362 J0.097 E0.0152 F1800
-G1 X38.738 Y32.095 E0.0915 F1800
-G2 X39.198 Y31.830 I0.097 J-0.362 E0.0152 F1800
-G1 X40.750 Y26.034 E0.2195 F1800
-G3 X41.475 Y26.228 I0.362 J0.097 E0.0431 F1800
-G1 X39.922 Y32.024 E0.2195 F1800
-G2 X40.187 Y32.483 I0.362 J0.097 E0.0152 F1800
-G1 X42.602 Y33.130 E0.0915 F1800
-G2 X43.061 Y32.865 I0.097 J-0.362 E0.0152 F1800
-G1 X44.614 Y27.069 E0.2195 F1800
-G3 X45.339 Y27.263 I0.362 J0.097 E0.0431 F1800
-G1 X43.786 Y33.059 E0.2195 F1800
-G2 X44.051 Y33.518 I0.362 J0.097 E0.0152 F1800
-G1 X46.466 Y34.165 E0.0915 F1800
-G2 X46.925 Y33.900 I0.097 J-0.362 E0.0152 F1800
-G1 X48.478 Y28.105 E0.2195 F1800
-G3 X49.202 Y28.299 I0.362 J0.097 E0.0431 F1800
-G1 X47.649 Y34.094 E0.2195 F1800
-G2 X47.915 Y34.554 I0.362 J0.097 E0.0152 F1800
-G1 X50.329 Y35.201 E0.0915 F1800
-G2 X50.789 Y34.935 I0.097 J-0.362 E0.0152 F1800
-G1 X52.342 Y29.140 E0.2195 F1800
-G3 X53.066 Y29.334 I0.362 J0.097 E0.0431 F1800
-G1 X51.513 Y35.130 E0.2195 F1800
-G2 X51.778 Y35.589 I0.362 J0.097 E0.0152 F1800
-G1 X54.193 Y36.236 E0.0915 F1800
-G2 X54.652 Y35.971 I0.097 J-0.362 E0.0152 F1800
-G1 X56.205 Y30.175 E0.2195 F1800
-G3 X56.930 Y30.369 I0.362 J0.097 E0.0431 F1800
-G1 X55.377 Y36.165 E0.2195 F1800
-G2 X55.642 Y36.624 I0.362 J0.097 E0.0152 F1800
-G1 X58.057 Y37.271 E0.0915 F1800
-G2 X58.516 Y37.006 I0.097 J-0.362 E0.0152 F1800
-G1 X60.069 Y31.210 E0.2195 F1800
-G3 X60.793 Y31.405 I0.362 J0.097 E0.0431 F1800
-G1 X59.240 Y37.200 E0.2195 F1800
-G2 X59.506 Y37.659 I0.362 J0.097 E0.0152 F1800
-G1 X61.920 Y38.306 E0.0915 F1800
-G2 X62.380 Y38.041 I0.097 J-0.362 E0.0152 F1800
-G1 X63.933 Y32.246 E0.2195 F1800
-G3 X64.657 Y32.440 I0.362 J0.097 E0.0431 F1800
-G1 X63.104 Y38.235 E0.2195 F1800
-G2 X63.369 Y38.695 I0.362 J0.097 E0.0152 F1800
-G1 X65.784 Y39.342 E0.0915 F1800
-G2 X66.243 Y39.077 I0.097 J-0.362 E0.0152 F1800
-G1 X67.796 Y33.281 E0.2195 F1800
-G3 X68.521 Y33.475 I0.362 J0.097 E0.0431 F1800
-G1 X66.968 Y39.271 E0.2195 F1800
-G2 X67.233 Y39.730 I0.362 J0.097 E0.0152 F1800
-G1 X69.648 Y40.377 E0.0915 F1800
-G2 X70.107 Y40.112 I0.097 J-0.362 E0.0152 F1800
-G1 X71.660 Y34.316 E0.2195 F1800
-G3 X72.384 Y34.510 I0.362 J0.097 E0.0431 F1800
-G1 X70.832 Y40.306 E0.2195 F1800
-G2 X71.097 Y40.765 I0.362 J0.097 E0.0152 F1800
-G1 X73.512 Y41.412 E0.0915 F1800
-G2 X73.971 Y41.147 I0.097 J-0.362 E0.0152 F1800
-G1 X75.524 Y35.352 E0.2195 F1800
-G3 X76.248 Y35.546 I0.362 J0.097 E0.0431 F1800
-G1 X74.695 Y41.341 E0.2195 F1800
-G2 X74.960 Y41.801 I0.362 J0.097 E0.0152 F1800
-G1 X77.375 Y42.448 E0.0915 F1800
-G2 X77.835 Y42.182 I0.097 J-0.362 E0.0152 F1800
-G1 X79.387 Y36.387 E0.2195 F1800
-G3 X80.112 Y36.581 I0.362 J0.097 E0.0431 F1800
-G1 X78.559 Y42.377 E0.2195 F1800
-G2 X78.824 Y42.836 I0.362 J0.097 E0.0152 F1800
-G1 X81.239 Y43.483 E0.0915 F1800
-G2 X81.698 Y43.218 I0.097 J-0.362 E0.0152 F1800
-G1 X83.251 Y37.422
+G1 X17.497 Y19.700
+G3 X18.222 Y19.894 I0.362 J0.097 E0.0431 F1800
+G1 X16.669 Y25.690 E0.2195 F1800
+G2 X16.934 Y26.149 I0.362 J0.097 E0.0152 F1800
+G1 X19.349 Y26.796 E0.0915 F1800
+G2 X19.808 Y26.531 I0.097 J-0.362 E0.0152 F1800
+G1 X21.361 Y20.735 E0.2195 F1800
+G3 X22.086 Y20.929 I0.362 J0.097 E0.0431 F1800
+G1 X20.533 Y26.725 E0.2195 F1800
+G2 X20.798 Y27.184 I0.362 J0.097 E0.0152 F1800
+G1 X23.213 Y27.831 E0.0915 F1800
+G2 X23.672 Y27.566 I0.097 J-0.362 E0.0152 F1800
+G1 X25.225 Y21.770 E0.2195 F1800
+G3 X25.949 Y21.965 I0.362 J0.097 E0.0431 F1800
+G1 X24.396 Y27.760 E0.2195 F1800
+G2 X24.662 Y28.219 I0.362 J0.097 E0.0152 F1800
+G1 X27.076 Y28.866 E0.0915 F1800
+G2 X27.536 Y28.601 I0.097 J-0.362 E0.0152 F1800
+G1 X29.089 Y22.806 E0.2195 F1800
+G3 X29.813 Y23.000 I0.362 J0.097 E0.0431 F1800
+G1 X28.260 Y28.795 E0.2195 F1800
+G2 X28.525 Y29.255 I0.362 J0.097 E0.0152 F1800
+G1 X30.940 Y29.902 E0.0915 F1800
+G2 X31.399 Y29.637 I0.097 J-0.362 E0.0152 F1800
+G1 X32.952 Y23.841 E0.2195 F1800
+G3 X33.677 Y24.035 I0.362 J0.097 E0.0431 F1800
+G1 X32.124 Y29.831 E0.2195 F1800
+G2 X32.389 Y30.290 I0.362 J0.097 E0.0152 F1800
+G1 X34.804 Y30.937 E0.0915 F1800
+G2 X35.263 Y30.672 I0.097 J-0.362 E0.0152 F1800
+G1 X36.816 Y24.876 E0.2195 F1800
+G3 X37.540 Y25.070 I0.362 J0.097 E0.0431 F1800
+G1 X35.988 Y30.866 E0.2195 F1800
+G2 X36.253 Y31.325 I0.362 J0.097 E0.0152 F1800
+G1 X38.668 Y31.972 E0.0915 F1800
+G2 X39.127 Y31.707 I0.097 J-0.362 E0.0152 F1800
+G1 X40.680 Y25.912 E0.2195 F1800
+G3 X41.404 Y26.106 I0.362 J0.097 E0.0431 F1800
+G1 X39.851 Y31.901 E0.2195 F1800
+G2 X40.116 Y32.361 I0.362 J0.097 E0.0152 F1800
+G1 X42.531 Y33.008 E0.0915 F1800
+G2 X42.991 Y32.742 I0.097 J-0.362 E0.0152 F1800
+G1 X44.543 Y26.947 E0.2195 F1800
+G3 X45.268 Y27.141 I0.362 J0.097 E0.0431 F1800
+G1 X43.715 Y32.937 E0.2195 F1800
+G2 X43.980 Y33.396 I0.362 J0.097 E0.0152 F1800
+G1 X46.395 Y34.043 E0.0915 F1800
+G2 X46.854 Y33.778 I0.097 J-0.362 E0.0152 F1800
+G1 X48.407 Y27.982 E0.2195 F1800
+G3 X49.132 Y28.176 I0.362 J0.097 E0.0431 F1800
+G1 X47.579 Y33.972 E0.2195 F1800
+G2 X47.844 Y34.431 I0.362 J0.097 E0.0152 F1800
+G1 X50.259 Y35.078 E0.0915 F1800
+G2 X50.718 Y34.813 I0.097 J-0.362 E0.0152 F1800
+G1 X52.271 Y29.017 E0.2195 F1800
+G3 X52.995 Y29.212 I0.362 J0.097 E0.0431 F1800
+G1 X51.442 Y35.007 E0.2195 F1800
+G2 X51.708 Y35.466 I0.362 J0.097 E0.0152 F1800
+G1 X54.122 Y36.113 E0.0915 F1800
+G2 X54.582 Y35.848 I0.097 J-0.362 E0.0152 F1800
+G1 X56.135 Y30.053 E0.2195 F1800
+G3 X56.859 Y30.247 I0.362 J0.097 E0.0431 F1800
+G1 X55.306 Y36.042 E0.2195 F1800
+G2 X55.571 Y36.502 I0.362 J0.097 E0.0152 F1800
+G1 X57.986 Y37.149 E0.0915 F1800
+G2 X58.445 Y36.884 I0.097 J-0.362 E0.0152 F1800
+G1 X59.998 Y31.088 E0.2195 F1800
+G3 X60.723 Y31.282 I0.362 J0.097 E0.0431 F1800
+G1 X59.170 Y37.078 E0.2195 F1800
+G2 X59.435 Y37.537 I0.362 J0.097 E0.0152 F1800
+G1 X61.850 Y38.184 E0.0915 F1800
+G2 X62.309 Y37.919 I0.097 J-0.362 E0.0152 F1800
+G1 X63.862 Y32.123 E0.2195 F1800
+G3 X64.586 Y32.317 I0.362 J0.097 E0.0431 F1800
+G1 X63.033 Y38.113 E0.2195 F1800
+G2 X63.299 Y38.572 I0.362 J0.097 E0.0152 F1800
+G1 X65.713 Y39.219 E0.0915 F1800
+G2 X66.173 Y38.954 I0.097 J-0.362 E0.0152 F1800
+G1 X67.726 Y33.159 E0.2195 F1800
+G3 X68.450 Y33.353 I0.362 J0.097 E0.0431 F1800
+G1 X66.897 Y39.148 E0.2195 F1800
+G2 X67.162 Y39.607 I0.362 J0.097 E0.0152 F1800
+G1 X69.577 Y40.255 E0.0915 F1800
+G2 X70.036 Y39.989 I0.097 J-0.362 E0.0152 F1800
+G1 X71.589 Y34.194 E0.2195 F1800
+G3 X72.314 Y34.388 I0.362 J0.097 E0.0431 F1800
+G1 X70.761 Y40.183 E0.2195 F1800
+G2 X71.026 Y40.643 I0.362 J0.097 E0.0152 F1800
+G1 X73.441 Y41.290 E0.0915 F1800
+G2 X73.900 Y41.025 I0.097 J-0.362 E0.0152 F1800
+G1 X75.453 Y35.229 E0.2195 F1800
+G3 X76.177 Y35.423 I0.362 J0.097 E0.0431 F1800
+G1 X74.625 Y41.219 E0.2195 F1800
+G2 X74.890 Y41.678 I0.362 J0.097 E0.0152 F1800
+G1 X77.305 Y42.325 E0.0915 F1800
+G2 X77.764 Y42.060 I0.097 J-0.362 E0.0152 F1800
+G1 X79.317 Y36.264 E0.2195 F1800
+G3 X80.041 Y36.458 I0.362 J0.097 E0.0431 F1800
+G1 X78.488 Y42.254 E0.2195 F1800
+G2 X78.753 Y42.713 I0.362 J0.097 E0.0152 F1800
+G1 X81.168 Y43.360 E0.0915 F1800
+G2 X81.628 Y43.095 I0.097 J-0.362 E0.0152 F1800
+G1 X83.180 Y37.300
 G1 Z0.850 E-5.0000 F4800
-G1 X81.181 Y45.150
-G1 X13.566 Y27.032
-G1 X13.168 Y36.243 F1800
+G1 X81.110 Y45.027
+G1 X13.495 Y26.910
+G1 X13.098 Y36.121 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X14.721 Y30.448
-G3 X15.446 Y30.642 I0.362 J0.097 E0.0431 F1800
-G1 X13.893 Y36.437 E0.2195 F1800
-G2 X14.158 Y36.897 I0.362 J0.097 E0.0152 F1800
-G1 X16.573 Y37.544 E0.0915 F1800
-G2 X17.032 Y37.278 I0.097 J-0.362 E0.0152 F1800
-G1 X18.585 Y31.483 E0.2195 F1800
-G3 X19.309 Y31.677 I0.362 J0.097 E0.0431 F1800
-G1 X17.756 Y37.473 E0.2195 F1800
-G2 X18.022 Y37.932 I0.362 J0.097 E0.0152 F1800
-G1 X20.436 Y38.579 E0.0915 F1800
-G2 X20.896 Y38.314 I0.097 J-0.362 E0.0152 F1800
-G1 X22.449 Y32.518 E0.2195 F1800
-G3 X23.173 Y32.712 I0.362 J0.097 E0.0431 F1800
-G1 X21.620 Y38.508 E0.2195 F1800
-G2 X21.885 Y38.967 I0.362 J0.097 E0.0152 F1800
-G1 X24.300 Y39.614 E0.0915 F1800
-G2 X24.759 Y39.349 I0.097 J-0.362 E0.0152 F1800
-G1 X26.312 Y33.553 E0.2195 F1800
-G3 X27.037 Y33.748 I0.362 J0.097 E0.0431 F1800
-G1 X25.484 Y39.543 E0.2195 F1800
-G2 X25.749 Y40.002 I0.362 J0.097 E0.0152 F1800
-G1 X28.164 Y40.649 E0.0915 F1800
-G2 X28.623 Y40.384 I0.097 J-0.362 E0.0152 F1800
-G1 X30.176 Y34.589 E0.2195 F1800
-G3 X30.900 Y34.783 I0.362 J0.097 E0.0431 F1800
-G1 X29.348 Y40.578 E0.2195 F1800
-G2 X29.613 Y41.038 I0.362 J0.097 E0.0152 F1800
-G1 X32.028 Y41.685 E0.0915 F1800
-G2 X32.487 Y41.420 I0.097 J-0.362 E0.0152 F1800
-G1 X34.040 Y35.624 E0.2195 F1800
-G3 X34.764 Y35.818 I0.362 J0.097 E0.0431 F1800
-G1 X33.211 Y41.614 E0.2195 F1800
-G2 X33.476 Y42.073 I0.362 J0.097 E0.0152 F1800
-G1 X35.891 Y42.720 E0.0915 F1800
-G2 X36.350 Y42.455 I0.097 J-0.362 E0.0152 F1800
-G1 X37.903 Y36.659 E0.2195 F1800
-G3 X38.628 Y36.853 I0.362 J0.097 E0.0431 F1800
-G1 X37.075 Y42.649 E0.2195 F1800
-G2 X37.340 Y43.108 I0.362 J0.097 E0.0152 F1800
-G1 X39.755 Y43.755 E0.0915 F1800
-G2 X40.214 Y43.490 I0.097 J-0.362 E0.0152 F1800
-G1 X41.767 Y37.695 E0.2195 F1800
-G3 X42.492 Y37.889 I0.362 J0.097 E0.0431 F1800
-G1 X40.939 Y43.684 E0.2195 F1800
-G2 X41.204 Y44.143 I0.362 J0.097 E0.0152 F1800
-G1 X43.619 Y44.791 E0.0915 F1800
-G2 X44.078 Y44.525 I0.097 J-0.362 E0.0152 F1800
-G1 X45.631 Y38.730 E0.2195 F1800
-G3 X46.355 Y38.924 I0.362 J0.097 E0.0431 F1800
-G1 X44.802 Y44.719 E0.2195 F1800
-G2 X45.068 Y45.179 I0.362 J0.097 E0.0152 F1800
-G1 X47.482 Y45.826 E0.0915 F1800
-G2 X47.942 Y45.561 I0.097 J-0.362 E0.0152 F1800
-G1 X49.495 Y39.765 E0.2195 F1800
-G3 X50.219 Y39.959 I0.362 J0.097 E0.0431 F1800
-G1 X48.666 Y45.755 E0.2195 F1800
-G2 X48.931 Y46.214 I0.362 J0.097 E0.0152 F1800
-G1 X51.346 Y46.861 E0.0915 F1800
-G2 X51.805 Y46.596 I0.097 J-0.362 E0.0152 F1800
-G1 X53.358 Y40.800 E0.2195 F1800
-G3 X54.083 Y40.994 I0.362 J0.097 E0.0431 F1800
-G1 X52.530 Y46.790 E0.2195 F1800
-G2 X52.795 Y47.249 I0.362 J0.097 E0.0152 F1800
-G1 X55.210 Y47.896 E0.0915 F1800
-G2 X55.669 Y47.631 I0.097 J-0.362 E0.0152 F1800
-G1 X57.222 Y41.836 E0.2195 F1800
-G3 X57.946 Y42.030 I0.362 J0.097 E0.0431 F1800
-G1 X56.393 Y47.825 E0.2195 F1800
-G2 X56.659 Y48.285 I0.362 J0.097 E0.0152 F1800
-G1 X59.073 Y48.932 E0.0915 F1800
-G2 X59.533 Y48.666 I0.097 J-0.362 E0.0152 F1800
-G1 X61.086 Y42.871 E0.2195 F1800
-G3 X61.810 Y43.065 I0.362 J0.097 E0.0431 F1800
-G1 X60.257 Y48.861 E0.2195 F1800
-G2 X60.522 Y49.320 I0.362 J0.097 E0.0152 F1800
-G1 X62.937 Y49.967 E0.0915 F1800
-G2 X63.396 Y49.702 I0.097 J-0.362 E0.0152 F1800
-G1 X64.949 Y43.906 E0.2195 F1800
-G3 X65.674 Y44.100 I0.362 J0.097 E0.0431 F1800
-G1 X64.121 Y49.896 E0.2195 F1800
-G2 X64.386 Y50.355 I0.362 J0.097 E0.0152 F1800
-G1 X66.801 Y51.002 E0.0915 F1800
-G2 X67.260 Y50.737 I0.097 J-0.362 E0.0152 F1800
-G1 X68.813 Y44.941 E0.2195 F1800
-G3 X69.537 Y45.136 I0.362 J0.097 E0.0431 F1800
-G1 X67.985 Y50.931 E0.2195 F1800
-G2 X68.250 Y51.390 I0.362 J0.097 E0.0152 F1800
-G1 X70.665 Y52.037 E0.0915 F1800
-G2 X71.124 Y51.772 I0.097 J-0.362 E0.0152 F1800
-G1 X72.677 Y45.977 E0.2195 F1800
-G3 X73.401 Y46.171 I0.362 J0.097 E0.0431 F1800
-G1 X71.848 Y51.966 E0.2195 F1800
-G2 X72.113 Y52.426 I0.362 J0.097 E0.0152 F1800
-G1 X74.528 Y53.073 E0.0915 F1800
-G2 X74.988 Y52.808 I0.097 J-0.362 E0.0152 F1800
-G1 X76.540 Y47.012 E0.2195 F1800
-G3 X77.265 Y47.206 I0.362 J0.097 E0.0431 F1800
-G1 X75.712 Y53.002 E0.2195 F1800
-G2 X75.977 Y53.461 I0.362 J0.097 E0.0152 F1800
-G1 X78.392 Y54.108 E0.0915 F1800
-G2 X78.851 Y53.843 I0.097 J-0.362 E0.0152 F1800
-G1 X80.404 Y48.047
+G1 X14.650 Y30.325
+G3 X15.375 Y30.519 I0.362 J0.097 E0.0431 F1800
+G1 X13.822 Y36.315 E0.2195 F1800
+G2 X14.087 Y36.774 I0.362 J0.097 E0.0152 F1800
+G1 X16.502 Y37.421 E0.0915 F1800
+G2 X16.961 Y37.156 I0.097 J-0.362 E0.0152 F1800
+G1 X18.514 Y31.360 E0.2195 F1800
+G3 X19.239 Y31.555 I0.362 J0.097 E0.0431 F1800
+G1 X17.686 Y37.350 E0.2195 F1800
+G2 X17.951 Y37.809 I0.362 J0.097 E0.0152 F1800
+G1 X20.366 Y38.456 E0.0915 F1800
+G2 X20.825 Y38.191 I0.097 J-0.362 E0.0152 F1800
+G1 X22.378 Y32.396 E0.2195 F1800
+G3 X23.102 Y32.590 I0.362 J0.097 E0.0431 F1800
+G1 X21.549 Y38.385 E0.2195 F1800
+G2 X21.815 Y38.845 I0.362 J0.097 E0.0152 F1800
+G1 X24.229 Y39.492 E0.0915 F1800
+G2 X24.689 Y39.227 I0.097 J-0.362 E0.0152 F1800
+G1 X26.242 Y33.431 E0.2195 F1800
+G3 X26.966 Y33.625 I0.362 J0.097 E0.0431 F1800
+G1 X25.413 Y39.421 E0.2195 F1800
+G2 X25.678 Y39.880 I0.362 J0.097 E0.0152 F1800
+G1 X28.093 Y40.527 E0.0915 F1800
+G2 X28.552 Y40.262 I0.097 J-0.362 E0.0152 F1800
+G1 X30.105 Y34.466 E0.2195 F1800
+G3 X30.830 Y34.660 I0.362 J0.097 E0.0431 F1800
+G1 X29.277 Y40.456 E0.2195 F1800
+G2 X29.542 Y40.915 I0.362 J0.097 E0.0152 F1800
+G1 X31.957 Y41.562 E0.0915 F1800
+G2 X32.416 Y41.297 I0.097 J-0.362 E0.0152 F1800
+G1 X33.969 Y35.502 E0.2195 F1800
+G3 X34.693 Y35.696 I0.362 J0.097 E0.0431 F1800
+G1 X33.141 Y41.491 E0.2195 F1800
+G2 X33.406 Y41.950 I0.362 J0.097 E0.0152 F1800
+G1 X35.821 Y42.598 E0.0915 F1800
+G2 X36.280 Y42.332 I0.097 J-0.362 E0.0152 F1800
+G1 X37.833 Y36.537 E0.2195 F1800
+G3 X38.557 Y36.731 I0.362 J0.097 E0.0431 F1800
+G1 X37.004 Y42.526 E0.2195 F1800
+G2 X37.269 Y42.986 I0.362 J0.097 E0.0152 F1800
+G1 X39.684 Y43.633 E0.0915 F1800
+G2 X40.143 Y43.368 I0.097 J-0.362 E0.0152 F1800
+G1 X41.696 Y37.572 E0.2195 F1800
+G3 X42.421 Y37.766 I0.362 J0.097 E0.0431 F1800
+G1 X40.868 Y43.562 E0.2195 F1800
+G2 X41.133 Y44.021 I0.362 J0.097 E0.0152 F1800
+G1 X43.548 Y44.668 E0.0915 F1800
+G2 X44.007 Y44.403 I0.097 J-0.362 E0.0152 F1800
+G1 X45.560 Y38.607 E0.2195 F1800
+G3 X46.285 Y38.801 I0.362 J0.097 E0.0431 F1800
+G1 X44.732 Y44.597 E0.2195 F1800
+G2 X44.997 Y45.056 I0.362 J0.097 E0.0152 F1800
+G1 X47.412 Y45.703 E0.0915 F1800
+G2 X47.871 Y45.438 I0.097 J-0.362 E0.0152 F1800
+G1 X49.424 Y39.643 E0.2195 F1800
+G3 X50.148 Y39.837 I0.362 J0.097 E0.0431 F1800
+G1 X48.595 Y45.632 E0.2195 F1800
+G2 X48.861 Y46.092 I0.362 J0.097 E0.0152 F1800
+G1 X51.275 Y46.739 E0.0915 F1800
+G2 X51.735 Y46.473 I0.097 J-0.362 E0.0152 F1800
+G1 X53.288 Y40.678 E0.2195 F1800
+G3 X54.012 Y40.872 I0.362 J0.097 E0.0431 F1800
+G1 X52.459 Y46.668 E0.2195 F1800
+G2 X52.724 Y47.127 I0.362 J0.097 E0.0152 F1800
+G1 X55.139 Y47.774 E0.0915 F1800
+G2 X55.598 Y47.509 I0.097 J-0.362 E0.0152 F1800
+G1 X57.151 Y41.713 E0.2195 F1800
+G3 X57.876 Y41.907 I0.362 J0.097 E0.0431 F1800
+G1 X56.323 Y47.703 E0.2195 F1800
+G2 X56.588 Y48.162 I0.362 J0.097 E0.0152 F1800
+G1 X59.003 Y48.809 E0.0915 F1800
+G2 X59.462 Y48.544 I0.097 J-0.362 E0.0152 F1800
+G1 X61.015 Y42.748 E0.2195 F1800
+G3 X61.739 Y42.943 I0.362 J0.097 E0.0431 F1800
+G1 X60.186 Y48.738 E0.2195 F1800
+G2 X60.452 Y49.197 I0.362 J0.097 E0.0152 F1800
+G1 X62.866 Y49.844 E0.0915 F1800
+G2 X63.326 Y49.579 I0.097 J-0.362 E0.0152 F1800
+G1 X64.879 Y43.784 E0.2195 F1800
+G3 X65.603 Y43.978 I0.362 J0.097 E0.0431 F1800
+G1 X64.050 Y49.773 E0.2195 F1800
+G2 X64.315 Y50.233 I0.362 J0.097 E0.0152 F1800
+G1 X66.730 Y50.880 E0.0915 F1800
+G2 X67.189 Y50.615 I0.097 J-0.362 E0.0152 F1800
+G1 X68.742 Y44.819 E0.2195 F1800
+G3 X69.467 Y45.013 I0.362 J0.097 E0.0431 F1800
+G1 X67.914 Y50.809 E0.2195 F1800
+G2 X68.179 Y51.268 I0.362 J0.097 E0.0152 F1800
+G1 X70.594 Y51.915 E0.0915 F1800
+G2 X71.053 Y51.650 I0.097 J-0.362 E0.0152 F1800
+G1 X72.606 Y45.854 E0.2195 F1800
+G3 X73.330 Y46.048 I0.362 J0.097 E0.0431 F1800
+G1 X71.778 Y51.844 E0.2195 F1800
+G2 X72.043 Y52.303 I0.362 J0.097 E0.0152 F1800
+G1 X74.458 Y52.950 E0.0915 F1800
+G2 X74.917 Y52.685 I0.097 J-0.362 E0.0152 F1800
+G1 X76.470 Y46.890 E0.2195 F1800
+G3 X77.194 Y47.084 I0.362 J0.097 E0.0431 F1800
+G1 X75.641 Y52.879 E0.2195 F1800
+G2 X75.906 Y53.338 I0.362 J0.097 E0.0152 F1800
+G1 X78.321 Y53.986 E0.0915 F1800
+G2 X78.781 Y53.720 I0.097 J-0.362 E0.0152 F1800
+G1 X80.333 Y47.925
 G1 Z0.850 E-5.0000 F4800
-G1 X78.334 Y55.775
-G1 X10.719 Y37.657
+G1 X78.263 Y55.652
+G1 X10.648 Y37.535
 ;print horizontal interlocked reference pattern 4
-G1 X10.321 Y46.868 F1800
+G1 X10.251 Y46.746 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X11.874 Y41.073
-G3 X12.599 Y41.267 I0.362 J0.097 E0.0431 F1800
-G1 X11.046 Y47.062 E0.2195 F1800
-G2 X11.311 Y47.522 I0.362 J0.097 E0.0152 F1800
-G1 X13.726 Y48.169 E0.0915 F1800
-G2 X14.185 Y47.904 I0.097 J-0.362 E0.0152 F1800
-G1 X15.738 Y42.108 E0.2195 F1800
-G3 X16.462 Y42.302 I0.362 J0.097 E0.0431 F1800
-G1 X14.909 Y48.098 E0.2195 F1800
-G2 X15.175 Y48.557 I0.362 J0.097 E0.0152 F1800
-G1 X17.589 Y49.204 E0.0915 F1800
-G2 X18.049 Y48.939 I0.097 J-0.362 E0.0152 F1800
-G1 X19.602 Y43.143 E0.2195 F1800
-G3 X20.326 Y43.337 I0.362 J0.097 E0.0431 F1800
-G1 X18.773 Y49.133 E0.2195 F1800
-G2 X19.038 Y49.592 I0.362 J0.097 E0.0152 F1800
-G1 X21.453 Y50.239 E0.0915 F1800
-G2 X21.912 Y49.974 I0.097 J-0.362 E0.0152 F1800
-G1 X23.465 Y44.179 E0.2195 F1800
-G3 X24.190 Y44.373 I0.362 J0.097 E0.0431 F1800
-G1 X22.637 Y50.168 E0.2195 F1800
-G2 X22.902 Y50.628 I0.362 J0.097 E0.0152 F1800
-G1 X25.317 Y51.275 E0.0915 F1800
-G2 X25.776 Y51.009 I0.097 J-0.362 E0.0152 F1800
-G1 X27.329 Y45.214 E0.2195 F1800
-G3 X28.053 Y45.408 I0.362 J0.097 E0.0431 F1800
-G1 X26.501 Y51.204 E0.2195 F1800
-G2 X26.766 Y51.663 I0.362 J0.097 E0.0152 F1800
-G1 X29.181 Y52.310 E0.0915 F1800
-G2 X29.640 Y52.045 I0.097 J-0.362 E0.0152 F1800
-G1 X31.193 Y46.249 E0.2195 F1800
-G3 X31.917 Y46.443 I0.362 J0.097 E0.0431 F1800
-G1 X30.364 Y52.239 E0.2195 F1800
-G2 X30.629 Y52.698 I0.362 J0.097 E0.0152 F1800
-G1 X33.044 Y53.345 E0.0915 F1800
-G2 X33.503 Y53.080 I0.097 J-0.362 E0.0152 F1800
-G1 X35.056 Y47.284 E0.2195 F1800
-G3 X35.781 Y47.479 I0.362 J0.097 E0.0431 F1800
-G1 X34.228 Y53.274 E0.2195 F1800
-G2 X34.493 Y53.733 I0.362 J0.097 E0.0152 F1800
-G1 X36.908 Y54.380 E0.0915 F1800
-G2 X37.367 Y54.115 I0.097 J-0.362 E0.0152 F1800
-G1 X38.920 Y48.320 E0.2195 F1800
-G3 X39.645 Y48.514 I0.362 J0.097 E0.0431 F1800
-G1 X38.092 Y54.309 E0.2195 F1800
-G2 X38.357 Y54.769 I0.362 J0.097 E0.0152 F1800
-G1 X40.772 Y55.416 E0.0915 F1800
-G2 X41.231 Y55.151 I0.097 J-0.362 E0.0152 F1800
-G1 X42.784 Y49.355 E0.2195 F1800
-G3 X43.508 Y49.549 I0.362 J0.097 E0.0431 F1800
-G1 X41.955 Y55.345 E0.2195 F1800
-G2 X42.221 Y55.804 I0.362 J0.097 E0.0152 F1800
-G1 X44.635 Y56.451 E0.0915 F1800
-G2 X45.095 Y56.186 I0.097 J-0.362 E0.0152 F1800
-G1 X46.648 Y50.390 E0.2195 F1800
-G3 X47.372 Y50.584 I0.362 J0.097 E0.0431 F1800
-G1 X45.819 Y56.380 E0.2195 F1800
-G2 X46.084 Y56.839 I0.362 J0.097 E0.0152 F1800
-G1 X48.499 Y57.486 E0.0915 F1800
-G2 X48.958 Y57.221 I0.097 J-0.362 E0.0152 F1800
-G1 X50.511 Y51.426 E0.2195 F1800
-G3 X51.236 Y51.620 I0.362 J0.097 E0.0431 F1800
-G1 X49.683 Y57.415 E0.2195 F1800
-G2 X49.948 Y57.874 I0.362 J0.097 E0.0152 F1800
-G1 X52.363 Y58.522 E0.0915 F1800
-G2 X52.822 Y58.256 I0.097 J-0.362 E0.0152 F1800
-G1 X54.375 Y52.461 E0.2195 F1800
-G3 X55.099 Y52.655 I0.362 J0.097 E0.0431 F1800
-G1 X53.546 Y58.450 E0.2195 F1800
-G2 X53.812 Y58.910 I0.362 J0.097 E0.0152 F1800
-G1 X56.226 Y59.557 E0.0915 F1800
-G2 X56.686 Y59.292 I0.097 J-0.362 E0.0152 F1800
-G1 X58.239 Y53.496 E0.2195 F1800
-G3 X58.963 Y53.690 I0.362 J0.097 E0.0431 F1800
-G1 X57.410 Y59.486 E0.2195 F1800
-G2 X57.675 Y59.945 I0.362 J0.097 E0.0152 F1800
-G1 X60.090 Y60.592 E0.0915 F1800
-G2 X60.549 Y60.327 I0.097 J-0.362 E0.0152 F1800
-G1 X62.102 Y54.531 E0.2195 F1800
-G3 X62.827 Y54.725 I0.362 J0.097 E0.0431 F1800
-G1 X61.274 Y60.521 E0.2195 F1800
-G2 X61.539 Y60.980 I0.362 J0.097 E0.0152 F1800
-G1 X63.954 Y61.627 E0.0915 F1800
-G2 X64.413 Y61.362 I0.097 J-0.362 E0.0152 F1800
-G1 X65.966 Y55.567 E0.2195 F1800
-G3 X66.690 Y55.761 I0.362 J0.097 E0.0431 F1800
-G1 X65.138 Y61.556 E0.2195 F1800
-G2 X65.403 Y62.016 I0.362 J0.097 E0.0152 F1800
-G1 X67.818 Y62.663 E0.0915 F1800
-G2 X68.277 Y62.397 I0.097 J-0.362 E0.0152 F1800
-G1 X69.830 Y56.602 E0.2195 F1800
-G3 X70.554 Y56.796 I0.362 J0.097 E0.0431 F1800
-G1 X69.001 Y62.592 E0.2195 F1800
-G2 X69.266 Y63.051 I0.362 J0.097 E0.0152 F1800
-G1 X71.681 Y63.698 E0.0915 F1800
-G2 X72.141 Y63.433 I0.097 J-0.362 E0.0152 F1800
-G1 X73.693 Y57.637 E0.2195 F1800
-G3 X74.418 Y57.831 I0.362 J0.097 E0.0431 F1800
-G1 X72.865 Y63.627 E0.2195 F1800
-G2 X73.130 Y64.086 I0.362 J0.097 E0.0152 F1800
-G1 X75.545 Y64.733 E0.0915 F1800
-G2 X76.004 Y64.468 I0.097 J-0.362 E0.0152 F1800
-G1 X77.557 Y58.672
+G1 X11.803 Y40.950
+G3 X12.528 Y41.144 I0.362 J0.097 E0.0431 F1800
+G1 X10.975 Y46.940 E0.2195 F1800
+G2 X11.240 Y47.399 I0.362 J0.097 E0.0152 F1800
+G1 X13.655 Y48.046 E0.0915 F1800
+G2 X14.114 Y47.781 I0.097 J-0.362 E0.0152 F1800
+G1 X15.667 Y41.986 E0.2195 F1800
+G3 X16.392 Y42.180 I0.362 J0.097 E0.0431 F1800
+G1 X14.839 Y47.975 E0.2195 F1800
+G2 X15.104 Y48.435 I0.362 J0.097 E0.0152 F1800
+G1 X17.519 Y49.082 E0.0915 F1800
+G2 X17.978 Y48.816 I0.097 J-0.362 E0.0152 F1800
+G1 X19.531 Y43.021 E0.2195 F1800
+G3 X20.255 Y43.215 I0.362 J0.097 E0.0431 F1800
+G1 X18.702 Y49.011 E0.2195 F1800
+G2 X18.968 Y49.470 I0.362 J0.097 E0.0152 F1800
+G1 X21.382 Y50.117 E0.0915 F1800
+G2 X21.842 Y49.852 I0.097 J-0.362 E0.0152 F1800
+G1 X23.395 Y44.056 E0.2195 F1800
+G3 X24.119 Y44.250 I0.362 J0.097 E0.0431 F1800
+G1 X22.566 Y50.046 E0.2195 F1800
+G2 X22.831 Y50.505 I0.362 J0.097 E0.0152 F1800
+G1 X25.246 Y51.152 E0.0915 F1800
+G2 X25.705 Y50.887 I0.097 J-0.362 E0.0152 F1800
+G1 X27.258 Y45.091 E0.2195 F1800
+G3 X27.983 Y45.286 I0.362 J0.097 E0.0431 F1800
+G1 X26.430 Y51.081 E0.2195 F1800
+G2 X26.695 Y51.540 I0.362 J0.097 E0.0152 F1800
+G1 X29.110 Y52.187 E0.0915 F1800
+G2 X29.569 Y51.922 I0.097 J-0.362 E0.0152 F1800
+G1 X31.122 Y46.127 E0.2195 F1800
+G3 X31.846 Y46.321 I0.362 J0.097 E0.0431 F1800
+G1 X30.294 Y52.116 E0.2195 F1800
+G2 X30.559 Y52.576 I0.362 J0.097 E0.0152 F1800
+G1 X32.973 Y53.223 E0.0915 F1800
+G2 X33.433 Y52.958 I0.097 J-0.362 E0.0152 F1800
+G1 X34.986 Y47.162 E0.2195 F1800
+G3 X35.710 Y47.356 I0.362 J0.097 E0.0431 F1800
+G1 X34.157 Y53.152 E0.2195 F1800
+G2 X34.422 Y53.611 I0.362 J0.097 E0.0152 F1800
+G1 X36.837 Y54.258 E0.0915 F1800
+G2 X37.296 Y53.993 I0.097 J-0.362 E0.0152 F1800
+G1 X38.849 Y48.197 E0.2195 F1800
+G3 X39.574 Y48.391 I0.362 J0.097 E0.0431 F1800
+G1 X38.021 Y54.187 E0.2195 F1800
+G2 X38.286 Y54.646 I0.362 J0.097 E0.0152 F1800
+G1 X40.701 Y55.293 E0.0915 F1800
+G2 X41.160 Y55.028 I0.097 J-0.362 E0.0152 F1800
+G1 X42.713 Y49.233 E0.2195 F1800
+G3 X43.438 Y49.427 I0.362 J0.097 E0.0431 F1800
+G1 X41.885 Y55.222 E0.2195 F1800
+G2 X42.150 Y55.681 I0.362 J0.097 E0.0152 F1800
+G1 X44.565 Y56.329 E0.0915 F1800
+G2 X45.024 Y56.063 I0.097 J-0.362 E0.0152 F1800
+G1 X46.577 Y50.268 E0.2195 F1800
+G3 X47.301 Y50.462 I0.362 J0.097 E0.0431 F1800
+G1 X45.748 Y56.257 E0.2195 F1800
+G2 X46.013 Y56.717 I0.362 J0.097 E0.0152 F1800
+G1 X48.428 Y57.364 E0.0915 F1800
+G2 X48.888 Y57.099 I0.097 J-0.362 E0.0152 F1800
+G1 X50.441 Y51.303 E0.2195 F1800
+G3 X51.165 Y51.497 I0.362 J0.097 E0.0431 F1800
+G1 X49.612 Y57.293 E0.2195 F1800
+G2 X49.877 Y57.752 I0.362 J0.097 E0.0152 F1800
+G1 X52.292 Y58.399 E0.0915 F1800
+G2 X52.751 Y58.134 I0.097 J-0.362 E0.0152 F1800
+G1 X54.304 Y52.338 E0.2195 F1800
+G3 X55.029 Y52.532 I0.362 J0.097 E0.0431 F1800
+G1 X53.476 Y58.328 E0.2195 F1800
+G2 X53.741 Y58.787 I0.362 J0.097 E0.0152 F1800
+G1 X56.156 Y59.434 E0.0915 F1800
+G2 X56.615 Y59.169 I0.097 J-0.362 E0.0152 F1800
+G1 X58.168 Y53.374 E0.2195 F1800
+G3 X58.892 Y53.568 I0.362 J0.097 E0.0431 F1800
+G1 X57.339 Y59.363 E0.2195 F1800
+G2 X57.605 Y59.823 I0.362 J0.097 E0.0152 F1800
+G1 X60.019 Y60.470 E0.0915 F1800
+G2 X60.479 Y60.204 I0.097 J-0.362 E0.0152 F1800
+G1 X62.032 Y54.409 E0.2195 F1800
+G3 X62.756 Y54.603 I0.362 J0.097 E0.0431 F1800
+G1 X61.203 Y60.399 E0.2195 F1800
+G2 X61.468 Y60.858 I0.362 J0.097 E0.0152 F1800
+G1 X63.883 Y61.505 E0.0915 F1800
+G2 X64.342 Y61.240 I0.097 J-0.362 E0.0152 F1800
+G1 X65.895 Y55.444 E0.2195 F1800
+G3 X66.620 Y55.638 I0.362 J0.097 E0.0431 F1800
+G1 X65.067 Y61.434 E0.2195 F1800
+G2 X65.332 Y61.893 I0.362 J0.097 E0.0152 F1800
+G1 X67.747 Y62.540 E0.0915 F1800
+G2 X68.206 Y62.275 I0.097 J-0.362 E0.0152 F1800
+G1 X69.759 Y56.479 E0.2195 F1800
+G3 X70.483 Y56.674 I0.362 J0.097 E0.0431 F1800
+G1 X68.931 Y62.469 E0.2195 F1800
+G2 X69.196 Y62.928 I0.362 J0.097 E0.0152 F1800
+G1 X71.611 Y63.575 E0.0915 F1800
+G2 X72.070 Y63.310 I0.097 J-0.362 E0.0152 F1800
+G1 X73.623 Y57.515 E0.2195 F1800
+G3 X74.347 Y57.709 I0.362 J0.097 E0.0431 F1800
+G1 X72.794 Y63.504 E0.2195 F1800
+G2 X73.059 Y63.964 I0.362 J0.097 E0.0152 F1800
+G1 X75.474 Y64.611 E0.0915 F1800
+G2 X75.934 Y64.346 I0.097 J-0.362 E0.0152 F1800
+G1 X77.486 Y58.550
 G1 Z0.850 E-5.0000 F4800
-G1 X75.487 Y66.400
-G1 X7.872 Y48.283
-G1 X7.474 Y57.494 F1800
+G1 X75.416 Y66.277
+G1 X7.801 Y48.160
+G1 X7.404 Y57.371 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X9.027 Y51.698
-G3 X9.752 Y51.892 I0.362 J0.097 E0.0431 F1800
-G1 X8.199 Y57.688 E0.2195 F1800
-G2 X8.464 Y58.147 I0.362 J0.097 E0.0152 F1800
-G1 X10.879 Y58.794 E0.0915 F1800
-G2 X11.338 Y58.529 I0.097 J-0.362 E0.0152 F1800
-G1 X12.891 Y52.733 E0.2195 F1800
-G3 X13.615 Y52.927 I0.362 J0.097 E0.0431 F1800
-G1 X12.062 Y58.723 E0.2195 F1800
-G2 X12.328 Y59.182 I0.362 J0.097 E0.0152 F1800
-G1 X14.742 Y59.829 E0.0915 F1800
-G2 X15.202 Y59.564 I0.097 J-0.362 E0.0152 F1800
-G1 X16.755 Y53.769 E0.2195 F1800
-G3 X17.479 Y53.963 I0.362 J0.097 E0.0431 F1800
-G1 X15.926 Y59.758 E0.2195 F1800
-G2 X16.191 Y60.217 I0.362 J0.097 E0.0152 F1800
-G1 X18.606 Y60.865 E0.0915 F1800
-G2 X19.065 Y60.599 I0.097 J-0.362 E0.0152 F1800
-G1 X20.618 Y54.804 E0.2195 F1800
-G3 X21.343 Y54.998 I0.362 J0.097 E0.0431 F1800
-G1 X19.790 Y60.793 E0.2195 F1800
-G2 X20.055 Y61.253 I0.362 J0.097 E0.0152 F1800
-G1 X22.470 Y61.900 E0.0915 F1800
-G2 X22.929 Y61.635 I0.097 J-0.362 E0.0152 F1800
-G1 X24.482 Y55.839 E0.2195 F1800
-G3 X25.206 Y56.033 I0.362 J0.097 E0.0431 F1800
-G1 X23.654 Y61.829 E0.2195 F1800
-G2 X23.919 Y62.288 I0.362 J0.097 E0.0152 F1800
-G1 X26.333 Y62.935 E0.0915 F1800
-G2 X26.793 Y62.670 I0.097 J-0.362 E0.0152 F1800
-G1 X28.346 Y56.874 E0.2195 F1800
-G3 X29.070 Y57.068 I0.362 J0.097 E0.0431 F1800
-G1 X27.517 Y62.864 E0.2195 F1800
-G2 X27.782 Y63.323 I0.362 J0.097 E0.0152 F1800
-G1 X30.197 Y63.970 E0.0915 F1800
-G2 X30.656 Y63.705 I0.097 J-0.362 E0.0152 F1800
-G1 X32.209 Y57.910 E0.2195 F1800
-G3 X32.934 Y58.104 I0.362 J0.097 E0.0431 F1800
-G1 X31.381 Y63.899 E0.2195 F1800
-G2 X31.646 Y64.359 I0.362 J0.097 E0.0152 F1800
-G1 X34.061 Y65.006 E0.0915 F1800
-G2 X34.520 Y64.740 I0.097 J-0.362 E0.0152 F1800
-G1 X36.073 Y58.945 E0.2195 F1800
-G3 X36.798 Y59.139 I0.362 J0.097 E0.0431 F1800
-G1 X35.245 Y64.935 E0.2195 F1800
-G2 X35.510 Y65.394 I0.362 J0.097 E0.0152 F1800
-G1 X37.925 Y66.041 E0.0915 F1800
-G2 X38.384 Y65.776 I0.097 J-0.362 E0.0152 F1800
-G1 X39.937 Y59.980 E0.2195 F1800
-G3 X40.661 Y60.174 I0.362 J0.097 E0.0431 F1800
-G1 X39.108 Y65.970 E0.2195 F1800
-G2 X39.373 Y66.429 I0.362 J0.097 E0.0152 F1800
-G1 X41.788 Y67.076 E0.0915 F1800
-G2 X42.248 Y66.811 I0.097 J-0.362 E0.0152 F1800
-G1 X43.801 Y61.015 E0.2195 F1800
-G3 X44.525 Y61.210 I0.362 J0.097 E0.0431 F1800
-G1 X42.972 Y67.005 E0.2195 F1800
-G2 X43.237 Y67.464 I0.362 J0.097 E0.0152 F1800
-G1 X45.652 Y68.111 E0.0915 F1800
-G2 X46.111 Y67.846 I0.097 J-0.362 E0.0152 F1800
-G1 X47.664 Y62.051 E0.2195 F1800
-G3 X48.389 Y62.245 I0.362 J0.097 E0.0431 F1800
-G1 X46.836 Y68.040 E0.2195 F1800
-G2 X47.101 Y68.500 I0.362 J0.097 E0.0152 F1800
-G1 X49.516 Y69.147 E0.0915 F1800
-G2 X49.975 Y68.882 I0.097 J-0.362 E0.0152 F1800
-G1 X51.528 Y63.086 E0.2195 F1800
-G3 X52.252 Y63.280 I0.362 J0.097 E0.0431 F1800
-G1 X50.699 Y69.076 E0.2195 F1800
-G2 X50.965 Y69.535 I0.362 J0.097 E0.0152 F1800
-G1 X53.379 Y70.182 E0.0915 F1800
-G2 X53.839 Y69.917 I0.097 J-0.362 E0.0152 F1800
-G1 X55.392 Y64.121 E0.2195 F1800
-G3 X56.116 Y64.315 I0.362 J0.097 E0.0431 F1800
-G1 X54.563 Y70.111 E0.2195 F1800
-G2 X54.828 Y70.570 I0.362 J0.097 E0.0152 F1800
-G1 X57.243 Y71.217 E0.0915 F1800
-G2 X57.702 Y70.952 I0.097 J-0.362 E0.0152 F1800
-G1 X59.255 Y65.157 E0.2195 F1800
-G3 X59.980 Y65.351 I0.362 J0.097 E0.0431 F1800
-G1 X58.427 Y71.146 E0.2195 F1800
-G2 X58.692 Y71.606 I0.362 J0.097 E0.0152 F1800
-G1 X61.107 Y72.253 E0.0915 F1800
-G2 X61.566 Y71.987 I0.097 J-0.362 E0.0152 F1800
-G1 X63.119 Y66.192 E0.2195 F1800
-G3 X63.843 Y66.386 I0.362 J0.097 E0.0431 F1800
-G1 X62.291 Y72.182 E0.2195 F1800
-G2 X62.556 Y72.641 I0.362 J0.097 E0.0152 F1800
-G1 X64.971 Y73.288 E0.0915 F1800
-G2 X65.430 Y73.023 I0.097 J-0.362 E0.0152 F1800
-G1 X66.983 Y67.227 E0.2195 F1800
-G3 X67.707 Y67.421 I0.362 J0.097 E0.0431 F1800
-G1 X66.154 Y73.217 E0.2195 F1800
-G2 X66.419 Y73.676 I0.362 J0.097 E0.0152 F1800
-G1 X68.834 Y74.323 E0.0915 F1800
-G2 X69.294 Y74.058 I0.097 J-0.362 E0.0152 F1800
-G1 X70.846 Y68.262 E0.2195 F1800
-G3 X71.571 Y68.457 I0.362 J0.097 E0.0431 F1800
-G1 X70.018 Y74.252 E0.2195 F1800
-G2 X70.283 Y74.711 I0.362 J0.097 E0.0152 F1800
-G1 X72.698 Y75.358 E0.0915 F1800
-G2 X73.157 Y75.093 I0.097 J-0.362 E0.0152 F1800
-G1 X74.710 Y69.298
+G1 X8.956 Y51.575
+G3 X9.681 Y51.770 I0.362 J0.097 E0.0431 F1800
+G1 X8.128 Y57.565 E0.2195 F1800
+G2 X8.393 Y58.024 I0.362 J0.097 E0.0152 F1800
+G1 X10.808 Y58.671 E0.0915 F1800
+G2 X11.267 Y58.406 I0.097 J-0.362 E0.0152 F1800
+G1 X12.820 Y52.611 E0.2195 F1800
+G3 X13.545 Y52.805 I0.362 J0.097 E0.0431 F1800
+G1 X11.992 Y58.600 E0.2195 F1800
+G2 X12.257 Y59.060 I0.362 J0.097 E0.0152 F1800
+G1 X14.672 Y59.707 E0.0915 F1800
+G2 X15.131 Y59.442 I0.097 J-0.362 E0.0152 F1800
+G1 X16.684 Y53.646 E0.2195 F1800
+G3 X17.408 Y53.840 I0.362 J0.097 E0.0431 F1800
+G1 X15.855 Y59.636 E0.2195 F1800
+G2 X16.121 Y60.095 I0.362 J0.097 E0.0152 F1800
+G1 X18.535 Y60.742 E0.0915 F1800
+G2 X18.995 Y60.477 I0.097 J-0.362 E0.0152 F1800
+G1 X20.548 Y54.681 E0.2195 F1800
+G3 X21.272 Y54.875 I0.362 J0.097 E0.0431 F1800
+G1 X19.719 Y60.671 E0.2195 F1800
+G2 X19.984 Y61.130 I0.362 J0.097 E0.0152 F1800
+G1 X22.399 Y61.777 E0.0915 F1800
+G2 X22.858 Y61.512 I0.097 J-0.362 E0.0152 F1800
+G1 X24.411 Y55.717 E0.2195 F1800
+G3 X25.136 Y55.911 I0.362 J0.097 E0.0431 F1800
+G1 X23.583 Y61.706 E0.2195 F1800
+G2 X23.848 Y62.166 I0.362 J0.097 E0.0152 F1800
+G1 X26.263 Y62.813 E0.0915 F1800
+G2 X26.722 Y62.547 I0.097 J-0.362 E0.0152 F1800
+G1 X28.275 Y56.752 E0.2195 F1800
+G3 X28.999 Y56.946 I0.362 J0.097 E0.0431 F1800
+G1 X27.447 Y62.742 E0.2195 F1800
+G2 X27.712 Y63.201 I0.362 J0.097 E0.0152 F1800
+G1 X30.126 Y63.848 E0.0915 F1800
+G2 X30.586 Y63.583 I0.097 J-0.362 E0.0152 F1800
+G1 X32.139 Y57.787 E0.2195 F1800
+G3 X32.863 Y57.981 I0.362 J0.097 E0.0431 F1800
+G1 X31.310 Y63.777 E0.2195 F1800
+G2 X31.575 Y64.236 I0.362 J0.097 E0.0152 F1800
+G1 X33.990 Y64.883 E0.0915 F1800
+G2 X34.449 Y64.618 I0.097 J-0.362 E0.0152 F1800
+G1 X36.002 Y58.822 E0.2195 F1800
+G3 X36.727 Y59.017 I0.362 J0.097 E0.0431 F1800
+G1 X35.174 Y64.812 E0.2195 F1800
+G2 X35.439 Y65.271 I0.362 J0.097 E0.0152 F1800
+G1 X37.854 Y65.918 E0.0915 F1800
+G2 X38.313 Y65.653 I0.097 J-0.362 E0.0152 F1800
+G1 X39.866 Y59.858 E0.2195 F1800
+G3 X40.591 Y60.052 I0.362 J0.097 E0.0431 F1800
+G1 X39.038 Y65.847 E0.2195 F1800
+G2 X39.303 Y66.307 I0.362 J0.097 E0.0152 F1800
+G1 X41.718 Y66.954 E0.0915 F1800
+G2 X42.177 Y66.689 I0.097 J-0.362 E0.0152 F1800
+G1 X43.730 Y60.893 E0.2195 F1800
+G3 X44.454 Y61.087 I0.362 J0.097 E0.0431 F1800
+G1 X42.901 Y66.883 E0.2195 F1800
+G2 X43.166 Y67.342 I0.362 J0.097 E0.0152 F1800
+G1 X45.581 Y67.989 E0.0915 F1800
+G2 X46.041 Y67.724 I0.097 J-0.362 E0.0152 F1800
+G1 X47.593 Y61.928 E0.2195 F1800
+G3 X48.318 Y62.122 I0.362 J0.097 E0.0431 F1800
+G1 X46.765 Y67.918 E0.2195 F1800
+G2 X47.030 Y68.377 I0.362 J0.097 E0.0152 F1800
+G1 X49.445 Y69.024 E0.0915 F1800
+G2 X49.904 Y68.759 I0.097 J-0.362 E0.0152 F1800
+G1 X51.457 Y62.964 E0.2195 F1800
+G3 X52.182 Y63.158 I0.362 J0.097 E0.0431 F1800
+G1 X50.629 Y68.953 E0.2195 F1800
+G2 X50.894 Y69.412 I0.362 J0.097 E0.0152 F1800
+G1 X53.309 Y70.060 E0.0915 F1800
+G2 X53.768 Y69.794 I0.097 J-0.362 E0.0152 F1800
+G1 X55.321 Y63.999 E0.2195 F1800
+G3 X56.045 Y64.193 I0.362 J0.097 E0.0431 F1800
+G1 X54.492 Y69.988 E0.2195 F1800
+G2 X54.758 Y70.448 I0.362 J0.097 E0.0152 F1800
+G1 X57.172 Y71.095 E0.0915 F1800
+G2 X57.632 Y70.830 I0.097 J-0.362 E0.0152 F1800
+G1 X59.185 Y65.034 E0.2195 F1800
+G3 X59.909 Y65.228 I0.362 J0.097 E0.0431 F1800
+G1 X58.356 Y71.024 E0.2195 F1800
+G2 X58.621 Y71.483 I0.362 J0.097 E0.0152 F1800
+G1 X61.036 Y72.130 E0.0915 F1800
+G2 X61.495 Y71.865 I0.097 J-0.362 E0.0152 F1800
+G1 X63.048 Y66.069 E0.2195 F1800
+G3 X63.773 Y66.263 I0.362 J0.097 E0.0431 F1800
+G1 X62.220 Y72.059 E0.2195 F1800
+G2 X62.485 Y72.518 I0.362 J0.097 E0.0152 F1800
+G1 X64.900 Y73.165 E0.0915 F1800
+G2 X65.359 Y72.900 I0.097 J-0.362 E0.0152 F1800
+G1 X66.912 Y67.105 E0.2195 F1800
+G3 X67.636 Y67.299 I0.362 J0.097 E0.0431 F1800
+G1 X66.084 Y73.094 E0.2195 F1800
+G2 X66.349 Y73.554 I0.362 J0.097 E0.0152 F1800
+G1 X68.764 Y74.201 E0.0915 F1800
+G2 X69.223 Y73.935 I0.097 J-0.362 E0.0152 F1800
+G1 X70.776 Y68.140 E0.2195 F1800
+G3 X71.500 Y68.334 I0.362 J0.097 E0.0431 F1800
+G1 X69.947 Y74.130 E0.2195 F1800
+G2 X70.212 Y74.589 I0.362 J0.097 E0.0152 F1800
+G1 X72.627 Y75.236 E0.0915 F1800
+G2 X73.087 Y74.971 I0.097 J-0.362 E0.0152 F1800
+G1 X74.639 Y69.175
 G1 Z0.850 E-5.0000 F4800
-G1 X72.640 Y77.025
-G1 X5.025 Y58.908
+G1 X72.569 Y76.903
+G1 X4.954 Y58.785
 ;print vertical interlocked signal pattern 0
-G1 X-77.804 Y-56.979 F1800
+G1 X-77.875 Y-57.101 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-72.008 Y-55.426
-G3 X-72.203 Y-54.701 I-0.097 J0.362 E0.0431 F1800
-G1 X-77.998 Y-56.254 E0.2195 F1800
-G2 X-78.457 Y-55.989 I-0.097 J0.362 E0.0152 F1800
-G1 X-79.104 Y-53.574 E0.0915 F1800
-G2 X-78.839 Y-53.115 I0.362 J0.097 E0.0152 F1800
-G1 X-73.044 Y-51.562 E0.2195 F1800
-G3 X-73.238 Y-50.838 I-0.097 J0.362 E0.0431 F1800
-G1 X-79.033 Y-52.390 E0.2195 F1800
-G2 X-79.493 Y-52.125 I-0.097 J0.362 E0.0152 F1800
-G1 X-80.140 Y-49.711 E0.0915 F1800
-G2 X-79.874 Y-49.251 I0.362 J0.097 E0.0152 F1800
-G1 X-74.079 Y-47.698 E0.2195 F1800
-G3 X-74.273 Y-46.974 I-0.097 J0.362 E0.0431 F1800
-G1 X-80.069 Y-48.527 E0.2195 F1800
-G2 X-80.528 Y-48.262 I-0.097 J0.362 E0.0152 F1800
-G1 X-81.175 Y-45.847 E0.0915 F1800
-G2 X-80.910 Y-45.388 I0.362 J0.097 E0.0152 F1800
-G1 X-75.114 Y-43.835 E0.2195 F1800
-G3 X-75.308 Y-43.110 I-0.097 J0.362 E0.0431 F1800
-G1 X-81.104 Y-44.663 E0.2195 F1800
-G2 X-81.563 Y-44.398 I-0.097 J0.362 E0.0152 F1800
-G1 X-82.210 Y-41.983 E0.0915 F1800
-G2 X-81.945 Y-41.524 I0.362 J0.097 E0.0152 F1800
-G1 X-76.149 Y-39.971 E0.2195 F1800
-G3 X-76.344 Y-39.246 I-0.097 J0.362 E0.0431 F1800
-G1 X-82.139 Y-40.799 E0.2195 F1800
-G2 X-82.598 Y-40.534 I-0.097 J0.362 E0.0152 F1800
-G1 X-83.245 Y-38.119 E0.0915 F1800
-G2 X-82.980 Y-37.660 I0.362 J0.097 E0.0152 F1800
-G1 X-77.185 Y-36.107 E0.2195 F1800
-G3 X-77.379 Y-35.383 I-0.097 J0.362 E0.0431 F1800
-G1 X-83.174 Y-36.936 E0.2195 F1800
-G2 X-83.634 Y-36.671 I-0.097 J0.362 E0.0152 F1800
-G1 X-84.281 Y-34.256 E0.0915 F1800
-G2 X-84.016 Y-33.796 I0.362 J0.097 E0.0152 F1800
-G1 X-78.220 Y-32.244 E0.2195 F1800
-G3 X-78.414 Y-31.519 I-0.097 J0.362 E0.0431 F1800
-G1 X-84.210 Y-33.072 E0.2195 F1800
-G2 X-84.669 Y-32.807 I-0.097 J0.362 E0.0152 F1800
-G1 X-85.316 Y-30.392 E0.0915 F1800
-G2 X-85.051 Y-29.933 I0.362 J0.097 E0.0152 F1800
-G1 X-79.255 Y-28.380 E0.2195 F1800
-G3 X-79.449 Y-27.655 I-0.097 J0.362 E0.0431 F1800
-G1 X-85.245 Y-29.208 E0.2195 F1800
-G2 X-85.704 Y-28.943 I-0.097 J0.362 E0.0152 F1800
-G1 X-86.351 Y-26.528 E0.0915 F1800
-G2 X-86.086 Y-26.069 I0.362 J0.097 E0.0152 F1800
-G1 X-80.291 Y-24.516 E0.2195 F1800
-G3 X-80.485 Y-23.792 I-0.097 J0.362 E0.0431 F1800
-G1 X-86.280 Y-25.345 E0.2195 F1800
-G2 X-86.740 Y-25.079 I-0.097 J0.362 E0.0152 F1800
-G1 X-87.387 Y-22.665 E0.0915 F1800
-G2 X-87.121 Y-22.205 I0.362 J0.097 E0.0152 F1800
-G1 X-81.326 Y-20.652 E0.2195 F1800
-G3 X-81.520 Y-19.928 I-0.097 J0.362 E0.0431 F1800
-G1 X-87.316 Y-21.481 E0.2195 F1800
-G2 X-87.775 Y-21.216 I-0.097 J0.362 E0.0152 F1800
-G1 X-88.422 Y-18.801 E0.0915 F1800
-G2 X-88.157 Y-18.342 I0.362 J0.097 E0.0152 F1800
-G1 X-82.361 Y-16.789 E0.2195 F1800
-G3 X-82.555 Y-16.064 I-0.097 J0.362 E0.0431 F1800
-G1 X-88.351 Y-17.617 E0.2195 F1800
-G2 X-88.810 Y-17.352 I-0.097 J0.362 E0.0152 F1800
-G1 X-89.457 Y-14.937 E0.0915 F1800
-G2 X-89.192 Y-14.478 I0.362 J0.097 E0.0152 F1800
-G1 X-83.396 Y-12.925 E0.2195 F1800
-G3 X-83.591 Y-12.201 I-0.097 J0.362 E0.0431 F1800
-G1 X-89.386 Y-13.753 E0.2195 F1800
-G2 X-89.845 Y-13.488 I-0.097 J0.362 E0.0152 F1800
-G1 X-90.492 Y-11.073 E0.0915 F1800
-G2 X-90.227 Y-10.614 I0.362 J0.097 E0.0152 F1800
-G1 X-84.432 Y-9.061 E0.2195 F1800
-G3 X-84.626 Y-8.337 I-0.097 J0.362 E0.0431 F1800
-G1 X-90.421 Y-9.890 E0.2195 F1800
-G2 X-90.881 Y-9.625 I-0.097 J0.362 E0.0152 F1800
-G1 X-91.528 Y-7.210 E0.0915 F1800
-G2 X-91.263 Y-6.751 I0.362 J0.097 E0.0152 F1800
-G1 X-85.467 Y-5.198 E0.2195 F1800
-G3 X-85.661 Y-4.473 I-0.097 J0.362 E0.0431 F1800
-G1 X-91.457 Y-6.026 E0.2195 F1800
-G2 X-91.916 Y-5.761 I-0.097 J0.362 E0.0152 F1800
-G1 X-92.563 Y-3.346 E0.0915 F1800
-G2 X-92.298 Y-2.887 I0.362 J0.097 E0.0152 F1800
-G1 X-86.502 Y-1.334 E0.2195 F1800
-G3 X-86.696 Y-0.609 I-0.097 J0.362 E0.0431 F1800
-G1 X-92.492 Y-2.162 E0.2195 F1800
-G2 X-92.951 Y-1.897 I-0.097 J0.362 E0.0152 F1800
-G1 X-93.598 Y0.518 E0.0915 F1800
-G2 X-93.333 Y0.977 I0.362 J0.097 E0.0152 F1800
-G1 X-87.538 Y2.530 E0.2195 F1800
-G3 X-87.732 Y3.254 I-0.097 J0.362 E0.0431 F1800
-G1 X-93.527 Y1.701 E0.2195 F1800
-G2 X-93.986 Y1.967 I-0.097 J0.362 E0.0152 F1800
-G1 X-94.634 Y4.381 E0.0915 F1800
-G2 X-94.368 Y4.841 I0.362 J0.097 E0.0152 F1800
-G1 X-88.573 Y6.394 E0.2195 F1800
-G3 X-88.767 Y7.118 I-0.097 J0.362 E0.0431 F1800
-G1 X-94.562 Y5.565 E0.2195 F1800
-G2 X-95.022 Y5.830 I-0.097 J0.362 E0.0152 F1800
-G1 X-95.669 Y8.245 E0.0915 F1800
-G2 X-95.404 Y8.704 I0.362 J0.097 E0.0152 F1800
-G1 X-89.608 Y10.257
+G1 X-72.079 Y-55.548
+G3 X-72.273 Y-54.824 I-0.097 J0.362 E0.0431 F1800
+G1 X-78.069 Y-56.377 E0.2195 F1800
+G2 X-78.528 Y-56.112 I-0.097 J0.362 E0.0152 F1800
+G1 X-79.175 Y-53.697 E0.0915 F1800
+G2 X-78.910 Y-53.237 I0.362 J0.097 E0.0152 F1800
+G1 X-73.114 Y-51.685 E0.2195 F1800
+G3 X-73.308 Y-50.960 I-0.097 J0.362 E0.0431 F1800
+G1 X-79.104 Y-52.513 E0.2195 F1800
+G2 X-79.563 Y-52.248 I-0.097 J0.362 E0.0152 F1800
+G1 X-80.210 Y-49.833 E0.0915 F1800
+G2 X-79.945 Y-49.374 I0.362 J0.097 E0.0152 F1800
+G1 X-74.150 Y-47.821 E0.2195 F1800
+G3 X-74.344 Y-47.096 I-0.097 J0.362 E0.0431 F1800
+G1 X-80.139 Y-48.649 E0.2195 F1800
+G2 X-80.599 Y-48.384 I-0.097 J0.362 E0.0152 F1800
+G1 X-81.246 Y-45.969 E0.0915 F1800
+G2 X-80.980 Y-45.510 I0.362 J0.097 E0.0152 F1800
+G1 X-75.185 Y-43.957 E0.2195 F1800
+G3 X-75.379 Y-43.233 I-0.097 J0.362 E0.0431 F1800
+G1 X-81.175 Y-44.786 E0.2195 F1800
+G2 X-81.634 Y-44.520 I-0.097 J0.362 E0.0152 F1800
+G1 X-82.281 Y-42.106 E0.0915 F1800
+G2 X-82.016 Y-41.646 I0.362 J0.097 E0.0152 F1800
+G1 X-76.220 Y-40.093 E0.2195 F1800
+G3 X-76.414 Y-39.369 I-0.097 J0.362 E0.0431 F1800
+G1 X-82.210 Y-40.922 E0.2195 F1800
+G2 X-82.669 Y-40.657 I-0.097 J0.362 E0.0152 F1800
+G1 X-83.316 Y-38.242 E0.0915 F1800
+G2 X-83.051 Y-37.783 I0.362 J0.097 E0.0152 F1800
+G1 X-77.255 Y-36.230 E0.2195 F1800
+G3 X-77.450 Y-35.505 I-0.097 J0.362 E0.0431 F1800
+G1 X-83.245 Y-37.058 E0.2195 F1800
+G2 X-83.704 Y-36.793 I-0.097 J0.362 E0.0152 F1800
+G1 X-84.351 Y-34.378 E0.0915 F1800
+G2 X-84.086 Y-33.919 I0.362 J0.097 E0.0152 F1800
+G1 X-78.291 Y-32.366 E0.2195 F1800
+G3 X-78.485 Y-31.642 I-0.097 J0.362 E0.0431 F1800
+G1 X-84.280 Y-33.194 E0.2195 F1800
+G2 X-84.740 Y-32.929 I-0.097 J0.362 E0.0152 F1800
+G1 X-85.387 Y-30.514 E0.0915 F1800
+G2 X-85.122 Y-30.055 I0.362 J0.097 E0.0152 F1800
+G1 X-79.326 Y-28.502 E0.2195 F1800
+G3 X-79.520 Y-27.778 I-0.097 J0.362 E0.0431 F1800
+G1 X-85.316 Y-29.331 E0.2195 F1800
+G2 X-85.775 Y-29.066 I-0.097 J0.362 E0.0152 F1800
+G1 X-86.422 Y-26.651 E0.0915 F1800
+G2 X-86.157 Y-26.191 I0.362 J0.097 E0.0152 F1800
+G1 X-80.361 Y-24.639 E0.2195 F1800
+G3 X-80.555 Y-23.914 I-0.097 J0.362 E0.0431 F1800
+G1 X-86.351 Y-25.467 E0.2195 F1800
+G2 X-86.810 Y-25.202 I-0.097 J0.362 E0.0152 F1800
+G1 X-87.457 Y-22.787 E0.0915 F1800
+G2 X-87.192 Y-22.328 I0.362 J0.097 E0.0152 F1800
+G1 X-81.397 Y-20.775 E0.2195 F1800
+G3 X-81.591 Y-20.050 I-0.097 J0.362 E0.0431 F1800
+G1 X-87.386 Y-21.603 E0.2195 F1800
+G2 X-87.846 Y-21.338 I-0.097 J0.362 E0.0152 F1800
+G1 X-88.493 Y-18.923 E0.0915 F1800
+G2 X-88.227 Y-18.464 I0.362 J0.097 E0.0152 F1800
+G1 X-82.432 Y-16.911 E0.2195 F1800
+G3 X-82.626 Y-16.187 I-0.097 J0.362 E0.0431 F1800
+G1 X-88.422 Y-17.740 E0.2195 F1800
+G2 X-88.881 Y-17.474 I-0.097 J0.362 E0.0152 F1800
+G1 X-89.528 Y-15.060 E0.0915 F1800
+G2 X-89.263 Y-14.600 I0.362 J0.097 E0.0152 F1800
+G1 X-83.467 Y-13.047 E0.2195 F1800
+G3 X-83.661 Y-12.323 I-0.097 J0.362 E0.0431 F1800
+G1 X-89.457 Y-13.876 E0.2195 F1800
+G2 X-89.916 Y-13.611 I-0.097 J0.362 E0.0152 F1800
+G1 X-90.563 Y-11.196 E0.0915 F1800
+G2 X-90.298 Y-10.737 I0.362 J0.097 E0.0152 F1800
+G1 X-84.502 Y-9.184 E0.2195 F1800
+G3 X-84.697 Y-8.459 I-0.097 J0.362 E0.0431 F1800
+G1 X-90.492 Y-10.012 E0.2195 F1800
+G2 X-90.951 Y-9.747 I-0.097 J0.362 E0.0152 F1800
+G1 X-91.598 Y-7.332 E0.0915 F1800
+G2 X-91.333 Y-6.873 I0.362 J0.097 E0.0152 F1800
+G1 X-85.538 Y-5.320 E0.2195 F1800
+G3 X-85.732 Y-4.596 I-0.097 J0.362 E0.0431 F1800
+G1 X-91.527 Y-6.149 E0.2195 F1800
+G2 X-91.987 Y-5.883 I-0.097 J0.362 E0.0152 F1800
+G1 X-92.634 Y-3.469 E0.0915 F1800
+G2 X-92.369 Y-3.009 I0.362 J0.097 E0.0152 F1800
+G1 X-86.573 Y-1.456 E0.2195 F1800
+G3 X-86.767 Y-0.732 I-0.097 J0.362 E0.0431 F1800
+G1 X-92.563 Y-2.285 E0.2195 F1800
+G2 X-93.022 Y-2.020 I-0.097 J0.362 E0.0152 F1800
+G1 X-93.669 Y0.395 E0.0915 F1800
+G2 X-93.404 Y0.854 I0.362 J0.097 E0.0152 F1800
+G1 X-87.608 Y2.407 E0.2195 F1800
+G3 X-87.802 Y3.132 I-0.097 J0.362 E0.0431 F1800
+G1 X-93.598 Y1.579 E0.2195 F1800
+G2 X-94.057 Y1.844 I-0.097 J0.362 E0.0152 F1800
+G1 X-94.704 Y4.259 E0.0915 F1800
+G2 X-94.439 Y4.718 I0.362 J0.097 E0.0152 F1800
+G1 X-88.644 Y6.271 E0.2195 F1800
+G3 X-88.838 Y6.995 I-0.097 J0.362 E0.0431 F1800
+G1 X-94.633 Y5.443 E0.2195 F1800
+G2 X-95.092 Y5.708 I-0.097 J0.362 E0.0152 F1800
+G1 X-95.740 Y8.123 E0.0915 F1800
+G2 X-95.474 Y8.582 I0.362 J0.097 E0.0152 F1800
+G1 X-89.679 Y10.135
 G1 Z0.850 E-5.0000 F4800
-G1 X-84.973 Y12.276 F1800
+G1 X-85.043 Y12.153 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-79.177 Y13.829
-G2 X-78.983 Y13.104 I0.097 J-0.362 E0.0431 F1800
-G1 X-84.778 Y11.551 E0.2195 F1800
-G3 X-85.044 Y11.092 I0.097 J-0.362 E0.0152 F1800
-G1 X-84.397 Y8.677 E0.0915 F1800
-G3 X-83.937 Y8.412 I0.362 J0.097 E0.0152 F1800
-G1 X-78.142 Y9.965 E0.2195 F1800
-G2 X-77.948 Y9.241 I0.097 J-0.362 E0.0431 F1800
-G1 X-83.743 Y7.688 E0.2195 F1800
-G3 X-84.008 Y7.228 I0.097 J-0.362 E0.0152 F1800
-G1 X-83.361 Y4.814 E0.0915 F1800
-G3 X-82.902 Y4.548 I0.362 J0.097 E0.0152 F1800
-G1 X-77.106 Y6.101 E0.2195 F1800
-G2 X-76.912 Y5.377 I0.097 J-0.362 E0.0431 F1800
-G1 X-82.708 Y3.824 E0.2195 F1800
-G3 X-82.973 Y3.365 I0.097 J-0.362 E0.0152 F1800
-G1 X-82.326 Y0.950 E0.0915 F1800
-G3 X-81.867 Y0.685 I0.362 J0.097 E0.0152 F1800
-G1 X-76.071 Y2.238 E0.2195 F1800
-G2 X-75.877 Y1.513 I0.097 J-0.362 E0.0431 F1800
-G1 X-81.673 Y-0.040 E0.2195 F1800
-G3 X-81.938 Y-0.499 I0.097 J-0.362 E0.0152 F1800
-G1 X-81.291 Y-2.914 E0.0915 F1800
-G3 X-80.831 Y-3.179 I0.362 J0.097 E0.0152 F1800
-G1 X-75.036 Y-1.626 E0.2195 F1800
-G2 X-74.842 Y-2.351 I0.097 J-0.362 E0.0431 F1800
-G1 X-80.637 Y-3.903 E0.2195 F1800
-G3 X-80.903 Y-4.363 I0.097 J-0.362 E0.0152 F1800
-G1 X-80.255 Y-6.778 E0.0915 F1800
-G3 X-79.796 Y-7.043 I0.362 J0.097 E0.0152 F1800
-G1 X-74.001 Y-5.490 E0.2195 F1800
-G2 X-73.807 Y-6.214 I0.097 J-0.362 E0.0431 F1800
-G1 X-79.602 Y-7.767 E0.2195 F1800
-G3 X-79.867 Y-8.226 I0.097 J-0.362 E0.0152 F1800
-G1 X-79.220 Y-10.641 E0.0915 F1800
-G3 X-78.761 Y-10.906 I0.362 J0.097 E0.0152 F1800
-G1 X-72.965 Y-9.354 E0.2195 F1800
-G2 X-72.771 Y-10.078 I0.097 J-0.362 E0.0431 F1800
-G1 X-78.567 Y-11.631 E0.2195 F1800
-G3 X-78.832 Y-12.090 I0.097 J-0.362 E0.0152 F1800
-G1 X-78.185 Y-14.505 E0.0915 F1800
-G3 X-77.726 Y-14.770 I0.362 J0.097 E0.0152 F1800
-G1 X-71.930 Y-13.217 E0.2195 F1800
-G2 X-71.736 Y-13.942 I0.097 J-0.362 E0.0431 F1800
-G1 X-77.532 Y-15.495 E0.2195 F1800
-G3 X-77.797 Y-15.954 I0.097 J-0.362 E0.0152 F1800
-G1 X-77.150 Y-18.369 E0.0915 F1800
-G3 X-76.690 Y-18.634 I0.362 J0.097 E0.0152 F1800
-G1 X-70.895 Y-17.081 E0.2195 F1800
-G2 X-70.701 Y-17.805 I0.097 J-0.362 E0.0431 F1800
-G1 X-76.496 Y-19.358 E0.2195 F1800
-G3 X-76.761 Y-19.818 I0.097 J-0.362 E0.0152 F1800
-G1 X-76.114 Y-22.232 E0.0915 F1800
-G3 X-75.655 Y-22.498 I0.362 J0.097 E0.0152 F1800
-G1 X-69.860 Y-20.945 E0.2195 F1800
-G2 X-69.665 Y-21.669 I0.097 J-0.362 E0.0431 F1800
-G1 X-75.461 Y-23.222 E0.2195 F1800
-G3 X-75.726 Y-23.681 I0.097 J-0.362 E0.0152 F1800
-G1 X-75.079 Y-26.096 E0.0915 F1800
-G3 X-74.620 Y-26.361 I0.362 J0.097 E0.0152 F1800
-G1 X-68.824 Y-24.808 E0.2195 F1800
-G2 X-68.630 Y-25.533 I0.097 J-0.362 E0.0431 F1800
-G1 X-74.426 Y-27.086 E0.2195 F1800
-G3 X-74.691 Y-27.545 I0.097 J-0.362 E0.0152 F1800
-G1 X-74.044 Y-29.960 E0.0915 F1800
-G3 X-73.585 Y-30.225 I0.362 J0.097 E0.0152 F1800
-G1 X-67.789 Y-28.672 E0.2195 F1800
-G2 X-67.595 Y-29.396 I0.097 J-0.362 E0.0431 F1800
-G1 X-73.390 Y-30.949 E0.2195 F1800
-G3 X-73.656 Y-31.409 I0.097 J-0.362 E0.0152 F1800
-G1 X-73.009 Y-33.824 E0.0915 F1800
-G3 X-72.549 Y-34.089 I0.362 J0.097 E0.0152 F1800
-G1 X-66.754 Y-32.536 E0.2195 F1800
-G2 X-66.560 Y-33.260 I0.097 J-0.362 E0.0431 F1800
-G1 X-72.355 Y-34.813 E0.2195 F1800
-G3 X-72.620 Y-35.272 I0.097 J-0.362 E0.0152 F1800
-G1 X-71.973 Y-37.687 E0.0915 F1800
-G3 X-71.514 Y-37.952 I0.362 J0.097 E0.0152 F1800
-G1 X-65.718 Y-36.399 E0.2195 F1800
-G2 X-65.524 Y-37.124 I0.097 J-0.362 E0.0431 F1800
-G1 X-71.320 Y-38.677 E0.2195 F1800
-G3 X-71.585 Y-39.136 I0.097 J-0.362 E0.0152 F1800
-G1 X-70.938 Y-41.551 E0.0915 F1800
-G3 X-70.479 Y-41.816 I0.362 J0.097 E0.0152 F1800
-G1 X-64.683 Y-40.263 E0.2195 F1800
-G2 X-64.489 Y-40.988 I0.097 J-0.362 E0.0431 F1800
-G1 X-70.285 Y-42.541 E0.2195 F1800
-G3 X-70.550 Y-43.000 I0.097 J-0.362 E0.0152 F1800
-G1 X-69.903 Y-45.415 E0.0915 F1800
-G3 X-69.443 Y-45.680 I0.362 J0.097 E0.0152 F1800
-G1 X-63.648 Y-44.127 E0.2195 F1800
-G2 X-63.454 Y-44.851 I0.097 J-0.362 E0.0431 F1800
-G1 X-69.249 Y-46.404 E0.2195 F1800
-G3 X-69.514 Y-46.864 I0.097 J-0.362 E0.0152 F1800
-G1 X-68.867 Y-49.278 E0.0915 F1800
-G3 X-68.408 Y-49.543 I0.362 J0.097 E0.0152 F1800
-G1 X-62.613 Y-47.991 E0.2195 F1800
-G2 X-62.418 Y-48.715 I0.097 J-0.362 E0.0431 F1800
-G1 X-68.214 Y-50.268 E0.2195 F1800
-G3 X-68.479 Y-50.727 I0.097 J-0.362 E0.0152 F1800
-G1 X-67.832 Y-53.142 E0.0915 F1800
-G3 X-67.373 Y-53.407 I0.362 J0.097 E0.0152 F1800
-G1 X-61.577 Y-51.854
+G1 X-79.248 Y13.706
+G2 X-79.054 Y12.982 I0.097 J-0.362 E0.0431 F1800
+G1 X-84.849 Y11.429 E0.2195 F1800
+G3 X-85.114 Y10.970 I0.097 J-0.362 E0.0152 F1800
+G1 X-84.467 Y8.555 E0.0915 F1800
+G3 X-84.008 Y8.290 I0.362 J0.097 E0.0152 F1800
+G1 X-78.212 Y9.843 E0.2195 F1800
+G2 X-78.018 Y9.118 I0.097 J-0.362 E0.0431 F1800
+G1 X-83.814 Y7.565 E0.2195 F1800
+G3 X-84.079 Y7.106 I0.097 J-0.362 E0.0152 F1800
+G1 X-83.432 Y4.691 E0.0915 F1800
+G3 X-82.973 Y4.426 I0.362 J0.097 E0.0152 F1800
+G1 X-77.177 Y5.979 E0.2195 F1800
+G2 X-76.983 Y5.254 I0.097 J-0.362 E0.0431 F1800
+G1 X-82.779 Y3.701 E0.2195 F1800
+G3 X-83.044 Y3.242 I0.097 J-0.362 E0.0152 F1800
+G1 X-82.397 Y0.827 E0.0915 F1800
+G3 X-81.937 Y0.562 I0.362 J0.097 E0.0152 F1800
+G1 X-76.142 Y2.115 E0.2195 F1800
+G2 X-75.948 Y1.391 I0.097 J-0.362 E0.0431 F1800
+G1 X-81.743 Y-0.162 E0.2195 F1800
+G3 X-82.009 Y-0.622 I0.097 J-0.362 E0.0152 F1800
+G1 X-81.361 Y-3.036 E0.0915 F1800
+G3 X-80.902 Y-3.302 I0.362 J0.097 E0.0152 F1800
+G1 X-75.107 Y-1.749 E0.2195 F1800
+G2 X-74.913 Y-2.473 I0.097 J-0.362 E0.0431 F1800
+G1 X-80.708 Y-4.026 E0.2195 F1800
+G3 X-80.973 Y-4.485 I0.097 J-0.362 E0.0152 F1800
+G1 X-80.326 Y-6.900 E0.0915 F1800
+G3 X-79.867 Y-7.165 I0.362 J0.097 E0.0152 F1800
+G1 X-74.071 Y-5.612 E0.2195 F1800
+G2 X-73.877 Y-6.337 I0.097 J-0.362 E0.0431 F1800
+G1 X-79.673 Y-7.890 E0.2195 F1800
+G3 X-79.938 Y-8.349 I0.097 J-0.362 E0.0152 F1800
+G1 X-79.291 Y-10.764 E0.0915 F1800
+G3 X-78.832 Y-11.029 I0.362 J0.097 E0.0152 F1800
+G1 X-73.036 Y-9.476 E0.2195 F1800
+G2 X-72.842 Y-10.200 I0.097 J-0.362 E0.0431 F1800
+G1 X-78.638 Y-11.753 E0.2195 F1800
+G3 X-78.903 Y-12.213 I0.097 J-0.362 E0.0152 F1800
+G1 X-78.256 Y-14.627 E0.0915 F1800
+G3 X-77.796 Y-14.893 I0.362 J0.097 E0.0152 F1800
+G1 X-72.001 Y-13.340 E0.2195 F1800
+G2 X-71.807 Y-14.064 I0.097 J-0.362 E0.0431 F1800
+G1 X-77.602 Y-15.617 E0.2195 F1800
+G3 X-77.867 Y-16.076 I0.097 J-0.362 E0.0152 F1800
+G1 X-77.220 Y-18.491 E0.0915 F1800
+G3 X-76.761 Y-18.756 I0.362 J0.097 E0.0152 F1800
+G1 X-70.966 Y-17.203 E0.2195 F1800
+G2 X-70.771 Y-17.928 I0.097 J-0.362 E0.0431 F1800
+G1 X-76.567 Y-19.481 E0.2195 F1800
+G3 X-76.832 Y-19.940 I0.097 J-0.362 E0.0152 F1800
+G1 X-76.185 Y-22.355 E0.0915 F1800
+G3 X-75.726 Y-22.620 I0.362 J0.097 E0.0152 F1800
+G1 X-69.930 Y-21.067 E0.2195 F1800
+G2 X-69.736 Y-21.792 I0.097 J-0.362 E0.0431 F1800
+G1 X-75.532 Y-23.344 E0.2195 F1800
+G3 X-75.797 Y-23.804 I0.097 J-0.362 E0.0152 F1800
+G1 X-75.150 Y-26.219 E0.0915 F1800
+G3 X-74.691 Y-26.484 I0.362 J0.097 E0.0152 F1800
+G1 X-68.895 Y-24.931 E0.2195 F1800
+G2 X-68.701 Y-25.655 I0.097 J-0.362 E0.0431 F1800
+G1 X-74.496 Y-27.208 E0.2195 F1800
+G3 X-74.762 Y-27.667 I0.097 J-0.362 E0.0152 F1800
+G1 X-74.115 Y-30.082 E0.0915 F1800
+G3 X-73.655 Y-30.347 I0.362 J0.097 E0.0152 F1800
+G1 X-67.860 Y-28.795 E0.2195 F1800
+G2 X-67.666 Y-29.519 I0.097 J-0.362 E0.0431 F1800
+G1 X-73.461 Y-31.072 E0.2195 F1800
+G3 X-73.726 Y-31.531 I0.097 J-0.362 E0.0152 F1800
+G1 X-73.079 Y-33.946 E0.0915 F1800
+G3 X-72.620 Y-34.211 I0.362 J0.097 E0.0152 F1800
+G1 X-66.824 Y-32.658 E0.2195 F1800
+G2 X-66.630 Y-33.383 I0.097 J-0.362 E0.0431 F1800
+G1 X-72.426 Y-34.936 E0.2195 F1800
+G3 X-72.691 Y-35.395 I0.097 J-0.362 E0.0152 F1800
+G1 X-72.044 Y-37.810 E0.0915 F1800
+G3 X-71.585 Y-38.075 I0.362 J0.097 E0.0152 F1800
+G1 X-65.789 Y-36.522 E0.2195 F1800
+G2 X-65.595 Y-37.246 I0.097 J-0.362 E0.0431 F1800
+G1 X-71.391 Y-38.799 E0.2195 F1800
+G3 X-71.656 Y-39.259 I0.097 J-0.362 E0.0152 F1800
+G1 X-71.009 Y-41.673 E0.0915 F1800
+G3 X-70.549 Y-41.939 I0.362 J0.097 E0.0152 F1800
+G1 X-64.754 Y-40.386 E0.2195 F1800
+G2 X-64.560 Y-41.110 I0.097 J-0.362 E0.0431 F1800
+G1 X-70.355 Y-42.663 E0.2195 F1800
+G3 X-70.620 Y-43.122 I0.097 J-0.362 E0.0152 F1800
+G1 X-69.973 Y-45.537 E0.0915 F1800
+G3 X-69.514 Y-45.802 I0.362 J0.097 E0.0152 F1800
+G1 X-63.719 Y-44.249 E0.2195 F1800
+G2 X-63.524 Y-44.974 I0.097 J-0.362 E0.0431 F1800
+G1 X-69.320 Y-46.527 E0.2195 F1800
+G3 X-69.585 Y-46.986 I0.097 J-0.362 E0.0152 F1800
+G1 X-68.938 Y-49.401 E0.0915 F1800
+G3 X-68.479 Y-49.666 I0.362 J0.097 E0.0152 F1800
+G1 X-62.683 Y-48.113 E0.2195 F1800
+G2 X-62.489 Y-48.837 I0.097 J-0.362 E0.0431 F1800
+G1 X-68.285 Y-50.390 E0.2195 F1800
+G3 X-68.550 Y-50.850 I0.097 J-0.362 E0.0152 F1800
+G1 X-67.903 Y-53.264 E0.0915 F1800
+G3 X-67.444 Y-53.530 I0.362 J0.097 E0.0152 F1800
+G1 X-61.648 Y-51.977
 G1 Z0.850 E-5.0000 F4800
 ;print horizontal interlocked signal pattern 0
-G1 X33.236 Y-46.378 F1800
+G1 X33.165 Y-46.501 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X31.683 Y-40.583
-G2 X32.408 Y-40.389 I0.362 J0.097 E0.0431 F1800
-G1 X33.960 Y-46.184 E0.2195 F1800
-G3 X34.420 Y-46.449 I0.362 J0.097 E0.0152 F1800
-G1 X36.835 Y-45.802 E0.0915 F1800
-G3 X37.100 Y-45.343 I-0.097 J0.362 E0.0152 F1800
-G1 X35.547 Y-39.547 E0.2195 F1800
-G2 X36.271 Y-39.353 I0.362 J0.097 E0.0431 F1800
-G1 X37.824 Y-45.149 E0.2195 F1800
-G3 X38.283 Y-45.414 I0.362 J0.097 E0.0152 F1800
-G1 X40.698 Y-44.767 E0.0915 F1800
-G3 X40.963 Y-44.308 I-0.097 J0.362 E0.0152 F1800
-G1 X39.411 Y-38.512 E0.2195 F1800
-G2 X40.135 Y-38.318 I0.362 J0.097 E0.0431 F1800
-G1 X41.688 Y-44.114 E0.2195 F1800
-G3 X42.147 Y-44.379 I0.362 J0.097 E0.0152 F1800
-G1 X44.562 Y-43.732 E0.0915 F1800
-G3 X44.827 Y-43.272 I-0.097 J0.362 E0.0152 F1800
-G1 X43.274 Y-37.477 E0.2195 F1800
-G2 X43.999 Y-37.283 I0.362 J0.097 E0.0431 F1800
-G1 X45.552 Y-43.078 E0.2195 F1800
-G3 X46.011 Y-43.343 I0.362 J0.097 E0.0152 F1800
-G1 X48.426 Y-42.696 E0.0915 F1800
-G3 X48.691 Y-42.237 I-0.097 J0.362 E0.0152 F1800
-G1 X47.138 Y-36.442 E0.2195 F1800
-G2 X47.862 Y-36.247 I0.362 J0.097 E0.0431 F1800
-G1 X49.415 Y-42.043 E0.2195 F1800
-G3 X49.875 Y-42.308 I0.362 J0.097 E0.0152 F1800
-G1 X52.289 Y-41.661 E0.0915 F1800
-G3 X52.555 Y-41.202 I-0.097 J0.362 E0.0152 F1800
-G1 X51.002 Y-35.406 E0.2195 F1800
-G2 X51.726 Y-35.212 I0.362 J0.097 E0.0431 F1800
-G1 X53.279 Y-41.008 E0.2195 F1800
-G3 X53.738 Y-41.273 I0.362 J0.097 E0.0152 F1800
-G1 X56.153 Y-40.626 E0.0915 F1800
-G3 X56.418 Y-40.167 I-0.097 J0.362 E0.0152 F1800
-G1 X54.865 Y-34.371 E0.2195 F1800
-G2 X55.590 Y-34.177 I0.362 J0.097 E0.0431 F1800
-G1 X57.143 Y-39.972 E0.2195 F1800
-G3 X57.602 Y-40.238 I0.362 J0.097 E0.0152 F1800
-G1 X60.017 Y-39.591 E0.0915 F1800
-G3 X60.282 Y-39.131 I-0.097 J0.362 E0.0152 F1800
-G1 X58.729 Y-33.336 E0.2195 F1800
-G2 X59.453 Y-33.142 I0.362 J0.097 E0.0431 F1800
-G1 X61.006 Y-38.937 E0.2195 F1800
-G3 X61.466 Y-39.202 I0.362 J0.097 E0.0152 F1800
-G1 X63.881 Y-38.555 E0.0915 F1800
-G3 X64.146 Y-38.096 I-0.097 J0.362 E0.0152 F1800
-G1 X62.593 Y-32.300 E0.2195 F1800
-G2 X63.317 Y-32.106 I0.362 J0.097 E0.0431 F1800
-G1 X64.870 Y-37.902 E0.2195 F1800
-G3 X65.329 Y-38.167 I0.362 J0.097 E0.0152 F1800
-G1 X67.744 Y-37.520 E0.0915 F1800
-G3 X68.009 Y-37.061 I-0.097 J0.362 E0.0152 F1800
-G1 X66.456 Y-31.265 E0.2195 F1800
-G2 X67.181 Y-31.071 I0.362 J0.097 E0.0431 F1800
-G1 X68.734 Y-36.867 E0.2195 F1800
-G3 X69.193 Y-37.132 I0.362 J0.097 E0.0152 F1800
-G1 X71.608 Y-36.485 E0.0915 F1800
-G3 X71.873 Y-36.025 I-0.097 J0.362 E0.0152 F1800
-G1 X70.320 Y-30.230 E0.2195 F1800
-G2 X71.045 Y-30.036 I0.362 J0.097 E0.0431 F1800
-G1 X72.598 Y-35.831 E0.2195 F1800
-G3 X73.057 Y-36.096 I0.362 J0.097 E0.0152 F1800
-G1 X75.472 Y-35.449 E0.0915 F1800
-G3 X75.737 Y-34.990 I-0.097 J0.362 E0.0152 F1800
-G1 X74.184 Y-29.195 E0.2195 F1800
-G2 X74.908 Y-29.000 I0.362 J0.097 E0.0431 F1800
-G1 X76.461 Y-34.796 E0.2195 F1800
-G3 X76.921 Y-35.061 I0.362 J0.097 E0.0152 F1800
-G1 X79.335 Y-34.414 E0.0915 F1800
-G3 X79.600 Y-33.955 I-0.097 J0.362 E0.0152 F1800
-G1 X78.048 Y-28.159 E0.2195 F1800
-G2 X78.772 Y-27.965 I0.362 J0.097 E0.0431 F1800
-G1 X80.325 Y-33.761 E0.2195 F1800
-G3 X80.784 Y-34.026 I0.362 J0.097 E0.0152 F1800
-G1 X83.199 Y-33.379 E0.0915 F1800
-G3 X83.464 Y-32.920 I-0.097 J0.362 E0.0152 F1800
-G1 X81.911 Y-27.124 E0.2195 F1800
-G2 X82.636 Y-26.930 I0.362 J0.097 E0.0431 F1800
-G1 X84.189 Y-32.725 E0.2195 F1800
-G3 X84.648 Y-32.991 I0.362 J0.097 E0.0152 F1800
-G1 X87.063 Y-32.344 E0.0915 F1800
-G3 X87.328 Y-31.884 I-0.097 J0.362 E0.0152 F1800
-G1 X85.775 Y-26.089 E0.2195 F1800
-G2 X86.499 Y-25.895 I0.362 J0.097 E0.0431 F1800
-G1 X88.052 Y-31.690 E0.2195 F1800
-G3 X88.512 Y-31.955 I0.362 J0.097 E0.0152 F1800
-G1 X90.926 Y-31.308 E0.0915 F1800
-G3 X91.192 Y-30.849 I-0.097 J0.362 E0.0152 F1800
-G1 X89.639 Y-25.053 E0.2195 F1800
-G2 X90.363 Y-24.859 I0.362 J0.097 E0.0431 F1800
-G1 X91.916 Y-30.655 E0.2195 F1800
-G3 X92.375 Y-30.920 I0.362 J0.097 E0.0152 F1800
-G1 X94.790 Y-30.273 E0.0915 F1800
-G3 X95.055 Y-29.814 I-0.097 J0.362 E0.0152 F1800
-G1 X93.502 Y-24.018 E0.2195 F1800
-G2 X94.227 Y-23.824 I0.362 J0.097 E0.0431 F1800
-G1 X95.780 Y-29.620 E0.2195 F1800
-G3 X96.239 Y-29.885 I0.362 J0.097 E0.0152 F1800
-G1 X98.654 Y-29.238 E0.0915 F1800
-G3 X98.919 Y-28.778 I-0.097 J0.362 E0.0152 F1800
-G1 X97.366 Y-22.983
+G1 X31.612 Y-40.705
+G2 X32.337 Y-40.511 I0.362 J0.097 E0.0431 F1800
+G1 X33.890 Y-46.307 E0.2195 F1800
+G3 X34.349 Y-46.572 I0.362 J0.097 E0.0152 F1800
+G1 X36.764 Y-45.925 E0.0915 F1800
+G3 X37.029 Y-45.465 I-0.097 J0.362 E0.0152 F1800
+G1 X35.476 Y-39.670 E0.2195 F1800
+G2 X36.201 Y-39.476 I0.362 J0.097 E0.0431 F1800
+G1 X37.753 Y-45.271 E0.2195 F1800
+G3 X38.213 Y-45.536 I0.362 J0.097 E0.0152 F1800
+G1 X40.628 Y-44.889 E0.0915 F1800
+G3 X40.893 Y-44.430 I-0.097 J0.362 E0.0152 F1800
+G1 X39.340 Y-38.635 E0.2195 F1800
+G2 X40.064 Y-38.440 I0.362 J0.097 E0.0431 F1800
+G1 X41.617 Y-44.236 E0.2195 F1800
+G3 X42.076 Y-44.501 I0.362 J0.097 E0.0152 F1800
+G1 X44.491 Y-43.854 E0.0915 F1800
+G3 X44.756 Y-43.395 I-0.097 J0.362 E0.0152 F1800
+G1 X43.204 Y-37.599 E0.2195 F1800
+G2 X43.928 Y-37.405 I0.362 J0.097 E0.0431 F1800
+G1 X45.481 Y-43.201 E0.2195 F1800
+G3 X45.940 Y-43.466 I0.362 J0.097 E0.0152 F1800
+G1 X48.355 Y-42.819 E0.0915 F1800
+G3 X48.620 Y-42.360 I-0.097 J0.362 E0.0152 F1800
+G1 X47.067 Y-36.564 E0.2195 F1800
+G2 X47.792 Y-36.370 I0.362 J0.097 E0.0431 F1800
+G1 X49.345 Y-42.165 E0.2195 F1800
+G3 X49.804 Y-42.431 I0.362 J0.097 E0.0152 F1800
+G1 X52.219 Y-41.784 E0.0915 F1800
+G3 X52.484 Y-41.324 I-0.097 J0.362 E0.0152 F1800
+G1 X50.931 Y-35.529 E0.2195 F1800
+G2 X51.655 Y-35.335 I0.362 J0.097 E0.0431 F1800
+G1 X53.208 Y-41.130 E0.2195 F1800
+G3 X53.668 Y-41.395 I0.362 J0.097 E0.0152 F1800
+G1 X56.082 Y-40.748 E0.0915 F1800
+G3 X56.348 Y-40.289 I-0.097 J0.362 E0.0152 F1800
+G1 X54.795 Y-34.493 E0.2195 F1800
+G2 X55.519 Y-34.299 I0.362 J0.097 E0.0431 F1800
+G1 X57.072 Y-40.095 E0.2195 F1800
+G3 X57.531 Y-40.360 I0.362 J0.097 E0.0152 F1800
+G1 X59.946 Y-39.713 E0.0915 F1800
+G3 X60.211 Y-39.254 I-0.097 J0.362 E0.0152 F1800
+G1 X58.658 Y-33.458 E0.2195 F1800
+G2 X59.383 Y-33.264 I0.362 J0.097 E0.0431 F1800
+G1 X60.936 Y-39.060 E0.2195 F1800
+G3 X61.395 Y-39.325 I0.362 J0.097 E0.0152 F1800
+G1 X63.810 Y-38.678 E0.0915 F1800
+G3 X64.075 Y-38.218 I-0.097 J0.362 E0.0152 F1800
+G1 X62.522 Y-32.423 E0.2195 F1800
+G2 X63.246 Y-32.229 I0.362 J0.097 E0.0431 F1800
+G1 X64.799 Y-38.024 E0.2195 F1800
+G3 X65.259 Y-38.289 I0.362 J0.097 E0.0152 F1800
+G1 X67.674 Y-37.642 E0.0915 F1800
+G3 X67.939 Y-37.183 I-0.097 J0.362 E0.0152 F1800
+G1 X66.386 Y-31.388 E0.2195 F1800
+G2 X67.110 Y-31.193 I0.362 J0.097 E0.0431 F1800
+G1 X68.663 Y-36.989 E0.2195 F1800
+G3 X69.122 Y-37.254 I0.362 J0.097 E0.0152 F1800
+G1 X71.537 Y-36.607 E0.0915 F1800
+G3 X71.802 Y-36.148 I-0.097 J0.362 E0.0152 F1800
+G1 X70.249 Y-30.352 E0.2195 F1800
+G2 X70.974 Y-30.158 I0.362 J0.097 E0.0431 F1800
+G1 X72.527 Y-35.954 E0.2195 F1800
+G3 X72.986 Y-36.219 I0.362 J0.097 E0.0152 F1800
+G1 X75.401 Y-35.572 E0.0915 F1800
+G3 X75.666 Y-35.113 I-0.097 J0.362 E0.0152 F1800
+G1 X74.113 Y-29.317 E0.2195 F1800
+G2 X74.838 Y-29.123 I0.362 J0.097 E0.0431 F1800
+G1 X76.391 Y-34.918 E0.2195 F1800
+G3 X76.850 Y-35.184 I0.362 J0.097 E0.0152 F1800
+G1 X79.265 Y-34.537 E0.0915 F1800
+G3 X79.530 Y-34.077 I-0.097 J0.362 E0.0152 F1800
+G1 X77.977 Y-28.282 E0.2195 F1800
+G2 X78.701 Y-28.088 I0.362 J0.097 E0.0431 F1800
+G1 X80.254 Y-33.883 E0.2195 F1800
+G3 X80.713 Y-34.148 I0.362 J0.097 E0.0152 F1800
+G1 X83.128 Y-33.501 E0.0915 F1800
+G3 X83.393 Y-33.042 I-0.097 J0.362 E0.0152 F1800
+G1 X81.841 Y-27.247 E0.2195 F1800
+G2 X82.565 Y-27.052 I0.362 J0.097 E0.0431 F1800
+G1 X84.118 Y-32.848 E0.2195 F1800
+G3 X84.577 Y-33.113 I0.362 J0.097 E0.0152 F1800
+G1 X86.992 Y-32.466 E0.0915 F1800
+G3 X87.257 Y-32.007 I-0.097 J0.362 E0.0152 F1800
+G1 X85.704 Y-26.211 E0.2195 F1800
+G2 X86.429 Y-26.017 I0.362 J0.097 E0.0431 F1800
+G1 X87.982 Y-31.813 E0.2195 F1800
+G3 X88.441 Y-32.078 I0.362 J0.097 E0.0152 F1800
+G1 X90.856 Y-31.431 E0.0915 F1800
+G3 X91.121 Y-30.972 I-0.097 J0.362 E0.0152 F1800
+G1 X89.568 Y-25.176 E0.2195 F1800
+G2 X90.292 Y-24.982 I0.362 J0.097 E0.0431 F1800
+G1 X91.845 Y-30.777 E0.2195 F1800
+G3 X92.305 Y-31.043 I0.362 J0.097 E0.0152 F1800
+G1 X94.719 Y-30.396 E0.0915 F1800
+G3 X94.985 Y-29.936 I-0.097 J0.362 E0.0152 F1800
+G1 X93.432 Y-24.141 E0.2195 F1800
+G2 X94.156 Y-23.947 I0.362 J0.097 E0.0431 F1800
+G1 X95.709 Y-29.742 E0.2195 F1800
+G3 X96.168 Y-30.007 I0.362 J0.097 E0.0152 F1800
+G1 X98.583 Y-29.360 E0.0915 F1800
+G3 X98.848 Y-28.901 I-0.097 J0.362 E0.0152 F1800
+G1 X97.295 Y-23.105
 G1 Z0.850 E-5.0000 F4800
-G1 X96.796 Y-17.959 F1800
+G1 X96.726 Y-18.082 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X95.244 Y-12.164
-G3 X94.519 Y-12.358 I-0.362 J-0.097 E0.0431 F1800
-G1 X96.072 Y-18.153 E0.2195 F1800
-G2 X95.807 Y-18.613 I-0.362 J-0.097 E0.0152 F1800
-G1 X93.392 Y-19.260 E0.0915 F1800
-G2 X92.933 Y-18.994 I-0.097 J0.362 E0.0152 F1800
-G1 X91.380 Y-13.199 E0.2195 F1800
-G3 X90.655 Y-13.393 I-0.362 J-0.097 E0.0431 F1800
-G1 X92.208 Y-19.189 E0.2195 F1800
-G2 X91.943 Y-19.648 I-0.362 J-0.097 E0.0152 F1800
-G1 X89.528 Y-20.295 E0.0915 F1800
-G2 X89.069 Y-20.030 I-0.097 J0.362 E0.0152 F1800
-G1 X87.516 Y-14.234 E0.2195 F1800
-G3 X86.792 Y-14.428 I-0.362 J-0.097 E0.0431 F1800
-G1 X88.345 Y-20.224 E0.2195 F1800
-G2 X88.079 Y-20.683 I-0.362 J-0.097 E0.0152 F1800
-G1 X85.665 Y-21.330 E0.0915 F1800
-G2 X85.205 Y-21.065 I-0.097 J0.362 E0.0152 F1800
-G1 X83.652 Y-15.269 E0.2195 F1800
-G3 X82.928 Y-15.464 I-0.362 J-0.097 E0.0431 F1800
-G1 X84.481 Y-21.259 E0.2195 F1800
-G2 X84.216 Y-21.718 I-0.362 J-0.097 E0.0152 F1800
-G1 X81.801 Y-22.365 E0.0915 F1800
-G2 X81.342 Y-22.100 I-0.097 J0.362 E0.0152 F1800
-G1 X79.789 Y-16.305 E0.2195 F1800
-G3 X79.064 Y-16.499 I-0.362 J-0.097 E0.0431 F1800
-G1 X80.617 Y-22.294 E0.2195 F1800
-G2 X80.352 Y-22.754 I-0.362 J-0.097 E0.0152 F1800
-G1 X77.937 Y-23.401 E0.0915 F1800
-G2 X77.478 Y-23.136 I-0.097 J0.362 E0.0152 F1800
-G1 X75.925 Y-17.340 E0.2195 F1800
-G3 X75.201 Y-17.534 I-0.362 J-0.097 E0.0431 F1800
-G1 X76.753 Y-23.330 E0.2195 F1800
-G2 X76.488 Y-23.789 I-0.362 J-0.097 E0.0152 F1800
-G1 X74.073 Y-24.436 E0.0915 F1800
-G2 X73.614 Y-24.171 I-0.097 J0.362 E0.0152 F1800
-G1 X72.061 Y-18.375 E0.2195 F1800
-G3 X71.337 Y-18.569 I-0.362 J-0.097 E0.0431 F1800
-G1 X72.890 Y-24.365 E0.2195 F1800
-G2 X72.625 Y-24.824 I-0.362 J-0.097 E0.0152 F1800
-G1 X70.210 Y-25.471 E0.0915 F1800
-G2 X69.751 Y-25.206 I-0.097 J0.362 E0.0152 F1800
-G1 X68.198 Y-19.411 E0.2195 F1800
-G3 X67.473 Y-19.605 I-0.362 J-0.097 E0.0431 F1800
-G1 X69.026 Y-25.400 E0.2195 F1800
-G2 X68.761 Y-25.860 I-0.362 J-0.097 E0.0152 F1800
-G1 X66.346 Y-26.507 E0.0915 F1800
-G2 X65.887 Y-26.241 I-0.097 J0.362 E0.0152 F1800
-G1 X64.334 Y-20.446 E0.2195 F1800
-G3 X63.609 Y-20.640 I-0.362 J-0.097 E0.0431 F1800
-G1 X65.162 Y-26.436 E0.2195 F1800
-G2 X64.897 Y-26.895 I-0.362 J-0.097 E0.0152 F1800
-G1 X62.482 Y-27.542 E0.0915 F1800
-G2 X62.023 Y-27.277 I-0.097 J0.362 E0.0152 F1800
-G1 X60.470 Y-21.481 E0.2195 F1800
-G3 X59.746 Y-21.675 I-0.362 J-0.097 E0.0431 F1800
-G1 X61.299 Y-27.471 E0.2195 F1800
-G2 X61.033 Y-27.930 I-0.362 J-0.097 E0.0152 F1800
-G1 X58.619 Y-28.577 E0.0915 F1800
-G2 X58.159 Y-28.312 I-0.097 J0.362 E0.0152 F1800
-G1 X56.606 Y-22.516 E0.2195 F1800
-G3 X55.882 Y-22.711 I-0.362 J-0.097 E0.0431 F1800
-G1 X57.435 Y-28.506 E0.2195 F1800
-G2 X57.170 Y-28.965 I-0.362 J-0.097 E0.0152 F1800
-G1 X54.755 Y-29.612 E0.0915 F1800
-G2 X54.296 Y-29.347 I-0.097 J0.362 E0.0152 F1800
-G1 X52.743 Y-23.552 E0.2195 F1800
-G3 X52.018 Y-23.746 I-0.362 J-0.097 E0.0431 F1800
-G1 X53.571 Y-29.541 E0.2195 F1800
-G2 X53.306 Y-30.001 I-0.362 J-0.097 E0.0152 F1800
-G1 X50.891 Y-30.648 E0.0915 F1800
-G2 X50.432 Y-30.382 I-0.097 J0.362 E0.0152 F1800
-G1 X48.879 Y-24.587 E0.2195 F1800
-G3 X48.155 Y-24.781 I-0.362 J-0.097 E0.0431 F1800
-G1 X49.708 Y-30.577 E0.2195 F1800
-G2 X49.442 Y-31.036 I-0.362 J-0.097 E0.0152 F1800
-G1 X47.028 Y-31.683 E0.0915 F1800
-G2 X46.568 Y-31.418 I-0.097 J0.362 E0.0152 F1800
-G1 X45.015 Y-25.622 E0.2195 F1800
-G3 X44.291 Y-25.816 I-0.362 J-0.097 E0.0431 F1800
-G1 X45.844 Y-31.612 E0.2195 F1800
-G2 X45.579 Y-32.071 I-0.362 J-0.097 E0.0152 F1800
-G1 X43.164 Y-32.718 E0.0915 F1800
-G2 X42.705 Y-32.453 I-0.097 J0.362 E0.0152 F1800
-G1 X41.152 Y-26.657 E0.2195 F1800
-G3 X40.427 Y-26.852 I-0.362 J-0.097 E0.0431 F1800
-G1 X41.980 Y-32.647 E0.2195 F1800
-G2 X41.715 Y-33.106 I-0.362 J-0.097 E0.0152 F1800
-G1 X39.300 Y-33.753 E0.0915 F1800
-G2 X38.841 Y-33.488 I-0.097 J0.362 E0.0152 F1800
-G1 X37.288 Y-27.693 E0.2195 F1800
-G3 X36.564 Y-27.887 I-0.362 J-0.097 E0.0431 F1800
-G1 X38.116 Y-33.682 E0.2195 F1800
-G2 X37.851 Y-34.142 I-0.362 J-0.097 E0.0152 F1800
-G1 X35.436 Y-34.789 E0.0915 F1800
-G2 X34.977 Y-34.524 I-0.097 J0.362 E0.0152 F1800
-G1 X33.424 Y-28.728 E0.2195 F1800
-G3 X32.700 Y-28.922 I-0.362 J-0.097 E0.0431 F1800
-G1 X34.253 Y-34.718 E0.2195 F1800
-G2 X33.988 Y-35.177 I-0.362 J-0.097 E0.0152 F1800
-G1 X31.573 Y-35.824 E0.0915 F1800
-G2 X31.113 Y-35.559 I-0.097 J0.362 E0.0152 F1800
-G1 X29.561 Y-29.763
+G1 X95.173 Y-12.286
+G3 X94.448 Y-12.480 I-0.362 J-0.097 E0.0431 F1800
+G1 X96.001 Y-18.276 E0.2195 F1800
+G2 X95.736 Y-18.735 I-0.362 J-0.097 E0.0152 F1800
+G1 X93.321 Y-19.382 E0.0915 F1800
+G2 X92.862 Y-19.117 I-0.097 J0.362 E0.0152 F1800
+G1 X91.309 Y-13.321 E0.2195 F1800
+G3 X90.585 Y-13.515 I-0.362 J-0.097 E0.0431 F1800
+G1 X92.138 Y-19.311 E0.2195 F1800
+G2 X91.872 Y-19.770 I-0.362 J-0.097 E0.0152 F1800
+G1 X89.458 Y-20.417 E0.0915 F1800
+G2 X88.998 Y-20.152 I-0.097 J0.362 E0.0152 F1800
+G1 X87.445 Y-14.357 E0.2195 F1800
+G3 X86.721 Y-14.551 I-0.362 J-0.097 E0.0431 F1800
+G1 X88.274 Y-20.346 E0.2195 F1800
+G2 X88.009 Y-20.806 I-0.362 J-0.097 E0.0152 F1800
+G1 X85.594 Y-21.453 E0.0915 F1800
+G2 X85.135 Y-21.187 I-0.097 J0.362 E0.0152 F1800
+G1 X83.582 Y-15.392 E0.2195 F1800
+G3 X82.857 Y-15.586 I-0.362 J-0.097 E0.0431 F1800
+G1 X84.410 Y-21.382 E0.2195 F1800
+G2 X84.145 Y-21.841 I-0.362 J-0.097 E0.0152 F1800
+G1 X81.730 Y-22.488 E0.0915 F1800
+G2 X81.271 Y-22.223 I-0.097 J0.362 E0.0152 F1800
+G1 X79.718 Y-16.427 E0.2195 F1800
+G3 X78.994 Y-16.621 I-0.362 J-0.097 E0.0431 F1800
+G1 X80.546 Y-22.417 E0.2195 F1800
+G2 X80.281 Y-22.876 I-0.362 J-0.097 E0.0152 F1800
+G1 X77.866 Y-23.523 E0.0915 F1800
+G2 X77.407 Y-23.258 I-0.097 J0.362 E0.0152 F1800
+G1 X75.854 Y-17.462 E0.2195 F1800
+G3 X75.130 Y-17.657 I-0.362 J-0.097 E0.0431 F1800
+G1 X76.683 Y-23.452 E0.2195 F1800
+G2 X76.418 Y-23.911 I-0.362 J-0.097 E0.0152 F1800
+G1 X74.003 Y-24.558 E0.0915 F1800
+G2 X73.544 Y-24.293 I-0.097 J0.362 E0.0152 F1800
+G1 X71.991 Y-18.498 E0.2195 F1800
+G3 X71.266 Y-18.692 I-0.362 J-0.097 E0.0431 F1800
+G1 X72.819 Y-24.487 E0.2195 F1800
+G2 X72.554 Y-24.947 I-0.362 J-0.097 E0.0152 F1800
+G1 X70.139 Y-25.594 E0.0915 F1800
+G2 X69.680 Y-25.329 I-0.097 J0.362 E0.0152 F1800
+G1 X68.127 Y-19.533 E0.2195 F1800
+G3 X67.402 Y-19.727 I-0.362 J-0.097 E0.0431 F1800
+G1 X68.955 Y-25.523 E0.2195 F1800
+G2 X68.690 Y-25.982 I-0.362 J-0.097 E0.0152 F1800
+G1 X66.275 Y-26.629 E0.0915 F1800
+G2 X65.816 Y-26.364 I-0.097 J0.362 E0.0152 F1800
+G1 X64.263 Y-20.568 E0.2195 F1800
+G3 X63.539 Y-20.762 I-0.362 J-0.097 E0.0431 F1800
+G1 X65.092 Y-26.558 E0.2195 F1800
+G2 X64.826 Y-27.017 I-0.362 J-0.097 E0.0152 F1800
+G1 X62.412 Y-27.664 E0.0915 F1800
+G2 X61.952 Y-27.399 I-0.097 J0.362 E0.0152 F1800
+G1 X60.399 Y-21.604 E0.2195 F1800
+G3 X59.675 Y-21.798 I-0.362 J-0.097 E0.0431 F1800
+G1 X61.228 Y-27.593 E0.2195 F1800
+G2 X60.963 Y-28.053 I-0.362 J-0.097 E0.0152 F1800
+G1 X58.548 Y-28.700 E0.0915 F1800
+G2 X58.089 Y-28.434 I-0.097 J0.362 E0.0152 F1800
+G1 X56.536 Y-22.639 E0.2195 F1800
+G3 X55.811 Y-22.833 I-0.362 J-0.097 E0.0431 F1800
+G1 X57.364 Y-28.629 E0.2195 F1800
+G2 X57.099 Y-29.088 I-0.362 J-0.097 E0.0152 F1800
+G1 X54.684 Y-29.735 E0.0915 F1800
+G2 X54.225 Y-29.470 I-0.097 J0.362 E0.0152 F1800
+G1 X52.672 Y-23.674 E0.2195 F1800
+G3 X51.948 Y-23.868 I-0.362 J-0.097 E0.0431 F1800
+G1 X53.501 Y-29.664 E0.2195 F1800
+G2 X53.235 Y-30.123 I-0.362 J-0.097 E0.0152 F1800
+G1 X50.821 Y-30.770 E0.0915 F1800
+G2 X50.361 Y-30.505 I-0.097 J0.362 E0.0152 F1800
+G1 X48.808 Y-24.709 E0.2195 F1800
+G3 X48.084 Y-24.904 I-0.362 J-0.097 E0.0431 F1800
+G1 X49.637 Y-30.699 E0.2195 F1800
+G2 X49.372 Y-31.158 I-0.362 J-0.097 E0.0152 F1800
+G1 X46.957 Y-31.805 E0.0915 F1800
+G2 X46.498 Y-31.540 I-0.097 J0.362 E0.0152 F1800
+G1 X44.945 Y-25.745 E0.2195 F1800
+G3 X44.220 Y-25.939 I-0.362 J-0.097 E0.0431 F1800
+G1 X45.773 Y-31.734 E0.2195 F1800
+G2 X45.508 Y-32.194 I-0.362 J-0.097 E0.0152 F1800
+G1 X43.093 Y-32.841 E0.0915 F1800
+G2 X42.634 Y-32.576 I-0.097 J0.362 E0.0152 F1800
+G1 X41.081 Y-26.780 E0.2195 F1800
+G3 X40.357 Y-26.974 I-0.362 J-0.097 E0.0431 F1800
+G1 X41.909 Y-32.770 E0.2195 F1800
+G2 X41.644 Y-33.229 I-0.362 J-0.097 E0.0152 F1800
+G1 X39.229 Y-33.876 E0.0915 F1800
+G2 X38.770 Y-33.611 I-0.097 J0.362 E0.0152 F1800
+G1 X37.217 Y-27.815 E0.2195 F1800
+G3 X36.493 Y-28.009 I-0.362 J-0.097 E0.0431 F1800
+G1 X38.046 Y-33.805 E0.2195 F1800
+G2 X37.781 Y-34.264 I-0.362 J-0.097 E0.0152 F1800
+G1 X35.366 Y-34.911 E0.0915 F1800
+G2 X34.906 Y-34.646 I-0.097 J0.362 E0.0152 F1800
+G1 X33.354 Y-28.851 E0.2195 F1800
+G3 X32.629 Y-29.045 I-0.362 J-0.097 E0.0431 F1800
+G1 X34.182 Y-34.840 E0.2195 F1800
+G2 X33.917 Y-35.299 I-0.362 J-0.097 E0.0152 F1800
+G1 X31.502 Y-35.947 E0.0915 F1800
+G2 X31.043 Y-35.681 I-0.097 J0.362 E0.0152 F1800
+G1 X29.490 Y-29.886
 G1 Z0.850 E-5.0000 F4800
 ;print vertical interlocked signal pattern 1
-G1 X-56.554 Y-51.285 F1800
+G1 X-56.660 Y-51.468 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-50.758 Y-49.732
-G3 X-50.952 Y-49.007 I-0.097 J0.362 E0.0431 F1800
-G1 X-56.748 Y-50.560 E0.2195 F1800
-G2 X-57.207 Y-50.295 I-0.097 J0.362 E0.0152 F1800
-G1 X-57.854 Y-47.880 E0.0915 F1800
-G2 X-57.589 Y-47.421 I0.362 J0.097 E0.0152 F1800
-G1 X-51.793 Y-45.868 E0.2195 F1800
-G3 X-51.987 Y-45.144 I-0.097 J0.362 E0.0431 F1800
-G1 X-57.783 Y-46.696 E0.2195 F1800
-G2 X-58.242 Y-46.431 I-0.097 J0.362 E0.0152 F1800
-G1 X-58.889 Y-44.016 E0.0915 F1800
-G2 X-58.624 Y-43.557 I0.362 J0.097 E0.0152 F1800
-G1 X-52.829 Y-42.004 E0.2195 F1800
-G3 X-53.023 Y-41.280 I-0.097 J0.362 E0.0431 F1800
-G1 X-58.818 Y-42.833 E0.2195 F1800
-G2 X-59.278 Y-42.568 I-0.097 J0.362 E0.0152 F1800
-G1 X-59.925 Y-40.153 E0.0915 F1800
-G2 X-59.659 Y-39.694 I0.362 J0.097 E0.0152 F1800
-G1 X-53.864 Y-38.141 E0.2195 F1800
-G3 X-54.058 Y-37.416 I-0.097 J0.362 E0.0431 F1800
-G1 X-59.854 Y-38.969 E0.2195 F1800
-G2 X-60.313 Y-38.704 I-0.097 J0.362 E0.0152 F1800
-G1 X-60.960 Y-36.289 E0.0915 F1800
-G2 X-60.695 Y-35.830 I0.362 J0.097 E0.0152 F1800
-G1 X-54.899 Y-34.277 E0.2195 F1800
-G3 X-55.093 Y-33.552 I-0.097 J0.362 E0.0431 F1800
-G1 X-60.889 Y-35.105 E0.2195 F1800
-G2 X-61.348 Y-34.840 I-0.097 J0.362 E0.0152 F1800
-G1 X-61.995 Y-32.425 E0.0915 F1800
-G2 X-61.730 Y-31.966 I0.362 J0.097 E0.0152 F1800
-G1 X-55.934 Y-30.413 E0.2195 F1800
-G3 X-56.129 Y-29.689 I-0.097 J0.362 E0.0431 F1800
-G1 X-61.924 Y-31.242 E0.2195 F1800
-G2 X-62.383 Y-30.976 I-0.097 J0.362 E0.0152 F1800
-G1 X-63.030 Y-28.562 E0.0915 F1800
-G2 X-62.765 Y-28.102 I0.362 J0.097 E0.0152 F1800
-G1 X-56.970 Y-26.549 E0.2195 F1800
-G3 X-57.164 Y-25.825 I-0.097 J0.362 E0.0431 F1800
-G1 X-62.959 Y-27.378 E0.2195 F1800
-G2 X-63.419 Y-27.113 I-0.097 J0.362 E0.0152 F1800
-G1 X-64.066 Y-24.698 E0.0915 F1800
-G2 X-63.801 Y-24.239 I0.362 J0.097 E0.0152 F1800
-G1 X-58.005 Y-22.686 E0.2195 F1800
-G3 X-58.199 Y-21.961 I-0.097 J0.362 E0.0431 F1800
-G1 X-63.995 Y-23.514 E0.2195 F1800
-G2 X-64.454 Y-23.249 I-0.097 J0.362 E0.0152 F1800
-G1 X-65.101 Y-20.834 E0.0915 F1800
-G2 X-64.836 Y-20.375 I0.362 J0.097 E0.0152 F1800
-G1 X-59.040 Y-18.822 E0.2195 F1800
-G3 X-59.234 Y-18.098 I-0.097 J0.362 E0.0431 F1800
-G1 X-65.030 Y-19.651 E0.2195 F1800
-G2 X-65.489 Y-19.385 I-0.097 J0.362 E0.0152 F1800
-G1 X-66.136 Y-16.971 E0.0915 F1800
-G2 X-65.871 Y-16.511 I0.362 J0.097 E0.0152 F1800
-G1 X-60.076 Y-14.958 E0.2195 F1800
-G3 X-60.270 Y-14.234 I-0.097 J0.362 E0.0431 F1800
-G1 X-66.065 Y-15.787 E0.2195 F1800
-G2 X-66.524 Y-15.522 I-0.097 J0.362 E0.0152 F1800
-G1 X-67.172 Y-13.107 E0.0915 F1800
-G2 X-66.906 Y-12.648 I0.362 J0.097 E0.0152 F1800
-G1 X-61.111 Y-11.095 E0.2195 F1800
-G3 X-61.305 Y-10.370 I-0.097 J0.362 E0.0431 F1800
-G1 X-67.100 Y-11.923 E0.2195 F1800
-G2 X-67.560 Y-11.658 I-0.097 J0.362 E0.0152 F1800
-G1 X-68.207 Y-9.243 E0.0915 F1800
-G2 X-67.942 Y-8.784 I0.362 J0.097 E0.0152 F1800
-G1 X-62.146 Y-7.231 E0.2195 F1800
-G3 X-62.340 Y-6.507 I-0.097 J0.362 E0.0431 F1800
-G1 X-68.136 Y-8.059 E0.2195 F1800
-G2 X-68.595 Y-7.794 I-0.097 J0.362 E0.0152 F1800
-G1 X-69.242 Y-5.379 E0.0915 F1800
-G2 X-68.977 Y-4.920 I0.362 J0.097 E0.0152 F1800
-G1 X-63.181 Y-3.367 E0.2195 F1800
-G3 X-63.375 Y-2.643 I-0.097 J0.362 E0.0431 F1800
-G1 X-69.171 Y-4.196 E0.2195 F1800
-G2 X-69.630 Y-3.931 I-0.097 J0.362 E0.0152 F1800
-G1 X-70.277 Y-1.516 E0.0915 F1800
-G2 X-70.012 Y-1.056 I0.362 J0.097 E0.0152 F1800
-G1 X-64.217 Y0.496 E0.2195 F1800
-G3 X-64.411 Y1.221 I-0.097 J0.362 E0.0431 F1800
-G1 X-70.206 Y-0.332 E0.2195 F1800
-G2 X-70.666 Y-0.067 I-0.097 J0.362 E0.0152 F1800
-G1 X-71.313 Y2.348 E0.0915 F1800
-G2 X-71.047 Y2.807 I0.362 J0.097 E0.0152 F1800
-G1 X-65.252 Y4.360 E0.2195 F1800
-G3 X-65.446 Y5.085 I-0.097 J0.362 E0.0431 F1800
-G1 X-71.242 Y3.532 E0.2195 F1800
-G2 X-71.701 Y3.797 I-0.097 J0.362 E0.0152 F1800
-G1 X-72.348 Y6.212 E0.0915 F1800
-G2 X-72.083 Y6.671 I0.362 J0.097 E0.0152 F1800
-G1 X-66.287 Y8.224 E0.2195 F1800
-G3 X-66.481 Y8.948 I-0.097 J0.362 E0.0431 F1800
-G1 X-72.277 Y7.395 E0.2195 F1800
-G2 X-72.736 Y7.661 I-0.097 J0.362 E0.0152 F1800
-G1 X-73.383 Y10.075 E0.0915 F1800
-G2 X-73.118 Y10.535 I0.362 J0.097 E0.0152 F1800
-G1 X-67.322 Y12.088 E0.2195 F1800
-G3 X-67.517 Y12.812 I-0.097 J0.362 E0.0431 F1800
-G1 X-73.312 Y11.259 E0.2195 F1800
-G2 X-73.771 Y11.524 I-0.097 J0.362 E0.0152 F1800
-G1 X-74.418 Y13.939 E0.0915 F1800
-G2 X-74.153 Y14.398 I0.362 J0.097 E0.0152 F1800
-G1 X-68.358 Y15.951
+G1 X-50.864 Y-49.915
+G3 X-51.058 Y-49.191 I-0.097 J0.362 E0.0431 F1800
+G1 X-56.854 Y-50.744 E0.2195 F1800
+G2 X-57.313 Y-50.479 I-0.097 J0.362 E0.0152 F1800
+G1 X-57.960 Y-48.064 E0.0915 F1800
+G2 X-57.695 Y-47.605 I0.362 J0.097 E0.0152 F1800
+G1 X-51.899 Y-46.052 E0.2195 F1800
+G3 X-52.093 Y-45.327 I-0.097 J0.362 E0.0431 F1800
+G1 X-57.889 Y-46.880 E0.2195 F1800
+G2 X-58.348 Y-46.615 I-0.097 J0.362 E0.0152 F1800
+G1 X-58.995 Y-44.200 E0.0915 F1800
+G2 X-58.730 Y-43.741 I0.362 J0.097 E0.0152 F1800
+G1 X-52.935 Y-42.188 E0.2195 F1800
+G3 X-53.129 Y-41.464 I-0.097 J0.362 E0.0431 F1800
+G1 X-58.924 Y-43.016 E0.2195 F1800
+G2 X-59.384 Y-42.751 I-0.097 J0.362 E0.0152 F1800
+G1 X-60.031 Y-40.337 E0.0915 F1800
+G2 X-59.765 Y-39.877 I0.362 J0.097 E0.0152 F1800
+G1 X-53.970 Y-38.324 E0.2195 F1800
+G3 X-54.164 Y-37.600 I-0.097 J0.362 E0.0431 F1800
+G1 X-59.960 Y-39.153 E0.2195 F1800
+G2 X-60.419 Y-38.888 I-0.097 J0.362 E0.0152 F1800
+G1 X-61.066 Y-36.473 E0.0915 F1800
+G2 X-60.801 Y-36.014 I0.362 J0.097 E0.0152 F1800
+G1 X-55.005 Y-34.461 E0.2195 F1800
+G3 X-55.199 Y-33.736 I-0.097 J0.362 E0.0431 F1800
+G1 X-60.995 Y-35.289 E0.2195 F1800
+G2 X-61.454 Y-35.024 I-0.097 J0.362 E0.0152 F1800
+G1 X-62.101 Y-32.609 E0.0915 F1800
+G2 X-61.836 Y-32.150 I0.362 J0.097 E0.0152 F1800
+G1 X-56.040 Y-30.597 E0.2195 F1800
+G3 X-56.235 Y-29.872 I-0.097 J0.362 E0.0431 F1800
+G1 X-62.030 Y-31.425 E0.2195 F1800
+G2 X-62.489 Y-31.160 I-0.097 J0.362 E0.0152 F1800
+G1 X-63.136 Y-28.745 E0.0915 F1800
+G2 X-62.871 Y-28.286 I0.362 J0.097 E0.0152 F1800
+G1 X-57.076 Y-26.733 E0.2195 F1800
+G3 X-57.270 Y-26.009 I-0.097 J0.362 E0.0431 F1800
+G1 X-63.065 Y-27.562 E0.2195 F1800
+G2 X-63.525 Y-27.297 I-0.097 J0.362 E0.0152 F1800
+G1 X-64.172 Y-24.882 E0.0915 F1800
+G2 X-63.907 Y-24.422 I0.362 J0.097 E0.0152 F1800
+G1 X-58.111 Y-22.869 E0.2195 F1800
+G3 X-58.305 Y-22.145 I-0.097 J0.362 E0.0431 F1800
+G1 X-64.101 Y-23.698 E0.2195 F1800
+G2 X-64.560 Y-23.433 I-0.097 J0.362 E0.0152 F1800
+G1 X-65.207 Y-21.018 E0.0915 F1800
+G2 X-64.942 Y-20.559 I0.362 J0.097 E0.0152 F1800
+G1 X-59.146 Y-19.006 E0.2195 F1800
+G3 X-59.340 Y-18.281 I-0.097 J0.362 E0.0431 F1800
+G1 X-65.136 Y-19.834 E0.2195 F1800
+G2 X-65.595 Y-19.569 I-0.097 J0.362 E0.0152 F1800
+G1 X-66.242 Y-17.154 E0.0915 F1800
+G2 X-65.977 Y-16.695 I0.362 J0.097 E0.0152 F1800
+G1 X-60.182 Y-15.142 E0.2195 F1800
+G3 X-60.376 Y-14.418 I-0.097 J0.362 E0.0431 F1800
+G1 X-66.171 Y-15.971 E0.2195 F1800
+G2 X-66.631 Y-15.705 I-0.097 J0.362 E0.0152 F1800
+G1 X-67.278 Y-13.291 E0.0915 F1800
+G2 X-67.012 Y-12.831 I0.362 J0.097 E0.0152 F1800
+G1 X-61.217 Y-11.278 E0.2195 F1800
+G3 X-61.411 Y-10.554 I-0.097 J0.362 E0.0431 F1800
+G1 X-67.207 Y-12.107 E0.2195 F1800
+G2 X-67.666 Y-11.842 I-0.097 J0.362 E0.0152 F1800
+G1 X-68.313 Y-9.427 E0.0915 F1800
+G2 X-68.048 Y-8.968 I0.362 J0.097 E0.0152 F1800
+G1 X-62.252 Y-7.415 E0.2195 F1800
+G3 X-62.446 Y-6.690 I-0.097 J0.362 E0.0431 F1800
+G1 X-68.242 Y-8.243 E0.2195 F1800
+G2 X-68.701 Y-7.978 I-0.097 J0.362 E0.0152 F1800
+G1 X-69.348 Y-5.563 E0.0915 F1800
+G2 X-69.083 Y-5.104 I0.362 J0.097 E0.0152 F1800
+G1 X-63.287 Y-3.551 E0.2195 F1800
+G3 X-63.482 Y-2.827 I-0.097 J0.362 E0.0431 F1800
+G1 X-69.277 Y-4.379 E0.2195 F1800
+G2 X-69.736 Y-4.114 I-0.097 J0.362 E0.0152 F1800
+G1 X-70.383 Y-1.699 E0.0915 F1800
+G2 X-70.118 Y-1.240 I0.362 J0.097 E0.0152 F1800
+G1 X-64.323 Y0.313 E0.2195 F1800
+G3 X-64.517 Y1.037 I-0.097 J0.362 E0.0431 F1800
+G1 X-70.312 Y-0.516 E0.2195 F1800
+G2 X-70.772 Y-0.251 I-0.097 J0.362 E0.0152 F1800
+G1 X-71.419 Y2.164 E0.0915 F1800
+G2 X-71.154 Y2.624 I0.362 J0.097 E0.0152 F1800
+G1 X-65.358 Y4.176 E0.2195 F1800
+G3 X-65.552 Y4.901 I-0.097 J0.362 E0.0431 F1800
+G1 X-71.348 Y3.348 E0.2195 F1800
+G2 X-71.807 Y3.613 I-0.097 J0.362 E0.0152 F1800
+G1 X-72.454 Y6.028 E0.0915 F1800
+G2 X-72.189 Y6.487 I0.362 J0.097 E0.0152 F1800
+G1 X-66.393 Y8.040 E0.2195 F1800
+G3 X-66.587 Y8.765 I-0.097 J0.362 E0.0431 F1800
+G1 X-72.383 Y7.212 E0.2195 F1800
+G2 X-72.842 Y7.477 I-0.097 J0.362 E0.0152 F1800
+G1 X-73.489 Y9.892 E0.0915 F1800
+G2 X-73.224 Y10.351 I0.362 J0.097 E0.0152 F1800
+G1 X-67.429 Y11.904 E0.2195 F1800
+G3 X-67.623 Y12.628 I-0.097 J0.362 E0.0431 F1800
+G1 X-73.418 Y11.075 E0.2195 F1800
+G2 X-73.877 Y11.341 I-0.097 J0.362 E0.0152 F1800
+G1 X-74.525 Y13.755 E0.0915 F1800
+G2 X-74.259 Y14.215 I0.362 J0.097 E0.0152 F1800
+G1 X-68.464 Y15.768
 G1 Z0.850 E-5.0000 F4800
-G1 X-63.722 Y17.970 F1800
+G1 X-63.828 Y17.786 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-57.927 Y19.523
-G2 X-57.733 Y18.798 I0.097 J-0.362 E0.0431 F1800
-G1 X-63.528 Y17.245 E0.2195 F1800
-G3 X-63.793 Y16.786 I0.097 J-0.362 E0.0152 F1800
-G1 X-63.146 Y14.371 E0.0915 F1800
-G3 X-62.687 Y14.106 I0.362 J0.097 E0.0152 F1800
-G1 X-56.891 Y15.659 E0.2195 F1800
-G2 X-56.697 Y14.935 I0.097 J-0.362 E0.0431 F1800
-G1 X-62.493 Y13.382 E0.2195 F1800
-G3 X-62.758 Y12.922 I0.097 J-0.362 E0.0152 F1800
-G1 X-62.111 Y10.508 E0.0915 F1800
-G3 X-61.652 Y10.242 I0.362 J0.097 E0.0152 F1800
-G1 X-55.856 Y11.795 E0.2195 F1800
-G2 X-55.662 Y11.071 I0.097 J-0.362 E0.0431 F1800
-G1 X-61.458 Y9.518 E0.2195 F1800
-G3 X-61.723 Y9.059 I0.097 J-0.362 E0.0152 F1800
-G1 X-61.076 Y6.644 E0.0915 F1800
-G3 X-60.616 Y6.379 I0.362 J0.097 E0.0152 F1800
-G1 X-54.821 Y7.932 E0.2195 F1800
-G2 X-54.627 Y7.207 I0.097 J-0.362 E0.0431 F1800
-G1 X-60.422 Y5.654 E0.2195 F1800
-G3 X-60.687 Y5.195 I0.097 J-0.362 E0.0152 F1800
-G1 X-60.040 Y2.780 E0.0915 F1800
-G3 X-59.581 Y2.515 I0.362 J0.097 E0.0152 F1800
-G1 X-53.786 Y4.068 E0.2195 F1800
-G2 X-53.591 Y3.343 I0.097 J-0.362 E0.0431 F1800
-G1 X-59.387 Y1.791 E0.2195 F1800
-G3 X-59.652 Y1.331 I0.097 J-0.362 E0.0152 F1800
-G1 X-59.005 Y-1.084 E0.0915 F1800
-G3 X-58.546 Y-1.349 I0.362 J0.097 E0.0152 F1800
-G1 X-52.750 Y0.204 E0.2195 F1800
-G2 X-52.556 Y-0.520 I0.097 J-0.362 E0.0431 F1800
-G1 X-58.352 Y-2.073 E0.2195 F1800
-G3 X-58.617 Y-2.532 I0.097 J-0.362 E0.0152 F1800
-G1 X-57.970 Y-4.947 E0.0915 F1800
-G3 X-57.511 Y-5.212 I0.362 J0.097 E0.0152 F1800
-G1 X-51.715 Y-3.660 E0.2195 F1800
-G2 X-51.521 Y-4.384 I0.097 J-0.362 E0.0431 F1800
-G1 X-57.316 Y-5.937 E0.2195 F1800
-G3 X-57.582 Y-6.396 I0.097 J-0.362 E0.0152 F1800
-G1 X-56.935 Y-8.811 E0.0915 F1800
-G3 X-56.475 Y-9.076 I0.362 J0.097 E0.0152 F1800
-G1 X-50.680 Y-7.523 E0.2195 F1800
-G2 X-50.486 Y-8.248 I0.097 J-0.362 E0.0431 F1800
-G1 X-56.281 Y-9.801 E0.2195 F1800
-G3 X-56.546 Y-10.260 I0.097 J-0.362 E0.0152 F1800
-G1 X-55.899 Y-12.675 E0.0915 F1800
-G3 X-55.440 Y-12.940 I0.362 J0.097 E0.0152 F1800
-G1 X-49.644 Y-11.387 E0.2195 F1800
-G2 X-49.450 Y-12.111 I0.097 J-0.362 E0.0431 F1800
-G1 X-55.246 Y-13.664 E0.2195 F1800
-G3 X-55.511 Y-14.124 I0.097 J-0.362 E0.0152 F1800
-G1 X-54.864 Y-16.538 E0.0915 F1800
-G3 X-54.405 Y-16.804 I0.362 J0.097 E0.0152 F1800
-G1 X-48.609 Y-15.251 E0.2195 F1800
-G2 X-48.415 Y-15.975 I0.097 J-0.362 E0.0431 F1800
-G1 X-54.211 Y-17.528 E0.2195 F1800
-G3 X-54.476 Y-17.987 I0.097 J-0.362 E0.0152 F1800
-G1 X-53.829 Y-20.402 E0.0915 F1800
-G3 X-53.369 Y-20.667 I0.362 J0.097 E0.0152 F1800
-G1 X-47.574 Y-19.114 E0.2195 F1800
-G2 X-47.380 Y-19.839 I0.097 J-0.362 E0.0431 F1800
-G1 X-53.175 Y-21.392 E0.2195 F1800
-G3 X-53.440 Y-21.851 I0.097 J-0.362 E0.0152 F1800
-G1 X-52.793 Y-24.266 E0.0915 F1800
-G3 X-52.334 Y-24.531 I0.362 J0.097 E0.0152 F1800
-G1 X-46.539 Y-22.978 E0.2195 F1800
-G2 X-46.344 Y-23.702 I0.097 J-0.362 E0.0431 F1800
-G1 X-52.140 Y-25.255 E0.2195 F1800
-G3 X-52.405 Y-25.715 I0.097 J-0.362 E0.0152 F1800
-G1 X-51.758 Y-28.129 E0.0915 F1800
-G3 X-51.299 Y-28.395 I0.362 J0.097 E0.0152 F1800
-G1 X-45.503 Y-26.842 E0.2195 F1800
-G2 X-45.309 Y-27.566 I0.097 J-0.362 E0.0431 F1800
-G1 X-51.105 Y-29.119 E0.2195 F1800
-G3 X-51.370 Y-29.578 I0.097 J-0.362 E0.0152 F1800
-G1 X-50.723 Y-31.993 E0.0915 F1800
-G3 X-50.264 Y-32.258 I0.362 J0.097 E0.0152 F1800
-G1 X-44.468 Y-30.705 E0.2195 F1800
-G2 X-44.274 Y-31.430 I0.097 J-0.362 E0.0431 F1800
-G1 X-50.069 Y-32.983 E0.2195 F1800
-G3 X-50.335 Y-33.442 I0.097 J-0.362 E0.0152 F1800
-G1 X-49.688 Y-35.857 E0.0915 F1800
-G3 X-49.228 Y-36.122 I0.362 J0.097 E0.0152 F1800
-G1 X-43.433 Y-34.569 E0.2195 F1800
-G2 X-43.239 Y-35.294 I0.097 J-0.362 E0.0431 F1800
-G1 X-49.034 Y-36.847 E0.2195 F1800
-G3 X-49.299 Y-37.306 I0.097 J-0.362 E0.0152 F1800
-G1 X-48.652 Y-39.721 E0.0915 F1800
-G3 X-48.193 Y-39.986 I0.362 J0.097 E0.0152 F1800
-G1 X-42.398 Y-38.433 E0.2195 F1800
-G2 X-42.203 Y-39.157 I0.097 J-0.362 E0.0431 F1800
-G1 X-47.999 Y-40.710 E0.2195 F1800
-G3 X-48.264 Y-41.169 I0.097 J-0.362 E0.0152 F1800
-G1 X-47.617 Y-43.584 E0.0915 F1800
-G3 X-47.158 Y-43.849 I0.362 J0.097 E0.0152 F1800
-G1 X-41.362 Y-42.297 E0.2195 F1800
-G2 X-41.168 Y-43.021 I0.097 J-0.362 E0.0431 F1800
-G1 X-46.964 Y-44.574 E0.2195 F1800
-G3 X-47.229 Y-45.033 I0.097 J-0.362 E0.0152 F1800
-G1 X-46.582 Y-47.448 E0.0915 F1800
-G3 X-46.123 Y-47.713 I0.362 J0.097 E0.0152 F1800
-G1 X-40.327 Y-46.160
+G1 X-58.033 Y19.339
+G2 X-57.839 Y18.615 I0.097 J-0.362 E0.0431 F1800
+G1 X-63.634 Y17.062 E0.2195 F1800
+G3 X-63.899 Y16.602 I0.097 J-0.362 E0.0152 F1800
+G1 X-63.252 Y14.188 E0.0915 F1800
+G3 X-62.793 Y13.922 I0.362 J0.097 E0.0152 F1800
+G1 X-56.997 Y15.475 E0.2195 F1800
+G2 X-56.803 Y14.751 I0.097 J-0.362 E0.0431 F1800
+G1 X-62.599 Y13.198 E0.2195 F1800
+G3 X-62.864 Y12.739 I0.097 J-0.362 E0.0152 F1800
+G1 X-62.217 Y10.324 E0.0915 F1800
+G3 X-61.758 Y10.059 I0.362 J0.097 E0.0152 F1800
+G1 X-55.962 Y11.612 E0.2195 F1800
+G2 X-55.768 Y10.887 I0.097 J-0.362 E0.0431 F1800
+G1 X-61.564 Y9.334 E0.2195 F1800
+G3 X-61.829 Y8.875 I0.097 J-0.362 E0.0152 F1800
+G1 X-61.182 Y6.460 E0.0915 F1800
+G3 X-60.722 Y6.195 I0.362 J0.097 E0.0152 F1800
+G1 X-54.927 Y7.748 E0.2195 F1800
+G2 X-54.733 Y7.023 I0.097 J-0.362 E0.0431 F1800
+G1 X-60.528 Y5.471 E0.2195 F1800
+G3 X-60.793 Y5.011 I0.097 J-0.362 E0.0152 F1800
+G1 X-60.146 Y2.596 E0.0915 F1800
+G3 X-59.687 Y2.331 I0.362 J0.097 E0.0152 F1800
+G1 X-53.892 Y3.884 E0.2195 F1800
+G2 X-53.697 Y3.160 I0.097 J-0.362 E0.0431 F1800
+G1 X-59.493 Y1.607 E0.2195 F1800
+G3 X-59.758 Y1.148 I0.097 J-0.362 E0.0152 F1800
+G1 X-59.111 Y-1.267 E0.0915 F1800
+G3 X-58.652 Y-1.532 I0.362 J0.097 E0.0152 F1800
+G1 X-52.856 Y0.020 E0.2195 F1800
+G2 X-52.662 Y-0.704 I0.097 J-0.362 E0.0431 F1800
+G1 X-58.458 Y-2.257 E0.2195 F1800
+G3 X-58.723 Y-2.716 I0.097 J-0.362 E0.0152 F1800
+G1 X-58.076 Y-5.131 E0.0915 F1800
+G3 X-57.617 Y-5.396 I0.362 J0.097 E0.0152 F1800
+G1 X-51.821 Y-3.843 E0.2195 F1800
+G2 X-51.627 Y-4.568 I0.097 J-0.362 E0.0431 F1800
+G1 X-57.422 Y-6.121 E0.2195 F1800
+G3 X-57.688 Y-6.580 I0.097 J-0.362 E0.0152 F1800
+G1 X-57.041 Y-8.995 E0.0915 F1800
+G3 X-56.581 Y-9.260 I0.362 J0.097 E0.0152 F1800
+G1 X-50.786 Y-7.707 E0.2195 F1800
+G2 X-50.592 Y-8.431 I0.097 J-0.362 E0.0431 F1800
+G1 X-56.387 Y-9.984 E0.2195 F1800
+G3 X-56.652 Y-10.444 I0.097 J-0.362 E0.0152 F1800
+G1 X-56.005 Y-12.858 E0.0915 F1800
+G3 X-55.546 Y-13.124 I0.362 J0.097 E0.0152 F1800
+G1 X-49.751 Y-11.571 E0.2195 F1800
+G2 X-49.556 Y-12.295 I0.097 J-0.362 E0.0431 F1800
+G1 X-55.352 Y-13.848 E0.2195 F1800
+G3 X-55.617 Y-14.307 I0.097 J-0.362 E0.0152 F1800
+G1 X-54.970 Y-16.722 E0.0915 F1800
+G3 X-54.511 Y-16.987 I0.362 J0.097 E0.0152 F1800
+G1 X-48.715 Y-15.434 E0.2195 F1800
+G2 X-48.521 Y-16.159 I0.097 J-0.362 E0.0431 F1800
+G1 X-54.317 Y-17.712 E0.2195 F1800
+G3 X-54.582 Y-18.171 I0.097 J-0.362 E0.0152 F1800
+G1 X-53.935 Y-20.586 E0.0915 F1800
+G3 X-53.476 Y-20.851 I0.362 J0.097 E0.0152 F1800
+G1 X-47.680 Y-19.298 E0.2195 F1800
+G2 X-47.486 Y-20.022 I0.097 J-0.362 E0.0431 F1800
+G1 X-53.281 Y-21.575 E0.2195 F1800
+G3 X-53.547 Y-22.035 I0.097 J-0.362 E0.0152 F1800
+G1 X-52.900 Y-24.449 E0.0915 F1800
+G3 X-52.440 Y-24.715 I0.362 J0.097 E0.0152 F1800
+G1 X-46.645 Y-23.162 E0.2195 F1800
+G2 X-46.451 Y-23.886 I0.097 J-0.362 E0.0431 F1800
+G1 X-52.246 Y-25.439 E0.2195 F1800
+G3 X-52.511 Y-25.898 I0.097 J-0.362 E0.0152 F1800
+G1 X-51.864 Y-28.313 E0.0915 F1800
+G3 X-51.405 Y-28.578 I0.362 J0.097 E0.0152 F1800
+G1 X-45.609 Y-27.025 E0.2195 F1800
+G2 X-45.415 Y-27.750 I0.097 J-0.362 E0.0431 F1800
+G1 X-51.211 Y-29.303 E0.2195 F1800
+G3 X-51.476 Y-29.762 I0.097 J-0.362 E0.0152 F1800
+G1 X-50.829 Y-32.177 E0.0915 F1800
+G3 X-50.370 Y-32.442 I0.362 J0.097 E0.0152 F1800
+G1 X-44.574 Y-30.889 E0.2195 F1800
+G2 X-44.380 Y-31.614 I0.097 J-0.362 E0.0431 F1800
+G1 X-50.176 Y-33.167 E0.2195 F1800
+G3 X-50.441 Y-33.626 I0.097 J-0.362 E0.0152 F1800
+G1 X-49.794 Y-36.041 E0.0915 F1800
+G3 X-49.334 Y-36.306 I0.362 J0.097 E0.0152 F1800
+G1 X-43.539 Y-34.753 E0.2195 F1800
+G2 X-43.345 Y-35.477 I0.097 J-0.362 E0.0431 F1800
+G1 X-49.140 Y-37.030 E0.2195 F1800
+G3 X-49.405 Y-37.489 I0.097 J-0.362 E0.0152 F1800
+G1 X-48.758 Y-39.904 E0.0915 F1800
+G3 X-48.299 Y-40.169 I0.362 J0.097 E0.0152 F1800
+G1 X-42.504 Y-38.617 E0.2195 F1800
+G2 X-42.309 Y-39.341 I0.097 J-0.362 E0.0431 F1800
+G1 X-48.105 Y-40.894 E0.2195 F1800
+G3 X-48.370 Y-41.353 I0.097 J-0.362 E0.0152 F1800
+G1 X-47.723 Y-43.768 E0.0915 F1800
+G3 X-47.264 Y-44.033 I0.362 J0.097 E0.0152 F1800
+G1 X-41.468 Y-42.480 E0.2195 F1800
+G2 X-41.274 Y-43.205 I0.097 J-0.362 E0.0431 F1800
+G1 X-47.070 Y-44.758 E0.2195 F1800
+G3 X-47.335 Y-45.217 I0.097 J-0.362 E0.0152 F1800
+G1 X-46.688 Y-47.632 E0.0915 F1800
+G3 X-46.229 Y-47.897 I0.362 J0.097 E0.0152 F1800
+G1 X-40.433 Y-46.344
 G1 Z0.850 E-5.0000 F4800
 ;print horizontal interlocked signal pattern 1
-G1 X27.542 Y-25.128 F1800
+G1 X27.436 Y-25.312 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X25.989 Y-19.332
-G2 X26.714 Y-19.138 I0.362 J0.097 E0.0431 F1800
-G1 X28.266 Y-24.934 E0.2195 F1800
-G3 X28.726 Y-25.199 I0.362 J0.097 E0.0152 F1800
-G1 X31.141 Y-24.552 E0.0915 F1800
-G3 X31.406 Y-24.093 I-0.097 J0.362 E0.0152 F1800
-G1 X29.853 Y-18.297 E0.2195 F1800
-G2 X30.577 Y-18.103 I0.362 J0.097 E0.0431 F1800
-G1 X32.130 Y-23.898 E0.2195 F1800
-G3 X32.589 Y-24.164 I0.362 J0.097 E0.0152 F1800
-G1 X35.004 Y-23.517 E0.0915 F1800
-G3 X35.269 Y-23.057 I-0.097 J0.362 E0.0152 F1800
-G1 X33.717 Y-17.262 E0.2195 F1800
-G2 X34.441 Y-17.068 I0.362 J0.097 E0.0431 F1800
-G1 X35.994 Y-22.863 E0.2195 F1800
-G3 X36.453 Y-23.128 I0.362 J0.097 E0.0152 F1800
-G1 X38.868 Y-22.481 E0.0915 F1800
-G3 X39.133 Y-22.022 I-0.097 J0.362 E0.0152 F1800
-G1 X37.580 Y-16.226 E0.2195 F1800
-G2 X38.305 Y-16.032 I0.362 J0.097 E0.0431 F1800
-G1 X39.858 Y-21.828 E0.2195 F1800
-G3 X40.317 Y-22.093 I0.362 J0.097 E0.0152 F1800
-G1 X42.732 Y-21.446 E0.0915 F1800
-G3 X42.997 Y-20.987 I-0.097 J0.362 E0.0152 F1800
-G1 X41.444 Y-15.191 E0.2195 F1800
-G2 X42.168 Y-14.997 I0.362 J0.097 E0.0431 F1800
-G1 X43.721 Y-20.793 E0.2195 F1800
-G3 X44.181 Y-21.058 I0.362 J0.097 E0.0152 F1800
-G1 X46.595 Y-20.411 E0.0915 F1800
-G3 X46.861 Y-19.951 I-0.097 J0.362 E0.0152 F1800
-G1 X45.308 Y-14.156 E0.2195 F1800
-G2 X46.032 Y-13.962 I0.362 J0.097 E0.0431 F1800
-G1 X47.585 Y-19.757 E0.2195 F1800
-G3 X48.044 Y-20.022 I0.362 J0.097 E0.0152 F1800
-G1 X50.459 Y-19.375 E0.0915 F1800
-G3 X50.724 Y-18.916 I-0.097 J0.362 E0.0152 F1800
-G1 X49.171 Y-13.121 E0.2195 F1800
-G2 X49.896 Y-12.926 I0.362 J0.097 E0.0431 F1800
-G1 X51.449 Y-18.722 E0.2195 F1800
-G3 X51.908 Y-18.987 I0.362 J0.097 E0.0152 F1800
-G1 X54.323 Y-18.340 E0.0915 F1800
-G3 X54.588 Y-17.881 I-0.097 J0.362 E0.0152 F1800
-G1 X53.035 Y-12.085 E0.2195 F1800
-G2 X53.759 Y-11.891 I0.362 J0.097 E0.0431 F1800
-G1 X55.312 Y-17.687 E0.2195 F1800
-G3 X55.772 Y-17.952 I0.362 J0.097 E0.0152 F1800
-G1 X58.186 Y-17.305 E0.0915 F1800
-G3 X58.452 Y-16.846 I-0.097 J0.362 E0.0152 F1800
-G1 X56.899 Y-11.050 E0.2195 F1800
-G2 X57.623 Y-10.856 I0.362 J0.097 E0.0431 F1800
-G1 X59.176 Y-16.651 E0.2195 F1800
-G3 X59.635 Y-16.917 I0.362 J0.097 E0.0152 F1800
-G1 X62.050 Y-16.270 E0.0915 F1800
-G3 X62.315 Y-15.810 I-0.097 J0.362 E0.0152 F1800
-G1 X60.762 Y-10.015 E0.2195 F1800
-G2 X61.487 Y-9.821 I0.362 J0.097 E0.0431 F1800
-G1 X63.040 Y-15.616 E0.2195 F1800
-G3 X63.499 Y-15.881 I0.362 J0.097 E0.0152 F1800
-G1 X65.914 Y-15.234 E0.0915 F1800
-G3 X66.179 Y-14.775 I-0.097 J0.362 E0.0152 F1800
-G1 X64.626 Y-8.979 E0.2195 F1800
-G2 X65.351 Y-8.785 I0.362 J0.097 E0.0431 F1800
-G1 X66.904 Y-14.581 E0.2195 F1800
-G3 X67.363 Y-14.846 I0.362 J0.097 E0.0152 F1800
-G1 X69.778 Y-14.199 E0.0915 F1800
-G3 X70.043 Y-13.740 I-0.097 J0.362 E0.0152 F1800
-G1 X68.490 Y-7.944 E0.2195 F1800
-G2 X69.214 Y-7.750 I0.362 J0.097 E0.0431 F1800
-G1 X70.767 Y-13.546 E0.2195 F1800
-G3 X71.226 Y-13.811 I0.362 J0.097 E0.0152 F1800
-G1 X73.641 Y-13.164 E0.0915 F1800
-G3 X73.906 Y-12.704 I-0.097 J0.362 E0.0152 F1800
-G1 X72.354 Y-6.909 E0.2195 F1800
-G2 X73.078 Y-6.715 I0.362 J0.097 E0.0431 F1800
-G1 X74.631 Y-12.510 E0.2195 F1800
-G3 X75.090 Y-12.776 I0.362 J0.097 E0.0152 F1800
-G1 X77.505 Y-12.128 E0.0915 F1800
-G3 X77.770 Y-11.669 I-0.097 J0.362 E0.0152 F1800
-G1 X76.217 Y-5.874 E0.2195 F1800
-G2 X76.942 Y-5.680 I0.362 J0.097 E0.0431 F1800
-G1 X78.495 Y-11.475 E0.2195 F1800
-G3 X78.954 Y-11.740 I0.362 J0.097 E0.0152 F1800
-G1 X81.369 Y-11.093 E0.0915 F1800
-G3 X81.634 Y-10.634 I-0.097 J0.362 E0.0152 F1800
-G1 X80.081 Y-4.838 E0.2195 F1800
-G2 X80.805 Y-4.644 I0.362 J0.097 E0.0431 F1800
-G1 X82.358 Y-10.440 E0.2195 F1800
-G3 X82.818 Y-10.705 I0.362 J0.097 E0.0152 F1800
-G1 X85.232 Y-10.058 E0.0915 F1800
-G3 X85.498 Y-9.599 I-0.097 J0.362 E0.0152 F1800
-G1 X83.945 Y-3.803 E0.2195 F1800
-G2 X84.669 Y-3.609 I0.362 J0.097 E0.0431 F1800
-G1 X86.222 Y-9.405 E0.2195 F1800
-G3 X86.681 Y-9.670 I0.362 J0.097 E0.0152 F1800
-G1 X89.096 Y-9.023 E0.0915 F1800
-G3 X89.361 Y-8.563 I-0.097 J0.362 E0.0152 F1800
-G1 X87.808 Y-2.768 E0.2195 F1800
-G2 X88.533 Y-2.574 I0.362 J0.097 E0.0431 F1800
-G1 X90.086 Y-8.369 E0.2195 F1800
-G3 X90.545 Y-8.634 I0.362 J0.097 E0.0152 F1800
-G1 X92.960 Y-7.987 E0.0915 F1800
-G3 X93.225 Y-7.528 I-0.097 J0.362 E0.0152 F1800
-G1 X91.672 Y-1.733
+G1 X25.883 Y-19.516
+G2 X26.607 Y-19.322 I0.362 J0.097 E0.0431 F1800
+G1 X28.160 Y-25.117 E0.2195 F1800
+G3 X28.620 Y-25.383 I0.362 J0.097 E0.0152 F1800
+G1 X31.034 Y-24.736 E0.0915 F1800
+G3 X31.300 Y-24.276 I-0.097 J0.362 E0.0152 F1800
+G1 X29.747 Y-18.481 E0.2195 F1800
+G2 X30.471 Y-18.287 I0.362 J0.097 E0.0431 F1800
+G1 X32.024 Y-24.082 E0.2195 F1800
+G3 X32.483 Y-24.347 I0.362 J0.097 E0.0152 F1800
+G1 X34.898 Y-23.700 E0.0915 F1800
+G3 X35.163 Y-23.241 I-0.097 J0.362 E0.0152 F1800
+G1 X33.610 Y-17.445 E0.2195 F1800
+G2 X34.335 Y-17.251 I0.362 J0.097 E0.0431 F1800
+G1 X35.888 Y-23.047 E0.2195 F1800
+G3 X36.347 Y-23.312 I0.362 J0.097 E0.0152 F1800
+G1 X38.762 Y-22.665 E0.0915 F1800
+G3 X39.027 Y-22.206 I-0.097 J0.362 E0.0152 F1800
+G1 X37.474 Y-16.410 E0.2195 F1800
+G2 X38.199 Y-16.216 I0.362 J0.097 E0.0431 F1800
+G1 X39.752 Y-22.012 E0.2195 F1800
+G3 X40.211 Y-22.277 I0.362 J0.097 E0.0152 F1800
+G1 X42.626 Y-21.630 E0.0915 F1800
+G3 X42.891 Y-21.170 I-0.097 J0.362 E0.0152 F1800
+G1 X41.338 Y-15.375 E0.2195 F1800
+G2 X42.062 Y-15.181 I0.362 J0.097 E0.0431 F1800
+G1 X43.615 Y-20.976 E0.2195 F1800
+G3 X44.074 Y-21.241 I0.362 J0.097 E0.0152 F1800
+G1 X46.489 Y-20.594 E0.0915 F1800
+G3 X46.754 Y-20.135 I-0.097 J0.362 E0.0152 F1800
+G1 X45.202 Y-14.340 E0.2195 F1800
+G2 X45.926 Y-14.145 I0.362 J0.097 E0.0431 F1800
+G1 X47.479 Y-19.941 E0.2195 F1800
+G3 X47.938 Y-20.206 I0.362 J0.097 E0.0152 F1800
+G1 X50.353 Y-19.559 E0.0915 F1800
+G3 X50.618 Y-19.100 I-0.097 J0.362 E0.0152 F1800
+G1 X49.065 Y-13.304 E0.2195 F1800
+G2 X49.790 Y-13.110 I0.362 J0.097 E0.0431 F1800
+G1 X51.343 Y-18.906 E0.2195 F1800
+G3 X51.802 Y-19.171 I0.362 J0.097 E0.0152 F1800
+G1 X54.217 Y-18.524 E0.0915 F1800
+G3 X54.482 Y-18.065 I-0.097 J0.362 E0.0152 F1800
+G1 X52.929 Y-12.269 E0.2195 F1800
+G2 X53.653 Y-12.075 I0.362 J0.097 E0.0431 F1800
+G1 X55.206 Y-17.870 E0.2195 F1800
+G3 X55.666 Y-18.136 I0.362 J0.097 E0.0152 F1800
+G1 X58.080 Y-17.489 E0.0915 F1800
+G3 X58.346 Y-17.029 I-0.097 J0.362 E0.0152 F1800
+G1 X56.793 Y-11.234 E0.2195 F1800
+G2 X57.517 Y-11.040 I0.362 J0.097 E0.0431 F1800
+G1 X59.070 Y-16.835 E0.2195 F1800
+G3 X59.529 Y-17.100 I0.362 J0.097 E0.0152 F1800
+G1 X61.944 Y-16.453 E0.0915 F1800
+G3 X62.209 Y-15.994 I-0.097 J0.362 E0.0152 F1800
+G1 X60.656 Y-10.198 E0.2195 F1800
+G2 X61.381 Y-10.004 I0.362 J0.097 E0.0431 F1800
+G1 X62.934 Y-15.800 E0.2195 F1800
+G3 X63.393 Y-16.065 I0.362 J0.097 E0.0152 F1800
+G1 X65.808 Y-15.418 E0.0915 F1800
+G3 X66.073 Y-14.959 I-0.097 J0.362 E0.0152 F1800
+G1 X64.520 Y-9.163 E0.2195 F1800
+G2 X65.245 Y-8.969 I0.362 J0.097 E0.0431 F1800
+G1 X66.797 Y-14.765 E0.2195 F1800
+G3 X67.257 Y-15.030 I0.362 J0.097 E0.0152 F1800
+G1 X69.672 Y-14.383 E0.0915 F1800
+G3 X69.937 Y-13.923 I-0.097 J0.362 E0.0152 F1800
+G1 X68.384 Y-8.128 E0.2195 F1800
+G2 X69.108 Y-7.934 I0.362 J0.097 E0.0431 F1800
+G1 X70.661 Y-13.729 E0.2195 F1800
+G3 X71.120 Y-13.995 I0.362 J0.097 E0.0152 F1800
+G1 X73.535 Y-13.347 E0.0915 F1800
+G3 X73.800 Y-12.888 I-0.097 J0.362 E0.0152 F1800
+G1 X72.247 Y-7.093 E0.2195 F1800
+G2 X72.972 Y-6.899 I0.362 J0.097 E0.0431 F1800
+G1 X74.525 Y-12.694 E0.2195 F1800
+G3 X74.984 Y-12.959 I0.362 J0.097 E0.0152 F1800
+G1 X77.399 Y-12.312 E0.0915 F1800
+G3 X77.664 Y-11.853 I-0.097 J0.362 E0.0152 F1800
+G1 X76.111 Y-6.057 E0.2195 F1800
+G2 X76.836 Y-5.863 I0.362 J0.097 E0.0431 F1800
+G1 X78.389 Y-11.659 E0.2195 F1800
+G3 X78.848 Y-11.924 I0.362 J0.097 E0.0152 F1800
+G1 X81.263 Y-11.277 E0.0915 F1800
+G3 X81.528 Y-10.818 I-0.097 J0.362 E0.0152 F1800
+G1 X79.975 Y-5.022 E0.2195 F1800
+G2 X80.699 Y-4.828 I0.362 J0.097 E0.0431 F1800
+G1 X82.252 Y-10.624 E0.2195 F1800
+G3 X82.712 Y-10.889 I0.362 J0.097 E0.0152 F1800
+G1 X85.126 Y-10.242 E0.0915 F1800
+G3 X85.392 Y-9.782 I-0.097 J0.362 E0.0152 F1800
+G1 X83.839 Y-3.987 E0.2195 F1800
+G2 X84.563 Y-3.793 I0.362 J0.097 E0.0431 F1800
+G1 X86.116 Y-9.588 E0.2195 F1800
+G3 X86.575 Y-9.853 I0.362 J0.097 E0.0152 F1800
+G1 X88.990 Y-9.206 E0.0915 F1800
+G3 X89.255 Y-8.747 I-0.097 J0.362 E0.0152 F1800
+G1 X87.702 Y-2.952 E0.2195 F1800
+G2 X88.427 Y-2.757 I0.362 J0.097 E0.0431 F1800
+G1 X89.980 Y-8.553 E0.2195 F1800
+G3 X90.439 Y-8.818 I0.362 J0.097 E0.0152 F1800
+G1 X92.854 Y-8.171 E0.0915 F1800
+G3 X93.119 Y-7.712 I-0.097 J0.362 E0.0152 F1800
+G1 X91.566 Y-1.916
 G1 Z0.850 E-5.0000 F4800
-G1 X91.102 Y3.291 F1800
+G1 X90.996 Y3.107 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X89.550 Y9.087
-G3 X88.825 Y8.893 I-0.362 J-0.097 E0.0431 F1800
-G1 X90.378 Y3.097 E0.2195 F1800
-G2 X90.113 Y2.638 I-0.362 J-0.097 E0.0152 F1800
-G1 X87.698 Y1.991 E0.0915 F1800
-G2 X87.239 Y2.256 I-0.097 J0.362 E0.0152 F1800
-G1 X85.686 Y8.051 E0.2195 F1800
-G3 X84.961 Y7.857 I-0.362 J-0.097 E0.0431 F1800
-G1 X86.514 Y2.062 E0.2195 F1800
-G2 X86.249 Y1.603 I-0.362 J-0.097 E0.0152 F1800
-G1 X83.834 Y0.955 E0.0915 F1800
-G2 X83.375 Y1.221 I-0.097 J0.362 E0.0152 F1800
-G1 X81.822 Y7.016 E0.2195 F1800
-G3 X81.098 Y6.822 I-0.362 J-0.097 E0.0431 F1800
-G1 X82.651 Y1.027 E0.2195 F1800
-G2 X82.385 Y0.567 I-0.362 J-0.097 E0.0152 F1800
-G1 X79.971 Y-0.080 E0.0915 F1800
-G2 X79.511 Y0.185 I-0.097 J0.362 E0.0152 F1800
-G1 X77.958 Y5.981 E0.2195 F1800
-G3 X77.234 Y5.787 I-0.362 J-0.097 E0.0431 F1800
-G1 X78.787 Y-0.009 E0.2195 F1800
-G2 X78.522 Y-0.468 I-0.362 J-0.097 E0.0152 F1800
-G1 X76.107 Y-1.115 E0.0915 F1800
-G2 X75.648 Y-0.850 I-0.097 J0.362 E0.0152 F1800
-G1 X74.095 Y4.946 E0.2195 F1800
-G3 X73.370 Y4.752 I-0.362 J-0.097 E0.0431 F1800
-G1 X74.923 Y-1.044 E0.2195 F1800
-G2 X74.658 Y-1.503 I-0.362 J-0.097 E0.0152 F1800
-G1 X72.243 Y-2.150 E0.0915 F1800
-G2 X71.784 Y-1.885 I-0.097 J0.362 E0.0152 F1800
-G1 X70.231 Y3.910 E0.2195 F1800
-G3 X69.507 Y3.716 I-0.362 J-0.097 E0.0431 F1800
-G1 X71.059 Y-2.079 E0.2195 F1800
-G2 X70.794 Y-2.539 I-0.362 J-0.097 E0.0152 F1800
-G1 X68.379 Y-3.186 E0.0915 F1800
-G2 X67.920 Y-2.920 I-0.097 J0.362 E0.0152 F1800
-G1 X66.367 Y2.875 E0.2195 F1800
-G3 X65.643 Y2.681 I-0.362 J-0.097 E0.0431 F1800
-G1 X67.196 Y-3.115 E0.2195 F1800
-G2 X66.931 Y-3.574 I-0.362 J-0.097 E0.0152 F1800
-G1 X64.516 Y-4.221 E0.0915 F1800
-G2 X64.056 Y-3.956 I-0.097 J0.362 E0.0152 F1800
-G1 X62.504 Y1.840 E0.2195 F1800
-G3 X61.779 Y1.646 I-0.362 J-0.097 E0.0431 F1800
-G1 X63.332 Y-4.150 E0.2195 F1800
-G2 X63.067 Y-4.609 I-0.362 J-0.097 E0.0152 F1800
-G1 X60.652 Y-5.256 E0.0915 F1800
-G2 X60.193 Y-4.991 I-0.097 J0.362 E0.0152 F1800
-G1 X58.640 Y0.805 E0.2195 F1800
-G3 X57.915 Y0.610 I-0.362 J-0.097 E0.0431 F1800
-G1 X59.468 Y-5.185 E0.2195 F1800
-G2 X59.203 Y-5.644 I-0.362 J-0.097 E0.0152 F1800
-G1 X56.788 Y-6.291 E0.0915 F1800
-G2 X56.329 Y-6.026 I-0.097 J0.362 E0.0152 F1800
-G1 X54.776 Y-0.231 E0.2195 F1800
-G3 X54.052 Y-0.425 I-0.362 J-0.097 E0.0431 F1800
-G1 X55.605 Y-6.220 E0.2195 F1800
-G2 X55.339 Y-6.680 I-0.362 J-0.097 E0.0152 F1800
-G1 X52.925 Y-7.327 E0.0915 F1800
-G2 X52.465 Y-7.062 I-0.097 J0.362 E0.0152 F1800
-G1 X50.912 Y-1.266 E0.2195 F1800
-G3 X50.188 Y-1.460 I-0.362 J-0.097 E0.0431 F1800
-G1 X51.741 Y-7.256 E0.2195 F1800
-G2 X51.476 Y-7.715 I-0.362 J-0.097 E0.0152 F1800
-G1 X49.061 Y-8.362 E0.0915 F1800
-G2 X48.602 Y-8.097 I-0.097 J0.362 E0.0152 F1800
-G1 X47.049 Y-2.301 E0.2195 F1800
-G3 X46.324 Y-2.495 I-0.362 J-0.097 E0.0431 F1800
-G1 X47.877 Y-8.291 E0.2195 F1800
-G2 X47.612 Y-8.750 I-0.362 J-0.097 E0.0152 F1800
-G1 X45.197 Y-9.397 E0.0915 F1800
-G2 X44.738 Y-9.132 I-0.097 J0.362 E0.0152 F1800
-G1 X43.185 Y-3.337 E0.2195 F1800
-G3 X42.461 Y-3.531 I-0.362 J-0.097 E0.0431 F1800
-G1 X44.014 Y-9.326 E0.2195 F1800
-G2 X43.748 Y-9.786 I-0.362 J-0.097 E0.0152 F1800
-G1 X41.334 Y-10.433 E0.0915 F1800
-G2 X40.874 Y-10.167 I-0.097 J0.362 E0.0152 F1800
-G1 X39.321 Y-4.372 E0.2195 F1800
-G3 X38.597 Y-4.566 I-0.362 J-0.097 E0.0431 F1800
-G1 X40.150 Y-10.362 E0.2195 F1800
-G2 X39.885 Y-10.821 I-0.362 J-0.097 E0.0152 F1800
-G1 X37.470 Y-11.468 E0.0915 F1800
-G2 X37.011 Y-11.203 I-0.097 J0.362 E0.0152 F1800
-G1 X35.458 Y-5.407 E0.2195 F1800
-G3 X34.733 Y-5.601 I-0.362 J-0.097 E0.0431 F1800
-G1 X36.286 Y-11.397 E0.2195 F1800
-G2 X36.021 Y-11.856 I-0.362 J-0.097 E0.0152 F1800
-G1 X33.606 Y-12.503 E0.0915 F1800
-G2 X33.147 Y-12.238 I-0.097 J0.362 E0.0152 F1800
-G1 X31.594 Y-6.442 E0.2195 F1800
-G3 X30.870 Y-6.637 I-0.362 J-0.097 E0.0431 F1800
-G1 X32.422 Y-12.432 E0.2195 F1800
-G2 X32.157 Y-12.891 I-0.362 J-0.097 E0.0152 F1800
-G1 X29.742 Y-13.538 E0.0915 F1800
-G2 X29.283 Y-13.273 I-0.097 J0.362 E0.0152 F1800
-G1 X27.730 Y-7.478 E0.2195 F1800
-G3 X27.006 Y-7.672 I-0.362 J-0.097 E0.0431 F1800
-G1 X28.559 Y-13.467 E0.2195 F1800
-G2 X28.294 Y-13.927 I-0.362 J-0.097 E0.0152 F1800
-G1 X25.879 Y-14.574 E0.0915 F1800
-G2 X25.419 Y-14.309 I-0.097 J0.362 E0.0152 F1800
-G1 X23.867 Y-8.513
+G1 X89.443 Y8.903
+G3 X88.719 Y8.709 I-0.362 J-0.097 E0.0431 F1800
+G1 X90.272 Y2.913 E0.2195 F1800
+G2 X90.007 Y2.454 I-0.362 J-0.097 E0.0152 F1800
+G1 X87.592 Y1.807 E0.0915 F1800
+G2 X87.133 Y2.072 I-0.097 J0.362 E0.0152 F1800
+G1 X85.580 Y7.868 E0.2195 F1800
+G3 X84.855 Y7.674 I-0.362 J-0.097 E0.0431 F1800
+G1 X86.408 Y1.878 E0.2195 F1800
+G2 X86.143 Y1.419 I-0.362 J-0.097 E0.0152 F1800
+G1 X83.728 Y0.772 E0.0915 F1800
+G2 X83.269 Y1.037 I-0.097 J0.362 E0.0152 F1800
+G1 X81.716 Y6.832 E0.2195 F1800
+G3 X80.992 Y6.638 I-0.362 J-0.097 E0.0431 F1800
+G1 X82.545 Y0.843 E0.2195 F1800
+G2 X82.279 Y0.384 I-0.362 J-0.097 E0.0152 F1800
+G1 X79.865 Y-0.264 E0.0915 F1800
+G2 X79.405 Y0.002 I-0.097 J0.362 E0.0152 F1800
+G1 X77.852 Y5.797 E0.2195 F1800
+G3 X77.128 Y5.603 I-0.362 J-0.097 E0.0431 F1800
+G1 X78.681 Y-0.192 E0.2195 F1800
+G2 X78.416 Y-0.652 I-0.362 J-0.097 E0.0152 F1800
+G1 X76.001 Y-1.299 E0.0915 F1800
+G2 X75.542 Y-1.034 I-0.097 J0.362 E0.0152 F1800
+G1 X73.989 Y4.762 E0.2195 F1800
+G3 X73.264 Y4.568 I-0.362 J-0.097 E0.0431 F1800
+G1 X74.817 Y-1.228 E0.2195 F1800
+G2 X74.552 Y-1.687 I-0.362 J-0.097 E0.0152 F1800
+G1 X72.137 Y-2.334 E0.0915 F1800
+G2 X71.678 Y-2.069 I-0.097 J0.362 E0.0152 F1800
+G1 X70.125 Y3.727 E0.2195 F1800
+G3 X69.400 Y3.533 I-0.362 J-0.097 E0.0431 F1800
+G1 X70.953 Y-2.263 E0.2195 F1800
+G2 X70.688 Y-2.722 I-0.362 J-0.097 E0.0152 F1800
+G1 X68.273 Y-3.369 E0.0915 F1800
+G2 X67.814 Y-3.104 I-0.097 J0.362 E0.0152 F1800
+G1 X66.261 Y2.691 E0.2195 F1800
+G3 X65.537 Y2.497 I-0.362 J-0.097 E0.0431 F1800
+G1 X67.090 Y-3.298 E0.2195 F1800
+G2 X66.825 Y-3.758 I-0.362 J-0.097 E0.0152 F1800
+G1 X64.410 Y-4.405 E0.0915 F1800
+G2 X63.950 Y-4.139 I-0.097 J0.362 E0.0152 F1800
+G1 X62.398 Y1.656 E0.2195 F1800
+G3 X61.673 Y1.462 I-0.362 J-0.097 E0.0431 F1800
+G1 X63.226 Y-4.334 E0.2195 F1800
+G2 X62.961 Y-4.793 I-0.362 J-0.097 E0.0152 F1800
+G1 X60.546 Y-5.440 E0.0915 F1800
+G2 X60.087 Y-5.175 I-0.097 J0.362 E0.0152 F1800
+G1 X58.534 Y0.621 E0.2195 F1800
+G3 X57.809 Y0.427 I-0.362 J-0.097 E0.0431 F1800
+G1 X59.362 Y-5.369 E0.2195 F1800
+G2 X59.097 Y-5.828 I-0.362 J-0.097 E0.0152 F1800
+G1 X56.682 Y-6.475 E0.0915 F1800
+G2 X56.223 Y-6.210 I-0.097 J0.362 E0.0152 F1800
+G1 X54.670 Y-0.414 E0.2195 F1800
+G3 X53.946 Y-0.609 I-0.362 J-0.097 E0.0431 F1800
+G1 X55.499 Y-6.404 E0.2195 F1800
+G2 X55.233 Y-6.863 I-0.362 J-0.097 E0.0152 F1800
+G1 X52.819 Y-7.510 E0.0915 F1800
+G2 X52.359 Y-7.245 I-0.097 J0.362 E0.0152 F1800
+G1 X50.806 Y-1.450 E0.2195 F1800
+G3 X50.082 Y-1.644 I-0.362 J-0.097 E0.0431 F1800
+G1 X51.635 Y-7.439 E0.2195 F1800
+G2 X51.370 Y-7.899 I-0.362 J-0.097 E0.0152 F1800
+G1 X48.955 Y-8.546 E0.0915 F1800
+G2 X48.496 Y-8.281 I-0.097 J0.362 E0.0152 F1800
+G1 X46.943 Y-2.485 E0.2195 F1800
+G3 X46.218 Y-2.679 I-0.362 J-0.097 E0.0431 F1800
+G1 X47.771 Y-8.475 E0.2195 F1800
+G2 X47.506 Y-8.934 I-0.362 J-0.097 E0.0152 F1800
+G1 X45.091 Y-9.581 E0.0915 F1800
+G2 X44.632 Y-9.316 I-0.097 J0.362 E0.0152 F1800
+G1 X43.079 Y-3.520 E0.2195 F1800
+G3 X42.355 Y-3.714 I-0.362 J-0.097 E0.0431 F1800
+G1 X43.907 Y-9.510 E0.2195 F1800
+G2 X43.642 Y-9.969 I-0.362 J-0.097 E0.0152 F1800
+G1 X41.227 Y-10.616 E0.0915 F1800
+G2 X40.768 Y-10.351 I-0.097 J0.362 E0.0152 F1800
+G1 X39.215 Y-4.556 E0.2195 F1800
+G3 X38.491 Y-4.750 I-0.362 J-0.097 E0.0431 F1800
+G1 X40.044 Y-10.545 E0.2195 F1800
+G2 X39.779 Y-11.005 I-0.362 J-0.097 E0.0152 F1800
+G1 X37.364 Y-11.652 E0.0915 F1800
+G2 X36.905 Y-11.386 I-0.097 J0.362 E0.0152 F1800
+G1 X35.352 Y-5.591 E0.2195 F1800
+G3 X34.627 Y-5.785 I-0.362 J-0.097 E0.0431 F1800
+G1 X36.180 Y-11.581 E0.2195 F1800
+G2 X35.915 Y-12.040 I-0.362 J-0.097 E0.0152 F1800
+G1 X33.500 Y-12.687 E0.0915 F1800
+G2 X33.041 Y-12.422 I-0.097 J0.362 E0.0152 F1800
+G1 X31.488 Y-6.626 E0.2195 F1800
+G3 X30.763 Y-6.820 I-0.362 J-0.097 E0.0431 F1800
+G1 X32.316 Y-12.616 E0.2195 F1800
+G2 X32.051 Y-13.075 I-0.362 J-0.097 E0.0152 F1800
+G1 X29.636 Y-13.722 E0.0915 F1800
+G2 X29.177 Y-13.457 I-0.097 J0.362 E0.0152 F1800
+G1 X27.624 Y-7.661 E0.2195 F1800
+G3 X26.900 Y-7.856 I-0.362 J-0.097 E0.0431 F1800
+G1 X28.453 Y-13.651 E0.2195 F1800
+G2 X28.187 Y-14.110 I-0.362 J-0.097 E0.0152 F1800
+G1 X25.773 Y-14.757 E0.0915 F1800
+G2 X25.313 Y-14.492 I-0.097 J0.362 E0.0152 F1800
+G1 X23.760 Y-8.697
 G1 Z0.850 E-5.0000 F4800
 ;print vertical interlocked signal pattern 2
-G1 X-35.303 Y-45.591 F1800
+G1 X-35.339 Y-45.652 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-29.508 Y-44.038
-G3 X-29.702 Y-43.313 I-0.097 J0.362 E0.0431 F1800
-G1 X-35.497 Y-44.866 E0.2195 F1800
-G2 X-35.957 Y-44.601 I-0.097 J0.362 E0.0152 F1800
-G1 X-36.604 Y-42.186 E0.0915 F1800
-G2 X-36.338 Y-41.727 I0.362 J0.097 E0.0152 F1800
-G1 X-30.543 Y-40.174 E0.2195 F1800
-G3 X-30.737 Y-39.450 I-0.097 J0.362 E0.0431 F1800
-G1 X-36.533 Y-41.002 E0.2195 F1800
-G2 X-36.992 Y-40.737 I-0.097 J0.362 E0.0152 F1800
-G1 X-37.639 Y-38.322 E0.0915 F1800
-G2 X-37.374 Y-37.863 I0.362 J0.097 E0.0152 F1800
-G1 X-31.578 Y-36.310 E0.2195 F1800
-G3 X-31.772 Y-35.586 I-0.097 J0.362 E0.0431 F1800
-G1 X-37.568 Y-37.139 E0.2195 F1800
-G2 X-38.027 Y-36.874 I-0.097 J0.362 E0.0152 F1800
-G1 X-38.674 Y-34.459 E0.0915 F1800
-G2 X-38.409 Y-33.999 I0.362 J0.097 E0.0152 F1800
-G1 X-32.613 Y-32.447 E0.2195 F1800
-G3 X-32.808 Y-31.722 I-0.097 J0.362 E0.0431 F1800
-G1 X-38.603 Y-33.275 E0.2195 F1800
-G2 X-39.062 Y-33.010 I-0.097 J0.362 E0.0152 F1800
-G1 X-39.709 Y-30.595 E0.0915 F1800
-G2 X-39.444 Y-30.136 I0.362 J0.097 E0.0152 F1800
-G1 X-33.649 Y-28.583 E0.2195 F1800
-G3 X-33.843 Y-27.858 I-0.097 J0.362 E0.0431 F1800
-G1 X-39.638 Y-29.411 E0.2195 F1800
-G2 X-40.098 Y-29.146 I-0.097 J0.362 E0.0152 F1800
-G1 X-40.745 Y-26.731 E0.0915 F1800
-G2 X-40.480 Y-26.272 I0.362 J0.097 E0.0152 F1800
-G1 X-34.684 Y-24.719 E0.2195 F1800
-G3 X-34.878 Y-23.995 I-0.097 J0.362 E0.0431 F1800
-G1 X-40.674 Y-25.548 E0.2195 F1800
-G2 X-41.133 Y-25.282 I-0.097 J0.362 E0.0152 F1800
-G1 X-41.780 Y-22.868 E0.0915 F1800
-G2 X-41.515 Y-22.408 I0.362 J0.097 E0.0152 F1800
-G1 X-35.719 Y-20.855 E0.2195 F1800
-G3 X-35.913 Y-20.131 I-0.097 J0.362 E0.0431 F1800
-G1 X-41.709 Y-21.684 E0.2195 F1800
-G2 X-42.168 Y-21.419 I-0.097 J0.362 E0.0152 F1800
-G1 X-42.815 Y-19.004 E0.0915 F1800
-G2 X-42.550 Y-18.545 I0.362 J0.097 E0.0152 F1800
-G1 X-36.755 Y-16.992 E0.2195 F1800
-G3 X-36.949 Y-16.267 I-0.097 J0.362 E0.0431 F1800
-G1 X-42.744 Y-17.820 E0.2195 F1800
-G2 X-43.204 Y-17.555 I-0.097 J0.362 E0.0152 F1800
-G1 X-43.851 Y-15.140 E0.0915 F1800
-G2 X-43.585 Y-14.681 I0.362 J0.097 E0.0152 F1800
-G1 X-37.790 Y-13.128 E0.2195 F1800
-G3 X-37.984 Y-12.404 I-0.097 J0.362 E0.0431 F1800
-G1 X-43.780 Y-13.957 E0.2195 F1800
-G2 X-44.239 Y-13.691 I-0.097 J0.362 E0.0152 F1800
-G1 X-44.886 Y-11.277 E0.0915 F1800
-G2 X-44.621 Y-10.817 I0.362 J0.097 E0.0152 F1800
-G1 X-38.825 Y-9.264 E0.2195 F1800
-G3 X-39.019 Y-8.540 I-0.097 J0.362 E0.0431 F1800
-G1 X-44.815 Y-10.093 E0.2195 F1800
-G2 X-45.274 Y-9.828 I-0.097 J0.362 E0.0152 F1800
-G1 X-45.921 Y-7.413 E0.0915 F1800
-G2 X-45.656 Y-6.954 I0.362 J0.097 E0.0152 F1800
-G1 X-39.860 Y-5.401 E0.2195 F1800
-G3 X-40.055 Y-4.676 I-0.097 J0.362 E0.0431 F1800
-G1 X-45.850 Y-6.229 E0.2195 F1800
-G2 X-46.309 Y-5.964 I-0.097 J0.362 E0.0152 F1800
-G1 X-46.956 Y-3.549 E0.0915 F1800
-G2 X-46.691 Y-3.090 I0.362 J0.097 E0.0152 F1800
-G1 X-40.896 Y-1.537 E0.2195 F1800
-G3 X-41.090 Y-0.813 I-0.097 J0.362 E0.0431 F1800
-G1 X-46.885 Y-2.365 E0.2195 F1800
-G2 X-47.345 Y-2.100 I-0.097 J0.362 E0.0152 F1800
-G1 X-47.992 Y0.315 E0.0915 F1800
-G2 X-47.727 Y0.774 I0.362 J0.097 E0.0152 F1800
-G1 X-41.931 Y2.327 E0.2195 F1800
-G3 X-42.125 Y3.051 I-0.097 J0.362 E0.0431 F1800
-G1 X-47.921 Y1.498 E0.2195 F1800
-G2 X-48.380 Y1.763 I-0.097 J0.362 E0.0152 F1800
-G1 X-49.027 Y4.178 E0.0915 F1800
-G2 X-48.762 Y4.638 I0.362 J0.097 E0.0152 F1800
-G1 X-42.966 Y6.190 E0.2195 F1800
-G3 X-43.160 Y6.915 I-0.097 J0.362 E0.0431 F1800
-G1 X-48.956 Y5.362 E0.2195 F1800
-G2 X-49.415 Y5.627 I-0.097 J0.362 E0.0152 F1800
-G1 X-50.062 Y8.042 E0.0915 F1800
-G2 X-49.797 Y8.501 I0.362 J0.097 E0.0152 F1800
-G1 X-44.002 Y10.054 E0.2195 F1800
-G3 X-44.196 Y10.779 I-0.097 J0.362 E0.0431 F1800
-G1 X-49.991 Y9.226 E0.2195 F1800
-G2 X-50.450 Y9.491 I-0.097 J0.362 E0.0152 F1800
-G1 X-51.098 Y11.906 E0.0915 F1800
-G2 X-50.832 Y12.365 I0.362 J0.097 E0.0152 F1800
-G1 X-45.037 Y13.918 E0.2195 F1800
-G3 X-45.231 Y14.642 I-0.097 J0.362 E0.0431 F1800
-G1 X-51.026 Y13.089 E0.2195 F1800
-G2 X-51.486 Y13.355 I-0.097 J0.362 E0.0152 F1800
-G1 X-52.133 Y15.769 E0.0915 F1800
-G2 X-51.868 Y16.229 I0.362 J0.097 E0.0152 F1800
-G1 X-46.072 Y17.782 E0.2195 F1800
-G3 X-46.266 Y18.506 I-0.097 J0.362 E0.0431 F1800
-G1 X-52.062 Y16.953 E0.2195 F1800
-G2 X-52.521 Y17.218 I-0.097 J0.362 E0.0152 F1800
-G1 X-53.168 Y19.633 E0.0915 F1800
-G2 X-52.903 Y20.092 I0.362 J0.097 E0.0152 F1800
-G1 X-47.107 Y21.645
+G1 X-29.543 Y-44.099
+G3 X-29.737 Y-43.374 I-0.097 J0.362 E0.0431 F1800
+G1 X-35.533 Y-44.927 E0.2195 F1800
+G2 X-35.992 Y-44.662 I-0.097 J0.362 E0.0152 F1800
+G1 X-36.639 Y-42.247 E0.0915 F1800
+G2 X-36.374 Y-41.788 I0.362 J0.097 E0.0152 F1800
+G1 X-30.578 Y-40.235 E0.2195 F1800
+G3 X-30.772 Y-39.511 I-0.097 J0.362 E0.0431 F1800
+G1 X-36.568 Y-41.064 E0.2195 F1800
+G2 X-37.027 Y-40.799 I-0.097 J0.362 E0.0152 F1800
+G1 X-37.674 Y-38.384 E0.0915 F1800
+G2 X-37.409 Y-37.924 I0.362 J0.097 E0.0152 F1800
+G1 X-31.614 Y-36.372 E0.2195 F1800
+G3 X-31.808 Y-35.647 I-0.097 J0.362 E0.0431 F1800
+G1 X-37.603 Y-37.200 E0.2195 F1800
+G2 X-38.063 Y-36.935 I-0.097 J0.362 E0.0152 F1800
+G1 X-38.710 Y-34.520 E0.0915 F1800
+G2 X-38.444 Y-34.061 I0.362 J0.097 E0.0152 F1800
+G1 X-32.649 Y-32.508 E0.2195 F1800
+G3 X-32.843 Y-31.783 I-0.097 J0.362 E0.0431 F1800
+G1 X-38.639 Y-33.336 E0.2195 F1800
+G2 X-39.098 Y-33.071 I-0.097 J0.362 E0.0152 F1800
+G1 X-39.745 Y-30.656 E0.0915 F1800
+G2 X-39.480 Y-30.197 I0.362 J0.097 E0.0152 F1800
+G1 X-33.684 Y-28.644 E0.2195 F1800
+G3 X-33.878 Y-27.920 I-0.097 J0.362 E0.0431 F1800
+G1 X-39.674 Y-29.473 E0.2195 F1800
+G2 X-40.133 Y-29.207 I-0.097 J0.362 E0.0152 F1800
+G1 X-40.780 Y-26.793 E0.0915 F1800
+G2 X-40.515 Y-26.333 I0.362 J0.097 E0.0152 F1800
+G1 X-34.719 Y-24.780 E0.2195 F1800
+G3 X-34.914 Y-24.056 I-0.097 J0.362 E0.0431 F1800
+G1 X-40.709 Y-25.609 E0.2195 F1800
+G2 X-41.168 Y-25.344 I-0.097 J0.362 E0.0152 F1800
+G1 X-41.815 Y-22.929 E0.0915 F1800
+G2 X-41.550 Y-22.470 I0.362 J0.097 E0.0152 F1800
+G1 X-35.755 Y-20.917 E0.2195 F1800
+G3 X-35.949 Y-20.192 I-0.097 J0.362 E0.0431 F1800
+G1 X-41.744 Y-21.745 E0.2195 F1800
+G2 X-42.204 Y-21.480 I-0.097 J0.362 E0.0152 F1800
+G1 X-42.851 Y-19.065 E0.0915 F1800
+G2 X-42.585 Y-18.606 I0.362 J0.097 E0.0152 F1800
+G1 X-36.790 Y-17.053 E0.2195 F1800
+G3 X-36.984 Y-16.329 I-0.097 J0.362 E0.0431 F1800
+G1 X-42.780 Y-17.881 E0.2195 F1800
+G2 X-43.239 Y-17.616 I-0.097 J0.362 E0.0152 F1800
+G1 X-43.886 Y-15.201 E0.0915 F1800
+G2 X-43.621 Y-14.742 I0.362 J0.097 E0.0152 F1800
+G1 X-37.825 Y-13.189 E0.2195 F1800
+G3 X-38.019 Y-12.465 I-0.097 J0.362 E0.0431 F1800
+G1 X-43.815 Y-14.018 E0.2195 F1800
+G2 X-44.274 Y-13.753 I-0.097 J0.362 E0.0152 F1800
+G1 X-44.921 Y-11.338 E0.0915 F1800
+G2 X-44.656 Y-10.879 I0.362 J0.097 E0.0152 F1800
+G1 X-38.860 Y-9.326 E0.2195 F1800
+G3 X-39.055 Y-8.601 I-0.097 J0.362 E0.0431 F1800
+G1 X-44.850 Y-10.154 E0.2195 F1800
+G2 X-45.309 Y-9.889 I-0.097 J0.362 E0.0152 F1800
+G1 X-45.956 Y-7.474 E0.0915 F1800
+G2 X-45.691 Y-7.015 I0.362 J0.097 E0.0152 F1800
+G1 X-39.896 Y-5.462 E0.2195 F1800
+G3 X-40.090 Y-4.737 I-0.097 J0.362 E0.0431 F1800
+G1 X-45.885 Y-6.290 E0.2195 F1800
+G2 X-46.345 Y-6.025 I-0.097 J0.362 E0.0152 F1800
+G1 X-46.992 Y-3.610 E0.0915 F1800
+G2 X-46.727 Y-3.151 I0.362 J0.097 E0.0152 F1800
+G1 X-40.931 Y-1.598 E0.2195 F1800
+G3 X-41.125 Y-0.874 I-0.097 J0.362 E0.0431 F1800
+G1 X-46.921 Y-2.427 E0.2195 F1800
+G2 X-47.380 Y-2.161 I-0.097 J0.362 E0.0152 F1800
+G1 X-48.027 Y0.253 E0.0915 F1800
+G2 X-47.762 Y0.713 I0.362 J0.097 E0.0152 F1800
+G1 X-41.966 Y2.266 E0.2195 F1800
+G3 X-42.160 Y2.990 I-0.097 J0.362 E0.0431 F1800
+G1 X-47.956 Y1.437 E0.2195 F1800
+G2 X-48.415 Y1.702 I-0.097 J0.362 E0.0152 F1800
+G1 X-49.062 Y4.117 E0.0915 F1800
+G2 X-48.797 Y4.576 I0.362 J0.097 E0.0152 F1800
+G1 X-43.002 Y6.129 E0.2195 F1800
+G3 X-43.196 Y6.854 I-0.097 J0.362 E0.0431 F1800
+G1 X-48.991 Y5.301 E0.2195 F1800
+G2 X-49.451 Y5.566 I-0.097 J0.362 E0.0152 F1800
+G1 X-50.098 Y7.981 E0.0915 F1800
+G2 X-49.832 Y8.440 I0.362 J0.097 E0.0152 F1800
+G1 X-44.037 Y9.993 E0.2195 F1800
+G3 X-44.231 Y10.717 I-0.097 J0.362 E0.0431 F1800
+G1 X-50.027 Y9.164 E0.2195 F1800
+G2 X-50.486 Y9.430 I-0.097 J0.362 E0.0152 F1800
+G1 X-51.133 Y11.844 E0.0915 F1800
+G2 X-50.868 Y12.304 I0.362 J0.097 E0.0152 F1800
+G1 X-45.072 Y13.857 E0.2195 F1800
+G3 X-45.266 Y14.581 I-0.097 J0.362 E0.0431 F1800
+G1 X-51.062 Y13.028 E0.2195 F1800
+G2 X-51.521 Y13.293 I-0.097 J0.362 E0.0152 F1800
+G1 X-52.168 Y15.708 E0.0915 F1800
+G2 X-51.903 Y16.167 I0.362 J0.097 E0.0152 F1800
+G1 X-46.107 Y17.720 E0.2195 F1800
+G3 X-46.302 Y18.445 I-0.097 J0.362 E0.0431 F1800
+G1 X-52.097 Y16.892 E0.2195 F1800
+G2 X-52.556 Y17.157 I-0.097 J0.362 E0.0152 F1800
+G1 X-53.203 Y19.572 E0.0915 F1800
+G2 X-52.938 Y20.031 I0.362 J0.097 E0.0152 F1800
+G1 X-47.143 Y21.584
 G1 Z0.850 E-5.0000 F4800
-G1 X-42.472 Y23.664 F1800
+G1 X-42.507 Y23.603 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-36.676 Y25.217
-G2 X-36.482 Y24.492 I0.097 J-0.362 E0.0431 F1800
-G1 X-42.278 Y22.939 E0.2195 F1800
-G3 X-42.543 Y22.480 I0.097 J-0.362 E0.0152 F1800
-G1 X-41.896 Y20.065 E0.0915 F1800
-G3 X-41.437 Y19.800 I0.362 J0.097 E0.0152 F1800
-G1 X-35.641 Y21.353 E0.2195 F1800
-G2 X-35.447 Y20.629 I0.097 J-0.362 E0.0431 F1800
-G1 X-41.242 Y19.076 E0.2195 F1800
-G3 X-41.508 Y18.616 I0.097 J-0.362 E0.0152 F1800
-G1 X-40.861 Y16.202 E0.0915 F1800
-G3 X-40.401 Y15.936 I0.362 J0.097 E0.0152 F1800
-G1 X-34.606 Y17.489 E0.2195 F1800
-G2 X-34.412 Y16.765 I0.097 J-0.362 E0.0431 F1800
-G1 X-40.207 Y15.212 E0.2195 F1800
-G3 X-40.472 Y14.753 I0.097 J-0.362 E0.0152 F1800
-G1 X-39.825 Y12.338 E0.0915 F1800
-G3 X-39.366 Y12.073 I0.362 J0.097 E0.0152 F1800
-G1 X-33.570 Y13.626 E0.2195 F1800
-G2 X-33.376 Y12.901 I0.097 J-0.362 E0.0431 F1800
-G1 X-39.172 Y11.348 E0.2195 F1800
-G3 X-39.437 Y10.889 I0.097 J-0.362 E0.0152 F1800
-G1 X-38.790 Y8.474 E0.0915 F1800
-G3 X-38.331 Y8.209 I0.362 J0.097 E0.0152 F1800
-G1 X-32.535 Y9.762 E0.2195 F1800
-G2 X-32.341 Y9.037 I0.097 J-0.362 E0.0431 F1800
-G1 X-38.137 Y7.485 E0.2195 F1800
-G3 X-38.402 Y7.025 I0.097 J-0.362 E0.0152 F1800
-G1 X-37.755 Y4.610 E0.0915 F1800
-G3 X-37.295 Y4.345 I0.362 J0.097 E0.0152 F1800
-G1 X-31.500 Y5.898 E0.2195 F1800
-G2 X-31.306 Y5.174 I0.097 J-0.362 E0.0431 F1800
-G1 X-37.101 Y3.621 E0.2195 F1800
-G3 X-37.367 Y3.162 I0.097 J-0.362 E0.0152 F1800
-G1 X-36.719 Y0.747 E0.0915 F1800
-G3 X-36.260 Y0.482 I0.362 J0.097 E0.0152 F1800
-G1 X-30.465 Y2.034 E0.2195 F1800
-G2 X-30.271 Y1.310 I0.097 J-0.362 E0.0431 F1800
-G1 X-36.066 Y-0.243 E0.2195 F1800
-G3 X-36.331 Y-0.702 I0.097 J-0.362 E0.0152 F1800
-G1 X-35.684 Y-3.117 E0.0915 F1800
-G3 X-35.225 Y-3.382 I0.362 J0.097 E0.0152 F1800
-G1 X-29.429 Y-1.829 E0.2195 F1800
-G2 X-29.235 Y-2.554 I0.097 J-0.362 E0.0431 F1800
-G1 X-35.031 Y-4.107 E0.2195 F1800
-G3 X-35.296 Y-4.566 I0.097 J-0.362 E0.0152 F1800
-G1 X-34.649 Y-6.981 E0.0915 F1800
-G3 X-34.190 Y-7.246 I0.362 J0.097 E0.0152 F1800
-G1 X-28.394 Y-5.693 E0.2195 F1800
-G2 X-28.200 Y-6.417 I0.097 J-0.362 E0.0431 F1800
-G1 X-33.996 Y-7.970 E0.2195 F1800
-G3 X-34.261 Y-8.430 I0.097 J-0.362 E0.0152 F1800
-G1 X-33.614 Y-10.844 E0.0915 F1800
-G3 X-33.154 Y-11.110 I0.362 J0.097 E0.0152 F1800
-G1 X-27.359 Y-9.557 E0.2195 F1800
-G2 X-27.165 Y-10.281 I0.097 J-0.362 E0.0431 F1800
-G1 X-32.960 Y-11.834 E0.2195 F1800
-G3 X-33.225 Y-12.293 I0.097 J-0.362 E0.0152 F1800
-G1 X-32.578 Y-14.708 E0.0915 F1800
-G3 X-32.119 Y-14.973 I0.362 J0.097 E0.0152 F1800
-G1 X-26.324 Y-13.420 E0.2195 F1800
-G2 X-26.129 Y-14.145 I0.097 J-0.362 E0.0431 F1800
-G1 X-31.925 Y-15.698 E0.2195 F1800
-G3 X-32.190 Y-16.157 I0.097 J-0.362 E0.0152 F1800
-G1 X-31.543 Y-18.572 E0.0915 F1800
-G3 X-31.084 Y-18.837 I0.362 J0.097 E0.0152 F1800
-G1 X-25.288 Y-17.284 E0.2195 F1800
-G2 X-25.094 Y-18.008 I0.097 J-0.362 E0.0431 F1800
-G1 X-30.890 Y-19.561 E0.2195 F1800
-G3 X-31.155 Y-20.021 I0.097 J-0.362 E0.0152 F1800
-G1 X-30.508 Y-22.435 E0.0915 F1800
-G3 X-30.049 Y-22.701 I0.362 J0.097 E0.0152 F1800
-G1 X-24.253 Y-21.148 E0.2195 F1800
-G2 X-24.059 Y-21.872 I0.097 J-0.362 E0.0431 F1800
-G1 X-29.854 Y-23.425 E0.2195 F1800
-G3 X-30.120 Y-23.884 I0.097 J-0.362 E0.0152 F1800
-G1 X-29.473 Y-26.299 E0.0915 F1800
-G3 X-29.013 Y-26.564 I0.362 J0.097 E0.0152 F1800
-G1 X-23.218 Y-25.011 E0.2195 F1800
-G2 X-23.024 Y-25.736 I0.097 J-0.362 E0.0431 F1800
-G1 X-28.819 Y-27.289 E0.2195 F1800
-G3 X-29.084 Y-27.748 I0.097 J-0.362 E0.0152 F1800
-G1 X-28.437 Y-30.163 E0.0915 F1800
-G3 X-27.978 Y-30.428 I0.362 J0.097 E0.0152 F1800
-G1 X-22.182 Y-28.875 E0.2195 F1800
-G2 X-21.988 Y-29.600 I0.097 J-0.362 E0.0431 F1800
-G1 X-27.784 Y-31.152 E0.2195 F1800
-G3 X-28.049 Y-31.612 I0.097 J-0.362 E0.0152 F1800
-G1 X-27.402 Y-34.027 E0.0915 F1800
-G3 X-26.943 Y-34.292 I0.362 J0.097 E0.0152 F1800
-G1 X-21.147 Y-32.739 E0.2195 F1800
-G2 X-20.953 Y-33.463 I0.097 J-0.362 E0.0431 F1800
-G1 X-26.749 Y-35.016 E0.2195 F1800
-G3 X-27.014 Y-35.475 I0.097 J-0.362 E0.0152 F1800
-G1 X-26.367 Y-37.890 E0.0915 F1800
-G3 X-25.907 Y-38.155 I0.362 J0.097 E0.0152 F1800
-G1 X-20.112 Y-36.603 E0.2195 F1800
-G2 X-19.918 Y-37.327 I0.097 J-0.362 E0.0431 F1800
-G1 X-25.713 Y-38.880 E0.2195 F1800
-G3 X-25.978 Y-39.339 I0.097 J-0.362 E0.0152 F1800
-G1 X-25.331 Y-41.754 E0.0915 F1800
-G3 X-24.872 Y-42.019 I0.362 J0.097 E0.0152 F1800
-G1 X-19.077 Y-40.466
+G1 X-36.712 Y25.155
+G2 X-36.518 Y24.431 I0.097 J-0.362 E0.0431 F1800
+G1 X-42.313 Y22.878 E0.2195 F1800
+G3 X-42.578 Y22.419 I0.097 J-0.362 E0.0152 F1800
+G1 X-41.931 Y20.004 E0.0915 F1800
+G3 X-41.472 Y19.739 I0.362 J0.097 E0.0152 F1800
+G1 X-35.676 Y21.292 E0.2195 F1800
+G2 X-35.482 Y20.567 I0.097 J-0.362 E0.0431 F1800
+G1 X-41.278 Y19.014 E0.2195 F1800
+G3 X-41.543 Y18.555 I0.097 J-0.362 E0.0152 F1800
+G1 X-40.896 Y16.140 E0.0915 F1800
+G3 X-40.437 Y15.875 I0.362 J0.097 E0.0152 F1800
+G1 X-34.641 Y17.428 E0.2195 F1800
+G2 X-34.447 Y16.704 I0.097 J-0.362 E0.0431 F1800
+G1 X-40.243 Y15.151 E0.2195 F1800
+G3 X-40.508 Y14.691 I0.097 J-0.362 E0.0152 F1800
+G1 X-39.861 Y12.277 E0.0915 F1800
+G3 X-39.401 Y12.011 I0.362 J0.097 E0.0152 F1800
+G1 X-33.606 Y13.564 E0.2195 F1800
+G2 X-33.412 Y12.840 I0.097 J-0.362 E0.0431 F1800
+G1 X-39.207 Y11.287 E0.2195 F1800
+G3 X-39.472 Y10.828 I0.097 J-0.362 E0.0152 F1800
+G1 X-38.825 Y8.413 E0.0915 F1800
+G3 X-38.366 Y8.148 I0.362 J0.097 E0.0152 F1800
+G1 X-32.571 Y9.701 E0.2195 F1800
+G2 X-32.376 Y8.976 I0.097 J-0.362 E0.0431 F1800
+G1 X-38.172 Y7.423 E0.2195 F1800
+G3 X-38.437 Y6.964 I0.097 J-0.362 E0.0152 F1800
+G1 X-37.790 Y4.549 E0.0915 F1800
+G3 X-37.331 Y4.284 I0.362 J0.097 E0.0152 F1800
+G1 X-31.535 Y5.837 E0.2195 F1800
+G2 X-31.341 Y5.113 I0.097 J-0.362 E0.0431 F1800
+G1 X-37.137 Y3.560 E0.2195 F1800
+G3 X-37.402 Y3.100 I0.097 J-0.362 E0.0152 F1800
+G1 X-36.755 Y0.686 E0.0915 F1800
+G3 X-36.296 Y0.420 I0.362 J0.097 E0.0152 F1800
+G1 X-30.500 Y1.973 E0.2195 F1800
+G2 X-30.306 Y1.249 I0.097 J-0.362 E0.0431 F1800
+G1 X-36.101 Y-0.304 E0.2195 F1800
+G3 X-36.367 Y-0.763 I0.097 J-0.362 E0.0152 F1800
+G1 X-35.720 Y-3.178 E0.0915 F1800
+G3 X-35.260 Y-3.443 I0.362 J0.097 E0.0152 F1800
+G1 X-29.465 Y-1.890 E0.2195 F1800
+G2 X-29.271 Y-2.615 I0.097 J-0.362 E0.0431 F1800
+G1 X-35.066 Y-4.168 E0.2195 F1800
+G3 X-35.331 Y-4.627 I0.097 J-0.362 E0.0152 F1800
+G1 X-34.684 Y-7.042 E0.0915 F1800
+G3 X-34.225 Y-7.307 I0.362 J0.097 E0.0152 F1800
+G1 X-28.429 Y-5.754 E0.2195 F1800
+G2 X-28.235 Y-6.479 I0.097 J-0.362 E0.0431 F1800
+G1 X-34.031 Y-8.032 E0.2195 F1800
+G3 X-34.296 Y-8.491 I0.097 J-0.362 E0.0152 F1800
+G1 X-33.649 Y-10.906 E0.0915 F1800
+G3 X-33.190 Y-11.171 I0.362 J0.097 E0.0152 F1800
+G1 X-27.394 Y-9.618 E0.2195 F1800
+G2 X-27.200 Y-10.342 I0.097 J-0.362 E0.0431 F1800
+G1 X-32.996 Y-11.895 E0.2195 F1800
+G3 X-33.261 Y-12.354 I0.097 J-0.362 E0.0152 F1800
+G1 X-32.614 Y-14.769 E0.0915 F1800
+G3 X-32.154 Y-15.034 I0.362 J0.097 E0.0152 F1800
+G1 X-26.359 Y-13.482 E0.2195 F1800
+G2 X-26.165 Y-14.206 I0.097 J-0.362 E0.0431 F1800
+G1 X-31.960 Y-15.759 E0.2195 F1800
+G3 X-32.225 Y-16.218 I0.097 J-0.362 E0.0152 F1800
+G1 X-31.578 Y-18.633 E0.0915 F1800
+G3 X-31.119 Y-18.898 I0.362 J0.097 E0.0152 F1800
+G1 X-25.324 Y-17.345 E0.2195 F1800
+G2 X-25.129 Y-18.070 I0.097 J-0.362 E0.0431 F1800
+G1 X-30.925 Y-19.623 E0.2195 F1800
+G3 X-31.190 Y-20.082 I0.097 J-0.362 E0.0152 F1800
+G1 X-30.543 Y-22.497 E0.0915 F1800
+G3 X-30.084 Y-22.762 I0.362 J0.097 E0.0152 F1800
+G1 X-24.288 Y-21.209 E0.2195 F1800
+G2 X-24.094 Y-21.933 I0.097 J-0.362 E0.0431 F1800
+G1 X-29.890 Y-23.486 E0.2195 F1800
+G3 X-30.155 Y-23.946 I0.097 J-0.362 E0.0152 F1800
+G1 X-29.508 Y-26.360 E0.0915 F1800
+G3 X-29.049 Y-26.626 I0.362 J0.097 E0.0152 F1800
+G1 X-23.253 Y-25.073 E0.2195 F1800
+G2 X-23.059 Y-25.797 I0.097 J-0.362 E0.0431 F1800
+G1 X-28.854 Y-27.350 E0.2195 F1800
+G3 X-29.120 Y-27.809 I0.097 J-0.362 E0.0152 F1800
+G1 X-28.473 Y-30.224 E0.0915 F1800
+G3 X-28.013 Y-30.489 I0.362 J0.097 E0.0152 F1800
+G1 X-22.218 Y-28.936 E0.2195 F1800
+G2 X-22.024 Y-29.661 I0.097 J-0.362 E0.0431 F1800
+G1 X-27.819 Y-31.214 E0.2195 F1800
+G3 X-28.084 Y-31.673 I0.097 J-0.362 E0.0152 F1800
+G1 X-27.437 Y-34.088 E0.0915 F1800
+G3 X-26.978 Y-34.353 I0.362 J0.097 E0.0152 F1800
+G1 X-21.182 Y-32.800 E0.2195 F1800
+G2 X-20.988 Y-33.525 I0.097 J-0.362 E0.0431 F1800
+G1 X-26.784 Y-35.077 E0.2195 F1800
+G3 X-27.049 Y-35.537 I0.097 J-0.362 E0.0152 F1800
+G1 X-26.402 Y-37.952 E0.0915 F1800
+G3 X-25.943 Y-38.217 I0.362 J0.097 E0.0152 F1800
+G1 X-20.147 Y-36.664 E0.2195 F1800
+G2 X-19.953 Y-37.388 I0.097 J-0.362 E0.0431 F1800
+G1 X-25.749 Y-38.941 E0.2195 F1800
+G3 X-26.014 Y-39.400 I0.097 J-0.362 E0.0152 F1800
+G1 X-25.367 Y-41.815 E0.0915 F1800
+G3 X-24.907 Y-42.080 I0.362 J0.097 E0.0152 F1800
+G1 X-19.112 Y-40.527
 G1 Z0.850 E-5.0000 F4800
 ;print horizontal interlocked signal pattern 2
-G1 X21.848 Y-3.877 F1800
+G1 X21.813 Y-3.939 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X20.295 Y1.918
-G2 X21.020 Y2.112 I0.362 J0.097 E0.0431 F1800
-G1 X22.572 Y-3.683 E0.2195 F1800
-G3 X23.032 Y-3.948 I0.362 J0.097 E0.0152 F1800
-G1 X25.447 Y-3.301 E0.0915 F1800
-G3 X25.712 Y-2.842 I-0.097 J0.362 E0.0152 F1800
-G1 X24.159 Y2.953 E0.2195 F1800
-G2 X24.883 Y3.148 I0.362 J0.097 E0.0431 F1800
-G1 X26.436 Y-2.648 E0.2195 F1800
-G3 X26.895 Y-2.913 I0.362 J0.097 E0.0152 F1800
-G1 X29.310 Y-2.266 E0.0915 F1800
-G3 X29.575 Y-1.807 I-0.097 J0.362 E0.0152 F1800
-G1 X28.023 Y3.989 E0.2195 F1800
-G2 X28.747 Y4.183 I0.362 J0.097 E0.0431 F1800
-G1 X30.300 Y-1.613 E0.2195 F1800
-G3 X30.759 Y-1.878 I0.362 J0.097 E0.0152 F1800
-G1 X33.174 Y-1.231 E0.0915 F1800
-G3 X33.439 Y-0.772 I-0.097 J0.362 E0.0152 F1800
-G1 X31.886 Y5.024 E0.2195 F1800
-G2 X32.611 Y5.218 I0.362 J0.097 E0.0431 F1800
-G1 X34.164 Y-0.577 E0.2195 F1800
-G3 X34.623 Y-0.843 I0.362 J0.097 E0.0152 F1800
-G1 X37.038 Y-0.196 E0.0915 F1800
-G3 X37.303 Y0.264 I-0.097 J0.362 E0.0152 F1800
-G1 X35.750 Y6.059 E0.2195 F1800
-G2 X36.474 Y6.253 I0.362 J0.097 E0.0431 F1800
-G1 X38.027 Y0.458 E0.2195 F1800
-G3 X38.487 Y0.193 I0.362 J0.097 E0.0152 F1800
-G1 X40.901 Y0.840 E0.0915 F1800
-G3 X41.167 Y1.299 I-0.097 J0.362 E0.0152 F1800
-G1 X39.614 Y7.094 E0.2195 F1800
-G2 X40.338 Y7.289 I0.362 J0.097 E0.0431 F1800
-G1 X41.891 Y1.493 E0.2195 F1800
-G3 X42.350 Y1.228 I0.362 J0.097 E0.0152 F1800
-G1 X44.765 Y1.875 E0.0915 F1800
-G3 X45.030 Y2.334 I-0.097 J0.362 E0.0152 F1800
-G1 X43.477 Y8.130 E0.2195 F1800
-G2 X44.202 Y8.324 I0.362 J0.097 E0.0431 F1800
-G1 X45.755 Y2.528 E0.2195 F1800
-G3 X46.214 Y2.263 I0.362 J0.097 E0.0152 F1800
-G1 X48.629 Y2.910 E0.0915 F1800
-G3 X48.894 Y3.369 I-0.097 J0.362 E0.0152 F1800
-G1 X47.341 Y9.165 E0.2195 F1800
-G2 X48.065 Y9.359 I0.362 J0.097 E0.0431 F1800
-G1 X49.618 Y3.564 E0.2195 F1800
-G3 X50.078 Y3.298 I0.362 J0.097 E0.0152 F1800
-G1 X52.492 Y3.945 E0.0915 F1800
-G3 X52.758 Y4.405 I-0.097 J0.362 E0.0152 F1800
-G1 X51.205 Y10.200 E0.2195 F1800
-G2 X51.929 Y10.394 I0.362 J0.097 E0.0431 F1800
-G1 X53.482 Y4.599 E0.2195 F1800
-G3 X53.941 Y4.334 I0.362 J0.097 E0.0152 F1800
-G1 X56.356 Y4.981 E0.0915 F1800
-G3 X56.621 Y5.440 I-0.097 J0.362 E0.0152 F1800
-G1 X55.068 Y11.236 E0.2195 F1800
-G2 X55.793 Y11.430 I0.362 J0.097 E0.0431 F1800
-G1 X57.346 Y5.634 E0.2195 F1800
-G3 X57.805 Y5.369 I0.362 J0.097 E0.0152 F1800
-G1 X60.220 Y6.016 E0.0915 F1800
-G3 X60.485 Y6.475 I-0.097 J0.362 E0.0152 F1800
-G1 X58.932 Y12.271 E0.2195 F1800
-G2 X59.657 Y12.465 I0.362 J0.097 E0.0431 F1800
-G1 X61.209 Y6.669 E0.2195 F1800
-G3 X61.669 Y6.404 I0.362 J0.097 E0.0152 F1800
-G1 X64.084 Y7.051 E0.0915 F1800
-G3 X64.349 Y7.511 I-0.097 J0.362 E0.0152 F1800
-G1 X62.796 Y13.306 E0.2195 F1800
-G2 X63.520 Y13.500 I0.362 J0.097 E0.0431 F1800
-G1 X65.073 Y7.705 E0.2195 F1800
-G3 X65.532 Y7.440 I0.362 J0.097 E0.0152 F1800
-G1 X67.947 Y8.087 E0.0915 F1800
-G3 X68.212 Y8.546 I-0.097 J0.362 E0.0152 F1800
-G1 X66.660 Y14.341 E0.2195 F1800
-G2 X67.384 Y14.536 I0.362 J0.097 E0.0431 F1800
-G1 X68.937 Y8.740 E0.2195 F1800
-G3 X69.396 Y8.475 I0.362 J0.097 E0.0152 F1800
-G1 X71.811 Y9.122 E0.0915 F1800
-G3 X72.076 Y9.581 I-0.097 J0.362 E0.0152 F1800
-G1 X70.523 Y15.377 E0.2195 F1800
-G2 X71.248 Y15.571 I0.362 J0.097 E0.0431 F1800
-G1 X72.801 Y9.775 E0.2195 F1800
-G3 X73.260 Y9.510 I0.362 J0.097 E0.0152 F1800
-G1 X75.675 Y10.157 E0.0915 F1800
-G3 X75.940 Y10.616 I-0.097 J0.362 E0.0152 F1800
-G1 X74.387 Y16.412 E0.2195 F1800
-G2 X75.111 Y16.606 I0.362 J0.097 E0.0431 F1800
-G1 X76.664 Y10.811 E0.2195 F1800
-G3 X77.124 Y10.545 I0.362 J0.097 E0.0152 F1800
-G1 X79.538 Y11.192 E0.0915 F1800
-G3 X79.804 Y11.652 I-0.097 J0.362 E0.0152 F1800
-G1 X78.251 Y17.447 E0.2195 F1800
-G2 X78.975 Y17.641 I0.362 J0.097 E0.0431 F1800
-G1 X80.528 Y11.846 E0.2195 F1800
-G3 X80.987 Y11.581 I0.362 J0.097 E0.0152 F1800
-G1 X83.402 Y12.228 E0.0915 F1800
-G3 X83.667 Y12.687 I-0.097 J0.362 E0.0152 F1800
-G1 X82.114 Y18.483 E0.2195 F1800
-G2 X82.839 Y18.677 I0.362 J0.097 E0.0431 F1800
-G1 X84.392 Y12.881 E0.2195 F1800
-G3 X84.851 Y12.616 I0.362 J0.097 E0.0152 F1800
-G1 X87.266 Y13.263 E0.0915 F1800
-G3 X87.531 Y13.722 I-0.097 J0.362 E0.0152 F1800
-G1 X85.978 Y19.518
+G1 X20.260 Y1.857
+G2 X20.984 Y2.051 I0.362 J0.097 E0.0431 F1800
+G1 X22.537 Y-3.745 E0.2195 F1800
+G3 X22.996 Y-4.010 I0.362 J0.097 E0.0152 F1800
+G1 X25.411 Y-3.363 E0.0915 F1800
+G3 X25.676 Y-2.903 I-0.097 J0.362 E0.0152 F1800
+G1 X24.123 Y2.892 E0.2195 F1800
+G2 X24.848 Y3.086 I0.362 J0.097 E0.0431 F1800
+G1 X26.401 Y-2.709 E0.2195 F1800
+G3 X26.860 Y-2.974 I0.362 J0.097 E0.0152 F1800
+G1 X29.275 Y-2.327 E0.0915 F1800
+G3 X29.540 Y-1.868 I-0.097 J0.362 E0.0152 F1800
+G1 X27.987 Y3.927 E0.2195 F1800
+G2 X28.712 Y4.122 I0.362 J0.097 E0.0431 F1800
+G1 X30.265 Y-1.674 E0.2195 F1800
+G3 X30.724 Y-1.939 I0.362 J0.097 E0.0152 F1800
+G1 X33.139 Y-1.292 E0.0915 F1800
+G3 X33.404 Y-0.833 I-0.097 J0.362 E0.0152 F1800
+G1 X31.851 Y4.963 E0.2195 F1800
+G2 X32.575 Y5.157 I0.362 J0.097 E0.0431 F1800
+G1 X34.128 Y-0.639 E0.2195 F1800
+G3 X34.587 Y-0.904 I0.362 J0.097 E0.0152 F1800
+G1 X37.002 Y-0.257 E0.0915 F1800
+G3 X37.267 Y0.202 I-0.097 J0.362 E0.0152 F1800
+G1 X35.715 Y5.998 E0.2195 F1800
+G2 X36.439 Y6.192 I0.362 J0.097 E0.0431 F1800
+G1 X37.992 Y0.397 E0.2195 F1800
+G3 X38.451 Y0.131 I0.362 J0.097 E0.0152 F1800
+G1 X40.866 Y0.778 E0.0915 F1800
+G3 X41.131 Y1.238 I-0.097 J0.362 E0.0152 F1800
+G1 X39.578 Y7.033 E0.2195 F1800
+G2 X40.303 Y7.227 I0.362 J0.097 E0.0431 F1800
+G1 X41.856 Y1.432 E0.2195 F1800
+G3 X42.315 Y1.167 I0.362 J0.097 E0.0152 F1800
+G1 X44.730 Y1.814 E0.0915 F1800
+G3 X44.995 Y2.273 I-0.097 J0.362 E0.0152 F1800
+G1 X43.442 Y8.069 E0.2195 F1800
+G2 X44.166 Y8.263 I0.362 J0.097 E0.0431 F1800
+G1 X45.719 Y2.467 E0.2195 F1800
+G3 X46.179 Y2.202 I0.362 J0.097 E0.0152 F1800
+G1 X48.593 Y2.849 E0.0915 F1800
+G3 X48.859 Y3.308 I-0.097 J0.362 E0.0152 F1800
+G1 X47.306 Y9.104 E0.2195 F1800
+G2 X48.030 Y9.298 I0.362 J0.097 E0.0431 F1800
+G1 X49.583 Y3.502 E0.2195 F1800
+G3 X50.042 Y3.237 I0.362 J0.097 E0.0152 F1800
+G1 X52.457 Y3.884 E0.0915 F1800
+G3 X52.722 Y4.344 I-0.097 J0.362 E0.0152 F1800
+G1 X51.169 Y10.139 E0.2195 F1800
+G2 X51.894 Y10.333 I0.362 J0.097 E0.0431 F1800
+G1 X53.447 Y4.538 E0.2195 F1800
+G3 X53.906 Y4.272 I0.362 J0.097 E0.0152 F1800
+G1 X56.321 Y4.920 E0.0915 F1800
+G3 X56.586 Y5.379 I-0.097 J0.362 E0.0152 F1800
+G1 X55.033 Y11.174 E0.2195 F1800
+G2 X55.758 Y11.368 I0.362 J0.097 E0.0431 F1800
+G1 X57.310 Y5.573 E0.2195 F1800
+G3 X57.770 Y5.308 I0.362 J0.097 E0.0152 F1800
+G1 X60.185 Y5.955 E0.0915 F1800
+G3 X60.450 Y6.414 I-0.097 J0.362 E0.0152 F1800
+G1 X58.897 Y12.210 E0.2195 F1800
+G2 X59.621 Y12.404 I0.362 J0.097 E0.0431 F1800
+G1 X61.174 Y6.608 E0.2195 F1800
+G3 X61.633 Y6.343 I0.362 J0.097 E0.0152 F1800
+G1 X64.048 Y6.990 E0.0915 F1800
+G3 X64.313 Y7.449 I-0.097 J0.362 E0.0152 F1800
+G1 X62.760 Y13.245 E0.2195 F1800
+G2 X63.485 Y13.439 I0.362 J0.097 E0.0431 F1800
+G1 X65.038 Y7.643 E0.2195 F1800
+G3 X65.497 Y7.378 I0.362 J0.097 E0.0152 F1800
+G1 X67.912 Y8.025 E0.0915 F1800
+G3 X68.177 Y8.485 I-0.097 J0.362 E0.0152 F1800
+G1 X66.624 Y14.280 E0.2195 F1800
+G2 X67.349 Y14.474 I0.362 J0.097 E0.0431 F1800
+G1 X68.902 Y8.679 E0.2195 F1800
+G3 X69.361 Y8.414 I0.362 J0.097 E0.0152 F1800
+G1 X71.776 Y9.061 E0.0915 F1800
+G3 X72.041 Y9.520 I-0.097 J0.362 E0.0152 F1800
+G1 X70.488 Y15.315 E0.2195 F1800
+G2 X71.212 Y15.510 I0.362 J0.097 E0.0431 F1800
+G1 X72.765 Y9.714 E0.2195 F1800
+G3 X73.225 Y9.449 I0.362 J0.097 E0.0152 F1800
+G1 X75.639 Y10.096 E0.0915 F1800
+G3 X75.904 Y10.555 I-0.097 J0.362 E0.0152 F1800
+G1 X74.352 Y16.351 E0.2195 F1800
+G2 X75.076 Y16.545 I0.362 J0.097 E0.0431 F1800
+G1 X76.629 Y10.749 E0.2195 F1800
+G3 X77.088 Y10.484 I0.362 J0.097 E0.0152 F1800
+G1 X79.503 Y11.131 E0.0915 F1800
+G3 X79.768 Y11.590 I-0.097 J0.362 E0.0152 F1800
+G1 X78.215 Y17.386 E0.2195 F1800
+G2 X78.940 Y17.580 I0.362 J0.097 E0.0431 F1800
+G1 X80.493 Y11.785 E0.2195 F1800
+G3 X80.952 Y11.519 I0.362 J0.097 E0.0152 F1800
+G1 X83.367 Y12.166 E0.0915 F1800
+G3 X83.632 Y12.626 I-0.097 J0.362 E0.0152 F1800
+G1 X82.079 Y18.421 E0.2195 F1800
+G2 X82.803 Y18.615 I0.362 J0.097 E0.0431 F1800
+G1 X84.356 Y12.820 E0.2195 F1800
+G3 X84.816 Y12.555 I0.362 J0.097 E0.0152 F1800
+G1 X87.230 Y13.202 E0.0915 F1800
+G3 X87.496 Y13.661 I-0.097 J0.362 E0.0152 F1800
+G1 X85.943 Y19.457
 G1 Z0.850 E-5.0000 F4800
-G1 X85.408 Y24.542 F1800
+G1 X85.373 Y24.480 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X83.855 Y30.337
-G3 X83.131 Y30.143 I-0.362 J-0.097 E0.0431 F1800
-G1 X84.684 Y24.347 E0.2195 F1800
-G2 X84.419 Y23.888 I-0.362 J-0.097 E0.0152 F1800
-G1 X82.004 Y23.241 E0.0915 F1800
-G2 X81.545 Y23.506 I-0.097 J0.362 E0.0152 F1800
-G1 X79.992 Y29.302 E0.2195 F1800
-G3 X79.267 Y29.108 I-0.362 J-0.097 E0.0431 F1800
-G1 X80.820 Y23.312 E0.2195 F1800
-G2 X80.555 Y22.853 I-0.362 J-0.097 E0.0152 F1800
-G1 X78.140 Y22.206 E0.0915 F1800
-G2 X77.681 Y22.471 I-0.097 J0.362 E0.0152 F1800
-G1 X76.128 Y28.267 E0.2195 F1800
-G3 X75.404 Y28.072 I-0.362 J-0.097 E0.0431 F1800
-G1 X76.957 Y22.277 E0.2195 F1800
-G2 X76.691 Y21.818 I-0.362 J-0.097 E0.0152 F1800
-G1 X74.277 Y21.171 E0.0915 F1800
-G2 X73.817 Y21.436 I-0.097 J0.362 E0.0152 F1800
-G1 X72.264 Y27.231 E0.2195 F1800
-G3 X71.540 Y27.037 I-0.362 J-0.097 E0.0431 F1800
-G1 X73.093 Y21.242 E0.2195 F1800
-G2 X72.828 Y20.782 I-0.362 J-0.097 E0.0152 F1800
-G1 X70.413 Y20.135 E0.0915 F1800
-G2 X69.954 Y20.400 I-0.097 J0.362 E0.0152 F1800
-G1 X68.401 Y26.196 E0.2195 F1800
-G3 X67.676 Y26.002 I-0.362 J-0.097 E0.0431 F1800
-G1 X69.229 Y20.206 E0.2195 F1800
-G2 X68.964 Y19.747 I-0.362 J-0.097 E0.0152 F1800
-G1 X66.549 Y19.100 E0.0915 F1800
-G2 X66.090 Y19.365 I-0.097 J0.362 E0.0152 F1800
-G1 X64.537 Y25.161 E0.2195 F1800
-G3 X63.813 Y24.967 I-0.362 J-0.097 E0.0431 F1800
-G1 X65.365 Y19.171 E0.2195 F1800
-G2 X65.100 Y18.712 I-0.362 J-0.097 E0.0152 F1800
-G1 X62.685 Y18.065 E0.0915 F1800
-G2 X62.226 Y18.330 I-0.097 J0.362 E0.0152 F1800
-G1 X60.673 Y24.125 E0.2195 F1800
-G3 X59.949 Y23.931 I-0.362 J-0.097 E0.0431 F1800
-G1 X61.502 Y18.136 E0.2195 F1800
-G2 X61.237 Y17.677 I-0.362 J-0.097 E0.0152 F1800
-G1 X58.822 Y17.029 E0.0915 F1800
-G2 X58.362 Y17.295 I-0.097 J0.362 E0.0152 F1800
-G1 X56.810 Y23.090 E0.2195 F1800
-G3 X56.085 Y22.896 I-0.362 J-0.097 E0.0431 F1800
-G1 X57.638 Y17.101 E0.2195 F1800
-G2 X57.373 Y16.641 I-0.362 J-0.097 E0.0152 F1800
-G1 X54.958 Y15.994 E0.0915 F1800
-G2 X54.499 Y16.259 I-0.097 J0.362 E0.0152 F1800
-G1 X52.946 Y22.055 E0.2195 F1800
-G3 X52.221 Y21.861 I-0.362 J-0.097 E0.0431 F1800
-G1 X53.774 Y16.065 E0.2195 F1800
-G2 X53.509 Y15.606 I-0.362 J-0.097 E0.0152 F1800
-G1 X51.094 Y14.959 E0.0915 F1800
-G2 X50.635 Y15.224 I-0.097 J0.362 E0.0152 F1800
-G1 X49.082 Y21.020 E0.2195 F1800
-G3 X48.358 Y20.826 I-0.362 J-0.097 E0.0431 F1800
-G1 X49.911 Y15.030 E0.2195 F1800
-G2 X49.645 Y14.571 I-0.362 J-0.097 E0.0152 F1800
-G1 X47.231 Y13.924 E0.0915 F1800
-G2 X46.771 Y14.189 I-0.097 J0.362 E0.0152 F1800
-G1 X45.218 Y19.984 E0.2195 F1800
-G3 X44.494 Y19.790 I-0.362 J-0.097 E0.0431 F1800
-G1 X46.047 Y13.995 E0.2195 F1800
-G2 X45.782 Y13.535 I-0.362 J-0.097 E0.0152 F1800
-G1 X43.367 Y12.888 E0.0915 F1800
-G2 X42.908 Y13.154 I-0.097 J0.362 E0.0152 F1800
-G1 X41.355 Y18.949 E0.2195 F1800
-G3 X40.630 Y18.755 I-0.362 J-0.097 E0.0431 F1800
-G1 X42.183 Y12.959 E0.2195 F1800
-G2 X41.918 Y12.500 I-0.362 J-0.097 E0.0152 F1800
-G1 X39.503 Y11.853 E0.0915 F1800
-G2 X39.044 Y12.118 I-0.097 J0.362 E0.0152 F1800
-G1 X37.491 Y17.914 E0.2195 F1800
-G3 X36.767 Y17.720 I-0.362 J-0.097 E0.0431 F1800
-G1 X38.320 Y11.924 E0.2195 F1800
-G2 X38.054 Y11.465 I-0.362 J-0.097 E0.0152 F1800
-G1 X35.640 Y10.818 E0.0915 F1800
-G2 X35.180 Y11.083 I-0.097 J0.362 E0.0152 F1800
-G1 X33.627 Y16.879 E0.2195 F1800
-G3 X32.903 Y16.684 I-0.362 J-0.097 E0.0431 F1800
-G1 X34.456 Y10.889 E0.2195 F1800
-G2 X34.191 Y10.430 I-0.362 J-0.097 E0.0152 F1800
-G1 X31.776 Y9.783 E0.0915 F1800
-G2 X31.317 Y10.048 I-0.097 J0.362 E0.0152 F1800
-G1 X29.764 Y15.843 E0.2195 F1800
-G3 X29.039 Y15.649 I-0.362 J-0.097 E0.0431 F1800
-G1 X30.592 Y9.854 E0.2195 F1800
-G2 X30.327 Y9.394 I-0.362 J-0.097 E0.0152 F1800
-G1 X27.912 Y8.747 E0.0915 F1800
-G2 X27.453 Y9.012 I-0.097 J0.362 E0.0152 F1800
-G1 X25.900 Y14.808 E0.2195 F1800
-G3 X25.175 Y14.614 I-0.362 J-0.097 E0.0431 F1800
-G1 X26.728 Y8.818 E0.2195 F1800
-G2 X26.463 Y8.359 I-0.362 J-0.097 E0.0152 F1800
-G1 X24.048 Y7.712 E0.0915 F1800
-G2 X23.589 Y7.977 I-0.097 J0.362 E0.0152 F1800
-G1 X22.036 Y13.773 E0.2195 F1800
-G3 X21.312 Y13.579 I-0.362 J-0.097 E0.0431 F1800
-G1 X22.865 Y7.783 E0.2195 F1800
-G2 X22.600 Y7.324 I-0.362 J-0.097 E0.0152 F1800
-G1 X20.185 Y6.677 E0.0915 F1800
-G2 X19.725 Y6.942 I-0.097 J0.362 E0.0152 F1800
-G1 X18.173 Y12.737
+G1 X83.820 Y30.276
+G3 X83.096 Y30.082 I-0.362 J-0.097 E0.0431 F1800
+G1 X84.649 Y24.286 E0.2195 F1800
+G2 X84.383 Y23.827 I-0.362 J-0.097 E0.0152 F1800
+G1 X81.969 Y23.180 E0.0915 F1800
+G2 X81.509 Y23.445 I-0.097 J0.362 E0.0152 F1800
+G1 X79.956 Y29.241 E0.2195 F1800
+G3 X79.232 Y29.046 I-0.362 J-0.097 E0.0431 F1800
+G1 X80.785 Y23.251 E0.2195 F1800
+G2 X80.520 Y22.792 I-0.362 J-0.097 E0.0152 F1800
+G1 X78.105 Y22.145 E0.0915 F1800
+G2 X77.646 Y22.410 I-0.097 J0.362 E0.0152 F1800
+G1 X76.093 Y28.205 E0.2195 F1800
+G3 X75.368 Y28.011 I-0.362 J-0.097 E0.0431 F1800
+G1 X76.921 Y22.216 E0.2195 F1800
+G2 X76.656 Y21.756 I-0.362 J-0.097 E0.0152 F1800
+G1 X74.241 Y21.109 E0.0915 F1800
+G2 X73.782 Y21.374 I-0.097 J0.362 E0.0152 F1800
+G1 X72.229 Y27.170 E0.2195 F1800
+G3 X71.505 Y26.976 I-0.362 J-0.097 E0.0431 F1800
+G1 X73.057 Y21.180 E0.2195 F1800
+G2 X72.792 Y20.721 I-0.362 J-0.097 E0.0152 F1800
+G1 X70.378 Y20.074 E0.0915 F1800
+G2 X69.918 Y20.339 I-0.097 J0.362 E0.0152 F1800
+G1 X68.365 Y26.135 E0.2195 F1800
+G3 X67.641 Y25.941 I-0.362 J-0.097 E0.0431 F1800
+G1 X69.194 Y20.145 E0.2195 F1800
+G2 X68.929 Y19.686 I-0.362 J-0.097 E0.0152 F1800
+G1 X66.514 Y19.039 E0.0915 F1800
+G2 X66.055 Y19.304 I-0.097 J0.362 E0.0152 F1800
+G1 X64.502 Y25.099 E0.2195 F1800
+G3 X63.777 Y24.905 I-0.362 J-0.097 E0.0431 F1800
+G1 X65.330 Y19.110 E0.2195 F1800
+G2 X65.065 Y18.651 I-0.362 J-0.097 E0.0152 F1800
+G1 X62.650 Y18.003 E0.0915 F1800
+G2 X62.191 Y18.269 I-0.097 J0.362 E0.0152 F1800
+G1 X60.638 Y24.064 E0.2195 F1800
+G3 X59.913 Y23.870 I-0.362 J-0.097 E0.0431 F1800
+G1 X61.466 Y18.075 E0.2195 F1800
+G2 X61.201 Y17.615 I-0.362 J-0.097 E0.0152 F1800
+G1 X58.786 Y16.968 E0.0915 F1800
+G2 X58.327 Y17.233 I-0.097 J0.362 E0.0152 F1800
+G1 X56.774 Y23.029 E0.2195 F1800
+G3 X56.050 Y22.835 I-0.362 J-0.097 E0.0431 F1800
+G1 X57.603 Y17.039 E0.2195 F1800
+G2 X57.338 Y16.580 I-0.362 J-0.097 E0.0152 F1800
+G1 X54.923 Y15.933 E0.0915 F1800
+G2 X54.463 Y16.198 I-0.097 J0.362 E0.0152 F1800
+G1 X52.911 Y21.994 E0.2195 F1800
+G3 X52.186 Y21.800 I-0.362 J-0.097 E0.0431 F1800
+G1 X53.739 Y16.004 E0.2195 F1800
+G2 X53.474 Y15.545 I-0.362 J-0.097 E0.0152 F1800
+G1 X51.059 Y14.898 E0.0915 F1800
+G2 X50.600 Y15.163 I-0.097 J0.362 E0.0152 F1800
+G1 X49.047 Y20.958 E0.2195 F1800
+G3 X48.322 Y20.764 I-0.362 J-0.097 E0.0431 F1800
+G1 X49.875 Y14.969 E0.2195 F1800
+G2 X49.610 Y14.509 I-0.362 J-0.097 E0.0152 F1800
+G1 X47.195 Y13.862 E0.0915 F1800
+G2 X46.736 Y14.128 I-0.097 J0.362 E0.0152 F1800
+G1 X45.183 Y19.923 E0.2195 F1800
+G3 X44.459 Y19.729 I-0.362 J-0.097 E0.0431 F1800
+G1 X46.012 Y13.933 E0.2195 F1800
+G2 X45.746 Y13.474 I-0.362 J-0.097 E0.0152 F1800
+G1 X43.332 Y12.827 E0.0915 F1800
+G2 X42.872 Y13.092 I-0.097 J0.362 E0.0152 F1800
+G1 X41.319 Y18.888 E0.2195 F1800
+G3 X40.595 Y18.694 I-0.362 J-0.097 E0.0431 F1800
+G1 X42.148 Y12.898 E0.2195 F1800
+G2 X41.883 Y12.439 I-0.362 J-0.097 E0.0152 F1800
+G1 X39.468 Y11.792 E0.0915 F1800
+G2 X39.009 Y12.057 I-0.097 J0.362 E0.0152 F1800
+G1 X37.456 Y17.853 E0.2195 F1800
+G3 X36.731 Y17.658 I-0.362 J-0.097 E0.0431 F1800
+G1 X38.284 Y11.863 E0.2195 F1800
+G2 X38.019 Y11.404 I-0.362 J-0.097 E0.0152 F1800
+G1 X35.604 Y10.757 E0.0915 F1800
+G2 X35.145 Y11.022 I-0.097 J0.362 E0.0152 F1800
+G1 X33.592 Y16.817 E0.2195 F1800
+G3 X32.868 Y16.623 I-0.362 J-0.097 E0.0431 F1800
+G1 X34.420 Y10.828 E0.2195 F1800
+G2 X34.155 Y10.368 I-0.362 J-0.097 E0.0152 F1800
+G1 X31.740 Y9.721 E0.0915 F1800
+G2 X31.281 Y9.986 I-0.097 J0.362 E0.0152 F1800
+G1 X29.728 Y15.782 E0.2195 F1800
+G3 X29.004 Y15.588 I-0.362 J-0.097 E0.0431 F1800
+G1 X30.557 Y9.792 E0.2195 F1800
+G2 X30.292 Y9.333 I-0.362 J-0.097 E0.0152 F1800
+G1 X27.877 Y8.686 E0.0915 F1800
+G2 X27.417 Y8.951 I-0.097 J0.362 E0.0152 F1800
+G1 X25.865 Y14.747 E0.2195 F1800
+G3 X25.140 Y14.553 I-0.362 J-0.097 E0.0431 F1800
+G1 X26.693 Y8.757 E0.2195 F1800
+G2 X26.428 Y8.298 I-0.362 J-0.097 E0.0152 F1800
+G1 X24.013 Y7.651 E0.0915 F1800
+G2 X23.554 Y7.916 I-0.097 J0.362 E0.0152 F1800
+G1 X22.001 Y13.711 E0.2195 F1800
+G3 X21.276 Y13.517 I-0.362 J-0.097 E0.0431 F1800
+G1 X22.829 Y7.722 E0.2195 F1800
+G2 X22.564 Y7.263 I-0.362 J-0.097 E0.0152 F1800
+G1 X20.149 Y6.615 E0.0915 F1800
+G2 X19.690 Y6.881 I-0.097 J0.362 E0.0152 F1800
+G1 X18.137 Y12.676
 G1 Z0.850 E-5.0000 F4800
 ;print vertical interlocked signal pattern 3
-G1 X-14.053 Y-39.897 F1800
+G1 X-14.194 Y-40.142 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-8.257 Y-38.344
-G3 X-8.451 Y-37.619 I-0.097 J0.362 E0.0431 F1800
-G1 X-14.247 Y-39.172 E0.2195 F1800
-G2 X-14.706 Y-38.907 I-0.097 J0.362 E0.0152 F1800
-G1 X-15.353 Y-36.492 E0.0915 F1800
-G2 X-15.088 Y-36.033 I0.362 J0.097 E0.0152 F1800
-G1 X-9.293 Y-34.480 E0.2195 F1800
-G3 X-9.487 Y-33.756 I-0.097 J0.362 E0.0431 F1800
-G1 X-15.282 Y-35.308 E0.2195 F1800
-G2 X-15.742 Y-35.043 I-0.097 J0.362 E0.0152 F1800
-G1 X-16.389 Y-32.628 E0.0915 F1800
-G2 X-16.123 Y-32.169 I0.362 J0.097 E0.0152 F1800
-G1 X-10.328 Y-30.616 E0.2195 F1800
-G3 X-10.522 Y-29.892 I-0.097 J0.362 E0.0431 F1800
-G1 X-16.318 Y-31.445 E0.2195 F1800
-G2 X-16.777 Y-31.180 I-0.097 J0.362 E0.0152 F1800
-G1 X-17.424 Y-28.765 E0.0915 F1800
-G2 X-17.159 Y-28.305 I0.362 J0.097 E0.0152 F1800
-G1 X-11.363 Y-26.753 E0.2195 F1800
-G3 X-11.557 Y-26.028 I-0.097 J0.362 E0.0431 F1800
-G1 X-17.353 Y-27.581 E0.2195 F1800
-G2 X-17.812 Y-27.316 I-0.097 J0.362 E0.0152 F1800
-G1 X-18.459 Y-24.901 E0.0915 F1800
-G2 X-18.194 Y-24.442 I0.362 J0.097 E0.0152 F1800
-G1 X-12.398 Y-22.889 E0.2195 F1800
-G3 X-12.593 Y-22.164 I-0.097 J0.362 E0.0431 F1800
-G1 X-18.388 Y-23.717 E0.2195 F1800
-G2 X-18.847 Y-23.452 I-0.097 J0.362 E0.0152 F1800
-G1 X-19.494 Y-21.037 E0.0915 F1800
-G2 X-19.229 Y-20.578 I0.362 J0.097 E0.0152 F1800
-G1 X-13.434 Y-19.025 E0.2195 F1800
-G3 X-13.628 Y-18.301 I-0.097 J0.362 E0.0431 F1800
-G1 X-19.423 Y-19.854 E0.2195 F1800
-G2 X-19.883 Y-19.588 I-0.097 J0.362 E0.0152 F1800
-G1 X-20.530 Y-17.174 E0.0915 F1800
-G2 X-20.264 Y-16.714 I0.362 J0.097 E0.0152 F1800
-G1 X-14.469 Y-15.161 E0.2195 F1800
-G3 X-14.663 Y-14.437 I-0.097 J0.362 E0.0431 F1800
-G1 X-20.459 Y-15.990 E0.2195 F1800
-G2 X-20.918 Y-15.725 I-0.097 J0.362 E0.0152 F1800
-G1 X-21.565 Y-13.310 E0.0915 F1800
-G2 X-21.300 Y-12.851 I0.362 J0.097 E0.0152 F1800
-G1 X-15.504 Y-11.298 E0.2195 F1800
-G3 X-15.698 Y-10.573 I-0.097 J0.362 E0.0431 F1800
-G1 X-21.494 Y-12.126 E0.2195 F1800
-G2 X-21.953 Y-11.861 I-0.097 J0.362 E0.0152 F1800
-G1 X-22.600 Y-9.446 E0.0915 F1800
-G2 X-22.335 Y-8.987 I0.362 J0.097 E0.0152 F1800
-G1 X-16.539 Y-7.434 E0.2195 F1800
-G3 X-16.734 Y-6.710 I-0.097 J0.362 E0.0431 F1800
-G1 X-22.529 Y-8.263 E0.2195 F1800
-G2 X-22.988 Y-7.997 I-0.097 J0.362 E0.0152 F1800
-G1 X-23.635 Y-5.583 E0.0915 F1800
-G2 X-23.370 Y-5.123 I0.362 J0.097 E0.0152 F1800
-G1 X-17.575 Y-3.570 E0.2195 F1800
-G3 X-17.769 Y-2.846 I-0.097 J0.362 E0.0431 F1800
-G1 X-23.564 Y-4.399 E0.2195 F1800
-G2 X-24.024 Y-4.134 I-0.097 J0.362 E0.0152 F1800
-G1 X-24.671 Y-1.719 E0.0915 F1800
-G2 X-24.406 Y-1.260 I0.362 J0.097 E0.0152 F1800
-G1 X-18.610 Y0.293 E0.2195 F1800
-G3 X-18.804 Y1.018 I-0.097 J0.362 E0.0431 F1800
-G1 X-24.600 Y-0.535 E0.2195 F1800
-G2 X-25.059 Y-0.270 I-0.097 J0.362 E0.0152 F1800
-G1 X-25.706 Y2.145 E0.0915 F1800
-G2 X-25.441 Y2.604 I0.362 J0.097 E0.0152 F1800
-G1 X-19.645 Y4.157 E0.2195 F1800
-G3 X-19.839 Y4.882 I-0.097 J0.362 E0.0431 F1800
-G1 X-25.635 Y3.329 E0.2195 F1800
-G2 X-26.094 Y3.594 I-0.097 J0.362 E0.0152 F1800
-G1 X-26.741 Y6.009 E0.0915 F1800
-G2 X-26.476 Y6.468 I0.362 J0.097 E0.0152 F1800
-G1 X-20.681 Y8.021 E0.2195 F1800
-G3 X-20.875 Y8.745 I-0.097 J0.362 E0.0431 F1800
-G1 X-26.670 Y7.192 E0.2195 F1800
-G2 X-27.130 Y7.457 I-0.097 J0.362 E0.0152 F1800
-G1 X-27.777 Y9.872 E0.0915 F1800
-G2 X-27.511 Y10.332 I0.362 J0.097 E0.0152 F1800
-G1 X-21.716 Y11.884 E0.2195 F1800
-G3 X-21.910 Y12.609 I-0.097 J0.362 E0.0431 F1800
-G1 X-27.706 Y11.056 E0.2195 F1800
-G2 X-28.165 Y11.321 I-0.097 J0.362 E0.0152 F1800
-G1 X-28.812 Y13.736 E0.0915 F1800
-G2 X-28.547 Y14.195 I0.362 J0.097 E0.0152 F1800
-G1 X-22.751 Y15.748 E0.2195 F1800
-G3 X-22.945 Y16.473 I-0.097 J0.362 E0.0431 F1800
-G1 X-28.741 Y14.920 E0.2195 F1800
-G2 X-29.200 Y15.185 I-0.097 J0.362 E0.0152 F1800
-G1 X-29.847 Y17.600 E0.0915 F1800
-G2 X-29.582 Y18.059 I0.362 J0.097 E0.0152 F1800
-G1 X-23.786 Y19.612 E0.2195 F1800
-G3 X-23.981 Y20.336 I-0.097 J0.362 E0.0431 F1800
-G1 X-29.776 Y18.783 E0.2195 F1800
-G2 X-30.235 Y19.049 I-0.097 J0.362 E0.0152 F1800
-G1 X-30.882 Y21.463 E0.0915 F1800
-G2 X-30.617 Y21.923 I0.362 J0.097 E0.0152 F1800
-G1 X-24.822 Y23.476 E0.2195 F1800
-G3 X-25.016 Y24.200 I-0.097 J0.362 E0.0431 F1800
-G1 X-30.811 Y22.647 E0.2195 F1800
-G2 X-31.271 Y22.912 I-0.097 J0.362 E0.0152 F1800
-G1 X-31.918 Y25.327 E0.0915 F1800
-G2 X-31.653 Y25.786 I0.362 J0.097 E0.0152 F1800
-G1 X-25.857 Y27.339
+G1 X-8.399 Y-38.589
+G3 X-8.593 Y-37.864 I-0.097 J0.362 E0.0431 F1800
+G1 X-14.388 Y-39.417 E0.2195 F1800
+G2 X-14.848 Y-39.152 I-0.097 J0.362 E0.0152 F1800
+G1 X-15.495 Y-36.737 E0.0915 F1800
+G2 X-15.230 Y-36.278 I0.362 J0.097 E0.0152 F1800
+G1 X-9.434 Y-34.725 E0.2195 F1800
+G3 X-9.628 Y-34.000 I-0.097 J0.362 E0.0431 F1800
+G1 X-15.424 Y-35.553 E0.2195 F1800
+G2 X-15.883 Y-35.288 I-0.097 J0.362 E0.0152 F1800
+G1 X-16.530 Y-32.873 E0.0915 F1800
+G2 X-16.265 Y-32.414 I0.362 J0.097 E0.0152 F1800
+G1 X-10.469 Y-30.861 E0.2195 F1800
+G3 X-10.663 Y-30.137 I-0.097 J0.362 E0.0431 F1800
+G1 X-16.459 Y-31.690 E0.2195 F1800
+G2 X-16.918 Y-31.425 I-0.097 J0.362 E0.0152 F1800
+G1 X-17.565 Y-29.010 E0.0915 F1800
+G2 X-17.300 Y-28.550 I0.362 J0.097 E0.0152 F1800
+G1 X-11.505 Y-26.998 E0.2195 F1800
+G3 X-11.699 Y-26.273 I-0.097 J0.362 E0.0431 F1800
+G1 X-17.494 Y-27.826 E0.2195 F1800
+G2 X-17.953 Y-27.561 I-0.097 J0.362 E0.0152 F1800
+G1 X-18.601 Y-25.146 E0.0915 F1800
+G2 X-18.335 Y-24.687 I0.362 J0.097 E0.0152 F1800
+G1 X-12.540 Y-23.134 E0.2195 F1800
+G3 X-12.734 Y-22.409 I-0.097 J0.362 E0.0431 F1800
+G1 X-18.529 Y-23.962 E0.2195 F1800
+G2 X-18.989 Y-23.697 I-0.097 J0.362 E0.0152 F1800
+G1 X-19.636 Y-21.282 E0.0915 F1800
+G2 X-19.371 Y-20.823 I0.362 J0.097 E0.0152 F1800
+G1 X-13.575 Y-19.270 E0.2195 F1800
+G3 X-13.769 Y-18.546 I-0.097 J0.362 E0.0431 F1800
+G1 X-19.565 Y-20.099 E0.2195 F1800
+G2 X-20.024 Y-19.833 I-0.097 J0.362 E0.0152 F1800
+G1 X-20.671 Y-17.419 E0.0915 F1800
+G2 X-20.406 Y-16.959 I0.362 J0.097 E0.0152 F1800
+G1 X-14.610 Y-15.406 E0.2195 F1800
+G3 X-14.804 Y-14.682 I-0.097 J0.362 E0.0431 F1800
+G1 X-20.600 Y-16.235 E0.2195 F1800
+G2 X-21.059 Y-15.970 I-0.097 J0.362 E0.0152 F1800
+G1 X-21.706 Y-13.555 E0.0915 F1800
+G2 X-21.441 Y-13.096 I0.362 J0.097 E0.0152 F1800
+G1 X-15.646 Y-11.543 E0.2195 F1800
+G3 X-15.840 Y-10.818 I-0.097 J0.362 E0.0431 F1800
+G1 X-21.635 Y-12.371 E0.2195 F1800
+G2 X-22.095 Y-12.106 I-0.097 J0.362 E0.0152 F1800
+G1 X-22.742 Y-9.691 E0.0915 F1800
+G2 X-22.476 Y-9.232 I0.362 J0.097 E0.0152 F1800
+G1 X-16.681 Y-7.679 E0.2195 F1800
+G3 X-16.875 Y-6.955 I-0.097 J0.362 E0.0431 F1800
+G1 X-22.671 Y-8.507 E0.2195 F1800
+G2 X-23.130 Y-8.242 I-0.097 J0.362 E0.0152 F1800
+G1 X-23.777 Y-5.827 E0.0915 F1800
+G2 X-23.512 Y-5.368 I0.362 J0.097 E0.0152 F1800
+G1 X-17.716 Y-3.815 E0.2195 F1800
+G3 X-17.910 Y-3.091 I-0.097 J0.362 E0.0431 F1800
+G1 X-23.706 Y-4.644 E0.2195 F1800
+G2 X-24.165 Y-4.379 I-0.097 J0.362 E0.0152 F1800
+G1 X-24.812 Y-1.964 E0.0915 F1800
+G2 X-24.547 Y-1.505 I0.362 J0.097 E0.0152 F1800
+G1 X-18.751 Y0.048 E0.2195 F1800
+G3 X-18.946 Y0.773 I-0.097 J0.362 E0.0431 F1800
+G1 X-24.741 Y-0.780 E0.2195 F1800
+G2 X-25.200 Y-0.515 I-0.097 J0.362 E0.0152 F1800
+G1 X-25.847 Y1.900 E0.0915 F1800
+G2 X-25.582 Y2.359 I0.362 J0.097 E0.0152 F1800
+G1 X-19.787 Y3.912 E0.2195 F1800
+G3 X-19.981 Y4.637 I-0.097 J0.362 E0.0431 F1800
+G1 X-25.776 Y3.084 E0.2195 F1800
+G2 X-26.236 Y3.349 I-0.097 J0.362 E0.0152 F1800
+G1 X-26.883 Y5.764 E0.0915 F1800
+G2 X-26.618 Y6.223 I0.362 J0.097 E0.0152 F1800
+G1 X-20.822 Y7.776 E0.2195 F1800
+G3 X-21.016 Y8.500 I-0.097 J0.362 E0.0431 F1800
+G1 X-26.812 Y6.947 E0.2195 F1800
+G2 X-27.271 Y7.213 I-0.097 J0.362 E0.0152 F1800
+G1 X-27.918 Y9.627 E0.0915 F1800
+G2 X-27.653 Y10.087 I0.362 J0.097 E0.0152 F1800
+G1 X-21.857 Y11.640 E0.2195 F1800
+G3 X-22.051 Y12.364 I-0.097 J0.362 E0.0431 F1800
+G1 X-27.847 Y10.811 E0.2195 F1800
+G2 X-28.306 Y11.076 I-0.097 J0.362 E0.0152 F1800
+G1 X-28.953 Y13.491 E0.0915 F1800
+G2 X-28.688 Y13.950 I0.362 J0.097 E0.0152 F1800
+G1 X-22.893 Y15.503 E0.2195 F1800
+G3 X-23.087 Y16.228 I-0.097 J0.362 E0.0431 F1800
+G1 X-28.882 Y14.675 E0.2195 F1800
+G2 X-29.342 Y14.940 I-0.097 J0.362 E0.0152 F1800
+G1 X-29.989 Y17.355 E0.0915 F1800
+G2 X-29.723 Y17.814 I0.362 J0.097 E0.0152 F1800
+G1 X-23.928 Y19.367 E0.2195 F1800
+G3 X-24.122 Y20.091 I-0.097 J0.362 E0.0431 F1800
+G1 X-29.918 Y18.538 E0.2195 F1800
+G2 X-30.377 Y18.804 I-0.097 J0.362 E0.0152 F1800
+G1 X-31.024 Y21.218 E0.0915 F1800
+G2 X-30.759 Y21.678 I0.362 J0.097 E0.0152 F1800
+G1 X-24.963 Y23.231 E0.2195 F1800
+G3 X-25.157 Y23.955 I-0.097 J0.362 E0.0431 F1800
+G1 X-30.953 Y22.402 E0.2195 F1800
+G2 X-31.412 Y22.667 I-0.097 J0.362 E0.0152 F1800
+G1 X-32.059 Y25.082 E0.0915 F1800
+G2 X-31.794 Y25.541 I0.362 J0.097 E0.0152 F1800
+G1 X-25.998 Y27.094
 G1 Z0.850 E-5.0000 F4800
-G1 X-21.221 Y29.358 F1800
+G1 X-21.363 Y29.113 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X-15.426 Y30.911
-G2 X-15.232 Y30.186 I0.097 J-0.362 E0.0431 F1800
-G1 X-21.027 Y28.633 E0.2195 F1800
-G3 X-21.293 Y28.174 I0.097 J-0.362 E0.0152 F1800
-G1 X-20.645 Y25.759 E0.0915 F1800
-G3 X-20.186 Y25.494 I0.362 J0.097 E0.0152 F1800
-G1 X-14.391 Y27.047 E0.2195 F1800
-G2 X-14.197 Y26.323 I0.097 J-0.362 E0.0431 F1800
-G1 X-19.992 Y24.770 E0.2195 F1800
-G3 X-20.257 Y24.310 I0.097 J-0.362 E0.0152 F1800
-G1 X-19.610 Y21.896 E0.0915 F1800
-G3 X-19.151 Y21.630 I0.362 J0.097 E0.0152 F1800
-G1 X-13.355 Y23.183 E0.2195 F1800
-G2 X-13.161 Y22.459 I0.097 J-0.362 E0.0431 F1800
-G1 X-18.957 Y20.906 E0.2195 F1800
-G3 X-19.222 Y20.447 I0.097 J-0.362 E0.0152 F1800
-G1 X-18.575 Y18.032 E0.0915 F1800
-G3 X-18.116 Y17.767 I0.362 J0.097 E0.0152 F1800
-G1 X-12.320 Y19.320 E0.2195 F1800
-G2 X-12.126 Y18.595 I0.097 J-0.362 E0.0431 F1800
-G1 X-17.922 Y17.042 E0.2195 F1800
-G3 X-18.187 Y16.583 I0.097 J-0.362 E0.0152 F1800
-G1 X-17.540 Y14.168 E0.0915 F1800
-G3 X-17.080 Y13.903 I0.362 J0.097 E0.0152 F1800
-G1 X-11.285 Y15.456 E0.2195 F1800
-G2 X-11.091 Y14.731 I0.097 J-0.362 E0.0431 F1800
-G1 X-16.886 Y13.179 E0.2195 F1800
-G3 X-17.151 Y12.719 I0.097 J-0.362 E0.0152 F1800
-G1 X-16.504 Y10.304 E0.0915 F1800
-G3 X-16.045 Y10.039 I0.362 J0.097 E0.0152 F1800
-G1 X-10.250 Y11.592 E0.2195 F1800
-G2 X-10.055 Y10.868 I0.097 J-0.362 E0.0431 F1800
-G1 X-15.851 Y9.315 E0.2195 F1800
-G3 X-16.116 Y8.856 I0.097 J-0.362 E0.0152 F1800
-G1 X-15.469 Y6.441 E0.0915 F1800
-G3 X-15.010 Y6.176 I0.362 J0.097 E0.0152 F1800
-G1 X-9.214 Y7.729 E0.2195 F1800
-G2 X-9.020 Y7.004 I0.097 J-0.362 E0.0431 F1800
-G1 X-14.816 Y5.451 E0.2195 F1800
-G3 X-15.081 Y4.992 I0.097 J-0.362 E0.0152 F1800
-G1 X-14.434 Y2.577 E0.0915 F1800
-G3 X-13.975 Y2.312 I0.362 J0.097 E0.0152 F1800
-G1 X-8.179 Y3.865 E0.2195 F1800
-G2 X-7.985 Y3.140 I0.097 J-0.362 E0.0431 F1800
-G1 X-13.780 Y1.587 E0.2195 F1800
-G3 X-14.046 Y1.128 I0.097 J-0.362 E0.0152 F1800
-G1 X-13.399 Y-1.287 E0.0915 F1800
-G3 X-12.939 Y-1.552 I0.362 J0.097 E0.0152 F1800
-G1 X-7.144 Y0.001 E0.2195 F1800
-G2 X-6.950 Y-0.723 I0.097 J-0.362 E0.0431 F1800
-G1 X-12.745 Y-2.276 E0.2195 F1800
-G3 X-13.010 Y-2.736 I0.097 J-0.362 E0.0152 F1800
-G1 X-12.363 Y-5.150 E0.0915 F1800
-G3 X-11.904 Y-5.416 I0.362 J0.097 E0.0152 F1800
-G1 X-6.108 Y-3.863 E0.2195 F1800
-G2 X-5.914 Y-4.587 I0.097 J-0.362 E0.0431 F1800
-G1 X-11.710 Y-6.140 E0.2195 F1800
-G3 X-11.975 Y-6.599 I0.097 J-0.362 E0.0152 F1800
-G1 X-11.328 Y-9.014 E0.0915 F1800
-G3 X-10.869 Y-9.279 I0.362 J0.097 E0.0152 F1800
-G1 X-5.073 Y-7.726 E0.2195 F1800
-G2 X-4.879 Y-8.451 I0.097 J-0.362 E0.0431 F1800
-G1 X-10.675 Y-10.004 E0.2195 F1800
-G3 X-10.940 Y-10.463 I0.097 J-0.362 E0.0152 F1800
-G1 X-10.293 Y-12.878 E0.0915 F1800
-G3 X-9.833 Y-13.143 I0.362 J0.097 E0.0152 F1800
-G1 X-4.038 Y-11.590 E0.2195 F1800
-G2 X-3.844 Y-12.314 I0.097 J-0.362 E0.0431 F1800
-G1 X-9.639 Y-13.867 E0.2195 F1800
-G3 X-9.904 Y-14.327 I0.097 J-0.362 E0.0152 F1800
-G1 X-9.257 Y-16.741 E0.0915 F1800
-G3 X-8.798 Y-17.007 I0.362 J0.097 E0.0152 F1800
-G1 X-3.003 Y-15.454 E0.2195 F1800
-G2 X-2.808 Y-16.178 I0.097 J-0.362 E0.0431 F1800
-G1 X-8.604 Y-17.731 E0.2195 F1800
-G3 X-8.869 Y-18.190 I0.097 J-0.362 E0.0152 F1800
-G1 X-8.222 Y-20.605 E0.0915 F1800
-G3 X-7.763 Y-20.870 I0.362 J0.097 E0.0152 F1800
-G1 X-1.967 Y-19.317 E0.2195 F1800
-G2 X-1.773 Y-20.042 I0.097 J-0.362 E0.0431 F1800
-G1 X-7.569 Y-21.595 E0.2195 F1800
-G3 X-7.834 Y-22.054 I0.097 J-0.362 E0.0152 F1800
-G1 X-7.187 Y-24.469 E0.0915 F1800
-G3 X-6.728 Y-24.734 I0.362 J0.097 E0.0152 F1800
-G1 X-0.932 Y-23.181 E0.2195 F1800
-G2 X-0.738 Y-23.906 I0.097 J-0.362 E0.0431 F1800
-G1 X-6.533 Y-25.458 E0.2195 F1800
-G3 X-6.799 Y-25.918 I0.097 J-0.362 E0.0152 F1800
-G1 X-6.152 Y-28.333 E0.0915 F1800
-G3 X-5.692 Y-28.598 I0.362 J0.097 E0.0152 F1800
-G1 X0.103 Y-27.045 E0.2195 F1800
-G2 X0.297 Y-27.769 I0.097 J-0.362 E0.0431 F1800
-G1 X-5.498 Y-29.322 E0.2195 F1800
-G3 X-5.763 Y-29.781 I0.097 J-0.362 E0.0152 F1800
-G1 X-5.116 Y-32.196 E0.0915 F1800
-G3 X-4.657 Y-32.461 I0.362 J0.097 E0.0152 F1800
-G1 X1.139 Y-30.909 E0.2195 F1800
-G2 X1.333 Y-31.633 I0.097 J-0.362 E0.0431 F1800
-G1 X-4.463 Y-33.186 E0.2195 F1800
-G3 X-4.728 Y-33.645 I0.097 J-0.362 E0.0152 F1800
-G1 X-4.081 Y-36.060 E0.0915 F1800
-G3 X-3.622 Y-36.325 I0.362 J0.097 E0.0152 F1800
-G1 X2.174 Y-34.772
+G1 X-15.567 Y30.666
+G2 X-15.373 Y29.941 I0.097 J-0.362 E0.0431 F1800
+G1 X-21.169 Y28.388 E0.2195 F1800
+G3 X-21.434 Y27.929 I0.097 J-0.362 E0.0152 F1800
+G1 X-20.787 Y25.514 E0.0915 F1800
+G3 X-20.328 Y25.249 I0.362 J0.097 E0.0152 F1800
+G1 X-14.532 Y26.802 E0.2195 F1800
+G2 X-14.338 Y26.078 I0.097 J-0.362 E0.0431 F1800
+G1 X-20.133 Y24.525 E0.2195 F1800
+G3 X-20.399 Y24.065 I0.097 J-0.362 E0.0152 F1800
+G1 X-19.752 Y21.651 E0.0915 F1800
+G3 X-19.292 Y21.385 I0.362 J0.097 E0.0152 F1800
+G1 X-13.497 Y22.938 E0.2195 F1800
+G2 X-13.303 Y22.214 I0.097 J-0.362 E0.0431 F1800
+G1 X-19.098 Y20.661 E0.2195 F1800
+G3 X-19.363 Y20.202 I0.097 J-0.362 E0.0152 F1800
+G1 X-18.716 Y17.787 E0.0915 F1800
+G3 X-18.257 Y17.522 I0.362 J0.097 E0.0152 F1800
+G1 X-12.462 Y19.075 E0.2195 F1800
+G2 X-12.267 Y18.350 I0.097 J-0.362 E0.0431 F1800
+G1 X-18.063 Y16.797 E0.2195 F1800
+G3 X-18.328 Y16.338 I0.097 J-0.362 E0.0152 F1800
+G1 X-17.681 Y13.923 E0.0915 F1800
+G3 X-17.222 Y13.658 I0.362 J0.097 E0.0152 F1800
+G1 X-11.426 Y15.211 E0.2195 F1800
+G2 X-11.232 Y14.487 I0.097 J-0.362 E0.0431 F1800
+G1 X-17.028 Y12.934 E0.2195 F1800
+G3 X-17.293 Y12.474 I0.097 J-0.362 E0.0152 F1800
+G1 X-16.646 Y10.060 E0.0915 F1800
+G3 X-16.187 Y9.794 I0.362 J0.097 E0.0152 F1800
+G1 X-10.391 Y11.347 E0.2195 F1800
+G2 X-10.197 Y10.623 I0.097 J-0.362 E0.0431 F1800
+G1 X-15.992 Y9.070 E0.2195 F1800
+G3 X-16.258 Y8.611 I0.097 J-0.362 E0.0152 F1800
+G1 X-15.611 Y6.196 E0.0915 F1800
+G3 X-15.151 Y5.931 I0.362 J0.097 E0.0152 F1800
+G1 X-9.356 Y7.484 E0.2195 F1800
+G2 X-9.162 Y6.759 I0.097 J-0.362 E0.0431 F1800
+G1 X-14.957 Y5.206 E0.2195 F1800
+G3 X-15.222 Y4.747 I0.097 J-0.362 E0.0152 F1800
+G1 X-14.575 Y2.332 E0.0915 F1800
+G3 X-14.116 Y2.067 I0.362 J0.097 E0.0152 F1800
+G1 X-8.320 Y3.620 E0.2195 F1800
+G2 X-8.126 Y2.895 I0.097 J-0.362 E0.0431 F1800
+G1 X-13.922 Y1.343 E0.2195 F1800
+G3 X-14.187 Y0.883 I0.097 J-0.362 E0.0152 F1800
+G1 X-13.540 Y-1.532 E0.0915 F1800
+G3 X-13.081 Y-1.797 I0.362 J0.097 E0.0152 F1800
+G1 X-7.285 Y-0.244 E0.2195 F1800
+G2 X-7.091 Y-0.968 I0.097 J-0.362 E0.0431 F1800
+G1 X-12.887 Y-2.521 E0.2195 F1800
+G3 X-13.152 Y-2.980 I0.097 J-0.362 E0.0152 F1800
+G1 X-12.505 Y-5.395 E0.0915 F1800
+G3 X-12.045 Y-5.660 I0.362 J0.097 E0.0152 F1800
+G1 X-6.250 Y-4.108 E0.2195 F1800
+G2 X-6.056 Y-4.832 I0.097 J-0.362 E0.0431 F1800
+G1 X-11.851 Y-6.385 E0.2195 F1800
+G3 X-12.116 Y-6.844 I0.097 J-0.362 E0.0152 F1800
+G1 X-11.469 Y-9.259 E0.0915 F1800
+G3 X-11.010 Y-9.524 I0.362 J0.097 E0.0152 F1800
+G1 X-5.215 Y-7.971 E0.2195 F1800
+G2 X-5.020 Y-8.696 I0.097 J-0.362 E0.0431 F1800
+G1 X-10.816 Y-10.249 E0.2195 F1800
+G3 X-11.081 Y-10.708 I0.097 J-0.362 E0.0152 F1800
+G1 X-10.434 Y-13.123 E0.0915 F1800
+G3 X-9.975 Y-13.388 I0.362 J0.097 E0.0152 F1800
+G1 X-4.179 Y-11.835 E0.2195 F1800
+G2 X-3.985 Y-12.559 I0.097 J-0.362 E0.0431 F1800
+G1 X-9.781 Y-14.112 E0.2195 F1800
+G3 X-10.046 Y-14.572 I0.097 J-0.362 E0.0152 F1800
+G1 X-9.399 Y-16.986 E0.0915 F1800
+G3 X-8.940 Y-17.252 I0.362 J0.097 E0.0152 F1800
+G1 X-3.144 Y-15.699 E0.2195 F1800
+G2 X-2.950 Y-16.423 I0.097 J-0.362 E0.0431 F1800
+G1 X-8.745 Y-17.976 E0.2195 F1800
+G3 X-9.011 Y-18.435 I0.097 J-0.362 E0.0152 F1800
+G1 X-8.364 Y-20.850 E0.0915 F1800
+G3 X-7.904 Y-21.115 I0.362 J0.097 E0.0152 F1800
+G1 X-2.109 Y-19.562 E0.2195 F1800
+G2 X-1.915 Y-20.287 I0.097 J-0.362 E0.0431 F1800
+G1 X-7.710 Y-21.840 E0.2195 F1800
+G3 X-7.975 Y-22.299 I0.097 J-0.362 E0.0152 F1800
+G1 X-7.328 Y-24.714 E0.0915 F1800
+G3 X-6.869 Y-24.979 I0.362 J0.097 E0.0152 F1800
+G1 X-1.073 Y-23.426 E0.2195 F1800
+G2 X-0.879 Y-24.151 I0.097 J-0.362 E0.0431 F1800
+G1 X-6.675 Y-25.703 E0.2195 F1800
+G3 X-6.940 Y-26.163 I0.097 J-0.362 E0.0152 F1800
+G1 X-6.293 Y-28.578 E0.0915 F1800
+G3 X-5.834 Y-28.843 I0.362 J0.097 E0.0152 F1800
+G1 X-0.038 Y-27.290 E0.2195 F1800
+G2 X0.156 Y-28.014 I0.097 J-0.362 E0.0431 F1800
+G1 X-5.640 Y-29.567 E0.2195 F1800
+G3 X-5.905 Y-30.026 I0.097 J-0.362 E0.0152 F1800
+G1 X-5.258 Y-32.441 E0.0915 F1800
+G3 X-4.798 Y-32.706 I0.362 J0.097 E0.0152 F1800
+G1 X0.997 Y-31.153 E0.2195 F1800
+G2 X1.191 Y-31.878 I0.097 J-0.362 E0.0431 F1800
+G1 X-4.604 Y-33.431 E0.2195 F1800
+G3 X-4.870 Y-33.890 I0.097 J-0.362 E0.0152 F1800
+G1 X-4.222 Y-36.305 E0.0915 F1800
+G3 X-3.763 Y-36.570 I0.362 J0.097 E0.0152 F1800
+G1 X2.032 Y-35.017
 G1 Z0.850 E-5.0000 F4800
 ;print horizontal interlocked signal pattern 3
-G1 X16.154 Y17.373 F1800
+G1 X16.013 Y17.128 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X14.601 Y23.168
-G2 X15.326 Y23.363 I0.362 J0.097 E0.0431 F1800
-G1 X16.878 Y17.567 E0.2195 F1800
-G3 X17.338 Y17.302 I0.362 J0.097 E0.0152 F1800
-G1 X19.753 Y17.949 E0.0915 F1800
-G3 X20.018 Y18.408 I-0.097 J0.362 E0.0152 F1800
-G1 X18.465 Y24.204 E0.2195 F1800
-G2 X19.189 Y24.398 I0.362 J0.097 E0.0431 F1800
-G1 X20.742 Y18.602 E0.2195 F1800
-G3 X21.201 Y18.337 I0.362 J0.097 E0.0152 F1800
-G1 X23.616 Y18.984 E0.0915 F1800
-G3 X23.881 Y19.443 I-0.097 J0.362 E0.0152 F1800
-G1 X22.328 Y25.239 E0.2195 F1800
-G2 X23.053 Y25.433 I0.362 J0.097 E0.0431 F1800
-G1 X24.606 Y19.638 E0.2195 F1800
-G3 X25.065 Y19.372 I0.362 J0.097 E0.0152 F1800
-G1 X27.480 Y20.019 E0.0915 F1800
-G3 X27.745 Y20.479 I-0.097 J0.362 E0.0152 F1800
-G1 X26.192 Y26.274 E0.2195 F1800
-G2 X26.917 Y26.468 I0.362 J0.097 E0.0431 F1800
-G1 X28.470 Y20.673 E0.2195 F1800
-G3 X28.929 Y20.408 I0.362 J0.097 E0.0152 F1800
-G1 X31.344 Y21.055 E0.0915 F1800
-G3 X31.609 Y21.514 I-0.097 J0.362 E0.0152 F1800
-G1 X30.056 Y27.310 E0.2195 F1800
-G2 X30.780 Y27.504 I0.362 J0.097 E0.0431 F1800
-G1 X32.333 Y21.708 E0.2195 F1800
-G3 X32.793 Y21.443 I0.362 J0.097 E0.0152 F1800
-G1 X35.207 Y22.090 E0.0915 F1800
-G3 X35.473 Y22.549 I-0.097 J0.362 E0.0152 F1800
-G1 X33.920 Y28.345 E0.2195 F1800
-G2 X34.644 Y28.539 I0.362 J0.097 E0.0431 F1800
-G1 X36.197 Y22.743 E0.2195 F1800
-G3 X36.656 Y22.478 I0.362 J0.097 E0.0152 F1800
-G1 X39.071 Y23.125 E0.0915 F1800
-G3 X39.336 Y23.585 I-0.097 J0.362 E0.0152 F1800
-G1 X37.783 Y29.380 E0.2195 F1800
-G2 X38.508 Y29.574 I0.362 J0.097 E0.0431 F1800
-G1 X40.061 Y23.779 E0.2195 F1800
-G3 X40.520 Y23.514 I0.362 J0.097 E0.0152 F1800
-G1 X42.935 Y24.161 E0.0915 F1800
-G3 X43.200 Y24.620 I-0.097 J0.362 E0.0152 F1800
-G1 X41.647 Y30.415 E0.2195 F1800
-G2 X42.371 Y30.610 I0.362 J0.097 E0.0431 F1800
-G1 X43.924 Y24.814 E0.2195 F1800
-G3 X44.384 Y24.549 I0.362 J0.097 E0.0152 F1800
-G1 X46.798 Y25.196 E0.0915 F1800
-G3 X47.064 Y25.655 I-0.097 J0.362 E0.0152 F1800
-G1 X45.511 Y31.451 E0.2195 F1800
-G2 X46.235 Y31.645 I0.362 J0.097 E0.0431 F1800
-G1 X47.788 Y25.849 E0.2195 F1800
-G3 X48.247 Y25.584 I0.362 J0.097 E0.0152 F1800
-G1 X50.662 Y26.231 E0.0915 F1800
-G3 X50.927 Y26.690 I-0.097 J0.362 E0.0152 F1800
-G1 X49.374 Y32.486 E0.2195 F1800
-G2 X50.099 Y32.680 I0.362 J0.097 E0.0431 F1800
-G1 X51.652 Y26.885 E0.2195 F1800
-G3 X52.111 Y26.619 I0.362 J0.097 E0.0152 F1800
-G1 X54.526 Y27.266 E0.0915 F1800
-G3 X54.791 Y27.726 I-0.097 J0.362 E0.0152 F1800
-G1 X53.238 Y33.521 E0.2195 F1800
-G2 X53.963 Y33.715 I0.362 J0.097 E0.0431 F1800
-G1 X55.515 Y27.920 E0.2195 F1800
-G3 X55.975 Y27.655 I0.362 J0.097 E0.0152 F1800
-G1 X58.390 Y28.302 E0.0915 F1800
-G3 X58.655 Y28.761 I-0.097 J0.362 E0.0152 F1800
-G1 X57.102 Y34.557 E0.2195 F1800
-G2 X57.826 Y34.751 I0.362 J0.097 E0.0431 F1800
-G1 X59.379 Y28.955 E0.2195 F1800
-G3 X59.838 Y28.690 I0.362 J0.097 E0.0152 F1800
-G1 X62.253 Y29.337 E0.0915 F1800
-G3 X62.518 Y29.796 I-0.097 J0.362 E0.0152 F1800
-G1 X60.966 Y35.592 E0.2195 F1800
-G2 X61.690 Y35.786 I0.362 J0.097 E0.0431 F1800
-G1 X63.243 Y29.990 E0.2195 F1800
-G3 X63.702 Y29.725 I0.362 J0.097 E0.0152 F1800
-G1 X66.117 Y30.372 E0.0915 F1800
-G3 X66.382 Y30.832 I-0.097 J0.362 E0.0152 F1800
-G1 X64.829 Y36.627 E0.2195 F1800
-G2 X65.554 Y36.821 I0.362 J0.097 E0.0431 F1800
-G1 X67.107 Y31.026 E0.2195 F1800
-G3 X67.566 Y30.760 I0.362 J0.097 E0.0152 F1800
-G1 X69.981 Y31.408 E0.0915 F1800
-G3 X70.246 Y31.867 I-0.097 J0.362 E0.0152 F1800
-G1 X68.693 Y37.662 E0.2195 F1800
-G2 X69.417 Y37.856 I0.362 J0.097 E0.0431 F1800
-G1 X70.970 Y32.061 E0.2195 F1800
-G3 X71.430 Y31.796 I0.362 J0.097 E0.0152 F1800
-G1 X73.844 Y32.443 E0.0915 F1800
-G3 X74.110 Y32.902 I-0.097 J0.362 E0.0152 F1800
-G1 X72.557 Y38.698 E0.2195 F1800
-G2 X73.281 Y38.892 I0.362 J0.097 E0.0431 F1800
-G1 X74.834 Y33.096 E0.2195 F1800
-G3 X75.293 Y32.831 I0.362 J0.097 E0.0152 F1800
-G1 X77.708 Y33.478 E0.0915 F1800
-G3 X77.973 Y33.937 I-0.097 J0.362 E0.0152 F1800
-G1 X76.420 Y39.733 E0.2195 F1800
-G2 X77.145 Y39.927 I0.362 J0.097 E0.0431 F1800
-G1 X78.698 Y34.131 E0.2195 F1800
-G3 X79.157 Y33.866 I0.362 J0.097 E0.0152 F1800
-G1 X81.572 Y34.513 E0.0915 F1800
-G3 X81.837 Y34.973 I-0.097 J0.362 E0.0152 F1800
-G1 X80.284 Y40.768
+G1 X14.460 Y22.924
+G2 X15.184 Y23.118 I0.362 J0.097 E0.0431 F1800
+G1 X16.737 Y17.322 E0.2195 F1800
+G3 X17.196 Y17.057 I0.362 J0.097 E0.0152 F1800
+G1 X19.611 Y17.704 E0.0915 F1800
+G3 X19.876 Y18.163 I-0.097 J0.362 E0.0152 F1800
+G1 X18.323 Y23.959 E0.2195 F1800
+G2 X19.048 Y24.153 I0.362 J0.097 E0.0431 F1800
+G1 X20.601 Y18.357 E0.2195 F1800
+G3 X21.060 Y18.092 I0.362 J0.097 E0.0152 F1800
+G1 X23.475 Y18.739 E0.0915 F1800
+G3 X23.740 Y19.199 I-0.097 J0.362 E0.0152 F1800
+G1 X22.187 Y24.994 E0.2195 F1800
+G2 X22.912 Y25.188 I0.362 J0.097 E0.0431 F1800
+G1 X24.464 Y19.393 E0.2195 F1800
+G3 X24.924 Y19.127 I0.362 J0.097 E0.0152 F1800
+G1 X27.339 Y19.775 E0.0915 F1800
+G3 X27.604 Y20.234 I-0.097 J0.362 E0.0152 F1800
+G1 X26.051 Y26.029 E0.2195 F1800
+G2 X26.775 Y26.223 I0.362 J0.097 E0.0431 F1800
+G1 X28.328 Y20.428 E0.2195 F1800
+G3 X28.787 Y20.163 I0.362 J0.097 E0.0152 F1800
+G1 X31.202 Y20.810 E0.0915 F1800
+G3 X31.467 Y21.269 I-0.097 J0.362 E0.0152 F1800
+G1 X29.914 Y27.065 E0.2195 F1800
+G2 X30.639 Y27.259 I0.362 J0.097 E0.0431 F1800
+G1 X32.192 Y21.463 E0.2195 F1800
+G3 X32.651 Y21.198 I0.362 J0.097 E0.0152 F1800
+G1 X35.066 Y21.845 E0.0915 F1800
+G3 X35.331 Y22.304 I-0.097 J0.362 E0.0152 F1800
+G1 X33.778 Y28.100 E0.2195 F1800
+G2 X34.503 Y28.294 I0.362 J0.097 E0.0431 F1800
+G1 X36.056 Y22.498 E0.2195 F1800
+G3 X36.515 Y22.233 I0.362 J0.097 E0.0152 F1800
+G1 X38.930 Y22.880 E0.0915 F1800
+G3 X39.195 Y23.340 I-0.097 J0.362 E0.0152 F1800
+G1 X37.642 Y29.135 E0.2195 F1800
+G2 X38.366 Y29.329 I0.362 J0.097 E0.0431 F1800
+G1 X39.919 Y23.534 E0.2195 F1800
+G3 X40.379 Y23.269 I0.362 J0.097 E0.0152 F1800
+G1 X42.793 Y23.916 E0.0915 F1800
+G3 X43.058 Y24.375 I-0.097 J0.362 E0.0152 F1800
+G1 X41.506 Y30.170 E0.2195 F1800
+G2 X42.230 Y30.365 I0.362 J0.097 E0.0431 F1800
+G1 X43.783 Y24.569 E0.2195 F1800
+G3 X44.242 Y24.304 I0.362 J0.097 E0.0152 F1800
+G1 X46.657 Y24.951 E0.0915 F1800
+G3 X46.922 Y25.410 I-0.097 J0.362 E0.0152 F1800
+G1 X45.369 Y31.206 E0.2195 F1800
+G2 X46.094 Y31.400 I0.362 J0.097 E0.0431 F1800
+G1 X47.647 Y25.604 E0.2195 F1800
+G3 X48.106 Y25.339 I0.362 J0.097 E0.0152 F1800
+G1 X50.521 Y25.986 E0.0915 F1800
+G3 X50.786 Y26.445 I-0.097 J0.362 E0.0152 F1800
+G1 X49.233 Y32.241 E0.2195 F1800
+G2 X49.957 Y32.435 I0.362 J0.097 E0.0431 F1800
+G1 X51.510 Y26.640 E0.2195 F1800
+G3 X51.970 Y26.374 I0.362 J0.097 E0.0152 F1800
+G1 X54.384 Y27.021 E0.0915 F1800
+G3 X54.650 Y27.481 I-0.097 J0.362 E0.0152 F1800
+G1 X53.097 Y33.276 E0.2195 F1800
+G2 X53.821 Y33.470 I0.362 J0.097 E0.0431 F1800
+G1 X55.374 Y27.675 E0.2195 F1800
+G3 X55.833 Y27.410 I0.362 J0.097 E0.0152 F1800
+G1 X58.248 Y28.057 E0.0915 F1800
+G3 X58.513 Y28.516 I-0.097 J0.362 E0.0152 F1800
+G1 X56.960 Y34.312 E0.2195 F1800
+G2 X57.685 Y34.506 I0.362 J0.097 E0.0431 F1800
+G1 X59.238 Y28.710 E0.2195 F1800
+G3 X59.697 Y28.445 I0.362 J0.097 E0.0152 F1800
+G1 X62.112 Y29.092 E0.0915 F1800
+G3 X62.377 Y29.551 I-0.097 J0.362 E0.0152 F1800
+G1 X60.824 Y35.347 E0.2195 F1800
+G2 X61.549 Y35.541 I0.362 J0.097 E0.0431 F1800
+G1 X63.101 Y29.745 E0.2195 F1800
+G3 X63.561 Y29.480 I0.362 J0.097 E0.0152 F1800
+G1 X65.976 Y30.127 E0.0915 F1800
+G3 X66.241 Y30.587 I-0.097 J0.362 E0.0152 F1800
+G1 X64.688 Y36.382 E0.2195 F1800
+G2 X65.412 Y36.576 I0.362 J0.097 E0.0431 F1800
+G1 X66.965 Y30.781 E0.2195 F1800
+G3 X67.424 Y30.516 I0.362 J0.097 E0.0152 F1800
+G1 X69.839 Y31.163 E0.0915 F1800
+G3 X70.104 Y31.622 I-0.097 J0.362 E0.0152 F1800
+G1 X68.551 Y37.417 E0.2195 F1800
+G2 X69.276 Y37.612 I0.362 J0.097 E0.0431 F1800
+G1 X70.829 Y31.816 E0.2195 F1800
+G3 X71.288 Y31.551 I0.362 J0.097 E0.0152 F1800
+G1 X73.703 Y32.198 E0.0915 F1800
+G3 X73.968 Y32.657 I-0.097 J0.362 E0.0152 F1800
+G1 X72.415 Y38.453 E0.2195 F1800
+G2 X73.140 Y38.647 I0.362 J0.097 E0.0431 F1800
+G1 X74.693 Y32.851 E0.2195 F1800
+G3 X75.152 Y32.586 I0.362 J0.097 E0.0152 F1800
+G1 X77.567 Y33.233 E0.0915 F1800
+G3 X77.832 Y33.692 I-0.097 J0.362 E0.0152 F1800
+G1 X76.279 Y39.488 E0.2195 F1800
+G2 X77.003 Y39.682 I0.362 J0.097 E0.0431 F1800
+G1 X78.556 Y33.887 E0.2195 F1800
+G3 X79.016 Y33.621 I0.362 J0.097 E0.0152 F1800
+G1 X81.430 Y34.268 E0.0915 F1800
+G3 X81.696 Y34.728 I-0.097 J0.362 E0.0152 F1800
+G1 X80.143 Y40.523
 G1 Z0.850 E-5.0000 F4800
-G1 X79.714 Y45.792 F1800
+G1 X79.573 Y45.547 F1800
 G1 Z0.350 E5.0000 F4800
-G1 X78.161 Y51.587
-G3 X77.437 Y51.393 I-0.362 J-0.097 E0.0431 F1800
-G1 X78.990 Y45.598 E0.2195 F1800
-G2 X78.725 Y45.139 I-0.362 J-0.097 E0.0152 F1800
-G1 X76.310 Y44.491 E0.0915 F1800
-G2 X75.851 Y44.757 I-0.097 J0.362 E0.0152 F1800
-G1 X74.298 Y50.552 E0.2195 F1800
-G3 X73.573 Y50.358 I-0.362 J-0.097 E0.0431 F1800
-G1 X75.126 Y44.563 E0.2195 F1800
-G2 X74.861 Y44.103 I-0.362 J-0.097 E0.0152 F1800
-G1 X72.446 Y43.456 E0.0915 F1800
-G2 X71.987 Y43.721 I-0.097 J0.362 E0.0152 F1800
-G1 X70.434 Y49.517 E0.2195 F1800
-G3 X69.710 Y49.323 I-0.362 J-0.097 E0.0431 F1800
-G1 X71.263 Y43.527 E0.2195 F1800
-G2 X70.997 Y43.068 I-0.362 J-0.097 E0.0152 F1800
-G1 X68.583 Y42.421 E0.0915 F1800
-G2 X68.123 Y42.686 I-0.097 J0.362 E0.0152 F1800
-G1 X66.570 Y48.482 E0.2195 F1800
-G3 X65.846 Y48.288 I-0.362 J-0.097 E0.0431 F1800
-G1 X67.399 Y42.492 E0.2195 F1800
-G2 X67.134 Y42.033 I-0.362 J-0.097 E0.0152 F1800
-G1 X64.719 Y41.386 E0.0915 F1800
-G2 X64.260 Y41.651 I-0.097 J0.362 E0.0152 F1800
-G1 X62.707 Y47.446 E0.2195 F1800
-G3 X61.982 Y47.252 I-0.362 J-0.097 E0.0431 F1800
-G1 X63.535 Y41.457 E0.2195 F1800
-G2 X63.270 Y40.997 I-0.362 J-0.097 E0.0152 F1800
-G1 X60.855 Y40.350 E0.0915 F1800
-G2 X60.396 Y40.616 I-0.097 J0.362 E0.0152 F1800
-G1 X58.843 Y46.411 E0.2195 F1800
-G3 X58.119 Y46.217 I-0.362 J-0.097 E0.0431 F1800
-G1 X59.671 Y40.421 E0.2195 F1800
-G2 X59.406 Y39.962 I-0.362 J-0.097 E0.0152 F1800
-G1 X56.991 Y39.315 E0.0915 F1800
-G2 X56.532 Y39.580 I-0.097 J0.362 E0.0152 F1800
-G1 X54.979 Y45.376 E0.2195 F1800
-G3 X54.255 Y45.182 I-0.362 J-0.097 E0.0431 F1800
-G1 X55.808 Y39.386 E0.2195 F1800
-G2 X55.543 Y38.927 I-0.362 J-0.097 E0.0152 F1800
-G1 X53.128 Y38.280 E0.0915 F1800
-G2 X52.668 Y38.545 I-0.097 J0.362 E0.0152 F1800
-G1 X51.116 Y44.341 E0.2195 F1800
-G3 X50.391 Y44.146 I-0.362 J-0.097 E0.0431 F1800
-G1 X51.944 Y38.351 E0.2195 F1800
-G2 X51.679 Y37.892 I-0.362 J-0.097 E0.0152 F1800
-G1 X49.264 Y37.245 E0.0915 F1800
-G2 X48.805 Y37.510 I-0.097 J0.362 E0.0152 F1800
-G1 X47.252 Y43.305 E0.2195 F1800
-G3 X46.527 Y43.111 I-0.362 J-0.097 E0.0431 F1800
-G1 X48.080 Y37.316 E0.2195 F1800
-G2 X47.815 Y36.856 I-0.362 J-0.097 E0.0152 F1800
-G1 X45.400 Y36.209 E0.0915 F1800
-G2 X44.941 Y36.474 I-0.097 J0.362 E0.0152 F1800
-G1 X43.388 Y42.270 E0.2195 F1800
-G3 X42.664 Y42.076 I-0.362 J-0.097 E0.0431 F1800
-G1 X44.217 Y36.280 E0.2195 F1800
-G2 X43.951 Y35.821 I-0.362 J-0.097 E0.0152 F1800
-G1 X41.537 Y35.174 E0.0915 F1800
-G2 X41.077 Y35.439 I-0.097 J0.362 E0.0152 F1800
-G1 X39.524 Y41.235 E0.2195 F1800
-G3 X38.800 Y41.041 I-0.362 J-0.097 E0.0431 F1800
-G1 X40.353 Y35.245 E0.2195 F1800
-G2 X40.088 Y34.786 I-0.362 J-0.097 E0.0152 F1800
-G1 X37.673 Y34.139 E0.0915 F1800
-G2 X37.214 Y34.404 I-0.097 J0.362 E0.0152 F1800
-G1 X35.661 Y40.199 E0.2195 F1800
-G3 X34.936 Y40.005 I-0.362 J-0.097 E0.0431 F1800
-G1 X36.489 Y34.210 E0.2195 F1800
-G2 X36.224 Y33.750 I-0.362 J-0.097 E0.0152 F1800
-G1 X33.809 Y33.103 E0.0915 F1800
-G2 X33.350 Y33.369 I-0.097 J0.362 E0.0152 F1800
-G1 X31.797 Y39.164 E0.2195 F1800
-G3 X31.073 Y38.970 I-0.362 J-0.097 E0.0431 F1800
-G1 X32.625 Y33.174 E0.2195 F1800
-G2 X32.360 Y32.715 I-0.362 J-0.097 E0.0152 F1800
-G1 X29.946 Y32.068 E0.0915 F1800
-G2 X29.486 Y32.333 I-0.097 J0.362 E0.0152 F1800
-G1 X27.933 Y38.129 E0.2195 F1800
-G3 X27.209 Y37.935 I-0.362 J-0.097 E0.0431 F1800
-G1 X28.762 Y32.139 E0.2195 F1800
-G2 X28.497 Y31.680 I-0.362 J-0.097 E0.0152 F1800
-G1 X26.082 Y31.033 E0.0915 F1800
-G2 X25.623 Y31.298 I-0.097 J0.362 E0.0152 F1800
-G1 X24.070 Y37.094 E0.2195 F1800
-G3 X23.345 Y36.899 I-0.362 J-0.097 E0.0431 F1800
-G1 X24.898 Y31.104 E0.2195 F1800
-G2 X24.633 Y30.645 I-0.362 J-0.097 E0.0152 F1800
-G1 X22.218 Y29.998 E0.0915 F1800
-G2 X21.759 Y30.263 I-0.097 J0.362 E0.0152 F1800
-G1 X20.206 Y36.058 E0.2195 F1800
-G3 X19.481 Y35.864 I-0.362 J-0.097 E0.0431 F1800
-G1 X21.034 Y30.069 E0.2195 F1800
-G2 X20.769 Y29.609 I-0.362 J-0.097 E0.0152 F1800
-G1 X18.354 Y28.962 E0.0915 F1800
-G2 X17.895 Y29.228 I-0.097 J0.362 E0.0152 F1800
-G1 X16.342 Y35.023 E0.2195 F1800
-G3 X15.618 Y34.829 I-0.362 J-0.097 E0.0431 F1800
-G1 X17.171 Y29.033 E0.2195 F1800
-G2 X16.906 Y28.574 I-0.362 J-0.097 E0.0152 F1800
-G1 X14.491 Y27.927 E0.0915 F1800
-G2 X14.031 Y28.192 I-0.097 J0.362 E0.0152 F1800
-G1 X12.479 Y33.988
+G1 X78.020 Y51.343
+G3 X77.296 Y51.148 I-0.362 J-0.097 E0.0431 F1800
+G1 X78.849 Y45.353 E0.2195 F1800
+G2 X78.583 Y44.894 I-0.362 J-0.097 E0.0152 F1800
+G1 X76.169 Y44.247 E0.0915 F1800
+G2 X75.709 Y44.512 I-0.097 J0.362 E0.0152 F1800
+G1 X74.156 Y50.307 E0.2195 F1800
+G3 X73.432 Y50.113 I-0.362 J-0.097 E0.0431 F1800
+G1 X74.985 Y44.318 E0.2195 F1800
+G2 X74.720 Y43.858 I-0.362 J-0.097 E0.0152 F1800
+G1 X72.305 Y43.211 E0.0915 F1800
+G2 X71.846 Y43.476 I-0.097 J0.362 E0.0152 F1800
+G1 X70.293 Y49.272 E0.2195 F1800
+G3 X69.568 Y49.078 I-0.362 J-0.097 E0.0431 F1800
+G1 X71.121 Y43.282 E0.2195 F1800
+G2 X70.856 Y42.823 I-0.362 J-0.097 E0.0152 F1800
+G1 X68.441 Y42.176 E0.0915 F1800
+G2 X67.982 Y42.441 I-0.097 J0.362 E0.0152 F1800
+G1 X66.429 Y48.237 E0.2195 F1800
+G3 X65.704 Y48.043 I-0.362 J-0.097 E0.0431 F1800
+G1 X67.257 Y42.247 E0.2195 F1800
+G2 X66.992 Y41.788 I-0.362 J-0.097 E0.0152 F1800
+G1 X64.577 Y41.141 E0.0915 F1800
+G2 X64.118 Y41.406 I-0.097 J0.362 E0.0152 F1800
+G1 X62.565 Y47.201 E0.2195 F1800
+G3 X61.841 Y47.007 I-0.362 J-0.097 E0.0431 F1800
+G1 X63.394 Y41.212 E0.2195 F1800
+G2 X63.129 Y40.752 I-0.362 J-0.097 E0.0152 F1800
+G1 X60.714 Y40.105 E0.0915 F1800
+G2 X60.254 Y40.371 I-0.097 J0.362 E0.0152 F1800
+G1 X58.702 Y46.166 E0.2195 F1800
+G3 X57.977 Y45.972 I-0.362 J-0.097 E0.0431 F1800
+G1 X59.530 Y40.176 E0.2195 F1800
+G2 X59.265 Y39.717 I-0.362 J-0.097 E0.0152 F1800
+G1 X56.850 Y39.070 E0.0915 F1800
+G2 X56.391 Y39.335 I-0.097 J0.362 E0.0152 F1800
+G1 X54.838 Y45.131 E0.2195 F1800
+G3 X54.113 Y44.937 I-0.362 J-0.097 E0.0431 F1800
+G1 X55.666 Y39.141 E0.2195 F1800
+G2 X55.401 Y38.682 I-0.362 J-0.097 E0.0152 F1800
+G1 X52.986 Y38.035 E0.0915 F1800
+G2 X52.527 Y38.300 I-0.097 J0.362 E0.0152 F1800
+G1 X50.974 Y44.096 E0.2195 F1800
+G3 X50.250 Y43.901 I-0.362 J-0.097 E0.0431 F1800
+G1 X51.803 Y38.106 E0.2195 F1800
+G2 X51.537 Y37.647 I-0.362 J-0.097 E0.0152 F1800
+G1 X49.123 Y37.000 E0.0915 F1800
+G2 X48.663 Y37.265 I-0.097 J0.362 E0.0152 F1800
+G1 X47.110 Y43.060 E0.2195 F1800
+G3 X46.386 Y42.866 I-0.362 J-0.097 E0.0431 F1800
+G1 X47.939 Y37.071 E0.2195 F1800
+G2 X47.674 Y36.611 I-0.362 J-0.097 E0.0152 F1800
+G1 X45.259 Y35.964 E0.0915 F1800
+G2 X44.800 Y36.229 I-0.097 J0.362 E0.0152 F1800
+G1 X43.247 Y42.025 E0.2195 F1800
+G3 X42.522 Y41.831 I-0.362 J-0.097 E0.0431 F1800
+G1 X44.075 Y36.035 E0.2195 F1800
+G2 X43.810 Y35.576 I-0.362 J-0.097 E0.0152 F1800
+G1 X41.395 Y34.929 E0.0915 F1800
+G2 X40.936 Y35.194 I-0.097 J0.362 E0.0152 F1800
+G1 X39.383 Y40.990 E0.2195 F1800
+G3 X38.659 Y40.796 I-0.362 J-0.097 E0.0431 F1800
+G1 X40.211 Y35.000 E0.2195 F1800
+G2 X39.946 Y34.541 I-0.362 J-0.097 E0.0152 F1800
+G1 X37.532 Y33.894 E0.0915 F1800
+G2 X37.072 Y34.159 I-0.097 J0.362 E0.0152 F1800
+G1 X35.519 Y39.954 E0.2195 F1800
+G3 X34.795 Y39.760 I-0.362 J-0.097 E0.0431 F1800
+G1 X36.348 Y33.965 E0.2195 F1800
+G2 X36.083 Y33.506 I-0.362 J-0.097 E0.0152 F1800
+G1 X33.668 Y32.858 E0.0915 F1800
+G2 X33.209 Y33.124 I-0.097 J0.362 E0.0152 F1800
+G1 X31.656 Y38.919 E0.2195 F1800
+G3 X30.931 Y38.725 I-0.362 J-0.097 E0.0431 F1800
+G1 X32.484 Y32.930 E0.2195 F1800
+G2 X32.219 Y32.470 I-0.362 J-0.097 E0.0152 F1800
+G1 X29.804 Y31.823 E0.0915 F1800
+G2 X29.345 Y32.088 I-0.097 J0.362 E0.0152 F1800
+G1 X27.792 Y37.884 E0.2195 F1800
+G3 X27.067 Y37.690 I-0.362 J-0.097 E0.0431 F1800
+G1 X28.620 Y31.894 E0.2195 F1800
+G2 X28.355 Y31.435 I-0.362 J-0.097 E0.0152 F1800
+G1 X25.940 Y30.788 E0.0915 F1800
+G2 X25.481 Y31.053 I-0.097 J0.362 E0.0152 F1800
+G1 X23.928 Y36.849 E0.2195 F1800
+G3 X23.204 Y36.655 I-0.362 J-0.097 E0.0431 F1800
+G1 X24.757 Y30.859 E0.2195 F1800
+G2 X24.492 Y30.400 I-0.362 J-0.097 E0.0152 F1800
+G1 X22.077 Y29.753 E0.0915 F1800
+G2 X21.617 Y30.018 I-0.097 J0.362 E0.0152 F1800
+G1 X20.064 Y35.813 E0.2195 F1800
+G3 X19.340 Y35.619 I-0.362 J-0.097 E0.0431 F1800
+G1 X20.893 Y29.824 E0.2195 F1800
+G2 X20.628 Y29.364 I-0.362 J-0.097 E0.0152 F1800
+G1 X18.213 Y28.717 E0.0915 F1800
+G2 X17.754 Y28.983 I-0.097 J0.362 E0.0152 F1800
+G1 X16.201 Y34.778 E0.2195 F1800
+G3 X15.476 Y34.584 I-0.362 J-0.097 E0.0431 F1800
+G1 X17.029 Y28.788 E0.2195 F1800
+G2 X16.764 Y28.329 I-0.362 J-0.097 E0.0152 F1800
+G1 X14.349 Y27.682 E0.0915 F1800
+G2 X13.890 Y27.947 I-0.097 J0.362 E0.0152 F1800
+G1 X12.337 Y33.743
 G1 Z0.850 E-5.0000 F4800
 ;print vertical interlocked signal pattern 4
 G1 X7.198 Y-34.203 F1800
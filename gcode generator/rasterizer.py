@@ -0,0 +1,490 @@
+"""
+.. module:: rasterizer
+    :synopsis: Render gcode into images that look like a scan of the printed calibration pattern
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The printed moves are taken from the gcode as parsed by the :mod:`simulator`, so the output of both the :class:`generator.generator` and the :class:`toolpath.toolpath` class can be rendered. Every printed line and arc is drawn with the width of the extruded line, calculated from the nozzle diameter and the extrusion multiplier of its tool. Arcs are split in short lines. All lines are then split in pieces that are not much longer than the line is wide, such that the coverage of every pixel near a piece can be calculated for many pieces at once in a small window.
+
+The image is rendered in square tiles. Every piece is put in a bucket of each tile it can affect, so a tile only looks at the pieces near it and the memory use is bounded by the size of a tile, regardless of the size of the image. Images are written as 24 bit BMP files, the format of the scans used by the analyser, one tile at a time.
+"""
+import argparse
+import math
+import struct
+import numpy as np
+
+from config import printer_config
+from simulator import simulator
+
+_file_header = struct.Struct("<2sIHHI")
+_info_header = struct.Struct("<IiiHHIIiiII")
+
+
+def _gaussian(sigma):
+    """Normalised gaussian kernel with a radius of three standard deviations
+    """
+    radius = int(math.ceil(3*sigma))
+    if sigma <= 0 or radius == 0:
+        return np.ones(1)
+    kernel = np.exp(-0.5*(np.arange(-radius,radius+1)/sigma)**2)
+    return kernel/kernel.sum()
+
+
+def tool_number(name):
+    """Get the tool number from the name of a tool as used by the :mod:`simulator`, for example 2 for T2
+
+    :param name: The name of the tool
+    :return: The tool number, or -1 when no tool is selected
+    :rtype: int
+    """
+    if name[:1] == 'T' and name[1:].isdigit():
+        return int(name[1:])
+    return -1
+
+
+def line_widths(config,tool_numbers):
+    """Calculate the width of the lines printed by tools from their nozzle diameter and extrusion multiplier. Unknown tools get the width of the first tool.
+
+    :param config: The :class:`config.printer_config` used to generate the gcode
+    :param tool_numbers: Array with a tool number per line
+    :return: The width of every line in millimeter
+    :rtype: numpy.ndarray
+    """
+    widths = {tool:nozzle*multiplier for tool,nozzle,multiplier in zip(config.tools,config.nozzle_diameters,config.extrusion_multiplier)}
+    default_width = config.nozzle_diameters[0]*config.extrusion_multiplier[0]
+    return np.array([widths.get(tool,default_width) for tool in np.asarray(tool_numbers).tolist()],dtype=float)
+
+
+def split_moves(x0,y0,x1,y1,kind,i,j,piece_length,chord_tolerance):
+    """Split lines and arcs in straight pieces of at most piece_length. Arcs are also split such that the pieces deviate at most chord_tolerance from the arc.
+
+    :param x0: Array with the x coordinate of the start of every move
+    :param y0: Array with the y coordinate of the start of every move
+    :param x1: Array with the x coordinate of the end of every move
+    :param y1: Array with the y coordinate of the end of every move
+    :param kind: Array with the number of the G command of every move, 2 and 3 are arcs
+    :param i: Array with the x coordinate of the arc center relative to the start
+    :param j: Array with the y coordinate of the arc center relative to the start
+    :param piece_length: Maximum length of a piece
+    :param chord_tolerance: Maximum distance between an arc and its pieces
+    :return: Arrays with the index of the move every piece belongs to, and the start (x0, y0) and end (x1, y1) of every piece
+    :rtype: tuple
+    """
+    arc = kind >= 2
+    cx = x0+i
+    cy = y0+j
+    radius = np.hypot(i,j)
+    start_angle = np.arctan2(y0-cy,x0-cx)
+    end_angle = np.arctan2(y1-cy,x1-cx)
+    counter_clockwise = np.mod(end_angle-start_angle,2*math.pi)
+    clockwise = np.mod(start_angle-end_angle,2*math.pi)
+    #an arc that ends where it starts is a full circle
+    counter_clockwise[counter_clockwise <= 1e-9] = 2*math.pi
+    clockwise[clockwise <= 1e-9] = 2*math.pi
+    sweep = np.where(kind == 2,-clockwise,counter_clockwise)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        max_angle = 2*np.arccos(np.clip(1-chord_tolerance/radius,-1,1))
+        n_arc = np.maximum(np.abs(sweep)*radius/piece_length,np.abs(sweep)/max_angle)
+    length = np.where(arc,np.nan_to_num(n_arc),np.hypot(x1-x0,y1-y0)/piece_length)
+    n = np.maximum(np.ceil(length),1).astype(np.intp)
+
+    move = np.repeat(np.arange(len(n)),n)
+    step = np.arange(len(move))-np.repeat(np.cumsum(n)-n,n)
+    t0 = step/n[move]
+    t1 = (step+1)/n[move]
+    is_arc = arc[move]
+    angle0 = start_angle[move]+sweep[move]*t0
+    angle1 = start_angle[move]+sweep[move]*t1
+    px0 = np.where(is_arc,cx[move]+radius[move]*np.cos(angle0),x0[move]+(x1-x0)[move]*t0)
+    py0 = np.where(is_arc,cy[move]+radius[move]*np.sin(angle0),y0[move]+(y1-y0)[move]*t0)
+    px1 = np.where(is_arc,cx[move]+radius[move]*np.cos(angle1),x0[move]+(x1-x0)[move]*t1)
+    py1 = np.where(is_arc,cy[move]+radius[move]*np.sin(angle1),y0[move]+(y1-y0)[move]*t1)
+    return move,px0,py0,px1,py1
+
+
+class rasterizer:
+    """Renders gcode into a grayscale image, or into a colour image with a colour per tool. The gcode is given piece by piece using :meth:`rasterizer.write`, after which the image can be rendered in memory using :meth:`rasterizer.render` or written tile by tile to a BMP file using :meth:`rasterizer.write_bmp`. For example:
+
+    .. code-block:: python
+
+        image = rasterizer(pattern.gen.config)
+        image.dpi = 600
+        image.blur = 0.03
+        image.write_all(pattern.iter_full_interlocked_print([1,2,3,4,5],2))
+        image.write_bmp("example_12345-1.bmp")
+
+    :param config: The :class:`config.printer_config` used to generate the gcode, which gives the tool numbers, nozzle diameters and extrusion multipliers used to find the width of the lines, and the center of the print
+    """
+
+    dpi = 1200
+    """Resolution of the image in dots per inch"""
+
+    page_width = 297
+    """Width of the page in millimeter. By default an A4 page in landscape orientation, on which the interlocked calibration print of five tools fits."""
+
+    page_height = 210
+    """Height of the page in millimeter"""
+
+    origin = None
+    """Position on the bed (x, y) in millimeter that ends up in the center of the page. By default the center of the print (x_center and y_center of the config)."""
+
+    paper_rotation = 0
+    """Rotation of the paper on the scanner in radians"""
+
+    mirror = False
+    """Mirror the image left to right, like a scanner that sees the paper from below"""
+
+    tool_offsets = None
+    """Dictionary with the offset (x, y) in millimeter on the bed of the lines of every tool number, to simulate a printer of which the nozzles are not aligned. Lines of tools that are not in the dictionary are not moved."""
+
+    blur = 0
+    """Standard deviation of the gaussian blur of the scanner in millimeter"""
+
+    noise = 0
+    """Standard deviation of the noise added to every pixel, as fraction of the full scale"""
+
+    seed = 0
+    """Seed of the noise. Every tile uses its own random generator derived from this seed, so the noise does not depend on the order in which tiles are rendered."""
+
+    paper = 235
+    """Gray value of the paper"""
+
+    ink = 40
+    """Gray value of the printed lines in a grayscale image"""
+
+    tool_colors = None
+    """Dictionary with the colour (red, green, blue) of the lines of every tool number. When set, a colour image is made in which overlapping lines of different tools mix like ink. Tools that are not in the dictionary get the gray value ink."""
+
+    tile_size = 1024
+    """Size in pixels of the square tiles in which the image is rendered"""
+
+    chord_tolerance = 0.1
+    """Maximum distance in pixels between an arc and the lines it is split in"""
+
+    window_elements = 1 << 16
+    """Maximum number of pixel coverages that is calculated at once. Small enough to keep the intermediate arrays in the cache of the processor."""
+
+    def __init__(self,config=None):
+        if config is None:
+            config = printer_config()
+        self.config = config
+        self.simulator = simulator()
+        self._pieces = None
+        self._pieces_key = None
+
+    def write(self,code):
+        """Add a piece of gcode. The gcode does not have to consist of whole lines.
+
+        :param code: The gcode
+        """
+        self.simulator.write(code)
+        self._pieces = None
+
+    def write_all(self,codes):
+        """Add gcode from an iterable, for example the output of :meth:`calibration_pattern.iter_full_interlocked_print`
+
+        :param codes: Iterable with pieces of gcode
+        """
+        for code in codes:
+            self.write(code)
+
+    @property
+    def shape(self):
+        """Size of the image in pixels (rows, columns)"""
+        return (int(round(self.page_height/25.4*self.dpi)),int(round(self.page_width/25.4*self.dpi)))
+
+    def segments(self):
+        """Get all printed moves of the gcode written so far
+
+        :return: Arrays with the start position (x0, y0) and end position (x1, y1) on the bed, the kind (the number of the G command), the arc center relative to the start (i, j), the width of the line in millimeter and the tool number of every printed move
+        :rtype: tuple
+        """
+        x0,y0,z0,x1,y1,z1,e,feed,kind,i,j,stop,sections,tools = self.simulator.moves()
+        printed = np.flatnonzero((e > 0) & ((x0 != x1) | (y0 != y1) | (kind >= 2)))
+        tool_numbers = np.array([tool_number(name) for name in self.simulator.tools])[tools[printed]]
+        width = line_widths(self.config,tool_numbers)
+        x0 = x0[printed]
+        y0 = y0[printed]
+        x1 = x1[printed]
+        y1 = y1[printed]
+        if self.tool_offsets:
+            for number,(x_offset,y_offset) in self.tool_offsets.items():
+                selected = tool_numbers == number
+                x0[selected] += x_offset
+                x1[selected] += x_offset
+                y0[selected] += y_offset
+                y1[selected] += y_offset
+        return x0,y0,x1,y1,kind[printed],i[printed],j[printed],width,tool_numbers
+
+    def _to_pixels(self,x,y):
+        """Convert positions on the bed to pixel coordinates (column, row) in which the center of pixel (r, c) is at (c+0.5, r+0.5)
+        """
+        origin = self.origin
+        if origin is None:
+            origin = (self.config.x_center,self.config.y_center)
+        cos = math.cos(self.paper_rotation)
+        sin = math.sin(self.paper_rotation)
+        x_rel = x-origin[0]
+        y_rel = y-origin[1]
+        x_page = cos*x_rel-sin*y_rel+self.page_width/2
+        y_page = sin*x_rel+cos*y_rel+self.page_height/2
+        if self.mirror:
+            x_page = self.page_width-x_page
+        scale = self.dpi/25.4
+        return x_page*scale,(self.page_height-y_page)*scale
+
+    def pieces(self):
+        """Split all printed moves in short straight pieces in pixel coordinates
+
+        :return: Arrays with the start (u0, v0) and end (u1, v1) of every piece in pixels, the half width of its line in pixels and its layer (the index of its tool in tool_colors, or 0 for grayscale images), and a list with the colour of every layer
+        :rtype: tuple
+        """
+        key = (self.config,self.dpi,self.page_width,self.page_height,self.origin,self.paper_rotation,self.mirror,None if self.tool_offsets is None else tuple(sorted(self.tool_offsets.items())),self.chord_tolerance,self.ink,self.tool_colors)
+        if self._pieces is not None and self._pieces_key == key:
+            return self._pieces
+        x0,y0,x1,y1,kind,i,j,width,tool = self.segments()
+        scale = self.dpi/25.4
+        half_width = width*scale/2
+        piece_length = (2*half_width.max()+2)/scale if len(width) else 1
+
+        move,px0,py0,px1,py1 = split_moves(x0,y0,x1,y1,kind,i,j,piece_length,self.chord_tolerance/scale)
+        u0,v0 = self._to_pixels(px0,py0)
+        u1,v1 = self._to_pixels(px1,py1)
+
+        if self.tool_colors is None:
+            layer = np.zeros(len(move),dtype=np.intp)
+            colors = [(self.ink,)*3]
+        else:
+            numbers = list(self.tool_colors)
+            colors = [tuple(self.tool_colors[number]) for number in numbers]+[(self.ink,)*3]
+            index = {number:layer for layer,number in enumerate(numbers)}
+            layer = np.array([index.get(number,len(numbers)) for number in tool.tolist()],dtype=np.intp)[move]
+        self._pieces = (u0,v0,u1,v1,half_width[move],layer,colors)
+        self._pieces_key = key
+        return self._pieces
+
+    def _buckets(self,halo):
+        """Sort the pieces by the tiles they can affect
+
+        :return: For every tile (row, column) the indexes of the pieces
+        :rtype: dict
+        """
+        u0,v0,u1,v1,half_width,layer,colors = self.pieces()
+        reach = half_width+1+halo
+        size = self.tile_size
+        rows,columns = self.shape
+        first_row = np.clip(np.floor((np.minimum(v0,v1)-reach)/size),0,(rows-1)//size).astype(np.intp)
+        last_row = np.clip(np.floor((np.maximum(v0,v1)+reach)/size),0,(rows-1)//size).astype(np.intp)
+        first_column = np.clip(np.floor((np.minimum(u0,u1)-reach)/size),0,(columns-1)//size).astype(np.intp)
+        last_column = np.clip(np.floor((np.maximum(u0,u1)+reach)/size),0,(columns-1)//size).astype(np.intp)
+        #pieces entirely outside the page are dropped
+        inside = (np.maximum(v0,v1)+reach >= 0) & (np.minimum(v0,v1)-reach < rows) & (np.maximum(u0,u1)+reach >= 0) & (np.minimum(u0,u1)-reach < columns)
+        tiles = []
+        indexes = []
+        for row_step in range(int((last_row-first_row).max(initial=0))+1):
+            for column_step in range(int((last_column-first_column).max(initial=0))+1):
+                selected = np.flatnonzero(inside & (first_row+row_step <= last_row) & (first_column+column_step <= last_column))
+                tiles.append((first_row[selected]+row_step)*(columns//size+1)+first_column[selected]+column_step)
+                indexes.append(selected)
+        tiles = np.concatenate(tiles) if tiles else np.zeros(0,dtype=np.intp)
+        indexes = np.concatenate(indexes) if indexes else np.zeros(0,dtype=np.intp)
+        order = np.argsort(tiles,kind='stable')
+        tiles = tiles[order]
+        indexes = indexes[order]
+        starts = np.flatnonzero(np.concatenate(([True],tiles[1:] != tiles[:-1]))) if len(tiles) else np.zeros(0,dtype=np.intp)
+        ends = np.append(starts[1:],len(tiles))
+        return {divmod(int(tiles[start]),columns//size+1):indexes[start:end] for start,end in zip(starts,ends)}
+
+    def _coverage(self,selected,row,column,height,width):
+        """Calculate the fraction of every pixel of a region covered by the pieces, per layer
+        """
+        u0,v0,u1,v1,half_width,layer,colors = self.pieces()
+        coverage = np.zeros((len(colors),height,width),dtype=np.float32)
+        if len(selected) == 0:
+            return coverage
+        flat = coverage.reshape(-1)
+        window = int(math.ceil(np.hypot(u1-u0,v1-v0)[selected].max()+2*half_width[selected].max()+3))
+        offsets = np.arange(window,dtype=np.float32)
+        chunk = max(1,self.window_elements//(window*window))
+        for start in range(0,len(selected),chunk):
+            pieces = selected[start:start+chunk]
+            corner_u = np.floor(np.minimum(u0,u1)[pieces]-half_width[pieces]-1)
+            corner_v = np.floor(np.minimum(v0,v1)[pieces]-half_width[pieces]-1)
+            d_u = (u1-u0)[pieces].astype(np.float32)[:,None,None]
+            d_v = (v1-v0)[pieces].astype(np.float32)[:,None,None]
+            length2 = d_u*d_u+d_v*d_v
+            length2[length2 == 0] = np.inf
+            radius = half_width[pieces].astype(np.float32)[:,None,None]
+            #position of every pixel center in the window relative to the start of the piece
+            p_u = (corner_u+0.5-u0[pieces]).astype(np.float32)[:,None,None]+offsets[None,None,:]
+            p_v = (corner_v+0.5-v0[pieces]).astype(np.float32)[:,None,None]+offsets[None,:,None]
+            t = (p_u*d_u+p_v*d_v)/length2
+            np.clip(t,0,1,out=t)
+            e_u = p_u-t*d_u
+            e_v = p_v-t*d_v
+            value = radius+0.5-np.sqrt(e_u*e_u+e_v*e_v)
+            np.minimum(value,1,out=value)
+            piece,window_v,window_u = np.nonzero(value > 0)
+            local_u = corner_u.astype(np.intp)[piece]-column+window_u
+            local_v = corner_v.astype(np.intp)[piece]-row+window_v
+            keep = (local_u >= 0) & (local_u < width) & (local_v >= 0) & (local_v < height)
+            index = (layer[pieces][piece]*height+local_v)*width+local_u
+            np.maximum.at(flat,index[keep],value[piece[keep],window_v[keep],window_u[keep]])
+        return coverage
+
+    def render_tile(self,row,column,height,width):
+        """Render a rectangular part of the image
+
+        :param row: First row of the part
+        :param column: First column of the part
+        :param height: Number of rows
+        :param width: Number of columns
+        :return: The gray values (height by width), or for colour images the red, green and blue values (height by width by 3), as 8 bit integers
+        :rtype: numpy.ndarray
+        """
+        halo = len(_gaussian(self.blur*self.dpi/25.4))//2
+        return self._render(row,column,height,width,self._select(row-halo,column-halo,height+2*halo,width+2*halo))
+
+    def _render(self,row,column,height,width,selected):
+        kernel = _gaussian(self.blur*self.dpi/25.4)
+        halo = len(kernel)//2
+        if len(selected) == 0:
+            #nothing printed near this tile
+            halo = 0
+        coverage = self._coverage(selected,row-halo,column-halo,height+2*halo,width+2*halo)
+        if halo:
+            #separable gaussian blur, the halo around the tile makes the result independent of the tiles
+            kernel = kernel.astype(np.float32)
+            blurred = kernel[0]*coverage[:,:height,:]
+            for k in range(1,len(kernel)):
+                blurred += kernel[k]*coverage[:,k:k+height,:]
+            coverage = kernel[0]*blurred[:,:,:width]
+            for k in range(1,len(kernel)):
+                coverage += kernel[k]*blurred[:,:,k:k+width]
+        colors = np.array(self.pieces()[6],dtype=np.float32)/255
+        if self.tool_colors is None:
+            image = coverage[0]
+            image *= self.ink-self.paper
+            image += self.paper
+        else:
+            #every layer absorbs part of the light like ink
+            image = np.full((height,width,3),self.paper,dtype=np.float32)
+            for layer in range(len(colors)):
+                image *= 1-coverage[layer][:,:,None]*(1-colors[layer])
+        if self.noise:
+            generator = np.random.default_rng((self.seed,row,column))
+            image += generator.standard_normal(image.shape,dtype=np.float32)*np.float32(self.noise*255)
+        np.rint(image,out=image)
+        np.clip(image,0,255,out=image)
+        return image.astype(np.uint8)
+
+    def _select(self,row,column,height,width):
+        """Find the pieces that can affect a region
+        """
+        u0,v0,u1,v1,half_width,layer,colors = self.pieces()
+        reach = half_width+1
+        return np.flatnonzero((np.maximum(v0,v1)+reach >= row) & (np.minimum(v0,v1)-reach < row+height) & (np.maximum(u0,u1)+reach >= column) & (np.minimum(u0,u1)-reach < column+width))
+
+    def tiles(self):
+        """Render the image tile by tile
+
+        :return: Iterator over the tiles, as tuples of the first row, the first column and the image of the tile (see :meth:`rasterizer.render_tile`)
+        :rtype: iterator
+        """
+        rows,columns = self.shape
+        size = self.tile_size
+        halo = len(_gaussian(self.blur*self.dpi/25.4))//2
+        buckets = self._buckets(halo)
+        empty = np.zeros(0,dtype=np.intp)
+        for row in range(0,rows,size):
+            for column in range(0,columns,size):
+                selected = buckets.get((row//size,column//size),empty)
+                yield row,column,self._render(row,column,min(size,rows-row),min(size,columns-column),selected)
+
+    def render(self):
+        """Render the whole image in memory. For large images use :meth:`rasterizer.write_bmp` instead.
+
+        :return: The image, see :meth:`rasterizer.render_tile`
+        :rtype: numpy.ndarray
+        """
+        rows,columns = self.shape
+        image = None
+        for row,column,tile in self.tiles():
+            if image is None:
+                image = np.empty((rows,columns)+tile.shape[2:],dtype=np.uint8)
+            image[row:row+tile.shape[0],column:column+tile.shape[1]] = tile
+        return image
+
+    def write_bmp(self,file_name):
+        """Render the image tile by tile and write it to a 24 bit BMP file. Every tile is written as soon as it is rendered, so only a single tile is kept in memory.
+
+        :param file_name: Name of the BMP file
+        """
+        rows,columns = self.shape
+        stride = (3*columns+3)//4*4
+        offset = _file_header.size+_info_header.size
+        pixels_per_meter = int(round(self.dpi/0.0254))
+        with open(file_name,"wb") as f:
+            f.write(_file_header.pack(b"BM",offset+stride*rows,0,0,offset))
+            f.write(_info_header.pack(_info_header.size,columns,rows,1,24,0,stride*rows,pixels_per_meter,pixels_per_meter,0,0))
+            f.truncate(offset+stride*rows)
+            for row,column,tile in self.tiles():
+                if tile.ndim == 2:
+                    tile = np.repeat(tile[:,:,None],3,axis=2)
+                #the rows of a BMP file are stored from bottom to top, and the colours as blue, green, red
+                data = np.ascontiguousarray(tile[:,:,::-1]).reshape(tile.shape[0],-1)
+                for i1 in range(tile.shape[0]):
+                    f.seek(offset+(rows-1-row-i1)*stride+3*column)
+                    f.write(data[i1].tobytes())
+
+
+def rasterize(code,file_name,config=None,**settings):
+    """Render gcode to a BMP file
+
+    :param code: The gcode, either a string or an iterable of pieces of gcode
+    :param file_name: Name of the BMP file
+    :param config: The :class:`config.printer_config` used to generate the gcode
+    :param settings: Attributes of the :class:`rasterizer.rasterizer` to change, for example dpi or blur
+    :return: The rasterizer
+    :rtype: rasterizer
+    """
+    image = rasterizer(config)
+    for name,value in settings.items():
+        if not hasattr(rasterizer,name):
+            raise Exception("Unknown setting given to rasterize: %s" % (name))
+        setattr(image,name,value)
+    if isinstance(code,str):
+        image.write(code)
+    else:
+        image.write_all(code)
+    image.write_bmp(file_name)
+    return image
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a gcode file into an image that looks like a scan of the print")
+    parser.add_argument("input",help="gcode file to render")
+    parser.add_argument("output",help="BMP file the image is written to")
+    parser.add_argument("--dpi",type=float,default=rasterizer.dpi,help="resolution of the image")
+    parser.add_argument("--blur",type=float,default=rasterizer.blur,help="standard deviation of the blur in millimeter")
+    parser.add_argument("--noise",type=float,default=rasterizer.noise,help="standard deviation of the noise as fraction of the full scale")
+    parser.add_argument("--paper-rotation",type=float,default=rasterizer.paper_rotation,help="rotation of the paper in radians")
+    parser.add_argument("--mirror",action="store_true",help="mirror the image, like a scan of the paper seen from below")
+    parser.add_argument("--seed",type=int,default=rasterizer.seed,help="seed of the noise")
+    args = parser.parse_args()
+
+    image = rasterizer()
+    image.dpi = args.dpi
+    image.blur = args.blur
+    image.noise = args.noise
+    image.paper_rotation = args.paper_rotation
+    image.mirror = args.mirror
+    image.seed = args.seed
+    with open(args.input) as f:
+        for chunk in iter(lambda: f.read(1 << 20),""):
+            image.write(chunk)
+    image.write_bmp(args.output)
+    print("%.0f by %.0f pixels written to %s" % (image.shape[1],image.shape[0],args.output))
+
+
+if __name__ == '__main__':
+    main()
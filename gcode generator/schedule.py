@@ -0,0 +1,266 @@
+"""
+.. module:: schedule
+    :synopsis: Choose the order in which the patterns of a full interlocked print are printed
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Every differential pattern of a full interlocked print (see :meth:`calibration_pattern.full_interlocked_print`) is treated as a block that consists of two halves, which can be printed in either order. The reference blocks are printed first, directly after the square, using the reference tool. The signal blocks are grouped per tool, such that every tool is selected only once, starting with the reference tool when it also prints a signal pattern. The order of the blocks and of their halves is chosen to minimise the travel distance, using a nearest neighbour tour that is improved using 2-opt. For the order of the tools all permutations are tried when there are only a few tools.
+"""
+import copy
+import itertools
+import math
+
+from generator import generator
+
+tool_change_time = 30
+"""Estimated time in seconds of a tool change, including heating up the new tool from its standby temperature"""
+
+max_permutation_tools = 6
+"""Maximum number of tools for which all orders of the tools are tried. For more tools the nearest tool is chosen every time."""
+
+
+class tracker(generator):
+    """Generator that only keeps track of the position instead of generating gcode. Used to find the start and end point of every part of a print quickly.
+    """
+
+    def __init__(self,config=None):
+        super().__init__(config)
+        self.current_tool_index = -1
+        self.curr_x = 0
+        self.curr_y = 0
+        self.entry = None
+        """Position of the first move_to since entry was last reset"""
+
+    def move_to(self,x,y):
+        if self.entry is None:
+            self.entry = (x,y)
+        self.curr_x = x
+        self.curr_y = y
+        return ""
+
+    def line(self,x,y):
+        self.curr_x += x
+        self.curr_y += y
+        return ""
+
+    def move(self,x,y):
+        return self.line(x,y)
+
+    def quarter_turn(self,x,y,clockwise):
+        return self.line(x,y)
+
+    def u_turn(self,x,y,clockwise):
+        return self.line(x,y)
+
+    def repeat(self,template,repetitions):
+        self.curr_x += repetitions*sum(move[1] for move in template)
+        self.curr_y += repetitions*sum(move[2] for move in template)
+        return ""
+
+
+def _distance(a,b):
+    return math.hypot(a[0]-b[0],a[1]-b[1])
+
+
+def _probe(job,iterator):
+    """Run part of a print on a tracker and return where it starts and ends
+    """
+    job.gen.entry = None
+    for code in iterator:
+        pass
+    return job.gen.entry,(job.gen.curr_x,job.gen.curr_y)
+
+
+def _orientations(halves):
+    """Get the entry point, exit point and internal travel of a block for both orders of its halves
+    """
+    (entry_a,exit_a),(entry_b,exit_b) = halves
+    return ((entry_a,exit_b,_distance(exit_a,entry_b)),
+            (entry_b,exit_a,_distance(exit_b,entry_a)))
+
+
+def path_travel(order,blocks,start):
+    """Calculate the travel of a fixed order of blocks with the best order of the halves of every block, using dynamic programming
+
+    :param order: List of block numbers
+    :param blocks: For every block the result of _orientations
+    :param start: The position before the first block
+    :return: The total travel, the reverse flag of every block in the order and the end position
+    :rtype: tuple
+    """
+    if not order:
+        return 0,[],start
+    costs = [_distance(start,entry)+internal for entry,exit,internal in blocks[order[0]]]
+    choices = []
+    for previous,current in zip(order,order[1:]):
+        new_costs = []
+        choice = []
+        for entry,exit,internal in blocks[current]:
+            options = [costs[o]+_distance(blocks[previous][o][1],entry) for o in range(2)]
+            best = 0 if options[0] <= options[1] else 1
+            choice.append(best)
+            new_costs.append(options[best]+internal)
+        choices.append(choice)
+        costs = new_costs
+    last = 0 if costs[0] <= costs[1] else 1
+    total = costs[last]
+    reverse = [last]
+    for choice in reversed(choices):
+        reverse.append(choice[reverse[-1]])
+    reverse.reverse()
+    return total,[bool(o) for o in reverse],blocks[order[-1]][last][1]
+
+
+def optimise_order(numbers,blocks,start):
+    """Find a short order of blocks, starting with a nearest neighbour tour that is improved using 2-opt
+
+    :param numbers: The block numbers to order
+    :param blocks: For every block the result of _orientations
+    :param start: The position before the first block
+    :return: The order, the total travel, the reverse flag of every block and the end position
+    :rtype: tuple
+    """
+    remaining = list(numbers)
+    order = []
+    position = start
+    while remaining:
+        best = min(remaining,key=lambda number: min(_distance(position,entry)+internal for entry,exit,internal in blocks[number]))
+        remaining.remove(best)
+        order.append(best)
+        position = path_travel(order,blocks,start)[2]
+
+    travel = path_travel(order,blocks,start)[0]
+    improved = True
+    while improved:
+        improved = False
+        for i1 in range(len(order)-1):
+            for i2 in range(i1+1,len(order)):
+                candidate = order[:i1]+order[i1:i2+1][::-1]+order[i2+1:]
+                candidate_travel = path_travel(candidate,blocks,start)[0]
+                if candidate_travel < travel-1e-9:
+                    order = candidate
+                    travel = candidate_travel
+                    improved = True
+    travel,reverse,end = path_travel(order,blocks,start)
+    return order,travel,reverse,end
+
+
+def plan(pattern,tool_list_indexes,reference_tool_index):
+    """Choose the order of the blocks of a full interlocked print
+
+    :param pattern: The :class:`calibration_pattern.calibration_pattern` job that generates the print, with n_tools set
+    :param tool_list_indexes: The tool index of every tool in the tool list
+    :param reference_tool_index: The tool index of the reference tool
+    :return: The blocks in the order they should be printed, as tuples of kind ('reference' or 'signal'), index in the tool list, direction ('y' or 'x'), tool index to change to before the block (or None) and wether the halves are printed in reverse order, and a report with the estimated travel and tool changes before and after scheduling
+    :rtype: tuple
+    """
+    job = copy.copy(pattern)
+    job.gen = tracker(pattern.gen.config)
+    square_exit = _probe(job,job._iter_square_section())[1]
+
+    keys = []
+    blocks = []
+    for kind in ('reference','signal'):
+        for i1 in range(job.n_tools):
+            for direction in ('y','x'):
+                x_start,y_start = job.pattern_start(i1,direction)
+                halves = [_probe(job,job.iter_differential_half(kind,half)) for half in job.differential_halves(kind,x_start,y_start,direction)]
+                keys.append((kind,i1,direction))
+                blocks.append(_orientations(halves))
+    number = {key:index for index,key in enumerate(keys)}
+
+    #the order of the original print
+    original = [number[('reference',i1,'y')] for i1 in range(job.n_tools)]
+    original += [number[('reference',i1,'x')] for i1 in range(job.n_tools)]
+    for i1 in range(job.n_tools):
+        original += [number[('signal',i1,'y')],number[('signal',i1,'x')]]
+    original_travel = _fixed_travel(original,blocks,square_exit)
+    original_changes = 0
+    current = reference_tool_index
+    for i1 in range(job.n_tools):
+        if tool_list_indexes[i1] != current:
+            original_changes += 1
+            current = tool_list_indexes[i1]
+
+    #references first, all with the reference tool
+    references = [number[('reference',i1,direction)] for i1 in range(job.n_tools) for direction in ('y','x')]
+    reference_order,reference_travel,reference_reverse,position = optimise_order(references,blocks,square_exit)
+
+    #signal patterns grouped per tool
+    groups = {}
+    for i1 in range(job.n_tools):
+        groups.setdefault(tool_list_indexes[i1],[]).extend([number[('signal',i1,'y')],number[('signal',i1,'x')]])
+    first = []
+    if reference_tool_index in groups:
+        first = [reference_tool_index]
+    others = [tool for tool in groups if tool != reference_tool_index]
+    if len(others) <= max_permutation_tools:
+        candidates = [(first+list(permutation),[]) for permutation in itertools.permutations(others)]
+    else:
+        candidates = [(first,others)]
+    best = None
+    for tools,nearest in candidates:
+        result = _plan_groups(tools,nearest,groups,blocks,position)
+        if best is None or result[0] < best[0]:
+            best = result
+    signal_travel,signal_plan = best
+
+    schedule = []
+    for block,reverse in zip(reference_order,reference_reverse):
+        kind,i1,direction = keys[block]
+        schedule.append((kind,i1,direction,None,reverse))
+    changes = 0
+    current = reference_tool_index
+    for tool,order,reverse in signal_plan:
+        for index,(block,block_reverse) in enumerate(zip(order,reverse)):
+            kind,i1,direction = keys[block]
+            schedule.append((kind,i1,direction,tool if index == 0 else None,block_reverse))
+        if tool != current:
+            changes += 1
+            current = tool
+
+    travel = reference_travel+signal_travel
+    speed = pattern.gen.print_speed
+    time_before = original_travel/speed+original_changes*tool_change_time
+    time_after = travel/speed+changes*tool_change_time
+    report = {'travel_before':original_travel,
+              'travel_after':travel,
+              'tool_changes_before':original_changes,
+              'tool_changes_after':changes,
+              'time_before':time_before,
+              'time_after':time_after,
+              'time_saved':time_before-time_after}
+    return schedule,report
+
+
+def _fixed_travel(order,blocks,start):
+    """Travel of an order of blocks without reversing any halves
+    """
+    travel = 0
+    position = start
+    for block in order:
+        entry,exit,internal = blocks[block][0]
+        travel += _distance(position,entry)+internal
+        position = exit
+    return travel
+
+
+def _plan_groups(tools,nearest,groups,blocks,start):
+    """Order the blocks within every group of a tool. The groups of tools are printed first in the given order, after which the group of the tools in nearest with the nearest block is chosen every time.
+    """
+    plan = []
+    travel = 0
+    position = start
+    remaining = list(nearest)
+    for tool in itertools.chain(tools,iter(lambda: _nearest_group(remaining,groups,blocks,position),None)):
+        order,group_travel,reverse,position = optimise_order(groups[tool],blocks,position)
+        travel += group_travel
+        plan.append((tool,order,reverse))
+    return travel,plan
+
+
+def _nearest_group(remaining,groups,blocks,position):
+    if not remaining:
+        return None
+    tool = min(remaining,key=lambda tool: min(_distance(position,entry) for block in groups[tool] for entry,exit,internal in blocks[block]))
+    remaining.remove(tool)
+    return tool
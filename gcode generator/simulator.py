@@ -0,0 +1,495 @@
+"""
+.. module:: simulator
+    :synopsis: Estimate the print time of gcode, per section, per tool and in total
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The simulator follows the motion planning of a typical printer firmware. Every move is given a trapezoidal speed profile with constant acceleration. The speed at the junction of two moves is limited using junction deviation, and arcs are limited to the speed at which the centripetal acceleration equals the acceleration. The speeds are planned over the whole program, as if the look ahead of the firmware was infinite. Commands other than moves (tool changes, homing, etc.) stop the motion and can be given a fixed duration.
+"""
+import argparse
+import math
+import re
+import warnings
+import numpy as np
+
+from sink import sink
+
+_CLOCKWISE = 2
+_COUNTER_CLOCKWISE = 3
+_move_commands = ('G0','G1','G2','G3')
+_move_letters = ('X','Y','Z','I','J','E','F')
+_remove_letters = str.maketrans("G"+"".join(_move_letters)," "*(len(_move_letters)+1))
+_other_line = re.compile(r"^(?!G[0-3] ).*$",re.M)
+
+#bytes that can occur in runs of moves, the bytes that separate words and the column of every letter
+_move_byte = np.zeros(256,dtype=bool)
+_move_byte[np.frombuffer(("G"+"".join(_move_letters)+"0123456789.- \n").encode(),dtype=np.uint8)] = True
+_separator_byte = np.zeros(256,dtype=bool)
+_separator_byte[[ord(' '),ord('\n')]] = True
+_letter_column = np.zeros(256,dtype=int)
+for _index,_letter in enumerate(_move_letters):
+    _letter_column[ord(_letter)] = _index+1
+
+
+def _fill(values,initial):
+    """Replace every nan by the last value before it that is not nan, or by initial
+    """
+    values = np.concatenate(([initial],values))
+    index = np.where(np.isnan(values),0,np.arange(len(values)))
+    np.maximum.accumulate(index,out=index)
+    return values[index][1:]
+
+
+class simulator:
+    """Print time estimator. Gcode can be given piece by piece using :meth:`simulator.write`, so the simulator can be used as output of for example :meth:`calibration_pattern.write_full_interlocked_print`, or a complete file can be simulated using :func:`simulator.simulate_file`. The gcode is parsed as it is written; only the moves themselves are kept until :meth:`simulator.report` is called.
+
+    Time is attributed to sections, which start at every comment starting with section_prefix (the comments of :meth:`calibration_pattern.full_interlocked_print`), and to the tool that is selected.
+    """
+
+    acceleration = 1000
+    """Acceleration in mm/s^2 of moves in the xy plane"""
+
+    z_acceleration = 200
+    """Acceleration in mm/s^2 of the z axis"""
+
+    e_acceleration = 2000
+    """Acceleration in mm/s^2 of the extruder"""
+
+    max_speed = 300
+    """Maximum speed in mm/s in the xy plane"""
+
+    max_z_speed = 15
+    """Maximum speed in mm/s of the z axis"""
+
+    max_e_speed = 80
+    """Maximum speed in mm/s of the extruder"""
+
+    junction_deviation = 0.05
+    """Junction deviation in millimeter, determines how fast corners can be taken"""
+
+    tool_change_time = 30
+    """Time in seconds of a tool change (a T command), including heating up the new tool"""
+
+    command_times = {'G28':20,'G32':60}
+    """Time in seconds of other commands that take time, like homing (G28) and bed probing (G32). Commands that wait for the user (like M25) are not included."""
+
+    section_prefix = "print "
+    """Comments starting with this text start a new section"""
+
+    def __init__(self):
+        self._partial = ""
+        self._rows = []
+        self._blocks = []
+        self._n_rows = 0
+        self._modes = [(0,True,False,False)]
+        self._stops = [0]
+        self._commands = []
+        self.sections = ["start"]
+        """Names of the sections started so far, the section of every move is an index in this list"""
+        self._section_index = {"start":0}
+        self._section_changes = [(0,0)]
+        self.tools = ["none"]
+        """Names of the tools selected so far, the tool of every move is an index in this list"""
+        self._tool_index = {"none":0}
+        self._tool_changes = [(0,0)]
+        self._absolute = True
+        self._relative_extrusion = False
+        self.lines = 0
+        """Number of lines simulated"""
+
+    def write(self,code):
+        """Simulate a piece of gcode. The gcode does not have to consist of whole lines.
+
+        :param code: The gcode
+        """
+        text = self._partial+code
+        end = text.rfind('\n')+1
+        self._partial = text[end:]
+        self._parse(text[:end])
+
+    def write_all(self,codes):
+        """Simulate gcode from an iterable, for example the output of :meth:`calibration_pattern.iter_full_interlocked_print`
+
+        :param codes: Iterable with pieces of gcode
+        """
+        for code in codes:
+            self.write(code)
+
+    def _parse(self,text):
+        """Split complete lines of gcode in moves and other commands. The runs of moves between other lines are converted to numbers all at once.
+        """
+        self.lines += text.count('\n')
+        start = 0
+        for other in _other_line.finditer(text):
+            if other.start() > start:
+                self._parse_moves(text[start:other.start()])
+            self._parse_line(other.group())
+            start = other.end()+1
+        if start < len(text):
+            self._parse_moves(text[start:])
+
+    def _parse_moves(self,text):
+        """Convert a run of complete move lines to a block of numbers. Every word is found from the bytes of the text, and all numbers are read at once after removing the letters. Runs that contain anything else than moves with simple words, like comments or other letters, are parsed line by line.
+        """
+        data = np.frombuffer(text.encode(),dtype=np.uint8)
+        values = None
+        if _move_byte[data].all():
+            separator = _separator_byte[data]
+            word_start = ~separator
+            word_start[1:] &= separator[:-1]
+            letters = data[word_start]
+            with warnings.catch_warnings():
+                #numbers like 1-2 or a lonely minus sign
+                warnings.simplefilter("error")
+                try:
+                    numbers = np.fromstring(text.translate(_remove_letters),sep=' ')
+                except (DeprecationWarning,ValueError):
+                    numbers = None
+            if numbers is not None and len(numbers) == len(letters):
+                command = letters == ord('G')
+                kind = numbers[command]
+                if len(kind) == text.count('\n') and np.isin(kind,(0,1,2,3)).all():
+                    row = np.cumsum(command)-1
+                    word = ~command
+                    values = np.full((len(kind),len(_move_letters)+1),np.nan)
+                    values[:,0] = kind
+                    values[row[word],_letter_column[letters[word]]] = numbers[word]
+        if values is None:
+            for line in text.split('\n'):
+                self._parse_line(line)
+            return
+        self._flush_rows()
+        self._blocks.append(values)
+        self._n_rows += len(values)
+
+    def _parse_line(self,line):
+        if not line.strip():
+            return
+        if line[0] == ';':
+            text = line[1:].strip()
+            if text.startswith(self.section_prefix):
+                self._set_section(text)
+            return
+        parts = line.split(';',1)[0].split()
+        if not parts:
+            return
+        if parts[0] in _move_commands:
+            words = {word[0]:word[1:] for word in parts[1:]}
+            try:
+                self._rows.append((float(parts[0][1]),)+tuple(float(words[letter]) if letter in words else math.nan for letter in _move_letters))
+            except ValueError:
+                raise Exception("Invalid number in gcode line: %s" % (line))
+            self._n_rows += 1
+        else:
+            self._command(parts[0])
+
+    def _flush_rows(self):
+        """Move the moves parsed line by line to the blocks
+        """
+        if self._rows:
+            self._blocks.append(np.array(self._rows).reshape(len(self._rows),len(_move_letters)+1))
+            self._rows = []
+
+    def _command(self,command):
+        duration = 0
+        n_rows = self._n_rows
+        if command[0] == 'T':
+            tool = command
+            if tool not in self._tool_index:
+                self._tool_index[tool] = len(self.tools)
+                self.tools.append(tool)
+            self._tool_changes.append((n_rows,self._tool_index[tool]))
+            duration = self.tool_change_time
+        elif command in ('M83','M82','G90','G91','G92'):
+            if command == 'M83':
+                self._relative_extrusion = True
+            elif command == 'M82':
+                self._relative_extrusion = False
+            elif command == 'G90':
+                self._absolute = True
+            elif command == 'G91':
+                self._absolute = False
+            self._modes.append((n_rows,self._absolute,self._relative_extrusion,command == 'G92'))
+        else:
+            duration = self.command_times.get(command,0)
+        if duration:
+            self._commands.append((duration,self._segment(self._section_changes,n_rows),self._segment(self._tool_changes,n_rows)))
+        self._stops.append(n_rows)
+
+    def _segment(self,changes,row):
+        """Get the value of the last change at or before a row
+        """
+        value = changes[0][1]
+        for change_row,change_value in changes:
+            if change_row > row:
+                break
+            value = change_value
+        return value
+
+    def _set_section(self,name):
+        if name not in self._section_index:
+            self._section_index[name] = len(self.sections)
+            self.sections.append(name)
+        self._section_changes.append((self._n_rows,self._section_index[name]))
+
+    def _per_row(self,changes,n_rows):
+        rows = np.array([change[0] for change in changes])
+        values = np.array([change[1] for change in changes])
+        return values[np.searchsorted(rows,np.arange(n_rows),side='right')-1]
+
+    def moves(self):
+        """Convert all moves simulated so far to arrays, with all modal values filled in
+
+        :return: Arrays with the start position (x0, y0, z0), end position (x1, y1, z1), extrusion, feedrate, kind (the number of the G command: 0 or 1 for lines, 2 for clockwise and 3 for counter clockwise arcs), arc center relative to the start (i, j), wether the move follows another command, and the section and tool of every move
+        :rtype: tuple
+        """
+        if self._partial:
+            self._parse(self._partial+'\n')
+            self._partial = ""
+        self._flush_rows()
+        n_rows = self._n_rows
+        values = np.concatenate(self._blocks) if self._blocks else np.zeros((0,len(_move_letters)+1))
+        kind = values[:,0]
+        x,y,z,i,j,e,feed = [values[:,index] for index in range(1,len(_move_letters)+1)]
+        i = np.nan_to_num(i)
+        j = np.nan_to_num(j)
+        feed = _fill(feed,1800.0)
+
+        #positions and extrusion per run of moves with the same modes
+        x1 = np.empty(n_rows)
+        y1 = np.empty(n_rows)
+        z1 = np.empty(n_rows)
+        extrusion = np.empty(n_rows)
+        position = [0.0,0.0,0.0]
+        e_position = 0.0
+        ends = [mode[0] for mode in self._modes[1:]]+[n_rows]
+        for (start,absolute,relative_extrusion,reset_e),end in zip(self._modes,ends):
+            if reset_e:
+                e_position = 0.0
+            if end <= start:
+                continue
+            for axis,(value,result) in enumerate(((x,x1),(y,y1),(z,z1))):
+                if absolute:
+                    result[start:end] = _fill(value[start:end],position[axis])
+                else:
+                    result[start:end] = position[axis]+np.cumsum(np.nan_to_num(value[start:end]))
+                position[axis] = result[end-1]
+            if relative_extrusion:
+                extrusion[start:end] = np.nan_to_num(e[start:end])
+            else:
+                absolute_e = _fill(e[start:end],e_position)
+                extrusion[start:end] = np.diff(np.concatenate(([e_position],absolute_e)))
+                e_position = absolute_e[-1]
+        x0 = np.concatenate(([0.0],x1[:-1]))
+        y0 = np.concatenate(([0.0],y1[:-1]))
+        z0 = np.concatenate(([0.0],z1[:-1]))
+
+        stop = np.zeros(n_rows,dtype=bool)
+        stops = np.array(self._stops)
+        stop[stops[stops < n_rows]] = True
+        sections = self._per_row(self._section_changes,n_rows)
+        tools = self._per_row(self._tool_changes,n_rows)
+        return x0,y0,z0,x1,y1,z1,extrusion,feed,kind,i,j,stop,sections,tools
+
+    def move_times(self):
+        """Plan all moves simulated so far and calculate the time every move takes
+
+        :return: Arrays with the time, the length and the extruded length of every move
+        :rtype: tuple
+        """
+        if not self._n_rows and not self._partial.strip():
+            return np.zeros(0),np.zeros(0),np.zeros(0)
+        x0,y0,z0,x1,y1,z1,e,feed,kind,i,j,stop,sections,tools = self.moves()
+        all_e = e
+        dx = x1-x0
+        dy = y1-y0
+        dz = z1-z0
+
+        #length and direction at the start and end of every move
+        arc = kind >= _CLOCKWISE
+        radius = np.hypot(i,j)
+        cx = x0+i
+        cy = y0+j
+        start_angle = np.arctan2(y0-cy,x0-cx)
+        end_angle = np.arctan2(y1-cy,x1-cx)
+        sweep = np.where(kind == _CLOCKWISE,start_angle-end_angle,end_angle-start_angle)
+        sweep = np.mod(sweep,2*math.pi)
+        #an arc that ends where it starts is a full circle
+        sweep[sweep <= 1e-9] = 2*math.pi
+        xy_length = np.where(arc,radius*sweep,np.hypot(dx,dy))
+        length = np.hypot(xy_length,dz)
+        e_only = length <= 1e-9
+        length = np.where(e_only,np.abs(e),length)
+
+        #moves that do not move anything are skipped by the firmware, but a stop before them is kept
+        n_moves = len(length)
+        keep = np.nonzero(length > 0)[0]
+        stopped = np.cumsum(stop)[keep]
+        stop = np.diff(np.concatenate(([0],stopped))) > 0
+        x0,y0,x1,y1,dx,dy,dz,e,feed,kind,i,j = [value[keep] for value in (x0,y0,x1,y1,dx,dy,dz,e,feed,kind,i,j)]
+        arc,radius,cx,cy,xy_length,length,e_only = [value[keep] for value in (arc,radius,cx,cy,xy_length,length,e_only)]
+        if len(keep) == 0:
+            return np.zeros(n_moves),np.zeros(n_moves),all_e
+
+        with np.errstate(divide='ignore',invalid='ignore'):
+            sign = np.where(kind == _CLOCKWISE,-1.0,1.0)
+            start_tx = np.where(arc,-sign*(y0-cy)/radius,dx/length)
+            start_ty = np.where(arc,sign*(x0-cx)/radius,dy/length)
+            end_tx = np.where(arc,-sign*(y1-cy)/radius,dx/length)
+            end_ty = np.where(arc,sign*(x1-cx)/radius,dy/length)
+            start_tz = np.where(e_only,0,dz/length)
+            if arc.any():
+                scale = np.where(arc,xy_length/length,1)
+                start_tx = start_tx*scale
+                start_ty = start_ty*scale
+                end_tx = end_tx*scale
+                end_ty = end_ty*scale
+
+            #speed and acceleration limits of every move
+            speed = np.minimum(feed/60,self.max_speed)
+            speed = np.where(dz != 0,np.minimum(speed,self.max_z_speed*length/np.abs(dz)),speed)
+            speed = np.where(e != 0,np.minimum(speed,self.max_e_speed*length/np.abs(e)),speed)
+            speed = np.where(arc,np.minimum(speed,np.sqrt(self.acceleration*radius)),speed)
+            acceleration = np.where(dz != 0,np.minimum(self.acceleration,self.z_acceleration*length/np.abs(dz)),self.acceleration)
+            acceleration = np.where(e_only,self.e_acceleration,acceleration)
+
+        #maximum speed at the start of every move, limited by junction deviation
+        cos_theta = -(end_tx[:-1]*start_tx[1:]+end_ty[:-1]*start_ty[1:]+start_tz[:-1]*start_tz[1:])
+        cos_theta = np.clip(cos_theta,-1,1)
+        sin_half = np.sqrt((1-cos_theta)/2)
+        with np.errstate(divide='ignore'):
+            junction = np.sqrt(acceleration[1:]*self.junction_deviation*sin_half/(1-sin_half))
+        junction = np.minimum(junction,np.minimum(speed[:-1],speed[1:]))
+        junction[stop[1:] | e_only[:-1] | e_only[1:]] = 0
+        entry = np.concatenate(([0],junction)).tolist()
+
+        #backward and forward pass
+        accel_distance = (2*acceleration*length).tolist()
+        n = len(entry)
+        exit_speed = 0.0
+        for k in range(n-1,-1,-1):
+            limit = math.sqrt(exit_speed*exit_speed+accel_distance[k])
+            if entry[k] > limit:
+                entry[k] = limit
+            exit_speed = entry[k]
+        for k in range(n-1):
+            limit = math.sqrt(entry[k]*entry[k]+accel_distance[k])
+            if entry[k+1] > limit:
+                entry[k+1] = limit
+        v0 = np.array(entry)
+        v1 = np.concatenate((v0[1:],[0]))
+
+        #time of the trapezoidal profile of every move
+        with np.errstate(divide='ignore',invalid='ignore'):
+            acceleration_length = (speed**2-v0**2)/(2*acceleration)
+            deceleration_length = (speed**2-v1**2)/(2*acceleration)
+            cruise = acceleration_length+deceleration_length <= length
+            peak = np.where(cruise,speed,np.sqrt(np.maximum((2*acceleration*length+v0**2+v1**2)/2,0)))
+            time = (peak-v0)/acceleration+(peak-v1)/acceleration
+            time = time+np.where(cruise,(length-acceleration_length-deceleration_length)/speed,0)
+        all_time = np.zeros(n_moves)
+        all_time[keep] = time
+        all_length = np.zeros(n_moves)
+        all_length[keep] = np.where(e_only,0,length)
+        return all_time,all_length,all_e
+
+    def report(self):
+        """Estimate the print time of all gcode simulated so far
+
+        :return: Dictionary with the total time, the time of all moves and of other commands, the time per section and per tool (all in seconds), the number of moves, the printed and travelled distance in millimeter and the extruded filament length in millimeter
+        :rtype: dict
+        """
+        time,length,e = self.move_times()
+        sections = self._per_row(self._section_changes,len(time))
+        tools = self._per_row(self._tool_changes,len(time))
+        section_times = np.bincount(sections,weights=time,minlength=len(self.sections))
+        tool_times = np.bincount(tools,weights=time,minlength=len(self.tools))
+        command_time = 0
+        for duration,section,tool in self._commands:
+            section_times[section] += duration
+            tool_times[tool] += duration
+            command_time += duration
+        printing = e > 0
+        move_time = float(time.sum())
+        return {'total_time':move_time+command_time,
+                'move_time':move_time,
+                'command_time':command_time,
+                'sections':{name:float(section_times[index]) for index,name in enumerate(self.sections)},
+                'tools':{name:float(tool_times[index]) for index,name in enumerate(self.tools) if tool_times[index] > 0},
+                'moves':len(time),
+                'print_distance':float(length[printing].sum()),
+                'travel_distance':float(length[~printing].sum()),
+                'extruded':float(e.sum())}
+
+
+class simulator_sink(sink):
+    """Sink that passes the gcode on to another output and simulates it at the same time, such that the print time is known as soon as the gcode is written
+
+    :param output: Object with a write method the gcode is written to. When it has a close method, it is closed together with this sink.
+    """
+
+    def __init__(self,output,buffer_size=None):
+        super().__init__(buffer_size)
+        self.output = output
+        self.simulator = simulator()
+
+    def write_chunk(self,chunk):
+        self.simulator.write(chunk)
+        self.output.write(chunk)
+
+    def close(self):
+        self.flush()
+        if hasattr(self.output,'close'):
+            self.output.close()
+
+
+def simulate(code):
+    """Estimate the print time of gcode
+
+    :param code: The gcode, either a string or an iterable of pieces of gcode
+    :return: The report, see :meth:`simulator.report`
+    :rtype: dict
+    """
+    estimator = simulator()
+    if isinstance(code,str):
+        estimator.write(code)
+    else:
+        estimator.write_all(code)
+    return estimator.report()
+
+
+def simulate_file(file_name):
+    """Estimate the print time of a gcode file, without reading the whole file in memory at once
+
+    :param file_name: Name of the gcode file
+    :return: The report, see :meth:`simulator.report`
+    :rtype: dict
+    """
+    estimator = simulator()
+    with open(file_name) as f:
+        for chunk in iter(lambda: f.read(sink.buffer_size),""):
+            estimator.write(chunk)
+    return estimator.report()
+
+
+def _format_time(seconds):
+    return "%.0f:%02.0f:%04.1f" % (seconds//3600,(seconds%3600)//60,seconds%60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate the print time of a gcode file")
+    parser.add_argument("file",help="gcode file to simulate")
+    args = parser.parse_args()
+
+    report = simulate_file(args.file)
+    print("total time %s (moves %s, other commands %s)" % (_format_time(report['total_time']),_format_time(report['move_time']),_format_time(report['command_time'])))
+    print("%.0f moves, %.0f mm printed, %.0f mm travelled, %.0f mm filament" % (report['moves'],report['print_distance'],report['travel_distance'],report['extruded']))
+    print("per section:")
+    for name,seconds in report['sections'].items():
+        print("  %-50s %s" % (name,_format_time(seconds)))
+    print("per tool:")
+    for name,seconds in report['tools'].items():
+        print("  %-50s %s" % (name,_format_time(seconds)))
+
+
+if __name__ == '__main__':
+    main()
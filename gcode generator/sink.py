@@ -0,0 +1,161 @@
+"""
+.. module:: sink
+    :synopsis: Buffered writers into which gcode can be streamed while it is being generated
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+"""
+
+class sink:
+    """Base class of the buffered writers. Gcode written to a sink is collected in a buffer and passed on in chunks of about :attr:`sink.buffer_size` characters, so memory use stays constant no matter how long the print is.
+    """
+
+    buffer_size = 65536
+    """Number of characters that are collected before a chunk is passed on"""
+
+    def __init__(self,buffer_size=None):
+        if buffer_size is not None:
+            self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self.bytes_written = 0
+
+    def write(self,code):
+        """Add gcode to the buffer and pass the buffer on once it is full
+
+        :param code: The gcode to write
+        """
+        self._buffer.append(code)
+        self._buffered += len(code)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def write_all(self,codes):
+        """Write all gcode from an iterable, for example the output of :meth:`calibration_pattern.iter_full_interlocked_print`
+
+        :param codes: Iterable with pieces of gcode
+        """
+        for code in codes:
+            self.write(code)
+
+    def flush(self):
+        """Pass the buffered gcode on as one chunk
+        """
+        if self._buffered:
+            chunk = "".join(self._buffer)
+            self._buffer = []
+            self._buffered = 0
+            self.bytes_written += len(chunk)
+            self.write_chunk(chunk)
+
+    def write_chunk(self,chunk):
+        """Pass a chunk of gcode on to wherever the sink writes to. Should be implemented by every sink.
+
+        :param chunk: The chunk of gcode
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Flush the remaining gcode and close the sink
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.close()
+
+
+class string_sink(sink):
+    """Sink that keeps the gcode in memory
+    """
+
+    def __init__(self,buffer_size=None):
+        super().__init__(buffer_size)
+        self._chunks = []
+
+    def write_chunk(self,chunk):
+        self._chunks.append(chunk)
+
+    def getvalue(self):
+        """Get all gcode written so far
+
+        :return: The gcode
+        :rtype: string
+        """
+        self.flush()
+        return "".join(self._chunks)
+
+
+class file_sink(sink):
+    """Sink that writes the gcode to a file
+
+    :param file: Name of the file to write to, or an already opened file object. A file that is opened by the sink is also closed by it.
+    """
+
+    def __init__(self,file,buffer_size=None):
+        super().__init__(buffer_size)
+        if isinstance(file,str):
+            self.file = open(file,"w")
+            self._owns_file = True
+        else:
+            self.file = file
+            self._owns_file = False
+
+    def write_chunk(self,chunk):
+        self.file.write(chunk)
+
+    def close(self):
+        self.flush()
+        if self._owns_file:
+            self.file.close()
+
+
+class socket_sink(sink):
+    """Sink that sends the gcode over a connected socket, for example to a printer
+
+    :param socket: The connected socket
+    :param encoding: Encoding used to convert the gcode to bytes
+    """
+
+    def __init__(self,socket,buffer_size=None,encoding="ascii"):
+        super().__init__(buffer_size)
+        self.socket = socket
+        self.encoding = encoding
+
+    def write_chunk(self,chunk):
+        self.socket.sendall(chunk.encode(self.encoding))
+
+
+class callback_sink(sink):
+    """Sink that calls a function with every chunk of gcode
+
+    :param callback: Function that is called with a chunk of gcode as only argument
+    """
+
+    def __init__(self,callback,buffer_size=None):
+        super().__init__(buffer_size)
+        self.callback = callback
+
+    def write_chunk(self,chunk):
+        self.callback(chunk)
+
+
+def chunks(codes,buffer_size=sink.buffer_size):
+    """Regroup small pieces of gcode in chunks of about buffer_size characters
+
+    :param codes: Iterable with pieces of gcode, for example the output of :meth:`calibration_pattern.iter_full_interlocked_print`
+    :param buffer_size: Number of characters after which a chunk is yielded
+    :return: Iterator over the chunks
+    :rtype: iterator
+    """
+    buffer = []
+    buffered = 0
+    for code in codes:
+        buffer.append(code)
+        buffered += len(code)
+        if buffered >= buffer_size:
+            yield "".join(buffer)
+            buffer = []
+            buffered = 0
+    if buffered:
+        yield "".join(buffer)
@@ -0,0 +1,215 @@
+"""
+.. module:: sweep
+    :synopsis: Generate many variants of a calibration print, for example for a grid of tool offsets, in parallel
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+"""
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from calibration_pattern import calibration_pattern
+from config import pattern_config
+from generator import generator
+from toolpath import toolpath
+from verifier import verifier
+
+render_parameters = ('x_offsets','y_offsets','rotation')
+"""Parameters that are applied when the gcode is formatted. Variants that only differ in these parameters share the same recorded geometry."""
+
+#recorded geometries, set in every worker process by _initialize
+_geometries = {}
+
+
+def _initialize(geometries):
+    global _geometries
+    _geometries = geometries
+
+
+def _render_variant(task):
+    """Format a single variant from its recorded geometry and write it to its file
+    """
+    geometry_key,settings,file_name,verify = task
+    start = time.perf_counter()
+    printer,batches = _geometries[geometry_key]
+    engine = toolpath(printer.replace(**settings))
+    check = verifier(engine.config) if verify else None
+    digest = hashlib.blake2b()
+    n_bytes = 0
+    with open(file_name,"w") as f:
+        for batch in batches:
+            code = engine.render(batch)
+            n_bytes += len(code)
+            digest.update(code.encode())
+            f.write(code)
+            if check is not None:
+                check.write(code)
+    report = None
+    if check is not None:
+        report = check.check()
+    return file_name,n_bytes,time.perf_counter()-start,report,digest.hexdigest()
+
+
+def record_geometry(pattern,tool_list,reference_tool):
+    """Record the toolpath of a full interlocked print once, without applying the tool offsets and the rotation
+
+    :param pattern: The configured :class:`calibration_pattern.calibration_pattern`
+    :param tool_list: List of tool numbers of the tools
+    :param reference_tool: Tool number of the reference tool
+    :return: The :class:`config.printer_config` of the pattern and the recorded batches, see :meth:`toolpath.toolpath.take`
+    :rtype: tuple
+    """
+    recorder = toolpath(pattern.gen.config)
+    recorder.record_only = True
+    job = calibration_pattern(pattern.config,recorder)
+    for code in job.iter_full_interlocked_print(tool_list,reference_tool):
+        pass
+    return pattern.gen.config,recorder.recorded
+
+
+def variants(grid):
+    """Expand a parameter grid into all its combinations
+
+    :param grid: Dictionary with for every parameter a list of values, for example {'x_offsets':[[0,0],[0,0.1]],'rotation':[0,math.pi/12]}
+    :return: A list with a dictionary of parameter values per variant
+    :rtype: list
+    """
+    names = list(grid)
+    return [dict(zip(names,values)) for values in itertools.product(*[grid[name] for name in names])]
+
+
+def sweep(grid,tool_list,reference_tool,folder,name="variant",pattern=None,processes=None,verify=False):
+    """Generate a full interlocked print for every combination of parameters in a grid, using a pool of processes. The geometry of the print is only recorded once for every combination of parameters that are not in :data:`sweep.render_parameters`. Every variant is written straight to its own file in folder, and an index file (name_index.csv) lists the parameters of every file.
+
+    .. code-block:: python
+
+        grid = {'x_offsets':[[0,0,0,0,0],[0,-0.05,0.05,-0.1,0.1]],
+                'rotation':[0,math.pi/12],
+                'interlocked_pitch':[0.6,0.75]}
+        report = sweep(grid,[1,2,3,4,5],2,"sweep")
+
+    :param grid: Dictionary with for every parameter a list of values. Parameters can be parameters of :class:`config.pattern_config` or :class:`config.printer_config`.
+    :param tool_list: List of tool numbers of the tools
+    :param reference_tool: Tool number of the reference tool
+    :param folder: Folder the variants are written to
+    :param name: Start of the file name of every variant
+    :param pattern: The :class:`calibration_pattern.calibration_pattern` used for all parameters that are not in the grid. When not given the default pattern is used.
+    :param processes: Number of processes to use. Defaults to the number of cores.
+    :param verify: Check every variant for overlapping lines, lines that are too close and moves outside the bed using the :mod:`verifier`. The result of every variant is written to name_verify.csv.
+    :return: A report with the number of variants and geometries, the total number of bytes, the time it took and the throughput, the variants of which the gcode is the same as that of an earlier variant (as pairs of file names), and when verify is enabled the files of the variants that did not pass
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    if pattern is None:
+        pattern = calibration_pattern()
+    os.makedirs(folder,exist_ok=True)
+
+    all_variants = variants(grid)
+    geometries = {}
+    tasks = []
+    for index,variant in enumerate(all_variants):
+        geometry = {key:value for key,value in variant.items() if key not in render_parameters}
+        geometry_key = json.dumps(geometry,sort_keys=True)
+        if geometry_key not in geometries:
+            pattern_values = {key:value for key,value in geometry.items() if key in pattern_config.__slots__}
+            printer_values = {key:value for key,value in geometry.items() if key not in pattern_config.__slots__}
+            job = calibration_pattern(pattern.config.replace(**pattern_values),generator(pattern.gen.config.replace(**printer_values)))
+            geometries[geometry_key] = record_geometry(job,tool_list,reference_tool)
+        settings = {key:value for key,value in variant.items() if key in render_parameters}
+        file_name = os.path.join(folder,"%s_%04.0f.gcode" % (name,index))
+        tasks.append((geometry_key,settings,file_name,verify))
+    record_time = time.perf_counter()-start
+
+    with open(os.path.join(folder,"%s_index.csv" % (name)),"w",newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["file"]+list(grid))
+        for task,variant in zip(tasks,all_variants):
+            writer.writerow([os.path.basename(task[2])]+[json.dumps(variant[key]) for key in grid])
+
+    if processes is None:
+        processes = os.cpu_count()
+    n_bytes = 0
+    checks = []
+    digests = {}
+    duplicates = []
+    with ProcessPoolExecutor(processes,initializer=_initialize,initargs=(geometries,)) as executor:
+        chunksize = max(1,len(tasks)//(4*processes))
+        for file_name,variant_bytes,variant_time,check,digest in executor.map(_render_variant,tasks,chunksize=chunksize):
+            n_bytes += variant_bytes
+            if check is not None:
+                checks.append((file_name,check))
+            #different parameters that give the same gcode usually mean a parameter is not applied
+            if digest in digests:
+                duplicates.append((file_name,digests[digest]))
+            else:
+                digests[digest] = file_name
+
+    failed = []
+    if verify:
+        with open(os.path.join(folder,"%s_verify.csv" % (name)),"w",newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["file","ok","overlaps","clearances","out_of_bed","min_gap"])
+            for file_name,check in checks:
+                writer.writerow([os.path.basename(file_name),check['ok'],check['n_overlaps'],check['n_clearances'],check['n_out_of_bed'],check['min_gap']])
+                if not check['ok']:
+                    failed.append(file_name)
+
+    total_time = time.perf_counter()-start
+    return {'variants':len(tasks),
+            'geometries':len(geometries),
+            'processes':processes,
+            'bytes':n_bytes,
+            'record_time':record_time,
+            'total_time':total_time,
+            'variants_per_second':len(tasks)/total_time,
+            'megabytes_per_second':n_bytes/total_time/1e6,
+            'duplicates':duplicates,
+            'failed':failed}
+
+
+def _offset_list(text):
+    return [float(value) for value in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate full interlocked calibration prints for a grid of parameters")
+    parser.add_argument("folder",help="folder the variants are written to")
+    parser.add_argument("--tools",type=int,nargs="+",default=[1,2,3,4,5],help="tool numbers of the tools")
+    parser.add_argument("--reference",type=int,default=2,help="tool number of the reference tool")
+    parser.add_argument("--x-offsets",type=_offset_list,nargs="+",help="comma separated x offsets of all tools, one list per variant")
+    parser.add_argument("--y-offsets",type=_offset_list,nargs="+",help="comma separated y offsets of all tools, one list per variant")
+    parser.add_argument("--rotation",type=float,nargs="+",help="rotations in degrees")
+    parser.add_argument("--interlocked-pitch",type=float,nargs="+",help="interlocked pitches in millimeter")
+    parser.add_argument("--name",default="variant",help="start of the file names")
+    parser.add_argument("--processes",type=int,help="number of processes, defaults to the number of cores")
+    parser.add_argument("--verify",action="store_true",help="check every variant for overlapping lines and moves outside the bed")
+    args = parser.parse_args()
+
+    grid = {}
+    if args.x_offsets:
+        grid['x_offsets'] = args.x_offsets
+    if args.y_offsets:
+        grid['y_offsets'] = args.y_offsets
+    if args.rotation:
+        grid['rotation'] = [angle*math.pi/180 for angle in args.rotation]
+    if args.interlocked_pitch:
+        grid['interlocked_pitch'] = args.interlocked_pitch
+
+    report = sweep(grid,args.tools,args.reference,args.folder,args.name,processes=args.processes,verify=args.verify)
+    print("generated %.0f variants from %.0f geometries using %.0f processes" % (report['variants'],report['geometries'],report['processes']))
+    print("%.1f MB in %.2f s: %.1f variants/s, %.1f MB/s" % (report['bytes']/1e6,report['total_time'],report['variants_per_second'],report['megabytes_per_second']))
+    for file_name,same_as in report['duplicates']:
+        print("warning: %s is the same as %s" % (file_name,same_as))
+    if args.verify:
+        print("%.0f variants did not pass the verification" % (len(report['failed'])))
+        for file_name in report['failed']:
+            print("  %s" % (file_name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+.. module:: test_binary_gcode
+    :synopsis: Checks that binary gcode decodes back to exactly the gcode that was encoded
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Run with pytest, or as a script.
+"""
+import io
+import os
+
+import binary_gcode
+from benchmark import golden_folder
+from calibration_pattern import calibration_pattern
+
+golden_files = ("interlocked_calibration_pattern_diabase.gcode","interlocked_calibration_pattern_diabase_one_tool_only_with_offsets.gcode","meander_print.gcode")
+
+odd_lines = "G1 X-0.000 Y1.500 E0.0100 F1800\n\n;comment\nG1 X1. Y.5\n  G1 X2.000  Y3.000 \nG2 X1.000 Y1.000 I-0.500 J0.000 E0.0123 F1800\nG1 X007 Y-0.0\nM104 S200 T1\nG1 X1.000 ;move"
+"""Gcode with lines that can not be stored as numbers without changing their text"""
+
+
+def _round_trip(code,**options):
+    data = io.BytesIO()
+    binary_gcode.encode(code,data,**options)
+    data.seek(0)
+    return binary_gcode.decode(data)
+
+
+def test_golden_files():
+    for name in golden_files:
+        with open(os.path.join(golden_folder,name)) as f:
+            code = f.read()
+        assert _round_trip(code) == code
+        assert _round_trip(code,compress=False,checksum=False) == code
+
+
+def test_empty():
+    assert _round_trip("") == ""
+    assert _round_trip([]) == ""
+    assert _round_trip("\n") == "\n"
+
+
+def test_no_trailing_newline():
+    for code in ("G1 X1.000 Y2.000",odd_lines,odd_lines+"\n"):
+        assert _round_trip(code) == code
+        assert _round_trip(code,block_lines=2) == code
+
+
+def test_sink_in_small_chunks():
+    pattern = calibration_pattern()
+    pattern.gen.rotation = 0.3
+    pattern.gen.x_offsets = [0.1,-0.05,0.05,-0.1,0.2]
+    code = "".join(pattern.iter_full_interlocked_print([1,2,3],2))+odd_lines
+    for chunk_size in (1,7,1000):
+        data = io.BytesIO()
+        #a block of 100 lines is much shorter than the print, so the chunks and the lines cross the block boundaries
+        with binary_gcode.binary_sink(data,buffer_size=1,block_lines=100) as output:
+            for i1 in range(0,len(code),chunk_size):
+                output.write(code[i1:i1+chunk_size])
+        assert output.bytes_encoded == len(data.getvalue())
+        data.seek(0)
+        blocks = list(binary_gcode.iter_decode(data))
+        assert len(blocks) > 10
+        assert "".join(blocks) == code
+
+
+if __name__ == "__main__":
+    for name,test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print("%s passed" % (name))
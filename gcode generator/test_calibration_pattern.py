@@ -0,0 +1,109 @@
+"""
+.. module:: test_calibration_pattern
+    :synopsis: Checks that the tool offsets are applied to the right parts of a full interlocked print
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Run with pytest, or as a script.
+"""
+import concurrent.futures
+import os
+import tempfile
+
+from calibration_pattern import calibration_pattern
+from sweep import sweep
+from toolpath import toolpath
+
+
+def _print(pattern,x_offsets,tool_list=(1,2,3,4,5),reference_tool=2):
+    pattern.gen.x_offsets = x_offsets
+    pattern.gen.y_offsets = [0,0,0,0,0]
+    return "".join(pattern.iter_full_interlocked_print(list(tool_list),reference_tool)).splitlines()
+
+
+def _sections(lines):
+    """Split a print in the parts before the comment of every pattern
+    """
+    sections = {}
+    name = 'start'
+    for line in lines:
+        if line.startswith(';print '):
+            name = line[len(';print '):]
+        sections.setdefault(name,[]).append(line)
+    return sections
+
+
+def test_offsets_of_one_tool():
+    for gen in (None,toolpath()):
+        pattern = calibration_pattern(gen=gen)
+        zero = _sections(_print(pattern,[0,0,0,0,0]))
+        moved = _sections(_print(pattern,[0,0,0.3,0,0]))
+        changed = sorted(name for name in zero if zero[name] != moved[name])
+        assert changed == ['horizontal interlocked signal pattern 2','vertical interlocked signal pattern 2'],changed
+
+
+def test_offsets_of_reference_tool():
+    pattern = calibration_pattern()
+    zero = _sections(_print(pattern,[0,0,0,0,0]))
+    moved = _sections(_print(pattern,[0,0.3,0,0,0]))
+    unchanged = sorted(name for name in zero if zero[name] == moved[name])
+    #the reference tool 2 is the second tool, so only the signal patterns of the other tools are not moved
+    assert unchanged == sorted('%s interlocked signal pattern %d' % (direction,i1) for direction in ('horizontal','vertical') for i1 in (0,2,3,4)),unchanged
+
+
+def test_reference_tool_not_in_tool_list():
+    pattern = calibration_pattern()
+    try:
+        _print(pattern,[0,0,0,0,0],tool_list=(3,4),reference_tool=1)
+    except Exception as error:
+        assert 'reference tool' in str(error)
+    else:
+        raise AssertionError("a reference tool that is not in the tool list should not be accepted")
+
+
+def test_sweep_variants_differ():
+    with tempfile.TemporaryDirectory() as folder:
+        report = sweep({'x_offsets':[[0,0,0,0,0],[0,0.3,0,0,0],[0,0,0,0,0.3]]},[1,2,3,4,5],2,folder,processes=1)
+        assert report['duplicates'] == [],report['duplicates']
+        report = sweep({'x_offsets':[[0,0,0,0,0],[0,0,0,0,0]]},[1,2,3,4,5],2,folder,processes=1)
+        assert [tuple(os.path.basename(name) for name in pair) for pair in report['duplicates']] == [('variant_0001.gcode','variant_0000.gcode')]
+
+
+def test_cached_sections():
+    for gen in (None,toolpath()):
+        pattern = calibration_pattern(gen=gen)
+        pattern.cache_sections = True
+        job = pattern.job()
+        _print(job,[0,0,0,0,0])
+        assert len(job.regenerated_sections) == 23
+        cached = _print(job,[0,0,0.2,0,0])
+        assert job.regenerated_sections == ['vertical signal 2','horizontal signal 2'],job.regenerated_sections
+        _print(job,[0,0.1,0.2,0,0])
+        expected = ['square']+['%s reference %d' % (direction,i1) for direction in ('vertical','horizontal') for i1 in range(5)]+['vertical signal 1','horizontal signal 1']
+        assert job.regenerated_sections == expected,job.regenerated_sections
+        job.cache_sections = False
+        assert _print(job,[0,0,0.2,0,0]) == cached
+        assert pattern.regenerated_sections == []
+
+
+def test_results_per_job():
+    pattern = calibration_pattern()
+    pattern.schedule_blocks = True
+    _print(pattern,[0,0,0,0,0])
+    assert pattern.regenerated_sections == [] and pattern.schedule_report is None
+    jobs = [pattern.job() for i1 in range(4)]
+    offsets = [[0,0,0,0,0],[0,0,0.2,0,0],[0,0,0,0,0.1],[0,0,0.2,0,0]]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        prints = list(executor.map(_print,jobs,offsets))
+    assert prints[1] == prints[3] and prints[0] != prints[1]
+    for job in jobs:
+        assert job.schedule_report is not None and job.schedule_report['travel_after'] <= job.schedule_report['travel_before']
+        #the start, square, stop and 20 patterns of the print of the job
+        assert len(set(job.regenerated_sections)) == len(job.regenerated_sections) == 23,job.regenerated_sections
+    assert pattern.regenerated_sections == [] and pattern.schedule_report is None
+
+
+if __name__ == "__main__":
+    for name,test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print("%s passed" % (name))
@@ -0,0 +1,52 @@
+"""
+.. module:: test_compact
+    :synopsis: Checks that compacted gcode is smaller and results in the same motion of the printer
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Run with pytest, or as a script.
+"""
+import os
+
+import compact
+from benchmark import golden_folder
+from calibration_pattern import calibration_pattern
+from sink import string_sink
+
+golden_files = ("interlocked_calibration_pattern_diabase.gcode","interlocked_calibration_pattern_diabase_one_tool_only_with_offsets.gcode","meander_print.gcode")
+
+
+def _check(original,compacted):
+    assert list(compact.motion(original)) == list(compact.motion(compacted))
+    assert compact.verify(original,compacted) > 0
+    assert len(compacted) < len(original)
+
+
+def test_golden_files():
+    for name in golden_files:
+        with open(os.path.join(golden_folder,name)) as f:
+            original = f.read()
+        _check(original,compact.compact(original))
+        _check(original,compact.compact(original,strip_comments=True))
+
+
+def test_rotated_print_with_offsets():
+    pattern = calibration_pattern()
+    pattern.gen.rotation = 0.4
+    pattern.gen.x_offsets = [0.1,-0.05,0.05,-0.1,0.2]
+    pattern.gen.y_offsets = [-0.1,0.05,0.15,0,0.1]
+    original = "".join(pattern.iter_full_interlocked_print([3,1,5],1))
+    _check(original,compact.compact(original))
+    #compacting the gcode piece by piece, with pieces that split lines, gives the same gcode
+    pieces = [original[i1:i1+97] for i1 in range(0,len(original),97)]
+    assert "".join(compact.iter_compact(pieces)) == compact.compact(original)
+    collected = string_sink(64)
+    with compact.compact_sink(collected) as output:
+        pattern.write_full_interlocked_print([3,1,5],1,output)
+    assert collected.getvalue() == compact.compact(original)
+
+
+if __name__ == "__main__":
+    for name,test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print("%s passed" % (name))
@@ -0,0 +1,74 @@
+"""
+.. module:: test_schedule
+    :synopsis: Checks that scheduling the blocks of a full interlocked print only changes the order in which the lines are printed
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Run with pytest, or as a script.
+"""
+import collections
+import math
+
+from calibration_pattern import calibration_pattern
+from generator import generator
+from toolpath import toolpath
+
+
+def _printed_lines(code):
+    """Count the printed lines and arcs of a print together with the tool that prints them, and sum the length of the travel moves
+    """
+    printed = collections.Counter()
+    travel = 0
+    tool = None
+    position = None
+    for line in code.splitlines():
+        words = line.split(';')[0].split()
+        if not words:
+            continue
+        if words[0].startswith('T'):
+            tool = words[0]
+            continue
+        if words[0] not in ('G0','G1','G2','G3'):
+            continue
+        values = {word[0]:float(word[1:]) for word in words[1:]}
+        if 'X' not in values or 'Y' not in values:
+            continue
+        if 'E' in values:
+            printed[(tool,line)] += 1
+        elif position is not None:
+            travel += math.hypot(values['X']-position[0],values['Y']-position[1])
+        position = (values['X'],values['Y'])
+    return printed,travel
+
+
+def _prints(tool_list,reference_tool,engine=generator,rotation=0):
+    codes = []
+    reports = []
+    for schedule_blocks in (False,True):
+        pattern = calibration_pattern(gen=engine())
+        pattern.gen.rotation = rotation
+        pattern.gen.x_offsets = [0.1,-0.05,0.05,-0.1,0.2]
+        pattern.gen.y_offsets = [-0.1,0.05,0.15,0,0.1]
+        pattern.schedule_blocks = schedule_blocks
+        job = pattern.job()
+        codes.append("".join(job.iter_full_interlocked_print(list(tool_list),reference_tool)))
+        reports.append(job.schedule_report)
+    return codes,reports[1]
+
+
+def test_same_lines_less_travel():
+    for tool_list,reference_tool,engine,rotation in (([1,2,3,4,5],2,generator,0),([4,1,5],5,generator,0.5),([2,2,3],3,toolpath,-1)):
+        (original,scheduled),report = _prints(tool_list,reference_tool,engine,rotation)
+        original_lines,original_travel = _printed_lines(original)
+        scheduled_lines,scheduled_travel = _printed_lines(scheduled)
+        assert sum(original_lines.values()) > 0
+        assert scheduled_lines == original_lines,(tool_list,reference_tool)
+        assert scheduled_travel <= original_travel+1e-6,(scheduled_travel,original_travel)
+        assert report['travel_after'] <= report['travel_before']+1e-9
+        assert report['tool_changes_after'] <= report['tool_changes_before']
+
+
+if __name__ == "__main__":
+    for name,test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print("%s passed" % (name))
@@ -0,0 +1,64 @@
+"""
+.. module:: test_toolpath
+    :synopsis: Checks that the toolpath engine generates exactly the same gcode as the generator class
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+Run with pytest, or as a script.
+"""
+import math
+import os
+import random
+
+from benchmark import _golden_prints,golden_folder
+from calibration_pattern import calibration_pattern
+from generator import generator
+from toolpath import toolpath
+
+
+def _patterns(printer_changes,pattern_changes):
+    """Make a pattern with the generator class and one with the toolpath engine, both with the same changes
+    """
+    patterns = []
+    for gen in (generator(),toolpath()):
+        pattern = calibration_pattern(gen=gen)
+        for name,value in printer_changes.items():
+            setattr(pattern.gen,name,value)
+        for name,value in pattern_changes.items():
+            setattr(pattern,name,value)
+        patterns.append(pattern)
+    return patterns
+
+
+def test_full_interlocked_print(n_configurations=6,seed=2):
+    randomness = random.Random(seed)
+    for i1 in range(n_configurations):
+        tool_list = randomness.sample([1,2,3,4,5],randomness.randint(1,5))
+        reference_tool = randomness.choice(tool_list)
+        printer_changes = {'rotation':randomness.uniform(-math.pi,math.pi),
+                           'x_offsets':[round(randomness.uniform(-0.2,0.2),3) for i2 in range(5)],
+                           'y_offsets':[round(randomness.uniform(-0.2,0.2),3) for i2 in range(5)]}
+        pattern_changes = {'interlocked_period':randomness.choice([3.5,4.0]),'schedule_blocks':i1 % 2 == 1}
+        reference,engine = _patterns(printer_changes,pattern_changes)
+        expected = "".join(reference.iter_full_interlocked_print(tool_list,reference_tool))
+        assert "".join(engine.iter_full_interlocked_print(tool_list,reference_tool)) == expected,(tool_list,reference_tool,printer_changes,pattern_changes)
+
+
+def test_meander_print():
+    for rotation in (0,0.3,-2):
+        reference,engine = _patterns({'rotation':rotation,'x_offsets':[0.1,-0.05,0,0,0.2],'y_offsets':[-0.1,0.05,0,0,0.2]},{'spacing':0.5,'width':40,'length':10})
+        for tool in (1,5):
+            assert "".join(engine.iter_meander_print(tool)) == "".join(reference.iter_meander_print(tool)),(rotation,tool)
+
+
+def test_golden_prints():
+    for engine in ('generator','toolpath'):
+        for pattern,print_name,arguments,name in _golden_prints(engine):
+            with open(os.path.join(golden_folder,name)) as f:
+                assert "".join(getattr(pattern,'iter_'+print_name)(*arguments)) == f.read(),(engine,name)
+
+
+if __name__ == "__main__":
+    for name,test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print("%s passed" % (name))
@@ -0,0 +1,326 @@
+"""
+.. module:: toolpath
+    :synopsis: Drop-in replacement of the generator class that records the toolpath in NumPy arrays and formats it in bulk
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+"""
+import math
+import itertools
+import numpy as np
+from generator import generator
+
+RAW = 0
+"""Row kind of gcode that is passed on as is, like tool changes, retractions and comments"""
+LINE = 1
+"""Row kind of a printed line, see :meth:`generator.line`"""
+MOVE = 2
+"""Row kind of a relative travel move, see :meth:`generator.move`"""
+MOVE_TO = 3
+"""Row kind of an absolute travel move, see :meth:`generator.move_to`"""
+U_TURN = 4
+"""Row kind of a printed u turn, see :meth:`generator.u_turn`"""
+QUARTER_TURN = 5
+"""Row kind of a printed quarter turn, see :meth:`generator.quarter_turn`"""
+
+#format of each row kind, arcs use G2 when clockwise and G3 otherwise
+_formats = np.array([
+    "",
+    "G1 X%.3f Y%.3f E%.4f F%.0f\n",
+    "G1 X%.3f Y%.3f\n",
+    "G1 X%.3f Y%.3f F%0.0f\n",
+    "G3 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n",
+    "G3 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n",
+    "G2 X%.3f Y%.3f I%.3f J%.3f E%.4f F%.0f\n",
+],dtype=object)
+
+#values (X, Y, I, J, E, F) used by the format of each row kind
+_columns = np.array([
+    [False,False,False,False,False,False],
+    [True,True,False,False,True,True],
+    [True,True,False,False,False,False],
+    [True,True,False,False,False,True],
+    [True,True,True,True,True,True],
+    [True,True,True,True,True,True],
+])
+
+
+class toolpath(generator):
+    """Drop-in replacement of the :class:`generator` class. Instead of formatting every move as it is generated, the moves are recorded as rows of NumPy arrays: the kind of move, the distance in x and y, the direction of arcs, and the tool and tool offset used. Once :attr:`toolpath.batch_size` rows are recorded, or when :meth:`toolpath.flush` is called, the tool offsets, the center and the rotation are applied to all rows at once as a single affine transform and all rows are formatted in bulk. The output is identical to that of the :class:`generator` class. To use it with a calibration pattern:
+
+    .. code-block:: python
+
+        pattern = calibration_pattern()
+        pattern.gen = toolpath()
+        lines = pattern.full_interlocked_print([1,2,3,4,5],2,"example.g")
+
+    The primitives return an empty string while recording, or all gcode recorded so far when the batch is full. The current position (curr_x and curr_y) is only updated when a batch is formatted.
+    """
+
+    batch_size = 1 << 16
+    """Number of rows that are recorded before they are formatted"""
+
+    record_only = False
+    """When enabled the recorded rows are not formatted, but kept in :attr:`toolpath.recorded`. They can then be formatted later, possibly multiple times, using :meth:`toolpath.render`."""
+
+    def __init__(self,config=None):
+        super().__init__(config)
+        self.recorded = []
+        self._shapes = {}
+        self._shape_list = []
+        self._clear()
+
+    def job(self):
+        """Create a toolpath for a single print job, see :meth:`generator.job`. The job uses the same :attr:`toolpath.batch_size` and :attr:`toolpath.record_only` as this toolpath, and the rows it records are added to the :attr:`toolpath.recorded` list of this toolpath.
+
+        :return: A new toolpath with the same config
+        :rtype: toolpath
+        """
+        job = super().job()
+        job.batch_size = self.batch_size
+        job.record_only = self.record_only
+        job.recorded = self.recorded
+        return job
+
+    def _clear(self):
+        self._rows = []
+        self._text = []
+
+    def _record(self,kind,x,y,shape=-1):
+        self._rows.append((kind,x,y,shape,self._tool_offset_index,self.current_tool_index))
+        if len(self._rows) >= self.batch_size:
+            return self.flush()
+        return ""
+
+    def _record_text(self,text):
+        if text:
+            self._text.append(text.replace("%","%%"))
+            return self._record(RAW,0.0,0.0)
+        return ""
+
+    def _shape(self,key):
+        """Look up the index of a printed move in the list of distinct printed moves. A calibration pattern only contains a handful of distinct printed moves, so their length and arc center only have to be calculated once.
+        """
+        shape = self._shapes.get(key)
+        if shape is None:
+            shape = len(self._shape_list)
+            self._shapes[key] = shape
+            self._shape_list.append(key)
+        return shape
+
+    def line(self,x,y):
+        return self._record(LINE,x,y,self._shape((LINE,x,y,False)))
+
+    def move_to(self,x,y):
+        return self._record(MOVE_TO,x,y)
+
+    def move(self,x,y):
+        return self._record(MOVE,x,y)
+
+    def quarter_turn(self,x,y,clockwise):
+        #the sign of zero is part of the key, as it matters for math.atan2
+        key = (QUARTER_TURN,x,y,bool(clockwise),math.copysign(1.0,x),math.copysign(1.0,y))
+        return self._record(QUARTER_TURN,x,y,self._shape(key))
+
+    def u_turn(self,x,y,clockwise):
+        return self._record(U_TURN,x,y,self._shape((U_TURN,x,y,bool(clockwise))))
+
+    def repeat(self,template,repetitions):
+        """Record a template that is repeated a number of times, see :meth:`generator.repeat`. The rows of the template are only created once and then copied for all repetitions. Because all moves are relative, copying the rows translates every repetition to the end of the previous one.
+        """
+        if repetitions <= 0 or not template:
+            return ""
+        rows = []
+        for move in template:
+            name,x,y = move[:3]
+            if name == 'line':
+                rows.append((LINE,x,y,self._shape((LINE,x,y,False)),self._tool_offset_index,self.current_tool_index))
+            elif name == 'move':
+                rows.append((MOVE,x,y,-1,self._tool_offset_index,self.current_tool_index))
+            elif name == 'u_turn':
+                rows.append((U_TURN,x,y,self._shape((U_TURN,x,y,bool(move[3]))),self._tool_offset_index,self.current_tool_index))
+            elif name == 'quarter_turn':
+                key = (QUARTER_TURN,x,y,bool(move[3]),math.copysign(1.0,x),math.copysign(1.0,y))
+                rows.append((QUARTER_TURN,x,y,self._shape(key),self._tool_offset_index,self.current_tool_index))
+            else:
+                raise Exception("Unknown primitive given to repeat function")
+        self._rows.extend(rows*repetitions)
+        if len(self._rows) >= self.batch_size:
+            return self.flush()
+        return ""
+
+    def extrude(self,amount):
+        return self._record_text(super().extrude(amount))
+
+    def retract(self):
+        return self._record_text(super().retract())
+
+    def reretract(self):
+        return self._record_text(super().reretract())
+
+    def comment(self,text):
+        return self._record_text(super().comment(text))
+
+    def starting_code(self,tool_list_indexes):
+        return self._record_text(super().starting_code(tool_list_indexes))
+
+    def stop_code(self):
+        return self._record_text(super().stop_code())
+
+    def tool_change(self,tool_index):
+        return self._record_text(super().tool_change(tool_index))
+
+    def flush(self):
+        """Format all recorded rows. When :attr:`toolpath.record_only` is enabled the rows are added to :attr:`toolpath.recorded` instead.
+
+        :return: The gcode of all rows recorded since the last flush
+        :rtype: string
+        """
+        if not self._rows:
+            return ""
+        batch = self.take()
+        if self.record_only:
+            self.recorded.append(batch)
+            return ""
+        return self.render(batch)
+
+    def take(self):
+        """Take all rows recorded since the last flush out of the toolpath, without formatting them
+
+        :return: A batch, consisting of an array with a row per move, a list with the gcode of the rows that are passed on as is and a list with the distinct printed moves the rows refer to
+        :rtype: tuple
+        """
+        rows = np.fromiter(itertools.chain.from_iterable(self._rows),float,count=6*len(self._rows)).reshape(-1,6)
+        batch = (rows,self._text,list(self._shape_list))
+        self._clear()
+        return batch
+
+    def render(self,batch):
+        """Format a batch of rows using the current settings of the toolpath. The same batch can be rendered multiple times, for example with different tool offsets or rotations. Batches must be rendered in the order in which they were recorded, because the position at the end of one batch is the starting position of the next one.
+
+        :param batch: A batch as returned by :meth:`toolpath.take`
+        :return: The gcode of the batch
+        :rtype: string
+        """
+        rows,text,shapes = batch
+        kind = rows[:,0].astype(np.intp)
+        dx = rows[:,1]
+        dy = rows[:,2]
+        shape = rows[:,3].astype(np.intp)
+        offset = rows[:,4].astype(np.intp)
+        tool = rows[:,5].astype(np.intp)
+
+        x_abs,y_abs = self._positions(kind,dx,dy)
+        values,clockwise = self._values(kind,dx,dy,shape,shapes,offset,tool,x_abs,y_abs)
+
+        fmt_index = kind.copy()
+        fmt_index[clockwise] = 6
+        fmts = _formats[fmt_index]
+        fmts[kind == RAW] = text
+        flat = values[_columns[kind]]
+        return "".join(fmts.tolist()) % tuple(flat.tolist())
+
+    def _positions(self,kind,dx,dy):
+        """Calculate the position of the print head after every row, by accumulating the relative moves in the same order as the :class:`generator` class does
+        """
+        x_abs = np.zeros(len(kind))
+        y_abs = np.zeros(len(kind))
+        moves = np.flatnonzero(kind != RAW)
+        if len(moves) == 0:
+            return x_abs,y_abs
+        starts = np.flatnonzero(kind[moves] == MOVE_TO)
+        if len(starts) == 0 or starts[0] != 0:
+            starts = np.concatenate(([0],starts))
+        ends = np.append(starts[1:],len(moves))
+        for start,end in zip(starts,ends):
+            rows = moves[start:end]
+            if kind[rows[0]] == MOVE_TO:
+                x0 = dx[rows[0]]
+                y0 = dy[rows[0]]
+                x_abs[rows[0]] = x0
+                y_abs[rows[0]] = y0
+                rows = rows[1:]
+            else:
+                x0 = self.curr_x
+                y0 = self.curr_y
+            x_abs[rows] = np.cumsum(np.concatenate(([x0],dx[rows])))[1:]
+            y_abs[rows] = np.cumsum(np.concatenate(([y0],dy[rows])))[1:]
+            if len(rows):
+                self.curr_x = x_abs[rows[-1]]
+                self.curr_y = y_abs[rows[-1]]
+            else:
+                self.curr_x = x0
+                self.curr_y = y0
+        #keep the same type as the generator class
+        self.curr_x = float(self.curr_x)
+        self.curr_y = float(self.curr_y)
+        x_abs[kind == RAW] = np.nan
+        y_abs[kind == RAW] = np.nan
+        return x_abs,y_abs
+
+    def _transform(self,x_pos,y_pos):
+        """Rotate coordinates around the center of the print, see :meth:`generator.rotate`
+        """
+        cos = math.cos(self.rotation)
+        sin = math.sin(self.rotation)
+        x_rel = x_pos-self.x_center
+        y_rel = y_pos-self.y_center
+        x_new = cos*x_rel-sin*y_rel+self.x_center
+        y_new = sin*x_rel+cos*y_rel+self.y_center
+        return x_new,y_new
+
+    def _shape_values(self,shapes):
+        """Calculate the length, the arc center and the direction of all distinct printed moves, the same way as the :class:`generator` class does
+        """
+        lengths = np.zeros(len(shapes))
+        centers = np.zeros((len(shapes),2))
+        clockwise = np.zeros(len(shapes),dtype=bool)
+        for i1,key in enumerate(shapes):
+            shape_kind,x,y,clockwise[i1] = key[:4]
+            distance = math.sqrt(x**2 + y**2)
+            if shape_kind == LINE:
+                lengths[i1] = distance
+            elif shape_kind == U_TURN:
+                lengths[i1] = 3.14159*distance/2
+            else:
+                lengths[i1] = 3.14159*distance/4
+                angle = math.atan2(y,x)
+                center_dist = distance/math.sqrt(2)
+                if clockwise[i1]:
+                    x_center2 = math.cos(angle-math.pi/4)*center_dist
+                    y_center2 = math.sin(angle-math.pi/4)*center_dist
+                else:
+                    x_center2 = math.cos(angle+math.pi/4)*center_dist
+                    y_center2 = math.sin(angle+math.pi/4)*center_dist
+                centers[i1] = self.rotate_around_origin(x_center2,y_center2)
+        return lengths,centers,clockwise
+
+    def _values(self,kind,dx,dy,shape,shapes,offset,tool,x_abs,y_abs):
+        """Calculate the X, Y, I, J, E and F values of all rows, and which rows are clockwise arcs
+        """
+        values = np.zeros((len(kind),6))
+        x_pos = x_abs+np.asarray(self.x_offsets,dtype=float)[offset]
+        y_pos = y_abs+np.asarray(self.y_offsets,dtype=float)[offset]
+        values[:,0],values[:,1] = self._transform(x_pos,y_pos)
+        values[:,5] = self.print_speed * 60
+
+        clockwise = np.zeros(len(kind),dtype=bool)
+        printed = np.flatnonzero(shape >= 0)
+        if len(printed) == 0:
+            return values,clockwise
+        lengths,centers,shape_clockwise = self._shape_values(shapes)
+        shape = shape[printed]
+        clockwise[printed] = shape_clockwise[shape]
+
+        nozzle_diameters = np.asarray(self.nozzle_diameters,dtype=float)[tool[printed]]
+        extrusion_multiplier = np.asarray(self.extrusion_multiplier,dtype=float)[tool[printed]]
+        volume = lengths[shape] * nozzle_diameters * self.layer_height * extrusion_multiplier
+        values[printed,4] = volume / (self.filament_diameter * self.filament_diameter * 3.14159 * 0.25)
+
+        quarter = kind[printed] == QUARTER_TURN
+        values[printed[quarter],2:4] = centers[shape[quarter]]
+
+        #the center of a u turn is the difference between the rotated end point and the rotated halfway point
+        u = np.flatnonzero(kind == U_TURN)
+        x_half,y_half = self._transform(x_pos[u]-dx[u]/2,y_pos[u]-dy[u]/2)
+        values[u,2] = values[u,0]-x_half
+        values[u,3] = values[u,1]-y_half
+        return values,clockwise
@@ -0,0 +1,286 @@
+"""
+.. module:: verifier
+    :synopsis: Check generated gcode for lines that overlap, lines that are too close together and moves outside the bed
+.. moduleauthor:: Martijn Schouten <github.com/martijnschouten>
+
+The printed moves are taken from the gcode as parsed by the :mod:`simulator` and split into short straight pieces (see :func:`rasterizer.split_moves`). Every piece belongs to a part: the section of the print it is in (see :attr:`simulator.simulator.section_prefix`) together with the tool that prints it. The pieces of a part are supposed to touch each other, but the pieces of different parts should be at least min_clearance apart, measured between the edges of the lines.
+
+To find the pieces that are close together without comparing all pieces with each other, the pieces are put in a uniform grid of square cells. A cell is as large as the largest distance at which two pieces can still be too close, and every piece is put in all cells its bounding box, enlarged by half this distance, touches. Two pieces that are too close then always share a cell, so only the pieces that share a cell are compared. Since the pieces are not longer than a cell, the number of comparisons grows linearly with the length of the print.
+"""
+import argparse
+import math
+import numpy as np
+
+from config import printer_config
+from rasterizer import line_widths,split_moves,tool_number
+from simulator import simulator
+
+
+def _point_distance(px,py,x0,y0,x1,y1):
+    """Distance of points to line pieces
+    """
+    dx = x1-x0
+    dy = y1-y0
+    length2 = dx*dx+dy*dy
+    with np.errstate(divide='ignore',invalid='ignore'):
+        t = np.clip(np.where(length2 > 0,((px-x0)*dx+(py-y0)*dy)/length2,0),0,1)
+    return np.hypot(px-x0-t*dx,py-y0-t*dy)
+
+
+def segment_distance(ax0,ay0,ax1,ay1,bx0,by0,bx1,by1):
+    """Calculate the shortest distance between pairs of line pieces
+
+    :param ax0: Array with the x coordinate of the start of the first pieces
+    :param ay0: Array with the y coordinate of the start of the first pieces
+    :param ax1: Array with the x coordinate of the end of the first pieces
+    :param ay1: Array with the y coordinate of the end of the first pieces
+    :param bx0: Array with the x coordinate of the start of the second pieces
+    :param by0: Array with the y coordinate of the start of the second pieces
+    :param bx1: Array with the x coordinate of the end of the second pieces
+    :param by1: Array with the y coordinate of the end of the second pieces
+    :return: The distance between every pair, which is 0 for pieces that cross
+    :rtype: numpy.ndarray
+    """
+    distance = np.minimum(np.minimum(_point_distance(ax0,ay0,bx0,by0,bx1,by1),_point_distance(ax1,ay1,bx0,by0,bx1,by1)),
+                          np.minimum(_point_distance(bx0,by0,ax0,ay0,ax1,ay1),_point_distance(bx1,by1,ax0,ay0,ax1,ay1)))
+    #pieces cross when the ends of each piece are on different sides of the other piece
+    side_a0 = (bx1-bx0)*(ay0-by0)-(by1-by0)*(ax0-bx0)
+    side_a1 = (bx1-bx0)*(ay1-by0)-(by1-by0)*(ax1-bx0)
+    side_b0 = (ax1-ax0)*(by0-ay0)-(ay1-ay0)*(bx0-ax0)
+    side_b1 = (ax1-ax0)*(by1-ay0)-(ay1-ay0)*(bx1-ax0)
+    distance[(side_a0*side_a1 < 0) & (side_b0*side_b1 < 0)] = 0
+    return distance
+
+
+class verifier:
+    """Geometric check of gcode. The gcode is given piece by piece using :meth:`verifier.write`, after which :meth:`verifier.check` reports all problems. For example:
+
+    .. code-block:: python
+
+        check = verifier(pattern.gen.config)
+        check.write_all(pattern.iter_full_interlocked_print([1,2,3,4,5],2))
+        report = check.check()
+        if not report['ok']:
+            print(report['overlaps'])
+
+    :param config: The :class:`config.printer_config` used to generate the gcode, which gives the width of the lines of every tool
+    """
+
+    bed = (-150,150,-150,150)
+    """Limits of the bed (x_min, x_max, y_min, y_max) in millimeter. Set these to the bed of the printer; by default a bed of 300 by 300 mm centered around the origin."""
+
+    min_clearance = 0.1
+    """Minimum distance in millimeter between the edges of lines of different parts"""
+
+    chord_tolerance = 0.005
+    """Maximum distance in millimeter between an arc and the pieces it is split in"""
+
+    max_problems = 100
+    """Maximum number of problems of every kind that is listed in the report. All problems are counted."""
+
+    def __init__(self,config=None):
+        if config is None:
+            config = printer_config()
+        self.config = config
+        self.simulator = simulator()
+
+    def write(self,code):
+        """Add a piece of gcode. The gcode does not have to consist of whole lines.
+
+        :param code: The gcode
+        """
+        self.simulator.write(code)
+
+    def write_all(self,codes):
+        """Add gcode from an iterable, for example the output of :meth:`calibration_pattern.iter_full_interlocked_print`
+
+        :param codes: Iterable with pieces of gcode
+        """
+        for code in codes:
+            self.write(code)
+
+    def pieces(self):
+        """Split all moves of the gcode written so far in pieces
+
+        :return: Arrays with the start (x0, y0) and end (x1, y1) of every piece, the half width of its line (0 for travel moves), the index of its move and its part, and a list with the name of every part
+        :rtype: tuple
+        """
+        x0,y0,z0,x1,y1,z1,e,feed,kind,i,j,stop,sections,tools = self.simulator.moves()
+        moves = np.flatnonzero((x0 != x1) | (y0 != y1) | (kind >= 2))
+        printed = e[moves] > 0
+        half_width = np.where(printed,line_widths(self.config,np.array([tool_number(name) for name in self.simulator.tools])[tools[moves]])/2,0)
+        distance = 2*half_width.max(initial=0)+self.min_clearance
+        move,px0,py0,px1,py1 = split_moves(x0[moves],y0[moves],x1[moves],y1[moves],kind[moves],i[moves],j[moves],max(distance,self.chord_tolerance),self.chord_tolerance)
+
+        n_tools = len(self.simulator.tools)
+        part = sections[moves]*n_tools+tools[moves]
+        used,part = np.unique(part,return_inverse=True)
+        names = ["%s (%s)" % (self.simulator.sections[number//n_tools],self.simulator.tools[number%n_tools]) for number in used.tolist()]
+        return px0,py0,px1,py1,half_width[move],moves[move],part[move],names
+
+    def candidate_pairs(self,x0,y0,x1,y1,distance,part=None):
+        """Find all pairs of pieces that can be closer than a distance using a uniform grid
+
+        :param x0: Array with the x coordinate of the start of every piece
+        :param y0: Array with the y coordinate of the start of every piece
+        :param x1: Array with the x coordinate of the end of every piece
+        :param y1: Array with the y coordinate of the end of every piece
+        :param distance: The distance, which is also used as size of the cells
+        :param part: Optional array with the part of every piece, pairs of pieces of the same part are left out
+        :return: Two arrays with the indexes of the first and second piece of every pair. Every pair is listed once.
+        :rtype: tuple
+        """
+        empty = np.zeros(0,dtype=np.intp)
+        if len(x0) < 2:
+            return empty,empty
+        x_min = np.minimum(x0,x1)-distance/2
+        x_max = np.maximum(x0,x1)+distance/2
+        y_min = np.minimum(y0,y1)-distance/2
+        y_max = np.maximum(y0,y1)+distance/2
+        first_column = np.floor((x_min-x_min.min())/distance).astype(np.int64)
+        last_column = np.floor((x_max-x_min.min())/distance).astype(np.int64)
+        first_row = np.floor((y_min-y_min.min())/distance).astype(np.int64)
+        last_row = np.floor((y_max-y_min.min())/distance).astype(np.int64)
+        n_rows = int(last_row.max())+1
+
+        #every piece in every cell it touches
+        cells = []
+        entries = []
+        for column_step in range(int((last_column-first_column).max())+1):
+            for row_step in range(int((last_row-first_row).max())+1):
+                selected = np.flatnonzero((first_column+column_step <= last_column) & (first_row+row_step <= last_row))
+                cells.append((first_column[selected]+column_step)*n_rows+first_row[selected]+row_step)
+                entries.append(selected)
+        cells = np.concatenate(cells)
+        entries = np.concatenate(entries)
+        order = np.argsort(cells,kind='stable')
+        cells = cells[order]
+        entries = entries[order]
+
+        #all pairs of entries in the same cell
+        starts = np.flatnonzero(np.concatenate(([True],cells[1:] != cells[:-1])))
+        sizes = np.diff(np.append(starts,len(cells)))
+        group_end = np.repeat(starts+sizes,sizes)
+        count = group_end-np.arange(len(cells))-1
+        first = np.repeat(np.arange(len(cells)),count)
+        second = first+1+np.arange(len(first))-np.repeat(np.cumsum(count)-count,count)
+        a = entries[first]
+        b = entries[second]
+        if part is not None:
+            different = part[a] != part[b]
+            a = a[different]
+            b = b[different]
+        #pairs that share more than one cell
+        keys = np.unique(np.minimum(a,b)*len(x0)+np.maximum(a,b))
+        return keys//len(x0),keys%len(x0)
+
+    def check(self):
+        """Check all gcode written so far
+
+        :return: Dictionary with the overlaps (lines of different parts that touch) and clearances (lines of different parts that are less than min_clearance apart), listed per pair of parts with the smallest gap between the edges of their lines and where it is, the moves that go outside the bed, the smallest gap between lines of different parts that were compared (infinite when no lines of different parts are near each other), the number of pieces and compared pairs of pieces, and wether no problems were found
+        :rtype: dict
+        """
+        x0,y0,x1,y1,half_width,move,part,names = self.pieces()
+        printed = np.flatnonzero(half_width > 0)
+        distance = 2*half_width.max(initial=0)+self.min_clearance
+        a,b = self.candidate_pairs(x0[printed],y0[printed],x1[printed],y1[printed],distance,part[printed])
+        a = printed[a]
+        b = printed[b]
+        gap = segment_distance(x0[a],y0[a],x1[a],y1[a],x0[b],y0[b],x1[b],y1[b])-half_width[a]-half_width[b]
+        overlaps = self._per_part_pair(gap < 0,gap,a,b,part,names,x0,y0,x1,y1)
+        clearances = self._per_part_pair((gap >= 0) & (gap < self.min_clearance),gap,a,b,part,names,x0,y0,x1,y1)
+
+        #every point of the path should be on the bed
+        x_min,x_max,y_min,y_max = self.bed
+        x = np.concatenate((x0,x1))
+        y = np.concatenate((y0,y1))
+        outside = np.flatnonzero((x < x_min) | (x > x_max) | (y < y_min) | (y > y_max))
+        out_of_bed = []
+        outside_moves,first = np.unique(np.concatenate((move,move))[outside],return_index=True)
+        for index,point in zip(outside_moves[:self.max_problems].tolist(),outside[first[:self.max_problems]].tolist()):
+            out_of_bed.append({'move':index,'x':float(x[point]),'y':float(y[point])})
+
+        return {'overlaps':overlaps[:self.max_problems],
+                'clearances':clearances[:self.max_problems],
+                'out_of_bed':out_of_bed,
+                'n_overlaps':len(overlaps),
+                'n_clearances':len(clearances),
+                'n_out_of_bed':len(outside_moves),
+                'min_gap':float(gap.min()) if len(gap) else math.inf,
+                'pieces':len(x0),
+                'pairs':len(gap),
+                'ok':not overlaps and not clearances and not len(outside_moves)}
+
+    def _per_part_pair(self,problem,gap,a,b,part,names,x0,y0,x1,y1):
+        """Summarise problems per pair of parts, with the location of the smallest gap
+        """
+        problem = np.flatnonzero(problem)
+        if len(problem) == 0:
+            return []
+        part_a = np.minimum(part[a[problem]],part[b[problem]])
+        part_b = np.maximum(part[a[problem]],part[b[problem]])
+        order = np.lexsort((gap[problem],part_b,part_a))
+        problem = problem[order]
+        part_a = part_a[order]
+        part_b = part_b[order]
+        first = np.flatnonzero(np.concatenate(([True],(part_a[1:] != part_a[:-1]) | (part_b[1:] != part_b[:-1]))))
+        counts = np.diff(np.append(first,len(problem)))
+        result = []
+        for start,count in zip(first.tolist(),counts.tolist()):
+            index = problem[start]
+            piece = a[index]
+            result.append({'parts':(names[part_a[start]],names[part_b[start]]),
+                           'gap':float(gap[index]),
+                           'x':float((x0[piece]+x1[piece])/2),
+                           'y':float((y0[piece]+y1[piece])/2),
+                           'count':count})
+        result.sort(key=lambda problem: problem['gap'])
+        return result
+
+
+def verify(code,config=None,**settings):
+    """Check gcode for overlapping lines, lines that are too close and moves outside the bed
+
+    :param code: The gcode, either a string or an iterable of pieces of gcode
+    :param config: The :class:`config.printer_config` used to generate the gcode
+    :param settings: Attributes of the :class:`verifier.verifier` to change, for example min_clearance or bed
+    :return: The report, see :meth:`verifier.check`
+    :rtype: dict
+    """
+    check = verifier(config)
+    for name,value in settings.items():
+        if not hasattr(verifier,name):
+            raise Exception("Unknown setting given to verify: %s" % (name))
+        setattr(check,name,value)
+    if isinstance(code,str):
+        check.write(code)
+    else:
+        check.write_all(code)
+    return check.check()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check a gcode file for overlapping lines, lines that are too close and moves outside the bed")
+    parser.add_argument("file",help="gcode file to check")
+    parser.add_argument("--min-clearance",type=float,default=verifier.min_clearance,help="minimum distance between the edges of lines of different parts in millimeter")
+    parser.add_argument("--bed",type=float,nargs=4,default=verifier.bed,metavar=("X_MIN","X_MAX","Y_MIN","Y_MAX"),help="limits of the bed in millimeter")
+    args = parser.parse_args()
+
+    check = verifier()
+    check.min_clearance = args.min_clearance
+    check.bed = tuple(args.bed)
+    with open(args.file) as f:
+        for chunk in iter(lambda: f.read(1 << 20),""):
+            check.write(chunk)
+    report = check.check()
+    print("%.0f pieces, %.0f pairs compared, smallest gap between different parts %.3f mm" % (report['pieces'],report['pairs'],report['min_gap']))
+    for kind,title in (('overlaps','overlapping'),('clearances','too close')):
+        for problem in report[kind]:
+            print("%s: %s and %s, gap %.3f mm at (%.2f, %.2f), %.0f pieces" % (title,problem['parts'][0],problem['parts'][1],problem['gap'],problem['x'],problem['y'],problem['count']))
+    for problem in report['out_of_bed']:
+        print("outside the bed: move %.0f at (%.2f, %.2f)" % (problem['move'],problem['x'],problem['y']))
+    print("ok" if report['ok'] else "%.0f overlaps, %.0f too close, %.0f moves outside the bed" % (report['n_overlaps'],report['n_clearances'],report['n_out_of_bed']))
+
+
+if __name__ == '__main__':
+    main()